@@ -6,9 +6,11 @@ import json
 import logging
 import os
 import subprocess
+import tempfile
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
-from anyio import to_thread
+from anyio import from_thread, to_thread
 from fastmcp.tools.tool import Tool, ToolResult
 from mcp.server.auth.handlers.metadata import ProtectedResourceMetadataHandler
 from mcp.shared.auth import ProtectedResourceMetadata
@@ -18,9 +20,10 @@ from starlette.responses import Response
 from erk_mcp.auth import build_auth_provider_from_env, get_authenticated_github_token
 from erk_shared.agentclick.machine_schema import request_schema
 from erk_shared.agentclick.mcp_exposed import discover_mcp_commands
+from erk_shared.agentclick.ndjson import collect_ndjson_stream
 
 if TYPE_CHECKING:
-    from fastmcp import FastMCP
+    from fastmcp import Context, FastMCP
 
 DEFAULT_MCP_NAME = "erk"
 DEFAULT_MCP_HTTP_PATH = "/mcp"
@@ -101,15 +104,101 @@ def _run_erk_json(
     return result.stdout
 
 
+def _run_erk_ndjson(
+    command_path: tuple[str, ...],
+    params: dict[str, Any],
+    *,
+    items_key: str,
+    env_override: dict[str, str] | None,
+    on_item: Callable[[dict[str, Any]], None] | None,
+) -> str:
+    """Run an erk json command with --stream, handing items over as they arrive.
+
+    Returns the same JSON document the non-streamed command would print, so
+    the final tool result does not depend on whether the command streamed.
+
+    Args:
+        command_path: Tuple of subcommand names, e.g. ("json", "pr", "list").
+        params: JSON-serializable dict piped to stdin.
+        items_key: Key the items are listed under in the non-streamed output.
+        env_override: Optional environment dict for the subprocess. None inherits process env.
+        on_item: Called with each item as soon as its line is read.
+    """
+    # stderr goes to a file so a chatty command cannot block on a full pipe
+    # while stdout is being read
+    with tempfile.TemporaryFile(mode="w+") as stderr_file:
+        process = subprocess.Popen(
+            ["erk", *command_path, "--stream"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+            env=env_override,
+        )
+        assert process.stdin is not None
+        assert process.stdout is not None
+        process.stdin.write(json.dumps(params))
+        process.stdin.close()
+        document: dict[str, Any] | None
+        try:
+            document = collect_ndjson_stream(process.stdout, items_key=items_key, on_item=on_item)
+        except ValueError:
+            document = None
+        process.stdout.close()
+        returncode = process.wait()
+        if document is None:
+            stderr_file.seek(0)
+            _log_subprocess_failure(command_path, returncode=returncode, stderr=stderr_file.read())
+            return _build_subprocess_error_output()
+    return json.dumps(document)
+
+
+def _current_context() -> Context | None:
+    from fastmcp.server.dependencies import get_context
+
+    # Error boundary: get_context() raises when no MCP request is active
+    # (e.g. a tool run directly), in which case there is no client to notify.
+    try:
+        return get_context()
+    except RuntimeError:
+        return None
+
+
+def _progress_forwarder(
+    context: Context | None,
+) -> Callable[[dict[str, Any]], None] | None:
+    """Build an on_item callback that reports each item as MCP progress.
+
+    The callback runs in the worker thread and hops back to the event loop
+    to send the notification; the item JSON is the progress message.
+    """
+    if context is None:
+        return None
+    forwarded = 0
+
+    def forward(item: dict[str, Any]) -> None:
+        nonlocal forwarded
+        forwarded += 1
+        from_thread.run(context.report_progress, forwarded, None, json.dumps(item))
+
+    return forward
+
+
 class MachineCommandTool(Tool):
     """MCP tool backed by an erk @machine_command CLI command.
 
     Dynamically registers a CLI command as an MCP tool using the
     command's request_type for input schema. The tool filters out
     None values before piping params as JSON to the CLI.
+
+    Commands that support --stream (stream_items_key is set) are run in
+    streaming mode; each item is forwarded to the client as a progress
+    notification as soon as it is read, and the tool result is the
+    complete document.
     """
 
     cli_command_path: tuple[str, ...]
+    stream_items_key: str | None = None
 
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
         params: dict[str, Any] = {}
@@ -121,8 +210,18 @@ class MachineCommandTool(Tool):
         env_override: dict[str, str] | None = None
         if user_token is not None:
             env_override = {**os.environ, "GH_TOKEN": user_token}
+        items_key = self.stream_items_key
+        if items_key is None:
+            result = await to_thread.run_sync(
+                lambda: _run_erk_json(path, params, env_override=env_override)
+            )
+            return self.convert_result(result)
+
+        on_item = _progress_forwarder(_current_context())
         result = await to_thread.run_sync(
-            lambda: _run_erk_json(path, params, env_override=env_override)
+            lambda: _run_erk_ndjson(
+                path, params, items_key=items_key, env_override=env_override, on_item=on_item
+            )
         )
         return self.convert_result(result)
 
@@ -137,12 +236,14 @@ def _build_machine_command_tools() -> tuple[MachineCommandTool, ...]:
         machine_meta = getattr(cmd, "_machine_command_meta", None)
         if machine_meta is None:
             continue
+        stream = machine_meta.stream
         tools.append(
             MachineCommandTool(
                 name=meta.name,
                 cli_command_path=command_path,
                 description=meta.description,
                 parameters=request_schema(machine_meta.request_type),
+                stream_items_key=stream.items_key if stream is not None else None,
             )
         )
     return tuple(tools)
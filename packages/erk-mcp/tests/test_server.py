@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import json
 import logging
 import subprocess
@@ -18,11 +19,67 @@ from erk_mcp.server import (
     _build_machine_command_tools,
     _build_root_protected_resource_metadata,
     _run_erk_json,
+    _run_erk_ndjson,
     create_mcp,
     create_startup_mcp,
 )
 
 
+def _fake_stream_process(stdout: str, *, returncode: int) -> MagicMock:
+    process = MagicMock()
+    process.stdin = io.StringIO()
+    process.stdin.close = MagicMock()
+    process.stdout = io.StringIO(stdout)
+    process.wait.return_value = returncode
+    return process
+
+
+class TestRunErkNdjson:
+    """Tests for _run_erk_ndjson streaming subprocess wrapper."""
+
+    @patch("erk_mcp.server.subprocess.Popen")
+    def test_forwards_items_and_returns_full_document(self, mock_popen: patch) -> None:
+        lines = [
+            {"type": "item", "item": {"pr_number": 1}},
+            {"type": "item", "item": {"pr_number": 2}},
+            {"type": "result", "success": True, "count": 2},
+        ]
+        process = _fake_stream_process(
+            "".join(json.dumps(line) + "\n" for line in lines), returncode=0
+        )
+        mock_popen.return_value = process
+        seen: list[dict] = []
+
+        output = _run_erk_ndjson(
+            ("json", "pr", "list"),
+            {"state": "open"},
+            items_key="plans",
+            env_override=None,
+            on_item=seen.append,
+        )
+
+        assert mock_popen.call_args[0][0] == ["erk", "json", "pr", "list", "--stream"]
+        assert process.stdin.getvalue() == '{"state": "open"}'
+        assert seen == [{"pr_number": 1}, {"pr_number": 2}]
+        assert json.loads(output) == {
+            "plans": [{"pr_number": 1}, {"pr_number": 2}],
+            "count": 2,
+            "success": True,
+        }
+
+    @patch("erk_mcp.server.subprocess.Popen")
+    def test_truncated_stream_returns_generic_error(self, mock_popen: patch) -> None:
+        mock_popen.return_value = _fake_stream_process(
+            json.dumps({"type": "item", "item": {}}) + "\n", returncode=1
+        )
+
+        output = _run_erk_ndjson(
+            ("json", "pr", "list"), {}, items_key="plans", env_override=None, on_item=None
+        )
+
+        assert json.loads(output)["error_type"] == CLI_SUBPROCESS_ERROR_TYPE
+
+
 class TestRunErkJson:
     """Tests for _run_erk_json subprocess wrapper with command path tuples."""
 
@@ -335,6 +392,11 @@ class TestMachineCommandTool:
         pr_list_tool = [t for t in tools if t.name == "pr_list"][0]
         assert pr_list_tool.cli_command_path == ("json", "pr", "list")
 
+    def test_pr_list_tool_streams_plans(self) -> None:
+        tools = _build_machine_command_tools()
+        pr_list_tool = [t for t in tools if t.name == "pr_list"][0]
+        assert pr_list_tool.stream_items_key == "plans"
+
     def test_discovered_tools_include_pr_view(self) -> None:
         tools = _build_machine_command_tools()
         tool_names = {t.name for t in tools}
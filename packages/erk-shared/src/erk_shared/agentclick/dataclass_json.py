@@ -8,7 +8,7 @@ import json
 import sys
 import types
 from dataclasses import fields
-from typing import Any, Literal, Union, get_args, get_origin
+from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
 
 import click
 
@@ -100,6 +100,29 @@ def dataclass_result_schema(cls: type) -> dict[str, Any]:
     }
 
 
+def item_schema(cls: type) -> dict[str, Any]:
+    """Generate JSON Schema for one element of a streamed list.
+
+    Uses a json_schema() classmethod if present, otherwise the dataclass
+    fields. Unlike result schemas, items carry no success flag.
+    """
+    json_schema_method = getattr(cls, "json_schema", None)
+    if json_schema_method is not None:
+        return json_schema_method()
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(
+            f"Cannot generate schema for {cls.__name__}: "
+            "no json_schema() classmethod and not a dataclass"
+        )
+    # Resolve string annotations from modules using `from __future__ import annotations`
+    hints = get_type_hints(cls)
+    properties = {
+        field.name: python_type_to_json_schema(hints[field.name])
+        for field in dataclasses.fields(cls)
+    }
+    return {"type": "object", "properties": properties, "required": sorted(properties)}
+
+
 def output_schema(output_types: tuple[type, ...]) -> dict[str, Any]:
     """Generate JSON Schema for command output types.
 
@@ -5,6 +5,7 @@ Provides @machine_command for commands that:
 - Return structured JSON output
 - Use frozen dataclass request types for strict validation
 - Support --schema flag for introspection
+- Optionally support --stream for NDJSON output of list results (see ndjson.py)
 
 Unlike @json_command (which adds --json/--schema to human commands),
 @machine_command creates dedicated machine-only commands with no
@@ -24,6 +25,21 @@ from erk_shared.agentclick.dataclass_json import (
     read_json_stdin,
     serialize_to_json_dict,
 )
+from erk_shared.agentclick.ndjson import StreamableResult, emit_ndjson_error, emit_ndjson_stream
+
+
+@dataclass(frozen=True)
+class MachineStreamSpec:
+    """Streaming support for a list-returning machine command.
+
+    Attributes:
+        items_key: Key the list is returned under in non-streamed output
+            (e.g. "plans"); used to rebuild that output from a stream.
+        item_type: Type of each list item, for the stream schema
+    """
+
+    items_key: str
+    item_type: type
 
 
 @dataclass(frozen=True)
@@ -32,6 +48,7 @@ class MachineCommandMeta:
 
     request_type: type
     output_types: tuple[type, ...]
+    stream: MachineStreamSpec | None = None
 
 
 @dataclass(frozen=True)
@@ -46,6 +63,7 @@ def machine_command(
     *,
     request_type: type,
     output_types: tuple[type, ...],
+    stream: MachineStreamSpec | None = None,
 ) -> Any:
     """Decorator for machine-only CLI commands with dataclass-based input.
 
@@ -59,13 +77,21 @@ def machine_command(
     to_json_dict()) or a MachineCommandError. The decorator handles
     serialization.
 
+    With `stream`, the command also accepts --stream, and the callback
+    receives a `stream_mode: bool` keyword. In stream mode its result must
+    implement iter_json_items() (StreamableResult); items are written as
+    NDJSON lines as the iterator produces them, so a result that fetches
+    lazily streams rows before the fetch finishes. Errors, including ones
+    raised mid-stream, become a terminal error line.
+
     Args:
         request_type: Frozen dataclass type for input validation
         output_types: Result types for schema generation
+        stream: Streaming spec for list-returning commands, or None
     """
 
     def decorator(cmd: click.Command) -> click.Command:
-        return _apply_machine_command(cmd, request_type, output_types)
+        return _apply_machine_command(cmd, request_type, output_types, stream)
 
     return decorator
 
@@ -112,16 +138,33 @@ def emit_machine_result(result: Any) -> None:
     emit_json_success(data)
 
 
+def _emit_stream_error(error: MachineCommandError) -> None:
+    emit_ndjson_error(error_type=error.error_type, message=error.message)
+
+
+def emit_machine_stream(result: StreamableResult) -> None:
+    """Emit a result's items as an NDJSON stream.
+
+    Raises:
+        SystemExit: With code 1 if the stream ended in an error event.
+    """
+    if not emit_ndjson_stream(result.iter_json_items()):
+        raise SystemExit(1)
+
+
 def _apply_machine_command(
     cmd: click.Command,
     request_type: type,
     output_types: tuple[type, ...],
+    stream: MachineStreamSpec | None,
 ) -> click.Command:
     """Wire up the machine_command behavior on a Click command."""
-    cmd._machine_command_meta = MachineCommandMeta(  # type: ignore[attr-defined]
+    meta = MachineCommandMeta(
         request_type=request_type,
         output_types=output_types,
+        stream=stream,
     )
+    cmd._machine_command_meta = meta  # type: ignore[attr-defined]
 
     # Add --schema flag
     schema_option = click.Option(
@@ -132,25 +175,39 @@ def _apply_machine_command(
     )
     cmd.params.append(schema_option)
 
+    if stream is not None:
+        cmd.params.append(
+            click.Option(
+                ["--stream", "stream_mode"],
+                is_flag=True,
+                default=False,
+                help="Stream list items as NDJSON lines instead of one JSON document",
+            )
+        )
+
     original_callback = cmd.callback
     if original_callback is None:
         return cmd
 
     def wrapped_callback(**kwargs: Any) -> Any:
         schema_mode = kwargs.pop("schema_mode", False)
+        # Streaming callbacks take stream_mode themselves so they can build
+        # a lazily fetched result instead of the full list.
+        stream_mode = kwargs.get("stream_mode", False)
         if schema_mode:
             from erk_shared.agentclick.machine_schema import build_machine_schema_document
 
-            meta = MachineCommandMeta(request_type=request_type, output_types=output_types)
             schema_doc = build_machine_schema_document(meta)
             click.echo(json.dumps(schema_doc, indent=2))
             return None
 
+        emit_error = _emit_stream_error if stream_mode else emit_machine_error
+
         # Read JSON from stdin
         try:
             input_data = read_machine_command_input()
         except json.JSONDecodeError as exc:
-            emit_machine_error(
+            emit_error(
                 MachineCommandError(
                     error_type="invalid_json_input",
                     message=f"Invalid JSON: {exc}",
@@ -158,7 +215,7 @@ def _apply_machine_command(
             )
             raise SystemExit(1) from None
         except ValueError as exc:
-            emit_machine_error(
+            emit_error(
                 MachineCommandError(
                     error_type="invalid_json_input",
                     message=str(exc),
@@ -173,7 +230,7 @@ def _apply_machine_command(
         try:
             request = parse_machine_request(request_type, input_data)
         except ValueError as exc:
-            emit_machine_error(
+            emit_error(
                 MachineCommandError(
                     error_type="invalid_request",
                     message=str(exc),
@@ -186,15 +243,18 @@ def _apply_machine_command(
         try:
             result = original_callback(**kwargs)
             if isinstance(result, MachineCommandError):
-                emit_machine_error(result)
+                emit_error(result)
                 raise SystemExit(1)
             if result is not None:
-                emit_machine_result(result)
+                if stream_mode:
+                    emit_machine_stream(result)
+                else:
+                    emit_machine_result(result)
             return result
         except click.ClickException as exc:
             error_type_attr = getattr(exc, "error_type", None)
             if error_type_attr is not None:
-                emit_machine_error(
+                emit_error(
                     MachineCommandError(
                         error_type=str(error_type_attr),
                         message=exc.format_message(),
@@ -10,10 +10,12 @@ from typing import Any
 from erk_shared.agentclick.dataclass_json import (
     ERROR_SCHEMA,
     is_optional_type,
+    item_schema,
     output_schema,
     python_type_to_json_schema,
 )
 from erk_shared.agentclick.machine_command import MachineCommandMeta
+from erk_shared.agentclick.ndjson import ndjson_stream_schema
 
 
 def request_schema(request_type: type) -> dict[str, Any]:
@@ -64,7 +66,9 @@ def result_schema(result_types: tuple[type, ...]) -> dict[str, Any]:
 def build_machine_schema_document(meta: MachineCommandMeta) -> dict[str, Any]:
     """Build the full schema document for a @machine_command.
 
-    Returns a dict with input_schema, output_schema, and error_schema.
+    Returns a dict with input_schema, output_schema, and error_schema, plus
+    stream_schema (the schema of each --stream NDJSON line) for commands
+    that support streaming.
 
     Args:
         meta: MachineCommandMeta with request_type and output_types
@@ -72,8 +76,11 @@ def build_machine_schema_document(meta: MachineCommandMeta) -> dict[str, Any]:
     Returns:
         Complete schema document
     """
-    return {
+    document: dict[str, Any] = {
         "input_schema": request_schema(meta.request_type),
         "output_schema": result_schema(meta.output_types),
         "error_schema": ERROR_SCHEMA,
     }
+    if meta.stream is not None:
+        document["stream_schema"] = ndjson_stream_schema(item_schema(meta.stream.item_type))
+    return document
@@ -0,0 +1,160 @@
+"""NDJSON streaming output for list-returning machine commands.
+
+A streamed response is newline-delimited JSON, one event per line:
+
+    {"type": "item", "item": {...}}          one per list item, as produced
+    {"type": "result", "success": true, "count": N}
+    {"type": "error", "success": false, "error_type": "...", "message": "..."}
+
+Exactly one terminal event (result or error) ends the stream. An error can
+follow items that were already emitted. Items are written as they are
+produced, so when the producer fetches lazily (e.g. page by page) output
+starts before the whole list has been fetched.
+
+collect_ndjson_stream() rebuilds the equivalent non-streamed document
+(`{<items_key>: [...], "count": N, "success": true}`) for consumers that
+need it whole.
+"""
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Protocol
+
+import click
+
+NDJSON_ITEM = "item"
+NDJSON_RESULT = "result"
+NDJSON_ERROR = "error"
+
+
+class StreamableResult(Protocol):
+    """Result whose list items can be serialized one at a time."""
+
+    def iter_json_items(self) -> Iterator[dict[str, Any]]:
+        """Yield each list item as a JSON-compatible dict."""
+        ...
+
+
+def emit_ndjson_stream(items: Iterable[dict[str, Any]]) -> bool:
+    """Write one item event per item, then the terminal event.
+
+    items may be a lazy iterator that fetches as it goes; each item is
+    written as soon as it is produced. If producing an item fails, the
+    items already written stand and an error event ends the stream.
+
+    Returns:
+        True if the stream ended with a result event, False with an error
+    """
+    count = 0
+    iterator = iter(items)
+    while True:
+        # Error boundary: a failing fetch mid-stream must still end the
+        # stream with a terminal event, after the items already written.
+        try:
+            item = next(iterator, None)
+        except Exception as exc:
+            error_type = getattr(exc, "error_type", None)
+            emit_ndjson_error(
+                error_type=str(error_type) if error_type is not None else "stream_failed",
+                message=_error_message(exc),
+            )
+            return False
+        if item is None:
+            break
+        click.echo(json.dumps({"type": NDJSON_ITEM, "item": item}))
+        count += 1
+    click.echo(json.dumps({"type": NDJSON_RESULT, "success": True, "count": count}))
+    return True
+
+
+def _error_message(exc: Exception) -> str:
+    if isinstance(exc, click.ClickException):
+        return exc.format_message()
+    return str(exc)
+
+
+def emit_ndjson_error(*, error_type: str, message: str) -> None:
+    """Write the terminal error event."""
+    click.echo(
+        json.dumps(
+            {
+                "type": NDJSON_ERROR,
+                "success": False,
+                "error_type": error_type,
+                "message": message,
+            }
+        )
+    )
+
+
+def collect_ndjson_stream(
+    lines: Iterable[str],
+    *,
+    items_key: str,
+    on_item: Callable[[dict[str, Any]], None] | None,
+) -> dict[str, Any]:
+    """Read a stream back into the equivalent non-streamed document.
+
+    Args:
+        lines: NDJSON lines (blank lines are ignored)
+        items_key: Key the items are listed under in the non-streamed output
+        on_item: Called with each item as soon as its line is read
+
+    Returns:
+        The success document, or the error event (without its "type") if
+        the stream ended in an error.
+
+    Raises:
+        ValueError: If the stream has no terminal event or a line is not a
+            stream event.
+    """
+    items: list[dict[str, Any]] = []
+    for line in lines:
+        if not line.strip():
+            continue
+        event = json.loads(line)
+        event_type = event.get("type") if isinstance(event, dict) else None
+        if event_type == NDJSON_ITEM:
+            items.append(event["item"])
+            if on_item is not None:
+                on_item(event["item"])
+        elif event_type == NDJSON_RESULT:
+            return {items_key: items, "count": event["count"], "success": True}
+        elif event_type == NDJSON_ERROR:
+            return {key: value for key, value in event.items() if key != "type"}
+        else:
+            raise ValueError(f"Not an NDJSON stream event: {line.strip()[:200]}")
+    raise ValueError(f"NDJSON stream ended after {len(items)} items without a result event")
+
+
+def ndjson_stream_schema(item_schema: dict[str, Any]) -> dict[str, Any]:
+    """JSON Schema for each line of a stream whose items match item_schema."""
+    return {
+        "format": "ndjson",
+        "oneOf": [
+            {
+                "type": "object",
+                "properties": {"type": {"const": NDJSON_ITEM}, "item": item_schema},
+                "required": ["item", "type"],
+            },
+            {
+                "type": "object",
+                "properties": {
+                    "type": {"const": NDJSON_RESULT},
+                    "success": {"type": "boolean", "const": True},
+                    "count": {"type": "integer"},
+                },
+                "required": ["count", "success", "type"],
+            },
+            {
+                "type": "object",
+                "properties": {
+                    "type": {"const": NDJSON_ERROR},
+                    "success": {"type": "boolean", "const": False},
+                    "error_type": {"type": "string"},
+                    "message": {"type": "string"},
+                },
+                "required": ["error_type", "message", "success", "type"],
+            },
+        ],
+    }
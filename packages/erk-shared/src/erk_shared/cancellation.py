@@ -0,0 +1,67 @@
+"""Cooperative cancellation for in-process operations.
+
+The TUI runs some erk commands on worker threads (see
+erk.tui.operations.in_process). A thread cannot be killed, so a cancelled
+operation stops at its next checkpoint instead: any output write, and the
+start of every subprocess and HTTP request made through the shared gateway
+helpers. Checkpoints raise OperationCancelledError, which unwinds the command.
+
+The flag lives in a context variable, so only the operation that was
+cancelled observes it; other operations and the CLI itself are unaffected.
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Cancel flag of the operation running in the current context, or None when
+# the current code is not cancellable (normal CLI runs).
+_cancel_event: ContextVar[threading.Event | None] = ContextVar("erk_cancel_event", default=None)
+
+
+class OperationCancelledError(BaseException):
+    """Raised at a checkpoint once the running operation has been cancelled.
+
+    Derives from BaseException so that the `except Exception` error
+    boundaries inside commands do not swallow it and carry on.
+    """
+
+
+@contextmanager
+def cancellable(event: threading.Event) -> Iterator[None]:
+    """Make checkpoints in this context raise once event is set.
+
+    Args:
+        event: Cancel flag for the operation, set from another thread
+    """
+    token = _cancel_event.set(event)
+    try:
+        yield
+    finally:
+        _cancel_event.reset(token)
+
+
+def bind_cancel_event(event: threading.Event | None) -> None:
+    """Set this context's cancel flag for the rest of its life.
+
+    For thread-pool initializers, whose worker context has no scope to
+    reset; everything else should use cancellable().
+    """
+    _cancel_event.set(event)
+
+
+def current_cancel_event() -> threading.Event | None:
+    """Return the cancel flag of this context, or None if not cancellable."""
+    return _cancel_event.get()
+
+
+def raise_if_cancelled() -> None:
+    """Checkpoint: stop the current operation if it has been cancelled.
+
+    Raises:
+        OperationCancelledError: If this context's cancel flag is set.
+    """
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise OperationCancelledError
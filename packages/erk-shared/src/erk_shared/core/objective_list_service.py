@@ -7,6 +7,7 @@ are GitHub issues with the 'erk-objective' label. No labels parameter is exposed
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 from erk_shared.core.pr_list_service import PrListData
@@ -49,3 +50,33 @@ class ObjectiveListService(ABC):
             PrListData containing objectives as plans, PR linkages, and workflow runs
         """
         ...
+
+    @abstractmethod
+    def iter_objective_list_pages(
+        self,
+        *,
+        location: GitHubRepoLocation,
+        state: IssueFilterState,
+        limit: int | None,
+        page_size: int,
+        skip_workflow_runs: bool,
+        creator: str | None,
+        exclude_labels: list[str] | None,
+        http_client: HttpClient,
+    ) -> Iterator[PrListData]:
+        """Fetch objective list data lazily, one page at a time.
+
+        Args:
+            location: GitHub repository location (local root + repo identity)
+            state: Filter by state ("open" or "closed")
+            limit: Maximum number of objectives across all pages (None for the
+                same default as get_objective_list_data)
+            page_size: Maximum number of objectives fetched per page
+            skip_workflow_runs: If True, skip fetching workflow runs
+            creator: Filter by creator username
+            exclude_labels: Labels to exclude from results
+
+        Yields:
+            PrListData for each page, in fetch order
+        """
+        ...
@@ -7,6 +7,7 @@ The real implementation remains in erk.core.services.plan_list_service.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -83,3 +84,40 @@ class PrListService(ABC):
             PrListData containing PRs, PR linkages, and workflow runs
         """
         ...
+
+    @abstractmethod
+    def iter_pr_list_pages(
+        self,
+        *,
+        location: GitHubRepoLocation,
+        labels: list[str],
+        state: IssueFilterState,
+        limit: int | None,
+        page_size: int,
+        skip_workflow_runs: bool,
+        creator: str | None,
+        exclude_labels: list[str] | None,
+        http_client: HttpClient,
+    ) -> Iterator[PrListData]:
+        """Fetch PR list data lazily, one page of plans at a time.
+
+        Each page is fetched and enriched only when the caller asks for it,
+        so the first rows are available before later pages are requested.
+        Concatenating the pages gives the plans get_pr_list_data() returns
+        for the same arguments.
+
+        Args:
+            location: GitHub repository location (local root + repo identity)
+            labels: Labels to filter issues by (e.g., ["erk-pr"])
+            state: Filter by state ("open" or "closed")
+            limit: Maximum number of issues across all pages (None for the
+                same default as get_pr_list_data)
+            page_size: Maximum number of issues fetched per page
+            skip_workflow_runs: If True, skip fetching workflow runs
+            creator: Filter by creator username
+            exclude_labels: Labels to exclude from results
+
+        Yields:
+            PrListData for each page, in fetch order
+        """
+        ...
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import time
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -121,6 +121,21 @@ class PromptResult:
     error: str | None
 
 
+@dataclass(frozen=True)
+class PromptRequest:
+    """Arguments for one execute_prompt() call in a batch.
+
+    Attributes mirror the keyword arguments of PromptExecutor.execute_prompt().
+    """
+
+    prompt: str
+    model: str
+    tools: list[str] | None
+    cwd: Path | None
+    system_prompt: str | None
+    dangerous: bool
+
+
 @dataclass(frozen=True)
 class CommandResult:
     """Result of executing a Claude CLI command.
@@ -156,6 +171,15 @@ class PromptExecutor(ABC):
         """Human-readable label for progress messages (e.g., 'Claude', 'Anthropic API')."""
         return "Claude"
 
+    def uncached(self) -> PromptExecutor:
+        """Return an executor whose execute_prompt() never serves cached results.
+
+        Call sites that must reach the model every time (e.g. credential
+        checks) use this to opt out of prompt result caching. Executors
+        without a cache return themselves.
+        """
+        return self
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the prompt executor backend is available.
@@ -391,6 +415,37 @@ class PromptExecutor(ABC):
         """
         ...
 
+    def execute_prompts_batch(
+        self,
+        requests: Sequence[PromptRequest],
+        *,
+        max_concurrency: int,
+    ) -> list[PromptResult]:
+        """Execute several independent prompts and return results in request order.
+
+        The default implementation runs prompts one at a time via
+        execute_prompt(). Executors that can issue requests concurrently
+        (e.g. AnthropicApiPromptExecutor) override this.
+
+        Args:
+            requests: Prompts to execute
+            max_concurrency: Upper bound on prompts in flight at once
+
+        Returns:
+            One PromptResult per request, in the same order
+        """
+        return [
+            self.execute_prompt(
+                request.prompt,
+                model=request.model,
+                tools=request.tools,
+                cwd=request.cwd,
+                system_prompt=request.system_prompt,
+                dangerous=request.dangerous,
+            )
+            for request in requests
+        ]
+
     @abstractmethod
     def execute_prompt_passthrough(
         self,
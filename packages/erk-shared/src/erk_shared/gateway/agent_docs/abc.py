@@ -74,3 +74,28 @@ class AgentDocs(ABC):
             Formatted markdown content
         """
         ...
+
+    @abstractmethod
+    def read_sync_manifest(self, project_root: Path) -> str | None:
+        """Read the docs sync manifest cached from the previous sync.
+
+        The manifest lives outside docs/learned/ (in .erk/scratch/) and is
+        never committed.
+
+        Args:
+            project_root: Root of the project
+
+        Returns:
+            Manifest content, or None if no sync has recorded one
+        """
+        ...
+
+    @abstractmethod
+    def write_sync_manifest(self, project_root: Path, content: str) -> None:
+        """Write the docs sync manifest.
+
+        Args:
+            project_root: Root of the project
+            content: Manifest content to write
+        """
+        ...
@@ -14,6 +14,7 @@ class DryRunAgentDocs(AgentDocs):
 
     Read-only methods delegate to the wrapped implementation.
     Mutation methods (write_file) are no-ops that log what would happen.
+    The sync manifest is a cache, so writing it is a silent no-op.
     """
 
     def __init__(self, wrapped: AgentDocs) -> None:
@@ -33,3 +34,9 @@ class DryRunAgentDocs(AgentDocs):
 
     def format_markdown(self, content: str) -> str:
         return self._wrapped.format_markdown(content)
+
+    def read_sync_manifest(self, project_root: Path) -> str | None:
+        return self._wrapped.read_sync_manifest(project_root)
+
+    def write_sync_manifest(self, project_root: Path, content: str) -> None:
+        return None
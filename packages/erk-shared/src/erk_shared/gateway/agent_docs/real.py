@@ -4,12 +4,17 @@ Production implementation that reads/writes to docs/learned/ directory
 and formats markdown with prettier.
 """
 
+import os
 from pathlib import Path
 
 from erk_shared.gateway.agent_docs.abc import AgentDocs
 from erk_shared.subprocess_utils import run_subprocess_with_context
 
 
+def _sync_manifest_path(project_root: Path) -> Path:
+    return project_root / ".erk" / "scratch" / "docs-sync-manifest.json"
+
+
 class RealAgentDocs(AgentDocs):
     """Production implementation backed by filesystem."""
 
@@ -109,3 +114,30 @@ class RealAgentDocs(AgentDocs):
             input=result.stdout,
         )
         return result.stdout
+
+    def read_sync_manifest(self, project_root: Path) -> str | None:
+        """Read .erk/scratch/docs-sync-manifest.json.
+
+        Args:
+            project_root: Root of the project
+
+        Returns:
+            Manifest content, or None if the file does not exist
+        """
+        manifest_path = _sync_manifest_path(project_root)
+        if not manifest_path.exists():
+            return None
+        return manifest_path.read_text(encoding="utf-8")
+
+    def write_sync_manifest(self, project_root: Path, content: str) -> None:
+        """Atomically write .erk/scratch/docs-sync-manifest.json.
+
+        Args:
+            project_root: Root of the project
+            content: Manifest content to write
+        """
+        manifest_path = _sync_manifest_path(project_root)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        tmp_path.replace(manifest_path)
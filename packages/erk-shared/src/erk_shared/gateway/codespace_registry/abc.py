@@ -78,3 +78,18 @@ class CodespaceRegistry(ABC):
             The default codespace name if set, None otherwise
         """
         ...
+
+    @abstractmethod
+    def get_last_started_at(self, name: str) -> datetime | None:
+        """Get when erk last started or connected to a codespace.
+
+        Remote launches use this to skip the start request for a codespace
+        that was used moments ago and is therefore still running.
+
+        Args:
+            name: Friendly name of the codespace
+
+        Returns:
+            Time of the last recorded start, or None if never recorded
+        """
+        ...
@@ -56,6 +56,8 @@ def _save_toml_data(config_path: Path, data: dict) -> None:
         codespace_table = tomlkit.table()
         codespace_table["gh_name"] = codespace_data["gh_name"]
         codespace_table["created_at"] = codespace_data["created_at"]
+        if codespace_data.get("last_started_at") is not None:
+            codespace_table["last_started_at"] = codespace_data["last_started_at"]
         codespaces_table[name] = codespace_table
 
     doc["codespaces"] = codespaces_table
@@ -109,6 +111,7 @@ class RealCodespaceRegistry(CodespaceRegistry):
         config_path: Path,
         codespaces: dict[str, RegisteredCodespace],
         default_codespace: str | None,
+        last_started: dict[str, datetime],
     ) -> None:
         """Initialize the registry with loaded data.
 
@@ -116,10 +119,12 @@ class RealCodespaceRegistry(CodespaceRegistry):
             config_path: Path to the codespaces.toml config file.
             codespaces: Dict mapping names to RegisteredCodespace instances.
             default_codespace: Name of the default codespace, or None.
+            last_started: Dict mapping names to their last recorded start time.
         """
         self._config_path = config_path
         self._codespaces = codespaces
         self._default_codespace = default_codespace
+        self._last_started = last_started
 
     @staticmethod
     def from_config_path(config_path: Path) -> "RealCodespaceRegistry":
@@ -138,10 +143,16 @@ class RealCodespaceRegistry(CodespaceRegistry):
             name: _codespace_from_dict(name, cdata) for name, cdata in codespaces_data.items()
         }
         default_codespace = data.get("default_codespace")
+        last_started = {
+            name: datetime.fromisoformat(cdata["last_started_at"])
+            for name, cdata in codespaces_data.items()
+            if "last_started_at" in cdata
+        }
         return RealCodespaceRegistry(
             config_path=config_path,
             codespaces=codespaces,
             default_codespace=default_codespace,
+            last_started=last_started,
         )
 
     @property
@@ -167,6 +178,10 @@ class RealCodespaceRegistry(CodespaceRegistry):
         """Get the name of the default codespace."""
         return self._default_codespace
 
+    def get_last_started_at(self, name: str) -> datetime | None:
+        """Get when erk last started or connected to a codespace."""
+        return self._last_started.get(name)
+
 
 # Standalone mutation functions that save to disk and return new registry
 
@@ -251,3 +266,30 @@ def set_default_codespace(
     data["default_codespace"] = name
     _save_toml_data(config_path, data)
     return RealCodespaceRegistry.from_config_path(config_path)
+
+
+def record_codespace_started(
+    config_path: Path,
+    name: str,
+    started_at: datetime,
+) -> None:
+    """Record that a codespace was just started or connected to.
+
+    This is cache state for skipping redundant start requests, so it is
+    best-effort: nothing is written when the config file or the entry does
+    not exist.
+
+    Args:
+        config_path: Path to the codespaces.toml config file.
+        name: Name of the codespace that was started.
+        started_at: When the codespace was started.
+    """
+    if not config_path.exists():
+        return
+    data = _load_toml_data(config_path)
+    codespaces = data.get("codespaces", {})
+    if name not in codespaces:
+        return
+    codespaces[name]["last_started_at"] = started_at.isoformat()
+    data["codespaces"] = codespaces
+    _save_toml_data(config_path, data)
@@ -6,7 +6,7 @@ import sys
 import click
 
 from erk_shared.gateway.console.abc import Console
-from erk_shared.output.output import user_output
+from erk_shared.output.output import is_output_redirected, user_output
 
 
 class InteractiveConsole(Console):
@@ -19,9 +19,9 @@ class InteractiveConsole(Console):
         """Check if stdin is connected to an interactive terminal.
 
         Returns:
-            True if stdin is a TTY, False otherwise
+            True if stdin is a TTY and output is not redirected, False otherwise
         """
-        return sys.stdin.isatty()
+        return not is_output_redirected() and sys.stdin.isatty()
 
     def is_stdout_tty(self) -> bool:
         """Check if stdout is connected to a TTY.
@@ -61,7 +61,12 @@ class InteractiveConsole(Console):
 
         Returns:
             True if the user confirmed, False otherwise.
+
+        Raises:
+            click.Abort: If output is redirected, since there is no terminal to answer.
         """
+        if is_output_redirected():
+            raise click.Abort()
         sys.stderr.flush()
         return click.confirm(prompt, default=default, err=True)
 
@@ -6,7 +6,6 @@ for config, command history, and version tracking.
 
 from __future__ import annotations
 
-import json
 import os
 import tomllib
 from pathlib import Path
@@ -265,57 +264,20 @@ class RealErkInstallation(ErkInstallation):
             PoolState if file exists and is valid, None otherwise
         """
         # Import here to avoid circular dependency at module level
-        from erk.core.worktree_pool import PoolState, SlotAssignment, SlotInfo
+        from erk.core.worktree_pool import load_pool_state
 
-        if not pool_json_path.exists():
-            return None
-
-        content = pool_json_path.read_text(encoding="utf-8")
-        data = json.loads(content)
-
-        slots = tuple(SlotInfo(name=s["name"]) for s in data.get("slots", []))
-
-        assignments = tuple(
-            SlotAssignment(
-                slot_name=a["slot_name"],
-                branch_name=a["branch_name"],
-                assigned_at=a["assigned_at"],
-                worktree_path=Path(a["worktree_path"]),
-            )
-            for a in data.get("assignments", [])
-        )
-
-        return PoolState(
-            version=data.get("version", "1.0"),
-            pool_size=data.get("pool_size", 4),
-            slots=slots,
-            assignments=assignments,
-        )
+        return load_pool_state(pool_json_path)
 
     def save_pool_state(self, pool_json_path: Path, state: PoolState) -> None:
         """Save pool state to JSON file.
 
-        Creates parent directories if they don't exist.
+        Writes atomically (temp file + rename) and bumps the stored revision.
 
         Args:
             pool_json_path: Path to the pool.json file
             state: Pool state to persist
         """
-        pool_json_path.parent.mkdir(parents=True, exist_ok=True)
-
-        data = {
-            "version": state.version,
-            "pool_size": state.pool_size,
-            "slots": [{"name": s.name} for s in state.slots],
-            "assignments": [
-                {
-                    "slot_name": a.slot_name,
-                    "branch_name": a.branch_name,
-                    "assigned_at": a.assigned_at,
-                    "worktree_path": str(a.worktree_path),
-                }
-                for a in state.assignments
-            ],
-        }
-
-        pool_json_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Import here to avoid circular dependency at module level
+        from erk.core.worktree_pool import save_pool_state
+
+        save_pool_state(pool_json_path, state)
@@ -46,11 +46,23 @@ class BranchDivergence(NamedTuple):
 
 @dataclass(frozen=True)
 class WorktreeInfo:
-    """Information about a single git worktree."""
+    """Information about a single git worktree.
+
+    Attributes:
+        path: Worktree directory
+        branch: Checked-out branch, or None for a detached HEAD
+        is_root: True for the repository's main worktree
+        head: Commit SHA checked out in the worktree, if known
+        locked: True if the worktree is locked (`git worktree lock`)
+        prunable: True if git reports the worktree as prunable (its directory is gone)
+    """
 
     path: Path
     branch: str | None
     is_root: bool = False
+    head: str | None = None
+    locked: bool = False
+    prunable: bool = False
 
 
 @dataclass(frozen=True)
@@ -64,6 +76,43 @@ class BranchSyncInfo:
     gone: bool = False  # True if upstream tracking branch has been deleted
 
 
+@dataclass(frozen=True)
+class RemoteBranchState:
+    """A local branch compared with its remote-tracking ref (<remote>/<branch>).
+
+    Attributes:
+        branch: Local branch name
+        local_sha: Commit of the local branch, or None if it does not exist locally
+        exists_on_remote: True if the remote-tracking ref exists
+        remote_sha: Commit of the remote-tracking ref, if known
+        ahead: Commits on the local branch not present on the remote ref
+        behind: Commits on the remote ref not present on the local branch
+    """
+
+    branch: str
+    local_sha: str | None
+    exists_on_remote: bool
+    remote_sha: str | None
+    ahead: int
+    behind: int
+
+
+@dataclass(frozen=True)
+class LocalRefUpdate:
+    """One entry of a batched local branch ref update.
+
+    Attributes:
+        branch: Local branch name (without refs/heads/)
+        target_sha: Commit the branch should point at
+        expected_sha: Commit the branch must currently point at for the update
+            to apply, or None to skip the check
+    """
+
+    branch: str
+    target_sha: str
+    expected_sha: str | None
+
+
 @dataclass(frozen=True)
 class RebaseResult:
     """Result of a git rebase operation.
@@ -1,6 +1,7 @@
 """Abstract interface for git analysis operations."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from pathlib import Path
 
 
@@ -77,3 +78,28 @@ class GitAnalysisOps(ABC):
             Full diff as string
         """
         ...
+
+    @abstractmethod
+    def stream_diff_to_branch(
+        self,
+        cwd: Path,
+        branch: str,
+        *,
+        exclude_basenames: frozenset[str],
+    ) -> Iterator[str]:
+        """Stream the diff between branch and HEAD line by line.
+
+        Same three-dot comparison as get_diff_to_branch, but files whose
+        basename is in exclude_basenames are dropped by git itself (via
+        exclude pathspecs) and output is yielded as it is produced, so
+        callers never hold the full diff in memory.
+
+        Args:
+            cwd: Working directory
+            branch: Branch to diff against
+            exclude_basenames: File basenames to leave out of the diff
+
+        Yields:
+            Diff lines, including their trailing newline
+        """
+        ...
@@ -1,5 +1,6 @@
 """Dry-run wrapper for git analysis operations."""
 
+from collections.abc import Iterator
 from pathlib import Path
 
 from erk_shared.gateway.git.analysis_ops.abc import GitAnalysisOps
@@ -34,3 +35,13 @@ class DryRunGitAnalysisOps(GitAnalysisOps):
     def get_diff_to_branch(self, cwd: Path, branch: str) -> str:
         """Query operation (read-only, delegates to wrapped)."""
         return self._wrapped.get_diff_to_branch(cwd, branch)
+
+    def stream_diff_to_branch(
+        self,
+        cwd: Path,
+        branch: str,
+        *,
+        exclude_basenames: frozenset[str],
+    ) -> Iterator[str]:
+        """Query operation (read-only, delegates to wrapped)."""
+        return self._wrapped.stream_diff_to_branch(cwd, branch, exclude_basenames=exclude_basenames)
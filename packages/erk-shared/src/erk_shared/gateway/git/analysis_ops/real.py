@@ -1,6 +1,8 @@
 """Real implementation of git analysis operations."""
 
 import subprocess
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
 from erk_shared.gateway.git.analysis_ops.abc import GitAnalysisOps
@@ -73,3 +75,51 @@ class RealGitAnalysisOps(GitAnalysisOps):
             cwd=cwd,
         )
         return result.stdout
+
+    def stream_diff_to_branch(
+        self,
+        cwd: Path,
+        branch: str,
+        *,
+        exclude_basenames: frozenset[str],
+    ) -> Iterator[str]:
+        """Stream diff between branch and HEAD, excluding files by basename.
+
+        `:/` anchors the diff at the repository root so running from a
+        subdirectory still covers the whole tree, matching get_diff_to_branch.
+        """
+        cmd = ["git", "diff", "--no-color", "--no-ext-diff", f"{branch}...HEAD", "--", ":/"]
+        cmd.extend(f":(top,exclude,glob)**/{name}" for name in sorted(exclude_basenames))
+        # stderr goes to a temp file rather than a pipe: nothing reads stderr
+        # while stdout is consumed, so a full stderr pipe would block git
+        # and never reach EOF on stdout.
+        with tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace") as stderr_file:
+            process = subprocess.Popen(
+                cmd,
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+            assert process.stdout is not None
+            try:
+                yield from process.stdout
+                returncode = process.wait()
+            finally:
+                # Consumer stopped early: don't leave git blocked on a full pipe
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+
+        if returncode != 0:
+            raise RuntimeError(
+                f"Failed to stream diff to branch '{branch}'\n"
+                f"Command: {' '.join(cmd)}\n"
+                f"Exit code: {returncode}\n"
+                f"stderr: {stderr.strip()}"
+            )
@@ -7,13 +7,19 @@ including both mutation and query operations.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from erk_shared.gateway.git.branch_ops.types import BranchAlreadyExists, BranchCreated
 
 if TYPE_CHECKING:
-    from erk_shared.gateway.git.abc import BranchDivergence, BranchSyncInfo
+    from erk_shared.gateway.git.abc import (
+        BranchDivergence,
+        BranchSyncInfo,
+        LocalRefUpdate,
+        RemoteBranchState,
+    )
 
 
 class GitBranchOps(ABC):
@@ -245,6 +251,26 @@ class GitBranchOps(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_remote_branch_states(
+        self, repo_root: Path, remote: str, branches: Sequence[str]
+    ) -> dict[str, RemoteBranchState]:
+        """Compare many local branches with their remote-tracking refs at once.
+
+        Reads local and remote-tracking refs in a single for-each-ref pass, so
+        the cost does not grow with one subprocess per branch. Branches that
+        match their remote ref need no further work.
+
+        Args:
+            repo_root: Path to the git repository root
+            remote: Remote name (e.g., "origin")
+            branches: Local branch names to compare
+
+        Returns:
+            Dict mapping each requested branch to its RemoteBranchState.
+        """
+        ...
+
     @abstractmethod
     def get_behind_commit_authors(self, cwd: Path, branch: str) -> list[str]:
         """Get authors of commits on remote that are not in local branch.
@@ -293,6 +319,23 @@ class GitBranchOps(ABC):
         """
         ...
 
+    @abstractmethod
+    def update_local_refs(self, repo_root: Path, updates: Sequence[LocalRefUpdate]) -> None:
+        """Move several local branch refs in one atomic transaction.
+
+        Uses `git update-ref --stdin`, so either every ref is updated or none
+        is. An update whose expected_sha no longer matches fails the whole
+        transaction. Used to fast-forward branches that are not checked out.
+
+        Args:
+            repo_root: Path to the git repository root
+            updates: Ref updates to apply; an empty sequence is a no-op
+
+        Raises:
+            RuntimeError: If the transaction is rejected
+        """
+        ...
+
     @abstractmethod
     def reset_hard(self, cwd: Path, target_ref: str) -> None:
         """Reset the current branch to a target ref, updating index and working tree.
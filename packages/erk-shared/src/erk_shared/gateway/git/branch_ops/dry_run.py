@@ -1,8 +1,14 @@
 """No-op Git branch operations wrapper for dry-run mode."""
 
+from collections.abc import Sequence
 from pathlib import Path
 
-from erk_shared.gateway.git.abc import BranchDivergence, BranchSyncInfo
+from erk_shared.gateway.git.abc import (
+    BranchDivergence,
+    BranchSyncInfo,
+    LocalRefUpdate,
+    RemoteBranchState,
+)
 from erk_shared.gateway.git.branch_ops.abc import GitBranchOps
 from erk_shared.gateway.git.branch_ops.types import BranchAlreadyExists, BranchCreated
 from erk_shared.output.output import user_output
@@ -62,6 +68,14 @@ class DryRunGitBranchOps(GitBranchOps):
         """No-op for updating local ref in dry-run mode."""
         user_output(f"[DRY RUN] Would run: git update-ref refs/heads/{branch} {target_sha[:8]}")
 
+    def update_local_refs(self, repo_root: Path, updates: Sequence[LocalRefUpdate]) -> None:
+        """No-op for batched ref updates in dry-run mode."""
+        for update in updates:
+            user_output(
+                f"[DRY RUN] Would run: git update-ref refs/heads/{update.branch} "
+                f"{update.target_sha[:8]}"
+            )
+
     def reset_hard(self, cwd: Path, target_ref: str) -> None:
         """No-op for reset --hard in dry-run mode."""
         user_output(f"[DRY RUN] Would run: git reset --hard {target_ref[:8]}")
@@ -116,6 +130,12 @@ class DryRunGitBranchOps(GitBranchOps):
         """Check if a local branch has diverged from its remote tracking branch."""
         return self._wrapped.is_branch_diverged_from_remote(cwd, branch, remote)
 
+    def get_remote_branch_states(
+        self, repo_root: Path, remote: str, branches: Sequence[str]
+    ) -> dict[str, RemoteBranchState]:
+        """Compare local branches with their remote-tracking refs."""
+        return self._wrapped.get_remote_branch_states(repo_root, remote, branches)
+
     def get_behind_commit_authors(self, cwd: Path, branch: str) -> list[str]:
         """Get authors of commits on remote that are not in local branch."""
         return self._wrapped.get_behind_commit_authors(cwd, branch)
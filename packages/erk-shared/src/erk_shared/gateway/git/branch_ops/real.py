@@ -2,9 +2,15 @@
 
 import re
 import subprocess
+from collections.abc import Sequence
 from pathlib import Path
 
-from erk_shared.gateway.git.abc import BranchDivergence, BranchSyncInfo
+from erk_shared.gateway.git.abc import (
+    BranchDivergence,
+    BranchSyncInfo,
+    LocalRefUpdate,
+    RemoteBranchState,
+)
 from erk_shared.gateway.git.branch_ops.abc import GitBranchOps
 from erk_shared.gateway.git.branch_ops.types import BranchAlreadyExists, BranchCreated
 from erk_shared.gateway.git.lock import wait_for_index_lock
@@ -312,17 +318,8 @@ class RealGitBranchOps(GitBranchOps):
             upstream = parts[1] if len(parts) > 1 and parts[1] else None
             track = parts[2] if len(parts) > 2 else ""
 
-            ahead, behind = 0, 0
-            gone = False
-            if track:
-                gone = "gone" in track
-                # Parse "[ahead N, behind M]" or "[ahead N]" or "[behind M]"
-                ahead_match = re.search(r"ahead (\d+)", track)
-                behind_match = re.search(r"behind (\d+)", track)
-                if ahead_match:
-                    ahead = int(ahead_match.group(1))
-                if behind_match:
-                    behind = int(behind_match.group(1))
+            gone = "gone" in track
+            ahead, behind = _parse_upstream_track(track)
 
             sync_info[branch] = BranchSyncInfo(
                 branch=branch,
@@ -373,6 +370,85 @@ class RealGitBranchOps(GitBranchOps):
         is_diverged = ahead > 0 and behind > 0
         return BranchDivergence(is_diverged=is_diverged, ahead=ahead, behind=behind)
 
+    def get_remote_branch_states(
+        self, repo_root: Path, remote: str, branches: Sequence[str]
+    ) -> dict[str, RemoteBranchState]:
+        """Compare local branches with <remote>/<branch> using one for-each-ref pass.
+
+        Ahead/behind counts come from %(upstream:track) when the branch's
+        upstream is the remote ref being compared against. Only branches that
+        differ from their remote ref without such an upstream need a
+        `git rev-list --left-right --count` call.
+        """
+        remote_prefix = f"refs/remotes/{remote}/"
+        result = run_subprocess_with_context(
+            cmd=[
+                "git",
+                "for-each-ref",
+                "--format=%(refname)\t%(objectname)\t%(upstream)\t%(upstream:track)",
+                "refs/heads/",
+                remote_prefix,
+            ],
+            operation_context=f"read local and '{remote}' branch refs",
+            cwd=repo_root,
+        )
+
+        local_refs: dict[str, tuple[str, str, str]] = {}
+        remote_shas: dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            if not line:
+                continue
+            refname, sha, upstream, track = line.split("\t")
+            if refname.startswith("refs/heads/"):
+                local_refs[refname.removeprefix("refs/heads/")] = (sha, upstream, track)
+            elif refname.startswith(remote_prefix):
+                remote_shas[refname.removeprefix(remote_prefix)] = sha
+
+        states: dict[str, RemoteBranchState] = {}
+        for branch in branches:
+            local = local_refs.get(branch)
+            local_sha = local[0] if local is not None else None
+            remote_sha = remote_shas.get(branch)
+            ahead, behind = 0, 0
+            if local is not None and remote_sha is not None and local_sha != remote_sha:
+                _, upstream, track = local
+                if upstream == f"{remote_prefix}{branch}":
+                    ahead, behind = _parse_upstream_track(track)
+                else:
+                    ahead, behind = self._count_ahead_behind(
+                        repo_root, branch, f"{remote_prefix}{branch}"
+                    )
+            states[branch] = RemoteBranchState(
+                branch=branch,
+                local_sha=local_sha,
+                exists_on_remote=remote_sha is not None,
+                remote_sha=remote_sha,
+                ahead=ahead,
+                behind=behind,
+            )
+        return states
+
+    def _count_ahead_behind(self, repo_root: Path, branch: str, other_ref: str) -> tuple[int, int]:
+        """Count commits unique to each side of branch...other_ref.
+
+        Raises:
+            RuntimeError: If git cannot compare the refs; reporting 0/0 would
+                make an unrelated or unreadable branch look in sync.
+        """
+        result = run_subprocess_with_context(
+            cmd=[
+                "git",
+                "rev-list",
+                "--left-right",
+                "--count",
+                f"refs/heads/{branch}...{other_ref}",
+            ],
+            operation_context=f"count commits between '{branch}' and '{other_ref}'",
+            cwd=repo_root,
+        )
+        ahead, behind = result.stdout.split()
+        return int(ahead), int(behind)
+
     def get_behind_commit_authors(self, cwd: Path, branch: str) -> list[str]:
         """Get authors of commits on remote that are not in local branch."""
         # Check if branch has upstream
@@ -427,6 +503,23 @@ class RealGitBranchOps(GitBranchOps):
             cwd=repo_root,
         )
 
+    def update_local_refs(self, repo_root: Path, updates: Sequence[LocalRefUpdate]) -> None:
+        """Apply all ref updates in one `git update-ref --stdin` transaction."""
+        if not updates:
+            return
+        commands = "".join(
+            f"update refs/heads/{update.branch} {update.target_sha}"
+            + (f" {update.expected_sha}" if update.expected_sha is not None else "")
+            + "\n"
+            for update in updates
+        )
+        run_subprocess_with_context(
+            cmd=["git", "update-ref", "--stdin"],
+            operation_context=f"update {len(updates)} local branch ref(s)",
+            cwd=repo_root,
+            input=commands,
+        )
+
     def reset_hard(self, cwd: Path, target_ref: str) -> None:
         """Reset the current branch to a target ref, updating index and working tree."""
         run_subprocess_with_context(
@@ -473,3 +566,12 @@ class RealGitBranchOps(GitBranchOps):
                     }
                 )
         return commits
+
+
+def _parse_upstream_track(track: str) -> tuple[int, int]:
+    """Parse %(upstream:track) output ("[ahead N, behind M]", "[gone]", "") into counts."""
+    ahead_match = re.search(r"ahead (\d+)", track)
+    behind_match = re.search(r"behind (\d+)", track)
+    ahead = int(ahead_match.group(1)) if ahead_match else 0
+    behind = int(behind_match.group(1)) if behind_match else 0
+    return ahead, behind
@@ -76,7 +76,12 @@ class RealGitCommitOps(GitCommitOps):
         files: dict[str, str],
         message: str,
     ) -> None:
-        """Create a commit on a branch using git plumbing (no checkout)."""
+        """Create a commit on a branch using git plumbing (no checkout).
+
+        Runs a fixed number of git processes regardless of file count: all
+        blobs are written by one `hash-object --stdin-paths` call and staged
+        by one `update-index --index-info` call.
+        """
         # Get parent commit SHA
         parent_sha = run_subprocess_with_context(
             cmd=["git", "rev-parse", branch],
@@ -84,12 +89,11 @@ class RealGitCommitOps(GitCommitOps):
             cwd=cwd,
         ).stdout.strip()
 
-        # Create temporary index file to avoid touching the real index
-        tmp_fd, tmp_index = tempfile.mkstemp(suffix=".idx", prefix="erk-pr-")
-        os.close(tmp_fd)
-        try:
+        # Temp dir holds a private index (to avoid touching the real one) and
+        # the file contents for bulk hashing
+        with tempfile.TemporaryDirectory(prefix="erk-pr-") as tmp_dir:
             env = os.environ.copy()
-            env["GIT_INDEX_FILE"] = tmp_index
+            env["GIT_INDEX_FILE"] = str(Path(tmp_dir) / "index")
 
             # Read parent tree into temp index
             run_subprocess_with_context(
@@ -99,21 +103,34 @@ class RealGitCommitOps(GitCommitOps):
                 env=env,
             )
 
-            # Hash each file and add to temp index
-            for path, content in files.items():
-                blob_sha = run_subprocess_with_context(
-                    cmd=["git", "hash-object", "-w", "--stdin"],
-                    operation_context=f"hash content for {path}",
+            if files:
+                paths = list(files)
+                blob_sources: list[str] = []
+                for position, path in enumerate(paths):
+                    blob_source = Path(tmp_dir) / f"blob-{position}"
+                    blob_source.write_text(files[path], encoding="utf-8")
+                    blob_sources.append(str(blob_source))
+
+                # Hash all files in one process; --no-filters matches hashing
+                # raw content from stdin
+                blob_shas = run_subprocess_with_context(
+                    cmd=["git", "hash-object", "-w", "--no-filters", "--stdin-paths"],
+                    operation_context=f"hash content for {len(paths)} file(s)",
                     cwd=cwd,
-                    input=content,
-                ).stdout.strip()
+                    input="".join(f"{source}\n" for source in blob_sources),
+                ).stdout.split()
 
-                cacheinfo = f"100644,{blob_sha},{path}"
+                # Add all blobs to temp index in one process
+                index_info = "".join(
+                    f"100644 {blob_sha}\t{path}\0"
+                    for blob_sha, path in zip(blob_shas, paths, strict=True)
+                )
                 run_subprocess_with_context(
-                    cmd=["git", "update-index", "--add", "--cacheinfo", cacheinfo],
-                    operation_context=f"add {path} to temp index",
+                    cmd=["git", "update-index", "-z", "--index-info"],
+                    operation_context=f"add {len(paths)} file(s) to temp index",
                     cwd=cwd,
                     env=env,
+                    input=index_info,
                 )
 
             # Write tree from temp index
@@ -124,21 +141,19 @@ class RealGitCommitOps(GitCommitOps):
                 env=env,
             ).stdout.strip()
 
-            # Create commit object
-            commit_sha = run_subprocess_with_context(
-                cmd=["git", "commit-tree", tree_sha, "-p", parent_sha, "-m", message],
-                operation_context="create commit on branch",
-                cwd=cwd,
-            ).stdout.strip()
+        # Create commit object
+        commit_sha = run_subprocess_with_context(
+            cmd=["git", "commit-tree", tree_sha, "-p", parent_sha, "-m", message],
+            operation_context="create commit on branch",
+            cwd=cwd,
+        ).stdout.strip()
 
-            # Update branch ref
-            run_subprocess_with_context(
-                cmd=["git", "update-ref", f"refs/heads/{branch}", commit_sha],
-                operation_context=f"update ref for {branch}",
-                cwd=cwd,
-            )
-        finally:
-            Path(tmp_index).unlink(missing_ok=True)
+        # Update branch ref
+        run_subprocess_with_context(
+            cmd=["git", "update-ref", f"refs/heads/{branch}", commit_sha],
+            operation_context=f"update ref for {branch}",
+            cwd=cwd,
+        )
 
     # ============================================================================
     # Query Operations
@@ -6,6 +6,7 @@ worktree commands via subprocess.
 
 import os
 import subprocess
+from dataclasses import replace
 from pathlib import Path
 
 from erk_shared.gateway.git.abc import WorktreeInfo
@@ -28,31 +29,34 @@ class RealWorktree(Worktree):
         )
 
         worktrees: list[WorktreeInfo] = []
-        current_path: Path | None = None
-        current_branch: str | None = None
+        current: WorktreeInfo | None = None
 
+        # Records are blank-line separated; "locked" and "prunable" may carry a reason
         for line in result.stdout.splitlines():
             line = line.strip()
             if line.startswith("worktree "):
-                current_path = Path(line.split(maxsplit=1)[1])
-                current_branch = None
+                current = WorktreeInfo(path=Path(line.split(maxsplit=1)[1]), branch=None)
+            elif current is None:
+                continue
             elif line.startswith("branch "):
-                if current_path is None:
-                    continue
                 branch_ref = line.split(maxsplit=1)[1]
-                current_branch = branch_ref.replace("refs/heads/", "")
-            elif line == "" and current_path is not None:
-                worktrees.append(WorktreeInfo(path=current_path, branch=current_branch))
-                current_path = None
-                current_branch = None
-
-        if current_path is not None:
-            worktrees.append(WorktreeInfo(path=current_path, branch=current_branch))
+                current = replace(current, branch=branch_ref.replace("refs/heads/", ""))
+            elif line.startswith("HEAD "):
+                current = replace(current, head=line.split(maxsplit=1)[1])
+            elif line == "locked" or line.startswith("locked "):
+                current = replace(current, locked=True)
+            elif line == "prunable" or line.startswith("prunable "):
+                current = replace(current, prunable=True)
+            elif line == "":
+                worktrees.append(current)
+                current = None
+
+        if current is not None:
+            worktrees.append(current)
 
         # Mark first worktree as root (git guarantees this ordering)
         if worktrees:
-            first = worktrees[0]
-            worktrees[0] = WorktreeInfo(path=first.path, branch=first.branch, is_root=True)
+            worktrees[0] = replace(worktrees[0], is_root=True)
 
         return worktrees
 
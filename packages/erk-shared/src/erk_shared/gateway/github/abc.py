@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from erk_shared.gateway.github.issues.types import IssueInfo
+from erk_shared.gateway.github.run_correlation import WorkflowRunResult
 from erk_shared.gateway.github.types import (
     BodyContent,
     GitHubRepoLocation,
     IssueFilterState,
     IssueOrPullRequest,
+    IssuesWithPrLinkagesPage,
     MergeError,
     MergeResult,
     PRCheckRun,
@@ -20,6 +24,7 @@ from erk_shared.gateway.github.types import (
     PRNotFound,
     PRReview,
     PRReviewThread,
+    PRReviewThreadPage,
     PullRequestInfo,
     WorkflowRun,
 )
@@ -111,6 +116,50 @@ class LocalGitHub(ABC):
         """
         ...
 
+    @abstractmethod
+    def start_workflow(
+        self, *, repo_root: Path, workflow: str, inputs: dict[str, str], ref: str | None
+    ) -> str:
+        """Dispatch a GitHub Actions workflow without waiting for its run.
+
+        Use with resolve_workflow_runs() to dispatch several workflows and
+        then find all of their runs in one polling loop.
+
+        Args:
+            repo_root: Repository root directory
+            workflow: Workflow filename (e.g., "implement-plan.yml")
+            inputs: Workflow inputs as key-value pairs
+            ref: Branch or tag to run workflow from (default: repository default branch)
+
+        Returns:
+            The distinct_id passed to the workflow for run correlation
+        """
+        ...
+
+    @abstractmethod
+    def resolve_workflow_runs(
+        self,
+        *,
+        repo_root: Path,
+        workflow: str,
+        distinct_ids: list[str],
+        dispatched_at: datetime,
+    ) -> dict[str, WorkflowRunResult]:
+        """Find the runs created by start_workflow() calls.
+
+        Args:
+            repo_root: Repository root directory
+            workflow: Workflow filename shared by all dispatches
+            distinct_ids: IDs returned by start_workflow()
+            dispatched_at: Time just before the first dispatch was sent
+
+        Returns:
+            Mapping of distinct_id -> WorkflowRunFound, WorkflowRunSkipped (the
+            run was skipped or cancelled) or WorkflowRunNotFound (no run
+            appeared before polling gave up). Every ID resolves independently.
+        """
+        ...
+
     @abstractmethod
     def create_pr(
         self,
@@ -425,6 +474,38 @@ class LocalGitHub(ABC):
         """
         ...
 
+    @abstractmethod
+    def iter_issues_with_pr_linkages_pages(
+        self,
+        *,
+        location: GitHubRepoLocation,
+        labels: list[str],
+        state: IssueFilterState,
+        limit: int | None,
+        page_size: int,
+        creator: str | None,
+    ) -> Iterator[IssuesWithPrLinkagesPage]:
+        """Stream the issues of get_issues_with_pr_linkages() one page at a time.
+
+        Pages are fetched lazily as the iterator is consumed, so a caller can
+        process the first issues before later pages are requested. The
+        issues across all pages match get_issues_with_pr_linkages() with the
+        same arguments.
+
+        Args:
+            location: GitHub repository location (local root + repo identity)
+            labels: Labels to filter by (e.g., ["erk-objective"])
+            state: Filter by state ("open" or "closed")
+            limit: Maximum issues to return across all pages (None for the
+                same default as get_issues_with_pr_linkages())
+            page_size: Maximum issues per page
+            creator: Filter by creator username, or None for all creators
+
+        Returns:
+            Iterator of pages, most recently updated issues first
+        """
+        ...
+
     @abstractmethod
     def get_pr(self, repo_root: Path, pr_number: int) -> PRDetails | PRNotFound:
         """Get comprehensive PR details in a single API call.
@@ -455,6 +536,42 @@ class LocalGitHub(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_pr_details_by_numbers(
+        self, repo_root: Path, pr_numbers: list[int]
+    ) -> dict[int, PRDetails]:
+        """Batch variant of get_pr().
+
+        Fetches PRs with aliased GraphQL queries, up to 50 PRs per request,
+        so N PRs cost ceil(N/50) round-trips instead of N.
+
+        Args:
+            repo_root: Repository root directory
+            pr_numbers: PR numbers to query
+
+        Returns:
+            Mapping of pr_number -> PRDetails. PRs that don't exist are omitted.
+        """
+        ...
+
+    @abstractmethod
+    def get_pr_details_by_branches(
+        self, repo_root: Path, branches: list[str]
+    ) -> dict[str, PRDetails]:
+        """Batch variant of get_pr_for_branch().
+
+        Looks up the most recently created PR (any state) for each head branch,
+        up to 50 branches per GraphQL request.
+
+        Args:
+            repo_root: Repository root directory
+            branches: Branch names to look up
+
+        Returns:
+            Mapping of branch -> PRDetails. Branches without a PR are omitted.
+        """
+        ...
+
     @abstractmethod
     def list_prs(
         self,
@@ -635,6 +752,34 @@ class LocalGitHub(ABC):
         """
         ...
 
+    @abstractmethod
+    def iter_pr_review_thread_pages(
+        self,
+        repo_root: Path,
+        pr_number: int,
+        *,
+        include_resolved: bool,
+        after: str | None,
+    ) -> Iterator[PRReviewThreadPage]:
+        """Stream review threads for a pull request one page at a time.
+
+        Pages are fetched lazily as the iterator is consumed, so a caller
+        that stops early does not download the rest of the PR. Every thread
+        is complete: threads with more comments than fit on a page have
+        their remaining comments fetched before the page is yielded.
+
+        Args:
+            repo_root: Repository root directory
+            pr_number: PR number to query
+            include_resolved: If True, include resolved threads
+            after: Cursor from a previous page's end_cursor. Only threads
+                added after that page are returned. None fetches all threads.
+
+        Returns:
+            Iterator of pages in GitHub's order (oldest thread first)
+        """
+        ...
+
     @abstractmethod
     def get_pr_reviews(
         self,
@@ -759,6 +904,45 @@ class LocalGitHub(ABC):
         """
         ...
 
+    @abstractmethod
+    def iter_pr_reviews(
+        self,
+        repo_root: Path,
+        pr_number: int,
+    ) -> Iterator[PRReview]:
+        """Stream PR-level reviews one page at a time, oldest first.
+
+        Same filtering as get_pr_reviews, without collecting every page first.
+
+        Args:
+            repo_root: Repository root directory
+            pr_number: PR number to query
+
+        Returns:
+            Iterator of PRReview in submission order
+        """
+        ...
+
+    @abstractmethod
+    def iter_pr_comments(
+        self,
+        repo_root: Path,
+        pr_number: int,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream issue/PR comments one page at a time, oldest first.
+
+        Pages are fetched lazily, so searches that stop at the first match
+        only download the pages they need.
+
+        Args:
+            repo_root: Repository root (for gh CLI context)
+            pr_number: PR number to fetch comments for
+
+        Returns:
+            Iterator of raw comment dicts with at least "id" and "body" keys
+        """
+        ...
+
     @abstractmethod
     def find_pr_comment_by_marker(
         self,
@@ -1,5 +1,7 @@
 """No-op wrapper for GitHub operations."""
 
+from collections.abc import Iterator
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -7,11 +9,13 @@ from erk_shared.gateway.github.abc import LocalGitHub
 from erk_shared.gateway.github.issues.abc import GitHubIssues
 from erk_shared.gateway.github.issues.dry_run import DryRunGitHubIssues
 from erk_shared.gateway.github.issues.types import IssueInfo
+from erk_shared.gateway.github.run_correlation import WorkflowRunFound, WorkflowRunResult
 from erk_shared.gateway.github.types import (
     BodyContent,
     GitHubRepoLocation,
     IssueFilterState,
     IssueOrPullRequest,
+    IssuesWithPrLinkagesPage,
     MergeResult,
     PRCheckRun,
     PRDetails,
@@ -19,6 +23,7 @@ from erk_shared.gateway.github.types import (
     PRNotFound,
     PRReview,
     PRReviewThread,
+    PRReviewThreadPage,
     PullRequestInfo,
     WorkflowRun,
 )
@@ -85,6 +90,29 @@ class DryRunLocalGitHub(LocalGitHub):
         # Return fake run ID - prevents actual workflow trigger
         return "noop-run-12345"
 
+    def start_workflow(
+        self, *, repo_root: Path, workflow: str, inputs: dict[str, str], ref: str | None
+    ) -> str:
+        """No-op for dispatching workflow in dry-run mode.
+
+        Returns:
+            A fake distinct_id for dry-run mode
+        """
+        return "noop-distinct-id"
+
+    def resolve_workflow_runs(
+        self,
+        *,
+        repo_root: Path,
+        workflow: str,
+        distinct_ids: list[str],
+        dispatched_at: datetime,
+    ) -> dict[str, WorkflowRunResult]:
+        """Return fake run IDs for dry-run dispatches."""
+        return {
+            distinct_id: WorkflowRunFound(run_id="noop-run-12345") for distinct_id in distinct_ids
+        }
+
     def create_pr(
         self,
         repo_root: Path,
@@ -201,6 +229,26 @@ class DryRunLocalGitHub(LocalGitHub):
             location=location, labels=labels, state=state, limit=limit, creator=creator
         )
 
+    def iter_issues_with_pr_linkages_pages(
+        self,
+        *,
+        location: GitHubRepoLocation,
+        labels: list[str],
+        state: IssueFilterState,
+        limit: int | None,
+        page_size: int,
+        creator: str | None,
+    ) -> Iterator[IssuesWithPrLinkagesPage]:
+        """Delegate read operation to wrapped implementation."""
+        return self._wrapped.iter_issues_with_pr_linkages_pages(
+            location=location,
+            labels=labels,
+            state=state,
+            limit=limit,
+            page_size=page_size,
+            creator=creator,
+        )
+
     def get_pr(self, repo_root: Path, pr_number: int) -> PRDetails | PRNotFound:
         """Delegate read operation to wrapped implementation."""
         return self._wrapped.get_pr(repo_root, pr_number)
@@ -209,6 +257,18 @@ class DryRunLocalGitHub(LocalGitHub):
         """Delegate read operation to wrapped implementation."""
         return self._wrapped.get_pr_for_branch(repo_root, branch)
 
+    def get_pr_details_by_numbers(
+        self, repo_root: Path, pr_numbers: list[int]
+    ) -> dict[int, PRDetails]:
+        """Delegate read operation to wrapped implementation."""
+        return self._wrapped.get_pr_details_by_numbers(repo_root, pr_numbers)
+
+    def get_pr_details_by_branches(
+        self, repo_root: Path, branches: list[str]
+    ) -> dict[str, PRDetails]:
+        """Delegate read operation to wrapped implementation."""
+        return self._wrapped.get_pr_details_by_branches(repo_root, branches)
+
     def list_prs(
         self,
         repo_root: Path,
@@ -281,6 +341,19 @@ class DryRunLocalGitHub(LocalGitHub):
             repo_root, pr_number, include_resolved=include_resolved
         )
 
+    def iter_pr_review_thread_pages(
+        self,
+        repo_root: Path,
+        pr_number: int,
+        *,
+        include_resolved: bool,
+        after: str | None,
+    ) -> Iterator[PRReviewThreadPage]:
+        """Delegate read operation to wrapped implementation."""
+        return self._wrapped.iter_pr_review_thread_pages(
+            repo_root, pr_number, include_resolved=include_resolved, after=after
+        )
+
     def get_pr_reviews(
         self,
         repo_root: Path,
@@ -344,6 +417,22 @@ class DryRunLocalGitHub(LocalGitHub):
         """Delegate read operation to wrapped implementation."""
         return self._wrapped.fetch_pr_comments(repo_root, pr_number)
 
+    def iter_pr_reviews(
+        self,
+        repo_root: Path,
+        pr_number: int,
+    ) -> Iterator[PRReview]:
+        """Delegate read operation to wrapped implementation."""
+        return self._wrapped.iter_pr_reviews(repo_root, pr_number)
+
+    def iter_pr_comments(
+        self,
+        repo_root: Path,
+        pr_number: int,
+    ) -> Iterator[dict[str, Any]]:
+        """Delegate read operation to wrapped implementation."""
+        return self._wrapped.iter_pr_comments(repo_root, pr_number)
+
     def find_pr_comment_by_marker(
         self,
         repo_root: Path,
@@ -4,18 +4,34 @@ These are stored in a separate file to keep the implementation code clean
 and make the queries easier to read and maintain.
 """
 
-# Query to fetch PR review threads with comments
-GET_PR_REVIEW_THREADS_QUERY = """query($owner: String!, $repo: String!, $number: Int!) {
+# Query to fetch one page of PR review threads with their first page of comments.
+# Pass the previous page's endCursor as $cursor to continue; null starts at the
+# first thread. Threads whose comments have a next page are completed with
+# GET_REVIEW_THREAD_COMMENTS_QUERY.
+GET_PR_REVIEW_THREADS_QUERY = """query(
+  $owner: String!
+  $repo: String!
+  $number: Int!
+  $cursor: String
+) {
   repository(owner: $owner, name: $repo) {
     pullRequest(number: $number) {
-      reviewThreads(first: 100) {
+      reviewThreads(first: 100, after: $cursor) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
         nodes {
           id
           isResolved
           isOutdated
           path
           line
-          comments(first: 20) {
+          comments(first: 100) {
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
             nodes {
               databaseId
               body
@@ -31,12 +47,43 @@ GET_PR_REVIEW_THREADS_QUERY = """query($owner: String!, $repo: String!, $number:
   }
 }"""
 
-# Query to fetch PR-level reviews (not inline threads)
+# Query to fetch the next page of comments for a single review thread
+GET_REVIEW_THREAD_COMMENTS_QUERY = """query($threadId: ID!, $cursor: String) {
+  node(id: $threadId) {
+    ... on PullRequestReviewThread {
+      comments(first: 100, after: $cursor) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        nodes {
+          databaseId
+          body
+          author { login }
+          path
+          line: originalLine
+          createdAt
+        }
+      }
+    }
+  }
+}"""
+
+# Query to fetch one page of PR-level reviews (not inline threads)
 # Excludes PENDING (draft reviews) and DISMISSED (superseded reviews)
-GET_PR_REVIEWS_QUERY = """query($owner: String!, $repo: String!, $number: Int!) {
+GET_PR_REVIEWS_QUERY = """query(
+  $owner: String!
+  $repo: String!
+  $number: Int!
+  $cursor: String
+) {
   repository(owner: $owner, name: $repo) {
     pullRequest(number: $number) {
-      reviews(first: 100, states: [CHANGES_REQUESTED, APPROVED, COMMENTED]) {
+      reviews(first: 100, after: $cursor, states: [CHANGES_REQUESTED, APPROVED, COMMENTED]) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
         nodes {
           id
           author { login }
@@ -125,7 +172,8 @@ GET_WORKFLOW_RUNS_BY_NODE_IDS_QUERY = """query($nodeIds: [ID!]!) {
 }"""
 
 # Parameterized query for issues with PR linkages
-# Note: filterBy is optional - pass null if not filtering by creator
+# Note: filterBy is optional - pass null if not filtering by creator. cursor is
+# optional - null starts at the first page.
 GET_ISSUES_WITH_PR_LINKAGES_QUERY = """query(
   $owner: String!
   $repo: String!
@@ -133,6 +181,7 @@ GET_ISSUES_WITH_PR_LINKAGES_QUERY = """query(
   $states: [IssueState!]!
   $first: Int!
   $filterBy: IssueFilters
+  $cursor: String
 ) {
   repository(owner: $owner, name: $repo) {
     issues(
@@ -140,8 +189,13 @@ GET_ISSUES_WITH_PR_LINKAGES_QUERY = """query(
       states: $states
       filterBy: $filterBy
       first: $first
+      after: $cursor
       orderBy: {field: UPDATED_AT, direction: DESC}
     ) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
       nodes {
         number
         title
@@ -1,6 +1,7 @@
 """Production implementation of GitHub issues using gh CLI."""
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -25,7 +26,9 @@ class RealGitHubIssues(GitHubIssues):
     """Production implementation using gh CLI.
 
     All GitHub issue operations execute actual gh commands via subprocess.
-    Maintains an internal label cache to avoid redundant API calls.
+    Maintains an internal label cache to avoid redundant API calls. The cache
+    is used under a lock, so threads sharing this gateway check and create
+    each label once.
     """
 
     def __init__(self, target_repo: str | None, *, time: Time) -> None:
@@ -39,6 +42,7 @@ class RealGitHubIssues(GitHubIssues):
         """
         self._target_repo = target_repo
         self._time = time
+        self._label_lock = threading.Lock()
         self._label_cache: RealLabelCache | None = None
 
     @property
@@ -394,77 +398,79 @@ class RealGitHubIssues(GitHubIssues):
         Note: Uses gh's native error handling - gh CLI raises RuntimeError
         on failures (not installed, not authenticated).
         """
-        # Lazily initialize cache on first use
-        if self._label_cache is None:
-            self._label_cache = RealLabelCache(repo_root)
-
-        # Fast path: if cached, skip API call entirely
-        if self._label_cache.has(label):
-            return
-
-        # GH-API-AUDIT: REST - GET labels
-        base_check_cmd = [
-            "gh",
-            "api",
-            "repos/{owner}/{repo}/labels",
-            "--jq",
-            f'.[] | select(.name == "{label}") | .name',
-        ]
-        check_cmd = self._build_gh_command(base_check_cmd)
-        stdout = execute_gh_command_with_retry(check_cmd, repo_root, self._time)
-
-        if stdout.strip():
-            # Label exists - cache it for future calls
+        with self._label_lock:
+            # Lazily initialize cache on first use
+            if self._label_cache is None:
+                self._label_cache = RealLabelCache(repo_root)
+
+            # Fast path: if cached, skip API call entirely
+            if self._label_cache.has(label):
+                return
+
+            # GH-API-AUDIT: REST - GET labels
+            base_check_cmd = [
+                "gh",
+                "api",
+                "repos/{owner}/{repo}/labels",
+                "--jq",
+                f'.[] | select(.name == "{label}") | .name',
+            ]
+            check_cmd = self._build_gh_command(base_check_cmd)
+            stdout = execute_gh_command_with_retry(check_cmd, repo_root, self._time)
+
+            if stdout.strip():
+                # Label exists - cache it for future calls
+                self._label_cache.add(label)
+                return
+
+            # GH-API-AUDIT: REST - gh label create uses REST
+            base_create_cmd = [
+                "gh",
+                "label",
+                "create",
+                label,
+                "--description",
+                description,
+                "--color",
+                color,
+            ]
+            create_cmd = self._build_gh_command(base_create_cmd)
+            execute_gh_command_with_retry(create_cmd, repo_root, self._time)
+
+            # Cache newly created label
             self._label_cache.add(label)
-            return
-
-        # GH-API-AUDIT: REST - gh label create uses REST
-        base_create_cmd = [
-            "gh",
-            "label",
-            "create",
-            label,
-            "--description",
-            description,
-            "--color",
-            color,
-        ]
-        create_cmd = self._build_gh_command(base_create_cmd)
-        execute_gh_command_with_retry(create_cmd, repo_root, self._time)
-
-        # Cache newly created label
-        self._label_cache.add(label)
 
     def label_exists(self, repo_root: Path, label: str) -> bool:
         """Check if label exists in repository (read-only).
 
         Uses the label cache if available to avoid redundant API calls.
         """
-        # Lazily initialize cache on first use
-        if self._label_cache is None:
-            self._label_cache = RealLabelCache(repo_root)
-
-        # Fast path: if cached, we know it exists
-        if self._label_cache.has(label):
-            return True
-
-        # GH-API-AUDIT: REST - GET labels
-        base_check_cmd = [
-            "gh",
-            "api",
-            "repos/{owner}/{repo}/labels",
-            "--jq",
-            f'.[] | select(.name == "{label}") | .name',
-        ]
-        check_cmd = self._build_gh_command(base_check_cmd)
-        stdout = execute_gh_command_with_retry(check_cmd, repo_root, self._time)
-
-        if stdout.strip():
-            # Label exists - cache it for future calls
-            self._label_cache.add(label)
-            return True
-
-        return False
+        with self._label_lock:
+            # Lazily initialize cache on first use
+            if self._label_cache is None:
+                self._label_cache = RealLabelCache(repo_root)
+
+            # Fast path: if cached, we know it exists
+            if self._label_cache.has(label):
+                return True
+
+            # GH-API-AUDIT: REST - GET labels
+            base_check_cmd = [
+                "gh",
+                "api",
+                "repos/{owner}/{repo}/labels",
+                "--jq",
+                f'.[] | select(.name == "{label}") | .name',
+            ]
+            check_cmd = self._build_gh_command(base_check_cmd)
+            stdout = execute_gh_command_with_retry(check_cmd, repo_root, self._time)
+
+            if stdout.strip():
+                # Label exists - cache it for future calls
+                self._label_cache.add(label)
+                return True
+
+            return False
 
     def ensure_label_on_issue(self, repo_root: Path, issue_number: int, label: str) -> None:
         """Ensure label is present on issue using gh CLI REST API (idempotent).
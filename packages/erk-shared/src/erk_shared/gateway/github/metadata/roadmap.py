@@ -3,7 +3,7 @@
 This module provides:
 - Data types: RoadmapNodeStatus, RoadmapNode, RoadmapPhase
 - Parsing: parse_roadmap() (v2 frontmatter only)
-- Frontmatter: validate, parse, group, update
+- Frontmatter: validate, parse, group, update (single node or batched)
 - Utilities: compute_summary(), find_next_node(), serialize_phases()
 
 Previously split across objective_roadmap_shared.py and
@@ -12,7 +12,7 @@ here to eliminate the circular dependency between erk_shared and erk.
 """
 
 import re
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, replace
 from typing import Literal, cast
 
@@ -50,6 +50,27 @@ class RoadmapPhase:
     nodes: list[RoadmapNode]
 
 
+@dataclass(frozen=True)
+class RoadmapNodeUpdate:
+    """Field changes for one node, applied by update_nodes_in_frontmatter().
+
+    Attributes:
+        node_id: Node ID to update (e.g., "1.1")
+        pr: New PR value. None=preserve existing, ""=clear, "#123"=set.
+        status: Explicit status to set, or None to infer from resolved values.
+        description: New description, or None to preserve existing.
+        slug: New slug, or None to preserve existing.
+        comment: New comment, or None to preserve existing.
+    """
+
+    node_id: str
+    pr: str | None
+    status: RoadmapNodeStatus | None
+    description: str | None
+    slug: str | None
+    comment: str | None
+
+
 # ---------------------------------------------------------------------------
 # Frontmatter validation and parsing
 # ---------------------------------------------------------------------------
@@ -343,53 +364,86 @@ def update_node_in_frontmatter(
     Returns:
         Updated block content with modified YAML, or None if node not found
     """
+    return update_nodes_in_frontmatter(
+        block_content,
+        [
+            RoadmapNodeUpdate(
+                node_id=node_id,
+                pr=pr,
+                status=status,
+                description=description,
+                slug=slug,
+                comment=comment,
+            )
+        ],
+    )
+
+
+def update_nodes_in_frontmatter(
+    block_content: str, updates: Sequence[RoadmapNodeUpdate]
+) -> str | None:
+    """Apply several node updates with one YAML parse and one render.
+
+    Updates are applied in order, so a later update for the same node sees
+    the result of an earlier one.
+
+    Args:
+        block_content: Raw content from metadata block
+        updates: Node updates to apply
+
+    Returns:
+        Updated block content with modified YAML, or None if the YAML is
+        invalid or any updated node is not found
+    """
     steps = parse_roadmap_frontmatter(block_content)
 
     if steps is None:
         return None
 
-    # Find and update the node
-    found = False
-    updated_steps: list[RoadmapNode] = []
-
-    for step in steps:
-        if step.id == node_id:
-            # Resolve PR: None=preserve, ""=clear, "#123"=set
-            if pr is None:
-                resolved_pr = step.pr
-            elif pr:
-                resolved_pr = pr
-            else:
-                resolved_pr = None
-
-            # Determine status: explicit > infer from resolved values > preserve
-            new_status: RoadmapNodeStatus
-            if status is not None:
-                new_status = status
-            elif resolved_pr:
-                new_status = cast(RoadmapNodeStatus, "in_progress")
-            else:
-                new_status = step.status  # preserve existing status
-
-            replacements: dict[str, object] = {"status": new_status, "pr": resolved_pr}
-            if description is not None:
-                replacements["description"] = description
-            if slug is not None:
-                replacements["slug"] = slug
-            if comment is not None:
-                replacements["comment"] = comment
-
-            updated_steps.append(replace(step, **replacements))
-            found = True
-        else:
-            updated_steps.append(step)
+    indexes_by_id: dict[str, list[int]] = {}
+    for index, step in enumerate(steps):
+        indexes_by_id.setdefault(step.id, []).append(index)
 
-    if not found:
-        return None
+    updated_steps = list(steps)
+    for update in updates:
+        indexes = indexes_by_id.get(update.node_id)
+        if indexes is None:
+            return None
+        for index in indexes:
+            updated_steps[index] = _apply_node_update(updated_steps[index], update)
 
     return render_roadmap_block_inner(updated_steps)
 
 
+def _apply_node_update(step: RoadmapNode, update: RoadmapNodeUpdate) -> RoadmapNode:
+    # Resolve PR: None=preserve, ""=clear, "#123"=set
+    if update.pr is None:
+        resolved_pr = step.pr
+    elif update.pr:
+        resolved_pr = update.pr
+    else:
+        resolved_pr = None
+
+    # Determine status: explicit > infer from resolved values > preserve
+    new_status: RoadmapNodeStatus
+    if update.status is not None:
+        new_status = update.status
+    elif resolved_pr:
+        new_status = cast(RoadmapNodeStatus, "in_progress")
+    else:
+        new_status = step.status  # preserve existing status
+
+    replacements: dict[str, object] = {"status": new_status, "pr": resolved_pr}
+    if update.description is not None:
+        replacements["description"] = update.description
+    if update.slug is not None:
+        replacements["slug"] = update.slug
+    if update.comment is not None:
+        replacements["comment"] = update.comment
+
+    return replace(step, **replacements)
+
+
 def add_node_to_frontmatter(
     block_content: str,
     *,
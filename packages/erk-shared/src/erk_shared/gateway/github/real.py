@@ -12,8 +12,8 @@ Error Handling Philosophy:
 
 import json
 import logging
-import secrets
-import string
+import threading
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -26,6 +26,7 @@ from erk_shared.gateway.github.graphql_queries import (
     GET_PR_CHECK_RUNS_QUERY,
     GET_PR_REVIEW_THREADS_QUERY,
     GET_PR_REVIEWS_QUERY,
+    GET_REVIEW_THREAD_COMMENTS_QUERY,
     GET_WORKFLOW_RUNS_BY_NODE_IDS_QUERY,
     ISSUE_PR_LINKAGE_FRAGMENT,
     RESOLVE_REVIEW_THREAD_MUTATION,
@@ -45,6 +46,16 @@ from erk_shared.gateway.github.pr_data_parsing import (
     parse_workflow_runs_nodes_response,
 )
 from erk_shared.gateway.github.retry import RetriesExhausted, RetryRequested, with_retries
+from erk_shared.gateway.github.run_correlation import (
+    RUN_CORRELATION_MAX_ATTEMPTS,
+    WorkflowRunNotFound,
+    WorkflowRunResult,
+    correlate_workflow_runs,
+    generate_distinct_id,
+    require_workflow_run,
+    workflow_runs_endpoint,
+)
+from erk_shared.gateway.github.transient_errors import is_rate_limit_error
 from erk_shared.gateway.github.types import (
     BodyContent,
     BodyFile,
@@ -55,6 +66,7 @@ from erk_shared.gateway.github.types import (
     GitHubRepoLocation,
     IssueFilterState,
     IssueOrPullRequest,
+    IssuesWithPrLinkagesPage,
     MergeError,
     MergeResult,
     PRCheckRun,
@@ -65,6 +77,7 @@ from erk_shared.gateway.github.types import (
     PRReviewComment,
     PRReviewState,
     PRReviewThread,
+    PRReviewThreadPage,
     PullRequestInfo,
     RepoInfo,
     WorkflowRun,
@@ -75,12 +88,148 @@ from erk_shared.subprocess_utils import _GH_COMMAND_TIMEOUT, run_subprocess_with
 
 _logger = logging.getLogger(__name__)
 
+# Page size for paginated REST list endpoints (GitHub's maximum)
+_REST_PAGE_SIZE = 100
+
+# Aliased lookups per GraphQL request in the batched PR details methods
+PR_DETAILS_BATCH_SIZE = 50
+
+# GraphQL selection matching the fields of PRDetails
+_PR_DETAILS_FIELDS = (
+    "number url title body state isDraft baseRefName headRefName isCrossRepository"
+    " mergeable mergeStateStatus labels(first: 100) { nodes { name } }"
+    " createdAt updatedAt author { login }"
+)
+
 
 def _elapsed_ms(start: float, end: float) -> float:
     """Convert monotonic clock interval to milliseconds."""
     return (end - start) * 1000
 
 
+def _graphql_cursor_args(cursor: str | None) -> list[str]:
+    """Build gh api arguments for an optional GraphQL `$cursor` variable.
+
+    `-F cursor=null` sends JSON null, which starts a connection at its first page.
+    """
+    if cursor is None:
+        return ["-F", "cursor=null"]
+    return ["-f", f"cursor={cursor}"]
+
+
+# Default page size of get_issues_with_pr_linkages() when no limit is given
+_DEFAULT_ISSUES_WITH_PR_LINKAGES_LIMIT = 30
+
+
+def _issues_with_pr_linkages_cmd(
+    location: GitHubRepoLocation,
+    *,
+    labels: list[str],
+    state: IssueFilterState,
+    first: int,
+    creator: str | None,
+) -> list[str]:
+    """Build the gh api command for GET_ISSUES_WITH_PR_LINKAGES_QUERY (no cursor)."""
+    repo_id = location.repo_id
+    states = [state.upper()]
+    # GH-API-AUDIT: GraphQL - issues with timeline
+    # WHY GRAPHQL: Complex nested query (issues + timeline + PR status) for erk dash
+    # IMPORTANT: gh api graphql requires special syntax for arrays and objects:
+    # - Arrays: use key[]=value1 -f key[]=value2 (NOT -F key=["value1"])
+    # - Objects: use key[subkey]=value (NOT -F key={"subkey": "value"})
+    # - Strings: use -f key=value
+    # - Integers: use -F key=123
+    cmd = [
+        "gh",
+        "api",
+        "graphql",
+        "-f",
+        f"query={GET_ISSUES_WITH_PR_LINKAGES_QUERY}",
+        "-f",
+        f"owner={repo_id.owner}",
+        "-f",
+        f"repo={repo_id.repo}",
+        "-F",
+        f"first={first}",
+    ]
+
+    # Add labels array using gh's array syntax: labels[]=value
+    for label in labels:
+        cmd.extend(["-f", f"labels[]={label}"])
+
+    # Add states array using gh's array syntax: states[]=value
+    for state_val in states:
+        cmd.extend(["-f", f"states[]={state_val}"])
+
+    # Add filterBy if creator specified using gh's object syntax: filterBy[createdBy]=value
+    if creator is not None:
+        cmd.extend(["-f", f"filterBy[createdBy]={creator}"])
+
+    return cmd
+
+
+def _parse_review_comment_nodes(nodes: list[dict[str, Any] | None]) -> list[PRReviewComment]:
+    """Parse review thread comment nodes into PRReviewComment objects."""
+    comments: list[PRReviewComment] = []
+    for comment_node in nodes:
+        if comment_node is None:
+            continue
+
+        author = comment_node.get("author")
+        author_login = author.get("login") if author else "unknown"
+
+        comments.append(
+            PRReviewComment(
+                id=comment_node.get("databaseId", 0),
+                body=comment_node.get("body", ""),
+                author=author_login,
+                path=comment_node.get("path", ""),
+                line=comment_node.get("line"),
+                created_at=comment_node.get("createdAt", ""),
+            )
+        )
+    return comments
+
+
+def _uncorrelated_runs_message(
+    *, workflow: str, missing: list[str], recent_runs: list[dict[str, Any]]
+) -> str:
+    """Build the error for dispatches whose runs never appeared."""
+    msg_parts = [
+        f"GitHub workflow triggered but could not find run ID after "
+        f"{RUN_CORRELATION_MAX_ATTEMPTS} attempts.",
+        "",
+        f"Workflow file: {workflow}",
+        f"Correlation ID: {', '.join(missing)}",
+        "",
+    ]
+
+    if recent_runs:
+        msg_parts.append(f"Found {len(recent_runs)} recent runs, but none matched.")
+        msg_parts.append("Recent run titles:")
+        for run in recent_runs[:5]:
+            title = run.get("display_title", "N/A")
+            status = run.get("status", "N/A")
+            msg_parts.append(f"  • {title} ({status})")
+        msg_parts.append("")
+    else:
+        msg_parts.append("No workflow runs found at all.")
+        msg_parts.append("")
+
+    msg_parts.extend(
+        [
+            "Possible causes:",
+            "  • GitHub API eventual consistency delay (rare but possible)",
+            "  • Workflow file doesn't use 'run-name' with distinct_id",
+            "  • All recent runs were cancelled/skipped",
+            "",
+            "Debug commands:",
+            f"  gh api repos/{{owner}}/{{repo}}/actions/workflows/{workflow}/runs?per_page=10",
+        ]
+    )
+    return "\n".join(msg_parts)
+
+
 # Feature flag to control whether PR mutations use REST API or gh CLI commands.
 # When True: Use REST API (gh api) - uses REST quota, preserves GraphQL quota
 # When False: Use gh CLI commands (gh pr) - uses GraphQL quota internally
@@ -102,6 +251,9 @@ class RealLocalGitHub(LocalGitHub):
     """Production implementation using gh CLI.
 
     All GitHub operations execute actual gh commands via subprocess.
+
+    Safe to share across threads; the default-branch cache is guarded by a
+    lock so concurrent dispatches fetch it once.
     """
 
     def __init__(
@@ -121,6 +273,7 @@ class RealLocalGitHub(LocalGitHub):
         self._time = time
         self._repo_info = repo_info
         self._issues = issues
+        self._default_branch_lock = threading.Lock()
         self._default_branch_cache: dict[Path, str] = {}
 
     @property
@@ -272,17 +425,6 @@ class RealLocalGitHub(LocalGitHub):
         except RuntimeError as e:
             return MergeError(pr_number=pr_number, message=str(e))
 
-    def _generate_distinct_id(self) -> str:
-        """Generate a random base36 ID for workflow dispatch correlation.
-
-        Returns:
-            6-character base36 string (e.g., 'a1b2c3')
-        """
-        # Base36 alphabet: 0-9 and a-z
-        base36_chars = string.digits + string.ascii_lowercase
-        # Generate 6 random characters (~2.2 billion possibilities)
-        return "".join(secrets.choice(base36_chars) for _ in range(6))
-
     def _get_default_branch(self, repo_root: Path) -> str:
         """Get the repository's default branch via REST API.
 
@@ -291,23 +433,23 @@ class RealLocalGitHub(LocalGitHub):
         Results are cached per repo_root since the default branch
         does not change within a session.
         """
-        if repo_root in self._default_branch_cache:
-            return self._default_branch_cache[repo_root]
-        # GH-API-AUDIT: REST - GET repos/{owner}/{repo} (.default_branch)
-        cmd = ["gh", "api", "repos/{owner}/{repo}", "--jq", ".default_branch"]
-        stdout = execute_gh_command_with_retry(cmd, repo_root, self._time)
-        branch = stdout.strip()
-        self._default_branch_cache[repo_root] = branch
-        return branch
+        with self._default_branch_lock:
+            if repo_root in self._default_branch_cache:
+                return self._default_branch_cache[repo_root]
+            # GH-API-AUDIT: REST - GET repos/{owner}/{repo} (.default_branch)
+            cmd = ["gh", "api", "repos/{owner}/{repo}", "--jq", ".default_branch"]
+            stdout = execute_gh_command_with_retry(cmd, repo_root, self._time)
+            branch = stdout.strip()
+            self._default_branch_cache[repo_root] = branch
+            return branch
 
-    def _dispatch_workflow_impl(
+    def start_workflow(
         self, *, repo_root: Path, workflow: str, inputs: dict[str, str], ref: str | None
     ) -> str:
         """Dispatch a GitHub Actions workflow and return the distinct_id.
 
-        Internal implementation used by trigger_workflow().
         Generates a unique distinct_id, passes it to the workflow, and returns
-        the distinct_id for polling.
+        the distinct_id for resolve_workflow_runs().
 
         Args:
             repo_root: Repository root path
@@ -318,10 +460,8 @@ class RealLocalGitHub(LocalGitHub):
         Returns:
             The distinct_id used for correlation
         """
-        distinct_id = self._generate_distinct_id()
-        debug_log(
-            f"_dispatch_workflow_impl: workflow={workflow}, distinct_id={distinct_id}, ref={ref}"
-        )
+        distinct_id = generate_distinct_id()
+        debug_log(f"start_workflow: workflow={workflow}, distinct_id={distinct_id}, ref={ref}")
 
         ref_value = ref if ref is not None else self._get_default_branch(repo_root)
         payload = json.dumps({"ref": ref_value, "inputs": {"distinct_id": distinct_id, **inputs}})
@@ -337,63 +477,46 @@ class RealLocalGitHub(LocalGitHub):
             "-",
         ]
 
-        debug_log(f"_dispatch_workflow_impl: executing command: {' '.join(cmd)}")
+        debug_log(f"start_workflow: executing command: {' '.join(cmd)}")
         run_subprocess_with_context(
             cmd=cmd,
             operation_context=f"trigger workflow '{workflow}'",
             cwd=repo_root,
             input=payload,
         )
-        debug_log("_dispatch_workflow_impl: workflow dispatched successfully")
+        debug_log("start_workflow: workflow dispatched successfully")
         return distinct_id
 
-    def trigger_workflow(
-        self, *, repo_root: Path, workflow: str, inputs: dict[str, str], ref: str | None
-    ) -> str:
-        """Trigger GitHub Actions workflow via gh CLI.
-
-        Generates a unique distinct_id internally, passes it to the workflow,
-        and uses it to reliably find the triggered run via displayTitle matching.
-
-        Args:
-            repo_root: Repository root path
-            workflow: Workflow file name (e.g., "implement-plan.yml")
-            inputs: Workflow inputs as key-value pairs
-            ref: Branch or tag to run workflow from (default: repository default branch)
+    def resolve_workflow_runs(
+        self,
+        *,
+        repo_root: Path,
+        workflow: str,
+        distinct_ids: list[str],
+        dispatched_at: datetime,
+    ) -> dict[str, WorkflowRunResult]:
+        """Find the runs for several dispatches with one runs listing per poll.
 
-        Returns:
-            The GitHub Actions run ID as a string
+        The workflows use run-name: "<title>:<distinct_id>", so each run is
+        matched by the suffix of its display title.
         """
-        distinct_id = self._dispatch_workflow_impl(
-            repo_root=repo_root, workflow=workflow, inputs=inputs, ref=ref
-        )
-
-        # Poll for the run by matching displayTitle containing the distinct ID
-        # The workflow uses run-name: "<issue_number>:<distinct_id>"
-        # GitHub API eventual consistency: exponential backoff 1,2,4,8,...,8s (~62s, 11 attempts)
-        max_attempts = 11
-        runs_data: list[dict[str, Any]] = []
-        for attempt in range(max_attempts):
-            user_output(f"  Waiting for workflow run... (attempt {attempt + 1}/{max_attempts})")
-            debug_log(f"trigger_workflow: polling attempt {attempt + 1}/{max_attempts}")
 
+        def fetch_runs_page(page: int) -> list[dict[str, Any]]:
+            endpoint = workflow_runs_endpoint(workflow, created_since=dispatched_at, page=page)
             # GH-API-AUDIT: REST - GET actions/workflows/{id}/runs
             runs_cmd = [
                 "gh",
                 "api",
-                f"repos/{{owner}}/{{repo}}/actions/workflows/{workflow}/runs?per_page=10",
+                f"repos/{{owner}}/{{repo}}/{endpoint}",
                 "--jq",
                 ".workflow_runs",
             ]
-
             runs_result = run_subprocess_with_context(
                 cmd=runs_cmd,
                 operation_context=f"get run ID for workflow '{workflow}'",
                 cwd=repo_root,
             )
-
             runs_data = json.loads(runs_result.stdout)
-            debug_log(f"trigger_workflow: found {len(runs_data)} runs")
 
             # Validate response structure (must be a list)
             if not isinstance(runs_data, list):
@@ -403,75 +526,51 @@ class RealLocalGitHub(LocalGitHub):
                     f"Raw output: {runs_result.stdout[:200]}"
                 )
                 raise RuntimeError(msg)
+            return runs_data
 
-            # Empty list is valid - workflow hasn't appeared yet, continue polling
-            if not runs_data:
-                # Continue to retry logic below
-                pass
-
-            # Find run by matching distinct_id in display_title
-            for run in runs_data:
-                display_title = run.get("display_title", "")
-                # Check for match pattern: :<distinct_id> (new format: issue_number:distinct_id)
-                if f":{distinct_id}" not in display_title:
-                    continue
-
-                conclusion = run.get("conclusion")
-                if conclusion in ("skipped", "cancelled"):
-                    # Matched run was skipped/cancelled — no point polling further
-                    raise RuntimeError(
-                        f"Workflow '{workflow}' run was {conclusion}.\n"
-                        f"Run ID: {run['id']}, title: '{display_title}'\n"
-                        f"This usually means a job-level condition was not met "
-                        f"(e.g., vars.CLAUDE_ENABLED is 'false')."
-                    )
+        correlation = correlate_workflow_runs(
+            workflow=workflow,
+            distinct_ids=distinct_ids,
+            fetch_runs_page=fetch_runs_page,
+            time=self._time,
+        )
+        results: dict[str, WorkflowRunResult] = dict(correlation.matched)
+        for distinct_id in correlation.missing(distinct_ids):
+            msg = _uncorrelated_runs_message(
+                workflow=workflow, missing=[distinct_id], recent_runs=correlation.recent_runs
+            )
+            debug_log(f"resolve_workflow_runs: exhausted all attempts, error: {msg}")
+            results[distinct_id] = WorkflowRunNotFound(message=msg)
+        return results
 
-                run_id = run["id"]
-                debug_log(f"trigger_workflow: found run {run_id}, title='{display_title}'")
-                return str(run_id)
+    def trigger_workflow(
+        self, *, repo_root: Path, workflow: str, inputs: dict[str, str], ref: str | None
+    ) -> str:
+        """Trigger GitHub Actions workflow via gh CLI.
 
-            # No matching run found, retry if attempts remaining
-            # Exponential backoff: 2^attempt seconds, capped at 8s
-            if attempt < max_attempts - 1:
-                delay = min(2**attempt, 8)
-                self._time.sleep(delay)
+        Generates a unique distinct_id internally, passes it to the workflow,
+        and uses it to reliably find the triggered run via displayTitle matching.
 
-        # All attempts exhausted without finding matching run
-        msg_parts = [
-            f"GitHub workflow triggered but could not find run ID after {max_attempts} attempts.",
-            "",
-            f"Workflow file: {workflow}",
-            f"Correlation ID: {distinct_id}",
-            "",
-        ]
+        Args:
+            repo_root: Repository root path
+            workflow: Workflow file name (e.g., "implement-plan.yml")
+            inputs: Workflow inputs as key-value pairs
+            ref: Branch or tag to run workflow from (default: repository default branch)
 
-        if runs_data:
-            msg_parts.append(f"Found {len(runs_data)} recent runs, but none matched.")
-            msg_parts.append("Recent run titles:")
-            for run in runs_data[:5]:
-                title = run.get("display_title", "N/A")
-                status = run.get("status", "N/A")
-                msg_parts.append(f"  • {title} ({status})")
-            msg_parts.append("")
-        else:
-            msg_parts.append("No workflow runs found at all.")
-            msg_parts.append("")
-
-        msg_parts.extend(
-            [
-                "Possible causes:",
-                "  • GitHub API eventual consistency delay (rare but possible)",
-                "  • Workflow file doesn't use 'run-name' with distinct_id",
-                "  • All recent runs were cancelled/skipped",
-                "",
-                "Debug commands:",
-                f"  gh api repos/{{owner}}/{{repo}}/actions/workflows/{workflow}/runs?per_page=10",
-            ]
+        Returns:
+            The GitHub Actions run ID as a string
+        """
+        dispatched_at = self._time.now()
+        distinct_id = self.start_workflow(
+            repo_root=repo_root, workflow=workflow, inputs=inputs, ref=ref
         )
-
-        msg = "\n".join(msg_parts)
-        debug_log(f"trigger_workflow: exhausted all attempts, error: {msg}")
-        raise RuntimeError(msg)
+        results = self.resolve_workflow_runs(
+            repo_root=repo_root,
+            workflow=workflow,
+            distinct_ids=[distinct_id],
+            dispatched_at=dispatched_at,
+        )
+        return require_workflow_run(results[distinct_id])
 
     def create_pr(
         self,
@@ -1094,47 +1193,51 @@ class RealLocalGitHub(LocalGitHub):
         Uses repository.issues() connection with inline timelineItems
         to get PR linkages in one API call.
         """
-        repo_id = location.repo_id
-
-        states = [state.upper()]
-        effective_limit = limit if limit is not None else 30
-
-        # GH-API-AUDIT: GraphQL - issues with timeline
-        # WHY GRAPHQL: Complex nested query (issues + timeline + PR status) for erk dash
-        # IMPORTANT: gh api graphql requires special syntax for arrays and objects:
-        # - Arrays: use key[]=value1 -f key[]=value2 (NOT -F key=["value1"])
-        # - Objects: use key[subkey]=value (NOT -F key={"subkey": "value"})
-        # - Strings: use -f key=value
-        # - Integers: use -F key=123
-        cmd = [
-            "gh",
-            "api",
-            "graphql",
-            "-f",
-            f"query={GET_ISSUES_WITH_PR_LINKAGES_QUERY}",
-            "-f",
-            f"owner={repo_id.owner}",
-            "-f",
-            f"repo={repo_id.repo}",
-            "-F",
-            f"first={effective_limit}",
-        ]
-
-        # Add labels array using gh's array syntax: labels[]=value
-        for label in labels:
-            cmd.extend(["-f", f"labels[]={label}"])
-
-        # Add states array using gh's array syntax: states[]=value
-        for state_val in states:
-            cmd.extend(["-f", f"states[]={state_val}"])
-
-        # Add filterBy if creator specified using gh's object syntax: filterBy[createdBy]=value
-        if creator is not None:
-            cmd.extend(["-f", f"filterBy[createdBy]={creator}"])
-
+        effective_limit = limit if limit is not None else _DEFAULT_ISSUES_WITH_PR_LINKAGES_LIMIT
+        cmd = _issues_with_pr_linkages_cmd(
+            location, labels=labels, state=state, first=effective_limit, creator=creator
+        )
         stdout = execute_gh_command_with_retry(cmd, location.root, self._time)
         response = json.loads(stdout)
-        return self._parse_issues_with_pr_linkages(response, repo_id)
+        return self._parse_issues_with_pr_linkages(response, location.repo_id)
+
+    def iter_issues_with_pr_linkages_pages(
+        self,
+        *,
+        location: GitHubRepoLocation,
+        labels: list[str],
+        state: IssueFilterState,
+        limit: int | None,
+        page_size: int,
+        creator: str | None,
+    ) -> Iterator[IssuesWithPrLinkagesPage]:
+        """Stream issues with PR linkages one GraphQL page at a time."""
+        remaining = limit if limit is not None else _DEFAULT_ISSUES_WITH_PR_LINKAGES_LIMIT
+        cursor: str | None = None
+        while remaining > 0:
+            first = min(page_size, remaining)
+            cmd = [
+                *_issues_with_pr_linkages_cmd(
+                    location, labels=labels, state=state, first=first, creator=creator
+                ),
+                *_graphql_cursor_args(cursor),
+            ]
+            stdout = execute_gh_command_with_retry(cmd, location.root, self._time)
+            response = json.loads(stdout)
+            issues, pr_linkages = self._parse_issues_with_pr_linkages(response, location.repo_id)
+
+            repo_data = response.get("data", {}).get("repository", {})
+            page_info = repo_data.get("issues", {}).get("pageInfo", {})
+            end_cursor = page_info.get("endCursor")
+            remaining -= first
+            if not page_info.get("hasNextPage", False) or remaining <= 0:
+                end_cursor = None
+            yield IssuesWithPrLinkagesPage(
+                issues=tuple(issues), pr_linkages=pr_linkages, end_cursor=end_cursor
+            )
+            if end_cursor is None:
+                return
+            cursor = end_cursor
 
     def _parse_issue_node(self, node: dict[str, Any]) -> IssueInfo | None:
         """Parse a single issue node from GraphQL response.
@@ -1390,6 +1493,156 @@ class RealLocalGitHub(LocalGitHub):
             author=author,
         )
 
+    def get_pr_details_by_numbers(
+        self, repo_root: Path, pr_numbers: list[int]
+    ) -> dict[int, PRDetails]:
+        """Fetch PRDetails for many PRs via chunked, aliased GraphQL queries.
+
+        A PR that doesn't exist makes gh report a GraphQL error for the whole
+        request, so a failed chunk is retried item by item with get_pr().
+        Rate-limit errors are raised instead: per-item retries would only
+        spend more of the exhausted quota.
+
+        Raises:
+            RuntimeError: If GitHub reports a rate limit
+        """
+        assert self._repo_info is not None, "repo_info required for get_pr_details_by_numbers"
+        numbers = list(dict.fromkeys(pr_numbers))
+        result: dict[int, PRDetails] = {}
+        for start in range(0, len(numbers), PR_DETAILS_BATCH_SIZE):
+            chunk = numbers[start : start + PR_DETAILS_BATCH_SIZE]
+            aliases = [
+                f"pr_{number}: pullRequest(number: {number}) {{ {_PR_DETAILS_FIELDS} }}"
+                for number in chunk
+            ]
+            repo_data = self._execute_pr_details_query(repo_root, aliases)
+            if repo_data is None:
+                for number in chunk:
+                    pr = self.get_pr(repo_root, number)
+                    if not isinstance(pr, PRNotFound):
+                        result[number] = pr
+                continue
+            for number in chunk:
+                node = repo_data.get(f"pr_{number}")
+                if node is not None:
+                    result[number] = self._parse_pr_details_from_graphql(node, self._repo_info)
+        return result
+
+    def get_pr_details_by_branches(
+        self, repo_root: Path, branches: list[str]
+    ) -> dict[str, PRDetails]:
+        """Find the PR for many head branches via chunked, aliased GraphQL queries.
+
+        Mirrors get_pr_for_branch(): PRs from forks are ignored and the most
+        recently created PR for a branch wins. A failed chunk is retried item
+        by item with get_pr_for_branch(), except on rate-limit errors, which
+        are raised.
+
+        Raises:
+            RuntimeError: If GitHub reports a rate limit
+        """
+        assert self._repo_info is not None, "repo_info required for get_pr_details_by_branches"
+        unique_branches = list(dict.fromkeys(branches))
+        result: dict[str, PRDetails] = {}
+        for start in range(0, len(unique_branches), PR_DETAILS_BATCH_SIZE):
+            chunk = unique_branches[start : start + PR_DETAILS_BATCH_SIZE]
+            aliases = [
+                f"b{index}: pullRequests(headRefName: {json.dumps(branch)}, first: 10,"
+                " states: [OPEN, CLOSED, MERGED],"
+                " orderBy: {field: CREATED_AT, direction: DESC})"
+                f" {{ nodes {{ {_PR_DETAILS_FIELDS} }} }}"
+                for index, branch in enumerate(chunk)
+            ]
+            repo_data = self._execute_pr_details_query(repo_root, aliases)
+            if repo_data is None:
+                for branch in chunk:
+                    pr = self.get_pr_for_branch(repo_root, branch)
+                    if not isinstance(pr, PRNotFound):
+                        result[branch] = pr
+                continue
+            for index, branch in enumerate(chunk):
+                connection = repo_data.get(f"b{index}") or {}
+                for node in connection.get("nodes") or []:
+                    if node is None or node.get("isCrossRepository"):
+                        continue
+                    result[branch] = self._parse_pr_details_from_graphql(node, self._repo_info)
+                    break
+        return result
+
+    def _execute_pr_details_query(
+        self, repo_root: Path, aliases: list[str]
+    ) -> dict[str, Any] | None:
+        """Run one aliased repository query.
+
+        Returns:
+            The repository data, or None if the query failed for a reason other
+            than a rate limit
+
+        Raises:
+            RuntimeError: If GitHub reports a rate limit
+        """
+        assert self._repo_info is not None
+        query = (
+            "query($owner: String!, $repo: String!) {"
+            f"  repository(owner: $owner, name: $repo) {{ {' '.join(aliases)} }}"
+            "}"
+        )
+        # GH-API-AUDIT: GraphQL - batched pullRequest details
+        cmd = [
+            "gh",
+            "api",
+            "graphql",
+            "-f",
+            f"query={query}",
+            "-f",
+            f"owner={self._repo_info.owner}",
+            "-f",
+            f"repo={self._repo_info.name}",
+        ]
+        try:
+            stdout = execute_gh_command_with_retry(cmd, repo_root, self._time)
+        except RuntimeError as e:
+            if is_rate_limit_error(str(e)):
+                raise
+            return None
+        return json.loads(stdout).get("data", {}).get("repository") or {}
+
+    def _parse_pr_details_from_graphql(
+        self, node: dict[str, Any], repo_info: RepoInfo
+    ) -> PRDetails:
+        """Parse PRDetails from a GraphQL pullRequest node selected with _PR_DETAILS_FIELDS."""
+        created_at_str = node.get("createdAt") or ""
+        updated_at_str = node.get("updatedAt") or ""
+        author_data = node.get("author")
+        labels_data = (node.get("labels") or {}).get("nodes") or []
+        return PRDetails(
+            number=node["number"],
+            url=node.get("url", ""),
+            title=node.get("title") or "",
+            body=node.get("body") or "",
+            state=node.get("state", "OPEN"),
+            is_draft=node.get("isDraft", False),
+            base_ref_name=node.get("baseRefName", ""),
+            head_ref_name=node.get("headRefName", ""),
+            is_cross_repository=node.get("isCrossRepository", False),
+            mergeable=node.get("mergeable") or "UNKNOWN",
+            merge_state_status=node.get("mergeStateStatus") or "UNKNOWN",
+            owner=repo_info.owner,
+            repo=repo_info.name,
+            labels=tuple(label.get("name", "") for label in labels_data if label),
+            created_at=(
+                datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
+                if created_at_str
+                else datetime(2000, 1, 1, tzinfo=UTC)
+            ),
+            updated_at=(
+                datetime.fromisoformat(updated_at_str.replace("Z", "+00:00"))
+                if updated_at_str
+                else datetime(2000, 1, 1, tzinfo=UTC)
+            ),
+            author=author_data.get("login", "") if author_data else "",
+        )
+
     def list_prs(
         self,
         repo_root: Path,
@@ -1877,91 +2130,109 @@ class RealLocalGitHub(LocalGitHub):
         """Get review threads for a pull request via GraphQL.
 
         Uses the reviewThreads connection which provides resolution status
-        that the REST API doesn't expose.
-        """
-        assert self._repo_info is not None, "repo_info required for get_pr_review_threads"
-
-        # GH-API-AUDIT: GraphQL - reviewThreads query
-        # WHY GRAPHQL: REST API does not expose isResolved field
-        cmd = [
-            "gh",
-            "api",
-            "graphql",
-            "-f",
-            f"query={GET_PR_REVIEW_THREADS_QUERY}",
-            "-f",
-            f"owner={self._repo_info.owner}",
-            "-f",
-            f"repo={self._repo_info.name}",
-            "-F",
-            f"number={pr_number}",
-        ]
-        stdout = execute_gh_command_with_retry(cmd, repo_root, self._time)
-        response = json.loads(stdout)
-
-        return self._parse_review_threads_response(response, include_resolved)
-
-    def _parse_review_threads_response(
-        self, response: dict[str, Any], include_resolved: bool
-    ) -> list[PRReviewThread]:
-        """Parse GraphQL response into PRReviewThread objects.
-
-        Args:
-            response: GraphQL response data
-            include_resolved: Whether to include resolved threads
-
-        Returns:
-            List of PRReviewThread sorted by (path, line)
+        that the REST API doesn't expose. Collects every page from
+        iter_pr_review_thread_pages.
         """
         threads: list[PRReviewThread] = []
+        for page in self.iter_pr_review_thread_pages(
+            repo_root, pr_number, include_resolved=include_resolved, after=None
+        ):
+            threads.extend(page.threads)
 
-        pr_data = response.get("data", {}).get("repository", {}).get("pullRequest")
-        if pr_data is None:
-            return threads
+        # Sort by path, then by line (None sorts first)
+        threads.sort(key=lambda t: (t.path, t.line or 0))
+        return threads
 
-        thread_nodes = pr_data.get("reviewThreads", {}).get("nodes", [])
+    def iter_pr_review_thread_pages(
+        self,
+        repo_root: Path,
+        pr_number: int,
+        *,
+        include_resolved: bool,
+        after: str | None,
+    ) -> Iterator[PRReviewThreadPage]:
+        """Stream review threads one GraphQL page (100 threads) at a time."""
+        assert self._repo_info is not None, "repo_info required for iter_pr_review_thread_pages"
+
+        cursor = after
+        while True:
+            # GH-API-AUDIT: GraphQL - reviewThreads query (paginated)
+            # WHY GRAPHQL: REST API does not expose isResolved field
+            cmd = [
+                "gh",
+                "api",
+                "graphql",
+                "-f",
+                f"query={GET_PR_REVIEW_THREADS_QUERY}",
+                "-f",
+                f"owner={self._repo_info.owner}",
+                "-f",
+                f"repo={self._repo_info.name}",
+                "-F",
+                f"number={pr_number}",
+                *_graphql_cursor_args(cursor),
+            ]
+            stdout = execute_gh_command_with_retry(cmd, repo_root, self._time)
+            response = json.loads(stdout)
 
-        for node in thread_nodes:
-            if node is None:
-                continue
+            pr_data = response.get("data", {}).get("repository", {}).get("pullRequest")
+            if pr_data is None:
+                return
+            connection = pr_data.get("reviewThreads", {})
 
-            is_resolved = node.get("isResolved", False)
-            if is_resolved and not include_resolved:
-                continue
-
-            # Parse comments
-            comments: list[PRReviewComment] = []
-            comment_nodes = node.get("comments", {}).get("nodes", [])
-            for comment_node in comment_nodes:
-                if comment_node is None:
+            threads: list[PRReviewThread] = []
+            for node in connection.get("nodes", []):
+                if node is None:
                     continue
-
-                author = comment_node.get("author")
-                author_login = author.get("login") if author else "unknown"
-
-                comment = PRReviewComment(
-                    id=comment_node.get("databaseId", 0),
-                    body=comment_node.get("body", ""),
-                    author=author_login,
-                    path=comment_node.get("path", ""),
-                    line=comment_node.get("line"),
-                    created_at=comment_node.get("createdAt", ""),
-                )
-                comments.append(comment)
-
-            thread = PRReviewThread(
-                id=node.get("id", ""),
-                path=node.get("path", ""),
-                line=node.get("line"),
-                is_resolved=is_resolved,
-                is_outdated=node.get("isOutdated", False),
-                comments=tuple(comments),
-            )
-            threads.append(thread)
-
-        # Sort by path, then by line (None sorts first)
-        threads.sort(key=lambda t: (t.path, t.line or 0))
-        return threads
+                is_resolved = node.get("isResolved", False)
+                if is_resolved and not include_resolved:
+                    continue
+                threads.append(self._parse_review_thread_node(repo_root, node))
+
+            page_info = connection.get("pageInfo", {})
+            end_cursor = page_info.get("endCursor")
+            yield PRReviewThreadPage(threads=tuple(threads), end_cursor=end_cursor)
+
+            if not page_info.get("hasNextPage", False) or end_cursor is None:
+                return
+            cursor = end_cursor
+
+    def _parse_review_thread_node(self, repo_root: Path, node: dict[str, Any]) -> PRReviewThread:
+        """Parse a reviewThreads node, fetching any comments past the first page."""
+        comments_connection = node.get("comments", {})
+        comments = _parse_review_comment_nodes(comments_connection.get("nodes", []))
+
+        page_info = comments_connection.get("pageInfo", {})
+        cursor = page_info.get("endCursor")
+        thread_id = node.get("id", "")
+        while page_info.get("hasNextPage", False) and cursor is not None and thread_id:
+            # GH-API-AUDIT: GraphQL - review thread comments query (paginated)
+            cmd = [
+                "gh",
+                "api",
+                "graphql",
+                "-f",
+                f"query={GET_REVIEW_THREAD_COMMENTS_QUERY}",
+                "-f",
+                f"threadId={thread_id}",
+                *_graphql_cursor_args(cursor),
+            ]
+            stdout = execute_gh_command_with_retry(cmd, repo_root, self._time)
+            response = json.loads(stdout)
+            thread_data = response.get("data", {}).get("node") or {}
+            comments_connection = thread_data.get("comments", {})
+            comments.extend(_parse_review_comment_nodes(comments_connection.get("nodes", [])))
+            page_info = comments_connection.get("pageInfo", {})
+            cursor = page_info.get("endCursor")
+
+        return PRReviewThread(
+            id=thread_id,
+            path=node.get("path", ""),
+            line=node.get("line"),
+            is_resolved=node.get("isResolved", False),
+            is_outdated=node.get("isOutdated", False),
+            comments=tuple(comments),
+        )
 
     def get_pr_reviews(
         self,
@@ -1969,36 +2240,58 @@ class RealLocalGitHub(LocalGitHub):
         pr_number: int,
     ) -> list[PRReview]:
         """Get PR-level reviews for a pull request via GraphQL."""
-        assert self._repo_info is not None, "repo_info required for get_pr_reviews"
+        reviews = list(self.iter_pr_reviews(repo_root, pr_number))
+        reviews.sort(key=lambda r: r.submitted_at)
+        return reviews
 
-        # GH-API-AUDIT: GraphQL - reviews query
-        # WHY GRAPHQL: REST API doesn't reliably expose review state + body in one call
-        cmd = [
-            "gh",
-            "api",
-            "graphql",
-            "-f",
-            f"query={GET_PR_REVIEWS_QUERY}",
-            "-f",
-            f"owner={self._repo_info.owner}",
-            "-f",
-            f"repo={self._repo_info.name}",
-            "-F",
-            f"number={pr_number}",
-        ]
-        stdout = execute_gh_command_with_retry(cmd, repo_root, self._time)
-        response = json.loads(stdout)
+    def iter_pr_reviews(
+        self,
+        repo_root: Path,
+        pr_number: int,
+    ) -> Iterator[PRReview]:
+        """Stream PR-level reviews one GraphQL page (100 reviews) at a time."""
+        assert self._repo_info is not None, "repo_info required for iter_pr_reviews"
+
+        cursor: str | None = None
+        while True:
+            # GH-API-AUDIT: GraphQL - reviews query (paginated)
+            # WHY GRAPHQL: REST API doesn't reliably expose review state + body in one call
+            cmd = [
+                "gh",
+                "api",
+                "graphql",
+                "-f",
+                f"query={GET_PR_REVIEWS_QUERY}",
+                "-f",
+                f"owner={self._repo_info.owner}",
+                "-f",
+                f"repo={self._repo_info.name}",
+                "-F",
+                f"number={pr_number}",
+                *_graphql_cursor_args(cursor),
+            ]
+            stdout = execute_gh_command_with_retry(cmd, repo_root, self._time)
+            response = json.loads(stdout)
 
-        return self._parse_reviews_response(response)
+            pr_data = response.get("data", {}).get("repository", {}).get("pullRequest")
+            if pr_data is None:
+                return
+            connection = pr_data.get("reviews", {})
+            yield from self._parse_reviews_response(response)
+
+            page_info = connection.get("pageInfo", {})
+            cursor = page_info.get("endCursor")
+            if not page_info.get("hasNextPage", False) or cursor is None:
+                return
 
     def _parse_reviews_response(self, response: dict[str, Any]) -> list[PRReview]:
-        """Parse GraphQL reviews response into PRReview objects.
+        """Parse one page of a GraphQL reviews response into PRReview objects.
 
         Args:
             response: GraphQL response data
 
         Returns:
-            List of PRReview sorted by submitted_at
+            List of PRReview in the order GitHub returned them
         """
         reviews: list[PRReview] = []
 
@@ -2027,7 +2320,6 @@ class RealLocalGitHub(LocalGitHub):
             )
             reviews.append(review)
 
-        reviews.sort(key=lambda r: r.submitted_at)
         return reviews
 
     def get_pr_check_runs(
@@ -2268,21 +2560,34 @@ class RealLocalGitHub(LocalGitHub):
         Returns:
             List of comment dicts from the GitHub API, or empty list on failure.
         """
-        # GH-API-AUDIT: REST - GET issues/{number}/comments
-        cmd = [
-            "gh",
-            "api",
-            f"repos/{{owner}}/{{repo}}/issues/{pr_number}/comments",
-            "--paginate",
-        ]
-
         try:
-            stdout = execute_gh_command_with_retry(cmd, repo_root, self._time)
-            return json.loads(stdout)
+            return list(self.iter_pr_comments(repo_root, pr_number))
         except RuntimeError as e:
             debug_log(f"fetch_pr_comments failed: {e}")
             return []
 
+    def iter_pr_comments(self, repo_root: Path, pr_number: int) -> Iterator[dict[str, Any]]:
+        """Stream issue/PR comments one REST page (100 comments) at a time.
+
+        Requests pages explicitly instead of using --paginate so that a
+        consumer that stops early does not download the remaining pages.
+        """
+        page = 1
+        while True:
+            # GH-API-AUDIT: REST - GET issues/{number}/comments (paginated)
+            cmd = [
+                "gh",
+                "api",
+                f"repos/{{owner}}/{{repo}}/issues/{pr_number}/comments"
+                f"?per_page={_REST_PAGE_SIZE}&page={page}",
+            ]
+            stdout = execute_gh_command_with_retry(cmd, repo_root, self._time)
+            comments: list[dict[str, Any]] = json.loads(stdout)
+            yield from comments
+            if len(comments) < _REST_PAGE_SIZE:
+                return
+            page += 1
+
     def find_pr_comment_by_marker(
         self,
         repo_root: Path,
@@ -2293,16 +2598,19 @@ class RealLocalGitHub(LocalGitHub):
 
         Uses REST API to list issue comments (PRs are issues in GitHub's model).
         Returns the numeric database ID needed for update operations.
-        Fetches all comments as JSON and searches in Python to avoid
-        shell escaping issues with special characters in markers.
+        Streams comments as JSON and searches in Python to avoid
+        shell escaping issues with special characters in markers; stops
+        fetching pages at the first match.
         """
-        comments = self.fetch_pr_comments(repo_root, pr_number)
-        for comment in comments:
-            body = comment.get("body", "")
-            if marker in body:
-                comment_id = comment.get("id")
-                if comment_id is not None:
-                    return int(comment_id)
+        try:
+            for comment in self.iter_pr_comments(repo_root, pr_number):
+                body = comment.get("body", "")
+                if marker in body:
+                    comment_id = comment.get("id")
+                    if comment_id is not None:
+                        return int(comment_id)
+        except RuntimeError as e:
+            debug_log(f"find_pr_comment_by_marker failed: {e}")
         return None
 
     def update_pr_comment(
@@ -0,0 +1,213 @@
+"""Correlate dispatched workflows with their runs.
+
+`workflow_dispatch` does not return a run ID, so every dispatch passes a
+random `distinct_id` input that the workflow echoes at the end of its
+run-name ("<title>:<distinct_id>"). The run is then found by listing the
+workflow's runs and matching display titles.
+
+Correlating one dispatch at a time multiplies API calls when a command
+dispatches many workflows, and a fixed first page of runs can miss a run
+once enough newer runs exist. correlate_workflow_runs() instead resolves
+any number of pending distinct IDs together: each poll tick pages through a
+single runs listing restricted to runs created since the dispatches, and
+removes every ID it finds from the pending set.
+
+Each distinct ID resolves independently to a WorkflowRunResult, so one lost
+or skipped run does not discard the runs that were found for the others.
+"""
+
+import secrets
+import string
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from urllib.parse import quote
+
+from erk_shared.debug import debug_log
+from erk_shared.gateway.time.abc import Time
+from erk_shared.output.output import user_output
+
+# GitHub API eventual consistency: exponential backoff 1,2,4,8,...,8s (~62s, 11 attempts)
+RUN_CORRELATION_MAX_ATTEMPTS = 11
+
+# Maximum page size accepted by the workflow runs listing
+RUNS_PAGE_SIZE = 100
+
+# Local and GitHub clocks can disagree; widen the created>= window so a
+# slightly fast local clock cannot filter out the runs being looked for.
+CLOCK_SKEW_ALLOWANCE = timedelta(minutes=2)
+
+FetchRunsPage = Callable[[int], list[dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class WorkflowRunFound:
+    """The dispatch's run was found."""
+
+    run_id: str
+
+
+@dataclass(frozen=True)
+class WorkflowRunNotFound:
+    """No run matched the dispatch before polling attempts ran out."""
+
+    message: str
+
+
+@dataclass(frozen=True)
+class WorkflowRunSkipped:
+    """The dispatch's run was found but was skipped or cancelled."""
+
+    run_id: str
+    conclusion: str
+    message: str
+
+
+WorkflowRunResult = WorkflowRunFound | WorkflowRunNotFound | WorkflowRunSkipped
+
+
+@dataclass(frozen=True)
+class WorkflowRunCorrelation:
+    """Outcome of correlating distinct IDs with workflow runs.
+
+    Attributes:
+        matched: Mapping of distinct_id -> found or skipped run for every ID
+            that matched a run. IDs that never matched are absent.
+        recent_runs: First page of runs from the last poll, for diagnostics.
+    """
+
+    matched: dict[str, WorkflowRunFound | WorkflowRunSkipped]
+    recent_runs: list[dict[str, Any]]
+
+    def missing(self, distinct_ids: Sequence[str]) -> list[str]:
+        """Return the IDs in distinct_ids that never matched a run, in order."""
+        return [d for d in distinct_ids if d not in self.matched]
+
+
+def require_workflow_run(result: WorkflowRunResult) -> str:
+    """Return the run ID of a found run.
+
+    For callers that dispatch a single workflow and treat any other outcome
+    as an error.
+
+    Raises:
+        RuntimeError: If the run was not found, skipped or cancelled.
+    """
+    if isinstance(result, WorkflowRunFound):
+        return result.run_id
+    raise RuntimeError(result.message)
+
+
+def generate_distinct_id() -> str:
+    """Generate a random base36 ID for workflow dispatch correlation.
+
+    Returns:
+        6-character base36 string (e.g., 'a1b2c3')
+    """
+    # Base36 alphabet: 0-9 and a-z
+    base36_chars = string.digits + string.ascii_lowercase
+    # Generate 6 random characters (~2.2 billion possibilities)
+    return "".join(secrets.choice(base36_chars) for _ in range(6))
+
+
+def distinct_id_from_display_title(display_title: str) -> str | None:
+    """Extract the distinct_id suffix from a run's display title.
+
+    Returns:
+        The text after the last ':' or None if the title has no ':'.
+    """
+    if ":" not in display_title:
+        return None
+    return display_title.rsplit(":", 1)[1].strip()
+
+
+def workflow_runs_endpoint(workflow: str, *, created_since: datetime, page: int) -> str:
+    """Build the runs listing path (relative to repos/{owner}/{repo}/) for one page.
+
+    Args:
+        workflow: Workflow filename (e.g., "plan-implement.yml")
+        created_since: When the earliest dispatch was sent. Naive datetimes
+            are treated as local time.
+        page: 1-based page number
+    """
+    since = (created_since.astimezone(UTC) - CLOCK_SKEW_ALLOWANCE).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return (
+        f"actions/workflows/{workflow}/runs"
+        f"?event=workflow_dispatch&created={quote('>=' + since)}"
+        f"&per_page={RUNS_PAGE_SIZE}&page={page}"
+    )
+
+
+def correlate_workflow_runs(
+    *,
+    workflow: str,
+    distinct_ids: Sequence[str],
+    fetch_runs_page: FetchRunsPage,
+    time: Time,
+) -> WorkflowRunCorrelation:
+    """Poll until every distinct ID is matched to a run or attempts run out.
+
+    Each poll tick fetches pages of the runs listing until all pending IDs
+    are found or a short (final) page is returned, so N dispatches cost one
+    listing per tick instead of N.
+
+    Args:
+        workflow: Workflow filename, used in error messages
+        distinct_ids: Correlation IDs passed to the dispatched workflows
+        fetch_runs_page: Returns the workflow_runs list for a 1-based page
+        time: Time gateway for backoff sleeps
+
+    Returns:
+        WorkflowRunCorrelation; IDs still missing after the last attempt are
+        absent from matched. A skipped or cancelled run is recorded as
+        WorkflowRunSkipped and is not polled for again.
+    """
+    pending = set(distinct_ids)
+    matched: dict[str, WorkflowRunFound | WorkflowRunSkipped] = {}
+    recent_runs: list[dict[str, Any]] = []
+
+    for attempt in range(RUN_CORRELATION_MAX_ATTEMPTS):
+        user_output(
+            f"  Waiting for workflow run... (attempt {attempt + 1}/{RUN_CORRELATION_MAX_ATTEMPTS})"
+        )
+        page = 1
+        while pending:
+            runs = fetch_runs_page(page)
+            debug_log(f"correlate_workflow_runs: page {page} returned {len(runs)} runs")
+            if page == 1:
+                recent_runs = runs
+            for run in runs:
+                display_title = run.get("display_title", "")
+                distinct_id = distinct_id_from_display_title(display_title)
+                if distinct_id is None or distinct_id not in pending:
+                    continue
+
+                conclusion = run.get("conclusion")
+                if conclusion in ("skipped", "cancelled"):
+                    # Matched run was skipped/cancelled — no point polling further
+                    matched[distinct_id] = WorkflowRunSkipped(
+                        run_id=str(run["id"]),
+                        conclusion=conclusion,
+                        message=(
+                            f"Workflow '{workflow}' run was {conclusion}.\n"
+                            f"Run ID: {run['id']}, title: '{display_title}'\n"
+                            f"This usually means a job-level condition was not met "
+                            f"(e.g., vars.CLAUDE_ENABLED is 'false')."
+                        ),
+                    )
+                else:
+                    matched[distinct_id] = WorkflowRunFound(run_id=str(run["id"]))
+                pending.discard(distinct_id)
+            if len(runs) < RUNS_PAGE_SIZE:
+                break
+            page += 1
+
+        if not pending:
+            break
+
+        # Exponential backoff: 2^attempt seconds, capped at 8s
+        if attempt < RUN_CORRELATION_MAX_ATTEMPTS - 1:
+            time.sleep(min(2**attempt, 8))
+
+    return WorkflowRunCorrelation(matched=matched, recent_runs=recent_runs)
@@ -28,3 +28,51 @@ def is_transient_error(error_message: str) -> bool:
     """
     lower_message = error_message.lower()
     return any(pattern in lower_message for pattern in TRANSIENT_ERROR_PATTERNS)
+
+
+SECONDARY_RATE_LIMIT_PATTERNS = (
+    "secondary rate limit",
+    "abuse detection mechanism",
+)
+
+
+def is_secondary_rate_limit_error(error_message: str) -> bool:
+    """Check if an error message indicates a GitHub secondary rate limit.
+
+    Secondary rate limits are triggered by bursts of concurrent or
+    content-creating requests. Unlike network errors, they clear only after
+    waiting (GitHub recommends at least a minute), so callers should back off
+    with longer delays than the transient-error retry schedule.
+
+    Args:
+        error_message: The error message to check
+
+    Returns:
+        True if the error reports a secondary rate limit, False otherwise
+    """
+    lower_message = error_message.lower()
+    return any(pattern in lower_message for pattern in SECONDARY_RATE_LIMIT_PATTERNS)
+
+
+RATE_LIMIT_PATTERNS = (
+    "rate limit exceeded",
+    "rate_limited",
+    *SECONDARY_RATE_LIMIT_PATTERNS,
+)
+
+
+def is_rate_limit_error(error_message: str) -> bool:
+    """Check if an error message indicates any GitHub rate limit.
+
+    Covers primary quota exhaustion (REST "API rate limit exceeded", GraphQL
+    RATE_LIMITED) as well as secondary rate limits. Callers must not answer
+    these by issuing more requests, e.g. by falling back to per-item calls.
+
+    Args:
+        error_message: The error message to check
+
+    Returns:
+        True if the error reports a rate limit, False otherwise
+    """
+    lower_message = error_message.lower()
+    return any(pattern in lower_message for pattern in RATE_LIMIT_PATTERNS)
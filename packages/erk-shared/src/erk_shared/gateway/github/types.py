@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal, TypedDict
 
+from erk_shared.gateway.github.issues.types import IssueInfo
 from erk_shared.non_ideal_state import EnsurableResult
 
 PRState = Literal["OPEN", "MERGED", "CLOSED"]
@@ -108,6 +109,22 @@ class PRReviewThread:
     comments: tuple[PRReviewComment, ...]
 
 
+@dataclass(frozen=True)
+class PRReviewThreadPage:
+    """One page of review threads from a cursor-paginated fetch.
+
+    Attributes:
+        threads: Threads on this page in GitHub's order (oldest first),
+            each with all of its comments
+        end_cursor: Cursor after the last thread on this page. Pass it as
+            `after` to fetch only threads added since this page. None when
+            the PR has no threads past the requested cursor.
+    """
+
+    threads: tuple[PRReviewThread, ...]
+    end_cursor: str | None
+
+
 @dataclass(frozen=True)
 class PRCheckRun:
     """A single CI check run or status context on a PR.
@@ -257,6 +274,23 @@ class PullRequestInfo:
     base_ref_name: str | None = None
 
 
+@dataclass(frozen=True)
+class IssuesWithPrLinkagesPage:
+    """One page of issues (with linked PRs) from a cursor-paginated fetch.
+
+    Attributes:
+        issues: Issues on this page, most recently updated first
+        pr_linkages: Mapping of issue number -> PRs referencing that issue,
+            for the issues on this page
+        end_cursor: Cursor after the last issue on this page, or None when
+            this is the last page
+    """
+
+    issues: tuple[IssueInfo, ...]
+    pr_linkages: dict[int, list[PullRequestInfo]]
+    end_cursor: str | None
+
+
 @dataclass(frozen=True)
 class CommonIssuePRFields:
     """Common fields shared by issues and pull requests from issueOrPullRequest queries."""
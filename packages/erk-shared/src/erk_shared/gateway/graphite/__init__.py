@@ -7,4 +7,5 @@ Import from submodules:
 - dry_run: DryRunGraphite
 - disabled: GraphiteDisabled, GraphiteDisabledReason, GraphiteDisabledError
 - parsing: parse_graphite_cache, parse_graphite_pr_info, read_graphite_json_file
+- stack_index: StackIndex, load_stack_index, save_stack_index
 """
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from erk_shared.gateway.git.abc import Git, WorktreeInfo
 from erk_shared.gateway.github.types import GitHubRepoId, PullRequestInfo
+from erk_shared.gateway.graphite.stack_index import StackIndex
 from erk_shared.gateway.graphite.types import BranchMetadata
 
 if TYPE_CHECKING:
@@ -160,6 +161,26 @@ class Graphite(ABC):
         """
         ...
 
+    def get_stack_index(self, git_ops: Git, repo_root: Path) -> StackIndex | None:
+        """Get the stack graph index for all gt-tracked branches.
+
+        The index answers ancestor, descendant, subtree, and trunk-distance
+        queries without re-walking branch metadata. This default builds it from
+        get_all_branches(); RealGraphite overrides it to reuse an index cached
+        per .graphite_cache_persist version.
+
+        Args:
+            git_ops: Git instance for accessing git common directory
+            repo_root: Repository root directory
+
+        Returns:
+            StackIndex, or None if no branches are tracked
+        """
+        all_branches = self.get_all_branches(git_ops, repo_root)
+        if not all_branches:
+            return None
+        return StackIndex.build(all_branches)
+
     def get_parent_branch(self, git_ops: Git, repo_root: Path, branch: str) -> str | None:
         """Get parent branch name for a given branch.
 
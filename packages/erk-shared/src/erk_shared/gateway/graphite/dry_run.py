@@ -5,6 +5,7 @@ from pathlib import Path
 from erk_shared.gateway.git.abc import Git
 from erk_shared.gateway.github.types import GitHubRepoId, PullRequestInfo
 from erk_shared.gateway.graphite.abc import Graphite
+from erk_shared.gateway.graphite.stack_index import StackIndex
 from erk_shared.gateway.graphite.types import BranchMetadata
 
 
@@ -48,6 +49,10 @@ class DryRunGraphite(Graphite):
         """Get branch stack (read-only operation, delegates to wrapped)."""
         return self._wrapped.get_branch_stack(git_ops, repo_root, branch)
 
+    def get_stack_index(self, git_ops: Git, repo_root: Path) -> StackIndex | None:
+        """Get stack graph index (read-only, delegates to wrapped)."""
+        return self._wrapped.get_stack_index(git_ops, repo_root)
+
     # Destructive operations: print dry-run message instead of executing
 
     def check_auth_status(self) -> tuple[bool, str | None, str | None]:
@@ -89,7 +89,21 @@ def parse_graphite_cache(
     Returns:
         Mapping of branch name to BranchMetadata
     """
-    cache_data = json.loads(json_str)
+    return parse_graphite_cache_data(json.loads(json_str), git_branch_heads)
+
+
+def parse_graphite_cache_data(
+    cache_data: dict[str, Any], git_branch_heads: dict[str, str]
+) -> dict[str, BranchMetadata]:
+    """Convert already-decoded .graphite_cache_persist data into BranchMetadata objects.
+
+    Args:
+        cache_data: Decoded JSON from .graphite_cache_persist file
+        git_branch_heads: Mapping of branch name to commit SHA from git
+
+    Returns:
+        Mapping of branch name to BranchMetadata
+    """
     branches_data: list[tuple[str, dict[str, object]]] = cache_data.get("branches", [])
 
     result = {}
@@ -129,6 +143,47 @@ def parse_graphite_cache(
     return result
 
 
+def read_branch_heads_from_refs(git_dir: Path) -> dict[str, str] | None:
+    """Read local branch head SHAs directly from the git ref store.
+
+    Loose refs under refs/heads take precedence over entries in packed-refs,
+    matching git's own resolution order. Symbolic refs are skipped.
+
+    Args:
+        git_dir: Git common directory (where refs/ and packed-refs live)
+
+    Returns:
+        Mapping of branch name to full commit SHA, or None if the ref store
+        cannot be read directly (reftable format or no refs/heads directory),
+        in which case callers should ask git instead.
+    """
+    if (git_dir / "reftable").exists():
+        return None
+    heads_dir = git_dir / "refs" / "heads"
+    if not heads_dir.is_dir():
+        return None
+
+    heads: dict[str, str] = {}
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.exists():
+        for line in packed_refs.read_text(encoding="utf-8").splitlines():
+            if not line or line[0] in "#^":
+                continue
+            sha, _, ref = line.partition(" ")
+            if ref.startswith("refs/heads/"):
+                heads[ref[len("refs/heads/") :]] = sha
+
+    for ref_file in heads_dir.rglob("*"):
+        if not ref_file.is_file() or ref_file.name.endswith(".lock"):
+            continue
+        content = ref_file.read_text(encoding="utf-8").strip()
+        if not content or content.startswith("ref:"):
+            continue
+        heads[ref_file.relative_to(heads_dir).as_posix()] = content
+
+    return heads
+
+
 def _graphite_url_to_github_url(graphite_url: str) -> str:
     """Convert Graphite URL to GitHub URL.
 
@@ -3,6 +3,7 @@
 import json
 import subprocess
 import sys
+import threading
 from pathlib import Path
 from subprocess import DEVNULL
 
@@ -10,10 +11,17 @@ from erk_shared.gateway.git.abc import Git
 from erk_shared.gateway.github.types import GitHubRepoId, PullRequestInfo
 from erk_shared.gateway.graphite.abc import Graphite
 from erk_shared.gateway.graphite.parsing import (
-    parse_graphite_cache,
+    parse_graphite_cache_data,
     parse_graphite_pr_info,
+    read_branch_heads_from_refs,
     read_graphite_json_file,
 )
+from erk_shared.gateway.graphite.stack_index import (
+    StackIndex,
+    StackIndexKey,
+    load_stack_index,
+    save_stack_index,
+)
 from erk_shared.gateway.graphite.types import BranchMetadata
 from erk_shared.output.output import user_output
 from erk_shared.subprocess_utils import run_subprocess_with_context
@@ -23,12 +31,35 @@ class RealGraphite(Graphite):
     """Production implementation using gt CLI.
 
     All Graphite operations execute actual gt commands via subprocess.
+
+    Safe to share across threads: the branch and stack-index caches are read,
+    rebuilt, and invalidated under one lock, so concurrent callers see a
+    consistent cache and a stale cache is rebuilt once.
     """
 
     def __init__(self) -> None:
-        """Initialize with empty cache for get_all_branches."""
+        """Initialize with empty caches for get_all_branches and get_stack_index."""
+        # Reentrant: get_stack_index() rebuilds via get_all_branches().
+        self._cache_lock = threading.RLock()
         self._branches_cache: dict[str, BranchMetadata] | None = None
         self._branches_cache_mtime: float | None = None
+        self._stack_index: StackIndex | None = None
+        self._stack_index_key: StackIndexKey | None = None
+        self._git_common_dirs: dict[Path, Path] = {}
+
+    def _get_git_common_dir(self, git_ops: Git, repo_root: Path) -> Path | None:
+        """Get the git common directory, resolving it once per repo root.
+
+        Stack lookups (parent/children) read Graphite's cache file on every
+        call; memoizing the directory keeps repeated lookups free of git
+        subprocesses.
+        """
+        if repo_root in self._git_common_dirs:
+            return self._git_common_dirs[repo_root]
+        git_dir = git_ops.repo.get_git_common_dir(repo_root)
+        if git_dir is not None:
+            self._git_common_dirs[repo_root] = git_dir
+        return git_dir
 
     def get_graphite_url(self, repo_id: GitHubRepoId, pr_number: int) -> str:
         """Get Graphite PR URL for a pull request.
@@ -47,7 +78,7 @@ class RealGraphite(Graphite):
 
     def get_prs_from_graphite(self, git_ops: Git, repo_root: Path) -> dict[str, PullRequestInfo]:
         """Get PR information from Graphite's .git/.graphite_pr_info file."""
-        git_dir = git_ops.repo.get_git_common_dir(repo_root)
+        git_dir = self._get_git_common_dir(git_ops, repo_root)
         if git_dir is None:
             return {}
 
@@ -63,14 +94,15 @@ class RealGraphite(Graphite):
     def get_all_branches(self, git_ops: Git, repo_root: Path) -> dict[str, BranchMetadata]:
         """Get all gt-tracked branches with metadata.
 
-        Reads .git/.graphite_cache_persist and enriches with commit SHAs from git.
-        Returns empty dict if cache doesn't exist or git operations fail.
+        Reads .git/.graphite_cache_persist and enriches with commit SHAs read
+        directly from the git ref store (falling back to git when refs can't be
+        read directly). Returns empty dict if cache doesn't exist.
 
         Results are cached based on file mtime - the cache is automatically
         invalidated when the underlying file changes, whether from erk operations
         or external gt commands.
         """
-        git_dir = git_ops.repo.get_git_common_dir(repo_root)
+        git_dir = self._get_git_common_dir(git_ops, repo_root)
         if git_dir is None:
             return {}
 
@@ -78,81 +110,72 @@ class RealGraphite(Graphite):
         if not cache_file.exists():
             return {}
 
-        # Check if cache is still valid via mtime
-        current_mtime = cache_file.stat().st_mtime
-        if (
-            self._branches_cache is not None
-            and self._branches_cache_mtime is not None
-            and self._branches_cache_mtime == current_mtime
-        ):
-            return self._branches_cache
-
-        # Cache miss or stale - recompute
-        data = read_graphite_json_file(cache_file, "Graphite cache")
+        with self._cache_lock:
+            # Check if cache is still valid via mtime
+            current_mtime = cache_file.stat().st_mtime
+            if (
+                self._branches_cache is not None
+                and self._branches_cache_mtime is not None
+                and self._branches_cache_mtime == current_mtime
+            ):
+                return self._branches_cache
+
+            # Cache miss or stale - recompute
+            data = read_graphite_json_file(cache_file, "Graphite cache")
+
+            all_heads = read_branch_heads_from_refs(git_dir)
+            if all_heads is None:
+                all_heads = git_ops.branch.get_all_branch_heads(repo_root)
+            branches_data = data.get("branches", [])
+            git_branch_heads = {
+                branch_name: all_heads[branch_name]
+                for branch_name, _ in branches_data
+                if isinstance(branch_name, str) and branch_name in all_heads
+            }
 
-        # Get all branch heads from git in a single call for enrichment
-        all_heads = git_ops.branch.get_all_branch_heads(repo_root)
-        branches_data = data.get("branches", [])
-        git_branch_heads = {
-            branch_name: all_heads[branch_name]
-            for branch_name, _ in branches_data
-            if isinstance(branch_name, str) and branch_name in all_heads
-        }
+            self._branches_cache = parse_graphite_cache_data(data, git_branch_heads)
+            self._branches_cache_mtime = current_mtime
+            return self._branches_cache
 
-        # parse_graphite_cache expects JSON string, so convert back
-        self._branches_cache = parse_graphite_cache(json.dumps(data), git_branch_heads)
-        self._branches_cache_mtime = current_mtime
-        return self._branches_cache
+    def get_stack_index(self, git_ops: Git, repo_root: Path) -> StackIndex | None:
+        """Get the stack graph index, built once per .graphite_cache_persist version.
 
-    def get_branch_stack(self, git_ops: Git, repo_root: Path, branch: str) -> list[str] | None:
-        """Get the linear worktree stack for a given branch."""
-        # Get all branch metadata
-        all_branches = self.get_all_branches(git_ops, repo_root)
-        if not all_branches:
+        The index is kept in memory and persisted next to the Graphite cache,
+        keyed by the cache file's mtime and size. A fresh process with an
+        unchanged Graphite cache loads the persisted index without parsing the
+        Graphite cache or reading branch heads.
+        """
+        git_dir = self._get_git_common_dir(git_ops, repo_root)
+        if git_dir is None:
             return None
 
-        # Check if the requested branch exists
-        if branch not in all_branches:
+        cache_file = git_dir / ".graphite_cache_persist"
+        if not cache_file.exists():
             return None
 
-        # Build parent-child map for traversal
-        branch_info: dict[str, dict[str, str | list[str] | None]] = {}
-        for name, metadata in all_branches.items():
-            branch_info[name] = {
-                "parent": metadata.parent,
-                "children": metadata.children,
-            }
+        key = StackIndexKey.for_file(cache_file)
+        with self._cache_lock:
+            if self._stack_index is not None and self._stack_index_key == key:
+                return self._stack_index
 
-        # Traverse DOWN to collect ancestors (current → parent → ... → trunk)
-        ancestors: list[str] = []
-        current = branch
-        while current in branch_info:
-            ancestors.append(current)
-            parent = branch_info[current]["parent"]
-            if not isinstance(parent, str) or parent not in branch_info:
-                break
-            current = parent
+            index = load_stack_index(git_dir, key)
+            if index is None:
+                all_branches = self.get_all_branches(git_ops, repo_root)
+                if not all_branches:
+                    return None
+                index = StackIndex.build(all_branches)
+                save_stack_index(git_dir, index, key)
 
-        # Reverse to get [trunk, ..., parent, current]
-        ancestors.reverse()
+            self._stack_index = index
+            self._stack_index_key = key
+            return index
 
-        # Traverse UP to collect descendants (current → child → ... → leaf)
-        descendants: list[str] = []
-        current = branch
-        while True:
-            children = branch_info[current]["children"]
-            if not children:
-                break
-            # Follow the first child for linear stack
-            first_child = children[0]
-            if first_child not in branch_info:
-                break
-            descendants.append(first_child)
-            current = first_child
-
-        # Combine ancestors and descendants
-        # ancestors already contains the current branch
-        return ancestors + descendants
+    def get_branch_stack(self, git_ops: Git, repo_root: Path, branch: str) -> list[str] | None:
+        """Get the linear worktree stack for a given branch."""
+        index = self.get_stack_index(git_ops, repo_root)
+        if index is None:
+            return None
+        return index.linear_stack(branch)
 
     def check_auth_status(self) -> tuple[bool, str | None, str | None]:
         """Check Graphite authentication status.
@@ -272,7 +295,9 @@ class RealGraphite(Graphite):
             ) from e
 
         # Invalidate branches cache - gt submit modifies Graphite metadata
-        self._branches_cache = None
+        with self._cache_lock:
+            self._branches_cache = None
+            self._stack_index = None
 
     def restack(self, repo_root: Path) -> tuple[bool, str | None]:
         """Restack the current stack using gt restack."""
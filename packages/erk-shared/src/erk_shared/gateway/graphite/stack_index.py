@@ -0,0 +1,276 @@
+"""Precomputed stack graph index over Graphite branch metadata.
+
+The index is built once from the branches in .graphite_cache_persist and
+answers stack queries without re-walking the parent/child maps:
+
+- is_ancestor: O(1) via preorder entry/exit intervals
+- ancestors, descendants, subtree: linear in the size of the result
+- trunk_distance: O(1)
+
+It is persisted next to the Graphite cache, keyed by the cache file's mtime
+and size, so fresh erk processes can answer stack queries without re-parsing
+the full Graphite cache.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from erk_shared.gateway.graphite.types import BranchMetadata
+
+STACK_INDEX_FILENAME = ".erk_graphite_stack_index.json"
+STACK_INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class StackIndexKey:
+    """Identity of the Graphite cache file an index was built from."""
+
+    mtime_ns: int
+    size: int
+
+    @staticmethod
+    def for_file(cache_file: Path) -> StackIndexKey:
+        stat = cache_file.stat()
+        return StackIndexKey(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+
+@dataclass(frozen=True)
+class StackIndex:
+    """Immutable ancestry index over gt-tracked branches.
+
+    Attributes:
+        parents: Branch name -> tracked parent name (None for roots/trunk)
+        children: Branch name -> child names in Graphite order (may include
+            untracked names, mirroring the Graphite cache)
+        preorder: Depth-first preorder over all branches reachable from a root
+        entry: Branch name -> position in preorder
+        exit: Branch name -> one past the position of its last descendant
+        depth: Branch name -> number of parent hops to its root (trunk distance)
+    """
+
+    parents: dict[str, str | None]
+    children: dict[str, tuple[str, ...]]
+    preorder: tuple[str, ...]
+    entry: dict[str, int]
+    exit: dict[str, int]
+    depth: dict[str, int]
+
+    @staticmethod
+    def build(branches: Mapping[str, BranchMetadata]) -> StackIndex:
+        """Build the index in O(n) from branch metadata."""
+        parents: dict[str, str | None] = {}
+        children: dict[str, tuple[str, ...]] = {}
+        for name, metadata in branches.items():
+            parent = metadata.parent
+            parents[name] = parent if parent is not None and parent in branches else None
+            children[name] = tuple(metadata.children)
+
+        # Tree edges come from parent pointers so each branch is visited once,
+        # even if the Graphite cache lists it under several children arrays.
+        tree_children: dict[str, list[str]] = {name: [] for name in branches}
+        for name in branches:
+            for child in children[name]:
+                if child in parents and parents[child] == name:
+                    tree_children[name].append(child)
+        for name, parent in parents.items():
+            if parent is not None and name not in tree_children[parent]:
+                tree_children[parent].append(name)
+
+        preorder: list[str] = []
+        entry: dict[str, int] = {}
+        exit_: dict[str, int] = {}
+        depth: dict[str, int] = {}
+        roots = [name for name, parent in parents.items() if parent is None]
+        for root in roots:
+            _index_subtree(
+                root,
+                tree_children=tree_children,
+                preorder=preorder,
+                entry=entry,
+                exit_=exit_,
+                depth=depth,
+            )
+
+        return StackIndex(
+            parents=parents,
+            children=children,
+            preorder=tuple(preorder),
+            entry=entry,
+            exit=exit_,
+            depth=depth,
+        )
+
+    def __contains__(self, branch: object) -> bool:
+        return branch in self.entry
+
+    def is_ancestor(self, ancestor: str, branch: str) -> bool:
+        """Return True if ancestor is a strict ancestor of branch."""
+        if ancestor not in self.entry or branch not in self.entry:
+            return False
+        return self.entry[ancestor] < self.entry[branch] < self.exit[ancestor]
+
+    def trunk_distance(self, branch: str) -> int | None:
+        """Return the number of parent hops from branch to trunk, or None if unknown."""
+        return self.depth.get(branch)
+
+    def ancestors(self, branch: str) -> list[str]:
+        """Return strict ancestors ordered from trunk down to the direct parent."""
+        if branch not in self.entry:
+            return []
+        result: list[str] = []
+        current = self.parents[branch]
+        while current is not None:
+            result.append(current)
+            current = self.parents[current]
+        result.reverse()
+        return result
+
+    def descendants(self, branch: str) -> list[str]:
+        """Return all strict descendants in depth-first preorder."""
+        if branch not in self.entry:
+            return []
+        return list(self.preorder[self.entry[branch] + 1 : self.exit[branch]])
+
+    def subtree(self, branch: str) -> list[str]:
+        """Return branch followed by all of its descendants in depth-first preorder."""
+        if branch not in self.entry:
+            return []
+        return list(self.preorder[self.entry[branch] : self.exit[branch]])
+
+    def linear_stack(self, branch: str) -> list[str] | None:
+        """Return the linear stack through branch, ordered trunk to leaf.
+
+        Ancestors run from trunk down to branch; descendants follow the first
+        child at each level until a leaf or an untracked child is reached.
+        Returns None if branch is not in the index.
+        """
+        if branch not in self.entry:
+            return None
+        stack = self.ancestors(branch)
+        stack.append(branch)
+        current = branch
+        while self.children[current] and self.children[current][0] in self.entry:
+            current = self.children[current][0]
+            stack.append(current)
+        return stack
+
+    def to_json(self, key: StackIndexKey) -> str:
+        """Serialize the index together with the cache key it was built from."""
+        return json.dumps(
+            {
+                "version": STACK_INDEX_VERSION,
+                "mtime_ns": key.mtime_ns,
+                "size": key.size,
+                "parents": self.parents,
+                "children": {name: list(kids) for name, kids in self.children.items()},
+                "preorder": list(self.preorder),
+                "exit": [self.exit[name] for name in self.preorder],
+                "depth": [self.depth[name] for name in self.preorder],
+            },
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def from_json(content: str, key: StackIndexKey) -> StackIndex | None:
+        """Deserialize an index, returning None if it is stale or malformed."""
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        if data.get("version") != STACK_INDEX_VERSION:
+            return None
+        if data.get("mtime_ns") != key.mtime_ns or data.get("size") != key.size:
+            return None
+        preorder = data.get("preorder")
+        exits = data.get("exit")
+        depths = data.get("depth")
+        parents = data.get("parents")
+        children = data.get("children")
+        if not (
+            isinstance(preorder, list)
+            and isinstance(exits, list)
+            and isinstance(depths, list)
+            and isinstance(parents, dict)
+            and isinstance(children, dict)
+            and len(preorder) == len(exits) == len(depths)
+            and all(isinstance(name, str) for name in preorder)
+            and len(set(preorder)) == len(preorder)
+            and all(isinstance(kids, list) for kids in children.values())
+        ):
+            return None
+        return StackIndex(
+            parents=parents,
+            children={name: tuple(kids) for name, kids in children.items()},
+            preorder=tuple(preorder),
+            entry={name: position for position, name in enumerate(preorder)},
+            exit=dict(zip(preorder, exits, strict=True)),
+            depth=dict(zip(preorder, depths, strict=True)),
+        )
+
+
+def load_stack_index(git_dir: Path, key: StackIndexKey) -> StackIndex | None:
+    """Load a persisted index from the git common directory if it matches key.
+
+    A missing, truncated, or otherwise corrupt index file yields None so the
+    caller rebuilds it and overwrites the bad file.
+    """
+    index_file = git_dir / STACK_INDEX_FILENAME
+    try:
+        content = index_file.read_text(encoding="utf-8")
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+    return StackIndex.from_json(content, key)
+
+
+def save_stack_index(git_dir: Path, index: StackIndex, key: StackIndexKey) -> None:
+    """Persist the index atomically via write-then-rename.
+
+    Skips persisting if the git common directory is not writable; the index is
+    a cache and will simply be rebuilt on the next invocation.
+    """
+    if not os.access(git_dir, os.W_OK):
+        return
+    index_file = git_dir / STACK_INDEX_FILENAME
+    tmp_file = git_dir / f"{STACK_INDEX_FILENAME}.{os.getpid()}.{threading.get_ident()}.tmp"
+    tmp_file.write_text(index.to_json(key), encoding="utf-8")
+    tmp_file.replace(index_file)
+
+
+def _index_subtree(
+    root: str,
+    *,
+    tree_children: dict[str, list[str]],
+    preorder: list[str],
+    entry: dict[str, int],
+    exit_: dict[str, int],
+    depth: dict[str, int],
+) -> None:
+    """Iteratively assign preorder entry/exit positions and depths under root."""
+    entry[root] = len(preorder)
+    depth[root] = 0
+    preorder.append(root)
+    # Each frame is (branch, next child position to visit)
+    frames: list[tuple[str, int]] = [(root, 0)]
+    while frames:
+        name, child_pos = frames[-1]
+        kids = tree_children[name]
+        if child_pos < len(kids):
+            frames[-1] = (name, child_pos + 1)
+            child = kids[child_pos]
+            if child in entry:
+                continue
+            entry[child] = len(preorder)
+            depth[child] = depth[name] + 1
+            preorder.append(child)
+            frames.append((child, 0))
+        else:
+            exit_[name] = len(preorder)
+            frames.pop()
@@ -8,6 +8,7 @@ from typing import Any
 
 import httpx
 
+from erk_shared.cancellation import raise_if_cancelled
 from erk_shared.gateway.http.abc import HttpClient, HttpError
 
 
@@ -56,7 +57,9 @@ class RealHttpClient(HttpClient):
 
         Raises:
             HttpError: If the response status code is >= 400
+            OperationCancelledError: If the calling operation has been cancelled
         """
+        raise_if_cancelled()
         url = f"{self._base_url}/{endpoint.lstrip('/')}"
         response = httpx.request(
             method, url, json=json_data, headers=self._build_headers(), timeout=30.0
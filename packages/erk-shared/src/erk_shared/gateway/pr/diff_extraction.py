@@ -6,13 +6,17 @@ to get the diff for AI-powered commit message generation.
 """
 
 import re
-from collections.abc import Generator
-from pathlib import Path
+import tempfile
+from collections.abc import Generator, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import IO
 
 from erk_shared.context.context import ErkContext
+from erk_shared.gateway.git.abc import Git
 from erk_shared.gateway.gt.events import CompletionEvent, ProgressEvent
-from erk_shared.gateway.gt.prompts import truncate_diff
-from erk_shared.scratch.scratch import write_scratch_file
+from erk_shared.gateway.gt.prompts import MAX_DIFF_CHARS
+from erk_shared.scratch.scratch import new_scratch_file_path
 
 # Lock files that are auto-generated and add no value to PR descriptions.
 # These are filtered out before sending diffs to AI for analysis.
@@ -30,6 +34,25 @@ EXCLUDED_LOCK_FILES = frozenset(
     }
 )
 
+# Per-file cap so one huge file can't crowd every other file out of the budget
+MAX_DIFF_FILE_CHARS = 100_000
+
+# Path markers of generated or vendored content. Such files are written after
+# hand-written sources and are the first to be summarized when over budget.
+_GENERATED_DIR_NAMES = frozenset(
+    {"dist", "build", "vendor", "node_modules", "generated", "__generated__"}
+)
+_GENERATED_SUFFIXES = (
+    ".min.js",
+    ".min.css",
+    ".map",
+    ".snap",
+    ".svg",
+    "_pb2.py",
+    "_pb2.pyi",
+    ".pb.go",
+)
+
 # Pattern to extract file path from diff header: "diff --git a/path/to/file b/path/to/file"
 _DIFF_FILE_PATH_PATTERN = re.compile(r"^diff --git a/(.+?) b/")
 
@@ -80,6 +103,221 @@ def filter_diff_excluded_files(diff: str) -> str:
     return "".join(filtered_sections)
 
 
+def is_generated_diff_path(path: str) -> bool:
+    """Check whether a diff path looks generated or vendored."""
+    posix_path = PurePosixPath(path)
+    if any(part in _GENERATED_DIR_NAMES for part in posix_path.parts[:-1]):
+        return True
+    return posix_path.name.endswith(_GENERATED_SUFFIXES)
+
+
+@dataclass(frozen=True)
+class DiffFileStat:
+    """Added/deleted line counts for one file in a diff."""
+
+    path: str
+    added: int
+    deleted: int
+
+
+@dataclass(frozen=True)
+class BudgetedDiffResult:
+    """Outcome of writing a diff under a size budget.
+
+    Attributes:
+        total_lines: Lines streamed from git (after exclusions)
+        truncated_files: Files whose diff was cut at the per-file limit
+        omitted_files: Files left out entirely, summarized by line counts
+    """
+
+    total_lines: int
+    truncated_files: tuple[str, ...]
+    omitted_files: tuple[DiffFileStat, ...]
+
+    @property
+    def was_truncated(self) -> bool:
+        return bool(self.truncated_files) or bool(self.omitted_files)
+
+
+@dataclass(frozen=True)
+class _DiffSection:
+    path: str | None
+    text: str
+    stat: DiffFileStat | None
+    truncated: bool
+
+
+class _SectionBuilder:
+    """Accumulates one file's diff lines, keeping at most max_chars of text."""
+
+    def __init__(self, *, path: str | None, max_chars: int) -> None:
+        self._path = path
+        self._max_chars = max_chars
+        self._kept: list[str] = []
+        self._kept_chars = 0
+        self._dropped_lines = 0
+        self._in_hunk = False
+        self._added = 0
+        self._deleted = 0
+
+    def add(self, line: str) -> None:
+        if line.startswith("@@"):
+            self._in_hunk = True
+        elif self._in_hunk and line.startswith("+"):
+            self._added += 1
+        elif self._in_hunk and line.startswith("-"):
+            self._deleted += 1
+
+        if self._dropped_lines == 0 and self._kept_chars + len(line) <= self._max_chars:
+            self._kept.append(line)
+            self._kept_chars += len(line)
+        else:
+            self._dropped_lines += 1
+
+    def build(self) -> _DiffSection:
+        text = "".join(self._kept)
+        if self._dropped_lines:
+            if text and not text.endswith("\n"):
+                text += "\n"
+            text += f"[... {self._dropped_lines:,} more lines of {self._path} truncated ...]\n"
+        stat = (
+            DiffFileStat(path=self._path, added=self._added, deleted=self._deleted)
+            if self._path is not None
+            else None
+        )
+        return _DiffSection(
+            path=self._path, text=text, stat=stat, truncated=self._dropped_lines > 0
+        )
+
+
+def _iter_sections(lines: Iterable[str], *, max_file_chars: int) -> Generator[_DiffSection]:
+    builder = _SectionBuilder(path=None, max_chars=max_file_chars)
+    has_content = False
+    for line in lines:
+        if line.startswith("diff --git "):
+            if has_content:
+                yield builder.build()
+            match = _DIFF_FILE_PATH_PATTERN.match(line)
+            path = match.group(1) if match else line.rstrip("\n")
+            builder = _SectionBuilder(path=path, max_chars=max_file_chars)
+        builder.add(line)
+        has_content = True
+    if has_content:
+        yield builder.build()
+
+
+class _LineCounter:
+    """Iterable wrapper that counts the lines passing through it."""
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        self._lines = lines
+        self.count = 0
+
+    def __iter__(self) -> Iterator[str]:
+        for line in self._lines:
+            self.count += 1
+            yield line
+
+
+class _BudgetedWriter:
+    """Writes sections while they fit the total budget; records the rest."""
+
+    def __init__(self, *, max_total_chars: int) -> None:
+        self._max_total_chars = max_total_chars
+        self._written_chars = 0
+        self.truncated_files: list[str] = []
+        self.omitted_files: list[DiffFileStat] = []
+
+    def emit(self, section: _DiffSection, *, text: str, out: IO[str]) -> None:
+        over_budget = self._written_chars + len(text) > self._max_total_chars
+        if over_budget and section.stat is not None:
+            self.omitted_files.append(section.stat)
+            return
+        out.write(text)
+        self._written_chars += len(text)
+        if section.truncated and section.path is not None:
+            self.truncated_files.append(section.path)
+
+
+def write_budgeted_diff(
+    lines: Iterable[str],
+    *,
+    output_path: Path,
+    max_total_chars: int,
+    max_file_chars: int,
+) -> BudgetedDiffResult:
+    """Write a streamed diff to output_path within a size budget.
+
+    Sections are consumed one file at a time. Hand-written files are
+    written in diff order as they arrive; generated files are spooled to a
+    temporary file and written after them. Each file is cut at
+    max_file_chars, and files that no longer fit in max_total_chars are
+    listed in a trailing summary with their added/deleted line counts.
+
+    Args:
+        lines: Diff lines, e.g. from GitAnalysisOps.stream_diff_to_branch
+        output_path: File to write the budgeted diff to
+        max_total_chars: Budget for the whole written diff
+        max_file_chars: Budget for any single file's diff
+
+    Returns:
+        BudgetedDiffResult describing what was truncated or omitted
+    """
+    writer = _BudgetedWriter(max_total_chars=max_total_chars)
+    deferred: list[tuple[_DiffSection, int]] = []
+    line_counter = _LineCounter(lines)
+
+    with (
+        output_path.open("w", encoding="utf-8") as out,
+        tempfile.TemporaryFile() as spool,
+    ):
+        for section in _iter_sections(line_counter, max_file_chars=max_file_chars):
+            if section.path is not None and is_generated_diff_path(section.path):
+                data = section.text.encode("utf-8")
+                spool.write(data)
+                deferred.append((section, len(data)))
+                continue
+            writer.emit(section, text=section.text, out=out)
+
+        spool.seek(0)
+        for section, size in deferred:
+            writer.emit(section, text=spool.read(size).decode("utf-8"), out=out)
+
+        if writer.omitted_files:
+            out.write(
+                f"\n[... {len(writer.omitted_files):,} files omitted "
+                "to fit the diff size budget ...]\n"
+            )
+            for stat in writer.omitted_files:
+                out.write(f" {stat.path} | +{stat.added} -{stat.deleted}\n")
+
+    return BudgetedDiffResult(
+        total_lines=line_counter.count,
+        truncated_files=tuple(writer.truncated_files),
+        omitted_files=tuple(writer.omitted_files),
+    )
+
+
+def write_branch_diff(
+    git: Git,
+    *,
+    cwd: Path,
+    base_branch: str,
+    output_path: Path,
+) -> BudgetedDiffResult:
+    """Stream the branch diff from git into output_path under the default budget.
+
+    Lock files are excluded by git itself, so their content never reaches
+    Python.
+    """
+    return write_budgeted_diff(
+        git.analysis.stream_diff_to_branch(cwd, base_branch, exclude_basenames=EXCLUDED_LOCK_FILES),
+        output_path=output_path,
+        max_total_chars=MAX_DIFF_CHARS,
+        max_file_chars=MAX_DIFF_FILE_CHARS,
+    )
+
+
 def execute_diff_extraction(
     ctx: ErkContext,
     cwd: Path,
@@ -90,8 +328,9 @@ def execute_diff_extraction(
 ) -> Generator[ProgressEvent | CompletionEvent[Path | None]]:
     """Extract PR diff using local git and write to scratch file.
 
-    This operation computes the diff between HEAD and the PR's base branch,
-    then writes it to a session-scoped scratch file for AI analysis.
+    This operation streams the diff between HEAD and the PR's base branch
+    into a session-scoped scratch file for AI analysis, within the diff
+    size budget (see write_budgeted_diff).
 
     Uses local git diff instead of GitHub API to avoid size limits (GitHub
     returns HTTP 406 for diffs exceeding ~20k lines).
@@ -111,27 +350,20 @@ def execute_diff_extraction(
 
     yield ProgressEvent(f"Getting diff for PR #{pr_number}...")
 
-    # Use local git diff - no size limits unlike GitHub API
-    pr_diff = ctx.git.analysis.get_diff_to_branch(cwd, base_branch)
-    diff_lines = len(pr_diff.splitlines())
-    yield ProgressEvent(f"Diff retrieved ({diff_lines} lines)", style="success")
-
-    # Filter out lock files before truncation
-    pr_diff = filter_diff_excluded_files(pr_diff)
-
-    # Truncate diff if needed
-    diff_content, was_truncated = truncate_diff(pr_diff)
-    if was_truncated:
-        yield ProgressEvent("Diff truncated for size", style="warning")
-
-    # Write diff to scratch file
-    diff_file = write_scratch_file(
-        diff_content,
+    # Use local git diff - no size limits unlike GitHub API. Lock files are
+    # excluded by git, and output streams straight into the scratch file.
+    diff_file = new_scratch_file_path(
         session_id=session_id,
         suffix=".diff",
         prefix="pr-diff-",
         repo_root=Path(repo_root),
     )
+    result = write_branch_diff(ctx.git, cwd=cwd, base_branch=base_branch, output_path=diff_file)
+    yield ProgressEvent(f"Diff retrieved ({result.total_lines} lines)", style="success")
+
+    if result.was_truncated:
+        yield ProgressEvent("Diff truncated for size", style="warning")
+
     yield ProgressEvent(f"Diff written to {diff_file}", style="success")
 
     yield CompletionEvent(diff_file)
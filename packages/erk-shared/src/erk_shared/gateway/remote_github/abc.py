@@ -6,9 +6,15 @@ git repository. All methods take explicit owner/repo parameters.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from erk_shared.gateway.github.issues.types import IssueInfo, IssueNotFound
-from erk_shared.gateway.remote_github.types import RemotePRInfo, RemotePRNotFound
+from erk_shared.gateway.github.run_correlation import WorkflowRunResult
+from erk_shared.gateway.remote_github.types import (
+    RemoteIssueComment,
+    RemotePRInfo,
+    RemotePRNotFound,
+)
 
 
 class RemoteGitHub(ABC):
@@ -181,6 +187,59 @@ class RemoteGitHub(ABC):
         """
         ...
 
+    @abstractmethod
+    def start_workflow(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        workflow: str,
+        ref: str,
+        inputs: dict[str, str],
+    ) -> str:
+        """Dispatch a workflow without waiting for its run.
+
+        Use with resolve_workflow_runs() to dispatch several workflows and
+        then find all of their runs in one polling loop.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            workflow: Workflow filename (e.g., "one-shot.yml")
+            ref: Git ref to dispatch from
+            inputs: Workflow input parameters
+
+        Returns:
+            The distinct_id passed to the workflow for run correlation
+        """
+        ...
+
+    @abstractmethod
+    def resolve_workflow_runs(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        workflow: str,
+        distinct_ids: list[str],
+        dispatched_at: datetime,
+    ) -> dict[str, WorkflowRunResult]:
+        """Find the runs created by start_workflow() calls.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            workflow: Workflow filename shared by all dispatches
+            distinct_ids: IDs returned by start_workflow()
+            dispatched_at: Time just before the first dispatch was sent
+
+        Returns:
+            Mapping of distinct_id -> WorkflowRunFound, WorkflowRunSkipped (the
+            run was skipped or cancelled) or WorkflowRunNotFound (no run
+            appeared before polling gave up). Every ID resolves independently.
+        """
+        ...
+
     @abstractmethod
     def add_issue_comment(
         self,
@@ -268,6 +327,29 @@ class RemoteGitHub(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_issue_comments_since(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        number: int,
+        since: str | None,
+    ) -> list[RemoteIssueComment]:
+        """Fetch comments updated at or after a timestamp, oldest first.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            number: Issue number
+            since: ISO 8601 timestamp; only comments whose updated_at is at or
+                after it are returned. None fetches all comments.
+
+        Returns:
+            List of RemoteIssueComment with id, timestamps, and body
+        """
+        ...
+
     @abstractmethod
     def list_issues(
         self,
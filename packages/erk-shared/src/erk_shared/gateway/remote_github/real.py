@@ -5,16 +5,29 @@ with no local git repository or gh CLI required.
 """
 
 import base64
-import secrets
-import string
 from datetime import datetime
+from typing import Any
 
 from erk_shared.gateway.github.issues.types import IssueInfo, IssueNotFound
+from erk_shared.gateway.github.run_correlation import (
+    RUN_CORRELATION_MAX_ATTEMPTS,
+    WorkflowRunNotFound,
+    WorkflowRunResult,
+    correlate_workflow_runs,
+    generate_distinct_id,
+    require_workflow_run,
+    workflow_runs_endpoint,
+)
 from erk_shared.gateway.http.abc import HttpClient, HttpError
 from erk_shared.gateway.remote_github.abc import RemoteGitHub
-from erk_shared.gateway.remote_github.types import RemotePRInfo, RemotePRNotFound
+from erk_shared.gateway.remote_github.types import (
+    RemoteIssueComment,
+    RemotePRInfo,
+    RemotePRNotFound,
+)
 from erk_shared.gateway.time.abc import Time
-from erk_shared.output.output import user_output
+
+_COMMENTS_PAGE_SIZE = 100
 
 
 class RealRemoteGitHub(RemoteGitHub):
@@ -162,46 +175,67 @@ class RealRemoteGitHub(RemoteGitHub):
         Replicates the dispatch+poll pattern from RealLocalGitHub.trigger_workflow
         but uses HttpClient instead of subprocess.
         """
-        distinct_id = _generate_distinct_id()
+        dispatched_at = self._time.now()
+        distinct_id = self.start_workflow(
+            owner=owner, repo=repo, workflow=workflow, ref=ref, inputs=inputs
+        )
+        results = self.resolve_workflow_runs(
+            owner=owner,
+            repo=repo,
+            workflow=workflow,
+            distinct_ids=[distinct_id],
+            dispatched_at=dispatched_at,
+        )
+        return require_workflow_run(results[distinct_id])
 
-        # Dispatch the workflow
+    def start_workflow(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        workflow: str,
+        ref: str,
+        inputs: dict[str, str],
+    ) -> str:
+        """Dispatch a workflow with a fresh distinct_id and return the ID."""
+        distinct_id = generate_distinct_id()
         payload = {"ref": ref, "inputs": {"distinct_id": distinct_id, **inputs}}
         self._http.post(
             f"repos/{owner}/{repo}/actions/workflows/{workflow}/dispatches",
             data=payload,
         )
+        return distinct_id
 
-        # Poll for the run by matching distinct_id in display_title
-        max_attempts = 11
-        for attempt in range(max_attempts):
-            user_output(f"  Waiting for workflow run... (attempt {attempt + 1}/{max_attempts})")
-
-            runs_response = self._http.get(
-                f"repos/{owner}/{repo}/actions/workflows/{workflow}/runs?per_page=10"
-            )
-            runs_data = runs_response.get("workflow_runs", [])
-
-            for run in runs_data:
-                display_title = run.get("display_title", "")
-                if f":{distinct_id}" not in display_title:
-                    continue
-
-                conclusion = run.get("conclusion")
-                if conclusion in ("skipped", "cancelled"):
-                    raise RuntimeError(
-                        f"Workflow '{workflow}' run was {conclusion}.\n"
-                        f"Run ID: {run['id']}, title: '{display_title}'"
-                    )
-
-                return str(run["id"])
-
-            # Exponential backoff: 1, 2, 4, 8, 8, 8, ...
-            delay = min(2**attempt, 8)
-            self._time.sleep(delay)
-
-        raise RuntimeError(
-            f"Timed out waiting for workflow '{workflow}' run after {max_attempts} attempts"
+    def resolve_workflow_runs(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        workflow: str,
+        distinct_ids: list[str],
+        dispatched_at: datetime,
+    ) -> dict[str, WorkflowRunResult]:
+        """Find the runs for several dispatches with one runs listing per poll."""
+
+        def fetch_runs_page(page: int) -> list[dict[str, Any]]:
+            endpoint = workflow_runs_endpoint(workflow, created_since=dispatched_at, page=page)
+            return self._http.get(f"repos/{owner}/{repo}/{endpoint}").get("workflow_runs", [])
+
+        correlation = correlate_workflow_runs(
+            workflow=workflow,
+            distinct_ids=distinct_ids,
+            fetch_runs_page=fetch_runs_page,
+            time=self._time,
         )
+        results: dict[str, WorkflowRunResult] = dict(correlation.matched)
+        for distinct_id in correlation.missing(distinct_ids):
+            results[distinct_id] = WorkflowRunNotFound(
+                message=(
+                    f"Timed out waiting for workflow '{workflow}' run after "
+                    f"{RUN_CORRELATION_MAX_ATTEMPTS} attempts"
+                )
+            )
+        return results
 
     def add_issue_comment(
         self,
@@ -267,6 +301,41 @@ class RealRemoteGitHub(RemoteGitHub):
         )
         return [c.get("body", "") for c in comments]
 
+    def get_issue_comments_since(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        number: int,
+        since: str | None,
+    ) -> list[RemoteIssueComment]:
+        """Fetch comments updated since a timestamp via the REST `since` filter.
+
+        Requests pages of _COMMENTS_PAGE_SIZE until a short page comes back,
+        so callers that advance a cursor from the result never skip comments.
+        """
+        base_query = f"per_page={_COMMENTS_PAGE_SIZE}"
+        if since is not None:
+            base_query += f"&since={since}"
+        endpoint = f"repos/{owner}/{repo}/issues/{number}/comments"
+
+        comments: list[RemoteIssueComment] = []
+        page = 1
+        while True:
+            page_items = self._http.get_list(f"{endpoint}?{base_query}&page={page}")
+            comments.extend(
+                RemoteIssueComment(
+                    id=c["id"],
+                    created_at=c.get("created_at", ""),
+                    updated_at=c.get("updated_at", c.get("created_at", "")),
+                    body=c.get("body") or "",
+                )
+                for c in page_items
+            )
+            if len(page_items) < _COMMENTS_PAGE_SIZE:
+                return comments
+            page += 1
+
     def list_issues(
         self,
         *,
@@ -467,13 +536,3 @@ def _parse_pr_response(data: dict, *, owner: str, repo_name: str) -> RemotePRInf
         repo=repo_name,
         labels=labels,
     )
-
-
-def _generate_distinct_id() -> str:
-    """Generate a random base36 ID for workflow dispatch correlation.
-
-    Returns:
-        6-character base36 string (e.g., 'a1b2c3')
-    """
-    base36_chars = string.digits + string.ascii_lowercase
-    return "".join(secrets.choice(base36_chars) for _ in range(6))
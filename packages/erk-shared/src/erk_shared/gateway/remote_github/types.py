@@ -27,3 +27,16 @@ class RemotePRNotFound:
     """Sentinel indicating a PR was not found."""
 
     pr_number: int
+
+
+@dataclass(frozen=True)
+class RemoteIssueComment:
+    """An issue comment with the fields needed for incremental indexing.
+
+    Timestamps are ISO 8601 strings as returned by the REST API.
+    """
+
+    id: int
+    created_at: str
+    updated_at: str
+    body: str
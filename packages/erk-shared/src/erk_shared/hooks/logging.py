@@ -1,18 +1,31 @@
-"""Hook execution logging I/O functions."""
+"""Hook execution logging I/O functions.
+
+Hook logs are stored as a segmented append-only log (see
+erk_shared.segmented_log) under .erk/scratch/hook-logs/, one JSON line per
+hook invocation.
+"""
 
-import json
 import subprocess
 from dataclasses import asdict
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 from erk_shared.hooks.types import HookExecutionLog, HookExitStatus
+from erk_shared.segmented_log import SegmentedLog, SegmentPolicy
 
 # Constants for truncation limits
 MAX_STDOUT_BYTES = 10 * 1024  # 10KB
 MAX_STDERR_BYTES = 10 * 1024  # 10KB
 MAX_STDIN_BYTES = 2 * 1024  # 2KB
 
+# Hook health only looks at the last day; a week of history is kept for debugging
+HOOK_LOG_POLICY = SegmentPolicy(
+    compact_after=timedelta(days=1),
+    retention=timedelta(days=7),
+    max_total_bytes=None,
+)
+
 
 def _get_repo_root() -> Path | None:
     """Get the repository root via git rev-parse.
@@ -32,68 +45,49 @@ def _get_repo_root() -> Path | None:
         return None
 
 
-def get_hook_log_dir(session_id: str, hook_id: str, repo_root: Path | None = None) -> Path:
-    """Get the directory for hook logs.
+def get_hook_log_dir(repo_root: Path | None = None) -> Path:
+    """Get the directory holding hook log segments.
 
     Args:
-        session_id: Claude Code session ID
-        hook_id: Hook identifier (e.g., "session-id-injector-hook")
         repo_root: Repository root path (uses git to detect if not provided)
 
     Returns:
-        Path to .erk/scratch/sessions/{session_id}/hooks/{hook_id}/
+        Path to .erk/scratch/hook-logs/
     """
     if repo_root is None:
         repo_root = _get_repo_root()
     if repo_root is None:
         # Fallback to cwd if not in a git repo (shouldn't happen in practice)
         repo_root = Path.cwd()
-    return repo_root / ".erk" / "scratch" / "sessions" / session_id / "hooks" / hook_id
+    return repo_root / ".erk" / "scratch" / "hook-logs"
+
+
+def _hook_log_store(log_dir: Path) -> SegmentedLog:
+    return SegmentedLog(log_dir, policy=HOOK_LOG_POLICY)
 
 
 def write_hook_log(log: HookExecutionLog, repo_root: Path | None = None) -> Path | None:
-    """Write a hook execution log to the appropriate directory.
+    """Append a hook execution log to the hook log segment for its start time.
 
     Args:
         log: HookExecutionLog to write
         repo_root: Repository root path (uses git to detect if not provided)
 
     Returns:
-        Path to written log file, or None if session_id is missing
+        Path to the segment file written, or None if session_id is missing
     """
     if log.session_id is None:
         return None
 
-    log_dir = get_hook_log_dir(log.session_id, log.hook_id, repo_root)
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    # Timestamp-based filename for ordering
-    timestamp = log.started_at.replace(":", "-").replace(".", "-")
-    log_file = log_dir / f"{timestamp}.json"
-
     # Convert to dict, handling enum serialization
     log_dict = asdict(log)
     log_dict["exit_status"] = log.exit_status.value
 
-    log_file.write_text(json.dumps(log_dict, indent=2), encoding="utf-8")
-    return log_file
-
-
-def read_hook_log(log_path: Path) -> HookExecutionLog | None:
-    """Read a hook log from a JSON file.
-
-    Args:
-        log_path: Path to the JSON log file
-
-    Returns:
-        HookExecutionLog, or None if file is invalid
-    """
-    if not log_path.exists():
-        return None
+    store = _hook_log_store(get_hook_log_dir(repo_root))
+    return store.append(log_dict, timestamp=datetime.fromisoformat(log.started_at))
 
-    content = log_path.read_text(encoding="utf-8")
-    data = json.loads(content)
 
+def _hook_log_from_dict(data: dict[str, Any]) -> HookExecutionLog:
     # Convert exit_status string back to enum
     exit_status_str = data.get("exit_status", "error")
     exit_status = HookExitStatus(exit_status_str)
@@ -117,7 +111,8 @@ def read_hook_log(log_path: Path) -> HookExecutionLog | None:
 def read_recent_hook_logs(repo_root: Path, max_age_hours: int = 24) -> list[HookExecutionLog]:
     """Read all hook logs from the last N hours.
 
-    Scans .erk/scratch/sessions/*/hooks/*/*.json for log files.
+    Only the segments under .erk/scratch/hook-logs/ that overlap the window
+    are opened.
 
     Args:
         repo_root: Repository root path
@@ -126,36 +121,14 @@ def read_recent_hook_logs(repo_root: Path, max_age_hours: int = 24) -> list[Hook
     Returns:
         List of HookExecutionLog sorted by started_at (newest first)
     """
-    sessions_dir = repo_root / ".erk" / "scratch" / "sessions"
-    if not sessions_dir.exists():
-        return []
+    since = datetime.now(UTC) - timedelta(hours=max_age_hours)
+    store = _hook_log_store(get_hook_log_dir(repo_root))
 
-    cutoff_time = datetime.now(UTC).timestamp() - (max_age_hours * 3600)
     logs: list[HookExecutionLog] = []
-
-    # Walk session directories
-    for session_dir in sessions_dir.iterdir():
-        if not session_dir.is_dir():
-            continue
-
-        hooks_dir = session_dir / "hooks"
-        if not hooks_dir.exists():
-            continue
-
-        # Walk hook directories within session
-        for hook_dir in hooks_dir.iterdir():
-            if not hook_dir.is_dir():
-                continue
-
-            # Read all JSON log files
-            for log_file in hook_dir.glob("*.json"):
-                # Quick mtime check before parsing
-                if log_file.stat().st_mtime < cutoff_time:
-                    continue
-
-                log = read_hook_log(log_file)
-                if log is not None:
-                    logs.append(log)
+    for data in store.read(since=since, until=None):
+        log = _hook_log_from_dict(data)
+        if datetime.fromisoformat(log.started_at) >= since:
+            logs.append(log)
 
     # Sort by started_at descending (newest first)
     logs.sort(key=lambda x: x.started_at, reverse=True)
@@ -187,20 +160,21 @@ def truncate_string(s: str, max_bytes: int) -> str:
 def clear_hook_logs(repo_root: Path) -> int:
     """Clear all hook execution logs.
 
-    Removes all JSON log files from .erk/scratch/sessions/*/hooks/*/.
-    Also removes empty hook directories after clearing.
+    Removes every segment under .erk/scratch/hook-logs/, plus per-invocation
+    JSON files left in .erk/scratch/sessions/*/hooks/*/ by older erk versions
+    (removing hook directories that end up empty).
 
     Args:
         repo_root: Repository root path
 
     Returns:
-        Number of log files deleted
+        Number of log entries deleted
     """
+    deleted_count = _hook_log_store(get_hook_log_dir(repo_root)).clear()
+
     sessions_dir = repo_root / ".erk" / "scratch" / "sessions"
     if not sessions_dir.exists():
-        return 0
-
-    deleted_count = 0
+        return deleted_count
 
     # Walk session directories
     for session_dir in sessions_dir.iterdir():
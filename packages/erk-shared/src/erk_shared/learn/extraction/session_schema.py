@@ -24,7 +24,7 @@ Session Entry Structure:
 from __future__ import annotations
 
 import json
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -613,10 +613,27 @@ def compute_session_provenance(session_file: Path) -> SessionProvenance | None:
 
     content = session_file.read_text(encoding="utf-8")
     raw_size_kb = session_file.stat().st_size // 1024
+    return provenance_from_entries(iter_jsonl_entries(content), raw_size_kb=raw_size_kb)
 
+
+def provenance_from_entries(
+    entries: Iterable[dict[str, Any]], *, raw_size_kb: int
+) -> SessionProvenance:
+    """Compute provenance stats from already-parsed session entries.
+
+    Lets callers that parse the JSONL for other purposes compute provenance
+    without reading the file a second time.
+
+    Args:
+        entries: Parsed JSONL entries, e.g. from iter_jsonl_entries().
+        raw_size_kb: Size of the source file in KB.
+
+    Returns:
+        SessionProvenance with stats.
+    """
     timestamps: list[float] = []
     user_turns = 0
-    for entry in iter_jsonl_entries(content):
+    for entry in entries:
         ts = parse_session_timestamp(entry.get("timestamp"))
         if ts is not None:
             timestamps.append(ts)
@@ -1,10 +1,62 @@
 """Output utilities for CLI commands with clear intent."""
 
 import sys
-from typing import Any
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TextIO
 
 import click
 
+from erk_shared.cancellation import bind_cancel_event, current_cancel_event
+
+# Destination for user_output()/machine_output() in the current context, or
+# None for stderr/stdout. Context variables are per thread, so one thread can
+# capture its output without touching sys.stdout/sys.stderr, which every
+# thread shares.
+_redirected_output: ContextVar[TextIO | None] = ContextVar("erk_redirected_output", default=None)
+
+
+@contextmanager
+def redirect_output(writer: TextIO) -> Iterator[None]:
+    """Send user_output() and machine_output() in this context to writer.
+
+    Used to capture one in-process command's output while other threads keep
+    writing to the real streams. Prompts cannot be answered while redirected:
+    user_confirm() raises click.Abort.
+
+    Args:
+        writer: Text stream receiving both user and machine output
+    """
+    token = _redirected_output.set(writer)
+    try:
+        yield
+    finally:
+        _redirected_output.reset(token)
+
+
+def is_output_redirected() -> bool:
+    """Return True if output in this context is captured by redirect_output()."""
+    return _redirected_output.get() is not None
+
+
+def inherit_output_redirect() -> Callable[[], None]:
+    """Return a thread-pool initializer applying this context's output redirect.
+
+    New threads start with an empty context, so pass this as the initializer
+    of a ThreadPoolExecutor whose workers call user_output(). The operation's
+    cancel flag is carried over too, so workers stop at their checkpoints
+    when the operation is cancelled.
+    """
+    writer = _redirected_output.get()
+    cancel_event = current_cancel_event()
+
+    def initializer() -> None:
+        _redirected_output.set(writer)
+        bind_cancel_event(cancel_event)
+
+    return initializer
+
 
 def user_output(
     message: Any | None = None,
@@ -22,7 +74,7 @@ def user_output(
         color: Force showing or hiding colors and other styles. By default, Click
             will remove color if the output does not look like an interactive terminal.
     """
-    click.echo(message, nl=nl, err=True, color=color)
+    click.echo(message, file=_redirected_output.get(), nl=nl, err=True, color=color)
 
 
 def machine_output(
@@ -41,7 +93,7 @@ def machine_output(
         color: Force showing or hiding colors and other styles. By default, Click
             will remove color if the output does not look like an interactive terminal.
     """
-    click.echo(message, nl=nl, err=False, color=color)
+    click.echo(message, file=_redirected_output.get(), nl=nl, err=False, color=color)
 
 
 def user_confirm(prompt: str, *, default: bool | None) -> bool:
@@ -57,7 +109,12 @@ def user_confirm(prompt: str, *, default: bool | None) -> bool:
 
     Returns:
         True if the user confirmed, False otherwise.
+
+    Raises:
+        click.Abort: If output is redirected, since there is no terminal to answer.
     """
+    if is_output_redirected():
+        raise click.Abort()
     sys.stderr.flush()
     return click.confirm(prompt, default=default, err=True)
 
@@ -21,7 +21,7 @@ for the full gateway vs backend architecture.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 
 from erk_shared.gateway.github.metadata.schemas import (
@@ -35,6 +35,7 @@ from erk_shared.gateway.github.metadata.schemas import (
     LAST_SESSION_ID,
     LAST_SESSION_SOURCE,
 )
+from erk_shared.gateway.github.types import PRDetails
 from erk_shared.learn.impl_events import (
     extract_implementation_sessions,
     extract_learn_sessions,
@@ -61,6 +62,12 @@ class ManagedPrBackend(ABC):
         close_managed_pr: Close a plan
         get_metadata_field: Get a single metadata field value
 
+    Bulk read operations (get_managed_prs, get_metadata_fields_many,
+    resolve_pr_numbers_for_branches) default to looping over the per-item
+    methods; backends override them to batch the underlying requests.
+    plans_from_pr_details converts PRs the caller has already fetched
+    without another request.
+
     Write operations:
         create_managed_pr: Create a new plan
         update_metadata: Update plan metadata
@@ -166,6 +173,72 @@ class ManagedPrBackend(ABC):
         """
         ...
 
+    # Bulk reads (concrete — backends override to batch requests)
+
+    def get_managed_prs(
+        self, repo_root: Path, pr_numbers: Sequence[str]
+    ) -> dict[str, Plan | PrNotFound]:
+        """Fetch several plans by identifier.
+
+        Args:
+            repo_root: Repository root directory
+            pr_numbers: Provider-specific identifiers
+
+        Returns:
+            Mapping of identifier -> Plan, or PrNotFound for missing plans
+        """
+        return {pr_number: self.get_managed_pr(repo_root, pr_number) for pr_number in pr_numbers}
+
+    def get_metadata_fields_many(
+        self, repo_root: Path, pr_numbers: Sequence[str]
+    ) -> dict[str, dict[str, object] | PrNotFound]:
+        """Get all plan-header metadata fields for several plans.
+
+        Args:
+            repo_root: Repository root directory
+            pr_numbers: Provider-specific identifiers
+
+        Returns:
+            Mapping of identifier -> metadata dict (empty if the plan has no
+            metadata block), or PrNotFound for missing plans
+        """
+        return {
+            pr_number: self.get_all_metadata_fields(repo_root, pr_number)
+            for pr_number in pr_numbers
+        }
+
+    def resolve_pr_numbers_for_branches(
+        self, repo_root: Path, branch_names: Sequence[str]
+    ) -> dict[str, str | None]:
+        """Resolve plan identifiers for several branches.
+
+        Args:
+            repo_root: Repository root directory
+            branch_names: Git branch names
+
+        Returns:
+            Mapping of branch -> plan identifier, or None for non-plan branches
+        """
+        return {
+            branch_name: self.resolve_pr_number_for_branch(repo_root, branch_name)
+            for branch_name in branch_names
+        }
+
+    @abstractmethod
+    def plans_from_pr_details(self, prs: Mapping[str, PRDetails]) -> dict[str, Plan]:
+        """Convert already-fetched PR details to plans without further requests.
+
+        Lets callers that batch-fetched PRs (e.g. via get_pr_details_by_branches)
+        derive plans and objectives instead of re-querying the same PRs.
+
+        Args:
+            prs: Mapping of any key (typically branch name) -> PRDetails
+
+        Returns:
+            Mapping of the same keys -> Plan
+        """
+        ...
+
     # Session discovery (concrete — uses get_plan + get_comments)
 
     def find_sessions_for_managed_pr(
@@ -3,8 +3,16 @@
 Provides single-parse conversions that populate header_fields on Plan,
 eliminating repeated YAML parsing of the plan-header metadata block.
 Also provides typed accessor helpers for reading fields from header_fields.
+
+Plan-header parses are cached by body text (plan_header_fields), so the
+same body seen again by a listing refresh or a batched backend read is not
+re-parsed. The cache key is the content itself, so an edited body is simply
+a cache miss. Callers always receive a deep copy, so mutating a result
+(including nested lists such as node_ids) never reaches the cache.
 """
 
+import copy
+import functools
 from datetime import datetime
 
 from erk_shared.gateway.github.issues.types import IssueInfo
@@ -14,6 +22,34 @@ from erk_shared.gateway.github.metadata.types import BlockKeys
 from erk_shared.gateway.github.types import PRDetails
 from erk_shared.pr_store.types import Plan, PlanState
 
+# Distinct bodies whose parsed plan-header is kept
+PLAN_HEADER_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=PLAN_HEADER_CACHE_SIZE)
+def _parse_plan_header(body: str) -> dict[str, object] | None:
+    """Cached parse. The returned dict is shared; only plan_header_fields may read it."""
+    block = find_metadata_block(body, BlockKeys.PLAN_HEADER)
+    if block is None:
+        return None
+    return copy.deepcopy(dict(block.data))
+
+
+def plan_header_fields(body: str) -> dict[str, object] | None:
+    """Parse the plan-header metadata block of a PR or issue body.
+
+    Args:
+        body: Full PR or issue body
+
+    Returns:
+        Deep copy of the plan-header fields, safe to mutate, or None if the
+        body has no plan-header block.
+    """
+    fields = _parse_plan_header(body)
+    if fields is None:
+        return None
+    return copy.deepcopy(fields)
+
 
 def _parse_node_ids(value: object) -> tuple[str, ...] | None:
     """Parse node_ids from header_fields value.
@@ -48,10 +84,7 @@ def github_issue_to_plan(issue: IssueInfo) -> Plan:
     """
     state = PlanState.OPEN if issue.state == "OPEN" else PlanState.CLOSED
 
-    header_fields: dict[str, object] = {}
-    block = find_metadata_block(issue.body, BlockKeys.PLAN_HEADER)
-    if block is not None:
-        header_fields = dict(block.data)
+    header_fields = plan_header_fields(issue.body) or {}
 
     objective_id: int | None = None
     raw_objective = header_fields.get(OBJECTIVE_ISSUE)
@@ -95,10 +128,7 @@ def pr_details_to_plan(pr: PRDetails, *, plan_body: str | None) -> Plan:
     state = PlanState.OPEN if pr.state == "OPEN" else PlanState.CLOSED
 
     # Parse plan-header block from PR body
-    header_fields: dict[str, object] = {}
-    block = find_metadata_block(pr.body, BlockKeys.PLAN_HEADER)
-    if block is not None:
-        header_fields = dict(block.data)
+    header_fields = plan_header_fields(pr.body) or {}
 
     # Extract objective_id from parsed header
     objective_id: int | None = None
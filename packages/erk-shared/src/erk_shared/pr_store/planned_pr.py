@@ -6,7 +6,7 @@ The "[erk-pr]" title prefix identifies managed PRs vs regular draft PRs.
 """
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from datetime import UTC
 from pathlib import Path
 
@@ -37,7 +37,7 @@ from erk_shared.gateway.github.pr_footer import build_pr_body_footer
 from erk_shared.gateway.github.types import BodyText, PRDetails, PRNotFound
 from erk_shared.gateway.time.abc import Time
 from erk_shared.pr_store.backend import ManagedPrBackend
-from erk_shared.pr_store.conversion import pr_details_to_plan
+from erk_shared.pr_store.conversion import plan_header_fields, pr_details_to_plan
 from erk_shared.pr_store.planned_pr_lifecycle import (
     build_plan_stage_body,
     extract_plan_content,
@@ -134,6 +134,24 @@ class ManagedGitHubPrBackend(ManagedPrBackend):
             return None
         return str(result.number)
 
+    def resolve_pr_numbers_for_branches(
+        self, repo_root: Path, branch_names: Sequence[str]
+    ) -> dict[str, str | None]:
+        """Resolve plan identifiers for several branches with batched PR lookups.
+
+        Args:
+            repo_root: Repository root directory
+            branch_names: Git branch names
+
+        Returns:
+            Mapping of branch -> PR number as string, or None if the branch has no PR
+        """
+        prs = self._github.get_pr_details_by_branches(repo_root, list(branch_names))
+        return {
+            branch_name: str(prs[branch_name].number) if branch_name in prs else None
+            for branch_name in branch_names
+        }
+
     def get_managed_pr_for_branch(self, repo_root: Path, branch_name: str) -> Plan | PrNotFound:
         """Look up the plan associated with a branch.
 
@@ -167,6 +185,39 @@ class ManagedGitHubPrBackend(ManagedPrBackend):
             return PrNotFound(pr_id=pr_number)
         return self._convert_to_plan(result)
 
+    def get_managed_prs(
+        self, repo_root: Path, pr_numbers: Sequence[str]
+    ) -> dict[str, Plan | PrNotFound]:
+        """Fetch several plans with batched PR lookups.
+
+        Args:
+            repo_root: Repository root directory
+            pr_numbers: PR numbers as strings
+
+        Returns:
+            Mapping of PR number -> Plan, or PrNotFound for missing PRs
+        """
+        prs = self._github.get_pr_details_by_numbers(repo_root, [int(n) for n in pr_numbers])
+        return {
+            pr_number: (
+                self._convert_to_plan(prs[int(pr_number)])
+                if int(pr_number) in prs
+                else PrNotFound(pr_id=pr_number)
+            )
+            for pr_number in pr_numbers
+        }
+
+    def plans_from_pr_details(self, prs: Mapping[str, PRDetails]) -> dict[str, Plan]:
+        """Convert already-fetched PR details to plans without further requests.
+
+        Args:
+            prs: Mapping of any key (typically branch name) -> PRDetails
+
+        Returns:
+            Mapping of the same keys -> Plan
+        """
+        return {key: self._convert_to_plan(pr) for key, pr in prs.items()}
+
     def get_comments(self, repo_root: Path, pr_number: str) -> list[str]:
         """Get all comments on a plan's draft PR.
 
@@ -214,20 +265,22 @@ class ManagedGitHubPrBackend(ManagedPrBackend):
             draft=True,
         )
 
-        plans: list[Plan] = []
-        for _branch, pr_info in prs.items():
-            # Filter to plans by title prefix (replaces erk-pr label check)
-            if pr_info.title is None or not pr_info.title.startswith(_PLAN_TITLE_PREFIX):
-                continue
-
-            pr_details = self._github.get_pr(repo_root, pr_info.number)
-            if isinstance(pr_details, PRNotFound):
-                continue
-
-            plans.append(self._convert_to_plan(pr_details))
+        # Filter to plans by title prefix (replaces erk-pr label check)
+        pending = [
+            pr_info.number
+            for pr_info in prs.values()
+            if pr_info.title is not None and pr_info.title.startswith(_PLAN_TITLE_PREFIX)
+        ]
 
-            if query.limit is not None and len(plans) >= query.limit:
-                break
+        # Fetch details in batches, only as many as the limit still needs
+        plans: list[Plan] = []
+        while pending and (query.limit is None or len(plans) < query.limit):
+            take = len(pending) if query.limit is None else query.limit - len(plans)
+            batch, pending = pending[:take], pending[take:]
+            details = self._github.get_pr_details_by_numbers(repo_root, batch)
+            plans.extend(
+                self._convert_to_plan(details[number]) for number in batch if number in details
+            )
 
         return plans
 
@@ -424,11 +477,11 @@ class ManagedGitHubPrBackend(ManagedPrBackend):
         if isinstance(result, PRNotFound):
             return PrNotFound(pr_id=pr_number)
 
-        block = find_metadata_block(result.body, BlockKeys.PLAN_HEADER)
-        if block is None:
+        header_fields = plan_header_fields(result.body)
+        if header_fields is None:
             return None
 
-        return block.data.get(field_name)
+        return header_fields.get(field_name)
 
     def get_all_metadata_fields(
         self,
@@ -450,11 +503,30 @@ class ManagedGitHubPrBackend(ManagedPrBackend):
         if isinstance(result, PRNotFound):
             return PrNotFound(pr_id=pr_number)
 
-        block = find_metadata_block(result.body, BlockKeys.PLAN_HEADER)
-        if block is None:
-            return {}
+        return plan_header_fields(result.body) or {}
+
+    def get_metadata_fields_many(
+        self, repo_root: Path, pr_numbers: Sequence[str]
+    ) -> dict[str, dict[str, object] | PrNotFound]:
+        """Get plan-header metadata fields for several PRs with batched PR lookups.
 
-        return dict(block.data)
+        Args:
+            repo_root: Repository root directory
+            pr_numbers: PR numbers as strings
+
+        Returns:
+            Mapping of PR number -> metadata dict (empty if the PR has no
+            metadata block), or PrNotFound for missing PRs
+        """
+        prs = self._github.get_pr_details_by_numbers(repo_root, [int(n) for n in pr_numbers])
+        return {
+            pr_number: (
+                plan_header_fields(prs[int(pr_number)].body) or {}
+                if int(pr_number) in prs
+                else PrNotFound(pr_id=pr_number)
+            )
+            for pr_number in pr_numbers
+        }
 
     def update_metadata(
         self,
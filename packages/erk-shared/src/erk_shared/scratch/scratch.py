@@ -56,6 +56,34 @@ def get_scratch_dir(
     return scratch_dir
 
 
+def new_scratch_file_path(
+    *,
+    session_id: str,
+    suffix: str,
+    prefix: str,
+    repo_root: Path | None,
+) -> Path:
+    """Return a unique, not-yet-written scratch file path.
+
+    For callers that stream content into the file instead of building it
+    in memory first.
+
+    Args:
+        session_id: Claude session ID for isolation.
+        suffix: File extension (e.g., ".diff").
+        prefix: Filename prefix for categorization.
+        repo_root: Repo root (auto-detected if None).
+
+    Returns:
+        Path inside the session scratch directory.
+    """
+    scratch_dir = get_scratch_dir(session_id, repo_root=repo_root)
+
+    # Generate unique filename using same pattern as tempfile
+    unique_id = uuid.uuid4().hex[:8]
+    return scratch_dir / f"{prefix}{unique_id}{suffix}"
+
+
 def write_scratch_file(
     content: str,
     *,
@@ -76,13 +104,9 @@ def write_scratch_file(
     Returns:
         Path to the created file (e.g., .erk/scratch/sessions/<session_id>/diff-abc12345.diff).
     """
-    scratch_dir = get_scratch_dir(session_id, repo_root=repo_root)
-
-    # Generate unique filename using same pattern as tempfile
-    unique_id = uuid.uuid4().hex[:8]
-    filename = f"{prefix}{unique_id}{suffix}"
-    file_path = scratch_dir / filename
-
+    file_path = new_scratch_file_path(
+        session_id=session_id, suffix=suffix, prefix=prefix, repo_root=repo_root
+    )
     file_path.write_text(content, encoding="utf-8")
     return file_path
 
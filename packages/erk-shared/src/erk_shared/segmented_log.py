@@ -0,0 +1,267 @@
+"""Append-only JSONL log store split into time-bucketed segment files.
+
+Records are appended to the hourly segment covering their timestamp. Segment
+file names encode their UTC time range, so the directory listing doubles as a
+time index: readers open only the segments that overlap the requested window
+instead of scanning the full history.
+
+Layout:
+    <root>/20250105T10.jsonl   hourly segment [10:00, 11:00)
+    <root>/20250104.jsonl      daily segment, produced by compaction
+
+Compaction runs opportunistically from the writer, at most once per
+COMPACTION_INTERVAL and only in the process that wins a non-blocking lock.
+It merges hourly segments older than the policy's compact_after into daily
+segments and drops segments beyond the retention window or size budget.
+Compaction only touches segments that writers have stopped appending to.
+"""
+
+import fcntl
+import json
+import os
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+SEGMENT_SUFFIX = ".jsonl"
+HOURLY_FORMAT = "%Y%m%dT%H"
+DAILY_FORMAT = "%Y%m%d"
+COMPACTION_INTERVAL = timedelta(hours=1)
+
+_COMPACTION_LOCK = ".compaction.lock"
+_COMPACTION_MARKER = ".last-compaction"
+
+
+@dataclass(frozen=True)
+class SegmentPolicy:
+    """Compaction and retention settings for a segmented log.
+
+    Attributes:
+        compact_after: Hourly segments that ended longer ago than this are
+            merged into daily segments
+        retention: Segments that ended longer ago than this are deleted
+            (None keeps them regardless of age)
+        max_total_bytes: Oldest segments are deleted until the log fits in
+            this budget; the newest segment is always kept (None for no limit)
+    """
+
+    compact_after: timedelta
+    retention: timedelta | None
+    max_total_bytes: int | None
+
+
+@dataclass(frozen=True)
+class LogSegment:
+    """A segment file together with the UTC time range it covers."""
+
+    path: Path
+    start: datetime
+    end: datetime
+
+    @property
+    def is_hourly(self) -> bool:
+        return self.end - self.start == timedelta(hours=1)
+
+
+def parse_segment_name(path: Path) -> LogSegment | None:
+    """Return the segment described by a file name, or None if not a segment."""
+    if path.suffix != SEGMENT_SUFFIX:
+        return None
+    stem = path.stem
+    if len(stem) == len("20250105T10") and stem[8:9] == "T":
+        if not (stem[:8].isdigit() and stem[9:].isdigit()):
+            return None
+        start = datetime.strptime(stem, HOURLY_FORMAT).replace(tzinfo=UTC)
+        return LogSegment(path=path, start=start, end=start + timedelta(hours=1))
+    if len(stem) == len("20250105") and stem.isdigit():
+        start = datetime.strptime(stem, DAILY_FORMAT).replace(tzinfo=UTC)
+        return LogSegment(path=path, start=start, end=start + timedelta(days=1))
+    return None
+
+
+def hourly_segment_name(timestamp: datetime) -> str:
+    """Return the file name of the hourly segment containing timestamp."""
+    return timestamp.astimezone(UTC).strftime(HOURLY_FORMAT) + SEGMENT_SUFFIX
+
+
+class SegmentedLog:
+    """Time-segmented append-only JSONL log rooted at a directory."""
+
+    def __init__(self, root: Path, *, policy: SegmentPolicy) -> None:
+        self._root = root
+        self._policy: SegmentPolicy = policy
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def append(self, record: Mapping[str, object], *, timestamp: datetime) -> Path:
+        """Append a record to the segment covering timestamp.
+
+        Uses an exclusive flock so concurrent writers never interleave lines.
+
+        Returns:
+            Path to the segment the record was written to
+        """
+        self._root.mkdir(parents=True, exist_ok=True)
+        segment_path = self._root / hourly_segment_name(timestamp)
+        line = json.dumps(record) + "\n"
+        with segment_path.open("a", encoding="utf-8") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.write(line)
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        self.compact_if_due(now=datetime.now(UTC))
+        return segment_path
+
+    def segments(self, *, since: datetime | None, until: datetime | None) -> list[LogSegment]:
+        """Return segments overlapping [since, until], oldest first.
+
+        Only file names are inspected; no segment is opened. Naive bounds are
+        interpreted as local time.
+        """
+        if not self._root.is_dir():
+            return []
+        if since is not None:
+            since = since.astimezone(UTC)
+        if until is not None:
+            until = until.astimezone(UTC)
+        result: list[LogSegment] = []
+        for path in self._root.iterdir():
+            segment = parse_segment_name(path)
+            if segment is None:
+                continue
+            if since is not None and segment.end <= since:
+                continue
+            if until is not None and segment.start > until:
+                continue
+            result.append(segment)
+        result.sort(key=lambda s: (s.start, s.end))
+        return result
+
+    def read(self, *, since: datetime | None, until: datetime | None) -> Iterator[dict[str, Any]]:
+        """Yield records from segments overlapping [since, until], oldest segment first.
+
+        Segment selection is by time bucket, so callers still filter records
+        on their own timestamp field for an exact window. Blank and malformed
+        lines are skipped.
+        """
+        for segment in self.segments(since=since, until=until):
+            yield from _read_records(segment.path)
+
+    def clear(self) -> int:
+        """Delete every segment, returning the number of records removed."""
+        removed = 0
+        for segment in self.segments(since=None, until=None):
+            removed += _count_records(segment.path)
+            segment.path.unlink()
+        return removed
+
+    def compact_if_due(self, *, now: datetime) -> None:
+        """Run compaction if it has not run within COMPACTION_INTERVAL."""
+        marker = self._root / _COMPACTION_MARKER
+        if marker.exists():
+            last_run = datetime.fromtimestamp(marker.stat().st_mtime, tz=UTC)
+            if now - last_run < COMPACTION_INTERVAL:
+                return
+        self.compact(now=now)
+
+    def compact(self, *, now: datetime) -> bool:
+        """Merge old hourly segments into daily ones and apply retention.
+
+        Returns:
+            True if compaction ran, False if another process holds the lock
+        """
+        if not self._root.is_dir():
+            return False
+        lock_path = self._root / _COMPACTION_LOCK
+        with lock_path.open("a", encoding="utf-8") as lock_file:
+            # Error boundary: flock has no LBYL form; a held lock means another
+            # process is already compacting and this one can skip.
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            try:
+                self._merge_hourly_segments(now=now)
+                self._apply_retention(now=now)
+                (self._root / _COMPACTION_MARKER).touch()
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        return True
+
+    def _merge_hourly_segments(self, *, now: datetime) -> None:
+        cutoff = now - self._policy.compact_after
+        by_day: dict[str, list[LogSegment]] = {}
+        for segment in self.segments(since=None, until=None):
+            if segment.is_hourly and segment.end <= cutoff:
+                day_name = segment.start.strftime(DAILY_FORMAT) + SEGMENT_SUFFIX
+                by_day.setdefault(day_name, []).append(segment)
+
+        for day_name, hourly in by_day.items():
+            daily_path = self._root / day_name
+            tmp_path = self._root / f".{day_name}.{os.getpid()}.tmp"
+            with tmp_path.open("w", encoding="utf-8") as out:
+                if daily_path.exists():
+                    out.write(_read_text_with_newline(daily_path))
+                for segment in hourly:
+                    out.write(_read_text_with_newline(segment.path))
+            # Replace before unlinking sources: an interruption between the two
+            # steps can duplicate records but never loses them.
+            tmp_path.replace(daily_path)
+            for segment in hourly:
+                segment.path.unlink()
+
+    def _apply_retention(self, *, now: datetime) -> None:
+        segments = self.segments(since=None, until=None)
+        if self._policy.retention is not None:
+            cutoff = now - self._policy.retention
+            expired = [s for s in segments if s.end <= cutoff]
+            for segment in expired:
+                segment.path.unlink()
+            segments = [s for s in segments if s.end > cutoff]
+
+        if self._policy.max_total_bytes is None:
+            return
+        sizes = [segment.path.stat().st_size for segment in segments]
+        total = sum(sizes)
+        # Keep at least the newest segment even if it alone exceeds the budget
+        for segment, size in zip(segments[:-1], sizes[:-1], strict=True):
+            if total <= self._policy.max_total_bytes:
+                break
+            segment.path.unlink()
+            total -= size
+
+
+def _read_records(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield JSON object records from a JSONL file, skipping invalid lines."""
+    if not path.exists():
+        return
+    with path.open("r", encoding="utf-8") as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if not line:
+                continue
+            # Error boundary: a torn write or manual edit must not make the
+            # whole log unreadable.
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict):
+                yield data
+
+
+def _count_records(path: Path) -> int:
+    with path.open("r", encoding="utf-8") as f:
+        return sum(1 for line in f if line.strip())
+
+
+def _read_text_with_newline(path: Path) -> str:
+    content = path.read_text(encoding="utf-8")
+    if content and not content.endswith("\n"):
+        return content + "\n"
+    return content
@@ -12,6 +12,7 @@ from collections.abc import Sequence
 from pathlib import Path
 from typing import IO, Any
 
+from erk_shared.cancellation import raise_if_cancelled
 from erk_shared.gateway.github.retry import (
     RETRY_DELAYS,
     RetriesExhausted,
@@ -108,7 +109,9 @@ def run_subprocess_with_context(
     Raises:
         RuntimeError: If command fails or times out, with enriched error context
         FileNotFoundError: If command binary is not found
+        OperationCancelledError: If the calling operation has been cancelled
     """
+    raise_if_cancelled()
     timing_desc = _build_timing_description(cmd)
     start_time = time.perf_counter()
     logger.debug("Starting: %s", timing_desc)
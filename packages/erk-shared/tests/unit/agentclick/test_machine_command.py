@@ -1,6 +1,7 @@
 """Tests for @machine_command decorator and supporting functions."""
 
 import json
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 from unittest.mock import patch
@@ -12,6 +13,7 @@ from erk_shared.agentclick.dataclass_json import coerce_json_value
 from erk_shared.agentclick.machine_command import (
     MachineCommandError,
     MachineCommandMeta,
+    MachineStreamSpec,
     emit_machine_error,
     emit_machine_result,
     machine_command,
@@ -90,6 +92,113 @@ def test_machine_command_success_flow() -> None:
     assert data["answer"] == "echo: hello"
 
 
+@dataclass(frozen=True)
+class Item:
+    name: str
+
+
+@dataclass(frozen=True)
+class ListResult:
+    names: list[str]
+    fail_after: int | None = None
+
+    def iter_json_items(self) -> Iterator[dict[str, Any]]:
+        for index, name in enumerate(self.names):
+            if index == self.fail_after:
+                raise RuntimeError("page fetch failed")
+            yield {"name": name}
+
+    def to_json_dict(self) -> dict[str, Any]:
+        return {"items": list(self.iter_json_items())}
+
+
+def _make_stream_cmd(
+    result: ListResult | MachineCommandError,
+    *,
+    stream_modes: list[bool] | None = None,
+) -> click.Command:
+    @machine_command(
+        request_type=SimpleRequest,
+        output_types=(ListResult,),
+        stream=MachineStreamSpec(items_key="items", item_type=Item),
+    )
+    @click.command("list-cmd")
+    def list_cmd(*, request: SimpleRequest, stream_mode: bool) -> ListResult | MachineCommandError:
+        if stream_modes is not None:
+            stream_modes.append(stream_mode)
+        return result
+
+    return list_cmd
+
+
+def test_stream_flag_only_added_with_stream_spec() -> None:
+    assert "stream_mode" not in [p.name for p in _make_cmd().params]
+    assert "stream_mode" in [p.name for p in _make_stream_cmd(ListResult(names=[])).params]
+
+
+def test_machine_command_stream_emits_ndjson_items() -> None:
+    cmd = _make_stream_cmd(ListResult(names=["a", "b"]))
+    with patch(
+        "erk_shared.agentclick.machine_command.read_machine_command_input",
+        return_value={"prompt": "x"},
+    ):
+        result = CliRunner().invoke(cmd, ["--stream"])
+
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        {"type": "item", "item": {"name": "a"}},
+        {"type": "item", "item": {"name": "b"}},
+        {"type": "result", "success": True, "count": 2},
+    ]
+
+
+def test_machine_command_passes_stream_mode_to_callback() -> None:
+    stream_modes: list[bool] = []
+    cmd = _make_stream_cmd(ListResult(names=[]), stream_modes=stream_modes)
+    with patch(
+        "erk_shared.agentclick.machine_command.read_machine_command_input",
+        return_value={"prompt": "x"},
+    ):
+        CliRunner().invoke(cmd, [])
+        CliRunner().invoke(cmd, ["--stream"])
+
+    assert stream_modes == [False, True]
+
+
+def test_machine_command_stream_mid_stream_failure_ends_with_error() -> None:
+    cmd = _make_stream_cmd(ListResult(names=["a", "b"], fail_after=1))
+    with patch(
+        "erk_shared.agentclick.machine_command.read_machine_command_input",
+        return_value={"prompt": "x"},
+    ):
+        result = CliRunner().invoke(cmd, ["--stream"])
+
+    assert result.exit_code == 1
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        {"type": "item", "item": {"name": "a"}},
+        {
+            "type": "error",
+            "success": False,
+            "error_type": "stream_failed",
+            "message": "page fetch failed",
+        },
+    ]
+
+
+def test_machine_command_stream_error_is_one_ndjson_line() -> None:
+    cmd = _make_stream_cmd(MachineCommandError(error_type="test_error", message="broke"))
+    with patch(
+        "erk_shared.agentclick.machine_command.read_machine_command_input",
+        return_value={"prompt": "x"},
+    ):
+        result = CliRunner().invoke(cmd, ["--stream"])
+
+    assert result.exit_code == 1
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        {"type": "error", "success": False, "error_type": "test_error", "message": "broke"}
+    ]
+
+
 def test_machine_command_error_flow() -> None:
     """MachineCommandError result emits JSON with success=False."""
 
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from erk_shared.agentclick.dataclass_json import ERROR_SCHEMA
-from erk_shared.agentclick.machine_command import MachineCommandMeta
+from erk_shared.agentclick.machine_command import MachineCommandMeta, MachineStreamSpec
 from erk_shared.agentclick.machine_schema import (
     build_machine_schema_document,
     request_schema,
@@ -117,6 +117,23 @@ def test_build_machine_schema_document() -> None:
     assert doc["error_schema"] == ERROR_SCHEMA
 
 
+def test_build_machine_schema_document_describes_stream() -> None:
+    """Streaming commands document each NDJSON line, with the item type's fields."""
+    meta = MachineCommandMeta(
+        request_type=MinimalRequest,
+        output_types=(SimpleResult,),
+        stream=MachineStreamSpec(items_key="requests", item_type=FullRequest),
+    )
+    doc = build_machine_schema_document(meta)
+
+    item_schema = doc["stream_schema"]["oneOf"][0]["properties"]["item"]
+    assert item_schema["properties"]["count"] == {"type": "integer"}
+    assert "success" not in item_schema["properties"]
+    assert "stream_schema" not in build_machine_schema_document(
+        MachineCommandMeta(request_type=MinimalRequest, output_types=(SimpleResult,))
+    )
+
+
 def test_error_schema_structure() -> None:
     """Error schema includes success, error_type, message."""
     assert ERROR_SCHEMA["type"] == "object"
@@ -0,0 +1,93 @@
+"""Tests for NDJSON streaming output."""
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from erk_shared.agentclick.ndjson import (
+    collect_ndjson_stream,
+    emit_ndjson_error,
+    emit_ndjson_stream,
+    ndjson_stream_schema,
+)
+
+
+def _emit(items: Iterable[dict[str, Any]]) -> list[str]:
+    @click.command()
+    def cmd() -> None:
+        emit_ndjson_stream(items)
+
+    return CliRunner().invoke(cmd, []).output.splitlines()
+
+
+def test_emits_one_line_per_item_then_result() -> None:
+    lines = _emit([{"n": 1}, {"n": 2}])
+
+    assert [json.loads(line) for line in lines] == [
+        {"type": "item", "item": {"n": 1}},
+        {"type": "item", "item": {"n": 2}},
+        {"type": "result", "success": True, "count": 2},
+    ]
+
+
+def test_producer_failure_ends_stream_with_error_event() -> None:
+    class FetchError(RuntimeError):
+        error_type = "api_error"
+
+    def items() -> Iterator[dict[str, Any]]:
+        yield {"n": 1}
+        raise FetchError("page 2 failed")
+
+    results: list[bool] = []
+
+    @click.command()
+    def cmd() -> None:
+        results.append(emit_ndjson_stream(items()))
+
+    lines = CliRunner().invoke(cmd, []).output.splitlines()
+
+    assert results == [False]
+    assert [json.loads(line) for line in lines] == [
+        {"type": "item", "item": {"n": 1}},
+        {"type": "error", "success": False, "error_type": "api_error", "message": "page 2 failed"},
+    ]
+
+
+def test_collect_rebuilds_non_streamed_document() -> None:
+    seen: list[dict[str, Any]] = []
+
+    document = collect_ndjson_stream(
+        _emit([{"n": 1}, {"n": 2}]), items_key="plans", on_item=seen.append
+    )
+
+    assert document == {"plans": [{"n": 1}, {"n": 2}], "count": 2, "success": True}
+    assert seen == [{"n": 1}, {"n": 2}]
+
+
+def test_collect_returns_terminal_error_after_items() -> None:
+    @click.command()
+    def cmd() -> None:
+        click.echo(json.dumps({"type": "item", "item": {"n": 1}}))
+        emit_ndjson_error(error_type="api_error", message="boom")
+
+    lines = CliRunner().invoke(cmd, []).output.splitlines()
+    document = collect_ndjson_stream(lines, items_key="plans", on_item=None)
+
+    assert document == {"success": False, "error_type": "api_error", "message": "boom"}
+
+
+def test_collect_rejects_truncated_stream() -> None:
+    with pytest.raises(ValueError, match="without a result event"):
+        collect_ndjson_stream(['{"type": "item", "item": {}}'], items_key="x", on_item=None)
+
+
+def test_stream_schema_wraps_item_schema() -> None:
+    schema = ndjson_stream_schema({"type": "object"})
+
+    assert schema["format"] == "ndjson"
+    item_event = schema["oneOf"][0]
+    assert item_event["properties"]["item"] == {"type": "object"}
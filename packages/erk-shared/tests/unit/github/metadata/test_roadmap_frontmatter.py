@@ -2,10 +2,12 @@
 
 from erk_shared.gateway.github.metadata.roadmap import (
     RoadmapNode,
+    RoadmapNodeUpdate,
     group_nodes_by_phase,
     parse_roadmap_frontmatter,
     render_roadmap_block_inner,
     update_node_in_frontmatter,
+    update_nodes_in_frontmatter,
     validate_roadmap_frontmatter,
 )
 
@@ -1188,3 +1190,60 @@ def test_update_node_preserves_depends_on() -> None:
     assert steps[0].depends_on == ()
     assert steps[1].depends_on == ("1.1",)
     assert steps[1].pr == "#999"
+
+
+def _planning_update(node_id: str, pr: str) -> RoadmapNodeUpdate:
+    return RoadmapNodeUpdate(
+        node_id=node_id, pr=pr, status="planning", description=None, slug=None, comment=None
+    )
+
+
+def test_update_nodes_in_frontmatter_applies_all_updates() -> None:
+    """Batch update applies every node update in one render."""
+    block_content = _details_block(
+        "schema_version: '4'\n"
+        "nodes:\n"
+        "- id: '1.1'\n"
+        "  description: First\n"
+        "  status: pending\n"
+        "  pr: null\n"
+        "- id: '1.2'\n"
+        "  description: Second\n"
+        "  status: pending\n"
+        "  pr: null\n"
+        "- id: '1.3'\n"
+        "  description: Third\n"
+        "  status: pending\n"
+        "  pr: null"
+    )
+
+    updated = update_nodes_in_frontmatter(
+        block_content, [_planning_update("1.1", "#10"), _planning_update("1.3", "#30")]
+    )
+
+    assert updated is not None
+    nodes = parse_roadmap_frontmatter(updated)
+    assert nodes is not None
+    assert [(n.id, n.status, n.pr) for n in nodes] == [
+        ("1.1", "planning", "#10"),
+        ("1.2", "pending", None),
+        ("1.3", "planning", "#30"),
+    ]
+
+
+def test_update_nodes_in_frontmatter_missing_node_returns_none() -> None:
+    """Batch update fails as a whole when any node is not found."""
+    block_content = _details_block(
+        "schema_version: '4'\n"
+        "nodes:\n"
+        "- id: '1.1'\n"
+        "  description: First\n"
+        "  status: pending\n"
+        "  pr: null"
+    )
+
+    updated = update_nodes_in_frontmatter(
+        block_content, [_planning_update("1.1", "#10"), _planning_update("9.9", "#99")]
+    )
+
+    assert updated is None
@@ -246,3 +246,42 @@ def test_fake_add_review_thread_reply_multiple() -> None:
     assert len(github.thread_replies) == 2
     assert github.thread_replies[0] == ("PRRT_1", "First reply")
     assert github.thread_replies[1] == ("PRRT_2", "Second reply")
+
+
+def _thread(thread_id: str, *, is_resolved: bool) -> PRReviewThread:
+    return PRReviewThread(
+        id=thread_id,
+        path="src/foo.py",
+        line=1,
+        is_resolved=is_resolved,
+        is_outdated=False,
+        comments=(),
+    )
+
+
+def test_fake_iter_review_thread_pages_resumes_after_cursor() -> None:
+    """Pages carry a cursor that resumes after the last thread seen."""
+    github = FakeLocalGitHub(
+        pr_review_threads={
+            123: [
+                _thread("PRRT_1", is_resolved=False),
+                _thread("PRRT_2", is_resolved=True),
+                _thread("PRRT_3", is_resolved=False),
+            ]
+        },
+        review_thread_page_size=2,
+    )
+
+    pages = list(
+        github.iter_pr_review_thread_pages(Path("/repo"), 123, include_resolved=False, after=None)
+    )
+
+    assert [[t.id for t in page.threads] for page in pages] == [["PRRT_1"], ["PRRT_3"]]
+
+    resumed = list(
+        github.iter_pr_review_thread_pages(
+            Path("/repo"), 123, include_resolved=True, after=pages[0].end_cursor
+        )
+    )
+
+    assert [t.id for page in resumed for t in page.threads] == ["PRRT_3"]
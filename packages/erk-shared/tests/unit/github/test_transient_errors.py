@@ -2,7 +2,12 @@
 
 import pytest
 
-from erk_shared.gateway.github.transient_errors import TRANSIENT_ERROR_PATTERNS, is_transient_error
+from erk_shared.gateway.github.transient_errors import (
+    TRANSIENT_ERROR_PATTERNS,
+    is_rate_limit_error,
+    is_secondary_rate_limit_error,
+    is_transient_error,
+)
 
 
 def test_io_timeout_detected() -> None:
@@ -106,3 +111,48 @@ def test_patterns_tuple_is_immutable() -> None:
 def test_all_patterns_in_lowercase(pattern: str) -> None:
     """Test that all patterns are lowercase for case-insensitive matching."""
     assert pattern == pattern.lower()
+
+
+def test_secondary_rate_limit_detected() -> None:
+    """Test that GitHub's secondary rate limit message is detected."""
+    error = (
+        "HTTP 403 for repos/o/r/actions/workflows/x.yml/dispatches: "
+        "You have exceeded a secondary rate limit. Please wait a few minutes before you try again."
+    )
+    assert is_secondary_rate_limit_error(error) is True
+
+
+def test_abuse_detection_detected_as_secondary_rate_limit() -> None:
+    """Test that the legacy abuse-detection wording is treated as a secondary rate limit."""
+    error = "You have triggered an abuse detection mechanism."
+    assert is_secondary_rate_limit_error(error) is True
+
+
+def test_primary_rate_limit_not_secondary() -> None:
+    """Test that primary quota exhaustion is not treated as a secondary rate limit."""
+    error = "HTTP 403: API rate limit exceeded for user ID 1."
+    assert is_secondary_rate_limit_error(error) is False
+
+
+def test_primary_rate_limit_detected_as_rate_limit() -> None:
+    """Test that primary quota exhaustion is a rate limit."""
+    error = "HTTP 403: API rate limit exceeded for user ID 1."
+    assert is_rate_limit_error(error) is True
+
+
+def test_graphql_rate_limited_detected_as_rate_limit() -> None:
+    """Test that the GraphQL RATE_LIMITED error type is a rate limit."""
+    error = "gh: GraphQL: API rate limit exceeded (RATE_LIMITED)"
+    assert is_rate_limit_error(error) is True
+
+
+def test_secondary_rate_limit_detected_as_rate_limit() -> None:
+    """Test that secondary rate limits are also rate limits."""
+    error = "You have exceeded a secondary rate limit."
+    assert is_rate_limit_error(error) is True
+
+
+def test_not_found_not_rate_limit() -> None:
+    """Test that a GraphQL not-found error is not a rate limit."""
+    error = "GraphQL: Could not resolve to a PullRequest with the number of 999."
+    assert is_rate_limit_error(error) is False
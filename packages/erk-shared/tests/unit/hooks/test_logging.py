@@ -1,11 +1,12 @@
 """Tests for hook logging I/O functions."""
 
 import json
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 from erk_shared.hooks.logging import (
+    clear_hook_logs,
     get_hook_log_dir,
-    read_hook_log,
     read_recent_hook_logs,
     truncate_string,
     write_hook_log,
@@ -13,130 +14,94 @@ from erk_shared.hooks.logging import (
 from erk_shared.hooks.types import HookExecutionLog, HookExitStatus
 
 
+def _make_log(
+    *,
+    hook_id: str,
+    session_id: str | None,
+    started_at: datetime,
+    exit_status: HookExitStatus,
+) -> HookExecutionLog:
+    return HookExecutionLog(
+        kit_id="test-kit",
+        hook_id=hook_id,
+        session_id=session_id,
+        started_at=started_at.isoformat(),
+        ended_at=(started_at + timedelta(seconds=1)).isoformat(),
+        duration_ms=1000,
+        exit_code=0 if exit_status == HookExitStatus.SUCCESS else 2,
+        exit_status=exit_status,
+        stdout="hello",
+        stderr="",
+        stdin_context=f'{{"session_id": "{session_id}"}}',
+    )
+
+
 class TestGetHookLogDir:
     """Tests for get_hook_log_dir function."""
 
     def test_returns_correct_path_with_repo_root(self, tmp_path: Path) -> None:
-        result = get_hook_log_dir("session-123", "my-hook", repo_root=tmp_path)
-        expected = tmp_path / ".erk" / "scratch" / "sessions" / "session-123" / "hooks" / "my-hook"
-        assert result == expected
+        result = get_hook_log_dir(repo_root=tmp_path)
+        assert result == tmp_path / ".erk" / "scratch" / "hook-logs"
 
 
 class TestWriteHookLog:
     """Tests for write_hook_log function."""
 
-    def test_writes_log_file(self, tmp_path: Path) -> None:
-        log = HookExecutionLog(
-            kit_id="test-kit",
+    def test_appends_json_line_to_segment(self, tmp_path: Path) -> None:
+        now = datetime.now(UTC)
+        log = _make_log(
             hook_id="test-hook",
             session_id="session-abc",
-            started_at="2024-01-01T12:00:00+00:00",
-            ended_at="2024-01-01T12:00:01+00:00",
-            duration_ms=1000,
-            exit_code=0,
+            started_at=now,
             exit_status=HookExitStatus.SUCCESS,
-            stdout="hello",
-            stderr="",
-            stdin_context='{"session_id": "session-abc"}',
         )
 
         result_path = write_hook_log(log, repo_root=tmp_path)
+        write_hook_log(log, repo_root=tmp_path)
 
         assert result_path is not None
-        assert result_path.exists()
-        content = json.loads(result_path.read_text(encoding="utf-8"))
+        assert result_path.parent == get_hook_log_dir(repo_root=tmp_path)
+        assert result_path.name == now.strftime("%Y%m%dT%H") + ".jsonl"
+        lines = result_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        content = json.loads(lines[0])
         assert content["kit_id"] == "test-kit"
         assert content["hook_id"] == "test-hook"
+        assert content["session_id"] == "session-abc"
         assert content["exit_status"] == "success"
 
     def test_returns_none_when_no_session_id(self, tmp_path: Path) -> None:
-        log = HookExecutionLog(
-            kit_id="test-kit",
+        log = _make_log(
             hook_id="test-hook",
-            session_id=None,  # No session ID
-            started_at="2024-01-01T12:00:00+00:00",
-            ended_at="2024-01-01T12:00:01+00:00",
-            duration_ms=1000,
-            exit_code=0,
+            session_id=None,
+            started_at=datetime.now(UTC),
             exit_status=HookExitStatus.SUCCESS,
-            stdout="",
-            stderr="",
-            stdin_context="",
         )
 
         result_path = write_hook_log(log, repo_root=tmp_path)
         assert result_path is None
 
 
-class TestReadHookLog:
-    """Tests for read_hook_log function."""
-
-    def test_reads_written_log(self, tmp_path: Path) -> None:
-        log = HookExecutionLog(
-            kit_id="test-kit",
-            hook_id="test-hook",
-            session_id="session-xyz",
-            started_at="2024-01-01T12:00:00+00:00",
-            ended_at="2024-01-01T12:00:01+00:00",
-            duration_ms=1000,
-            exit_code=1,
-            exit_status=HookExitStatus.ERROR,
-            stdout="output",
-            stderr="error message",
-            stdin_context="{}",
-            error_message="Something went wrong",
-        )
-
-        result_path = write_hook_log(log, repo_root=tmp_path)
-        assert result_path is not None
-
-        read_log = read_hook_log(result_path)
-
-        assert read_log is not None
-        assert read_log.kit_id == "test-kit"
-        assert read_log.hook_id == "test-hook"
-        assert read_log.exit_status == HookExitStatus.ERROR
-        assert read_log.error_message == "Something went wrong"
-
-    def test_returns_none_for_nonexistent_file(self, tmp_path: Path) -> None:
-        result = read_hook_log(tmp_path / "nonexistent.json")
-        assert result is None
-
-
 class TestReadRecentHookLogs:
     """Tests for read_recent_hook_logs function."""
 
-    def test_returns_empty_when_no_sessions_dir(self, tmp_path: Path) -> None:
+    def test_returns_empty_when_no_log_dir(self, tmp_path: Path) -> None:
         result = read_recent_hook_logs(tmp_path)
         assert result == []
 
     def test_reads_logs_from_multiple_sessions(self, tmp_path: Path) -> None:
-        # Write logs to two different sessions
-        log1 = HookExecutionLog(
-            kit_id="kit1",
+        now = datetime.now(UTC)
+        log1 = _make_log(
             hook_id="hook1",
             session_id="session-1",
-            started_at="2024-01-01T12:00:00+00:00",
-            ended_at="2024-01-01T12:00:01+00:00",
-            duration_ms=1000,
-            exit_code=0,
+            started_at=now - timedelta(minutes=1),
             exit_status=HookExitStatus.SUCCESS,
-            stdout="",
-            stderr="",
-            stdin_context="",
         )
-        log2 = HookExecutionLog(
-            kit_id="kit2",
+        log2 = _make_log(
             hook_id="hook2",
             session_id="session-2",
-            started_at="2024-01-01T12:01:00+00:00",
-            ended_at="2024-01-01T12:01:01+00:00",
-            duration_ms=1000,
-            exit_code=2,
+            started_at=now,
             exit_status=HookExitStatus.BLOCKED,
-            stdout="",
-            stderr="",
-            stdin_context="",
         )
 
         write_hook_log(log1, repo_root=tmp_path)
@@ -144,10 +109,49 @@ class TestReadRecentHookLogs:
 
         result = read_recent_hook_logs(tmp_path)
 
-        assert len(result) == 2
-        # Should be sorted by started_at descending (newest first)
-        assert result[0].hook_id == "hook2"
-        assert result[1].hook_id == "hook1"
+        assert result == [log2, log1]
+
+    def test_skips_segments_outside_window(self, tmp_path: Path) -> None:
+        now = datetime.now(UTC)
+        recent = _make_log(
+            hook_id="recent",
+            session_id="session-1",
+            started_at=now,
+            exit_status=HookExitStatus.SUCCESS,
+        )
+        write_hook_log(recent, repo_root=tmp_path)
+        misplaced = _make_log(
+            hook_id="misplaced",
+            session_id="session-1",
+            started_at=now,
+            exit_status=HookExitStatus.SUCCESS,
+        )
+        old_segment = get_hook_log_dir(repo_root=tmp_path) / (
+            (now - timedelta(hours=30)).strftime("%Y%m%dT%H") + ".jsonl"
+        )
+        # A recent record inside an old segment is only seen if the segment is opened
+        record = {**misplaced.__dict__, "exit_status": "success"}
+        old_segment.write_text(json.dumps(record) + "\n", encoding="utf-8")
+
+        assert read_recent_hook_logs(tmp_path, max_age_hours=24) == [recent]
+
+
+class TestClearHookLogs:
+    """Tests for clear_hook_logs on segmented logs."""
+
+    def test_clears_segments_and_counts_entries(self, tmp_path: Path) -> None:
+        now = datetime.now(UTC)
+        for hook_id in ["hook-a", "hook-b", "hook-c"]:
+            log = _make_log(
+                hook_id=hook_id,
+                session_id="session-1",
+                started_at=now,
+                exit_status=HookExitStatus.SUCCESS,
+            )
+            write_hook_log(log, repo_root=tmp_path)
+
+        assert clear_hook_logs(tmp_path) == 3
+        assert read_recent_hook_logs(tmp_path) == []
 
 
 class TestTruncateString:
@@ -8,8 +8,11 @@ from pathlib import Path
 
 from erk_shared.gateway.gt.events import CompletionEvent, ProgressEvent
 from erk_shared.gateway.pr.diff_extraction import (
+    DiffFileStat,
     execute_diff_extraction,
     filter_diff_excluded_files,
+    is_generated_diff_path,
+    write_budgeted_diff,
 )
 from tests.fakes.gateway.git import FakeGit
 from tests.fakes.gateway.github import FakeLocalGitHub
@@ -333,3 +336,107 @@ def test_execute_diff_extraction_uses_passed_base_branch(tmp_path: Path) -> None
     # Should use the passed base_branch (feature-base), not trunk
     assert "feature branch diff" in content
     assert "trunk diff" not in content
+
+
+# --- Tests for write_budgeted_diff ---
+
+
+def _file_diff(path: str, *, added_lines: int) -> str:
+    body = "".join(f"+line {i}\n" for i in range(added_lines))
+    return f"diff --git a/{path} b/{path}\n@@ -0,0 +1,{added_lines} @@\n{body}"
+
+
+def test_is_generated_diff_path() -> None:
+    assert is_generated_diff_path("web/dist/app.js")
+    assert is_generated_diff_path("static/app.min.js")
+    assert is_generated_diff_path("proto/service_pb2.py")
+    assert not is_generated_diff_path("src/erk/dist.py")
+    assert not is_generated_diff_path("src/app.py")
+
+
+def test_write_budgeted_diff_within_budget_is_unchanged(tmp_path: Path) -> None:
+    diff = _file_diff("a.py", added_lines=3) + _file_diff("b.py", added_lines=2)
+    output = tmp_path / "out.diff"
+
+    result = write_budgeted_diff(
+        diff.splitlines(keepends=True),
+        output_path=output,
+        max_total_chars=10_000,
+        max_file_chars=10_000,
+    )
+
+    assert output.read_text(encoding="utf-8") == diff
+    assert result.total_lines == len(diff.splitlines())
+    assert not result.was_truncated
+
+
+def test_write_budgeted_diff_truncates_large_file(tmp_path: Path) -> None:
+    diff = _file_diff("big.py", added_lines=100) + _file_diff("small.py", added_lines=1)
+    output = tmp_path / "out.diff"
+
+    result = write_budgeted_diff(
+        diff.splitlines(keepends=True),
+        output_path=output,
+        max_total_chars=10_000,
+        max_file_chars=200,
+    )
+
+    content = output.read_text(encoding="utf-8")
+    assert result.truncated_files == ("big.py",)
+    assert "more lines of big.py truncated" in content
+    assert "+line 99\n" not in content
+    assert _file_diff("small.py", added_lines=1) in content
+
+
+def test_write_budgeted_diff_prefers_source_over_generated(tmp_path: Path) -> None:
+    diff = (
+        _file_diff("dist/bundle.js", added_lines=20)
+        + _file_diff("src/app.py", added_lines=20)
+        + _file_diff("src/lib.py", added_lines=2)
+    )
+    output = tmp_path / "out.diff"
+    source_chars = len(_file_diff("src/app.py", added_lines=20)) + len(
+        _file_diff("src/lib.py", added_lines=2)
+    )
+
+    result = write_budgeted_diff(
+        diff.splitlines(keepends=True),
+        output_path=output,
+        max_total_chars=source_chars + 10,
+        max_file_chars=10_000,
+    )
+
+    content = output.read_text(encoding="utf-8")
+    assert "diff --git a/src/app.py" in content
+    assert "diff --git a/src/lib.py" in content
+    assert "diff --git a/dist/bundle.js" not in content
+    assert result.omitted_files == (DiffFileStat(path="dist/bundle.js", added=20, deleted=0),)
+    assert "1 files omitted to fit the diff size budget" in content
+    assert " dist/bundle.js | +20 -0" in content
+
+
+def test_execute_diff_extraction_excludes_lock_files(tmp_path: Path) -> None:
+    """Lock files are excluded before the diff reaches the scratch file."""
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+
+    local_diff = _file_diff("app.py", added_lines=1) + _file_diff("pkg/uv.lock", added_lines=5)
+
+    git = FakeGit(
+        git_common_dirs={tmp_path: repo_root},
+        repository_roots={tmp_path: str(repo_root)},
+        trunk_branches={repo_root: "main"},
+        diff_to_branch={(tmp_path, "main"): local_diff},
+    )
+    ctx = context_for_test(git=git, github=FakeLocalGitHub(), graphite=FakeGraphite(), cwd=tmp_path)
+
+    events = list(
+        execute_diff_extraction(
+            ctx, tmp_path, pr_number=123, session_id="test-session", base_branch="main"
+        )
+    )
+
+    completion_events = [e for e in events if isinstance(e, CompletionEvent)]
+    result = completion_events[0].result
+    assert isinstance(result, Path)
+    assert result.read_text(encoding="utf-8") == _file_diff("app.py", added_lines=1)
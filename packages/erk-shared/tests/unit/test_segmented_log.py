@@ -0,0 +1,134 @@
+"""Tests for the time-segmented append-only log store."""
+
+import fcntl
+import json
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+
+from erk_shared.segmented_log import (
+    SegmentedLog,
+    SegmentPolicy,
+    hourly_segment_name,
+    parse_segment_name,
+)
+
+_NOW = datetime(2026, 3, 10, 15, 30, tzinfo=UTC)
+
+
+def _store(root: Path, *, retention: timedelta | None, max_total_bytes: int | None) -> SegmentedLog:
+    return SegmentedLog(
+        root,
+        policy=SegmentPolicy(
+            compact_after=timedelta(days=1),
+            retention=retention,
+            max_total_bytes=max_total_bytes,
+        ),
+    )
+
+
+def _write_segment(root: Path, name: str, records: list[dict[str, object]]) -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    content = "".join(json.dumps(record) + "\n" for record in records)
+    (root / name).write_text(content, encoding="utf-8")
+
+
+def test_parse_segment_name() -> None:
+    hourly = parse_segment_name(Path("20260310T15.jsonl"))
+    daily = parse_segment_name(Path("20260309.jsonl"))
+
+    assert hourly is not None
+    assert hourly.start == datetime(2026, 3, 10, 15, tzinfo=UTC)
+    assert hourly.end == datetime(2026, 3, 10, 16, tzinfo=UTC)
+    assert daily is not None
+    assert daily.end - daily.start == timedelta(days=1)
+    assert parse_segment_name(Path(".last-compaction")) is None
+    assert parse_segment_name(Path("notes.jsonl")) is None
+
+
+def test_hourly_segment_name_uses_utc() -> None:
+    eastern = _NOW.astimezone(timezone(timedelta(hours=-5)))
+    assert hourly_segment_name(eastern) == "20260310T15.jsonl"
+
+
+def test_segments_select_only_overlapping_time_range(tmp_path: Path) -> None:
+    _write_segment(tmp_path, "20260308.jsonl", [{"n": 1}])
+    _write_segment(tmp_path, "20260310T13.jsonl", [{"n": 2}])
+    _write_segment(tmp_path, "20260310T15.jsonl", [{"n": 3}])
+    store = _store(tmp_path, retention=None, max_total_bytes=None)
+
+    selected = store.segments(since=_NOW - timedelta(hours=2), until=None)
+
+    assert [s.path.name for s in selected] == ["20260310T13.jsonl", "20260310T15.jsonl"]
+    assert [r["n"] for r in store.read(since=None, until=_NOW - timedelta(days=1))] == [1]
+
+
+def test_append_and_read_round_trip(tmp_path: Path) -> None:
+    store = _store(tmp_path, retention=None, max_total_bytes=None)
+
+    path = store.append({"n": 1}, timestamp=datetime.now(UTC))
+    store.append({"n": 2}, timestamp=datetime.now(UTC))
+
+    assert path.parent == tmp_path
+    assert [r["n"] for r in store.read(since=None, until=None)] == [1, 2]
+
+
+def test_read_skips_malformed_lines(tmp_path: Path) -> None:
+    tmp_path.mkdir(exist_ok=True)
+    (tmp_path / "20260310T15.jsonl").write_text('{"n": 1}\n{"n": \n\n[1]\n', encoding="utf-8")
+    store = _store(tmp_path, retention=None, max_total_bytes=None)
+
+    assert list(store.read(since=None, until=None)) == [{"n": 1}]
+
+
+def test_compact_merges_old_hourly_segments_into_daily(tmp_path: Path) -> None:
+    _write_segment(tmp_path, "20260308.jsonl", [{"n": 0}])
+    _write_segment(tmp_path, "20260308T22.jsonl", [{"n": 1}])
+    _write_segment(tmp_path, "20260308T23.jsonl", [{"n": 2}])
+    _write_segment(tmp_path, "20260310T14.jsonl", [{"n": 3}])
+    store = _store(tmp_path, retention=None, max_total_bytes=None)
+
+    assert store.compact(now=_NOW) is True
+
+    names = sorted(s.path.name for s in store.segments(since=None, until=None))
+    assert names == ["20260308.jsonl", "20260310T14.jsonl"]
+    assert [r["n"] for r in store.read(since=None, until=None)] == [0, 1, 2, 3]
+
+
+def test_compact_drops_segments_past_retention(tmp_path: Path) -> None:
+    _write_segment(tmp_path, "20260301.jsonl", [{"n": 1}])
+    _write_segment(tmp_path, "20260310T14.jsonl", [{"n": 2}])
+    store = _store(tmp_path, retention=timedelta(days=7), max_total_bytes=None)
+
+    store.compact(now=_NOW)
+
+    assert [r["n"] for r in store.read(since=None, until=None)] == [2]
+
+
+def test_compact_enforces_size_budget_keeping_newest(tmp_path: Path) -> None:
+    for day in ["20260301", "20260302", "20260303"]:
+        _write_segment(tmp_path, f"{day}.jsonl", [{"day": day, "pad": "x" * 100}])
+    store = _store(tmp_path, retention=None, max_total_bytes=150)
+
+    store.compact(now=_NOW)
+
+    assert [r["day"] for r in store.read(since=None, until=None)] == ["20260303"]
+
+
+def test_compact_skips_when_another_process_holds_lock(tmp_path: Path) -> None:
+    _write_segment(tmp_path, "20260308T22.jsonl", [{"n": 1}])
+    store = _store(tmp_path, retention=None, max_total_bytes=None)
+
+    with (tmp_path / ".compaction.lock").open("a", encoding="utf-8") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        assert store.compact(now=_NOW) is False
+
+    assert (tmp_path / "20260308T22.jsonl").exists()
+
+
+def test_clear_returns_record_count(tmp_path: Path) -> None:
+    _write_segment(tmp_path, "20260308.jsonl", [{"n": 1}, {"n": 2}])
+    _write_segment(tmp_path, "20260310T15.jsonl", [{"n": 3}])
+    store = _store(tmp_path, retention=None, max_total_bytes=None)
+
+    assert store.clear() == 3
+    assert store.segments(since=None, until=None) == []
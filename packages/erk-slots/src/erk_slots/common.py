@@ -1,6 +1,7 @@
 """Shared utilities for slot commands."""
 
 import shutil
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -9,9 +10,16 @@ import click
 from erk.cli.activation import write_worktree_activate_script
 from erk.core.context import ErkContext
 from erk.core.repo_discovery import RepoContext, ensure_erk_metadata_dir
-from erk.core.worktree_pool import PoolState, SlotAssignment, load_pool_state, save_pool_state
+from erk.core.worktree_pool import (
+    PoolState,
+    SlotAssignment,
+    load_pool_state,
+    pool_state_lock,
+    save_pool_state,
+    try_pool_state_lock,
+)
 from erk_shared.gateway.console.abc import Console
-from erk_shared.gateway.git.abc import Git
+from erk_shared.gateway.git.abc import Git, WorktreeInfo
 from erk_shared.impl_folder import IMPL_DIR_RELATIVE
 from erk_shared.output.output import user_output
 from erk_shared.slots.naming import (
@@ -31,6 +39,39 @@ class SlotAllocationResult:
     already_assigned: bool  # True if branch was already in a slot
 
 
+@dataclass(frozen=True)
+class PoolWorktrees:
+    """Snapshot of the repository's worktrees from one `git worktree list`.
+
+    Pool reconciliation reads branch, HEAD and locked/prunable state for every
+    slot from this snapshot instead of querying each slot worktree, so the
+    number of git calls does not grow with the pool size.
+
+    Attributes:
+        by_path: Worktrees keyed by resolved path
+    """
+
+    by_path: Mapping[Path, WorktreeInfo]
+
+    def get(self, worktree_path: Path) -> WorktreeInfo | None:
+        """Return the worktree registered at worktree_path, if any."""
+        return self.by_path.get(worktree_path.resolve())
+
+
+def read_pool_worktrees(git: Git, repo_root: Path) -> PoolWorktrees:
+    """List the repository's worktrees once for pool reconciliation.
+
+    Args:
+        git: Git gateway for worktree operations
+        repo_root: Repository root path
+
+    Returns:
+        PoolWorktrees snapshot of every registered worktree
+    """
+    worktrees = git.worktree.list_worktrees(repo_root)
+    return PoolWorktrees(by_path={wt.path.resolve(): wt for wt in worktrees})
+
+
 def get_pool_size(ctx: ErkContext) -> int:
     """Get effective pool size from config or default.
 
@@ -81,49 +122,62 @@ def find_next_available_slot(state: PoolState, worktrees_dir: Path | None) -> in
 def find_inactive_slot(
     state: PoolState,
     git: Git,
-    repo_root: Path,
+    worktrees: PoolWorktrees,
 ) -> tuple[str, Path] | None:
     """Find an available managed slot for reuse.
 
     Searches for worktrees that exist but are not assigned.
     Uses git as source of truth for which worktrees exist.
     Prefers slots in order (lowest slot number first).
-    Skips slots with uncommitted changes.
+    Skips locked or prunable worktrees and slots with uncommitted changes.
 
     Args:
         state: Current pool state
-        git: Git gateway for worktree operations
-        repo_root: Repository root path
+        git: Git gateway for status checks
+        worktrees: Worktree snapshot from read_pool_worktrees()
 
     Returns:
         Tuple of (slot_name, worktree_path) for an available slot,
         or None if no inactive slot found
     """
-    assigned_slots = {a.slot_name for a in state.assignments}
+    for slot_name, wt_path in _inactive_slot_candidates(state, worktrees):
+        # Skip slots with staged or modified files (untracked files are
+        # irrelevant for branch switching safety — git leaves them untouched)
+        if _has_staged_or_modified_files(git, wt_path):
+            continue
+        return (slot_name, wt_path)
+
+    return None
 
-    # Get all worktrees from git (source of truth)
-    worktrees = git.worktree.list_worktrees(repo_root)
 
-    # Build lookup of slot_name -> worktree_path for managed slots
+def _inactive_slot_candidates(state: PoolState, worktrees: PoolWorktrees) -> list[tuple[str, Path]]:
+    """List unassigned, usable managed slots in slot number order.
+
+    Uses only pool state and the worktree snapshot, so it is cheap enough to
+    run while holding pool_state_lock().
+    """
+    assigned_slots = {a.slot_name for a in state.assignments}
+
+    # Build lookup of slot_name -> worktree_path for usable managed slots
     managed_worktrees: dict[str, Path] = {}
-    for wt in worktrees:
+    for wt in worktrees.by_path.values():
+        if wt.locked or wt.prunable:
+            continue
         slot_name = wt.path.name
         if extract_slot_number(slot_name) is not None:
             managed_worktrees[slot_name] = wt.path
 
-    # Find first unassigned slot (by slot number order)
+    candidates: list[tuple[str, Path]] = []
     for slot_num in range(1, state.pool_size + 1):
         slot_name = generate_slot_name(slot_num)
         if slot_name in managed_worktrees and slot_name not in assigned_slots:
-            wt_path = managed_worktrees[slot_name]
-            # Skip slots with staged or modified files (untracked files are
-            # irrelevant for branch switching safety — git leaves them untouched)
-            staged, modified, _untracked = git.status.get_file_status(wt_path)
-            if staged or modified:
-                continue
-            return (slot_name, wt_path)
+            candidates.append((slot_name, managed_worktrees[slot_name]))
+    return candidates
 
-    return None
+
+def _has_staged_or_modified_files(git: Git, worktree_path: Path) -> bool:
+    staged, modified, _untracked = git.status.get_file_status(worktree_path)
+    return bool(staged or modified)
 
 
 def is_slot_initialized(state: PoolState, slot_name: str) -> bool:
@@ -165,19 +219,21 @@ class PoolSyncResult:
 
 def sync_pool_assignments(
     state: PoolState,
-    git: Git,
+    worktrees: PoolWorktrees,
     pool_json_path: Path,
 ) -> PoolSyncResult:
     """Sync pool assignments with actual git branch state.
 
-    For each assignment, checks the actual branch in the worktree and
-    updates pool.json when mismatches are detected. This handles the case
-    where users manually run ``gt create`` or ``git checkout`` in a pool
-    slot, causing the recorded branch to diverge from the actual branch.
+    For each assignment, looks up the actual branch of its worktree in the
+    snapshot and updates pool.json when mismatches are detected. This handles
+    the case where users manually run ``gt create`` or ``git checkout`` in a
+    pool slot, causing the recorded branch to diverge from the actual branch.
+    Assignments whose worktree is not registered or is prunable are left
+    unchanged.
 
     Args:
         state: Current pool state
-        git: Git gateway for branch operations
+        worktrees: Worktree snapshot from read_pool_worktrees()
         pool_json_path: Path to pool.json for saving updated state
 
     Returns:
@@ -187,11 +243,12 @@ def sync_pool_assignments(
     synced_count = 0
 
     for assignment in state.assignments:
-        if not assignment.worktree_path.exists():
+        worktree = worktrees.get(assignment.worktree_path)
+        if worktree is None or worktree.prunable:
             updated_assignments.append(assignment)
             continue
 
-        actual_branch = git.branch.get_current_branch(assignment.worktree_path)
+        actual_branch = worktree.branch
 
         if actual_branch is None:
             # Detached HEAD — leave assignment unchanged
@@ -230,41 +287,56 @@ def sync_pool_assignments(
     return PoolSyncResult(state=new_state, synced_count=synced_count)
 
 
-@dataclass(frozen=True)
-class ExistingAssignmentValidation:
-    """Result of validating an existing branch assignment."""
+def remove_slot_assignment(pool_json_path: Path, slot_name: str) -> None:
+    """Remove the assignment for a slot from pool.json.
 
-    result: SlotAllocationResult | None  # If we can use the existing assignment
-    updated_state: PoolState | None  # If state was updated (stale assignment removed)
+    pool.json is reloaded under pool_state_lock(), so assignments other
+    processes made since the caller loaded its copy of the state are kept.
+
+    Args:
+        pool_json_path: Path to pool.json
+        slot_name: Slot whose assignment is removed
+    """
+    with pool_state_lock(pool_json_path):
+        state = load_pool_state(pool_json_path)
+        if state is None:
+            return
+        save_pool_state(
+            pool_json_path,
+            PoolState(
+                version=state.version,
+                pool_size=state.pool_size,
+                slots=state.slots,
+                assignments=tuple(a for a in state.assignments if a.slot_name != slot_name),
+            ),
+        )
 
 
 def _validate_existing_assignment(
     ctx: ErkContext,
     *,
-    state: PoolState,
     existing: SlotAssignment,
     branch_name: str,
     repo_pool_json_path: Path,
-) -> ExistingAssignmentValidation:
+    worktrees: PoolWorktrees,
+) -> SlotAllocationResult | None:
     """Validate an existing assignment and determine if it can be used.
 
-    Handles three cases:
-    1. Worktree directory missing → remove stale assignment, return updated state
+    Runs outside pool_state_lock(), since it may call git. Handles three cases:
+    1. Worktree directory missing → remove stale assignment, return None
     2. Worktree has correct branch → return result to use existing assignment
     3. Worktree has wrong branch → fix it or error if uncommitted changes
 
     Args:
         ctx: Erk context with git gateway
-        state: Current pool state
         existing: The existing assignment to validate
         branch_name: Expected branch name
-        repo_pool_json_path: Path to pool.json for saving updated state
+        repo_pool_json_path: Path to pool.json for removing a stale assignment
+        worktrees: Worktree snapshot from read_pool_worktrees()
 
     Returns:
-        ExistingAssignmentValidation with either:
-        - result set: Use this existing assignment (fast path)
-        - updated_state set: Stale assignment removed, continue with normal allocation
-        - both None: Should not happen (raises SystemExit on error)
+        SlotAllocationResult to use the existing assignment, or None if the
+        stale assignment was removed and a new slot must be allocated
 
     Raises:
         SystemExit(1): If worktree has uncommitted changes and can't be fixed
@@ -276,28 +348,25 @@ def _validate_existing_assignment(
             + f"Removing stale assignment for '{branch_name}' "
             + f"(worktree {existing.worktree_path} no longer exists)"
         )
-        new_assignments = tuple(a for a in state.assignments if a.slot_name != existing.slot_name)
-        updated_state = PoolState(
-            version=state.version,
-            pool_size=state.pool_size,
-            slots=state.slots,
-            assignments=new_assignments,
-        )
-        save_pool_state(repo_pool_json_path, updated_state)
-        return ExistingAssignmentValidation(result=None, updated_state=updated_state)
+        remove_slot_assignment(repo_pool_json_path, existing.slot_name)
+        return None
 
-    # Worktree exists - verify it has the correct branch
-    actual_branch = ctx.git.branch.get_current_branch(existing.worktree_path)
+    result = SlotAllocationResult(
+        slot_name=existing.slot_name,
+        worktree_path=existing.worktree_path,
+        already_assigned=True,
+    )
+
+    # Worktree exists - verify it has the correct branch, asking git directly
+    # only if the directory is not in the worktree snapshot
+    worktree = worktrees.get(existing.worktree_path)
+    if worktree is not None:
+        actual_branch = worktree.branch
+    else:
+        actual_branch = ctx.git.branch.get_current_branch(existing.worktree_path)
     if actual_branch == branch_name:
         # Branch matches - fast path
-        return ExistingAssignmentValidation(
-            result=SlotAllocationResult(
-                slot_name=existing.slot_name,
-                worktree_path=existing.worktree_path,
-                already_assigned=True,
-            ),
-            updated_state=None,
-        )
+        return result
 
     # Worktree has a different branch - need to fix
     if ctx.git.status.has_uncommitted_changes(existing.worktree_path):
@@ -318,14 +387,7 @@ def _validate_existing_assignment(
         + f"(was '{actual_branch}')"
     )
     ctx.branch_manager.checkout_branch(existing.worktree_path, branch_name)
-    return ExistingAssignmentValidation(
-        result=SlotAllocationResult(
-            slot_name=existing.slot_name,
-            worktree_path=existing.worktree_path,
-            already_assigned=True,
-        ),
-        updated_state=None,
-    )
+    return result
 
 
 def find_assignment_by_worktree(state: PoolState, git: Git, cwd: Path) -> SlotAssignment | None:
@@ -454,7 +516,6 @@ def cleanup_worktree_artifacts(worktree_path: Path) -> None:
 
 def update_slot_assignment_tip(
     pool_json_path: Path,
-    state: PoolState,
     current_assignment: SlotAssignment,
     *,
     branch_name: str,
@@ -464,10 +525,11 @@ def update_slot_assignment_tip(
 
     Used for stack-in-place: when creating a new branch from within an assigned
     slot, update the assignment to track the new branch without consuming a new slot.
+    pool.json is reloaded and saved under pool_state_lock(), so concurrent
+    changes to other slots are preserved.
 
     Args:
         pool_json_path: Path to pool.json for saving updated state
-        state: Current pool state
         current_assignment: The assignment to update
         branch_name: New branch name to assign
         now: ISO timestamp for the assignment
@@ -482,24 +544,323 @@ def update_slot_assignment_tip(
         worktree_path=current_assignment.worktree_path,
     )
 
-    new_assignments = tuple(
-        new_assignment if a.slot_name == current_assignment.slot_name else a
-        for a in state.assignments
+    with pool_state_lock(pool_json_path):
+        state = load_pool_state(pool_json_path)
+        if state is not None:
+            new_assignments = tuple(
+                new_assignment if a.slot_name == current_assignment.slot_name else a
+                for a in state.assignments
+            )
+            save_pool_state(
+                pool_json_path,
+                PoolState(
+                    version=state.version,
+                    pool_size=state.pool_size,
+                    slots=state.slots,
+                    assignments=new_assignments,
+                ),
+            )
+
+    return SlotAllocationResult(
+        slot_name=current_assignment.slot_name,
+        worktree_path=current_assignment.worktree_path,
+        already_assigned=True,
+    )
+
+
+@dataclass(frozen=True)
+class _SlotReservation:
+    """A slot recorded in pool.json for a branch whose worktree is not ready yet.
+
+    Attributes:
+        slot_name: Reserved slot
+        worktree_path: Worktree directory of the slot
+        create_worktree: True if the worktree must be created, False if an
+            existing worktree is switched to the branch
+    """
+
+    slot_name: str
+    worktree_path: Path
+    create_worktree: bool
+
+
+def _load_or_create_pool_state(ctx: ErkContext, repo: RepoContext) -> PoolState:
+    state = load_pool_state(repo.pool_json_path)
+    if state is not None:
+        return state
+    return PoolState(
+        version="1.0",
+        pool_size=get_pool_size(ctx),
+        slots=(),
+        assignments=(),
+    )
+
+
+def _find_clean_inactive_slots(
+    ctx: ErkContext,
+    repo: RepoContext,
+    *,
+    worktrees: PoolWorktrees,
+    reuse_inactive_slots: bool,
+) -> frozenset[str]:
+    """Return inactive slots whose worktrees are safe to switch branches in.
+
+    Runs git status per candidate slot, so it is called before taking
+    pool_state_lock(); the locked section only picks from this set.
+    """
+    if not reuse_inactive_slots:
+        return frozenset()
+    state = _load_or_create_pool_state(ctx, repo)
+    return frozenset(
+        slot_name
+        for slot_name, wt_path in _inactive_slot_candidates(state, worktrees)
+        if not _has_staged_or_modified_files(ctx.git, wt_path)
+    )
+
+
+def _find_free_slot(
+    state: PoolState,
+    repo: RepoContext,
+    *,
+    worktrees: PoolWorktrees,
+    clean_inactive_slots: frozenset[str],
+) -> _SlotReservation | None:
+    """Pick an unassigned slot without evicting anything.
+
+    Prefers reusing an existing inactive worktree from clean_inactive_slots,
+    then a slot number with no worktree yet. Returns None if the pool is full.
+    """
+    for slot_name, worktree_path in _inactive_slot_candidates(state, worktrees):
+        if slot_name in clean_inactive_slots:
+            return _SlotReservation(
+                slot_name=slot_name, worktree_path=worktree_path, create_worktree=False
+            )
+
+    slot_num = find_next_available_slot(state, repo.worktrees_dir)
+    if slot_num is None:
+        return None
+    slot_name = generate_slot_name(slot_num)
+    return _SlotReservation(
+        slot_name=slot_name,
+        worktree_path=repo.worktrees_dir / slot_name,
+        create_worktree=True,
     )
 
+
+def _record_reservation(
+    ctx: ErkContext,
+    repo: RepoContext,
+    state: PoolState,
+    *,
+    reservation: _SlotReservation,
+    branch_name: str,
+) -> None:
+    new_assignment = SlotAssignment(
+        slot_name=reservation.slot_name,
+        branch_name=branch_name,
+        assigned_at=ctx.time.now().isoformat(),
+        worktree_path=reservation.worktree_path,
+    )
     new_state = PoolState(
         version=state.version,
         pool_size=state.pool_size,
         slots=state.slots,
-        assignments=new_assignments,
+        assignments=(*state.assignments, new_assignment),
     )
+    save_pool_state(repo.pool_json_path, new_state)
 
-    save_pool_state(pool_json_path, new_state)
+
+def _release_reservation(repo: RepoContext, reservation: _SlotReservation) -> None:
+    remove_slot_assignment(repo.pool_json_path, reservation.slot_name)
+
+
+def _prepare_reserved_worktree(
+    ctx: ErkContext,
+    repo: RepoContext,
+    *,
+    reservation: _SlotReservation,
+    branch_name: str,
+    cleanup_artifacts: bool,
+) -> SlotAllocationResult:
+    """Check out the branch in a reserved slot, outside the pool lock.
+
+    If git fails, the reservation is removed from pool.json so the slot is
+    not left assigned to a branch it does not hold.
+    """
+    worktree_path = reservation.worktree_path
+    # Error boundary: the slot is already recorded as taken, so a failed
+    # checkout must release it before the error propagates.
+    try:
+        if reservation.create_worktree:
+            worktree_path.mkdir(parents=True, exist_ok=True)
+            ctx.git.worktree.add_worktree(
+                repo.root,
+                worktree_path,
+                branch=branch_name,
+                ref=None,
+                create_branch=False,
+            )
+        else:
+            if cleanup_artifacts:
+                cleanup_worktree_artifacts(worktree_path)
+            ctx.branch_manager.checkout_branch(worktree_path, branch_name)
+    except Exception:
+        _release_reservation(repo, reservation)
+        raise
+
+    # Always regenerate activation script with latest template
+    write_worktree_activate_script(
+        worktree_path=worktree_path,
+        post_create_commands=None,
+    )
 
     return SlotAllocationResult(
-        slot_name=current_assignment.slot_name,
-        worktree_path=current_assignment.worktree_path,
-        already_assigned=True,
+        slot_name=reservation.slot_name,
+        worktree_path=worktree_path,
+        already_assigned=False,
+    )
+
+
+@dataclass(frozen=True)
+class _PoolFull:
+    """No slot was free when the allocation was decided; nothing was recorded."""
+
+    state: PoolState
+
+
+def _reserve_slot(
+    ctx: ErkContext,
+    repo: RepoContext,
+    branch_name: str,
+    *,
+    clean_inactive_slots: frozenset[str],
+    evict: SlotAssignment | None,
+) -> SlotAssignment | _SlotReservation | _PoolFull:
+    """Decide which slot the branch gets and record it in pool.json.
+
+    This is the only part of allocation that holds pool_state_lock(). Apart
+    from one `git worktree list`, it only reads and writes pool.json, so the
+    lock is held for milliseconds.
+
+    Returns:
+        The branch's existing assignment, a recorded reservation, or _PoolFull
+        when no slot is free and evict is no longer a current assignment
+    """
+    with pool_state_lock(repo.pool_json_path):
+        return _reserve_slot_locked(
+            ctx, repo, branch_name, clean_inactive_slots=clean_inactive_slots, evict=evict
+        )
+
+
+def _reserve_slot_locked(
+    ctx: ErkContext,
+    repo: RepoContext,
+    branch_name: str,
+    *,
+    clean_inactive_slots: frozenset[str],
+    evict: SlotAssignment | None,
+) -> SlotAssignment | _SlotReservation | _PoolFull:
+    """Body of _reserve_slot; the caller must hold pool_state_lock()."""
+    state = _load_or_create_pool_state(ctx, repo)
+
+    # Sync against a listing taken under the lock: a snapshot from before
+    # it could predate another process's reservation and revert it
+    worktrees = read_pool_worktrees(ctx.git, repo.root)
+    state = sync_pool_assignments(state, worktrees, repo.pool_json_path).state
+
+    existing = find_branch_assignment(state, branch_name)
+    if existing is not None:
+        return existing
+
+    reservation = _find_free_slot(
+        state, repo, worktrees=worktrees, clean_inactive_slots=clean_inactive_slots
+    )
+    if reservation is None:
+        # The user agreed to evict a specific assignment; if another
+        # process changed it meanwhile, ask again with the current state
+        if evict is None or evict not in state.assignments:
+            return _PoolFull(state=state)
+
+        state = PoolState(
+            version=state.version,
+            pool_size=state.pool_size,
+            slots=state.slots,
+            assignments=tuple(a for a in state.assignments if a != evict),
+        )
+        user_output(
+            click.style("✓ ", fg="green")
+            + f"Unassigned {click.style(evict.branch_name, fg='yellow')} "
+            + f"from {click.style(evict.slot_name, fg='cyan')}"
+        )
+
+        # Reuse the unassigned slot; recreate its worktree if the
+        # directory is gone (orphaned assignment)
+        reservation = _SlotReservation(
+            slot_name=evict.slot_name,
+            worktree_path=evict.worktree_path,
+            create_worktree=not evict.worktree_path.exists(),
+        )
+
+    _record_reservation(ctx, repo, state, reservation=reservation, branch_name=branch_name)
+    return reservation
+
+
+def claim_next_free_slot(
+    ctx: ErkContext,
+    repo: RepoContext,
+    branch_name: str,
+    *,
+    cleanup_artifacts: bool,
+) -> SlotAllocationResult | None:
+    """Claim a free pool slot for a branch without waiting, evicting or prompting.
+
+    Intended for parallel agents, which should retry later or give up rather
+    than queue on pool.json or take over another branch's slot. The lock is
+    only tried (LOCK_NB): if another process holds it, or every slot is
+    assigned, nothing is recorded and None is returned. The checkout of the
+    claimed slot runs after the lock is released.
+
+    The branch MUST already exist before calling this function.
+
+    Args:
+        ctx: Erk context
+        repo: Repository context with pool_json_path and worktrees_dir
+        branch_name: Name of existing branch to assign
+        cleanup_artifacts: Remove .erk/impl-context/ and .erk/scratch/ on worktree reuse
+
+    Returns:
+        SlotAllocationResult for the claimed (or already assigned) slot, or
+        None if the pool lock is busy or every slot is assigned
+    """
+    ensure_erk_metadata_dir(repo)
+    clean_inactive_slots = _find_clean_inactive_slots(
+        ctx,
+        repo,
+        worktrees=read_pool_worktrees(ctx.git, repo.root),
+        reuse_inactive_slots=True,
+    )
+
+    with try_pool_state_lock(repo.pool_json_path) as acquired:
+        if not acquired:
+            return None
+        decision = _reserve_slot_locked(
+            ctx, repo, branch_name, clean_inactive_slots=clean_inactive_slots, evict=None
+        )
+
+    if isinstance(decision, _PoolFull):
+        return None
+    if isinstance(decision, SlotAssignment):
+        return SlotAllocationResult(
+            slot_name=decision.slot_name,
+            worktree_path=decision.worktree_path,
+            already_assigned=True,
+        )
+    return _prepare_reserved_worktree(
+        ctx,
+        repo,
+        reservation=decision,
+        branch_name=branch_name,
+        cleanup_artifacts=cleanup_artifacts,
     )
 
 
@@ -517,6 +878,11 @@ def allocate_slot_for_branch(
     This is the unified slot allocation algorithm used by all commands
     that need to assign branches to pool slots.
 
+    The slot is chosen and recorded in pool.json while holding
+    pool_state_lock(), so concurrent allocations never pick the same slot.
+    Git status checks run before the lock is taken, and the pool-full prompt,
+    stale-assignment checkout and worktree setup run after it is released.
+
     The branch MUST already exist before calling this function.
 
     Args:
@@ -535,139 +901,47 @@ def allocate_slot_for_branch(
     """
     ensure_erk_metadata_dir(repo)
 
-    # Get pool size from config or default
-    pool_size = get_pool_size(ctx)
+    # Pre-lock listing for the inactive-slot status checks and for
+    # validating an existing assignment; sync re-lists under the lock
+    worktrees = read_pool_worktrees(ctx.git, repo.root)
+    clean_inactive_slots = _find_clean_inactive_slots(
+        ctx, repo, worktrees=worktrees, reuse_inactive_slots=reuse_inactive_slots
+    )
 
-    # Load or create pool state
-    state = load_pool_state(repo.pool_json_path)
-    if state is None:
-        state = PoolState(
-            version="1.0",
-            pool_size=pool_size,
-            slots=(),
-            assignments=(),
+    evict: SlotAssignment | None = None
+    while True:
+        decision = _reserve_slot(
+            ctx,
+            repo,
+            branch_name,
+            clean_inactive_slots=clean_inactive_slots,
+            evict=evict,
         )
+        if isinstance(decision, _SlotReservation):
+            return _prepare_reserved_worktree(
+                ctx,
+                repo,
+                reservation=decision,
+                branch_name=branch_name,
+                cleanup_artifacts=cleanup_artifacts,
+            )
+        if isinstance(decision, _PoolFull):
+            # Pool is full - handle interactively or with --force
+            evict = handle_pool_full_interactive(ctx.console, decision.state, force=force)
+            if evict is None:
+                raise SystemExit(1) from None
+            continue
 
-    # Sync pool assignments with actual git state before making decisions
-    sync_result = sync_pool_assignments(state, ctx.git, repo.pool_json_path)
-    state = sync_result.state
-
-    # Check if branch is already assigned
-    existing = find_branch_assignment(state, branch_name)
-    if existing is not None:
-        validation = _validate_existing_assignment(
+        result = _validate_existing_assignment(
             ctx,
-            state=state,
-            existing=existing,
+            existing=decision,
             branch_name=branch_name,
             repo_pool_json_path=repo.pool_json_path,
+            worktrees=worktrees,
         )
-        if validation.result is not None:
-            return validation.result
-        if validation.updated_state is not None:
-            state = validation.updated_state
-        # Fall through to normal allocation
-
-    # First, prefer reusing existing worktrees (fast path)
-    inactive_slot = None
-    if reuse_inactive_slots:
-        inactive_slot = find_inactive_slot(state, ctx.git, repo.root)
-
-    if inactive_slot is not None:
-        slot_name, worktree_path = inactive_slot
-        if cleanup_artifacts:
-            cleanup_worktree_artifacts(worktree_path)
-        ctx.branch_manager.checkout_branch(worktree_path, branch_name)
-    else:
-        # Fall back to on-demand slot creation
-        slot_num = find_next_available_slot(state, repo.worktrees_dir)
-        if slot_num is None:
-            # Pool is full - handle interactively or with --force
-            to_unassign = handle_pool_full_interactive(ctx.console, state, force=force)
-            if to_unassign is None:
-                raise SystemExit(1) from None
-
-            # Remove the assignment from state
-            new_assignments = tuple(
-                a for a in state.assignments if a.slot_name != to_unassign.slot_name
-            )
-            state = PoolState(
-                version=state.version,
-                pool_size=state.pool_size,
-                slots=state.slots,
-                assignments=new_assignments,
-            )
-            save_pool_state(repo.pool_json_path, state)
-            user_output(
-                click.style("✓ ", fg="green")
-                + f"Unassigned {click.style(to_unassign.branch_name, fg='yellow')} "
-                + f"from {click.style(to_unassign.slot_name, fg='cyan')}"
-            )
-
-            # Reuse the unassigned slot
-            slot_name = to_unassign.slot_name
-            worktree_path = to_unassign.worktree_path
-
-            # Check if worktree directory actually exists
-            if worktree_path.exists():
-                # Worktree exists - clean up and checkout
-                if cleanup_artifacts:
-                    cleanup_worktree_artifacts(worktree_path)
-                ctx.branch_manager.checkout_branch(worktree_path, branch_name)
-            else:
-                # Worktree doesn't exist (orphaned assignment) - create it
-                worktree_path.mkdir(parents=True, exist_ok=True)
-                ctx.git.worktree.add_worktree(
-                    repo.root,
-                    worktree_path,
-                    branch=branch_name,
-                    ref=None,
-                    create_branch=False,
-                )
-        else:
-            # Create new slot - no worktree exists yet
-            slot_name = generate_slot_name(slot_num)
-            worktree_path = repo.worktrees_dir / slot_name
-            worktree_path.mkdir(parents=True, exist_ok=True)
-            ctx.git.worktree.add_worktree(
-                repo.root,
-                worktree_path,
-                branch=branch_name,
-                ref=None,
-                create_branch=False,
-            )
-
-    # Always regenerate activation script with latest template
-    write_worktree_activate_script(
-        worktree_path=worktree_path,
-        post_create_commands=None,
-    )
-
-    # Create new assignment
-    now = ctx.time.now().isoformat()
-    new_assignment = SlotAssignment(
-        slot_name=slot_name,
-        branch_name=branch_name,
-        assigned_at=now,
-        worktree_path=worktree_path,
-    )
-
-    # Update state with new assignment
-    new_state = PoolState(
-        version=state.version,
-        pool_size=state.pool_size,
-        slots=state.slots,
-        assignments=(*state.assignments, new_assignment),
-    )
-
-    # Save state
-    save_pool_state(repo.pool_json_path, new_state)
-
-    return SlotAllocationResult(
-        slot_name=slot_name,
-        worktree_path=worktree_path,
-        already_assigned=False,
-    )
+        if result is not None:
+            return result
+        # Stale assignment removed - fall through to normal allocation
 
 
 def find_current_slot_assignment(state: PoolState, cwd: Path) -> SlotAssignment | None:
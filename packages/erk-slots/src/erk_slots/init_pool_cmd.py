@@ -9,6 +9,7 @@ from erk.core.worktree_pool import (
     PoolState,
     SlotInfo,
     load_pool_state,
+    pool_state_lock,
     save_pool_state,
 )
 from erk_shared.gateway.git.branch_ops.types import BranchAlreadyExists
@@ -139,17 +140,25 @@ def slot_init_pool(ctx: ErkContext, count: int | None, *, dry_run: bool) -> None
         else:
             user_output(f"  Initialized {slot_name}")
 
-    # Update and save state
-    new_state = PoolState(
-        version=state.version,
-        pool_size=state.pool_size,
-        slots=tuple(new_slots),
-        assignments=state.assignments,
-    )
+    # Record the new slots; pool.json is re-read under the lock so changes
+    # other erk processes made while the worktrees were created are kept
     if ctx.dry_run:
         user_output("[DRY RUN] Would save pool state")
     else:
-        save_pool_state(repo.pool_json_path, new_state)
+        with pool_state_lock(repo.pool_json_path):
+            current = load_pool_state(repo.pool_json_path)
+            if current is None:
+                current = state
+            recorded = {slot.name for slot in current.slots}
+            save_pool_state(
+                repo.pool_json_path,
+                PoolState(
+                    version=current.version,
+                    pool_size=current.pool_size,
+                    slots=(*current.slots, *(s for s in new_slots if s.name not in recorded)),
+                    assignments=current.assignments,
+                ),
+            )
 
     # Report results
     if initialized_count > 0:
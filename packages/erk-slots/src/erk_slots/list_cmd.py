@@ -12,6 +12,7 @@ from erk.core.display_utils import format_relative_time
 from erk.core.worktree_pool import PoolState, load_pool_state
 from erk_shared.cli_alias import alias
 from erk_shared.slots.naming import generate_slot_name
+from erk_slots.common import read_pool_worktrees
 from erk_slots.config import DEFAULT_POOL_SIZE
 
 SlotStatus = Literal["available", "assigned", "error"]
@@ -118,6 +119,9 @@ def slot_list(ctx: ErkContext) -> None:
         relative_time = format_relative_time(assignment.assigned_at)
         assignments_by_slot[assignment.slot_name] = (assignment.branch_name, relative_time)
 
+    # One worktree listing provides the actual branch of every slot
+    worktrees = read_pool_worktrees(ctx.git, repo.root)
+
     # Create Rich table
     table = Table(show_header=True, header_style="bold", box=None)
     table.add_column("Worktree", style="cyan", no_wrap=True)
@@ -141,8 +145,9 @@ def slot_list(ctx: ErkContext) -> None:
         worktree_exists = ctx.git.worktree.path_exists(worktree_path)
 
         actual_branch: str | None = None
-        if worktree_exists:
-            actual_branch = ctx.git.branch.get_current_branch(worktree_path)
+        worktree = worktrees.get(worktree_path)
+        if worktree_exists and worktree is not None:
+            actual_branch = worktree.branch
 
         # Get assigned branch info
         assigned_branch: str | None = None
@@ -41,19 +41,17 @@ class WorktreeLookupResult:
 
 
 def find_worktree_for_branch_or_path(
-    ctx: ErkContext,
     repo: RepoContext,
     branch: str,
     worktrees: list[WorktreeInfo],
 ) -> WorktreeLookupResult:
     """Find a worktree for a branch, falling back to path-based lookup.
 
-    First tries exact branch match via find_worktree_for_branch(). If no match,
+    First tries an exact branch match in the worktree list. If no match,
     computes the expected worktree path from the branch name and checks if any
     worktree exists at that path (regardless of what branch it has checked out).
 
     Args:
-        ctx: Erk context
         repo: Repository context (for worktrees_dir)
         branch: Branch name to find
         worktrees: List of worktrees from list_worktrees()
@@ -65,9 +63,9 @@ def find_worktree_for_branch_or_path(
         - needs_checkout=True means worktree exists at expected path but has different branch
     """
     # First try exact branch match
-    exact_path = ctx.git.worktree.find_worktree_for_branch(repo.root, branch)
-    if exact_path is not None:
-        return WorktreeLookupResult(path=exact_path, needs_checkout=False)
+    for wt in worktrees:
+        if wt.branch == branch:
+            return WorktreeLookupResult(path=wt.path, needs_checkout=False)
 
     # No exact match - compute expected path and check if worktree exists there
     expected_name = sanitize_worktree_name(branch)
@@ -81,6 +79,74 @@ def find_worktree_for_branch_or_path(
     return WorktreeLookupResult(path=None, needs_checkout=False)
 
 
+class StackNavigationIndex:
+    """Stack and worktree lookups for one navigation, each resolved once.
+
+    Every hop of `erk up`/`erk down` needs the worktree list, the trunk
+    branch and the stack neighbours of a branch. The index answers worktree
+    lookups from one `git worktree list` and stack neighbours from Graphite's
+    cached stack index (`Graphite.get_stack_index`), so walking several levels
+    of a stack spawns no further git processes per hop. Without a stack index
+    (Graphite disabled or nothing tracked) the branch manager's lookups are
+    memoized instead.
+    """
+
+    def __init__(self, ctx: ErkContext, repo: RepoContext) -> None:
+        self._ctx = ctx
+        self._repo = repo
+        self._worktrees = ctx.git.worktree.list_worktrees(repo.root)
+        self._stack = ctx.graphite.get_stack_index(ctx.git, repo.root)
+        self._parents: dict[str, str | None] = {}
+        self._children: dict[str, list[str]] = {}
+        self._trunk: str | None = None
+
+    @property
+    def worktrees(self) -> list[WorktreeInfo]:
+        """Worktrees of the repository, as of the last refresh."""
+        return self._worktrees
+
+    def refresh_worktrees(self) -> None:
+        """Re-read the worktree list after a navigation step allocated a slot."""
+        self._worktrees = self._ctx.git.worktree.list_worktrees(self._repo.root)
+
+    def parent_branch(self, branch: str) -> str | None:
+        """Parent of `branch` in the stack, or None if untracked or trunk."""
+        if self._stack is not None:
+            return self._stack.parents.get(branch)
+        if branch not in self._parents:
+            self._parents[branch] = self._ctx.branch_manager.get_parent_branch(
+                self._repo.root, branch
+            )
+        return self._parents[branch]
+
+    def child_branches(self, branch: str) -> list[str]:
+        """Children of `branch` in the stack."""
+        if self._stack is not None:
+            return list(self._stack.children.get(branch, ()))
+        if branch not in self._children:
+            self._children[branch] = self._ctx.branch_manager.get_child_branches(
+                self._repo.root, branch
+            )
+        return self._children[branch]
+
+    def trunk_branch(self) -> str:
+        """Detected trunk branch of the repository."""
+        if self._trunk is None:
+            self._trunk = self._ctx.git.branch.detect_trunk_branch(self._repo.root)
+        return self._trunk
+
+    def worktree_for_branch(self, branch: str) -> Path | None:
+        """Path of the worktree that has `branch` checked out, if any."""
+        for wt in self._worktrees:
+            if wt.branch == branch:
+                return wt.path
+        return None
+
+    def lookup(self, branch: str) -> WorktreeLookupResult:
+        """Find the worktree for `branch` (see find_worktree_for_branch_or_path)."""
+        return find_worktree_for_branch_or_path(self._repo, branch, self._worktrees)
+
+
 def get_slot_name_for_worktree(pool_json_path: Path, worktree_path: Path) -> str | None:
     """Get the slot name if the worktree is a pool slot.
 
@@ -174,9 +240,7 @@ def unallocate_worktree_and_branch(
 
     if assignment is not None:
         # Slot worktree: unassign instead of delete
-        # state is guaranteed to be non-None since assignment was found in it
-        assert state is not None
-        execute_unassign(ctx, repo, state, assignment)
+        execute_unassign(ctx, repo, assignment)
         ctx.branch_manager.delete_branch(main_repo_root, branch)
         user_output(click.style("✓", fg="green") + " Unassigned slot and deleted branch")
     else:
@@ -190,7 +254,7 @@ def unallocate_worktree_and_branch(
 
 
 def resolve_up_navigation(
-    ctx: ErkContext, repo: RepoContext, current_branch: str, worktrees: list[WorktreeInfo]
+    ctx: ErkContext, repo: RepoContext, current_branch: str, index: StackNavigationIndex
 ) -> tuple[str, bool]:
     """Resolve --up navigation to determine target branch name.
 
@@ -198,7 +262,7 @@ def resolve_up_navigation(
         ctx: Erk context
         repo: Repository context
         current_branch: Current branch name
-        worktrees: List of worktrees from git_ops.worktree.list_worktrees()
+        index: Stack and worktree lookups for this navigation
 
     Returns:
         Tuple of (target_branch, was_created)
@@ -210,7 +274,7 @@ def resolve_up_navigation(
     """
     # Navigate up to child branch
     children = Ensure.truthy(
-        ctx.branch_manager.get_child_branches(repo.root, current_branch),
+        index.child_branches(current_branch),
         "Already at the top of the stack (no child branches)",
     )
 
@@ -226,7 +290,7 @@ def resolve_up_navigation(
     target_branch = children[0]
 
     # Check if target branch has a worktree (or a worktree at expected path)
-    lookup = find_worktree_for_branch_or_path(ctx, repo, target_branch, worktrees)
+    lookup = index.lookup(target_branch)
     if lookup.path is not None:
         # Worktree exists (checkout will be handled by orchestrator if needed)
         return target_branch, False
@@ -235,6 +299,7 @@ def resolve_up_navigation(
     _worktree_path, already_existed = ensure_branch_has_worktree(
         ctx, repo, branch_name=target_branch, no_slot=False, force=False
     )
+    index.refresh_worktrees()
     return target_branch, not already_existed
 
 
@@ -243,8 +308,7 @@ def resolve_down_navigation(
     *,
     repo: RepoContext,
     current_branch: str,
-    worktrees: list[WorktreeInfo],
-    trunk_branch: str | None,
+    index: StackNavigationIndex,
 ) -> tuple[str, bool]:
     """Resolve --down navigation to determine target branch name.
 
@@ -252,8 +316,7 @@ def resolve_down_navigation(
         ctx: Erk context
         repo: Repository context
         current_branch: Current branch name
-        worktrees: List of worktrees from git_ops.worktree.list_worktrees()
-        trunk_branch: Configured trunk branch name, or None for auto-detection
+        index: Stack and worktree lookups for this navigation
 
     Returns:
         Tuple of (target_branch, was_created)
@@ -264,10 +327,10 @@ def resolve_down_navigation(
         SystemExit: If navigation fails (at bottom of stack)
     """
     # Navigate down to parent branch
-    parent_branch = ctx.branch_manager.get_parent_branch(repo.root, current_branch)
+    parent_branch = index.parent_branch(current_branch)
+    detected_trunk = index.trunk_branch()
     if parent_branch is None:
         # Check if we're already on trunk
-        detected_trunk = ctx.git.branch.detect_trunk_branch(repo.root)
         Ensure.invariant(
             current_branch != detected_trunk,
             f"Already at the bottom of the stack (on trunk branch '{detected_trunk}')",
@@ -280,13 +343,12 @@ def resolve_down_navigation(
         raise SystemExit(1)
 
     # Check if parent is the trunk - if so, switch to root
-    detected_trunk = ctx.git.branch.detect_trunk_branch(repo.root)
     if parent_branch == detected_trunk:
         # Trunk always belongs in the root worktree
         return "root", False
     else:
         # Parent is not trunk, check if it has a worktree (or one at expected path)
-        lookup = find_worktree_for_branch_or_path(ctx, repo, parent_branch, worktrees)
+        lookup = index.lookup(parent_branch)
         if lookup.path is not None:
             # Worktree exists (checkout will be handled by orchestrator if needed)
             return parent_branch, False
@@ -295,6 +357,7 @@ def resolve_down_navigation(
         _worktree_path, already_existed = ensure_branch_has_worktree(
             ctx, repo, branch_name=parent_branch, no_slot=False, force=False
         )
+        index.refresh_worktrees()
         return parent_branch, not already_existed
 
 
@@ -435,12 +498,12 @@ def execute_stack_navigation(
         ctx.git.branch.get_current_branch(ctx.cwd), "Not currently on a branch (detached HEAD)"
     )
 
-    # Get all worktrees
-    worktrees = ctx.git.worktree.list_worktrees(repo.root)
+    # Worktree list, trunk and stack neighbours, each resolved at most once
+    index = StackNavigationIndex(ctx, repo)
 
     # Direction-specific validation for --delete-current
     if direction == "up" and delete_current:
-        children = ctx.branch_manager.get_child_branches(repo.root, current_branch)
+        children = index.child_branches(current_branch)
         Ensure.invariant(
             len(children) > 0,
             "Cannot navigate up: already at top of stack. "
@@ -456,7 +519,7 @@ def execute_stack_navigation(
     current_worktree_path: Path | None = None
     if delete_current:
         current_worktree_path = Ensure.not_none(
-            ctx.git.worktree.find_worktree_for_branch(repo.root, current_branch),
+            index.worktree_for_branch(current_branch),
             f"Could not find worktree for branch '{current_branch}'",
         )
 
@@ -476,14 +539,13 @@ def execute_stack_navigation(
 
     for step in range(count):
         if direction == "up":
-            target_name, step_created = resolve_up_navigation(ctx, repo, target_name, worktrees)
+            target_name, step_created = resolve_up_navigation(ctx, repo, target_name, index)
         else:  # direction == "down"
             target_name, step_created = resolve_down_navigation(
                 ctx,
                 repo=repo,
                 current_branch=target_name,
-                worktrees=worktrees,
-                trunk_branch=ctx.trunk_branch,
+                index=index,
             )
             is_root = target_name == "root"
 
@@ -513,7 +575,7 @@ def execute_stack_navigation(
         slot_name = get_slot_name_for_worktree(repo.pool_json_path, current_worktree_path)
         use_graphite = ctx.global_config.use_graphite if ctx.global_config is not None else False
         is_current_root_wt = any(
-            wt.is_root and wt.path == current_worktree_path for wt in worktrees
+            wt.is_root and wt.path == current_worktree_path for wt in index.worktrees
         )
         deletion_commands = render_deferred_deletion_commands(
             worktree_path=current_worktree_path,
@@ -529,12 +591,12 @@ def execute_stack_navigation(
     if is_root:
         target_path = repo.main_repo_root if repo.main_repo_root else repo.root
         # Build checkout command when navigating to root with non-trunk branch
-        detected_trunk = ctx.git.branch.detect_trunk_branch(repo.root)
-        root_wt = next((wt for wt in worktrees if wt.is_root), None)
+        detected_trunk = index.trunk_branch()
+        root_wt = next((wt for wt in index.worktrees if wt.is_root), None)
         if root_wt is not None and root_wt.branch != detected_trunk:
             checkout_commands = [f"git checkout {shlex.quote(detected_trunk)}"]
     else:
-        lookup = find_worktree_for_branch_or_path(ctx, repo, target_name, worktrees)
+        lookup = index.lookup(target_name)
         target_path = Ensure.not_none(
             lookup.path,
             f"Branch '{target_name}' has no worktree. This should not happen.",
@@ -561,7 +623,7 @@ def execute_stack_navigation(
             ctx=ctx,
             repo=repo,
             target_path=target_path,
-            worktrees=worktrees,
+            worktrees=index.worktrees,
             deletion_commands=all_post_cd if all_post_cd else None,
             script=script,
             command_name=direction,
@@ -583,4 +645,5 @@ def execute_stack_navigation(
             source_branch=current_branch,
             force=force,
             is_root=is_root,
+            worktrees=index.worktrees,
         )
@@ -7,7 +7,7 @@ import click
 
 from erk.cli.core import discover_repo_context
 from erk.core.context import ErkContext
-from erk.core.worktree_pool import PoolState, SlotAssignment
+from erk.core.worktree_pool import PoolState, SlotAssignment, pool_state_lock
 from erk_shared.output.output import user_output
 from erk_slots.diagnostics import (
     SyncIssue,
@@ -121,11 +121,14 @@ def execute_repair(
         state: Current pool state
         stale_assignments: RepairableAssignment objects to remove
 
+    Only assignments equal to a stale one are removed, so a slot that was
+    reassigned since the diagnostics ran keeps its new assignment.
+
     Returns:
         New PoolState with stale assignments filtered out
     """
-    stale_slot_names = {ra.assignment.slot_name for ra in stale_assignments}
-    new_assignments = tuple(a for a in state.assignments if a.slot_name not in stale_slot_names)
+    stale = {ra.assignment for ra in stale_assignments}
+    new_assignments = tuple(a for a in state.assignments if a not in stale)
 
     return PoolState(
         version=state.version,
@@ -218,9 +221,6 @@ def slot_repair(ctx: ErkContext, force: bool, dry_run: bool) -> None:
             user_output("Aborted.")
             return
 
-    # Execute repair
-    new_state = execute_repair(state, stale_assignments)
-
     if dry_run:
         user_output("")
         user_output(
@@ -230,7 +230,14 @@ def slot_repair(ctx: ErkContext, force: bool, dry_run: bool) -> None:
         for ra in stale_assignments:
             user_output(f"  erk slot unassign {ra.assignment.slot_name}")
     else:
-        ctx.erk_installation.save_pool_state(repo.pool_json_path, new_state)
+        # Re-read pool.json under the lock so only the stale assignments are
+        # dropped and concurrent changes to other slots are kept
+        with pool_state_lock(repo.pool_json_path):
+            current = ctx.erk_installation.load_pool_state(repo.pool_json_path)
+            if current is None:
+                current = state
+            new_state = execute_repair(current, stale_assignments)
+            ctx.erk_installation.save_pool_state(repo.pool_json_path, new_state)
         user_output("")
         user_output(
             click.style("✓ ", fg="green") + f"Removed {len(stale_assignments)} stale assignment(s)"
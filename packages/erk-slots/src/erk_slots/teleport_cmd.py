@@ -323,7 +323,6 @@ def _execute_in_place_teleport(
         if current_assignment is not None:
             update_slot_assignment_tip(
                 repo.pool_json_path,
-                state,
                 current_assignment,
                 branch_name=plan.branch_name,
                 now=ctx.time.now().isoformat(),
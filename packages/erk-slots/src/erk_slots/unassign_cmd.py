@@ -12,11 +12,11 @@ from erk.core.worktree_pool import (
     PoolState,
     SlotAssignment,
     load_pool_state,
-    save_pool_state,
 )
 from erk_shared.gateway.git.branch_ops.types import BranchAlreadyExists
 from erk_shared.output.output import user_output
 from erk_shared.slots.naming import get_placeholder_branch_name
+from erk_slots.common import remove_slot_assignment
 
 
 @dataclass(frozen=True)
@@ -31,7 +31,6 @@ class UnassignResult:
 def execute_unassign(
     ctx: ErkContext,
     repo: RepoContext,
-    state: PoolState,
     assignment: SlotAssignment,
 ) -> UnassignResult:
     """Execute the unassign operation for a pool slot.
@@ -40,12 +39,12 @@ def execute_unassign(
     - Checking for uncommitted changes
     - Getting or creating placeholder branch
     - Checking out placeholder branch
-    - Removing assignment from pool state
+    - Removing assignment from pool state, re-read under the pool lock so
+      concurrent changes to other slots are kept
 
     Args:
         ctx: ErkContext with git operations
         repo: Repository context
-        state: Current pool state
         assignment: The assignment to remove
 
     Returns:
@@ -88,20 +87,11 @@ def execute_unassign(
     # Checkout placeholder branch in the worktree
     ctx.branch_manager.checkout_branch(assignment.worktree_path, placeholder_branch)
 
-    # Remove assignment from state (immutable update)
-    new_assignments = tuple(a for a in state.assignments if a.slot_name != assignment.slot_name)
-    new_state = PoolState(
-        version=state.version,
-        pool_size=state.pool_size,
-        slots=state.slots,
-        assignments=new_assignments,
-    )
-
-    # Save updated state (guard for dry-run mode)
+    # Remove assignment from pool.json (guard for dry-run mode)
     if ctx.dry_run:
         user_output("[DRY RUN] Would save pool state")
     else:
-        save_pool_state(repo.pool_json_path, new_state)
+        remove_slot_assignment(repo.pool_json_path, assignment.slot_name)
 
     return UnassignResult(
         branch_name=assignment.branch_name,
@@ -196,7 +186,7 @@ def slot_unassign(ctx: ErkContext, worktree: str | None) -> None:
             raise SystemExit(1) from None
 
     # Execute the unassign operation
-    result = execute_unassign(ctx, repo, state, assignment)
+    result = execute_unassign(ctx, repo, assignment)
 
     user_output(
         click.style("✓ ", fg="green")
@@ -5,6 +5,7 @@ from click.testing import CliRunner
 from erk.cli.cli import cli
 from erk.core.repo_discovery import RepoContext
 from erk.core.worktree_pool import PoolState, SlotAssignment, save_pool_state
+from erk_shared.gateway.git.abc import WorktreeInfo
 from tests.fakes.gateway.git import FakeGit
 from tests.fakes.gateway.graphite import FakeGraphite
 from tests.test_utils.env_helpers import erk_isolated_fs_env
@@ -127,8 +128,13 @@ def test_slot_list_shows_reason_column() -> None:
         worktree_path.mkdir(parents=True)
 
         git_ops = FakeGit(
-            worktrees=env.build_worktrees("main"),
-            current_branches={env.cwd: "main", worktree_path: "feature-xyz"},
+            worktrees={
+                env.cwd: [
+                    *env.build_worktrees("main")[env.cwd],
+                    WorktreeInfo(path=worktree_path, branch="feature-xyz"),
+                ]
+            },
+            current_branches={env.cwd: "main"},
             git_common_dirs={env.cwd: env.git_dir, worktree_path: env.git_dir},
         )
 
@@ -174,8 +180,13 @@ def test_slot_list_shows_dirty_for_uncommitted_changes() -> None:
         worktree_path.mkdir(parents=True)
 
         git_ops = FakeGit(
-            worktrees=env.build_worktrees("main"),
-            current_branches={env.cwd: "main", worktree_path: "feature-xyz"},
+            worktrees={
+                env.cwd: [
+                    *env.build_worktrees("main")[env.cwd],
+                    WorktreeInfo(path=worktree_path, branch="feature-xyz"),
+                ]
+            },
+            current_branches={env.cwd: "main"},
             git_common_dirs={env.cwd: env.git_dir, worktree_path: env.git_dir},
             file_statuses={worktree_path: (["staged.py"], [], [])},
         )
@@ -223,8 +234,13 @@ def test_slot_list_shows_exists_column() -> None:
         worktree_path.mkdir(parents=True)
 
         git_ops = FakeGit(
-            worktrees=env.build_worktrees("main"),
-            current_branches={env.cwd: "main", worktree_path: "feature-xyz"},
+            worktrees={
+                env.cwd: [
+                    *env.build_worktrees("main")[env.cwd],
+                    WorktreeInfo(path=worktree_path, branch="feature-xyz"),
+                ]
+            },
+            current_branches={env.cwd: "main"},
             git_common_dirs={env.cwd: env.git_dir, worktree_path: env.git_dir},
         )
 
@@ -277,8 +293,13 @@ def test_slot_list_healthy_when_branch_upstack_from_assigned() -> None:
         # Worktree has child branch "feature-xyz-child"
         # but pool.json says it's assigned to parent "feature-xyz"
         git_ops = FakeGit(
-            worktrees=env.build_worktrees("main"),
-            current_branches={env.cwd: "main", worktree_path: "feature-xyz-child"},
+            worktrees={
+                env.cwd: [
+                    *env.build_worktrees("main")[env.cwd],
+                    WorktreeInfo(path=worktree_path, branch="feature-xyz-child"),
+                ]
+            },
+            current_branches={env.cwd: "main"},
             git_common_dirs={env.cwd: env.git_dir, worktree_path: env.git_dir},
         )
 
@@ -320,3 +341,4 @@ def test_slot_list_healthy_when_branch_upstack_from_assigned() -> None:
         assert "assigned" in result.output
         # Should NOT show branch-mismatch error
         assert "branch-mismatch" not in result.output
+        assert "worktree-missing" not in result.output
@@ -66,6 +66,63 @@ def test_up_with_existing_worktree() -> None:
         assert str(repo_dir / "worktrees" / "feature-2") in script_content
 
 
+def test_up_multiple_levels_with_existing_worktrees() -> None:
+    """Test 'erk up 2' walks two levels of the stack in one navigation."""
+    runner = CliRunner()
+    with erk_inmem_env(runner) as env:
+        repo_dir = env.setup_repo_structure()
+
+        git_ops = FakeGit(
+            worktrees=env.build_worktrees(
+                "main", ["feature-1", "feature-2", "feature-3"], repo_dir=repo_dir
+            ),
+            current_branches={env.cwd: "feature-1"},
+            default_branches={env.cwd: "main"},
+            git_common_dirs={env.cwd: env.git_dir},
+        )
+
+        # Set up stack: main -> feature-1 -> feature-2 -> feature-3
+        graphite_ops = FakeGraphite(
+            branches={
+                "main": BranchMetadata.trunk("main", children=["feature-1"], commit_sha="abc123"),
+                "feature-1": BranchMetadata.branch(
+                    "feature-1", "main", children=["feature-2"], commit_sha="def456"
+                ),
+                "feature-2": BranchMetadata.branch(
+                    "feature-2", "feature-1", children=["feature-3"], commit_sha="ghi789"
+                ),
+                "feature-3": BranchMetadata.branch("feature-3", "feature-2", commit_sha="jkl012"),
+            }
+        )
+
+        repo = RepoContext(
+            root=env.cwd,
+            repo_name=env.cwd.name,
+            repo_dir=repo_dir,
+            worktrees_dir=repo_dir / "worktrees",
+            pool_json_path=repo_dir / "pool.json",
+        )
+
+        test_ctx = env.build_context(
+            git=git_ops, graphite=graphite_ops, repo=repo, use_graphite=True
+        )
+
+        result = runner.invoke(
+            cli, ["slot", "up", "2", "--script"], obj=test_ctx, catch_exceptions=False
+        )
+
+        assert result.exit_code == 0
+        assert str(repo_dir / "worktrees" / "feature-3") in result.stdout
+        assert git_ops.added_worktrees == []
+
+        # StackNavigationIndex lists worktrees once for the whole walk, reads
+        # the stack from one Graphite stack index, and an upward walk never
+        # needs the trunk branch
+        assert len(git_ops.worktree.list_worktrees_calls) == 1
+        assert len(graphite_ops.get_all_branches_calls) == 1
+        assert git_ops.branch.detect_trunk_branch_calls == []
+
+
 def test_up_at_top_of_stack() -> None:
     """Test 'erk up' navigation when at the top of stack (no children)."""
     runner = CliRunner()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Benchmark AnthropicApiPromptExecutor sequential vs batched throughput.
+
+Runs the same prompts against a local fake of the Messages API
+(tests/fakes/tests/anthropic_server.py), once with a concurrency of 1 and
+once with --concurrency, and reports wall time and prompts per second.
+
+Usage (from the repo root, so the fakes under tests/ are importable):
+    uv run python -m scripts.benchmark_anthropic_batch [--prompts 32] [--latency 0.2]
+"""
+
+import argparse
+import os
+import time
+
+from tests.fakes.gateway.time import FakeTime
+from tests.fakes.tests.anthropic_server import FakeAnthropicServer
+
+from erk.core.anthropic_prompt_executor import AnthropicApiPromptExecutor
+from erk_shared.core.prompt_executor import PromptRequest
+
+
+def main() -> None:
+    """Benchmark sequential vs batched execution against the fake server."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--prompts", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    os.environ.setdefault("ANTHROPIC_API_KEY", "sk-fake")
+    requests = [
+        PromptRequest(
+            prompt=f"prompt {index}",
+            model="haiku",
+            tools=None,
+            cwd=None,
+            system_prompt=None,
+            dangerous=False,
+        )
+        for index in range(args.prompts)
+    ]
+
+    with FakeAnthropicServer(latency_seconds=args.latency, rate_limited_requests=0) as server:
+        executor = AnthropicApiPromptExecutor(time=FakeTime(), base_url=server.base_url)
+
+        start = time.perf_counter()
+        executor.execute_prompts_batch(requests, max_concurrency=1)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        executor.execute_prompts_batch(requests, max_concurrency=args.concurrency)
+        batched = time.perf_counter() - start
+
+    print(f"{args.prompts} prompts, {args.latency:.2f}s latency per request")
+    print(f"  {'sequential:':<23}{sequential:6.2f}s ({args.prompts / sequential:6.1f}/s)")
+    label = f"batched (concurrency {args.concurrency}):"
+    print(f"  {label:<23}{batched:6.2f}s ({args.prompts / batched:6.1f}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark RealGitCommitOps.commit_files_to_branch for 1, 10, and 100 files.
+
+Creates a throwaway repository, commits N files to its main branch through the
+plumbing path, and reports wall time and git process count per commit.
+
+Usage:
+    uv run python scripts/benchmark_commit_files.py [ROUNDS]
+"""
+
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from erk_shared import subprocess_utils
+from erk_shared.gateway.git.commit_ops.real import RealGitCommitOps
+from erk_shared.gateway.time.real import RealTime
+
+FILE_COUNTS = (1, 10, 100)
+
+
+def _init_repo(repo: Path) -> None:
+    for cmd in (
+        ["git", "init", "-q", "-b", "main"],
+        ["git", "config", "user.email", "bench@example.com"],
+        ["git", "config", "user.name", "Bench"],
+        ["git", "commit", "-q", "--allow-empty", "-m", "init"],
+    ):
+        subprocess.run(cmd, cwd=repo, check=True)
+
+
+def main() -> None:
+    """Main entry point."""
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    commit_ops = RealGitCommitOps(RealTime())
+
+    process_count = 0
+    real_run = subprocess.run
+
+    def counting_run(*args, **kwargs):  # type: ignore[no-untyped-def]
+        nonlocal process_count
+        process_count += 1
+        return real_run(*args, **kwargs)
+
+    subprocess_utils.subprocess.run = counting_run  # type: ignore[assignment]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp)
+        _init_repo(repo)
+        print(f"{'files':>6} {'median ms':>10} {'processes':>10}")
+        for file_count in FILE_COUNTS:
+            timings: list[float] = []
+            for round_index in range(rounds):
+                files = {
+                    f"chunks/chunk-{i:03}.xml": f"<chunk round='{round_index}'>{i}</chunk>\n"
+                    for i in range(file_count)
+                }
+                process_count = 0
+                start = time.perf_counter()
+                commit_ops.commit_files_to_branch(
+                    repo, branch="main", files=files, message=f"{file_count} files"
+                )
+                timings.append((time.perf_counter() - start) * 1000)
+            print(f"{file_count:>6} {statistics.median(timings):>10.1f} {process_count:>10}")
+
+
+if __name__ == "__main__":
+    main()
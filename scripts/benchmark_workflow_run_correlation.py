@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark per-dispatch run polling against batched workflow run correlation.
+
+Dispatches workflows against a local stub of the GitHub dispatch and runs
+endpoints (tests/fakes/tests/workflow_runs_server.py), whose runs only
+become visible after a delay and sit behind older history, and reports wall
+time and request count for each strategy.
+
+Usage (from the repo root, so the fakes under tests/ are importable):
+    uv run python -m scripts.benchmark_workflow_run_correlation [--dispatches 20] [--history 300]
+"""
+
+import argparse
+import time
+from datetime import UTC, datetime
+
+from tests.fakes.tests.workflow_runs_server import FakeWorkflowRunsServer
+
+from erk_shared.gateway.http.real import RealHttpClient
+from erk_shared.gateway.remote_github.real import RealRemoteGitHub
+from erk_shared.gateway.time.real import RealTime
+
+
+def main() -> None:
+    """Benchmark per-dispatch polling vs batched run correlation."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--dispatches", type=int, default=20)
+    parser.add_argument("--history", type=int, default=300)
+    parser.add_argument("--visibility-delay", type=float, default=0.5)
+    args = parser.parse_args()
+
+    inputs = [{"pr_number": str(1000 + index)} for index in range(args.dispatches)]
+
+    def run(batched: bool) -> tuple[float, int]:
+        with FakeWorkflowRunsServer(
+            visibility_delay=args.visibility_delay, history=args.history
+        ) as server:
+            remote = RealRemoteGitHub(
+                http_client=RealHttpClient(token="fake", base_url=server.base_url),
+                time=RealTime(),
+            )
+            start = time.perf_counter()
+            if batched:
+                dispatched_at = datetime.now(UTC)
+                distinct_ids = [
+                    remote.start_workflow(
+                        owner="o", repo="r", workflow="wf.yml", ref="main", inputs=item
+                    )
+                    for item in inputs
+                ]
+                remote.resolve_workflow_runs(
+                    owner="o",
+                    repo="r",
+                    workflow="wf.yml",
+                    distinct_ids=distinct_ids,
+                    dispatched_at=dispatched_at,
+                )
+            else:
+                for item in inputs:
+                    remote.dispatch_workflow(
+                        owner="o", repo="r", workflow="wf.yml", ref="main", inputs=item
+                    )
+            elapsed = time.perf_counter() - start
+            return elapsed, server.dispatch_count + server.list_count
+
+    sequential, sequential_requests = run(batched=False)
+    batched, batched_requests = run(batched=True)
+
+    print(
+        f"{args.dispatches} dispatches, {args.history} older runs, "
+        f"{args.visibility_delay:.2f}s run visibility delay"
+    )
+    print(f"  {'per-dispatch polling:':<23}{sequential:6.2f}s, {sequential_requests} requests")
+    print(f"  {'batched correlation:':<23}{batched:6.2f}s, {batched_requests} requests")
+
+
+if __name__ == "__main__":
+    main()
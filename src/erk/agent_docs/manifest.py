@@ -0,0 +1,244 @@
+"""Sync manifest that makes `erk docs sync` incremental.
+
+Every sync reads all docs under docs/learned/, but most of the cost is in
+YAML parsing and in running prettier on each generated file. The manifest
+records content hashes from the previous sync so both can be skipped for
+anything that has not changed:
+
+- docs: rel_path -> SHA-256 of the doc content plus its validation result.
+  A doc whose hash matches reuses the stored frontmatter instead of being
+  re-parsed.
+- generated: rel_path -> SHA-256 of the unformatted generated content and
+  of the formatted output on disk. When the generated content is unchanged
+  and the file on disk still hashes to the recorded output, the file is in
+  sync and prettier is not run.
+
+Invalidation is purely content-based, so edits, branch switches, and hand
+edits to generated files are all detected. Cached validation results are also
+keyed by VALIDATION_RULES_VERSION, so bumping it re-validates every doc. The
+manifest is only a cache: a missing, truncated, or malformed file is treated
+as empty.
+"""
+
+import hashlib
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, cast
+
+from erk.agent_docs.models import (
+    AgentDocFrontmatter,
+    AgentDocValidationResult,
+    AuditResult,
+    Tripwire,
+)
+
+# Bump when the manifest layout changes
+DOCS_SYNC_MANIFEST_VERSION = 1
+
+# Bump when frontmatter, content, or tripwire validation in
+# erk.agent_docs.operations changes, so cached validation results are dropped
+VALIDATION_RULES_VERSION = 1
+
+
+@dataclass(frozen=True)
+class DocManifestEntry:
+    """Cached validation of one source doc.
+
+    Attributes:
+        content_sha256: Hash of the doc content the result was computed from.
+        result: Validation result for that content.
+    """
+
+    content_sha256: str
+    result: AgentDocValidationResult
+
+
+@dataclass(frozen=True)
+class GeneratedManifestEntry:
+    """Cached state of one generated file.
+
+    Attributes:
+        source_sha256: Hash of the generated content before formatting.
+        output_sha256: Hash of the formatted content written to disk.
+    """
+
+    source_sha256: str
+    output_sha256: str
+
+
+@dataclass(frozen=True)
+class DocsSyncManifest:
+    """Content hashes recorded by the previous sync.
+
+    Attributes:
+        docs: Cached validation per source doc, valid only for the
+            VALIDATION_RULES_VERSION the manifest was written with.
+        generated: Cached state per generated file.
+    """
+
+    docs: Mapping[str, DocManifestEntry]
+    generated: Mapping[str, GeneratedManifestEntry]
+
+
+EMPTY_DOCS_SYNC_MANIFEST = DocsSyncManifest(docs={}, generated={})
+
+
+def content_sha256(content: str) -> str:
+    """Return the hex SHA-256 of text content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _frontmatter_to_json(frontmatter: AgentDocFrontmatter) -> dict[str, Any]:
+    return {
+        "title": frontmatter.title,
+        "read_when": frontmatter.read_when,
+        "tripwires": [
+            {"action": t.action, "warning": t.warning, "pattern": t.pattern}
+            for t in frontmatter.tripwires
+        ],
+        "last_audited": frontmatter.last_audited,
+        "audit_result": frontmatter.audit_result,
+    }
+
+
+def _frontmatter_from_json(data: Any) -> AgentDocFrontmatter | None:
+    if not isinstance(data, dict):
+        return None
+    title = data.get("title")
+    read_when = data.get("read_when")
+    tripwires = data.get("tripwires")
+    last_audited = data.get("last_audited")
+    audit_result = data.get("audit_result")
+    if not (
+        isinstance(title, str)
+        and isinstance(read_when, list)
+        and isinstance(tripwires, list)
+        and (last_audited is None or isinstance(last_audited, str))
+        and (audit_result is None or isinstance(audit_result, str))
+    ):
+        return None
+    parsed_tripwires: list[Tripwire] = []
+    for tripwire in tripwires:
+        if not isinstance(tripwire, dict):
+            return None
+        action = tripwire.get("action")
+        warning = tripwire.get("warning")
+        pattern = tripwire.get("pattern")
+        if not (
+            isinstance(action, str)
+            and isinstance(warning, str)
+            and (pattern is None or isinstance(pattern, str))
+        ):
+            return None
+        parsed_tripwires.append(Tripwire(action=action, warning=warning, pattern=pattern))
+    return AgentDocFrontmatter(
+        title=title,
+        read_when=[str(item) for item in read_when],
+        tripwires=parsed_tripwires,
+        last_audited=last_audited,
+        audit_result=cast(AuditResult | None, audit_result),
+    )
+
+
+def _doc_entry_from_json(rel_path: str, entry: Any) -> DocManifestEntry | None:
+    if not isinstance(entry, dict):
+        return None
+    sha256 = entry.get("sha256")
+    errors = entry.get("errors")
+    frontmatter_data = entry.get("frontmatter")
+    if not isinstance(sha256, str) or not isinstance(errors, list):
+        return None
+    frontmatter = None
+    if frontmatter_data is not None:
+        frontmatter = _frontmatter_from_json(frontmatter_data)
+        if frontmatter is None:
+            return None
+    return DocManifestEntry(
+        content_sha256=sha256,
+        result=AgentDocValidationResult(
+            file_path=rel_path,
+            frontmatter=frontmatter,
+            errors=tuple(str(error) for error in errors),
+        ),
+    )
+
+
+def _generated_entry_from_json(entry: Any) -> GeneratedManifestEntry | None:
+    if not isinstance(entry, dict):
+        return None
+    source_sha256 = entry.get("source_sha256")
+    output_sha256 = entry.get("output_sha256")
+    if not isinstance(source_sha256, str) or not isinstance(output_sha256, str):
+        return None
+    return GeneratedManifestEntry(source_sha256=source_sha256, output_sha256=output_sha256)
+
+
+def parse_docs_sync_manifest(content: str | None) -> DocsSyncManifest:
+    """Parse manifest content written by serialize_docs_sync_manifest.
+
+    Args:
+        content: Manifest file content, or None if there is no manifest.
+
+    Returns:
+        The parsed manifest. An empty manifest is returned when there is
+        none, it was written by a different manifest version, or it cannot
+        be parsed; doc entries are dropped when they were recorded under a
+        different VALIDATION_RULES_VERSION.
+    """
+    if content is None:
+        return EMPTY_DOCS_SYNC_MANIFEST
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        return EMPTY_DOCS_SYNC_MANIFEST
+    if not isinstance(data, dict) or data.get("version") != DOCS_SYNC_MANIFEST_VERSION:
+        return EMPTY_DOCS_SYNC_MANIFEST
+    doc_entries = data.get("docs")
+    generated_entries = data.get("generated")
+    if not isinstance(doc_entries, dict) or not isinstance(generated_entries, dict):
+        return EMPTY_DOCS_SYNC_MANIFEST
+
+    docs: dict[str, DocManifestEntry] = {}
+    if data.get("rules_version") == VALIDATION_RULES_VERSION:
+        for rel_path, entry in doc_entries.items():
+            doc_entry = _doc_entry_from_json(rel_path, entry)
+            if doc_entry is None:
+                return EMPTY_DOCS_SYNC_MANIFEST
+            docs[rel_path] = doc_entry
+
+    generated: dict[str, GeneratedManifestEntry] = {}
+    for rel_path, entry in generated_entries.items():
+        generated_entry = _generated_entry_from_json(entry)
+        if generated_entry is None:
+            return EMPTY_DOCS_SYNC_MANIFEST
+        generated[rel_path] = generated_entry
+    return DocsSyncManifest(docs=docs, generated=generated)
+
+
+def serialize_docs_sync_manifest(manifest: DocsSyncManifest) -> str:
+    """Serialize a manifest to JSON with stable key order."""
+    payload = {
+        "version": DOCS_SYNC_MANIFEST_VERSION,
+        "rules_version": VALIDATION_RULES_VERSION,
+        "docs": {
+            rel_path: {
+                "sha256": entry.content_sha256,
+                "frontmatter": (
+                    _frontmatter_to_json(entry.result.frontmatter)
+                    if entry.result.frontmatter is not None
+                    else None
+                ),
+                "errors": list(entry.result.errors),
+            }
+            for rel_path, entry in sorted(manifest.docs.items())
+        },
+        "generated": {
+            rel_path: {
+                "source_sha256": entry.source_sha256,
+                "output_sha256": entry.output_sha256,
+            }
+            for rel_path, entry in sorted(manifest.generated.items())
+        },
+    }
+    return json.dumps(payload, indent=2) + "\n"
@@ -7,11 +7,20 @@ files with frontmatter metadata.
 import re
 from collections import defaultdict
 from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast, get_args
 
 import click
 
+from erk.agent_docs.manifest import (
+    DocManifestEntry,
+    DocsSyncManifest,
+    GeneratedManifestEntry,
+    content_sha256,
+    parse_docs_sync_manifest,
+    serialize_docs_sync_manifest,
+)
 from erk.agent_docs.models import (
     AgentDocFrontmatter,
     AgentDocValidationResult,
@@ -44,6 +53,9 @@ def resolve_docs_project_root(*, repo_root: Path, docs_path: str | None) -> Path
 
 AGENT_DOCS_DIR = "docs/learned"
 
+# Validation results are cached in the sync manifest. When changing any rule
+# below (this pattern, _validate_tripwires, validate_agent_doc_frontmatter,
+# validate_agent_doc_content), bump VALIDATION_RULES_VERSION in manifest.py.
 LAST_AUDITED_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2} PT$")
 
 # Category descriptions for root index generation.
@@ -296,6 +308,16 @@ def validate_agent_doc_content(rel_path: str, content: str) -> AgentDocValidatio
     )
 
 
+def _is_generated_doc_name(filename: str) -> bool:
+    """Return True for files that are always generated by sync."""
+    return filename == "index.md" or filename == "tripwires-index.md"
+
+
+def _is_generated_tripwires_doc(filename: str, content: str) -> bool:
+    """Return True for tripwires.md files carrying the auto-generated banner."""
+    return filename == "tripwires.md" and "AUTO-GENERATED FILE" in content
+
+
 def discover_agent_docs(agent_docs: AgentDocs, project_root: Path) -> list[str]:
     """Discover all markdown files in the agent docs directory.
 
@@ -316,40 +338,46 @@ def discover_agent_docs(agent_docs: AgentDocs, project_root: Path) -> list[str]:
     files: list[str] = []
     for rel_path in all_files:
         filename = Path(rel_path).name
-        # Skip auto-generated files (index.md, tripwires-index.md, tripwires.md)
-        if filename == "index.md":
-            continue
-        if filename == "tripwires-index.md":
+        # Skip auto-generated files (index.md, tripwires-index.md)
+        if _is_generated_doc_name(filename):
             continue
         # Skip auto-generated tripwires.md files (check for banner)
         if filename == "tripwires.md":
             content = agent_docs.read_file(project_root, rel_path)
-            if content is not None and "AUTO-GENERATED FILE" in content:
+            if content is not None and _is_generated_tripwires_doc(filename, content):
                 continue
         files.append(rel_path)
 
     return sorted(files)
 
 
-def validate_agent_docs(
-    agent_docs: AgentDocs, project_root: Path
-) -> list[AgentDocValidationResult]:
-    """Validate all agent documentation files in a project.
+@dataclass(frozen=True)
+class _DocsScan:
+    """Validation results from reading every source doc once.
 
-    Args:
-        agent_docs: Gateway for accessing docs/learned/ files.
-        project_root: Path to the project root.
-
-    Returns:
-        List of validation results for each file.
+    Attributes:
+        results: Validation result per source doc, sorted by path.
+        entries: Manifest entries for the docs that could be read.
     """
-    if not agent_docs.has_docs_dir(project_root):
-        return []
 
-    rel_paths = discover_agent_docs(agent_docs, project_root)
-    results: list[AgentDocValidationResult] = []
+    results: tuple[AgentDocValidationResult, ...]
+    entries: Mapping[str, DocManifestEntry]
 
-    for rel_path in rel_paths:
+
+def _scan_agent_docs(
+    agent_docs: AgentDocs, project_root: Path, *, manifest: DocsSyncManifest
+) -> _DocsScan:
+    """Read and validate each source doc, reusing manifest results for unchanged docs.
+
+    Each file is read exactly once: the auto-generated tripwires.md check uses
+    the same content that is hashed and validated.
+    """
+    results: list[AgentDocValidationResult] = []
+    entries: dict[str, DocManifestEntry] = {}
+    for rel_path in sorted(agent_docs.list_files(project_root)):
+        filename = Path(rel_path).name
+        if _is_generated_doc_name(filename):
+            continue
         content = agent_docs.read_file(project_root, rel_path)
         if content is None:
             results.append(
@@ -360,33 +388,53 @@ def validate_agent_docs(
                 )
             )
             continue
-        result = validate_agent_doc_content(rel_path, content)
-        results.append(result)
+        if _is_generated_tripwires_doc(filename, content):
+            continue
 
-    return results
+        digest = content_sha256(content)
+        entry = manifest.docs.get(rel_path)
+        if entry is None or entry.content_sha256 != digest:
+            entry = DocManifestEntry(
+                content_sha256=digest,
+                result=validate_agent_doc_content(rel_path, content),
+            )
+        entries[rel_path] = entry
+        results.append(entry.result)
 
+    return _DocsScan(results=tuple(results), entries=entries)
 
-def collect_tripwires(agent_docs: AgentDocs, project_root: Path) -> list[CollectedTripwire]:
-    """Collect all tripwires from agent documentation frontmatter.
+
+def _load_sync_manifest(agent_docs: AgentDocs, project_root: Path) -> DocsSyncManifest:
+    return parse_docs_sync_manifest(agent_docs.read_sync_manifest(project_root))
+
+
+def validate_agent_docs(
+    agent_docs: AgentDocs, project_root: Path
+) -> list[AgentDocValidationResult]:
+    """Validate all agent documentation files in a project.
+
+    Docs unchanged since the last sync reuse the validation result recorded
+    in the sync manifest.
 
     Args:
         agent_docs: Gateway for accessing docs/learned/ files.
         project_root: Path to the project root.
 
     Returns:
-        List of collected tripwires with their source documentation info.
+        List of validation results for each file.
     """
     if not agent_docs.has_docs_dir(project_root):
         return []
 
-    rel_paths = discover_agent_docs(agent_docs, project_root)
-    tripwires: list[CollectedTripwire] = []
+    manifest = _load_sync_manifest(agent_docs, project_root)
+    return list(_scan_agent_docs(agent_docs, project_root, manifest=manifest).results)
 
-    for rel_path in rel_paths:
-        content = agent_docs.read_file(project_root, rel_path)
-        if content is None:
-            continue
-        result = validate_agent_doc_content(rel_path, content)
+
+def _tripwires_from_results(
+    results: tuple[AgentDocValidationResult, ...],
+) -> list[CollectedTripwire]:
+    tripwires: list[CollectedTripwire] = []
+    for result in results:
         if not result.is_valid or result.frontmatter is None:
             continue
 
@@ -396,7 +444,7 @@ def collect_tripwires(agent_docs: AgentDocs, project_root: Path) -> list[Collect
                     action=tripwire.action,
                     warning=tripwire.warning,
                     pattern=tripwire.pattern,
-                    doc_path=rel_path,
+                    doc_path=result.file_path,
                     doc_title=result.frontmatter.title,
                 )
             )
@@ -404,6 +452,24 @@ def collect_tripwires(agent_docs: AgentDocs, project_root: Path) -> list[Collect
     return tripwires
 
 
+def collect_tripwires(agent_docs: AgentDocs, project_root: Path) -> list[CollectedTripwire]:
+    """Collect all tripwires from agent documentation frontmatter.
+
+    Args:
+        agent_docs: Gateway for accessing docs/learned/ files.
+        project_root: Path to the project root.
+
+    Returns:
+        List of collected tripwires with their source documentation info.
+    """
+    if not agent_docs.has_docs_dir(project_root):
+        return []
+
+    manifest = _load_sync_manifest(agent_docs, project_root)
+    scan = _scan_agent_docs(agent_docs, project_root, manifest=manifest)
+    return _tripwires_from_results(scan.results)
+
+
 def _get_category_from_path(doc_path: str) -> str | None:
     """Extract category from a doc path.
 
@@ -535,43 +601,25 @@ def generate_tripwires_index(
     return "\n".join(lines)
 
 
-def collect_valid_docs(
-    agent_docs: AgentDocs, project_root: Path
+def _organize_valid_docs(
+    results: tuple[AgentDocValidationResult, ...],
 ) -> tuple[list[DocInfo], list[CategoryInfo], int]:
-    """Collect all valid documentation files organized by category.
-
-    Args:
-        agent_docs: Gateway for accessing docs/learned/ files.
-        project_root: Path to the project root.
-
-    Returns:
-        Tuple of (uncategorized_docs, categories, invalid_count).
-    """
-    if not agent_docs.has_docs_dir(project_root):
-        return [], [], 0
-
-    rel_paths = discover_agent_docs(agent_docs, project_root)
     uncategorized: list[DocInfo] = []
     categories: dict[str, list[DocInfo]] = {}
     invalid_count = 0
 
-    for rel_path in rel_paths:
-        content = agent_docs.read_file(project_root, rel_path)
-        if content is None:
-            invalid_count += 1
-            continue
-        result = validate_agent_doc_content(rel_path, content)
+    for result in results:
         if not result.is_valid or result.frontmatter is None:
             invalid_count += 1
             continue
 
         doc_info = DocInfo(
-            rel_path=rel_path,
+            rel_path=result.file_path,
             frontmatter=result.frontmatter,
         )
 
         # Check if in subdirectory (category)
-        path_parts = Path(rel_path).parts
+        path_parts = Path(result.file_path).parts
         if len(path_parts) > 1:
             category = path_parts[0]
             if category not in categories:
@@ -592,6 +640,26 @@ def collect_valid_docs(
     return sorted(uncategorized, key=lambda d: d.rel_path), category_list, invalid_count
 
 
+def collect_valid_docs(
+    agent_docs: AgentDocs, project_root: Path
+) -> tuple[list[DocInfo], list[CategoryInfo], int]:
+    """Collect all valid documentation files organized by category.
+
+    Args:
+        agent_docs: Gateway for accessing docs/learned/ files.
+        project_root: Path to the project root.
+
+    Returns:
+        Tuple of (uncategorized_docs, categories, invalid_count).
+    """
+    if not agent_docs.has_docs_dir(project_root):
+        return [], [], 0
+
+    manifest = _load_sync_manifest(agent_docs, project_root)
+    scan = _scan_agent_docs(agent_docs, project_root, manifest=manifest)
+    return _organize_valid_docs(scan.results)
+
+
 def generate_root_index(
     uncategorized: list[DocInfo],
     categories: list[CategoryInfo],
@@ -671,87 +739,73 @@ def generate_category_index(category: CategoryInfo) -> str:
     return "\n".join(lines)
 
 
-def _update_index_file(
+def _update_generated_file(
     agent_docs: AgentDocs,
     project_root: Path,
     *,
     rel_path: str,
     content: str,
+    previous: GeneratedManifestEntry | None,
+    recorded: dict[str, GeneratedManifestEntry],
     created: list[str],
     updated: list[str],
     unchanged: list[str],
     dry_run: bool,
 ) -> None:
-    """Update an index file if content changed.
+    """Update a generated file if content changed.
+
+    When the unformatted content and the file on disk both match the previous
+    sync's manifest entry, the file is reported unchanged without running the
+    formatter. The manifest entry is only recorded once the file on disk holds
+    the formatted content, so a dry run never caches an out-of-sync file.
 
     Args:
         agent_docs: Gateway for accessing docs/learned/ files.
         project_root: Root of the project.
-        rel_path: Relative path under docs/learned/ (e.g., "architecture/index.md").
+        rel_path: Relative path under docs/learned/ (e.g., "architecture/tripwires.md").
         content: New content to write.
+        previous: Manifest entry for rel_path from the previous sync, if any.
+        recorded: Manifest entries for this sync, updated in place.
         created: List to append if file was created.
         updated: List to append if file was updated.
         unchanged: List to append if file was unchanged.
         dry_run: If True, don't actually write.
     """
-    # Format content with prettier before comparing or writing
-    formatted_content = agent_docs.format_markdown(content)
-
+    source_sha256 = content_sha256(content)
     existing = agent_docs.read_file(project_root, rel_path)
-    if existing is None:
-        if not dry_run:
-            agent_docs.write_file(project_root, rel_path, formatted_content)
-        created.append(rel_path)
-        return
-
-    if existing == formatted_content:
+    existing_sha256 = content_sha256(existing) if existing is not None else None
+
+    if (
+        previous is not None
+        and previous.source_sha256 == source_sha256
+        and previous.output_sha256 == existing_sha256
+    ):
+        recorded[rel_path] = previous
         unchanged.append(rel_path)
         return
 
-    if not dry_run:
-        agent_docs.write_file(project_root, rel_path, formatted_content)
-    updated.append(rel_path)
-
-
-def _update_generated_file(
-    agent_docs: AgentDocs,
-    project_root: Path,
-    *,
-    rel_path: str,
-    content: str,
-    created: list[str],
-    updated: list[str],
-    unchanged: list[str],
-    dry_run: bool,
-) -> None:
-    """Update a generated file if content changed.
-
-    Args:
-        agent_docs: Gateway for accessing docs/learned/ files.
-        project_root: Root of the project.
-        rel_path: Relative path under docs/learned/ (e.g., "architecture/tripwires.md").
-        content: New content to write.
-        created: List to append if file was created.
-        updated: List to append if file was updated.
-        unchanged: List to append if file was unchanged.
-        dry_run: If True, don't actually write.
-    """
     # Format content with prettier before comparing or writing
     formatted_content = agent_docs.format_markdown(content)
+    entry = GeneratedManifestEntry(
+        source_sha256=source_sha256,
+        output_sha256=content_sha256(formatted_content),
+    )
 
-    existing = agent_docs.read_file(project_root, rel_path)
     if existing is None:
         if not dry_run:
             agent_docs.write_file(project_root, rel_path, formatted_content)
+            recorded[rel_path] = entry
         created.append(rel_path)
         return
 
     if existing == formatted_content:
+        recorded[rel_path] = entry
         unchanged.append(rel_path)
         return
 
     if not dry_run:
         agent_docs.write_file(project_root, rel_path, formatted_content)
+        recorded[rel_path] = entry
     updated.append(rel_path)
 
 
@@ -768,6 +822,10 @@ def sync_agent_docs(
     each subdirectory (category) that contains 2+ docs. Also generates
     per-category tripwires.md files (e.g., architecture/tripwires.md).
 
+    Incremental: only docs whose content changed since the last sync are
+    re-parsed, and only generated files whose content or on-disk state
+    changed are re-formatted. See erk.agent_docs.manifest.
+
     Args:
         agent_docs: Gateway for accessing docs/learned/ files.
         project_root: Path to the project root.
@@ -787,9 +845,13 @@ def sync_agent_docs(
             tripwires_by_category=(),
         )
 
+    manifest = _load_sync_manifest(agent_docs, project_root)
+
     on_progress("Scanning docs...")
-    uncategorized, categories, invalid_count = collect_valid_docs(agent_docs, project_root)
+    scan = _scan_agent_docs(agent_docs, project_root, manifest=manifest)
+    uncategorized, categories, invalid_count = _organize_valid_docs(scan.results)
 
+    recorded: dict[str, GeneratedManifestEntry] = {}
     created: list[str] = []
     updated: list[str] = []
     unchanged: list[str] = []
@@ -797,11 +859,13 @@ def sync_agent_docs(
     # Generate root index
     on_progress("Generating root index...")
     root_content = generate_root_index(uncategorized, categories)
-    _update_index_file(
+    _update_generated_file(
         agent_docs,
         project_root,
         rel_path="index.md",
         content=root_content,
+        previous=manifest.generated.get("index.md"),
+        recorded=recorded,
         created=created,
         updated=updated,
         unchanged=unchanged,
@@ -815,11 +879,13 @@ def sync_agent_docs(
             continue
 
         category_content = generate_category_index(category)
-        _update_index_file(
+        _update_generated_file(
             agent_docs,
             project_root,
             rel_path=f"{category.name}/index.md",
             content=category_content,
+            previous=manifest.generated.get(f"{category.name}/index.md"),
+            recorded=recorded,
             created=created,
             updated=updated,
             unchanged=unchanged,
@@ -828,7 +894,7 @@ def sync_agent_docs(
 
     # Collect and generate per-category tripwire files
     on_progress("Collecting tripwires...")
-    tripwires = collect_tripwires(agent_docs, project_root)
+    tripwires = _tripwires_from_results(scan.results)
     tripwires_count = len(tripwires)
 
     tripwires_by_category = group_tripwires_by_category(tripwires)
@@ -843,6 +909,8 @@ def sync_agent_docs(
             project_root,
             rel_path=f"{category_name}/tripwires.md",
             content=tripwires_content,
+            previous=manifest.generated.get(f"{category_name}/tripwires.md"),
+            recorded=recorded,
             created=created,
             updated=updated,
             unchanged=unchanged,
@@ -866,12 +934,20 @@ def sync_agent_docs(
             project_root,
             rel_path="tripwires-index.md",
             content=tripwires_index_content,
+            previous=manifest.generated.get("tripwires-index.md"),
+            recorded=recorded,
             created=created,
             updated=updated,
             unchanged=unchanged,
             dry_run=dry_run,
         )
 
+    if not dry_run:
+        agent_docs.write_sync_manifest(
+            project_root,
+            serialize_docs_sync_manifest(DocsSyncManifest(docs=scan.entries, generated=recorded)),
+        )
+
     return SyncResult(
         created=tuple(created),
         updated=tuple(updated),
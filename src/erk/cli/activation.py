@@ -245,6 +245,10 @@ def write_worktree_activate_script(
 ) -> Path:
     """Write an activation script to .erk/bin/activate.sh in the worktree.
 
+    The file is only rewritten when the rendered content differs from what is
+    on disk, so repeated navigation to the same worktree leaves the script
+    (and its mtime, which direnv and shell hooks watch) untouched.
+
     The script will:
       - CD to the worktree root
       - Create .venv with `uv sync` if not present
@@ -272,6 +276,8 @@ def write_worktree_activate_script(
     bin_dir.mkdir(parents=True, exist_ok=True)
 
     script_path = bin_dir / "activate.sh"
+    if script_path.exists() and script_path.read_text(encoding="utf-8") == script_content:
+        return script_path
     script_path.write_text(script_content, encoding="utf-8")
 
     return script_path
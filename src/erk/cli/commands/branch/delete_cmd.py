@@ -209,10 +209,7 @@ def _handle_slot_worktree(
     """
     assert wt_info.slot_assignment is not None
 
-    state = load_pool_state(repo.pool_json_path)
-    assert state is not None  # Must exist since we found the assignment
-
-    execute_unassign(ctx, repo, state, wt_info.slot_assignment)
+    execute_unassign(ctx, repo, wt_info.slot_assignment)
     user_output(
         click.style("✓", fg="green")
         + f" Unassigned slot {click.style(wt_info.slot_assignment.slot_name, fg='cyan')}"
@@ -7,6 +7,7 @@ import click
 from erk.cli.commands.codespace.resolve import resolve_codespace
 from erk.core.context import ErkContext
 from erk_shared.context.types import NoRepoSentinel
+from erk_shared.gateway.codespace_registry.real import record_codespace_started
 
 
 def _build_export_prefix(env_vars: tuple[str, ...]) -> str:
@@ -98,5 +99,11 @@ def connect_codespace(
 
     click.echo(f"Connecting to codespace '{codespace.name}'...", err=True)
 
+    # gh codespace ssh starts a stopped codespace itself; record it so a
+    # follow-up remote run can skip its own start request
+    record_codespace_started(
+        ctx.erk_installation.get_codespaces_config_path(), codespace.name, ctx.time.now()
+    )
+
     # Replace current process with SSH session to codespace
     ctx.codespace.exec_ssh_interactive(codespace.gh_name, remote_command)
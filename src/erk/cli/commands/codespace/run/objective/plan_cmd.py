@@ -3,8 +3,9 @@
 import click
 
 from erk.cli.commands.codespace.resolve import resolve_codespace
-from erk.core.codespace_run import build_codespace_ssh_command
+from erk.core.codespace_run import build_codespace_ssh_command, is_codespace_warm
 from erk.core.context import ErkContext
+from erk_shared.gateway.codespace_registry.real import record_codespace_started
 
 
 @click.command("plan")
@@ -37,7 +38,8 @@ def run_plan(
     ISSUE_REF is an objective issue number or GitHub URL.
 
     Starts the codespace if stopped, then executes 'erk objective plan'
-    via SSH, streaming output to the terminal.
+    via SSH, streaming output to the terminal. The start request is skipped
+    when erk used the codespace within the last few minutes.
     """
     codespace = resolve_codespace(
         ctx.codespace_registry,
@@ -45,8 +47,16 @@ def run_plan(
         config_codespace_name=ctx.local_config.codespace_name,
     )
 
-    click.echo(f"Starting codespace '{codespace.name}'...", err=True)
-    ctx.codespace.start_codespace(codespace.gh_name)
+    warm = is_codespace_warm(
+        ctx.codespace_registry.get_last_started_at(codespace.name), now=ctx.time.now()
+    )
+    if warm:
+        click.echo(
+            f"Codespace '{codespace.name}' started recently; skipping start request", err=True
+        )
+    else:
+        click.echo(f"Starting codespace '{codespace.name}'...", err=True)
+        ctx.codespace.start_codespace(codespace.gh_name)
 
     flags = []
     if dangerous:
@@ -59,6 +69,12 @@ def run_plan(
         remote_erk_cmd,
         working_directory=ctx.local_config.codespace_working_directory,
     )
+
+    # exec_ssh_interactive replaces this process, so the start is recorded
+    # before handing off rather than after the session ends
+    record_codespace_started(
+        ctx.erk_installation.get_codespaces_config_path(), codespace.name, ctx.time.now()
+    )
     click.echo(
         f"Running '{remote_erk_cmd}' on '{codespace.name}'...",
         err=True,
@@ -34,7 +34,7 @@ import click
 
 from erk.artifacts.paths import get_bundled_github_dir
 from erk_shared.context.helpers import require_cwd, require_prompt_executor
-from erk_shared.core.prompt_executor import PromptExecutor
+from erk_shared.core.prompt_executor import PromptExecutor, PromptRequest
 from erk_shared.gateway.github.metadata.core import find_metadata_block
 from erk_shared.gateway.github.metadata.plan_header import (
     extract_plan_header_ci_summary_comment_id,
@@ -43,6 +43,9 @@ from erk_shared.gateway.github.metadata.plan_header import (
 from erk_shared.gateway.github.metadata.types import BlockKeys
 from erk_shared.subprocess_utils import run_subprocess_with_context
 
+# Concurrent summarization requests when the executor supports batching
+SUMMARY_CONCURRENCY = 8
+
 
 @dataclass(frozen=True)
 class FailingJob:
@@ -303,7 +306,7 @@ def _generate_all_summaries(
     executor: PromptExecutor,
     cwd: Path,
 ) -> None:
-    """Fetch failing jobs, summarize each, and output markers.
+    """Fetch failing jobs, summarize them as one prompt batch, and output markers.
 
     Outputs ERK-CI-SUMMARY markers to stdout and progress to stderr.
     If pr_number is provided, also posts summaries as a PR comment.
@@ -334,12 +337,11 @@ def _generate_all_summaries(
         return
 
     prompts_dir = get_bundled_github_dir()
-    collected_summaries: list[tuple[str, str]] = []
 
+    # Fetch all logs first so the summaries can be generated as one batch
+    prompts: list[str | None] = []
     for job in jobs:
-        click.echo(f"Summarizing: {job.name} (job {job.job_id})", err=True)
-
-        # Fetch job logs
+        click.echo(f"Fetching logs: {job.name} (job {job.job_id})", err=True)
         log_result = run_subprocess_with_context(
             cmd=[
                 "gh",
@@ -350,29 +352,44 @@ def _generate_all_summaries(
             cwd=cwd,
             check=False,
         )
-
         if log_result.returncode != 0 or not log_result.stdout.strip():
-            click.echo(f"=== ERK-CI-SUMMARY:{job.name} ===")
-            click.echo("(Log fetch failed)")
-            click.echo(f"=== /ERK-CI-SUMMARY:{job.name} ===")
+            prompts.append(None)
             continue
-
         log_content = _truncate_logs(log_result.stdout, max_lines=500)
-        prompt = _build_summary_prompt(
-            job_name=job.name,
-            log_content=log_content,
-            prompts_dir=prompts_dir,
+        prompts.append(
+            _build_summary_prompt(
+                job_name=job.name,
+                log_content=log_content,
+                prompts_dir=prompts_dir,
+            )
         )
 
-        prompt_result = executor.execute_prompt(
-            prompt,
+    requests = [
+        PromptRequest(
+            prompt=prompt,
             model="claude-haiku-4-5-20251001",
             tools=None,
             cwd=cwd,
             system_prompt=None,
             dangerous=False,
         )
+        for prompt in prompts
+        if prompt is not None
+    ]
+    click.echo(f"Summarizing {len(requests)} job(s)", err=True)
+    prompt_results = iter(
+        executor.execute_prompts_batch(requests, max_concurrency=SUMMARY_CONCURRENCY)
+    )
+
+    collected_summaries: list[tuple[str, str]] = []
+    for job, prompt in zip(jobs, prompts, strict=True):
+        if prompt is None:
+            click.echo(f"=== ERK-CI-SUMMARY:{job.name} ===")
+            click.echo("(Log fetch failed)")
+            click.echo(f"=== /ERK-CI-SUMMARY:{job.name} ===")
+            continue
 
+        prompt_result = next(prompt_results)
         if prompt_result.success and prompt_result.output and prompt_result.output.strip():
             summary = prompt_result.output.strip()
         else:
@@ -17,9 +17,12 @@ Usage:
     erk exec classify-pr-feedback
     erk exec classify-pr-feedback --pr 123
     erk exec classify-pr-feedback --include-resolved
+    erk exec classify-pr-feedback --since-cursor <review_threads_cursor>
 
 Output:
-    JSON with mechanically classified feedback (intermediate format for LLM)
+    JSON with mechanically classified feedback (intermediate format for LLM).
+    review_threads_cursor can be passed back via --since-cursor to classify
+    only review threads added since this run (see get-pr-feedback).
 
 Exit Codes:
     0: Success (or graceful error with JSON output)
@@ -36,6 +39,7 @@ from typing import Literal
 
 import click
 
+from erk.cli.commands.exec.scripts.get_pr_feedback import fetch_review_threads
 from erk.cli.script_output import exit_with_error
 from erk_shared.context.helpers import (
     get_current_branch,
@@ -113,6 +117,7 @@ class ClassificationResult:
     discussion_comments: tuple[ClassifiedDiscussionComment, ...]
     restructured_files: tuple[RestructuredFile, ...]
     mechanical_informational_count: int
+    review_threads_cursor: str | None
     error: str | None
 
 
@@ -354,6 +359,7 @@ def _classify_impl(
         discussion_comments=tuple(classified_discussion),
         restructured_files=restructured_files,
         mechanical_informational_count=mechanical_informational_count,
+        review_threads_cursor=None,  # Filled by caller
         error=None,
     )
 
@@ -402,8 +408,15 @@ def _get_restructured_files(*, repo_root: Path, trunk: str) -> tuple[Restructure
 @click.command(name="classify-pr-feedback")
 @click.option("--pr", type=int, default=None, help="PR number (defaults to current branch's PR)")
 @click.option("--include-resolved", is_flag=True, help="Include resolved review threads")
+@click.option(
+    "--since-cursor",
+    default=None,
+    help="Only classify review threads added after this review_threads_cursor",
+)
 @click.pass_context
-def classify_pr_feedback(ctx: click.Context, pr: int | None, include_resolved: bool) -> None:
+def classify_pr_feedback(
+    ctx: click.Context, pr: int | None, include_resolved: bool, since_cursor: str | None
+) -> None:
     """Classify PR review feedback mechanically before LLM processing.
 
     Fetches reviews, threads, and discussion comments, then applies deterministic
@@ -443,10 +456,12 @@ def classify_pr_feedback(ctx: click.Context, pr: int | None, include_resolved: b
             pr_details.number,
         )
         threads_future = executor.submit(
-            github.get_pr_review_threads,
+            fetch_review_threads,
+            github,
             repo_root,
             pr_details.number,
             include_resolved=include_resolved,
+            since_cursor=since_cursor,
         )
         comments_future = executor.submit(
             GitHubChecks.issue_comments,
@@ -458,7 +473,7 @@ def classify_pr_feedback(ctx: click.Context, pr: int | None, include_resolved: b
         reviews = reviews_future.result()
 
         try:
-            threads = threads_future.result()
+            threads, threads_cursor = threads_future.result()
         except RuntimeError as e:
             exit_with_error("github-api-failed", str(e))
 
@@ -486,6 +501,7 @@ def classify_pr_feedback(ctx: click.Context, pr: int | None, include_resolved: b
         discussion_comments=result.discussion_comments,
         restructured_files=result.restructured_files,
         mechanical_informational_count=result.mechanical_informational_count,
+        review_threads_cursor=threads_cursor,
         error=result.error,
     )
 
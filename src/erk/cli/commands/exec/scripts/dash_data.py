@@ -3,10 +3,12 @@
 Usage:
     erk exec dash-data [--state open|closed] [--label LABEL] [--limit N]
         [--show-prs/--no-show-prs] [--show-runs/--no-show-runs]
-        [--run-state STATE] [--creator USER]
+        [--run-state STATE] [--creator USER] [--stream]
 
 Output:
-    JSON with {success, plans, count}
+    JSON with {success, plans, count}, or with --stream one NDJSON line per
+    plan followed by a result line (see erk_shared.agentclick.ndjson).
+    Streamed plans are fetched page by page and written as each page arrives.
 
 Exit Codes:
     0: Success
@@ -17,10 +19,12 @@ import json
 
 import click
 
+from erk.cli.commands.pr.list.operation import STREAM_PAGE_SIZE
 from erk.cli.core import discover_repo_context
 from erk.core.repo_discovery import ensure_erk_metadata_dir
 from erk.tui.data.real_provider import RealPrDataProvider
 from erk.tui.data.types import PrFilters, serialize_pr_row
+from erk_shared.agentclick.ndjson import emit_ndjson_error, emit_ndjson_stream
 from erk_shared.context.helpers import require_context
 from erk_shared.gateway.github.types import GitHubRepoId, GitHubRepoLocation, IssueFilterState
 
@@ -33,6 +37,7 @@ from erk_shared.gateway.github.types import GitHubRepoId, GitHubRepoLocation, Is
 @click.option("--show-runs/--no-show-runs", default=False)
 @click.option("--run-state", default=None)
 @click.option("--creator", default=None)
+@click.option("--stream", is_flag=True, help="Emit plans as NDJSON lines as each page is fetched")
 @click.pass_context
 def dash_data(
     ctx: click.Context,
@@ -44,6 +49,7 @@ def dash_data(
     show_runs: bool,
     run_state: str | None,
     creator: str | None,
+    stream: bool,
 ) -> None:
     """Serialize plan dashboard data to JSON."""
     erk_ctx = require_context(ctx)
@@ -52,8 +58,10 @@ def dash_data(
     ensure_erk_metadata_dir(repo)
 
     if repo.github is None:
-        click.echo(
-            json.dumps({"success": False, "error": "Could not determine repository owner/name"})
+        _emit_error(
+            stream=stream,
+            error_type="repo_not_found",
+            message="Could not determine repository owner/name",
         )
         raise SystemExit(1)
 
@@ -64,7 +72,11 @@ def dash_data(
 
     http_client = erk_ctx.http_client
     if http_client is None:
-        click.echo(json.dumps({"success": False, "error": "GitHub authentication not available"}))
+        _emit_error(
+            stream=stream,
+            error_type="auth_required",
+            message="GitHub authentication not available",
+        )
         raise SystemExit(1)
 
     provider = RealPrDataProvider(
@@ -86,7 +98,19 @@ def dash_data(
         creator=creator,
     )
 
+    if stream:
+        rows = provider.iter_pr_rows(filters, page_size=STREAM_PAGE_SIZE)
+        if not emit_ndjson_stream(serialize_pr_row(row) for row in rows):
+            raise SystemExit(1)
+        return
+
     rows, _timings = provider.fetch_prs(filters)
     plans = [serialize_pr_row(row) for row in rows]
-
     click.echo(json.dumps({"success": True, "plans": plans, "count": len(plans)}))
+
+
+def _emit_error(*, stream: bool, error_type: str, message: str) -> None:
+    if stream:
+        emit_ndjson_error(error_type=error_type, message=message)
+        return
+    click.echo(json.dumps({"success": False, "error": message}))
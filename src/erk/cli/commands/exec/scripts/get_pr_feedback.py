@@ -7,9 +7,14 @@ Usage:
     erk exec get-pr-feedback
     erk exec get-pr-feedback --pr 123
     erk exec get-pr-feedback --include-resolved
+    erk exec get-pr-feedback --since-cursor <review_threads_cursor>
 
 Output:
-    JSON with pr_info, review_threads, and discussion_comments sections
+    JSON with pr_info, review_threads, and discussion_comments sections, plus
+    review_threads_cursor. Passing that cursor back via --since-cursor returns
+    only review threads added since this run, so polling loops on long-lived
+    PRs don't re-download every thread. Threads already seen are not
+    re-checked; run without --since-cursor for a full refresh.
 
 Exit Codes:
     0: Success (or graceful error with JSON output)
@@ -20,6 +25,7 @@ from __future__ import annotations
 
 import json
 from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TypedDict
 
 import click
@@ -31,6 +37,7 @@ from erk_shared.context.helpers import (
     require_issues,
     require_repo_root,
 )
+from erk_shared.gateway.github.abc import LocalGitHub
 from erk_shared.gateway.github.checks import GitHubChecks
 from erk_shared.gateway.github.issues.types import IssueComment
 from erk_shared.gateway.github.types import PRReview, PRReviewThread
@@ -112,15 +119,62 @@ def _format_discussion_comment(comment: IssueComment) -> DiscussionCommentDict:
     }
 
 
+# --- Fetching ---
+
+
+def fetch_review_threads(
+    github: LocalGitHub,
+    repo_root: Path,
+    pr_number: int,
+    *,
+    include_resolved: bool,
+    since_cursor: str | None,
+) -> tuple[list[PRReviewThread], str | None]:
+    """Fetch review threads page by page, optionally only those after a cursor.
+
+    Shared by get-pr-feedback and classify-pr-feedback so both report the
+    same threads and cursor semantics.
+
+    Args:
+        github: GitHub gateway
+        repo_root: Repository root
+        pr_number: PR whose threads to fetch
+        include_resolved: Include resolved threads
+        since_cursor: Only fetch threads added after this cursor, or None for all
+
+    Returns:
+        Tuple of (threads sorted by (path, line), cursor for the next
+        incremental fetch). The cursor is since_cursor unchanged when no
+        threads were added.
+    """
+    threads: list[PRReviewThread] = []
+    cursor = since_cursor
+    for page in github.iter_pr_review_thread_pages(
+        repo_root, pr_number, include_resolved=include_resolved, after=since_cursor
+    ):
+        threads.extend(page.threads)
+        if page.end_cursor is not None:
+            cursor = page.end_cursor
+    threads.sort(key=lambda t: (t.path, t.line or 0))
+    return threads, cursor
+
+
 # --- Command ---
 
 
 @click.command(name="get-pr-feedback")
 @click.option("--pr", type=int, default=None, help="PR number (defaults to current branch's PR)")
 @click.option("--include-resolved", is_flag=True, help="Include resolved review threads")
+@click.option(
+    "--since-cursor",
+    default=None,
+    help="Only return review threads added after this review_threads_cursor",
+)
 @click.pass_context
 @handle_non_ideal_exit
-def get_pr_feedback(ctx: click.Context, pr: int | None, include_resolved: bool) -> None:
+def get_pr_feedback(
+    ctx: click.Context, pr: int | None, include_resolved: bool, since_cursor: str | None
+) -> None:
     """Fetch all PR feedback in a single command.
 
     Combines review threads (GraphQL) and discussion comments (REST) into
@@ -150,10 +204,12 @@ def get_pr_feedback(ctx: click.Context, pr: int | None, include_resolved: bool)
             pr_details.number,
         )
         threads_future = executor.submit(
-            github.get_pr_review_threads,
+            fetch_review_threads,
+            github,
             repo_root,
             pr_details.number,
             include_resolved=include_resolved,
+            since_cursor=since_cursor,
         )
         comments_future = executor.submit(
             GitHubChecks.issue_comments,
@@ -165,7 +221,7 @@ def get_pr_feedback(ctx: click.Context, pr: int | None, include_resolved: bool)
         reviews = reviews_future.result()
 
         try:
-            threads = threads_future.result()
+            threads, threads_cursor = threads_future.result()
         except RuntimeError as e:
             exit_with_error("github-api-failed", str(e))
 
@@ -181,6 +237,7 @@ def get_pr_feedback(ctx: click.Context, pr: int | None, include_resolved: bool)
         "pr_title": pr_details.title,
         "reviews": [_format_review(r) for r in reviews],
         "review_threads": [_format_thread(t) for t in valid_threads],
+        "review_threads_cursor": threads_cursor,
         "discussion_comments": [_format_discussion_comment(c) for c in comments],
     }
     click.echo(json.dumps(result, indent=2))
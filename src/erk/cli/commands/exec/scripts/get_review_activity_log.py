@@ -62,12 +62,16 @@ def get_review_activity_log(
     repo_root = require_repo_root(ctx)
     github = require_github(ctx)
 
-    comments = github.fetch_pr_comments(repo_root, pr_number)
+    # Stream comments so pages after the marker comment are never fetched
     comment_body = None
-    for comment in comments:
-        if marker in comment.get("body", ""):
-            comment_body = comment["body"]
-            break
+    try:
+        for comment in github.iter_pr_comments(repo_root, pr_number):
+            if marker in comment.get("body", ""):
+                comment_body = comment["body"]
+                break
+    except RuntimeError:
+        # API failure reads as "not found" so callers' `|| true` flow continues
+        comment_body = None
 
     if comment_body is None:
         result = {"success": True, "found": False, "activity_log": ""}
@@ -31,8 +31,7 @@ from erk.cli.commands.exec.scripts.objective_post_action_comment import (
     _format_action_comment,
 )
 from erk.cli.commands.exec.scripts.update_objective_node import (
-    _find_node_refs,
-    _replace_node_refs_in_body,
+    _replace_nodes_refs_in_body,
 )
 from erk.cli.repo_resolution import get_remote_github
 from erk_shared.context.helpers import (
@@ -49,7 +48,11 @@ from erk_shared.gateway.github.issues.types import IssueNotFound
 from erk_shared.gateway.github.metadata.core import (
     extract_metadata_value,
 )
-from erk_shared.gateway.github.metadata.roadmap import rerender_comment_roadmap
+from erk_shared.gateway.github.metadata.roadmap import (
+    RoadmapNodeUpdate,
+    parse_roadmap,
+    rerender_comment_roadmap,
+)
 from erk_shared.gateway.github.metadata.types import BlockKeys
 from erk_shared.gateway.github.types import PRNotFound
 from erk_shared.gateway.remote_github.abc import RemoteGitHub
@@ -81,34 +84,33 @@ def _update_nodes_in_body(
 
     Returns the updated body and a list of node update records.
     """
-    node_updates: list[NodeUpdateDict] = []
-    updated_body = body
-
-    for node_id in matched_steps:
-        previous_pr, found = _find_node_refs(updated_body, node_id)
-        if not found:
-            continue
-
-        new_body = _replace_node_refs_in_body(
-            updated_body,
-            node_id,
-            new_pr=pr_ref,
-            explicit_status="done",
-            description=None,
-            slug=None,
-            comment=None,
-        )
-        if new_body is None:
-            continue
-
-        updated_body = new_body
-        node_updates.append(
-            NodeUpdateDict(
+    phases, _ = parse_roadmap(body)
+    previous_prs = {step.id: step.pr for phase in phases for step in phase.nodes}
+    found_steps = [node_id for node_id in matched_steps if node_id in previous_prs]
+    if not found_steps:
+        return body, []
+
+    updated_body = _replace_nodes_refs_in_body(
+        body,
+        [
+            RoadmapNodeUpdate(
                 node_id=node_id,
-                previous_pr=previous_pr,
+                pr=pr_ref,
+                status="done",
+                description=None,
+                slug=None,
+                comment=None,
             )
-        )
+            for node_id in found_steps
+        ],
+    )
+    if updated_body is None:
+        return body, []
 
+    node_updates = [
+        NodeUpdateDict(node_id=node_id, previous_pr=previous_prs[node_id])
+        for node_id in found_steps
+    ]
     return updated_body, node_updates
 
 
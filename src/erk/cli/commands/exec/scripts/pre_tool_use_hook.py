@@ -16,7 +16,6 @@ import sys
 
 import click
 
-from erk.core.capabilities.detection import is_reminder_installed
 from erk.hooks.decorators import HookContext, hook_command
 
 # ============================================================================
@@ -97,7 +96,7 @@ def pre_tool_use_hook(ctx: click.Context, *, hook_ctx: HookContext) -> None:
     if not is_python_file(file_path):
         return
 
-    if not is_reminder_installed(hook_ctx.repo_root, "dignified-python"):
+    if not hook_ctx.is_reminder_installed("dignified-python"):
         return
 
     click.echo(build_pretool_dignified_python_reminder())
@@ -8,6 +8,7 @@ This command is invoked via erk exec preprocess-session <log-path>.
 
 import json
 import tempfile
+from collections.abc import Callable
 from pathlib import Path
 
 import click
@@ -373,20 +374,9 @@ def deduplicate_assistant_messages(entries: list[dict]) -> list[dict]:
     return deduplicated
 
 
-def generate_compressed_xml(
-    entries: list[dict], source_label: str | None = None, enable_pruning: bool = True
-) -> str:
-    """Generate coarse-grained XML from filtered entries.
-
-    Args:
-        entries: List of session entries to convert to XML
-        source_label: Optional label for agent logs
-        enable_pruning: Whether to prune tool results (default: True)
-
-    Returns:
-        XML string representation of the session
-    """
-    xml_lines = ["<session>"]
+def _session_metadata_lines(entries: list[dict], source_label: str | None) -> list[str]:
+    """Return the <meta> lines that open a <session> for these entries."""
+    xml_lines: list[str] = []
 
     # Add source label if provided (for agent logs)
     if source_label:
@@ -407,134 +397,158 @@ def generate_compressed_xml(
             xml_lines.append(f'  <meta model="{escape_xml(model)}" />')
             break
 
-    for entry in entries:
-        entry_type = entry["type"]
-        message = entry.get("message", {})
+    return xml_lines
 
-        if entry_type == "summary":
-            if "summary" in message:
-                summary_text = message["summary"]
-            else:
-                summary_text = entry.get("summary", "")
-            if summary_text:
-                xml_lines.append(f"  <summary>{escape_xml(str(summary_text))}</summary>")
-
-        elif entry_type == "system":
-            subtype = entry.get("subtype", "")
-            duration_ms = entry.get("durationMs", "")
-            escaped_subtype = escape_xml(str(subtype))
-            escaped_duration = escape_xml(str(duration_ms))
-            xml_lines.append(
-                f'  <system subtype="{escaped_subtype}" duration_ms="{escaped_duration}" />'
-            )
 
-        elif entry_type == "user":
-            # Extract user content - may contain text and/or tool_result blocks
-            content = message.get("content", "")
-            if isinstance(content, list):
-                # Handle list of content blocks - separate text from tool_results
-                text_parts = []
-                tool_results = []
-                for block in content:
-                    if isinstance(block, dict):
-                        if block.get("type") == "text":
-                            text_parts.append(block.get("text", ""))
-                        elif block.get("type") == "tool_result":
-                            # Collect tool_result for separate output
-                            tool_results.append(block)
-                    elif isinstance(block, str):
-                        text_parts.append(block)
-
-                # Output user text content if any
-                if text_parts:
-                    text_content = "\n".join(text_parts)
-                    xml_lines.append(f"  <user>{escape_xml(text_content)}</user>")
-
-                # Output tool_results embedded in user messages
-                for tr_block in tool_results:
-                    tool_use_id = tr_block.get("tool_use_id", "")
-                    tr_content = tr_block.get("content", "")
-
-                    # Extract text from nested content
-                    if isinstance(tr_content, list):
-                        result_parts = []
-                        for item in tr_content:
-                            if isinstance(item, dict) and item.get("type") == "text":
-                                result_parts.append(item.get("text", ""))
-                            elif isinstance(item, str):
-                                result_parts.append(item)
-                        result_text = "\n".join(result_parts)
-                    else:
-                        result_text = str(tr_content)
-
-                    # Apply pruning if enabled
-                    if enable_pruning:
-                        result_text = prune_tool_result_content(result_text)
-
-                    xml_lines.append(f'  <tool_result tool="{escape_xml(tool_use_id)}">')
-                    xml_lines.append(escape_xml(result_text))
-                    xml_lines.append("  </tool_result>")
-            else:
-                # Simple string content
-                xml_lines.append(f"  <user>{escape_xml(content)}</user>")
+def _render_entry_lines(entry: dict, *, enable_pruning: bool) -> list[str]:
+    """Render one session entry as XML lines (without the session wrapper)."""
+    xml_lines: list[str] = []
+    entry_type = entry["type"]
+    message = entry.get("message", {})
 
-        elif entry_type == "assistant":
-            # Extract text and tool uses
-            content_blocks = message.get("content", [])
-            for content in content_blocks:
-                if content.get("type") == "text":
-                    text = content.get("text", "")
-                    if text.strip():  # Only include non-empty text
-                        xml_lines.append(f"  <assistant>{escape_xml(text)}</assistant>")
-                elif content.get("type") == "thinking":
-                    thinking_text = content.get("thinking", "")
-                    if thinking_text.strip():
-                        xml_lines.append(f"  <thinking>{escape_xml(thinking_text)}</thinking>")
-                elif content.get("type") == "tool_use":
-                    tool_name = content.get("name", "")
-                    tool_id = content.get("id", "")
-                    escaped_name = escape_xml(tool_name)
-                    escaped_id = escape_xml(tool_id)
-                    xml_lines.append(f'  <tool_use name="{escaped_name}" id="{escaped_id}">')
-                    input_params = content.get("input", {})
-                    for key, value in input_params.items():
-                        escaped_key = escape_xml(key)
-                        escaped_value = escape_xml(str(value))
-                        xml_lines.append(f'    <param name="{escaped_key}">{escaped_value}</param>')
-                    xml_lines.append("  </tool_use>")
-
-            # Emit usage metadata if present
-            usage = message.get("usage", {})
-            if usage:
-                parts = [f'{escape_xml(str(k))}="{escape_xml(str(v))}"' for k, v in usage.items()]
-                xml_lines.append(f"  <usage {' '.join(parts)} />")
-
-        elif entry_type == "tool_result":
-            # Handle tool results - apply pruning if enabled
-            content_blocks = message.get("content", [])
-            tool_use_id = message.get("tool_use_id", "")
+    if entry_type == "summary":
+        if "summary" in message:
+            summary_text = message["summary"]
+        else:
+            summary_text = entry.get("summary", "")
+        if summary_text:
+            xml_lines.append(f"  <summary>{escape_xml(str(summary_text))}</summary>")
+
+    elif entry_type == "system":
+        subtype = entry.get("subtype", "")
+        duration_ms = entry.get("durationMs", "")
+        escaped_subtype = escape_xml(str(subtype))
+        escaped_duration = escape_xml(str(duration_ms))
+        xml_lines.append(
+            f'  <system subtype="{escaped_subtype}" duration_ms="{escaped_duration}" />'
+        )
 
-            # Extract result content
-            result_parts = []
-            for block in content_blocks:
+    elif entry_type == "user":
+        # Extract user content - may contain text and/or tool_result blocks
+        content = message.get("content", "")
+        if isinstance(content, list):
+            # Handle list of content blocks - separate text from tool_results
+            text_parts = []
+            tool_results = []
+            for block in content:
                 if isinstance(block, dict):
                     if block.get("type") == "text":
-                        result_parts.append(block.get("text", ""))
-                    elif "text" in block:
-                        result_parts.append(block["text"])
+                        text_parts.append(block.get("text", ""))
+                    elif block.get("type") == "tool_result":
+                        # Collect tool_result for separate output
+                        tool_results.append(block)
                 elif isinstance(block, str):
-                    result_parts.append(block)
+                    text_parts.append(block)
+
+            # Output user text content if any
+            if text_parts:
+                text_content = "\n".join(text_parts)
+                xml_lines.append(f"  <user>{escape_xml(text_content)}</user>")
+
+            # Output tool_results embedded in user messages
+            for tr_block in tool_results:
+                tool_use_id = tr_block.get("tool_use_id", "")
+                tr_content = tr_block.get("content", "")
+
+                # Extract text from nested content
+                if isinstance(tr_content, list):
+                    result_parts = []
+                    for item in tr_content:
+                        if isinstance(item, dict) and item.get("type") == "text":
+                            result_parts.append(item.get("text", ""))
+                        elif isinstance(item, str):
+                            result_parts.append(item)
+                    result_text = "\n".join(result_parts)
+                else:
+                    result_text = str(tr_content)
 
-            result_text = "\n".join(result_parts)
+                # Apply pruning if enabled
+                if enable_pruning:
+                    result_text = prune_tool_result_content(result_text)
 
-            # Apply pruning if enabled
-            if enable_pruning:
-                result_text = prune_tool_result_content(result_text)
+                xml_lines.append(f'  <tool_result tool="{escape_xml(tool_use_id)}">')
+                xml_lines.append(escape_xml(result_text))
+                xml_lines.append("  </tool_result>")
+        else:
+            # Simple string content
+            xml_lines.append(f"  <user>{escape_xml(content)}</user>")
+
+    elif entry_type == "assistant":
+        # Extract text and tool uses
+        content_blocks = message.get("content", [])
+        for content in content_blocks:
+            if content.get("type") == "text":
+                text = content.get("text", "")
+                if text.strip():  # Only include non-empty text
+                    xml_lines.append(f"  <assistant>{escape_xml(text)}</assistant>")
+            elif content.get("type") == "thinking":
+                thinking_text = content.get("thinking", "")
+                if thinking_text.strip():
+                    xml_lines.append(f"  <thinking>{escape_xml(thinking_text)}</thinking>")
+            elif content.get("type") == "tool_use":
+                tool_name = content.get("name", "")
+                tool_id = content.get("id", "")
+                escaped_name = escape_xml(tool_name)
+                escaped_id = escape_xml(tool_id)
+                xml_lines.append(f'  <tool_use name="{escaped_name}" id="{escaped_id}">')
+                input_params = content.get("input", {})
+                for key, value in input_params.items():
+                    escaped_key = escape_xml(key)
+                    escaped_value = escape_xml(str(value))
+                    xml_lines.append(f'    <param name="{escaped_key}">{escaped_value}</param>')
+                xml_lines.append("  </tool_use>")
+
+        # Emit usage metadata if present
+        usage = message.get("usage", {})
+        if usage:
+            parts = [f'{escape_xml(str(k))}="{escape_xml(str(v))}"' for k, v in usage.items()]
+            xml_lines.append(f"  <usage {' '.join(parts)} />")
+
+    elif entry_type == "tool_result":
+        # Handle tool results - apply pruning if enabled
+        content_blocks = message.get("content", [])
+        tool_use_id = message.get("tool_use_id", "")
+
+        # Extract result content
+        result_parts = []
+        for block in content_blocks:
+            if isinstance(block, dict):
+                if block.get("type") == "text":
+                    result_parts.append(block.get("text", ""))
+                elif "text" in block:
+                    result_parts.append(block["text"])
+            elif isinstance(block, str):
+                result_parts.append(block)
+
+        result_text = "\n".join(result_parts)
+
+        # Apply pruning if enabled
+        if enable_pruning:
+            result_text = prune_tool_result_content(result_text)
+
+        xml_lines.append(f'  <tool_result tool="{escape_xml(tool_use_id)}">')
+        xml_lines.append(escape_xml(result_text))
+        xml_lines.append("  </tool_result>")
+
+    return xml_lines
 
-            xml_lines.append(f'  <tool_result tool="{escape_xml(tool_use_id)}">')
-            xml_lines.append(escape_xml(result_text))
-            xml_lines.append("  </tool_result>")
 
+def generate_compressed_xml(
+    entries: list[dict], source_label: str | None = None, enable_pruning: bool = True
+) -> str:
+    """Generate coarse-grained XML from filtered entries.
+
+    Args:
+        entries: List of session entries to convert to XML
+        source_label: Optional label for agent logs
+        enable_pruning: Whether to prune tool results (default: True)
+
+    Returns:
+        XML string representation of the session
+    """
+    xml_lines = ["<session>", *_session_metadata_lines(entries, source_label)]
+    for entry in entries:
+        xml_lines.extend(_render_entry_lines(entry, enable_pruning=enable_pruning))
     xml_lines.append("</session>")
     return "\n".join(xml_lines)
 
@@ -556,17 +570,36 @@ def process_log_file(
     Returns:
         Tuple of (filtered entries, total entries count, skipped entries count)
     """
-    entries = []
-    total_entries = 0
-    skipped_entries = 0
+    raw_entries = [
+        json.loads(line)
+        for line in log_path.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+    return filter_session_entries(
+        raw_entries, session_id=session_id, enable_filtering=enable_filtering
+    )
 
-    for line in log_path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
 
-        entry = json.loads(line)
-        total_entries += 1
+def filter_session_entries(
+    raw_entries: list[dict],
+    *,
+    session_id: str | None,
+    enable_filtering: bool,
+) -> tuple[list[dict], int, int]:
+    """Filter parsed JSONL entries down to the fields used for XML generation.
 
+    Args:
+        raw_entries: Parsed JSONL entries in file order
+        session_id: Optional session ID to filter entries by
+        enable_filtering: Whether to apply optimization filters
+
+    Returns:
+        Tuple of (filtered entries, total entries count, skipped entries count)
+    """
+    entries = []
+    skipped_entries = 0
+
+    for entry in raw_entries:
         # Filter by session ID if provided
         if session_id is not None:
             entry_session = entry.get("sessionId")
@@ -599,7 +632,7 @@ def process_log_file(
 
         entries.append(filtered)
 
-    return entries, total_entries, skipped_entries
+    return entries, len(raw_entries), skipped_entries
 
 
 def discover_agent_logs(session_log_path: Path, session_id: str) -> list[Path]:
@@ -618,7 +651,9 @@ def discover_agent_logs(session_log_path: Path, session_id: str) -> list[Path]:
     # Filter by session ID - check first entry of each file
     matching_logs = []
     for agent_log in all_agent_logs:
-        first_line = agent_log.read_text(encoding="utf-8").split("\n", 1)[0]
+        # Only the first line is needed; avoid reading large logs in full
+        with agent_log.open(encoding="utf-8") as f:
+            first_line = f.readline()
         if not first_line.strip():
             continue
         first_entry = json.loads(first_line)
@@ -732,17 +767,22 @@ def split_entries_to_chunks(
     max_tokens: int,
     source_label: str | None,
     enable_pruning: bool,
+    token_estimator: Callable[[str], int],
 ) -> list[str]:
     """Split entries into XML chunks that fit within token budget.
 
     Each chunk is a valid XML document with <session>...</session> wrapper.
-    Splitting happens at entry boundaries, never mid-entry.
+    Splitting happens at entry boundaries, never mid-entry. Every entry is
+    rendered once; chunks are assembled by concatenating rendered lines and
+    produce the same XML as generate_compressed_xml() on the chunk's entries.
 
     Args:
         entries: List of session entries to split
         max_tokens: Maximum tokens per chunk
         source_label: Optional label for agent logs (included in each chunk)
         enable_pruning: Whether to prune tool results
+        token_estimator: Returns the token count of a text fragment, e.g.
+            estimate_tokens or a tokenizer-backed counter
 
     Returns:
         List of XML strings, each under the token budget
@@ -755,41 +795,40 @@ def split_entries_to_chunks(
 
     chunks: list[str] = []
     current_entries: list[dict] = []
+    current_lines: list[str] = []
     current_tokens = 0
 
     # Estimate overhead for XML wrapper
-    wrapper_overhead = estimate_tokens("<session>\n</session>")
+    wrapper_overhead = token_estimator("<session>\n</session>")
     if source_label:
-        wrapper_overhead += estimate_tokens(f'  <meta source="{source_label}" />\n')
+        wrapper_overhead += token_estimator(f'  <meta source="{source_label}" />\n')
+
+    def finalize_chunk() -> None:
+        header = _session_metadata_lines(current_entries, source_label)
+        chunks.append("\n".join(["<session>", *header, *current_lines, "</session>"]))
 
     for entry in entries:
-        # Generate XML for this single entry to estimate size
-        single_xml = generate_compressed_xml(
-            [entry], source_label=None, enable_pruning=enable_pruning
-        )
-        # Extract just the entry content (without session wrapper)
-        entry_xml = single_xml.replace("<session>\n", "").replace("\n</session>", "")
-        entry_tokens = estimate_tokens(entry_xml)
+        entry_lines = _render_entry_lines(entry, enable_pruning=enable_pruning)
+        # Size the entry as it would appear alone in a session, including any
+        # branch/model metadata it carries. An entry that renders nothing is
+        # sized as the bare closing tag left over from stripping the wrapper.
+        sized_lines = [*_session_metadata_lines([entry], None), *entry_lines]
+        entry_tokens = token_estimator("\n".join(sized_lines) if sized_lines else "</session>")
 
         # Check if adding this entry would exceed budget
         if current_tokens + entry_tokens + wrapper_overhead > max_tokens and current_entries:
-            # Finalize current chunk
-            chunk_xml = generate_compressed_xml(
-                current_entries, source_label=source_label, enable_pruning=enable_pruning
-            )
-            chunks.append(chunk_xml)
+            finalize_chunk()
             current_entries = []
+            current_lines = []
             current_tokens = 0
 
         current_entries.append(entry)
+        current_lines.extend(entry_lines)
         current_tokens += entry_tokens
 
     # Finalize last chunk
     if current_entries:
-        chunk_xml = generate_compressed_xml(
-            current_entries, source_label=source_label, enable_pruning=enable_pruning
-        )
-        chunks.append(chunk_xml)
+        finalize_chunk()
 
     return chunks
 
@@ -966,6 +1005,7 @@ def preprocess_session(
                 max_tokens=max_tokens,
                 source_label=source_label,
                 enable_pruning=enable_filtering,
+                token_estimator=estimate_tokens,
             )
             xml_sections.extend(chunks)
     else:
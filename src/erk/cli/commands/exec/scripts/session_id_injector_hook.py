@@ -8,6 +8,7 @@ This command is invoked via erk exec session-id-injector-hook.
 import click
 
 from erk.hooks.decorators import HookContext, hook_command
+from erk.hooks.state import record_session_id
 from erk_shared.gateway.erk_installation.real import RealErkInstallation
 
 
@@ -39,9 +40,8 @@ def session_id_injector_hook(ctx: click.Context, *, hook_ctx: HookContext) -> No
     # Output session ID if available
     if hook_ctx.session_id is not None:
         # Write to file for CLI tools to read (worktree-scoped persistence)
-        session_file = hook_ctx.repo_root / ".erk" / "scratch" / "current-session-id"
-        session_file.parent.mkdir(parents=True, exist_ok=True)
-        session_file.write_text(hook_ctx.session_id, encoding="utf-8")
+        if hook_ctx.hook_state is not None:
+            record_session_id(hook_ctx.hook_state, hook_ctx.session_id)
 
         # Still output reminder for LLM context
         click.echo(f"📌 session: {hook_ctx.session_id}")
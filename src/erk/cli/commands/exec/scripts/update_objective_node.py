@@ -68,10 +68,11 @@ from erk_shared.gateway.github.metadata.plan_header import (
 )
 from erk_shared.gateway.github.metadata.roadmap import (
     RoadmapNodeStatus,
+    RoadmapNodeUpdate,
     parse_roadmap,
     render_objective_roadmap_block,
     rerender_comment_roadmap,
-    update_node_in_frontmatter,
+    update_nodes_in_frontmatter,
 )
 from erk_shared.gateway.github.metadata.types import BlockKeys
 from erk_shared.gateway.github.types import BodyText
@@ -231,20 +232,6 @@ def _build_output(
     )
 
 
-def _find_node_refs(body: str, node_id: str) -> tuple[str | None, bool]:
-    """Find the current PR value for a node in the roadmap body.
-
-    Returns:
-        (previous_pr, found)
-    """
-    phases, _ = parse_roadmap(body)
-    for phase in phases:
-        for step in phase.nodes:
-            if step.id == node_id:
-                return step.pr, True
-    return None, False
-
-
 def _replace_node_refs_in_body(
     body: str,
     node_id: str,
@@ -271,7 +258,39 @@ def _replace_node_refs_in_body(
     Returns:
         Updated body string, or None if the node row was not found.
     """
-    # Check for frontmatter-aware path
+    return _replace_nodes_refs_in_body(
+        body,
+        [
+            RoadmapNodeUpdate(
+                node_id=node_id,
+                pr=new_pr,
+                status=(
+                    cast(RoadmapNodeStatus, explicit_status)
+                    if explicit_status is not None
+                    else None
+                ),
+                description=description,
+                slug=slug,
+                comment=comment,
+            )
+        ],
+    )
+
+
+def _replace_nodes_refs_in_body(body: str, updates: list[RoadmapNodeUpdate]) -> str | None:
+    """Apply several node updates to the raw markdown body in one pass.
+
+    Extracts the objective-roadmap block once, applies every update to the
+    parsed frontmatter in memory, and renders the block back once.
+
+    Args:
+        body: Full issue body text.
+        updates: Node updates to apply, in order.
+
+    Returns:
+        Updated body string, or None if the roadmap block is missing or any
+        node was not found.
+    """
     raw_blocks = extract_raw_metadata_blocks(body)
     roadmap_block = None
     for block in raw_blocks:
@@ -282,15 +301,7 @@ def _replace_node_refs_in_body(
     if roadmap_block is None:
         return None
 
-    updated_block_content = update_node_in_frontmatter(
-        roadmap_block.body,
-        node_id,
-        pr=new_pr,
-        status=cast(RoadmapNodeStatus, explicit_status) if explicit_status is not None else None,
-        description=description,
-        slug=slug,
-        comment=comment,
-    )
+    updated_block_content = update_nodes_in_frontmatter(roadmap_block.body, updates)
 
     if updated_block_content is None:
         return None
@@ -470,39 +481,26 @@ def update_objective_node(
         click.echo(json.dumps(output.to_dict()))
         raise SystemExit(0)
 
-    # Process multiple nodes with single API call
-    results: list[UpdateObjectiveNodeResult] = []
-    updated_body = issue.body
-    any_failure = False
-
-    for node_id in node:
-        previous_pr, found = _find_node_refs(updated_body, node_id)
-        if not found:
-            results.append(UpdateObjectiveNodeResult.fail(node_id=node_id, error="node_not_found"))
-            any_failure = True
-            continue
-
-        new_body = _replace_node_refs_in_body(
-            updated_body,
-            node_id,
-            new_pr=pr_ref,
-            explicit_status=explicit_status,
+    # Apply all node updates in memory with a single roadmap parse and render
+    previous_prs = {step.id: step.pr for phase in phases for step in phase.nodes}
+    status = cast(RoadmapNodeStatus, explicit_status) if explicit_status is not None else None
+    updates = [
+        RoadmapNodeUpdate(
+            node_id=node_id,
+            pr=pr_ref,
+            status=status,
             description=new_description,
             slug=new_slug,
             comment=new_comment,
         )
-        if new_body is None:
-            results.append(
-                UpdateObjectiveNodeResult.fail(node_id=node_id, error="replacement_failed")
-            )
-            any_failure = True
-            continue
-
-        updated_body = new_body
-        results.append(UpdateObjectiveNodeResult.ok(node_id=node_id, previous_pr=previous_pr))
-
-    # Exit early if all nodes failed
-    if any_failure and not any(r.success for r in results):
+        for node_id in node
+    ]
+    new_body = _replace_nodes_refs_in_body(issue.body, updates)
+    if new_body is None:
+        results = [
+            UpdateObjectiveNodeResult.fail(node_id=node_id, error="replacement_failed")
+            for node_id in node
+        ]
         output = _build_output(
             issue_number=issue_number,
             node=node,
@@ -516,6 +514,12 @@ def update_objective_node(
         click.echo(json.dumps(output.to_dict()))
         raise SystemExit(0)
 
+    updated_body = new_body
+    results = [
+        UpdateObjectiveNodeResult.ok(node_id=node_id, previous_pr=previous_prs[node_id])
+        for node_id in node
+    ]
+
     # Single API call to write all updates
     github.update_issue_body(repo_root, issue_number, BodyText(content=updated_body))
 
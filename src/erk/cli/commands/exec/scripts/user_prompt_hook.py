@@ -15,12 +15,10 @@ This command is invoked via:
     ERK_HOOK_ID=user-prompt-hook erk exec user-prompt-hook
 """
 
-from pathlib import Path
-
 import click
 
-from erk.core.capabilities.detection import is_reminder_installed
 from erk.hooks.decorators import HookContext, hook_command
+from erk.hooks.state import record_session_id
 
 # ============================================================================
 # Pure Functions for Output Building
@@ -71,19 +69,16 @@ Read relevant docs before exploring raw files. Then explore codebase as necessar
 # ============================================================================
 
 
-def _persist_session_id(repo_root: Path, session_id: str | None) -> None:
-    """Write session ID to file.
+def _persist_session_id(hook_ctx: HookContext) -> None:
+    """Write session ID to file, skipping the write when it is unchanged.
 
     Args:
-        repo_root: Path to the git repository root.
-        session_id: The current session ID, or None if not available.
+        hook_ctx: Hook context carrying the session ID and cached hook state.
     """
-    if session_id is None:
+    if hook_ctx.session_id is None or hook_ctx.hook_state is None:
         return
 
-    session_file = repo_root / ".erk" / "scratch" / "current-session-id"
-    session_file.parent.mkdir(parents=True, exist_ok=True)
-    session_file.write_text(session_id, encoding="utf-8")
+    record_session_id(hook_ctx.hook_state, hook_ctx.session_id)
 
 
 # ============================================================================
@@ -106,19 +101,19 @@ def user_prompt_hook(ctx: click.Context, *, hook_ctx: HookContext) -> None:
         return
 
     # Persist session ID
-    _persist_session_id(hook_ctx.repo_root, hook_ctx.session_id)
+    _persist_session_id(hook_ctx)
 
     # Build context parts - session context is always included
     context_parts = [build_session_context(hook_ctx.session_id)]
 
     # Add reminders based on installed capabilities
-    if is_reminder_installed(hook_ctx.repo_root, "devrun"):
+    if hook_ctx.is_reminder_installed("devrun"):
         context_parts.append(build_devrun_reminder())
 
-    if is_reminder_installed(hook_ctx.repo_root, "tripwires"):
+    if hook_ctx.is_reminder_installed("tripwires"):
         context_parts.append(build_tripwires_reminder())
 
-    if is_reminder_installed(hook_ctx.repo_root, "explore-docs"):
+    if hook_ctx.is_reminder_installed("explore-docs"):
         context_parts.append(build_explore_docs_reminder())
 
     click.echo("\n".join(p for p in context_parts if p))
@@ -99,8 +99,8 @@ def _validate_credentials_impl(
             message="Neither CLAUDE_CODE_OAUTH_TOKEN nor ANTHROPIC_API_KEY is set",
         )
 
-    # Validate by making a minimal API call
-    result = prompt_executor.execute_prompt(
+    # Validate by making a minimal API call (never answered from the prompt cache)
+    result = prompt_executor.uncached().execute_prompt(
         "respond with ok",
         model="haiku",
         tools=None,
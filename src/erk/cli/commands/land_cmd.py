@@ -329,14 +329,13 @@ def _cleanup_no_worktree(cleanup: CleanupContext) -> None:
 def _cleanup_slot_with_assignment(
     cleanup: CleanupContext,
     *,
-    state: PoolState,
     assignment: SlotAssignment,
 ) -> None:
     """Handle cleanup for slot worktree with assignment: unassign and delete branch."""
     if not cleanup.cleanup_confirmed:
         user_output("Slot preserved. Branch still exists locally.")
         return
-    execute_unassign(cleanup.ctx, cleanup.repo, state, assignment)
+    execute_unassign(cleanup.ctx, cleanup.repo, assignment)
     # Defensive: ensure branch is released before deletion
     # (handles stale pool state where worktree_path doesn't match actual location)
     _ensure_branch_not_checked_out(
@@ -509,13 +508,8 @@ def _cleanup_landed_branch(cleanup: CleanupContext) -> None:
         case CleanupType.NO_WORKTREE:
             _cleanup_no_worktree(cleanup)
         case CleanupType.SLOT_ASSIGNED:
-            assert resolved.pool_state is not None
             assert resolved.assignment is not None
-            _cleanup_slot_with_assignment(
-                cleanup,
-                state=resolved.pool_state,
-                assignment=resolved.assignment,
-            )
+            _cleanup_slot_with_assignment(cleanup, assignment=resolved.assignment)
         case CleanupType.SLOT_UNASSIGNED:
             assert cleanup.worktree_path is not None
             _cleanup_slot_without_assignment(cleanup, slot_name=cleanup.worktree_path.name)
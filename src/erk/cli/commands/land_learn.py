@@ -6,6 +6,11 @@ Extracted to avoid circular imports between land_cmd and land_pipeline.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -19,16 +24,18 @@ from erk.cli.commands.exec.scripts.preprocess_session import (
     deduplicate_assistant_messages,
     deduplicate_documentation_blocks,
     discover_agent_logs,
+    estimate_tokens,
+    filter_session_entries,
     is_empty_session,
     is_warmup_session,
-    process_log_file,
     split_entries_to_chunks,
     truncate_tool_parameters,
 )
 from erk.core.branch_slug_generator import generate_branch_slug
 from erk.core.context import ErkContext
 from erk_shared.learn.extraction.session_schema import (
-    compute_session_provenance,
+    iter_jsonl_entries,
+    provenance_from_entries,
 )
 from erk_shared.naming import generate_planned_pr_branch_name
 from erk_shared.output.output import user_output
@@ -332,20 +339,249 @@ class SessionStats:
     xml_chunks: tuple[str, ...]
 
 
-def _compute_session_stats(session_path: Path, *, session_id: str) -> SessionStats | None:
-    """Compute preprocessing stats for a session.
+@dataclass(frozen=True)
+class _ProcessedSessionFile:
+    """Provenance and XML chunks for one session or agent JSONL file."""
+
+    user_turns: int
+    duration_minutes: int | None
+    skipped: bool
+    xml_chunks: tuple[str, ...]
+
+
+# Bump when the preprocessing pipeline output changes to invalidate cached results
+SESSION_STATS_CACHE_VERSION = 1
+# Entries hold rendered XML chunks, so the cache is bounded by total size
+SESSION_STATS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Below this many bytes of uncached JSONL, process startup outweighs the parallel speedup
+PARALLEL_PREPROCESS_MIN_BYTES = 16 * 1024 * 1024
+
+
+def _process_session_file(
+    log_path: Path, *, session_id: str, source_label: str | None
+) -> _ProcessedSessionFile:
+    """Read one JSONL file once and derive provenance and XML chunks from it.
+
+    Module-level so it can run in a worker process.
+    """
+    content = log_path.read_text(encoding="utf-8")
+    raw_entries = list(iter_jsonl_entries(content))
+    provenance = provenance_from_entries(raw_entries, raw_size_kb=len(content) // 1024)
+
+    entries, _total, _skipped = filter_session_entries(
+        raw_entries, session_id=session_id, enable_filtering=True
+    )
+    if is_empty_session(entries) or is_warmup_session(entries):
+        return _ProcessedSessionFile(
+            user_turns=provenance.user_turns,
+            duration_minutes=provenance.duration_minutes,
+            skipped=True,
+            xml_chunks=(),
+        )
+
+    entries = deduplicate_documentation_blocks(entries)
+    entries = truncate_tool_parameters(entries)
+    entries = deduplicate_assistant_messages(entries)
+    chunks = split_entries_to_chunks(
+        entries,
+        max_tokens=200_000,
+        source_label=source_label,
+        enable_pruning=True,
+        token_estimator=estimate_tokens,
+    )
+    return _ProcessedSessionFile(
+        user_turns=provenance.user_turns,
+        duration_minutes=provenance.duration_minutes,
+        skipped=False,
+        xml_chunks=tuple(chunks),
+    )
+
+
+def _session_file_cache_path(
+    cache_dir: Path, log_path: Path, *, session_id: str, source_label: str | None
+) -> Path:
+    """Cache entry for a file, keyed by its path, size and mtime."""
+    stat = log_path.stat()
+    key_material = json.dumps(
+        [
+            SESSION_STATS_CACHE_VERSION,
+            str(log_path.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            session_id,
+            source_label,
+        ]
+    )
+    key = hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _load_processed_session_file(cache_path: Path) -> _ProcessedSessionFile | None:
+    """Return a cached result, or None on a miss.
+
+    Missing, unreadable and malformed entries are misses; malformed ones are
+    removed. A hit refreshes the entry's mtime, which eviction uses as its
+    last-used time.
+    """
+    try:
+        content = cache_path.read_text(encoding="utf-8")
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        data = None
+    processed = _processed_session_file_from_json(data) if isinstance(data, dict) else None
+    if processed is None:
+        cache_path.unlink(missing_ok=True)
+        return None
+    try:
+        os.utime(cache_path)
+    except FileNotFoundError:
+        pass
+    return processed
+
+
+def _processed_session_file_from_json(data: dict[str, object]) -> _ProcessedSessionFile | None:
+    user_turns = data.get("user_turns")
+    duration_minutes = data.get("duration_minutes")
+    skipped = data.get("skipped")
+    xml_chunks = data.get("xml_chunks")
+    if not (
+        isinstance(user_turns, int)
+        and (duration_minutes is None or isinstance(duration_minutes, int))
+        and isinstance(skipped, bool)
+        and isinstance(xml_chunks, list)
+    ):
+        return None
+    chunks = tuple(chunk for chunk in xml_chunks if isinstance(chunk, str))
+    if len(chunks) != len(xml_chunks):
+        return None
+    return _ProcessedSessionFile(
+        user_turns=user_turns,
+        duration_minutes=duration_minutes,
+        skipped=skipped,
+        xml_chunks=chunks,
+    )
+
+
+def _store_processed_session_file(cache_path: Path, processed: _ProcessedSessionFile) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {
+                "user_turns": processed.user_turns,
+                "duration_minutes": processed.duration_minutes,
+                "skipped": processed.skipped,
+                "xml_chunks": list(processed.xml_chunks),
+            }
+        ),
+        encoding="utf-8",
+    )
+    tmp_path.replace(cache_path)
+
 
-    Reads the JSONL, counts user turns, computes duration from timestamps,
-    runs the preprocessing compression pipeline, and returns size stats.
+def _evict_session_stats_cache(cache_dir: Path, *, max_bytes: int) -> None:
+    """Remove least recently used entries until the cache fits in max_bytes."""
+    entries: list[tuple[float, int, Path]] = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    entries.sort()
+    for _, size, path in entries:
+        if total_bytes <= max_bytes:
+            return
+        path.unlink(missing_ok=True)
+        total_bytes -= size
+
+
+def _process_session_files(
+    files: list[tuple[Path, str | None]],
+    *,
+    session_id: str,
+    cache_dir: Path | None,
+) -> list[_ProcessedSessionFile]:
+    """Process (path, source_label) pairs, reusing cached results.
 
-    Returns None if preprocessing fails (e.g. corrupt JSONL).
+    Uncached files are spread across a process pool when there is enough
+    work to pay for it. Results are returned in input order.
     """
-    provenance = compute_session_provenance(session_path)
-    if provenance is None:
+    results: list[_ProcessedSessionFile | None] = []
+    cache_paths: list[Path | None] = []
+    for log_path, source_label in files:
+        cache_path = (
+            _session_file_cache_path(
+                cache_dir, log_path, session_id=session_id, source_label=source_label
+            )
+            if cache_dir is not None
+            else None
+        )
+        cache_paths.append(cache_path)
+        results.append(_load_processed_session_file(cache_path) if cache_path is not None else None)
+
+    pending = [index for index, result in enumerate(results) if result is None]
+    pending_bytes = sum(files[index][0].stat().st_size for index in pending)
+    if len(pending) > 1 and pending_bytes >= PARALLEL_PREPROCESS_MIN_BYTES:
+        workers = min(len(pending), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _process_session_file,
+                    files[index][0],
+                    session_id=session_id,
+                    source_label=files[index][1],
+                )
+                for index in pending
+            ]
+            computed = [future.result() for future in futures]
+    else:
+        computed = [
+            _process_session_file(
+                files[index][0], session_id=session_id, source_label=files[index][1]
+            )
+            for index in pending
+        ]
+
+    for index, processed in zip(pending, computed, strict=True):
+        results[index] = processed
+        cache_path = cache_paths[index]
+        if cache_path is not None:
+            _store_processed_session_file(cache_path, processed)
+    if cache_dir is not None and pending:
+        _evict_session_stats_cache(cache_dir, max_bytes=SESSION_STATS_CACHE_MAX_BYTES)
+
+    return [result for result in results if result is not None]
+
+
+def _session_stats_cache_dir(ctx: ErkContext) -> Path | None:
+    """Cache directory under the erk installation, or None if there is none."""
+    erk_root = ctx.erk_installation.root()
+    if not erk_root.exists():
         return None
+    return erk_root / "cache" / "session-stats"
+
 
-    user_turns = provenance.user_turns
-    duration_minutes = provenance.duration_minutes
+def _compute_session_stats(
+    session_path: Path, *, session_id: str, cache_dir: Path | None
+) -> SessionStats | None:
+    """Compute preprocessing stats for a session.
+
+    Reads the session JSONL and each agent log once, deriving user turns,
+    duration and compressed XML in the same pass. Agent logs are processed
+    in parallel, and per-file results are cached in cache_dir keyed by
+    (path, size, mtime) so landing again does not redo unchanged files.
+
+    Returns None if the session file does not exist.
+    """
+    if not session_path.exists():
+        return None
 
     # Compute raw size: main JSONL + agent logs (includes agent log sizes)
     raw_bytes = session_path.stat().st_size
@@ -353,54 +589,30 @@ def _compute_session_stats(session_path: Path, *, session_id: str) -> SessionSta
     for agent_log in agent_logs:
         raw_bytes += agent_log.stat().st_size
 
-    # Run preprocessing pipeline to get XML sections
-    entries, _total, _skipped = process_log_file(
-        session_path, session_id=session_id, enable_filtering=True
-    )
+    files: list[tuple[Path, str | None]] = [(session_path, None)]
+    for agent_log in agent_logs:
+        files.append((agent_log, f"agent-{agent_log.stem.replace('agent-', '')}"))
+    processed = _process_session_files(files, session_id=session_id, cache_dir=cache_dir)
 
-    if is_empty_session(entries) or is_warmup_session(entries):
+    main = processed[0]
+    if main.skipped:
         # Still report stats but XML will be minimal
         return SessionStats(
-            user_turns=user_turns,
-            duration_minutes=duration_minutes,
+            user_turns=main.user_turns,
+            duration_minutes=main.duration_minutes,
             raw_size_kb=raw_bytes // 1024,
             xml_size_kb=0,
             xml_chunks=(),
         )
 
-    entries = deduplicate_documentation_blocks(entries)
-    entries = truncate_tool_parameters(entries)
-    entries = deduplicate_assistant_messages(entries)
-
-    # Process agent logs through same pipeline
-    all_entries_with_labels: list[tuple[list[dict], str | None]] = [(entries, None)]
-    for agent_log in agent_logs:
-        agent_entries, _at, _as = process_log_file(
-            agent_log, session_id=session_id, enable_filtering=True
-        )
-        if is_empty_session(agent_entries) or is_warmup_session(agent_entries):
-            continue
-        agent_entries = deduplicate_documentation_blocks(agent_entries)
-        agent_entries = truncate_tool_parameters(agent_entries)
-        agent_entries = deduplicate_assistant_messages(agent_entries)
-        source_label = f"agent-{agent_log.stem.replace('agent-', '')}"
-        all_entries_with_labels.append((agent_entries, source_label))
-
-    all_chunks: list[str] = []
-    for session_entries, source_label in all_entries_with_labels:
-        chunks = split_entries_to_chunks(
-            session_entries,
-            max_tokens=200_000,
-            source_label=source_label,
-            enable_pruning=True,
-        )
-        all_chunks.extend(chunks)
-
+    all_chunks = [
+        chunk for result in processed if not result.skipped for chunk in result.xml_chunks
+    ]
     xml_bytes = sum(len(chunk.encode("utf-8")) for chunk in all_chunks)
 
     return SessionStats(
-        user_turns=user_turns,
-        duration_minutes=duration_minutes,
+        user_turns=main.user_turns,
+        duration_minutes=main.duration_minutes,
         raw_size_kb=raw_bytes // 1024,
         xml_size_kb=xml_bytes // 1024,
         xml_chunks=tuple(all_chunks),
@@ -491,6 +703,7 @@ def _log_session_discovery(
     planning_ids = {sessions.planning_session_id} if sessions.planning_session_id else set()
     impl_ids = set(sessions.implementation_session_ids)
     learn_ids = set(sessions.learn_session_ids)
+    stats_cache_dir = _session_stats_cache_dir(ctx)
 
     table = Table(
         show_header=False,
@@ -518,7 +731,9 @@ def _log_session_discovery(
             emoji, label = "\u2753", "unknown:"
 
         if sid in readable_map:
-            stats = _compute_session_stats(readable_map[sid], session_id=sid)
+            stats = _compute_session_stats(
+                readable_map[sid], session_id=sid, cache_dir=stats_cache_dir
+            )
             if stats is not None:
                 duration_part = (
                     f" \u00b7 {stats.duration_minutes} min"
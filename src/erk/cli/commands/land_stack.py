@@ -21,7 +21,7 @@ from erk.cli.commands.land_cmd import (
 from erk.cli.commands.land_learn import _create_learn_pr_for_merged_branch
 from erk.cli.commands.navigation_helpers import check_clean_working_tree
 from erk.cli.commands.objective_helpers import (
-    get_objective_for_branch,
+    get_objectives_for_branches,
     run_objective_update_after_land,
 )
 from erk.cli.ensure import Ensure
@@ -242,13 +242,17 @@ def _validate_stack_entries(
     root_needs_clean_check = False
     user_output(click.style("  Validating stack entries...", dim=True))
 
+    # One batched PR read; plan ids and objectives are derived from it
+    prs_by_branch = ctx.github.get_pr_details_by_branches(main_repo_root, stack_branches)
+    objectives = get_objectives_for_branches(ctx, stack_branches, prs_by_branch)
+
     for index, branch in enumerate(stack_branches):
-        pr_details = ctx.github.get_pr_for_branch(main_repo_root, branch)
+        pr_details = prs_by_branch.get(branch)
         Ensure.invariant(
-            not isinstance(pr_details, PRNotFound),
+            pr_details is not None,
             f"No pull request found for branch '{branch}' in the stack.",
         )
-        assert isinstance(pr_details, PRDetails)
+        assert pr_details is not None
 
         expected_base = trunk_branch if index == 0 else stack_branches[index - 1]
         Ensure.invariant(
@@ -283,8 +287,8 @@ def _validate_stack_entries(
                 branch=branch,
                 pr_number=pr_details.number,
                 worktree_path=worktree_path,
-                pr_id=ctx.pr_backend.resolve_pr_number_for_branch(main_repo_root, branch),
-                objective_number=get_objective_for_branch(ctx, main_repo_root, branch),
+                pr_id=str(pr_details.number),
+                objective_number=objectives[branch],
             )
         )
         user_output(
@@ -1,6 +1,6 @@
 """Log command for querying erk command history.
 
-Provides access to the command audit trail stored in ~/.erk/command_history.jsonl.
+Provides access to the command audit trail stored in ~/.erk/command_history/.
 """
 
 from datetime import UTC, datetime
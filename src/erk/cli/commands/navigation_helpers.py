@@ -17,6 +17,7 @@ from erk.core.repo_discovery import RepoContext
 from erk.core.worktree_pool import PoolState, SlotAssignment
 from erk.core.worktree_utils import compute_relative_path_in_worktree
 from erk_shared.debug import debug_log
+from erk_shared.gateway.git.abc import WorktreeInfo
 from erk_shared.gateway.github.types import PRNotFound
 from erk_shared.output.output import user_output
 from erk_shared.scratch.markers import PENDING_LEARN_MARKER, marker_exists
@@ -214,6 +215,7 @@ def activate_target(
     source_branch: str | None,
     force: bool,
     is_root: bool,
+    worktrees: list[WorktreeInfo] | None,
 ) -> NoReturn:
     """Activate a worktree or root repository and exit.
 
@@ -233,6 +235,8 @@ def activate_target(
             shows delete hint in activation instructions.
         force: If True and source_branch is provided, shows the delete hint.
         is_root: If True, uses root repo messaging; otherwise uses worktree messaging
+        worktrees: Worktree list the caller already fetched, or None to list
+            them here (only needed when preserve_relative_path is True)
 
     Raises:
         SystemExit: Always raises (either success or error)
@@ -245,7 +249,8 @@ def activate_target(
     # Compute relative path to preserve user's position within worktree
     relative_path: Path | None = None
     if preserve_relative_path:
-        worktrees = ctx.git.worktree.list_worktrees(repo.root)
+        if worktrees is None:
+            worktrees = ctx.git.worktree.list_worktrees(repo.root)
         relative_path = compute_relative_path_in_worktree(worktrees, ctx.cwd)
 
     # Determine messaging based on whether this is root or a worktree
@@ -336,6 +341,7 @@ def activate_worktree(
         source_branch=source_branch,
         force=force,
         is_root=False,
+        worktrees=None,
     )
 
 
@@ -382,4 +388,5 @@ def activate_root_repo(
         source_branch=source_branch,
         force=force,
         is_root=True,
+        worktrees=None,
     )
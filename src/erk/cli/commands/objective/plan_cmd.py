@@ -1,11 +1,14 @@
 """Create a plan from an objective node."""
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
 import click
 
 from erk.cli.commands.exec.scripts.update_objective_node import (
     _replace_node_refs_in_body,
+    _replace_nodes_refs_in_body,
 )
 from erk.cli.commands.implement_shared import normalize_model_name
 from erk.cli.commands.objective.check.validation import (
@@ -15,14 +18,19 @@ from erk.cli.commands.objective.check.validation import (
 )
 from erk.cli.commands.objective_helpers import get_objective_for_branch
 from erk.cli.commands.one_shot_remote_dispatch import (
+    ONE_SHOT_MAX_CONCURRENCY,
+    ONE_SHOT_WORKFLOW,
     OneShotDispatchParams,
     OneShotDispatchResult,
+    StartedOneShot,
     dispatch_one_shot_remote,
+    finish_one_shot_remote,
+    start_one_shot_remote,
 )
 from erk.cli.commands.ref_resolution import resolve_dispatch_ref
 from erk.cli.github_parsing import parse_issue_identifier
 from erk.cli.repo_resolution import get_remote_github, repo_option, resolve_owner_repo
-from erk.core.branch_slug_generator import generate_branch_slug
+from erk.core.branch_slug_generator import generate_branch_slug, generate_branch_slugs
 from erk.core.context import ErkContext, NoRepoSentinel
 from erk_shared.context.types import InteractiveAgentConfig
 from erk_shared.core.prompt_executor import PromptExecutor
@@ -34,14 +42,21 @@ from erk_shared.gateway.github.metadata.dependency_graph import (
     phases_from_graph,
 )
 from erk_shared.gateway.github.metadata.roadmap import (
+    RoadmapNodeUpdate,
     RoadmapPhase,
     enrich_phase_names,
+    parse_roadmap,
     rerender_comment_roadmap,
 )
 from erk_shared.gateway.github.metadata.types import BlockKeys
+from erk_shared.gateway.github.run_correlation import WorkflowRunFound, WorkflowRunResult
+from erk_shared.gateway.http.abc import HttpError
 from erk_shared.gateway.remote_github.abc import RemoteGitHub
 from erk_shared.naming import sanitize_worktree_name
-from erk_shared.output.output import user_output
+from erk_shared.output.output import inherit_output_redirect, user_output
+
+# Slug prompts in flight at once when planning all unblocked nodes
+SLUG_CONCURRENCY = 8
 
 
 def _generate_slug(prompt_executor: PromptExecutor, description: str) -> str:
@@ -58,6 +73,19 @@ def _generate_slug(prompt_executor: PromptExecutor, description: str) -> str:
         A slug string suitable for branch names
     """
     slug = generate_branch_slug(prompt_executor, description)
+    return _slug_or_fallback(slug, description)
+
+
+def _generate_slugs(prompt_executor: PromptExecutor, descriptions: list[str]) -> list[str]:
+    """Batch form of _generate_slug(); runs the slug prompts concurrently."""
+    slugs = generate_branch_slugs(prompt_executor, descriptions, max_concurrency=SLUG_CONCURRENCY)
+    return [
+        _slug_or_fallback(slug, description)
+        for slug, description in zip(slugs, descriptions, strict=True)
+    ]
+
+
+def _slug_or_fallback(slug: str, description: str) -> str:
     if slug == description:
         return sanitize_worktree_name(description)[:25].rstrip("-")
     return slug
@@ -288,9 +316,6 @@ def _handle_all_unblocked(
         user_output(f"  {node.id}: {node.description} (Phase: {phase_name})")
     user_output("")
 
-    dispatched_count = 0
-    successful_dispatches: list[tuple[str, int]] = []
-
     # Resolve dispatch ref — local enrichments when available, fallback to default branch
     if ref_current and not has_local_repo:
         raise click.UsageError("--ref-current requires a local git repository")
@@ -306,63 +331,225 @@ def _handle_all_unblocked(
     if ref is None:
         ref = remote.get_default_branch_name(owner=owner, repo=repo_name)
 
-    for node, phase_name in resolved.nodes:
+    # Generate every node's slug up front as one concurrent prompt batch
+    slugs = _generate_slugs(
+        ctx.prompt_executor, [node.description for node, _phase_name in resolved.nodes]
+    )
+
+    node_params: list[tuple[ObjectiveNode, OneShotDispatchParams]] = []
+    for (node, phase_name), slug in zip(resolved.nodes, slugs, strict=True):
         prompt = (
             f"/erk:objective-plan {resolved.issue_number}\n"
             f"Implement step {node.id} of objective #{resolved.issue_number}: "
             f"{node.description} (Phase: {phase_name})"
         )
-
-        user_output(f"Dispatching node {click.style(node.id, bold=True)}: {node.description}")
-
-        slug = _generate_slug(ctx.prompt_executor, node.description)
-
-        params = OneShotDispatchParams(
-            prompt=prompt,
-            model=model,
-            extra_workflow_inputs={
-                "objective_issue": str(resolved.issue_number),
-                "node_id": node.id,
-            },
-            slug=slug,
+        node_params.append(
+            (
+                node,
+                OneShotDispatchParams(
+                    prompt=prompt,
+                    model=model,
+                    extra_workflow_inputs={
+                        "objective_issue": str(resolved.issue_number),
+                        "node_id": node.id,
+                    },
+                    slug=slug,
+                ),
+            )
         )
 
-        dispatch_result = dispatch_one_shot_remote(
-            remote=remote,
-            owner=owner,
-            repo=repo_name,
-            params=params,
-            dry_run=dry_run,
-            ref=ref,
-            time_gateway=ctx.time,
-            prompt_executor=ctx.prompt_executor,
+    if dry_run:
+        for node, params in node_params:
+            user_output(f"Dispatching node {click.style(node.id, bold=True)}: {node.description}")
+            dispatch_one_shot_remote(
+                remote=remote,
+                owner=owner,
+                repo=repo_name,
+                params=params,
+                dry_run=True,
+                ref=ref,
+                time_gateway=ctx.time,
+                prompt_executor=ctx.prompt_executor,
+            )
+        user_output(
+            f"\n{click.style('Dry-run complete:', fg='cyan', bold=True)} "
+            f"Would dispatch {len(resolved.nodes)} node(s)"
         )
+        return
 
-        if isinstance(dispatch_result, OneShotDispatchResult):
-            successful_dispatches.append((node.id, dispatch_result.pr_number))
-            dispatched_count += 1
+    outcomes = _dispatch_nodes(
+        ctx,
+        remote,
+        owner=owner,
+        repo_name=repo_name,
+        ref=ref,
+        node_params=node_params,
+    )
+    successful_dispatches = [
+        (node_id, outcome.pr_number)
+        for node_id, outcome in outcomes
+        if isinstance(outcome, OneShotDispatchResult)
+    ]
+    failures = [(node_id, outcome) for node_id, outcome in outcomes if isinstance(outcome, str)]
 
     # Single atomic update after all dispatches complete
     if successful_dispatches:
         user_output("Updating objective roadmap...")
         _batch_update_objective_nodes(
-            get_remote_github(ctx),
+            remote,
             owner=owner,
             repo=repo_name,
             issue_number=resolved.issue_number,
             node_updates=successful_dispatches,
         )
 
-    if dry_run:
-        user_output(
-            f"\n{click.style('Dry-run complete:', fg='cyan', bold=True)} "
-            f"Would dispatch {len(resolved.nodes)} node(s)"
-        )
-    else:
+    user_output(
+        f"\n{click.style('Done!', fg='green', bold=True)} "
+        f"Dispatched {len(successful_dispatches)}/{len(resolved.nodes)} node(s)"
+    )
+    if failures:
+        user_output("")
         user_output(
-            f"\n{click.style('Done!', fg='green', bold=True)} "
-            f"Dispatched {dispatched_count}/{len(resolved.nodes)} node(s)"
+            click.style("Error: ", fg="red") + f"{len(failures)} node(s) failed to dispatch:"
         )
+        for node_id, message in failures:
+            user_output(f"  {node_id}: {message}")
+        raise SystemExit(1)
+
+
+def _dispatch_nodes(
+    ctx: ErkContext,
+    remote: RemoteGitHub,
+    *,
+    owner: str,
+    repo_name: str,
+    ref: str,
+    node_params: list[tuple[ObjectiveNode, OneShotDispatchParams]],
+) -> list[tuple[str, OneShotDispatchResult | str]]:
+    """Start every node's one-shot concurrently, then resolve all runs at once.
+
+    Mirrors `erk pr dispatch`: starts run across at most
+    ONE_SHOT_MAX_CONCURRENCY workers with one [n/total] line per node, every
+    run is resolved in one resolve_workflow_runs() polling loop, and the
+    queued comments fan out the same way. A node that fails, or whose run is
+    not found, fails on its own; the others still finish.
+
+    Returns:
+        (node_id, result) pairs in node order; result is the error message
+        for a failed node
+    """
+    submitted_by = remote.get_authenticated_user()
+    user_output(click.style(f"  \u2713 Authenticated as {submitted_by}", dim=True))
+    trunk = remote.get_default_branch_name(owner=owner, repo=repo_name)
+
+    for node, _params in node_params:
+        user_output(f"Dispatching node {click.style(node.id, bold=True)}: {node.description}")
+
+    count = len(node_params)
+    max_workers = min(ONE_SHOT_MAX_CONCURRENCY, count)
+    outcomes: dict[int, StartedOneShot | OneShotDispatchResult | str] = {}
+    dispatched_at = ctx.time.now()
+    with ThreadPoolExecutor(
+        max_workers=max_workers, initializer=inherit_output_redirect()
+    ) as executor:
+        futures = {
+            executor.submit(
+                _run_node_isolated,
+                lambda params=params: start_one_shot_remote(
+                    remote=remote,
+                    owner=owner,
+                    repo=repo_name,
+                    params=params,
+                    ref=ref,
+                    time_gateway=ctx.time,
+                    prompt_executor=ctx.prompt_executor,
+                    submitted_by=submitted_by,
+                    trunk=trunk,
+                ),
+            ): i
+            for i, (_node, params) in enumerate(node_params)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            outcome = future.result()
+            outcomes[i] = outcome
+            node_id = node_params[i][0].id
+            progress = f"[{len(outcomes)}/{count}]"
+            if isinstance(outcome, str):
+                user_output(f"{progress} " + click.style("\u2717", fg="red") + f" {node_id} failed")
+            else:
+                user_output(
+                    f"{progress} "
+                    + click.style("\u2713", fg="green")
+                    + f" {node_id} dispatched (PR #{outcome.pr_number})"
+                )
+
+    started = {i: o for i, o in outcomes.items() if isinstance(o, StartedOneShot)}
+    if started:
+        user_output(f"Resolving {len(started)} workflow run(s)...")
+        run_results: dict[str, WorkflowRunResult]
+        # Error boundary: the runs listing failing must not hide which
+        # nodes were dispatched; each is reported as unresolved instead.
+        try:
+            run_results = remote.resolve_workflow_runs(
+                owner=owner,
+                repo=repo_name,
+                workflow=ONE_SHOT_WORKFLOW,
+                distinct_ids=[o.distinct_id for o in started.values()],
+                dispatched_at=dispatched_at,
+            )
+        except (RuntimeError, HttpError) as e:
+            run_results = {}
+            for i in started:
+                outcomes[i] = f"workflow dispatched but run not resolved: {e}"
+            started = {}
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, initializer=inherit_output_redirect()
+        ) as executor:
+            finish_futures = {}
+            for i, o in started.items():
+                run_result = run_results[o.distinct_id]
+                if not isinstance(run_result, WorkflowRunFound):
+                    outcomes[i] = (
+                        f"PR #{o.pr_number}: workflow dispatched but run not resolved: "
+                        f"{run_result.message}"
+                    )
+                    continue
+                finish_futures[i] = executor.submit(
+                    _run_node_isolated,
+                    lambda o=o, run_id=run_result.run_id: finish_one_shot_remote(
+                        remote=remote,
+                        owner=owner,
+                        repo=repo_name,
+                        started=o,
+                        run_id=run_id,
+                        time_gateway=ctx.time,
+                    ),
+                )
+            for i, future in finish_futures.items():
+                outcomes[i] = future.result()
+
+    results: list[tuple[str, OneShotDispatchResult | str]] = []
+    for i, (node, _params) in enumerate(node_params):
+        outcome = outcomes[i]
+        # Every StartedOneShot was finished or replaced by an error above
+        assert not isinstance(outcome, StartedOneShot)
+        results.append((node.id, outcome))
+    return results
+
+
+def _run_node_isolated(
+    fn: Callable[[], StartedOneShot | OneShotDispatchResult],
+) -> StartedOneShot | OneShotDispatchResult | str:
+    """Run one node's dispatch step, converting its failure into an error message."""
+    # Error boundary: one node failing must not abort the rest of the batch.
+    try:
+        return fn()
+    except click.ClickException as e:
+        return e.format_message()
+    except Exception as e:
+        return str(e)
 
 
 def _update_objective_node(
@@ -423,8 +610,9 @@ def _batch_update_objective_nodes(
 ) -> None:
     """Mark multiple nodes as 'planning' with draft PRs in a single API write.
 
-    Fetches the issue body once, applies all node updates in memory, then writes
-    back once. Same for the v2 comment if present.
+    Fetches the issue body once, applies all node updates to the parsed roadmap
+    in memory (one parse, one render), then writes back once. Same for the v2
+    comment if present. Nodes no longer in the roadmap are skipped.
     """
     if not node_updates:
         return
@@ -433,26 +621,29 @@ def _batch_update_objective_nodes(
     if isinstance(issue, IssueNotFound):
         return
 
-    # Accumulate all body changes in memory
-    updated_body = issue.body
-    body_changed = False
-    for node_id, pr_number in node_updates:
-        new_body = _replace_node_refs_in_body(
-            updated_body,
-            node_id,
-            new_pr=f"#{pr_number}",
-            explicit_status="planning",
+    phases, _ = parse_roadmap(issue.body)
+    known_node_ids = {node.id for phase in phases for node in phase.nodes}
+    updates = [
+        RoadmapNodeUpdate(
+            node_id=node_id,
+            pr=f"#{pr_number}",
+            status="planning",
             description=None,
             slug=None,
             comment=None,
         )
-        if new_body is not None:
-            updated_body = new_body
-            body_changed = True
+        for node_id, pr_number in node_updates
+        if node_id in known_node_ids
+    ]
+    if not updates:
+        return
+
+    updated_body = _replace_nodes_refs_in_body(issue.body, updates)
+    if updated_body is None:
+        return
 
     # Single write for all body changes
-    if body_changed:
-        remote.update_issue_body(owner=owner, repo=repo, number=issue_number, body=updated_body)
+    remote.update_issue_body(owner=owner, repo=repo, number=issue_number, body=updated_body)
 
     # v2 format: re-render comment table from updated YAML (single write)
     objective_comment_id = extract_metadata_value(
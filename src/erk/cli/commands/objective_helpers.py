@@ -5,12 +5,14 @@ and prompt users to update them after landing.
 """
 
 import logging
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 
 import click
 
 from erk.cli.output import stream_command_with_feedback
 from erk.core.context import ErkContext
+from erk_shared.gateway.github.types import PRDetails
 from erk_shared.naming import extract_objective_number
 from erk_shared.output.output import user_output
 from erk_shared.pr_store.types import PlanState, PrNotFound
@@ -73,6 +75,38 @@ def get_objective_for_branch(ctx: ErkContext, repo_root: Path, branch: str) -> i
     return extract_objective_number(branch)
 
 
+def get_objectives_for_branches(
+    ctx: ErkContext,
+    branches: Sequence[str],
+    prs_by_branch: Mapping[str, PRDetails],
+) -> dict[str, int | None]:
+    """Batch variant of get_objective_for_branch for already-fetched PRs.
+
+    Derives each linked plan from the PR details the caller already holds
+    (e.g. from get_pr_details_by_branches) instead of re-querying them.
+    Falls back to the objective number encoded in the branch name exactly
+    like get_objective_for_branch.
+
+    Args:
+        ctx: ErkContext
+        branches: Branch names to resolve
+        prs_by_branch: Mapping of branch -> PRDetails; branches without an
+            entry have no plan
+
+    Returns:
+        Mapping of branch -> objective issue number or None
+    """
+    plans = ctx.pr_backend.plans_from_pr_details(prs_by_branch)
+    objectives: dict[str, int | None] = {}
+    for branch in branches:
+        plan = plans.get(branch)
+        if plan is not None and plan.objective_id is not None:
+            objectives[branch] = plan.objective_id
+        else:
+            objectives[branch] = extract_objective_number(branch)
+    return objectives
+
+
 def run_objective_update_after_close(
     ctx: ErkContext,
     *,
@@ -34,6 +34,11 @@ from erk_shared.pr_store.planned_pr_lifecycle import build_plan_stage_body
 
 ONE_SHOT_WORKFLOW = "one-shot.yml"
 
+# Upper bound on one-shots started at once by batch dispatch. Each start
+# creates a branch, a commit and a PR, and GitHub's secondary rate limits
+# penalize bursts of concurrent content-creating requests, so this stays small.
+ONE_SHOT_MAX_CONCURRENCY = 4
+
 
 @dataclass(frozen=True)
 class OneShotDispatchParams:
@@ -90,6 +95,22 @@ class OneShotDispatchResult:
         }
 
 
+@dataclass(frozen=True)
+class StartedOneShot:
+    """A one-shot whose draft PR exists and whose workflow was dispatched.
+
+    The workflow run is not known yet; resolve it with
+    RemoteGitHub.resolve_workflow_runs() using distinct_id, then pass the
+    run ID to finish_one_shot_remote().
+    """
+
+    pr_number: int
+    branch_name: str
+    distinct_id: str
+    submitted_by: str
+    prompt: str
+
+
 @dataclass(frozen=True)
 class OneShotDryRunResult:
     """Result of a dry-run one-shot dispatch (preview only, no mutations)."""
@@ -277,145 +298,24 @@ def dispatch_one_shot_remote(
 
     start_monotonic = time.monotonic()
 
-    current_step = "Generating branch name"
+    current_step = _StepTracker(name="Generating branch name")
 
     try:
-        objective_issue_str = params.extra_workflow_inputs.get("objective_issue")
-        objective_id = int(objective_issue_str) if objective_issue_str else None
-
-        # Generate branch name
-        user_output("Generating branch name...")
-        if params.slug is not None:
-            slug = params.slug
-            user_output(click.style(f"  \u2713 Slug: {slug} (pre-generated)", dim=True))
-        else:
-            if prompt_executor is not None:
-                slug = generate_branch_slug(prompt_executor, params.prompt)
-            else:
-                slug = sanitize_worktree_name(params.prompt)[:25].rstrip("-")
-            user_output(click.style(f"  \u2713 Slug: {slug}", dim=True))
-
-        branch_name = generate_planned_pr_branch_name(
-            slug,
-            time_gateway.now(),
-            objective_id=objective_id,
-        )
-        user_output(click.style(f"  \u2192 Branch: {branch_name}", dim=True))
-
-        # Get trunk SHA for branch creation
-        current_step = "Getting trunk SHA"
-        trunk_sha = remote.get_default_branch_sha(owner=owner, repo=repo)
-
-        # Create branch from trunk
-        current_step = "Creating branch"
-        user_output("Creating branch...")
-        remote.create_ref(
-            owner=owner,
-            repo=repo,
-            ref=f"refs/heads/{branch_name}",
-            sha=trunk_sha,
-        )
-        user_output(click.style("  \u2713 Branch created", dim=True))
-
-        # Write prompt to .erk/impl-context/prompt.md
-        current_step = "Committing prompt file"
-        user_output("Committing prompt file...")
-        remote.create_file_commit(
+        branch_name, pr_number, inputs = _create_one_shot_pr(
+            remote=remote,
             owner=owner,
             repo=repo,
-            path=".erk/impl-context/prompt.md",
-            content=params.prompt + "\n",
-            message=f"One-shot: {params.prompt[:60]}",
-            branch=branch_name,
-        )
-        user_output(click.style("  \u2713 Committed", dim=True))
-
-        # Create draft PR
-        current_step = "Creating draft PR"
-        user_output("Creating draft PR...")
-        created_at = time_gateway.now().replace(tzinfo=UTC).isoformat()
-        metadata_body = format_plan_header_body(
-            created_at=created_at,
-            created_by=submitted_by,
-            worktree_name=None,
-            branch_name=branch_name,
-            plan_comment_id=None,
-            last_dispatched_run_id=None,
-            last_dispatched_node_id=None,
-            last_dispatched_at=None,
-            last_local_impl_at=None,
-            last_local_impl_event=None,
-            last_local_impl_session=None,
-            last_local_impl_user=None,
-            last_remote_impl_at=None,
-            last_remote_impl_run_id=None,
-            last_remote_impl_session_id=None,
-            source_repo=None,
-            objective_issue=objective_id,
-            node_ids=None,
-            created_from_session=None,
-            created_from_workflow_run_url=None,
-            last_learn_session=None,
-            last_learn_at=None,
-            learn_status=None,
-            learn_plan_issue=None,
-            learn_plan_pr=None,
-            learned_from_issue=None,
-            lifecycle_stage="prompted",
-        )
-        placeholder_content = (
-            f"_One-shot: plan content will be populated by one-shot workflow._\n\n"
-            f"**Prompt:** {params.prompt}"
-        )
-        pr_body_initial = build_plan_stage_body(metadata_body, placeholder_content, summary="")
-        pr_number = remote.create_pull_request(
-            owner=owner,
-            repo=repo,
-            head=branch_name,
-            base=trunk,
-            title=pr_title,
-            body=pr_body_initial,
-            draft=True,
-        )
-
-        # Add footer now that we have the PR number
-        footer = build_pr_body_footer(pr_number)
-        remote.update_pull_request_body(
-            owner=owner,
-            repo=repo,
-            pr_number=pr_number,
-            body=pr_body_initial + footer,
-        )
-
-        # Add plan labels
-        remote.add_labels(
-            owner=owner,
-            repo=repo,
-            issue_number=pr_number,
-            labels=("erk-pr",),
+            params=params,
+            time_gateway=time_gateway,
+            prompt_executor=prompt_executor,
+            submitted_by=submitted_by,
+            trunk=trunk,
+            quiet=False,
+            current_step=current_step,
         )
-        user_output(click.style(f"  \u2192 PR #{pr_number}", dim=True))
-
-        # Build workflow inputs
-        max_input_len = 500
-        truncated_prompt = params.prompt[:max_input_len]
-        if len(params.prompt) > max_input_len:
-            truncated_prompt += "... (full prompt committed to .erk/impl-context/prompt.md)"
-
-        inputs: dict[str, str] = {
-            "prompt": truncated_prompt,
-            "branch_name": branch_name,
-            "pr_number": str(pr_number),
-            "submitted_by": submitted_by,
-            "pr_backend": "planned_pr",
-        }
-        if params.model is not None:
-            inputs["model_name"] = params.model
-        inputs["plan_issue_number"] = str(pr_number)
-        inputs.update(params.extra_workflow_inputs)
 
         # Dispatch workflow
-        current_step = "Dispatching one-shot workflow"
+        current_step.name = "Dispatching one-shot workflow"
         user_output("Dispatching one-shot workflow...")
         dispatch_ref = ref if ref is not None else branch_name
         run_id = remote.dispatch_workflow(
@@ -427,44 +327,24 @@ def dispatch_one_shot_remote(
         )
         user_output(click.style(f"  \u2192 Run ID: {run_id}", dim=True))
 
-        # Post queued comment (best-effort)
-        run_url = construct_workflow_run_url(owner, repo, run_id)
-        queued_at = time_gateway.now().replace(tzinfo=UTC).isoformat()
-
-        current_step = "Posting queued event comment"
-        try:
-            metadata_block = create_submission_queued_block(
-                queued_at=queued_at,
-                submitted_by=submitted_by,
-                pr_number=pr_number,
-                validation_results={"pr_is_open": True, "has_erk_pr_title": True},
-                expected_workflow="one-shot",
-            )
-            comment_body = render_erk_issue_event(
-                title="\U0001f504 One-Shot Dispatched",
-                metadata=metadata_block,
-                description=(
-                    f"One-shot submitted by **{submitted_by}** at {queued_at}.\n\n"
-                    f"**Workflow run:** {run_url}\n\n"
-                    f"**Prompt:** {params.prompt}"
-                ),
-            )
-            remote.add_issue_comment(
-                owner=owner,
-                repo=repo,
-                issue_number=pr_number,
-                body=comment_body,
-            )
-            user_output(click.style("\u2713", fg="green") + " Queued event comment posted")
-        except HttpError as e:
-            user_output(
-                click.style("Warning: ", fg="yellow") + f"Failed to post queued comment: {e}"
-            )
+        current_step.name = "Posting queued event comment"
+        result = _post_one_shot_queued_comment(
+            remote=remote,
+            owner=owner,
+            repo=repo,
+            pr_number=pr_number,
+            branch_name=branch_name,
+            run_id=run_id,
+            submitted_by=submitted_by,
+            prompt=params.prompt,
+            time_gateway=time_gateway,
+            quiet=False,
+        )
 
     except SystemExit:
         raise
     except Exception as exc:
-        user_output(click.style(f"Failed during: {current_step}", fg="red"))
+        user_output(click.style(f"Failed during: {current_step.name}", fg="red"))
         raise exc from exc
 
     # Display results
@@ -472,14 +352,340 @@ def dispatch_one_shot_remote(
     duration_str = format_duration(elapsed)
     user_output("")
     user_output(click.style(f"Done! ({duration_str})", fg="green", bold=True))
-    pr_url = f"https://github.com/{owner}/{repo}/pull/{pr_number}"
-    user_output(f"PR: {click.style(pr_url, fg='cyan')}")
-    user_output(f"Run: {click.style(run_url, fg='cyan')}")
+    user_output(f"PR: {click.style(result.pr_url, fg='cyan')}")
+    user_output(f"Run: {click.style(result.run_url, fg='cyan')}")
+
+    return result
+
+
+def start_one_shot_remote(
+    *,
+    remote: RemoteGitHub,
+    owner: str,
+    repo: str,
+    params: OneShotDispatchParams,
+    ref: str | None,
+    time_gateway: Time,
+    prompt_executor: PromptExecutor | None,
+    submitted_by: str,
+    trunk: str,
+) -> StartedOneShot:
+    """Create a one-shot's branch and draft PR and dispatch its workflow, quietly.
+
+    The batch counterpart of dispatch_one_shot_remote(): it does not wait for
+    the workflow run, so many one-shots can be started concurrently and their
+    runs resolved together with RemoteGitHub.resolve_workflow_runs().
+
+    Args:
+        remote: RemoteGitHub gateway for API calls
+        owner: Repository owner
+        repo: Repository name
+        params: Dispatch parameters
+        ref: Branch to dispatch workflow from, or None for the new branch
+        time_gateway: Time gateway for timestamps
+        prompt_executor: PromptExecutor for slug generation, or None
+        submitted_by: Authenticated GitHub user, fetched once by the caller
+        trunk: Default branch name, fetched once by the caller
+
+    Returns:
+        StartedOneShot with the distinct_id for run correlation
+
+    Raises:
+        RuntimeError: If a step fails; the message names the step
+    """
+    current_step = _StepTracker(name="Generating branch name")
+    # Error boundary: batch callers report one message per one-shot, so the
+    # failing step is folded into the error instead of printed separately.
+    try:
+        branch_name, pr_number, inputs = _create_one_shot_pr(
+            remote=remote,
+            owner=owner,
+            repo=repo,
+            params=params,
+            time_gateway=time_gateway,
+            prompt_executor=prompt_executor,
+            submitted_by=submitted_by,
+            trunk=trunk,
+            quiet=True,
+            current_step=current_step,
+        )
+        current_step.name = "Dispatching one-shot workflow"
+        distinct_id = remote.start_workflow(
+            owner=owner,
+            repo=repo,
+            workflow=ONE_SHOT_WORKFLOW,
+            ref=ref if ref is not None else branch_name,
+            inputs=inputs,
+        )
+    except (RuntimeError, HttpError) as exc:
+        raise RuntimeError(f"{current_step.name} failed: {exc}") from exc
+
+    return StartedOneShot(
+        pr_number=pr_number,
+        branch_name=branch_name,
+        distinct_id=distinct_id,
+        submitted_by=submitted_by,
+        prompt=params.prompt,
+    )
+
+
+def finish_one_shot_remote(
+    *,
+    remote: RemoteGitHub,
+    owner: str,
+    repo: str,
+    started: StartedOneShot,
+    run_id: str,
+    time_gateway: Time,
+) -> OneShotDispatchResult:
+    """Post the queued event comment for a started one-shot, quietly.
+
+    Args:
+        remote: RemoteGitHub gateway for API calls
+        owner: Repository owner
+        repo: Repository name
+        started: One-shot returned by start_one_shot_remote()
+        run_id: Workflow run ID resolved for started.distinct_id
+        time_gateway: Time gateway for timestamps
+
+    Returns:
+        OneShotDispatchResult for the one-shot
+    """
+    return _post_one_shot_queued_comment(
+        remote=remote,
+        owner=owner,
+        repo=repo,
+        pr_number=started.pr_number,
+        branch_name=started.branch_name,
+        run_id=run_id,
+        submitted_by=started.submitted_by,
+        prompt=started.prompt,
+        time_gateway=time_gateway,
+        quiet=True,
+    )
+
+
+@dataclass
+class _StepTracker:
+    """Name of the dispatch step in progress, for failure messages."""
+
+    name: str
+
+
+def _create_one_shot_pr(
+    *,
+    remote: RemoteGitHub,
+    owner: str,
+    repo: str,
+    params: OneShotDispatchParams,
+    time_gateway: Time,
+    prompt_executor: PromptExecutor | None,
+    submitted_by: str,
+    trunk: str,
+    quiet: bool,
+    current_step: _StepTracker,
+) -> tuple[str, int, dict[str, str]]:
+    """Create the branch, prompt commit and draft PR for a one-shot.
+
+    Returns:
+        Tuple of (branch_name, pr_number, workflow inputs)
+    """
+
+    def progress(message: str) -> None:
+        if not quiet:
+            user_output(message)
+
+    objective_issue_str = params.extra_workflow_inputs.get("objective_issue")
+    objective_id = int(objective_issue_str) if objective_issue_str else None
+
+    # Generate branch name
+    progress("Generating branch name...")
+    if params.slug is not None:
+        slug = params.slug
+        progress(click.style(f"  \u2713 Slug: {slug} (pre-generated)", dim=True))
+    else:
+        if prompt_executor is not None:
+            slug = generate_branch_slug(prompt_executor, params.prompt)
+        else:
+            slug = sanitize_worktree_name(params.prompt)[:25].rstrip("-")
+        progress(click.style(f"  \u2713 Slug: {slug}", dim=True))
+
+    branch_name = generate_planned_pr_branch_name(
+        slug,
+        time_gateway.now(),
+        objective_id=objective_id,
+    )
+    progress(click.style(f"  \u2192 Branch: {branch_name}", dim=True))
+
+    # Get trunk SHA for branch creation
+    current_step.name = "Getting trunk SHA"
+    trunk_sha = remote.get_default_branch_sha(owner=owner, repo=repo)
+
+    # Create branch from trunk
+    current_step.name = "Creating branch"
+    progress("Creating branch...")
+    remote.create_ref(
+        owner=owner,
+        repo=repo,
+        ref=f"refs/heads/{branch_name}",
+        sha=trunk_sha,
+    )
+    progress(click.style("  \u2713 Branch created", dim=True))
+
+    # Write prompt to .erk/impl-context/prompt.md
+    current_step.name = "Committing prompt file"
+    progress("Committing prompt file...")
+    remote.create_file_commit(
+        owner=owner,
+        repo=repo,
+        path=".erk/impl-context/prompt.md",
+        content=params.prompt + "\n",
+        message=f"One-shot: {params.prompt[:60]}",
+        branch=branch_name,
+    )
+    progress(click.style("  \u2713 Committed", dim=True))
+
+    # Create draft PR
+    current_step.name = "Creating draft PR"
+    progress("Creating draft PR...")
+    max_title_len = 60
+    suffix = "..." if len(params.prompt) > max_title_len else ""
+    pr_title = f"One-shot: {params.prompt[:max_title_len]}{suffix}"
+    created_at = time_gateway.now().replace(tzinfo=UTC).isoformat()
+    metadata_body = format_plan_header_body(
+        created_at=created_at,
+        created_by=submitted_by,
+        worktree_name=None,
+        branch_name=branch_name,
+        plan_comment_id=None,
+        last_dispatched_run_id=None,
+        last_dispatched_node_id=None,
+        last_dispatched_at=None,
+        last_local_impl_at=None,
+        last_local_impl_event=None,
+        last_local_impl_session=None,
+        last_local_impl_user=None,
+        last_remote_impl_at=None,
+        last_remote_impl_run_id=None,
+        last_remote_impl_session_id=None,
+        source_repo=None,
+        objective_issue=objective_id,
+        node_ids=None,
+        created_from_session=None,
+        created_from_workflow_run_url=None,
+        last_learn_session=None,
+        last_learn_at=None,
+        learn_status=None,
+        learn_plan_issue=None,
+        learn_plan_pr=None,
+        learned_from_issue=None,
+        lifecycle_stage="prompted",
+    )
+    placeholder_content = (
+        f"_One-shot: plan content will be populated by one-shot workflow._\n\n"
+        f"**Prompt:** {params.prompt}"
+    )
+    pr_body_initial = build_plan_stage_body(metadata_body, placeholder_content, summary="")
+    pr_number = remote.create_pull_request(
+        owner=owner,
+        repo=repo,
+        head=branch_name,
+        base=trunk,
+        title=pr_title,
+        body=pr_body_initial,
+        draft=True,
+    )
+
+    # Add footer now that we have the PR number
+    footer = build_pr_body_footer(pr_number)
+    remote.update_pull_request_body(
+        owner=owner,
+        repo=repo,
+        pr_number=pr_number,
+        body=pr_body_initial + footer,
+    )
+
+    # Add plan labels
+    remote.add_labels(
+        owner=owner,
+        repo=repo,
+        issue_number=pr_number,
+        labels=("erk-pr",),
+    )
+    progress(click.style(f"  \u2192 PR #{pr_number}", dim=True))
+
+    # Build workflow inputs
+    max_input_len = 500
+    truncated_prompt = params.prompt[:max_input_len]
+    if len(params.prompt) > max_input_len:
+        truncated_prompt += "... (full prompt committed to .erk/impl-context/prompt.md)"
+
+    inputs: dict[str, str] = {
+        "prompt": truncated_prompt,
+        "branch_name": branch_name,
+        "pr_number": str(pr_number),
+        "submitted_by": submitted_by,
+        "pr_backend": "planned_pr",
+    }
+    if params.model is not None:
+        inputs["model_name"] = params.model
+    inputs["plan_issue_number"] = str(pr_number)
+    inputs.update(params.extra_workflow_inputs)
+    return branch_name, pr_number, inputs
+
+
+def _post_one_shot_queued_comment(
+    *,
+    remote: RemoteGitHub,
+    owner: str,
+    repo: str,
+    pr_number: int,
+    branch_name: str,
+    run_id: str,
+    submitted_by: str,
+    prompt: str,
+    time_gateway: Time,
+    quiet: bool,
+) -> OneShotDispatchResult:
+    """Post the queued event comment (best-effort) and build the result."""
+    run_url = construct_workflow_run_url(owner, repo, run_id)
+    queued_at = time_gateway.now().replace(tzinfo=UTC).isoformat()
+
+    try:
+        metadata_block = create_submission_queued_block(
+            queued_at=queued_at,
+            submitted_by=submitted_by,
+            pr_number=pr_number,
+            validation_results={"pr_is_open": True, "has_erk_pr_title": True},
+            expected_workflow="one-shot",
+        )
+        comment_body = render_erk_issue_event(
+            title="\U0001f504 One-Shot Dispatched",
+            metadata=metadata_block,
+            description=(
+                f"One-shot submitted by **{submitted_by}** at {queued_at}.\n\n"
+                f"**Workflow run:** {run_url}\n\n"
+                f"**Prompt:** {prompt}"
+            ),
+        )
+        remote.add_issue_comment(
+            owner=owner,
+            repo=repo,
+            issue_number=pr_number,
+            body=comment_body,
+        )
+        if not quiet:
+            user_output(click.style("\u2713", fg="green") + " Queued event comment posted")
+    except HttpError as e:
+        user_output(
+            click.style("Warning: ", fg="yellow")
+            + f"Failed to post queued comment on PR #{pr_number}: {e}"
+        )
 
     return OneShotDispatchResult(
         pr_number=pr_number,
         run_id=run_id,
         branch_name=branch_name,
-        pr_url=pr_url,
+        pr_url=f"https://github.com/{owner}/{repo}/pull/{pr_number}",
         run_url=run_url,
     )
@@ -1,10 +1,14 @@
 """Dispatch plans for remote AI implementation via GitHub Actions."""
 
 import logging
+import threading
 import tomllib
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TypeVar
 
 import click
 
@@ -35,12 +39,21 @@ from erk_shared.gateway.github.parsing import (
     construct_workflow_run_url,
     extract_owner_repo_from_github_url,
 )
+from erk_shared.gateway.github.retry import RetriesExhausted, RetryRequested, with_retries
+from erk_shared.gateway.github.run_correlation import (
+    WorkflowRunFound,
+    WorkflowRunNotFound,
+    WorkflowRunResult,
+    require_workflow_run,
+)
+from erk_shared.gateway.github.transient_errors import is_secondary_rate_limit_error
 from erk_shared.gateway.github.types import PRNotFound
+from erk_shared.gateway.http.abc import HttpError
 from erk_shared.gateway.remote_github.abc import RemoteGitHub
 from erk_shared.gateway.time.abc import Time
 from erk_shared.impl_context import build_impl_context_files
 from erk_shared.impl_folder import read_plan_ref, resolve_impl_dir
-from erk_shared.output.output import user_output
+from erk_shared.output.output import inherit_output_redirect, user_output
 from erk_shared.pr_store.planned_pr_lifecycle import extract_plan_content
 from erk_shared.pr_store.types import PrNotFound
 from erk_shared.slots.naming import is_placeholder_branch
@@ -48,6 +61,19 @@ from erk_shared.subprocess_utils import run_subprocess_with_context
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on PRs validated or dispatched at once. GitHub's secondary rate
+# limits penalize bursts of concurrent content-creating requests, so this stays
+# small.
+DISPATCH_MAX_CONCURRENCY = 4
+
+# Delays (seconds) between retries when GitHub reports a secondary rate limit.
+# Without a retry-after header, GitHub asks clients to wait at least a minute
+# before retrying and to back off exponentially. gh and HttpError surface the
+# message but not the headers, so the delays start at a minute and double.
+SECONDARY_RATE_LIMIT_DELAYS = [60.0, 120.0, 240.0]
+
+T = TypeVar("T")
+
 
 def load_workflow_config(repo_root: Path, workflow_name: str) -> dict[str, str]:
     """Load workflow config from .erk/config.toml [workflows.<name>] section.
@@ -98,6 +124,14 @@ class DispatchResult:
     workflow_url: str
 
 
+@dataclass(frozen=True)
+class DispatchFailure:
+    """A plan whose dispatch failed while the rest of its batch continued."""
+
+    pr_number: int
+    message: str
+
+
 def _build_workflow_run_url(pr_url: str, run_id: str) -> str:
     """Construct GitHub Actions workflow run URL from PR URL and run ID.
 
@@ -190,7 +224,25 @@ def _validate_planned_pr_for_dispatch(
     )
 
 
-def _dispatch_planned_pr_plan(
+@dataclass(frozen=True)
+class StartedDispatch:
+    """Planned PR whose workflow was dispatched but not yet matched to a run.
+
+    Attributes:
+        validated: The dispatched planned PR
+        distinct_id: Correlation ID passed to the workflow
+        queued_at: ISO timestamp recorded when the dispatch was sent
+        pr_body: PR body fetched before dispatch (remote mode appends the
+            run link to it; local mode re-reads the PR instead)
+    """
+
+    validated: ValidatedPlannedPR
+    distinct_id: str
+    queued_at: str
+    pr_body: str | None
+
+
+def _start_planned_pr_dispatch(
     ctx: ErkContext,
     *,
     repo: RepoContext,
@@ -198,37 +250,109 @@ def _dispatch_planned_pr_plan(
     submitted_by: str,
     base_branch: str,
     ref: str | None,
-) -> DispatchResult:
-    """Dispatch a validated planned-PR plan for implementation.
+    quiet: bool,
+) -> StartedDispatch:
+    """Dispatch the workflow for a planned-PR plan already pushed to its branch.
+
+    Expects the plan to have been committed and pushed by _push_plan_to_branch.
+    Dispatches the workflow with pr_backend="planned_pr"; the run is resolved
+    later, together with the other dispatches, via resolve_workflow_runs().
+
+    Args:
+        ctx: ErkContext with GitHub operations
+        repo: Repository context
+        validated: Validated planned PR information
+        submitted_by: GitHub username of submitter
+        base_branch: Base branch for PR
+        ref: Branch to dispatch workflow from, or None for default
+        quiet: Suppress per-step progress output (batch dispatch)
+
+    Returns:
+        StartedDispatch with the workflow's correlation ID.
+    """
+    pr_number = validated.number
+    branch_name = validated.branch_name
+
+    # Gather submission metadata
+    queued_at = datetime.now(UTC).isoformat()
+
+    # Load workflow-specific config
+    workflow_config = load_workflow_config(repo.root, DISPATCH_WORKFLOW_NAME)
+
+    # Build inputs dict with pr_backend="planned_pr"
+    if not quiet:
+        user_output("")
+        user_output(f"Dispatching workflow: {click.style(DISPATCH_WORKFLOW_NAME, fg='cyan')}")
+
+    inputs = {
+        "pr_number": str(pr_number),
+        "submitted_by": submitted_by,
+        "pr_title": validated.title,
+        "branch_name": branch_name,
+        "impl_pr_number": str(pr_number),
+        "base_branch": base_branch,
+        "pr_backend": "planned_pr",
+        **workflow_config,
+    }
+
+    distinct_id = _call_with_rate_limit_backoff(
+        ctx.time,
+        f"dispatch workflow for PR #{pr_number}",
+        lambda: ctx.github.start_workflow(
+            repo_root=repo.root,
+            workflow=DISPATCH_WORKFLOW_NAME,
+            inputs=inputs,
+            ref=ref,
+        ),
+    )
+    if not quiet:
+        user_output(click.style("✓", fg="green") + " Workflow dispatched.")
+    return StartedDispatch(
+        validated=validated, distinct_id=distinct_id, queued_at=queued_at, pr_body=None
+    )
+
+
+def _push_plan_to_branch(
+    ctx: ErkContext,
+    *,
+    repo: RepoContext,
+    validated: ValidatedPlannedPR,
+    quiet: bool,
+) -> None:
+    """Commit a planned-PR plan's impl-context files to its branch and push.
 
     For planned-PR plans, the branch and PR already exist. This function:
     - Syncs local branch ref to remote using git plumbing (no checkout)
     - Commits .erk/impl-context/ files directly to branch (no checkout)
-    - Pushes and triggers the workflow with pr_backend="planned_pr"
+    - Pushes the branch to origin
+
+    Mutates the local repository, so callers dispatching several plans at
+    once must not run it concurrently.
 
     Args:
         ctx: ErkContext with git operations
         repo: Repository context
         validated: Validated planned PR information
-        submitted_by: GitHub username of submitter
-        base_branch: Base branch for PR
+        quiet: Suppress per-step progress output (batch dispatch)
 
-    Returns:
-        DispatchResult with URLs and identifiers.
+    Raises:
+        UserFacingCliError: If the plan content is missing, the checked-out
+            branch has uncommitted changes, or the push fails.
     """
     pr_number = validated.number
     branch_name = validated.branch_name
 
     # Fetch plan content via ManagedPrBackend
-    user_output("Fetching plan content...")
+    if not quiet:
+        user_output("Fetching plan content...")
     result = ctx.pr_store.get_managed_pr(repo.root, str(pr_number))
     if isinstance(result, PrNotFound):
-        user_output(click.style("Error: ", fg="red") + f"PR #{pr_number}: plan content not found")
-        raise SystemExit(1)
+        raise UserFacingCliError(f"PR #{pr_number}: plan content not found", error_type="cli_error")
     plan = result
 
     # Sync local branch ref to remote (no checkout required)
-    user_output(f"Syncing branch: {click.style(branch_name, fg='cyan')}")
+    if not quiet:
+        user_output(f"Syncing branch: {click.style(branch_name, fg='cyan')}")
     ctx.git.remote.fetch_branch(repo.root, "origin", branch_name)
     checked_out_path = ctx.git.worktree.is_branch_checked_out(repo.root, branch_name)
     if checked_out_path is None:
@@ -239,7 +363,8 @@ def _dispatch_planned_pr_plan(
             sync_branch_to_sha(ctx, repo.root, branch_name, remote_sha)
 
     # Commit impl-context files directly to branch (no checkout required)
-    user_output("Committing plan to branch...")
+    if not quiet:
+        user_output("Committing plan to branch...")
     files = build_impl_context_files(
         plan_content=plan.body,
         pr_number=str(pr_number),
@@ -273,36 +398,36 @@ def _dispatch_planned_pr_plan(
     )
     if isinstance(push_result, PushError):
         raise UserFacingCliError(push_result.message, error_type="cli_error")
-    user_output(click.style("✓", fg="green") + " Branch pushed to remote")
+    if not quiet:
+        user_output(click.style("✓", fg="green") + " Branch pushed to remote")
 
-    # Gather submission metadata
-    queued_at = datetime.now(UTC).isoformat()
-
-    # Load workflow-specific config
-    workflow_config = load_workflow_config(repo.root, DISPATCH_WORKFLOW_NAME)
 
-    # Build inputs dict with pr_backend="planned_pr"
-    user_output("")
-    user_output(f"Dispatching workflow: {click.style(DISPATCH_WORKFLOW_NAME, fg='cyan')}")
+def _finish_planned_pr_dispatch(
+    ctx: ErkContext,
+    *,
+    repo: RepoContext,
+    started: StartedDispatch,
+    run_id: str,
+    submitted_by: str,
+    quiet: bool,
+) -> DispatchResult:
+    """Record a resolved dispatch: metadata, PR body run link, queued comment.
 
-    inputs = {
-        "pr_number": str(pr_number),
-        "submitted_by": submitted_by,
-        "pr_title": validated.title,
-        "branch_name": branch_name,
-        "impl_pr_number": str(pr_number),
-        "base_branch": base_branch,
-        "pr_backend": "planned_pr",
-        **workflow_config,
-    }
+    Args:
+        ctx: ErkContext with GitHub operations
+        repo: Repository context
+        started: Dispatch returned by _start_planned_pr_dispatch()
+        run_id: Workflow run ID resolved for the dispatch
+        submitted_by: GitHub username of submitter
+        quiet: Suppress per-step progress output (batch dispatch); warnings
+            are still printed
 
-    run_id = ctx.github.trigger_workflow(
-        repo_root=repo.root,
-        workflow=DISPATCH_WORKFLOW_NAME,
-        inputs=inputs,
-        ref=ref,
-    )
-    user_output(click.style("✓", fg="green") + " Workflow dispatched.")
+    Returns:
+        DispatchResult with URLs and identifiers.
+    """
+    validated = started.validated
+    pr_number = validated.number
+    queued_at = started.queued_at
 
     # Compute workflow URL
     workflow_url = _build_workflow_run_url(validated.url, run_id)
@@ -317,10 +442,12 @@ def _dispatch_planned_pr_plan(
             run_id=run_id,
             dispatched_at=queued_at,
         )
-        user_output(click.style("✓", fg="green") + " Dispatch metadata written")
+        if not quiet:
+            user_output(click.style("✓", fg="green") + " Dispatch metadata written")
     except Exception as e:
         user_output(
-            click.style("Warning: ", fg="yellow") + f"Failed to update dispatch metadata: {e}"
+            click.style("Warning: ", fg="yellow")
+            + f"Failed to update dispatch metadata for PR #{pr_number}: {e}"
         )
 
     # Update PR body with workflow run link (best-effort)
@@ -359,13 +486,15 @@ def _dispatch_planned_pr_plan(
             ),
         )
 
-        user_output("Posting queued event comment...")
+        if not quiet:
+            user_output("Posting queued event comment...")
         ctx.pr_backend.add_comment(repo.root, str(pr_number), comment_body)
-        user_output(click.style("✓", fg="green") + " Queued event comment posted")
+        if not quiet:
+            user_output(click.style("✓", fg="green") + " Queued event comment posted")
     except Exception as e:
         user_output(
             click.style("Warning: ", fg="yellow")
-            + f"Failed to post queued comment: {e}\n"
+            + f"Failed to post queued comment on PR #{pr_number}: {e}\n"
             + "Workflow is already running."
         )
 
@@ -443,7 +572,7 @@ def _validate_planned_pr_for_dispatch_remote(
     )
 
 
-def _dispatch_planned_pr_plan_remote(
+def _start_planned_pr_dispatch_remote(
     remote: RemoteGitHub,
     time_gateway: Time,
     *,
@@ -453,10 +582,11 @@ def _dispatch_planned_pr_plan_remote(
     submitted_by: str,
     base_branch: str,
     ref: str | None,
-) -> DispatchResult:
+    quiet: bool,
+) -> StartedDispatch:
     """Dispatch a validated planned-PR plan via RemoteGitHub REST API.
 
-    This is the remote counterpart of _dispatch_planned_pr_plan. It uses
+    This is the remote counterpart of _start_planned_pr_dispatch. It uses
     the RemoteGitHub gateway to commit impl-context files and dispatch
     the workflow, without requiring a local git clone.
 
@@ -469,23 +599,28 @@ def _dispatch_planned_pr_plan_remote(
         submitted_by: GitHub username of submitter
         base_branch: Base branch for implementation
         ref: Branch to dispatch workflow from, or None for default
+        quiet: Suppress per-step progress output (batch dispatch)
 
     Returns:
-        DispatchResult with URLs and identifiers.
+        StartedDispatch with the workflow's correlation ID.
+
+    Raises:
+        UserFacingCliError: If the plan content cannot be fetched.
     """
     pr_number = validated.number
     branch_name = validated.branch_name
 
     # Fetch plan content from the PR body
-    user_output("Fetching plan content...")
+    if not quiet:
+        user_output("Fetching plan content...")
     issue = remote.get_issue(owner=owner, repo=repo_name, number=pr_number)
     if isinstance(issue, IssueNotFound):
-        user_output(click.style("Error: ", fg="red") + f"PR #{pr_number}: plan content not found")
-        raise SystemExit(1)
+        raise UserFacingCliError(f"PR #{pr_number}: plan content not found", error_type="cli_error")
     plan_content = extract_plan_content(issue.body) if issue.body else ""
 
     # Commit impl-context files to the plan branch via REST API
-    user_output("Committing plan to branch...")
+    if not quiet:
+        user_output("Committing plan to branch...")
     now_iso = time_gateway.now().isoformat()
     files = build_impl_context_files(
         plan_content=plan_content,
@@ -497,19 +632,25 @@ def _dispatch_planned_pr_plan_remote(
         node_ids=None,
     )
     for file_path, content in files.items():
-        remote.create_file_commit(
-            owner=owner,
-            repo=repo_name,
-            path=file_path,
-            content=content,
-            message=f"Add plan for PR #{pr_number}",
-            branch=branch_name,
+        _call_with_rate_limit_backoff(
+            time_gateway,
+            f"commit {file_path} for PR #{pr_number}",
+            lambda file_path=file_path, content=content: remote.create_file_commit(
+                owner=owner,
+                repo=repo_name,
+                path=file_path,
+                content=content,
+                message=f"Add plan for PR #{pr_number}",
+                branch=branch_name,
+            ),
         )
-    user_output(click.style("\u2713", fg="green") + " Plan committed to branch")
+    if not quiet:
+        user_output(click.style("\u2713", fg="green") + " Plan committed to branch")
 
     # Dispatch workflow
     queued_at = time_gateway.now().isoformat()
-    user_output(f"\nDispatching workflow: {click.style(DISPATCH_WORKFLOW_NAME, fg='cyan')}")
+    if not quiet:
+        user_output(f"\nDispatching workflow: {click.style(DISPATCH_WORKFLOW_NAME, fg='cyan')}")
     dispatch_ref = (
         ref if ref is not None else remote.get_default_branch_name(owner=owner, repo=repo_name)
     )
@@ -522,14 +663,52 @@ def _dispatch_planned_pr_plan_remote(
         "base_branch": base_branch,
         "pr_backend": "planned_pr",
     }
-    run_id = remote.dispatch_workflow(
-        owner=owner,
-        repo=repo_name,
-        workflow=DISPATCH_WORKFLOW_NAME,
-        ref=dispatch_ref,
-        inputs=inputs,
+    distinct_id = _call_with_rate_limit_backoff(
+        time_gateway,
+        f"dispatch workflow for PR #{pr_number}",
+        lambda: remote.start_workflow(
+            owner=owner,
+            repo=repo_name,
+            workflow=DISPATCH_WORKFLOW_NAME,
+            ref=dispatch_ref,
+            inputs=inputs,
+        ),
+    )
+    if not quiet:
+        user_output(click.style("\u2713", fg="green") + " Workflow dispatched.")
+    return StartedDispatch(
+        validated=validated, distinct_id=distinct_id, queued_at=queued_at, pr_body=issue.body
     )
-    user_output(click.style("\u2713", fg="green") + " Workflow dispatched.")
+
+
+def _finish_planned_pr_dispatch_remote(
+    remote: RemoteGitHub,
+    *,
+    owner: str,
+    repo_name: str,
+    started: StartedDispatch,
+    run_id: str,
+    submitted_by: str,
+    quiet: bool,
+) -> DispatchResult:
+    """Remote counterpart of _finish_planned_pr_dispatch.
+
+    Args:
+        remote: RemoteGitHub gateway
+        owner: Repository owner
+        repo_name: Repository name
+        started: Dispatch returned by _start_planned_pr_dispatch_remote()
+        run_id: Workflow run ID resolved for the dispatch
+        submitted_by: GitHub username of submitter
+        quiet: Suppress per-step progress output (batch dispatch); warnings
+            are still printed
+
+    Returns:
+        DispatchResult with URLs and identifiers.
+    """
+    validated = started.validated
+    pr_number = validated.number
+    queued_at = started.queued_at
 
     # Compute URLs
     workflow_url = construct_workflow_run_url(owner, repo_name, run_id)
@@ -537,8 +716,8 @@ def _dispatch_planned_pr_plan_remote(
 
     # Update PR body with workflow run link (best-effort)
     try:
-        if issue.body:
-            updated_body = issue.body + f"\n\n**Workflow run:** {workflow_url}"
+        if started.pr_body:
+            updated_body = started.pr_body + f"\n\n**Workflow run:** {workflow_url}"
             remote.update_pull_request_body(
                 owner=owner,
                 repo=repo_name,
@@ -570,18 +749,20 @@ def _dispatch_planned_pr_plan_remote(
                 f"**Workflow run:** {workflow_url}"
             ),
         )
-        user_output("Posting queued event comment...")
+        if not quiet:
+            user_output("Posting queued event comment...")
         remote.add_issue_comment(
             owner=owner,
             repo=repo_name,
             issue_number=pr_number,
             body=comment_body,
         )
-        user_output(click.style("\u2713", fg="green") + " Queued event comment posted")
+        if not quiet:
+            user_output(click.style("\u2713", fg="green") + " Queued event comment posted")
     except Exception as e:
         user_output(
             click.style("Warning: ", fg="yellow")
-            + f"Failed to post queued comment: {e}\n"
+            + f"Failed to post queued comment on PR #{pr_number}: {e}\n"
             + "Workflow is already running."
         )
 
@@ -596,6 +777,188 @@ def _dispatch_planned_pr_plan_remote(
     )
 
 
+def _call_with_rate_limit_backoff(
+    time_gateway: Time,
+    operation_name: str,
+    fn: Callable[[], T],
+) -> T:
+    """Call GitHub, backing off while GitHub reports a secondary rate limit.
+
+    Only secondary-rate-limit errors are retried; any other error propagates
+    immediately. fn is repeated as a whole, so it must be safe to repeat: a
+    single write request (e.g. the workflow dispatch POST) or read-only
+    polling. Never wrap a dispatch together with its run polling, or a
+    rate-limited poll would dispatch the workflow again.
+
+    Raises:
+        RuntimeError: If the rate limit persists after all retries.
+    """
+
+    def try_call() -> T | RetryRequested:
+        try:
+            return fn()
+        except (RuntimeError, HttpError) as e:
+            if is_secondary_rate_limit_error(str(e)):
+                return RetryRequested(reason=str(e))
+            raise
+
+    result = with_retries(time_gateway, operation_name, try_call, list(SECONDARY_RATE_LIMIT_DELAYS))
+    if isinstance(result, RetriesExhausted):
+        raise RuntimeError(f"GitHub secondary rate limit persisted: {result.reason}")
+    return result
+
+
+def _validate_all(
+    pr_numbers: Sequence[int],
+    validate: Callable[[int], ValidatedPlannedPR],
+) -> list[ValidatedPlannedPR]:
+    """Validate PRs concurrently, returning results in input order.
+
+    Validation stays all-or-nothing: a SystemExit raised by any validator
+    propagates once the in-flight validations finish.
+    """
+
+    def validate_one(pr_number: int) -> ValidatedPlannedPR:
+        user_output(f"Validating PR #{pr_number}...")
+        return validate(pr_number)
+
+    max_workers = min(DISPATCH_MAX_CONCURRENCY, len(pr_numbers))
+    with ThreadPoolExecutor(
+        max_workers=max_workers, initializer=inherit_output_redirect()
+    ) as executor:
+        return list(executor.map(validate_one, pr_numbers))
+
+
+def _run_isolated(
+    pr_number: int, fn: Callable[[], StartedDispatch | DispatchResult]
+) -> StartedDispatch | DispatchResult | DispatchFailure:
+    """Run one PR's step of a batch, converting its failure into a DispatchFailure."""
+    # Error boundary: one PR failing must not abort the rest of the batch.
+    # Per-PR dispatch steps raise UserFacingCliError rather than printing and
+    # exiting, so the failure message is captured here for the summary.
+    try:
+        return fn()
+    except click.ClickException as e:
+        return DispatchFailure(pr_number=pr_number, message=e.format_message())
+    except Exception as e:
+        return DispatchFailure(pr_number=pr_number, message=str(e))
+
+
+def _dispatch_all(
+    validated_prs: list[ValidatedPlannedPR],
+    *,
+    start: Callable[[ValidatedPlannedPR, bool], StartedDispatch],
+    resolve: Callable[[list[StartedDispatch]], dict[str, WorkflowRunResult]],
+    finish: Callable[[StartedDispatch, str, bool], DispatchResult],
+) -> None:
+    """Dispatch validated PRs, resolve their runs, and print the summary.
+
+    start and finish take a quiet flag. A single PR is dispatched inline with
+    full step-by-step output, so its errors surface exactly as before. Batches
+    start and finish dispatches quietly across at most DISPATCH_MAX_CONCURRENCY
+    workers, print one [n/total] line per PR, and resolve every run in one
+    correlation loop in between. A PR whose run was not found, skipped or
+    cancelled fails on its own; the others are still finished. Failures are
+    listed with their error after the summary and make the command exit
+    non-zero.
+    """
+    if len(validated_prs) == 1:
+        v = validated_prs[0]
+        user_output(f"Dispatching PR #{v.number}...")
+        user_output("")
+        started = start(v, False)
+        user_output("")
+        run_id = require_workflow_run(resolve([started])[started.distinct_id])
+        user_output("")
+        result = finish(started, run_id, False)
+        user_output("")
+        _print_dispatch_summary([result])
+        return
+
+    count = len(validated_prs)
+    max_workers = min(DISPATCH_MAX_CONCURRENCY, count)
+    user_output(f"Dispatching {count} PR(s), up to {max_workers} at a time...")
+    user_output("")
+
+    outcomes: dict[int, StartedDispatch | DispatchResult | DispatchFailure] = {}
+    with ThreadPoolExecutor(
+        max_workers=max_workers, initializer=inherit_output_redirect()
+    ) as executor:
+        futures = {
+            executor.submit(_run_isolated, v.number, lambda v=v: start(v, True)): i
+            for i, v in enumerate(validated_prs)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            outcome = future.result()
+            outcomes[i] = outcome
+            progress = f"[{len(outcomes)}/{count}]"
+            if isinstance(outcome, DispatchFailure):
+                user_output(
+                    f"{progress} "
+                    + click.style("\u2717", fg="red")
+                    + f" PR #{validated_prs[i].number} failed"
+                )
+            else:
+                user_output(
+                    f"{progress} "
+                    + click.style("\u2713", fg="green")
+                    + f" PR #{validated_prs[i].number} dispatched"
+                )
+    user_output("")
+
+    started = [o for o in (outcomes[i] for i in range(count)) if isinstance(o, StartedDispatch)]
+    if started:
+        user_output(f"Resolving {len(started)} workflow run(s)...")
+        try:
+            run_results = resolve(started)
+        except (RuntimeError, HttpError) as e:
+            # The runs listing itself failed, so no run could be matched
+            run_results = {o.distinct_id: WorkflowRunNotFound(message=str(e)) for o in started}
+
+        run_ids: dict[str, str] = {}
+        for i, o in outcomes.items():
+            if not isinstance(o, StartedDispatch):
+                continue
+            run_result = run_results[o.distinct_id]
+            if isinstance(run_result, WorkflowRunFound):
+                run_ids[o.distinct_id] = run_result.run_id
+            else:
+                # The workflow was dispatched; only matching it to a run failed
+                outcomes[i] = DispatchFailure(
+                    pr_number=o.validated.number,
+                    message=f"workflow dispatched but run not resolved: {run_result.message}",
+                )
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, initializer=inherit_output_redirect()
+        ) as executor:
+            finish_futures = {
+                i: executor.submit(
+                    _run_isolated,
+                    o.validated.number,
+                    lambda o=o: finish(o, run_ids[o.distinct_id], True),
+                )
+                for i, o in outcomes.items()
+                if isinstance(o, StartedDispatch)
+            }
+            for i, future in finish_futures.items():
+                outcomes[i] = future.result()
+
+    ordered = [outcomes[i] for i in range(count)]
+    results = [o for o in ordered if isinstance(o, DispatchResult)]
+    failures = [o for o in ordered if isinstance(o, DispatchFailure)]
+
+    if results:
+        _print_dispatch_summary(results)
+    if failures:
+        user_output("")
+        user_output(click.style("Error: ", fg="red") + f"{len(failures)} PR(s) failed to dispatch:")
+        for f in failures:
+            user_output(f"  #{f.pr_number}: {f.message}")
+        raise SystemExit(1)
+
+
 def _detect_pr_number_from_context(
     ctx: ErkContext,
     repo: RepoContext,
@@ -668,16 +1031,15 @@ def _dispatch_remote(
     user_output(f"Validating {len(pr_numbers)} PR(s)...")
     user_output("")
 
-    validated_prs: list[ValidatedPlannedPR] = []
-    for pr_number in pr_numbers:
-        user_output(f"Validating PR #{pr_number}...")
-        validated = _validate_planned_pr_for_dispatch_remote(
+    validated_prs = _validate_all(
+        pr_numbers,
+        lambda pr_number: _validate_planned_pr_for_dispatch_remote(
             remote,
             owner=owner,
             repo_name=repo_name,
             pr_number=pr_number,
-        )
-        validated_prs.append(validated)
+        ),
+    )
 
     user_output("")
     user_output(click.style("\u2713", fg="green") + f" All {len(validated_prs)} PR(s) validated")
@@ -687,15 +1049,11 @@ def _dispatch_remote(
         user_output(f"  #{v.number}: {click.style(v.title, fg='yellow')}")
     user_output("")
 
-    # Dispatch all validated plans
-    results: list[DispatchResult] = []
-    for i, v in enumerate(validated_prs):
-        if len(validated_prs) > 1:
-            user_output(f"--- Dispatching PR {i + 1}/{len(validated_prs)}: #{v.number} ---")
-        else:
-            user_output(f"Dispatching PR #{v.number}...")
-        user_output("")
-        result = _dispatch_planned_pr_plan_remote(
+    # Dispatch all validated plans, then resolve every run in one polling loop
+    dispatched_at = ctx.time.now()
+    _dispatch_all(
+        validated_prs,
+        start=lambda v, quiet: _start_planned_pr_dispatch_remote(
             remote,
             ctx.time,
             owner=owner,
@@ -704,11 +1062,29 @@ def _dispatch_remote(
             submitted_by=submitted_by,
             base_branch=base_branch,
             ref=ref,
-        )
-        results.append(result)
-        user_output("")
-
-    _print_dispatch_summary(results)
+            quiet=quiet,
+        ),
+        resolve=lambda started: _call_with_rate_limit_backoff(
+            ctx.time,
+            "resolve workflow runs",
+            lambda: remote.resolve_workflow_runs(
+                owner=owner,
+                repo=repo_name,
+                workflow=DISPATCH_WORKFLOW_NAME,
+                distinct_ids=[d.distinct_id for d in started],
+                dispatched_at=dispatched_at,
+            ),
+        ),
+        finish=lambda started, run_id, quiet: _finish_planned_pr_dispatch_remote(
+            remote,
+            owner=owner,
+            repo_name=repo_name,
+            started=started,
+            run_id=run_id,
+            submitted_by=submitted_by,
+            quiet=quiet,
+        ),
+    )
 
 
 def _dispatch_local(
@@ -790,11 +1166,10 @@ def _dispatch_local(
     user_output(f"Validating {len(pr_numbers)} planned-PR(s)...")
     user_output("")
 
-    validated_planned_prs: list[ValidatedPlannedPR] = []
-    for pr_number in pr_numbers:
-        user_output(f"Validating PR #{pr_number}...")
-        validated_pr = _validate_planned_pr_for_dispatch(ctx, repo, pr_number)
-        validated_planned_prs.append(validated_pr)
+    validated_planned_prs = _validate_all(
+        pr_numbers,
+        lambda pr_number: _validate_planned_pr_for_dispatch(ctx, repo, pr_number),
+    )
 
     user_output("")
     user_output(
@@ -806,27 +1181,47 @@ def _dispatch_local(
         user_output(f"  #{v.number}: {click.style(v.title, fg='yellow')}")
     user_output("")
 
-    # Dispatch all validated plans
-    results: list[DispatchResult] = []
-    for i, v in enumerate(validated_planned_prs):
-        if len(validated_planned_prs) > 1:
-            count = len(validated_planned_prs)
-            user_output(f"--- Dispatching PR {i + 1}/{count}: #{v.number} ---")
-        else:
-            user_output(f"Dispatching PR #{v.number}...")
-        user_output("")
-        result = _dispatch_planned_pr_plan(
+    # Dispatch all validated plans, then resolve every run in one polling loop.
+    # Branch sync, commit, and push mutate the local repository, so they run
+    # one PR at a time; workflow dispatch and PR metadata updates overlap.
+    dispatched_at = ctx.time.now()
+    git_lock = threading.Lock()
+
+    def start(v: ValidatedPlannedPR, quiet: bool) -> StartedDispatch:
+        with git_lock:
+            _push_plan_to_branch(ctx, repo=repo, validated=v, quiet=quiet)
+        return _start_planned_pr_dispatch(
             ctx,
             repo=repo,
             validated=v,
             submitted_by=submitted_by,
             base_branch=target_branch,
             ref=ref,
+            quiet=quiet,
         )
-        results.append(result)
-        user_output("")
 
-    _print_dispatch_summary(results)
+    _dispatch_all(
+        validated_planned_prs,
+        start=start,
+        resolve=lambda started: _call_with_rate_limit_backoff(
+            ctx.time,
+            "resolve workflow runs",
+            lambda: ctx.github.resolve_workflow_runs(
+                repo_root=repo.root,
+                workflow=DISPATCH_WORKFLOW_NAME,
+                distinct_ids=[d.distinct_id for d in started],
+                dispatched_at=dispatched_at,
+            ),
+        ),
+        finish=lambda started, run_id, quiet: _finish_planned_pr_dispatch(
+            ctx,
+            repo=repo,
+            started=started,
+            run_id=run_id,
+            submitted_by=submitted_by,
+            quiet=quiet,
+        ),
+    )
 
 
 def _print_dispatch_summary(results: list[DispatchResult]) -> None:
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import click
 
+from erk.cli.ensure import UserFacingCliError
 from erk.core.context import ErkContext
 from erk.core.repo_discovery import RepoContext
 from erk_shared.output.output import user_output
@@ -14,8 +15,11 @@ def sync_branch_to_sha(ctx: ErkContext, repo_root: Path, branch: str, target_sha
 
     When the branch is NOT checked out, uses update_local_ref (fast ref update).
     When the branch IS checked out, uses 'git reset --hard' in the worktree
-    to atomically sync ref + index + working tree. Refuses if the worktree
-    has uncommitted changes.
+    to atomically sync ref + index + working tree.
+
+    Raises:
+        UserFacingCliError: If the branch is checked out in a worktree with
+            uncommitted changes.
     """
     checked_out_path = ctx.git.worktree.is_branch_checked_out(repo_root, branch)
     if checked_out_path is None:
@@ -27,13 +31,12 @@ def sync_branch_to_sha(ctx: ErkContext, repo_root: Path, branch: str, target_sha
         return
 
     if ctx.git.status.has_uncommitted_changes(checked_out_path):
-        user_output(
-            click.style("Error: ", fg="red")
-            + f"Branch '{branch}' is checked out at {checked_out_path} with "
+        raise UserFacingCliError(
+            f"Branch '{branch}' is checked out at {checked_out_path} with "
             f"uncommitted changes.\n\n"
-            f"Please commit or stash changes before proceeding."
+            f"Please commit or stash changes before proceeding.",
+            error_type="cli_error",
         )
-        raise SystemExit(1)
 
     # Atomically sync ref + index + working tree
     ctx.git.branch.reset_hard(checked_out_path, target_sha)
@@ -356,6 +356,7 @@ def _run_interactive_mode(
         refresh_interval=interval,
         initial_sort=initial_sort,
         cmux_integration=cmux_integration,
+        erk_context=ctx,
     )
     app.run()
 
@@ -6,10 +6,21 @@ returns structured JSON output.
 
 import click
 
-from erk.cli.commands.pr.list.operation import PrListRequest, PrListResult, run_pr_list
+from erk.cli.commands.pr.list.operation import (
+    PrListRequest,
+    PrListResult,
+    PrListStreamResult,
+    run_pr_list,
+    stream_pr_list,
+)
 from erk.cli.repo_resolution import resolve_owner_repo
 from erk.core.context import ErkContext
-from erk_shared.agentclick.machine_command import MachineCommandError, machine_command
+from erk.tui.data.types import PrRowData
+from erk_shared.agentclick.machine_command import (
+    MachineCommandError,
+    MachineStreamSpec,
+    machine_command,
+)
 from erk_shared.agentclick.mcp_exposed import mcp_exposed
 from erk_shared.gateway.github.types import GitHubRepoId
 
@@ -25,6 +36,7 @@ from erk_shared.gateway.github.types import GitHubRepoId
 @machine_command(
     request_type=PrListRequest,
     output_types=(PrListResult,),
+    stream=MachineStreamSpec(items_key="plans", item_type=PrRowData),
 )
 @click.command("list")
 @click.pass_obj
@@ -32,8 +44,15 @@ def json_pr_list(
     ctx: ErkContext,
     *,
     request: PrListRequest,
-) -> PrListResult | MachineCommandError:
-    """List plans as structured JSON."""
+    stream_mode: bool,
+) -> PrListResult | PrListStreamResult | MachineCommandError:
+    """List plans as structured JSON.
+
+    With --stream, plans are fetched page by page and emitted as they
+    arrive, in fetch order rather than the requested sort.
+    """
     owner, repo_name = resolve_owner_repo(ctx, target_repo=None)
     repo_id = GitHubRepoId(owner=owner, repo=repo_name)
+    if stream_mode:
+        return stream_pr_list(ctx, request, repo_id=repo_id)
     return run_pr_list(ctx, request, repo_id=repo_id)
@@ -5,6 +5,7 @@ human command (pr/list_cmd.py) and machine command (json/pr/list_cmd.py) share.
 """
 
 import tempfile
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -50,6 +51,33 @@ class PrListResult:
         return {"plans": plans, "count": len(plans)}
 
 
+@dataclass(frozen=True)
+class PrListStreamResult:
+    """Streamed result for erk pr list --stream.
+
+    rows is a lazy iterator that fetches plans page by page, so serializing
+    it emits the first plans before later pages have been requested. Rows
+    are in fetch order (most recently updated first); `sort` is not applied.
+    """
+
+    rows: Iterator[PrRowData]
+
+    def iter_json_items(self) -> Iterator[dict[str, Any]]:
+        """Yield each plan as a JSON dict as soon as its page is fetched."""
+        for row in self.rows:
+            yield serialize_pr_row(row)
+
+
+# Plans requested per page when streaming
+STREAM_PAGE_SIZE = 25
+
+
+@dataclass(frozen=True)
+class _PrListQuery:
+    provider: RealPrDataProvider
+    filters: PrFilters
+
+
 def run_pr_list(
     ctx: ErkContext,
     request: PrListRequest,
@@ -66,6 +94,74 @@ def run_pr_list(
     Returns:
         PrListResult or MachineCommandError
     """
+    query = _prepare_pr_list_query(ctx, request, repo_id=repo_id)
+    if isinstance(query, MachineCommandError):
+        return query
+    provider = query.provider
+
+    rows, timings = provider.fetch_prs(query.filters)
+
+    warnings: list[str] = []
+    if timings is not None and timings.warnings:
+        warnings = list(timings.warnings)
+
+    if request.stage is not None:
+        rows = [r for r in rows if _matches_stage(r, request.stage)]
+
+    # Sort
+    if request.sort == "activity" and not isinstance(ctx.repo, NoRepoSentinel):
+        sort_key = SortKey.BRANCH_ACTIVITY
+        activity_by_plan = provider.fetch_branch_activity(rows)
+        rows = sort_plans(rows, sort_key, activity_by_plan=activity_by_plan)
+    else:
+        sort_key = SortKey.PR_ID
+        rows = sort_plans(rows, sort_key)
+
+    return PrListResult(rows=rows, warnings=warnings)
+
+
+def stream_pr_list(
+    ctx: ErkContext,
+    request: PrListRequest,
+    *,
+    repo_id: GitHubRepoId,
+) -> PrListStreamResult | MachineCommandError:
+    """Execute pr list operation, fetching rows lazily for --stream.
+
+    Nothing is fetched until the result's rows are iterated. Sorting
+    needs the whole list, so rows stay in fetch order; the stage filter
+    is applied row by row.
+
+    Args:
+        ctx: ErkContext with all dependencies
+        request: Validated request parameters
+        repo_id: Resolved GitHub repo ID
+
+    Returns:
+        PrListStreamResult or MachineCommandError
+    """
+    query = _prepare_pr_list_query(ctx, request, repo_id=repo_id)
+    if isinstance(query, MachineCommandError):
+        return query
+
+    rows = query.provider.iter_pr_rows(query.filters, page_size=STREAM_PAGE_SIZE)
+    stage = request.stage
+    if stage is not None:
+        rows = (r for r in rows if _matches_stage(r, stage))
+    return PrListStreamResult(rows=rows)
+
+
+def _matches_stage(row: PrRowData, stage: str) -> bool:
+    return strip_rich_markup(row.lifecycle_display).startswith(stage)
+
+
+def _prepare_pr_list_query(
+    ctx: ErkContext,
+    request: PrListRequest,
+    *,
+    repo_id: GitHubRepoId,
+) -> _PrListQuery | MachineCommandError:
+    """Resolve the provider and filters shared by run_pr_list and stream_pr_list."""
     http_client = ctx.http_client
     if http_client is None:
         return MachineCommandError(
@@ -107,23 +203,4 @@ def run_pr_list(
         show_pr_column=False,
         lifecycle_stage=request.stage,
     )
-
-    rows, timings = provider.fetch_prs(filters)
-
-    warnings: list[str] = []
-    if timings is not None and timings.warnings:
-        warnings = list(timings.warnings)
-
-    if request.stage is not None:
-        rows = [r for r in rows if strip_rich_markup(r.lifecycle_display).startswith(request.stage)]
-
-    # Sort
-    if request.sort == "activity" and not isinstance(ctx.repo, NoRepoSentinel):
-        sort_key = SortKey.BRANCH_ACTIVITY
-        activity_by_plan = provider.fetch_branch_activity(rows)
-        rows = sort_plans(rows, sort_key, activity_by_plan=activity_by_plan)
-    else:
-        sort_key = SortKey.PR_ID
-        rows = sort_plans(rows, sort_key)
-
-    return PrListResult(rows=rows, warnings=warnings)
+    return _PrListQuery(provider=provider, filters=filters)
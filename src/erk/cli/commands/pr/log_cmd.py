@@ -1,9 +1,24 @@
-"""Command to display chronological event log for a plan."""
+"""Command to display chronological event log for a plan.
+
+Events are parsed from metadata blocks in PR comments. Parsed events are kept
+in a per-PR index under ~/.erk/cache/pr-events so repeat invocations fetch only
+comments updated since the last run (via the REST `since` filter) and parse
+only bodies that are new or were edited:
+
+    <cache>/<owner>/<repo>/<pr_number>.json
+
+The index maps comment ID -> (updated_at, events) and records the newest
+updated_at seen as the fetch cursor. Deleted comments are not detected
+incrementally; `--refresh` rebuilds the index from all comments.
+"""
 
 import json
-from collections.abc import Callable
-from datetime import datetime
-from typing import Literal, TypeAlias, TypedDict
+import os
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Literal, TypeAlias, TypedDict, get_args
 
 import click
 
@@ -14,6 +29,7 @@ from erk_shared.gateway.github.issues.types import IssueNotFound
 from erk_shared.gateway.github.metadata.core import parse_metadata_blocks
 from erk_shared.gateway.github.metadata.types import BlockKeys
 from erk_shared.gateway.github.types import GitHubRepoId
+from erk_shared.gateway.remote_github.types import RemoteIssueComment
 from erk_shared.output.output import user_output
 
 # Event type literals
@@ -26,6 +42,8 @@ EventType: TypeAlias = Literal[
     "worktree-created",
 ]
 
+PR_EVENT_INDEX_VERSION = 1
+
 
 # Event metadata types
 class PlanCreatedMetadata(TypedDict, total=False):
@@ -107,12 +125,42 @@ EventExtractor: TypeAlias = Callable[[dict], Event | None]
     is_flag=True,
     help="Output events as JSON instead of human-readable timeline",
 )
+@click.option(
+    "--event-type",
+    "event_types",
+    type=click.Choice(get_args(EventType)),
+    multiple=True,
+    help="Only show events of this type (repeatable)",
+)
+@click.option(
+    "--since",
+    "since",
+    type=str,
+    default=None,
+    help="Only show events at or after this ISO 8601 time",
+)
+@click.option(
+    "--until",
+    "until",
+    type=str,
+    default=None,
+    help="Only show events at or before this ISO 8601 time",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Rebuild the cached event index from all comments",
+)
 @resolved_repo_option
 @click.pass_obj
 def pr_log(
     ctx: ErkContext,
     identifier: str,
     output_json: bool,
+    event_types: tuple[str, ...],
+    since: str | None,
+    until: str | None,
+    refresh: bool,
     *,
     repo_id: GitHubRepoId,
 ) -> None:
@@ -133,9 +181,15 @@ def pr_log(
         # View events as JSON for scripting
         $ erk pr log 42 --json
 
+        # Only workflow starts since a given day
+        $ erk pr log 42 --event-type workflow-started --since 2024-01-15
+
         # View from outside a git repo
         $ erk pr log 42 --repo owner/repo
     """
+    since_time = _parse_time_bound(since, param_hint="--since")
+    until_time = _parse_time_bound(until, param_hint="--until")
+
     try:
         remote = get_remote_github(ctx)
 
@@ -146,12 +200,22 @@ def pr_log(
             user_output(click.style("Error: ", fg="red") + f"PR '{identifier}' not found")
             raise SystemExit(1)
 
-        comment_bodies = remote.get_issue_comments(
-            owner=repo_id.owner, repo=repo_id.repo, number=pr_number
-        )
+        index_path = _event_index_path(ctx, repo_id=repo_id, pr_number=pr_number)
+        index = _EMPTY_EVENT_INDEX if refresh else _load_event_index(index_path)
 
-        events = _extract_events_from_comments(comment_bodies)
-        events.sort(key=lambda e: e["timestamp"])
+        comments = remote.get_issue_comments_since(
+            owner=repo_id.owner, repo=repo_id.repo, number=pr_number, since=index.cursor
+        )
+        updated = _update_event_index(index, comments)
+        if index_path is not None and updated != index:
+            _save_event_index(index_path, updated)
+
+        events = _filter_events(
+            _indexed_events(updated),
+            event_types=frozenset(event_types),
+            since=since_time,
+            until=until_time,
+        )
 
         if output_json:
             _output_json(events)
@@ -163,6 +227,161 @@ def pr_log(
         raise SystemExit(1) from e
 
 
+@dataclass(frozen=True)
+class _IndexedComment:
+    """Events parsed from one comment, tagged with the version they came from."""
+
+    updated_at: str
+    events: tuple[Event, ...]
+
+
+@dataclass(frozen=True)
+class _PrEventIndex:
+    """Parsed events for one PR, keyed by comment ID.
+
+    Attributes:
+        cursor: Newest comment updated_at seen, passed as `since` on the next
+            fetch. None when no comments have been indexed.
+        comments: Indexed comments keyed by comment ID.
+    """
+
+    cursor: str | None
+    comments: dict[int, _IndexedComment]
+
+
+_EMPTY_EVENT_INDEX = _PrEventIndex(cursor=None, comments={})
+
+
+def _event_index_path(ctx: ErkContext, *, repo_id: GitHubRepoId, pr_number: int) -> Path | None:
+    """Index file under the erk installation, or None if there is none."""
+    erk_root = ctx.erk_installation.root()
+    if not erk_root.exists():
+        return None
+    return erk_root / "cache" / "pr-events" / repo_id.owner / repo_id.repo / f"{pr_number}.json"
+
+
+def _load_event_index(path: Path | None) -> _PrEventIndex:
+    """Load an index, or an empty one if it is missing, unreadable or from another version.
+
+    The index is only a cache of parsed comments, so a corrupt file is
+    rebuilt from a full fetch instead of failing the command.
+    """
+    if path is None or not path.exists():
+        return _EMPTY_EVENT_INDEX
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return _EMPTY_EVENT_INDEX
+    if not isinstance(data, dict) or data.get("version") != PR_EVENT_INDEX_VERSION:
+        return _EMPTY_EVENT_INDEX
+    try:
+        return _PrEventIndex(
+            cursor=data["cursor"],
+            comments={
+                int(comment_id): _IndexedComment(
+                    updated_at=entry["updated_at"], events=tuple(entry["events"])
+                )
+                for comment_id, entry in data["comments"].items()
+            },
+        )
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return _EMPTY_EVENT_INDEX
+
+
+def _save_event_index(path: Path, index: _PrEventIndex) -> None:
+    """Write the index atomically so concurrent invocations never see partial JSON."""
+    payload = {
+        "version": PR_EVENT_INDEX_VERSION,
+        "cursor": index.cursor,
+        "comments": {
+            str(comment_id): {"updated_at": entry.updated_at, "events": list(entry.events)}
+            for comment_id, entry in sorted(index.comments.items())
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _update_event_index(
+    index: _PrEventIndex, comments: Sequence[RemoteIssueComment]
+) -> _PrEventIndex:
+    """Merge fetched comments into the index, parsing only new or edited bodies.
+
+    The `since` filter is inclusive, so comments at the cursor are fetched
+    again; those are skipped because their updated_at is unchanged.
+    """
+    merged = dict(index.comments)
+    cursor = index.cursor
+    for comment in comments:
+        existing = merged.get(comment.id)
+        if existing is None or existing.updated_at != comment.updated_at:
+            merged[comment.id] = _IndexedComment(
+                updated_at=comment.updated_at,
+                events=tuple(_extract_events_from_comments([comment.body])),
+            )
+        if cursor is None or comment.updated_at > cursor:
+            cursor = comment.updated_at
+    return _PrEventIndex(cursor=cursor, comments=merged)
+
+
+def _indexed_events(index: _PrEventIndex) -> list[Event]:
+    """All indexed events in chronological order."""
+    events = [event for entry in index.comments.values() for event in entry.events]
+    events.sort(key=lambda e: e["timestamp"])
+    return events
+
+
+def _parse_time_bound(value: str | None, *, param_hint: str) -> datetime | None:
+    """Parse a --since/--until value; naive times are taken as UTC."""
+    if value is None:
+        return None
+    parsed = _parse_iso_time(value)
+    if parsed is None:
+        raise click.BadParameter(f"Invalid ISO 8601 time: {value}", param_hint=param_hint)
+    return parsed
+
+
+def _parse_iso_time(value: str) -> datetime | None:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def _filter_events(
+    events: list[Event],
+    *,
+    event_types: frozenset[str],
+    since: datetime | None,
+    until: datetime | None,
+) -> list[Event]:
+    """Keep events matching the type and time-range filters.
+
+    Events whose timestamp cannot be parsed are dropped when a time bound is set.
+    """
+    if not event_types and since is None and until is None:
+        return events
+    filtered: list[Event] = []
+    for event in events:
+        if event_types and event["event_type"] not in event_types:
+            continue
+        if since is not None or until is not None:
+            event_time = _parse_iso_time(event["timestamp"])
+            if event_time is None:
+                continue
+            if since is not None and event_time < since:
+                continue
+            if until is not None and event_time > until:
+                continue
+        filtered.append(event)
+    return filtered
+
+
 def _extract_events_from_comments(comment_bodies: list[str]) -> list[Event]:
     """Extract all events from comment metadata blocks.
 
@@ -50,8 +50,7 @@ from erk_shared.gateway.github.parsing import parse_git_remote_url
 from erk_shared.gateway.github.pr_footer import build_pr_body_footer
 from erk_shared.gateway.github.types import BodyText, GitHubRepoId, PRNotFound
 from erk_shared.gateway.gt.operations.finalize import ERK_SKIP_LEARN_LABEL, is_learn_plan
-from erk_shared.gateway.gt.prompts import truncate_diff
-from erk_shared.gateway.pr.diff_extraction import filter_diff_excluded_files
+from erk_shared.gateway.pr.diff_extraction import write_branch_diff
 from erk_shared.impl_context import impl_context_exists, remove_impl_context
 from erk_shared.impl_folder import (
     has_plan_ref,
@@ -60,7 +59,7 @@ from erk_shared.impl_folder import (
     save_plan_ref,
     validate_plan_linkage,
 )
-from erk_shared.scratch.scratch import write_scratch_file
+from erk_shared.scratch.scratch import new_scratch_file_path
 
 # ---------------------------------------------------------------------------
 # Utilities
@@ -583,7 +582,7 @@ def label_code_pr(ctx: ErkContext, state: SubmitState) -> SubmitState | SubmitEr
 
 
 def extract_diff(ctx: ErkContext, state: SubmitState) -> SubmitState | SubmitError:
-    """Local git diff to base branch, filter lock files, truncate, write scratch file."""
+    """Stream local git diff to base branch into a budgeted scratch file."""
     if state.skip_description:
         return state
 
@@ -595,25 +594,21 @@ def extract_diff(ctx: ErkContext, state: SubmitState) -> SubmitState | SubmitErr
             details={},
         )
 
-    pr_diff = ctx.git.analysis.get_diff_to_branch(state.cwd, state.base_branch)
-    if state.debug:
-        diff_lines = len(pr_diff.splitlines())
-        click.echo(click.style(f"   Diff retrieved ({diff_lines} lines)", dim=True))
-
-    # Filter lock files, truncate
-    pr_diff = filter_diff_excluded_files(pr_diff)
-    diff_content, was_truncated = truncate_diff(pr_diff)
-    if was_truncated and state.debug:
-        click.echo(click.style("   Diff truncated for size", dim=True))
-
-    # Write scratch file
-    diff_file = write_scratch_file(
-        diff_content,
+    # Stream from git straight into the scratch file: lock files are excluded
+    # by git, and per-file/total budgets bound what is kept
+    diff_file = new_scratch_file_path(
         session_id=state.session_id,
         suffix=".diff",
         prefix="pr-diff-",
         repo_root=state.repo_root,
     )
+    diff_result = write_branch_diff(
+        ctx.git, cwd=state.cwd, base_branch=state.base_branch, output_path=diff_file
+    )
+    if state.debug:
+        click.echo(click.style(f"   Diff retrieved ({diff_result.total_lines} lines)", dim=True))
+        if diff_result.was_truncated:
+            click.echo(click.style("   Diff truncated for size", dim=True))
 
     return dataclasses.replace(state, diff_file=diff_file)
 
@@ -16,14 +16,13 @@ import click
 from erk.cli.commands.land_cmd import _ensure_branch_not_checked_out
 from erk.cli.commands.land_learn import _create_learn_pr_for_merged_branch
 from erk.cli.commands.objective_helpers import (
-    get_objective_for_branch,
+    get_objectives_for_branches,
     run_objective_update_after_land,
 )
 from erk.cli.commands.wt.delete_cmd import _prune_worktrees_safe
 from erk.core.context import ErkContext
 from erk.core.worktree_pool import load_pool_state
 from erk_shared.context.types import RepoContext
-from erk_shared.gateway.github.types import PRNotFound
 from erk_shared.output.output import user_output
 from erk_slots.common import find_branch_assignment
 from erk_slots.unassign_cmd import execute_unassign
@@ -94,28 +93,34 @@ def detect_merged_branches(
     if not candidates:
         return []
 
-    # 4. Check PR state for each candidate
+    # 4. Check PR state for all candidates in one batched lookup
+    prs_by_branch = ctx.github.get_pr_details_by_branches(
+        main_repo_root, [info.branch for info in candidates]
+    )
+    merged_branches = [
+        info.branch
+        for info in candidates
+        if info.branch in prs_by_branch and prs_by_branch[info.branch].state == "MERGED"
+    ]
+    if not merged_branches:
+        return []
+
+    # 5. Derive objectives from the PRs fetched above (no further requests)
+    objectives = get_objectives_for_branches(ctx, merged_branches, prs_by_branch)
+
     merged: list[ReconcileBranchInfo] = []
-    for info in candidates:
-        pr_result = ctx.github.get_pr_for_branch(main_repo_root, info.branch)
-        if isinstance(pr_result, PRNotFound):
-            continue
-        if pr_result.state != "MERGED":
-            continue
-
-        # 5. Resolve metadata
-        pr_id = ctx.pr_backend.resolve_pr_number_for_branch(main_repo_root, info.branch)
-        objective_number = get_objective_for_branch(ctx, main_repo_root, info.branch)
-        worktree_path = ctx.git.worktree.find_worktree_for_branch(repo_root, info.branch)
+    for branch in merged_branches:
+        pr_result = prs_by_branch[branch]
+        worktree_path = ctx.git.worktree.find_worktree_for_branch(repo_root, branch)
 
         merged.append(
             ReconcileBranchInfo(
-                branch=info.branch,
+                branch=branch,
                 pr_number=pr_result.number,
                 pr_title=pr_result.title,
                 worktree_path=worktree_path,
-                pr_id=pr_id,
-                objective_number=objective_number,
+                pr_id=str(pr_result.number),
+                objective_number=objectives[branch],
             )
         )
 
@@ -231,7 +236,7 @@ def _cleanup_branch(
     if pool_state is not None:
         assignment = find_branch_assignment(pool_state, info.branch)
         if assignment is not None:
-            execute_unassign(ctx, repo, pool_state, assignment)
+            execute_unassign(ctx, repo, assignment)
 
     # Ensure branch is not checked out anywhere
     _ensure_branch_not_checked_out(ctx, repo_root=main_repo_root, branch=info.branch)
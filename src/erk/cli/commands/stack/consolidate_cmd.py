@@ -110,9 +110,7 @@ def _remove_worktree_slot_aware(
 
     if assignment is not None:
         # Slot worktree: unassign instead of remove
-        # state is guaranteed to be non-None since assignment was found in it
-        assert state is not None
-        execute_unassign(ctx, repo, state, assignment)
+        execute_unassign(ctx, repo, assignment)
         return (None, assignment.slot_name)
     else:
         # Non-slot worktree: remove normally
@@ -330,9 +330,7 @@ def _delete_worktree_directory(ctx: ErkContext, repo: RepoContext, wt_path: Path
 
     if assignment is not None:
         # Slot worktree: unassign instead of delete
-        # state is guaranteed to be non-None since assignment was found in it
-        assert state is not None
-        execute_unassign(ctx, repo, state, assignment)
+        execute_unassign(ctx, repo, assignment)
         user_output(
             click.style("✓", fg="green")
             + f" Unassigned slot {click.style(assignment.slot_name, fg='cyan')}"
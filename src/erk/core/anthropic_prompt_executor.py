@@ -3,25 +3,36 @@
 This module provides the AnthropicApiPromptExecutor that calls the
 Anthropic SDK directly, bypassing the CLI subprocess overhead. Used
 for lightweight operations (slug generation, commit messages) where
-low latency matters.
+low latency matters, and for batch workloads via execute_prompts_batch().
+
+One SDK client (and so one HTTP connection pool) is shared by all calls
+on an executor. Responses are streamed, so long generations are not
+subject to the non-streaming request timeout. Rate limits, overload and
+transient connection errors are retried with backoff that honors the
+server's retry-after header.
 """
 
 from __future__ import annotations
 
 import logging
 import os
-from collections.abc import Iterator
+import random
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from anthropic import Anthropic, APIError
+from anthropic import Anthropic, APIConnectionError, APIError, APIStatusError, RateLimitError
 from anthropic.types import TextBlock
 
 from erk_shared.core.prompt_executor import (
     ExecutorEvent,
     PromptExecutor,
+    PromptRequest,
     PromptResult,
 )
+from erk_shared.gateway.time.abc import Time
 
 if TYPE_CHECKING:
     from erk_shared.context.types import PermissionMode
@@ -35,13 +46,62 @@ _MODEL_ALIASES: dict[str, str] = {
 }
 
 
+MAX_ATTEMPTS = 5
+INITIAL_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+
+
 def _resolve_model(model: str) -> str:
     return _MODEL_ALIASES.get(model, model)
 
 
+def _is_retryable(exc: APIError) -> bool:
+    """Rate limits, overload/server errors and dropped connections are transient."""
+    if isinstance(exc, RateLimitError | APIConnectionError):
+        return True
+    return isinstance(exc, APIStatusError) and exc.status_code >= 500
+
+
+def _backoff_seconds(exc: APIError, *, attempt: int) -> float:
+    """Seconds to wait before retry number `attempt` (1-based).
+
+    Uses the server's retry-after header when present, otherwise exponential
+    backoff with jitter so concurrent callers do not retry in lockstep.
+    """
+    if isinstance(exc, APIStatusError):
+        retry_after = exc.response.headers.get("retry-after")
+        if retry_after is not None and retry_after.replace(".", "", 1).isdigit():
+            return min(float(retry_after), MAX_BACKOFF_SECONDS)
+    base = min(INITIAL_BACKOFF_SECONDS * 2 ** (attempt - 1), MAX_BACKOFF_SECONDS)
+    return base + random.uniform(0, base / 4)
+
+
 class AnthropicApiPromptExecutor(PromptExecutor):
     """PromptExecutor backed by the Anthropic SDK (no CLI subprocess)."""
 
+    def __init__(self, *, time: Time, base_url: str | None) -> None:
+        """Create an executor.
+
+        Args:
+            time: Time gateway used for retry backoff sleeps.
+            base_url: API base URL, or None for the SDK default (which honors
+                ANTHROPIC_BASE_URL). Pointed at a local fake server for tests
+                and throughput benchmarks.
+        """
+        self._time = time
+        self._base_url = base_url
+        self._client: Anthropic | None = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self, api_key: str) -> Anthropic:
+        """Return the shared client, creating it on first use."""
+        with self._client_lock:
+            if self._client is None:
+                # Retries are handled here so backoff is shared across the batch
+                # and observable through the Time gateway.
+                self._client = Anthropic(api_key=api_key, base_url=self._base_url, max_retries=0)
+            return self._client
+
     @property
     def prompt_label(self) -> str:
         return "Anthropic API"
@@ -89,19 +149,30 @@ class AnthropicApiPromptExecutor(PromptExecutor):
         if system_prompt is not None:
             kwargs["system"] = system_prompt
 
-        try:
-            client = Anthropic(api_key=api_key)
-            response = client.messages.create(**kwargs)
-        except APIError as exc:
-            logger.warning("Anthropic API call failed: %s", exc)
-            return PromptResult(
-                success=False,
-                output="",
-                error=str(exc),
-            )
-
-        content_block = response.content[0]
-        if not isinstance(content_block, TextBlock):
+        client = self._get_client(api_key)
+        attempt = 1
+        while True:
+            # Error boundary: SDK failures become a failed PromptResult, after
+            # retrying the transient ones.
+            try:
+                with client.messages.stream(**kwargs) as stream:
+                    response = stream.get_final_message()
+                break
+            except APIError as exc:
+                if attempt >= MAX_ATTEMPTS or not _is_retryable(exc):
+                    logger.warning("Anthropic API call failed: %s", exc)
+                    return PromptResult(
+                        success=False,
+                        output="",
+                        error=str(exc),
+                    )
+                delay = _backoff_seconds(exc, attempt=attempt)
+                logger.debug("Anthropic API call failed (%s), retrying in %.1fs", exc, delay)
+                self._time.sleep(delay)
+                attempt += 1
+
+        text_parts = [block.text for block in response.content if isinstance(block, TextBlock)]
+        if not text_parts:
             return PromptResult(
                 success=False,
                 output="",
@@ -110,10 +181,39 @@ class AnthropicApiPromptExecutor(PromptExecutor):
 
         return PromptResult(
             success=True,
-            output=content_block.text.strip(),
+            output="".join(text_parts).strip(),
             error=None,
         )
 
+    def execute_prompts_batch(
+        self,
+        requests: Sequence[PromptRequest],
+        *,
+        max_concurrency: int,
+    ) -> list[PromptResult]:
+        """Execute prompts concurrently over the shared client.
+
+        Results are returned in request order. Each prompt retries
+        independently, so one rate-limited request does not fail the batch.
+        """
+        if not requests:
+            return []
+        workers = max(1, min(max_concurrency, len(requests)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="anthropic-batch") as pool:
+            return list(
+                pool.map(
+                    lambda request: self.execute_prompt(
+                        request.prompt,
+                        model=request.model,
+                        tools=request.tools,
+                        cwd=request.cwd,
+                        system_prompt=request.system_prompt,
+                        dangerous=request.dangerous,
+                    ),
+                    requests,
+                )
+            )
+
     def execute_command_streaming(
         self,
         *,
@@ -9,9 +9,10 @@ Follows the CommitMessageGenerator pattern from src/erk/core/commit_message_gene
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
-from erk_shared.core.prompt_executor import PromptExecutor
+from erk_shared.core.prompt_executor import PromptExecutor, PromptRequest, PromptResult
 from erk_shared.naming import sanitize_worktree_name
 
 BRANCH_SLUG_SYSTEM_PROMPT = """\
@@ -72,28 +73,59 @@ class BranchSlugGenerator:
             system_prompt=BRANCH_SLUG_SYSTEM_PROMPT,
             dangerous=False,
         )
+        return _to_slug_result(result)
 
-        if not result.success:
-            return BranchSlugResult(
-                success=False,
-                slug=None,
-                error_message=result.error or "LLM execution failed",
-            )
+    def generate_batch(
+        self, titles: Sequence[str], *, max_concurrency: int
+    ) -> list[BranchSlugResult]:
+        """Generate slugs for several titles as one prompt batch.
+
+        Executors that support concurrent prompts run the batch in parallel.
+
+        Args:
+            titles: Titles to distill into slugs
+            max_concurrency: Upper bound on prompts in flight at once
 
-        slug = _postprocess_slug(result.output)
-        if slug is None:
-            return BranchSlugResult(
-                success=False,
-                slug=None,
-                error_message=f"Invalid LLM output: {result.output!r}",
+        Returns:
+            One BranchSlugResult per title, in the same order
+        """
+        requests = [
+            PromptRequest(
+                prompt=title,
+                model="haiku",
+                tools=None,
+                cwd=None,
+                system_prompt=BRANCH_SLUG_SYSTEM_PROMPT,
+                dangerous=False,
             )
+            for title in titles
+        ]
+        results = self._executor.execute_prompts_batch(requests, max_concurrency=max_concurrency)
+        return [_to_slug_result(result) for result in results]
+
+
+def _to_slug_result(result: PromptResult) -> BranchSlugResult:
+    if not result.success:
+        return BranchSlugResult(
+            success=False,
+            slug=None,
+            error_message=result.error or "LLM execution failed",
+        )
 
+    slug = _postprocess_slug(result.output)
+    if slug is None:
         return BranchSlugResult(
-            success=True,
-            slug=slug,
-            error_message=None,
+            success=False,
+            slug=None,
+            error_message=f"Invalid LLM output: {result.output!r}",
         )
 
+    return BranchSlugResult(
+        success=True,
+        slug=slug,
+        error_message=None,
+    )
+
 
 def _postprocess_slug(raw_output: str) -> str | None:
     """Clean and validate LLM slug output.
@@ -149,3 +181,18 @@ def generate_branch_slug(executor: PromptExecutor, title: str) -> str:
     if result.success and result.slug is not None:
         return result.slug
     return title
+
+
+def generate_branch_slugs(
+    executor: PromptExecutor, titles: Sequence[str], *, max_concurrency: int
+) -> list[str]:
+    """Batch form of generate_branch_slug(), returning one slug per title.
+
+    Each failed generation falls back to its raw title, as in generate_branch_slug().
+    """
+    generator = BranchSlugGenerator(executor)
+    results = generator.generate_batch(titles, max_concurrency=max_concurrency)
+    return [
+        result.slug if result.success and result.slug is not None else title
+        for title, result in zip(titles, results, strict=True)
+    ]
@@ -0,0 +1,193 @@
+"""Prompt executor that serves repeated single-shot prompts from a cache.
+
+Wraps another PromptExecutor and routes execute_prompt() and
+execute_prompts_batch() through a PromptResultCache. Only prompts whose result
+depends solely on the cache key are cached: calls with a working directory
+(which may load project context or let tools read files) and dangerous calls
+always go to the wrapped executor.
+All other methods delegate directly.
+
+Call sites that must reach the model every time (e.g. credential checks)
+opt out with `executor.uncached()`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from erk.core.prompt_cache import PromptResultCache, prompt_cache_key
+from erk_shared.core.prompt_executor import (
+    ExecutorEvent,
+    PromptExecutor,
+    PromptRequest,
+    PromptResult,
+)
+from erk_shared.debug_timing import timed_operation
+
+if TYPE_CHECKING:
+    from erk_shared.context.types import PermissionMode
+
+
+@dataclass(frozen=True)
+class CachingPromptExecutor(PromptExecutor):
+    """Composite executor: cached execute_prompt, everything else delegated.
+
+    Attributes:
+        inner: Executor that runs prompts on a cache miss and handles all
+            streaming/interactive/passthrough operations.
+        cache: On-disk prompt result cache.
+    """
+
+    inner: PromptExecutor
+    cache: PromptResultCache
+
+    @property
+    def prompt_label(self) -> str:
+        return self.inner.prompt_label
+
+    def uncached(self) -> PromptExecutor:
+        return self.inner.uncached()
+
+    def is_available(self) -> bool:
+        return self.inner.is_available()
+
+    def execute_prompt(
+        self,
+        prompt: str,
+        *,
+        model: str,
+        tools: list[str] | None,
+        cwd: Path | None,
+        system_prompt: str | None,
+        dangerous: bool,
+    ) -> PromptResult:
+        """Return a cached result when available, otherwise run and cache it."""
+        if cwd is not None or dangerous:
+            return self.inner.execute_prompt(
+                prompt,
+                model=model,
+                tools=tools,
+                cwd=cwd,
+                system_prompt=system_prompt,
+                dangerous=dangerous,
+            )
+
+        key = prompt_cache_key(model=model, system_prompt=system_prompt, prompt=prompt, tools=tools)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        with timed_operation(f"prompt ({model}, cache miss)"):
+            result = self.inner.execute_prompt(
+                prompt,
+                model=model,
+                tools=tools,
+                cwd=cwd,
+                system_prompt=system_prompt,
+                dangerous=dangerous,
+            )
+        self.cache.put(key, result)
+        return result
+
+    def execute_prompts_batch(
+        self,
+        requests: Sequence[PromptRequest],
+        *,
+        max_concurrency: int,
+    ) -> list[PromptResult]:
+        """Serve cached results and run only the misses as one inner batch."""
+        results: list[PromptResult | None] = [None] * len(requests)
+        miss_positions: list[int] = []
+        miss_keys: list[str | None] = []
+        for position, request in enumerate(requests):
+            if request.cwd is not None or request.dangerous:
+                miss_positions.append(position)
+                miss_keys.append(None)
+                continue
+            key = prompt_cache_key(
+                model=request.model,
+                system_prompt=request.system_prompt,
+                prompt=request.prompt,
+                tools=request.tools,
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[position] = cached
+            else:
+                miss_positions.append(position)
+                miss_keys.append(key)
+
+        if miss_positions:
+            with timed_operation(f"prompt batch ({len(miss_positions)} cache misses)"):
+                fetched = self.inner.execute_prompts_batch(
+                    [requests[position] for position in miss_positions],
+                    max_concurrency=max_concurrency,
+                )
+            for position, key, result in zip(miss_positions, miss_keys, fetched, strict=True):
+                if key is not None:
+                    self.cache.put(key, result)
+                results[position] = result
+
+        return [result for result in results if result is not None]
+
+    def execute_command_streaming(
+        self,
+        *,
+        command: str,
+        worktree_path: Path,
+        dangerous: bool,
+        verbose: bool = False,
+        debug: bool = False,
+        model: str | None = None,
+        permission_mode: PermissionMode,
+        allow_dangerous: bool = False,
+    ) -> Iterator[ExecutorEvent]:
+        return self.inner.execute_command_streaming(
+            command=command,
+            worktree_path=worktree_path,
+            dangerous=dangerous,
+            verbose=verbose,
+            debug=debug,
+            model=model,
+            permission_mode=permission_mode,
+            allow_dangerous=allow_dangerous,
+        )
+
+    def execute_interactive(
+        self,
+        *,
+        worktree_path: Path,
+        dangerous: bool,
+        command: str,
+        target_subpath: Path | None,
+        model: str | None = None,
+        permission_mode: PermissionMode,
+    ) -> None:
+        return self.inner.execute_interactive(
+            worktree_path=worktree_path,
+            dangerous=dangerous,
+            command=command,
+            target_subpath=target_subpath,
+            model=model,
+            permission_mode=permission_mode,
+        )
+
+    def execute_prompt_passthrough(
+        self,
+        prompt: str,
+        *,
+        model: str,
+        tools: list[str] | None,
+        cwd: Path,
+        dangerous: bool,
+    ) -> int:
+        return self.inner.execute_prompt_passthrough(
+            prompt,
+            model=model,
+            tools=tools,
+            cwd=cwd,
+            dangerous=dangerous,
+        )
@@ -8,25 +8,39 @@ from pathlib import Path
 import tomli
 
 
-def is_reminder_installed(repo_root: Path, reminder_name: str) -> bool:
-    """Check if a reminder capability is installed via state.toml.
-
-    This is a fast check designed for use in hooks where performance matters.
+def read_installed_reminders(repo_root: Path) -> frozenset[str]:
+    """Read the installed reminder names from state.toml.
 
     Args:
         repo_root: Path to the repository root.
-        reminder_name: Name of the reminder (e.g., 'devrun', 'dignified-python').
 
     Returns:
-        True if the reminder is in the installed list, False otherwise.
+        Names listed under [reminders].installed, or an empty set when
+        state.toml does not exist.
     """
     state_path = repo_root / ".erk" / "state.toml"
     if not state_path.exists():
-        return False
+        return frozenset()
 
     with state_path.open("rb") as f:
         data = tomli.load(f)
 
     reminders = data.get("reminders", {})
-    installed = reminders.get("installed", [])
-    return reminder_name in installed
+    return frozenset(reminders.get("installed", []))
+
+
+def is_reminder_installed(repo_root: Path, reminder_name: str) -> bool:
+    """Check if a reminder capability is installed via state.toml.
+
+    This is a fast check designed for use in hooks where performance matters.
+    Hooks running under @logged_hook should prefer
+    HookContext.is_reminder_installed, which reads the cached hook state.
+
+    Args:
+        repo_root: Path to the repository root.
+        reminder_name: Name of the reminder (e.g., 'devrun', 'dignified-python').
+
+    Returns:
+        True if the reminder is in the installed list, False otherwise.
+    """
+    return reminder_name in read_installed_reminders(repo_root)
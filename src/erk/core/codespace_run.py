@@ -5,6 +5,12 @@ Every remoteable command calls this with its own erk CLI string.
 """
 
 import shlex
+from datetime import datetime, timedelta
+
+# A codespace erk started or connected to this recently is still running
+# (GitHub's shortest idle timeout is 5 minutes), so starting it again only
+# adds a REST round trip before the SSH session can open.
+CODESPACE_WARM_WINDOW = timedelta(minutes=5)
 
 
 def build_codespace_ssh_command(
@@ -29,3 +35,18 @@ def build_codespace_ssh_command(
     cd_prefix = f"cd {shlex.quote(working_directory)} && " if working_directory is not None else ""
     bootstrap = "git pull && uv sync && source .venv/bin/activate"
     return f"bash -l -c '{cd_prefix}{bootstrap} && {erk_command}'"
+
+
+def is_codespace_warm(last_started_at: datetime | None, *, now: datetime) -> bool:
+    """Check whether a codespace was started recently enough to still be running.
+
+    Args:
+        last_started_at: Last recorded start from the codespace registry, or None
+        now: Current time
+
+    Returns:
+        True if the start request can be skipped
+    """
+    if last_started_at is None:
+        return False
+    return timedelta(0) <= now - last_started_at < CODESPACE_WARM_WINDOW
@@ -4,12 +4,15 @@ This module provides logging of all erk CLI invocations with context,
 similar to zsh's ~/.zsh_history. Used for debugging issues like
 "what command deleted my worktree".
 
-Log location: ~/.erk/command_history.jsonl
-Format: One JSON object per line (JSONL) for easy parsing and appending.
+Log location: ~/.erk/command_history/ (segmented, see erk_shared.segmented_log)
+Format: One JSON object per line (JSONL) in hourly segment files, compacted
+into daily segments. Queries with --since open only the segments in range.
+
+Entries written before segmentation live in ~/.erk/command_history.jsonl
+(and its rotated .jsonl.old); they are still read but no longer written.
 """
 
 import atexit
-import fcntl
 import json
 import os
 import sys
@@ -17,16 +20,23 @@ import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 from erk_shared.gateway.erk_installation.abc import ErkInstallation
 from erk_shared.gateway.erk_installation.real import RealErkInstallation
 from erk_shared.gateway.git.real import RealGit
+from erk_shared.segmented_log import SegmentedLog, SegmentPolicy
 
 # Environment variable to disable command logging
 ENV_DISABLE_LOG = "ERK_NO_COMMAND_LOG"
 
-# Maximum log file size in bytes (50MB)
-MAX_LOG_SIZE_BYTES = 50 * 1024 * 1024
+# History is kept until it outgrows the budget of the old rotated single
+# file scheme (50MB current + 50MB .old)
+COMMAND_LOG_POLICY = SegmentPolicy(
+    compact_after=timedelta(days=1),
+    retention=None,
+    max_total_bytes=100 * 1024 * 1024,
+)
 
 
 @dataclass(frozen=True)
@@ -44,7 +54,9 @@ class CommandLogEntry:
 
 
 def _get_log_file_path(installation: ErkInstallation | None = None) -> Path:
-    """Return path to command history log file.
+    """Return path to the legacy single-file command history log.
+
+    The segment directory is derived from it (see _get_log_store).
 
     Args:
         installation: ErkInstallation instance. If None, uses RealErkInstallation.
@@ -96,36 +108,24 @@ def get_or_generate_session_id(cwd: Path) -> str:
     return str(uuid.uuid4())
 
 
-def _rotate_log_if_needed(log_path: Path) -> None:
-    """Rotate log file if it exceeds maximum size."""
-    if not log_path.exists():
-        return
-    if log_path.stat().st_size <= MAX_LOG_SIZE_BYTES:
-        return
+def _get_log_store(log_path: Path) -> SegmentedLog:
+    """Return the segmented log stored next to the legacy log file.
 
-    # Rotate: rename current to .old (overwriting previous .old)
-    old_path = log_path.with_suffix(".jsonl.old")
-    if old_path.exists():
-        old_path.unlink()
-    log_path.rename(old_path)
+    ~/.erk/command_history.jsonl -> ~/.erk/command_history/
+    """
+    return SegmentedLog(log_path.with_suffix(""), policy=COMMAND_LOG_POLICY)
 
 
-def _write_entry(log_path: Path, entry_dict: dict[str, str | int | list[str] | None]) -> None:
-    """Write a log entry with file locking for concurrent writes."""
-    # Ensure parent directory exists
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+def _legacy_log_paths(log_path: Path) -> list[Path]:
+    """Return existing pre-segmentation log files, oldest first."""
+    candidates = [log_path.with_suffix(".jsonl.old"), log_path]
+    return [path for path in candidates if path.exists()]
 
-    # Rotate if needed (before acquiring lock to avoid holding lock during rename)
-    _rotate_log_if_needed(log_path)
 
-    # Open with append mode and exclusive lock
-    with log_path.open("a", encoding="utf-8") as f:
-        # Acquire exclusive lock for concurrent write safety
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-        try:
-            f.write(json.dumps(entry_dict) + "\n")
-        finally:
-            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+def _write_entry(log_path: Path, entry_dict: dict[str, str | int | list[str] | None]) -> None:
+    """Append a log entry to the segment for its timestamp."""
+    timestamp = datetime.fromisoformat(str(entry_dict["timestamp"]))
+    _get_log_store(log_path).append(entry_dict, timestamp=timestamp)
 
 
 def log_command_start(args: list[str], cwd: Path) -> str | None:
@@ -221,32 +221,88 @@ def read_log_entries(
     Returns:
         List of matching entries, most recent first
     """
+    if since is not None:
+        since = since.astimezone(UTC)
+    if until is not None:
+        until = until.astimezone(UTC)
+
     log_path = _get_log_file_path()
-    if not log_path.exists():
-        return []
+    records: list[dict[str, Any]] = []
+    for legacy_path in _legacy_log_paths(log_path):
+        # A legacy file holds nothing newer than its last write
+        last_write = datetime.fromtimestamp(legacy_path.stat().st_mtime, tz=UTC)
+        if since is not None and last_write < since:
+            continue
+        records.extend(_read_legacy_records(legacy_path))
+    # Completions land after their start entry, so only `since` bounds the
+    # segments read; `until` is applied per entry below.
+    records.extend(_get_log_store(log_path).read(since=since, until=None))
 
     entries: list[CommandLogEntry] = []
     completion_map: dict[str, int] = {}  # start_timestamp -> exit_code
+    command_records: list[dict[str, Any]] = []
+
+    for data in records:
+        if data.get("type") == "completion":
+            start_ts = data.get("start_timestamp")
+            exit_code = data.get("exit_code")
+            if start_ts is not None and exit_code is not None:
+                completion_map[start_ts] = exit_code
+        else:
+            command_records.append(data)
 
-    # First pass: collect completion entries
-    with log_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+    for data in command_records:
+        # Parse timestamp
+        timestamp_str = data.get("timestamp")
+        if timestamp_str is None:
+            continue
+        try:
+            timestamp = datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            continue
+
+        # Apply time filters
+        if since is not None and timestamp < since:
+            continue
+        if until is not None and timestamp > until:
+            continue
+
+        # Apply command filter
+        command = data.get("command", "")
+        if command_filter is not None and command_filter.lower() not in command.lower():
+            continue
+
+        # Apply cwd filter
+        entry_cwd = data.get("cwd", "")
+        if cwd_filter is not None and entry_cwd != cwd_filter:
+            continue
+
+        entry = CommandLogEntry(
+            timestamp=timestamp_str,
+            command=command,
+            args=tuple(data.get("args", [])),
+            cwd=entry_cwd,
+            branch=data.get("branch"),
+            exit_code=completion_map.get(timestamp_str),
+            session_id=data.get("session_id"),
+            pid=data.get("pid", 0),
+        )
+        entries.append(entry)
 
-            if data.get("type") == "completion":
-                start_ts = data.get("start_timestamp")
-                exit_code = data.get("exit_code")
-                if start_ts is not None and exit_code is not None:
-                    completion_map[start_ts] = exit_code
+    # Sort by timestamp descending (most recent first)
+    entries.sort(key=lambda e: e.timestamp, reverse=True)
+
+    # Apply limit
+    if limit is not None:
+        entries = entries[:limit]
 
-    # Second pass: collect command entries
-    with log_path.open("r", encoding="utf-8") as f:
+    return entries
+
+
+def _read_legacy_records(path: Path) -> list[dict[str, Any]]:
+    """Read JSON object records from a pre-segmentation log file."""
+    records: list[dict[str, Any]] = []
+    with path.open("r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line:
@@ -255,59 +311,9 @@ def read_log_entries(
                 data = json.loads(line)
             except json.JSONDecodeError:
                 continue
-
-            # Skip completion entries
-            if data.get("type") == "completion":
-                continue
-
-            # Parse timestamp
-            timestamp_str = data.get("timestamp")
-            if timestamp_str is None:
-                continue
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str)
-            except ValueError:
-                continue
-
-            # Apply time filters
-            if since is not None and timestamp < since:
-                continue
-            if until is not None and timestamp > until:
-                continue
-
-            # Apply command filter
-            command = data.get("command", "")
-            if command_filter is not None and command_filter.lower() not in command.lower():
-                continue
-
-            # Apply cwd filter
-            entry_cwd = data.get("cwd", "")
-            if cwd_filter is not None and entry_cwd != cwd_filter:
-                continue
-
-            # Look up exit code from completion entries
-            exit_code = completion_map.get(timestamp_str)
-
-            entry = CommandLogEntry(
-                timestamp=timestamp_str,
-                command=command,
-                args=tuple(data.get("args", [])),
-                cwd=entry_cwd,
-                branch=data.get("branch"),
-                exit_code=exit_code,
-                session_id=data.get("session_id"),
-                pid=data.get("pid", 0),
-            )
-            entries.append(entry)
-
-    # Sort by timestamp descending (most recent first)
-    entries.sort(key=lambda e: e.timestamp, reverse=True)
-
-    # Apply limit
-    if limit is not None:
-        entries = entries[:limit]
-
-    return entries
+            if isinstance(data, dict):
+                records.append(data)
+    return records
 
 
 def get_cli_args() -> list[str]:
@@ -19,9 +19,16 @@ import tomlkit
 from erk.artifacts.paths import ErkPackageInfo as ErkPackageInfo
 from erk.cli.config import load_config, load_local_config, merge_configs_with_local
 from erk.core.anthropic_prompt_executor import AnthropicApiPromptExecutor
+from erk.core.caching_prompt_executor import CachingPromptExecutor
 from erk.core.codex_prompt_executor import CodexCliPromptExecutor
 from erk.core.completion import RealCompletion
 from erk.core.fallback_prompt_executor import FallbackPromptExecutor
+from erk.core.prompt_cache import (
+    DEFAULT_PROMPT_CACHE_EVICTION_INTERVAL_SECONDS,
+    DEFAULT_PROMPT_CACHE_MAX_ENTRIES,
+    DEFAULT_PROMPT_CACHE_TTL_SECONDS,
+    PromptResultCache,
+)
 from erk.core.prompt_executor import ClaudeCliPromptExecutor
 from erk.core.repo_discovery import discover_repo_or_sentinel, ensure_erk_metadata_dir
 from erk.core.script_writer import RealScriptWriter
@@ -109,11 +116,12 @@ def select_prompt_executor(
     *,
     cli_executor: PromptExecutor,
     global_config: GlobalConfig | None,
+    time: Time,
 ) -> PromptExecutor:
     """Wrap cli_executor with FallbackPromptExecutor when API fast path is enabled."""
     if global_config is not None and global_config.anthropic_api_fast_path:
         return FallbackPromptExecutor(
-            api_executor=AnthropicApiPromptExecutor(),
+            api_executor=AnthropicApiPromptExecutor(time=time, base_url=None),
             cli_executor=cli_executor,
         )
     return cli_executor
@@ -318,14 +326,25 @@ def create_context(*, dry_run: bool, script: bool = False, debug: bool = False)
             graphite_branch_ops = DryRunGraphiteBranchOps(graphite_branch_ops)
         github = DryRunLocalGitHub(github)
 
-    # 10. Create prompt executor (optionally API-first via FallbackPromptExecutor)
+    # 10. Create prompt executor (optionally API-first via FallbackPromptExecutor),
+    # with single-shot prompt results cached under ~/.erk/cache/prompts
     cli_executor = create_prompt_executor(
         global_config=global_config,
         console=console,
     )
-    prompt_executor = select_prompt_executor(
-        cli_executor=cli_executor,
-        global_config=global_config,
+    prompt_executor = CachingPromptExecutor(
+        inner=select_prompt_executor(
+            cli_executor=cli_executor,
+            global_config=global_config,
+            time=time,
+        ),
+        cache=PromptResultCache(
+            erk_installation.root() / "cache" / "prompts",
+            time=time,
+            ttl_seconds=DEFAULT_PROMPT_CACHE_TTL_SECONDS,
+            max_entries=DEFAULT_PROMPT_CACHE_MAX_ENTRIES,
+            eviction_interval_seconds=DEFAULT_PROMPT_CACHE_EVICTION_INTERVAL_SECONDS,
+        ),
     )
 
     # 11. Create claude installation and agent launcher
@@ -1,14 +1,15 @@
 """Fallback prompt executor that tries API first, then CLI.
 
 This module provides a composite PromptExecutor that routes
-execute_prompt() through the Anthropic API when available, falling
+execute_prompt() and execute_prompts_batch() through the Anthropic API
+when available, falling
 back to the CLI executor. All other methods (streaming, interactive,
 passthrough) delegate directly to the CLI executor.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -16,6 +17,7 @@ from typing import TYPE_CHECKING
 from erk_shared.core.prompt_executor import (
     ExecutorEvent,
     PromptExecutor,
+    PromptRequest,
     PromptResult,
 )
 
@@ -75,6 +77,19 @@ class FallbackPromptExecutor(PromptExecutor):
             dangerous=dangerous,
         )
 
+    def execute_prompts_batch(
+        self,
+        requests: Sequence[PromptRequest],
+        *,
+        max_concurrency: int,
+    ) -> list[PromptResult]:
+        """Execute the batch via API if available, otherwise via CLI."""
+        if self.api_executor.is_available():
+            return self.api_executor.execute_prompts_batch(
+                requests, max_concurrency=max_concurrency
+            )
+        return self.cli_executor.execute_prompts_batch(requests, max_concurrency=max_concurrency)
+
     def execute_command_streaming(
         self,
         *,
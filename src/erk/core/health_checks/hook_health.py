@@ -8,7 +8,7 @@ from erk.core.health_checks.models import CheckResult
 def check_hook_health(repo_root: Path) -> CheckResult:
     """Check hook execution health from recent logs.
 
-    Reads logs from .erk/scratch/sessions/*/hooks/*/*.json for the last 24 hours
+    Reads hook log segments from .erk/scratch/hook-logs/ covering the last 24 hours
     and reports any failures (non-zero exit codes, exceptions).
 
     Args:
@@ -0,0 +1,192 @@
+"""Content-addressed on-disk cache for single-shot prompt results.
+
+Entries are keyed by a SHA-256 over (model, system prompt, prompt, tool set)
+and stored as one JSON file per key under the cache root:
+
+    <root>/<key[:2]>/<key>.json
+
+Entries expire after a TTL. File mtimes record the last hit. Eviction is
+amortized: at most once per eviction interval (tracked by the mtime of
+<root>/.last-eviction), a put sweeps expired entries and then the least
+recently used ones past the entry limit, so the limit is soft between sweeps.
+Only successful results are stored. Entries are written via a temp file and
+rename, and unreadable or vanished entries count as misses, so concurrent
+erk processes can share the cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from erk_shared.core.prompt_executor import PromptResult
+from erk_shared.gateway.time.abc import Time
+
+logger = logging.getLogger(__name__)
+
+PROMPT_CACHE_VERSION = 1
+DEFAULT_PROMPT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_PROMPT_CACHE_MAX_ENTRIES = 2000
+DEFAULT_PROMPT_CACHE_EVICTION_INTERVAL_SECONDS = 3600
+
+_EVICTION_MARKER_NAME = ".last-eviction"
+
+
+@dataclass(frozen=True)
+class PromptCacheStats:
+    """Hit/miss counters for one cache instance."""
+
+    hits: int
+    misses: int
+
+
+def prompt_cache_key(
+    *,
+    model: str,
+    system_prompt: str | None,
+    prompt: str,
+    tools: list[str] | None,
+) -> str:
+    """Return the content address for a prompt invocation.
+
+    Tool order does not affect the key.
+    """
+    payload = json.dumps(
+        {
+            "version": PROMPT_CACHE_VERSION,
+            "model": model,
+            "system_prompt": system_prompt,
+            "prompt": prompt,
+            "tools": sorted(tools) if tools is not None else None,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PromptResultCache:
+    """TTL + LRU bounded prompt result cache stored on disk."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        time: Time,
+        ttl_seconds: int,
+        max_entries: int,
+        eviction_interval_seconds: int,
+    ) -> None:
+        self._root = root
+        self._time = time
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._eviction_interval_seconds = eviction_interval_seconds
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> PromptCacheStats:
+        return PromptCacheStats(hits=self._hits, misses=self._misses)
+
+    def _entry_path(self, key: str) -> Path:
+        return self._root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> PromptResult | None:
+        """Return the cached result for key, or None on a miss or expired entry."""
+        entry_path = self._entry_path(key)
+        data = _read_entry(entry_path)
+        if data is None:
+            entry_path.unlink(missing_ok=True)
+            return self._record_miss(key)
+        now = self._time.now().timestamp()
+        created_at = data.get("created_at")
+        output = data.get("output")
+        if not isinstance(created_at, float | int) or not isinstance(output, str):
+            entry_path.unlink(missing_ok=True)
+            return self._record_miss(key)
+        if now - created_at > self._ttl_seconds:
+            entry_path.unlink(missing_ok=True)
+            return self._record_miss(key)
+        # mtime tracks recency of use for LRU eviction; another process may
+        # have evicted the entry since it was read, which is harmless
+        try:
+            os.utime(entry_path, (now, now))
+        except FileNotFoundError:
+            pass
+        self._hits += 1
+        logger.debug("Prompt cache hit %s (hits=%d misses=%d)", key[:12], self._hits, self._misses)
+        return PromptResult(success=True, output=output, error=None)
+
+    def put(self, key: str, result: PromptResult) -> None:
+        """Store a successful result. Failed results are never cached."""
+        if not result.success:
+            return
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        now = self._time.now().timestamp()
+        tmp_path = entry_path.with_name(
+            f".{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_text(
+            json.dumps({"created_at": now, "output": result.output}), encoding="utf-8"
+        )
+        os.utime(tmp_path, (now, now))
+        tmp_path.replace(entry_path)
+        if self._eviction_due(now):
+            self._evict(now)
+
+    def _record_miss(self, key: str) -> None:
+        self._misses += 1
+        logger.debug("Prompt cache miss %s (hits=%d misses=%d)", key[:12], self._hits, self._misses)
+        return None
+
+    def _eviction_due(self, now: float) -> bool:
+        marker = self._root / _EVICTION_MARKER_NAME
+        try:
+            last_eviction = marker.stat().st_mtime
+        except FileNotFoundError:
+            return True
+        return now - last_eviction >= self._eviction_interval_seconds
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the least recently used past the limit."""
+        marker = self._root / _EVICTION_MARKER_NAME
+        marker.touch()
+        os.utime(marker, (now, now))
+
+        live: list[tuple[float, Path]] = []
+        for path in self._root.glob("*/*.json"):
+            try:
+                last_used = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if now - last_used > self._ttl_seconds:
+                path.unlink(missing_ok=True)
+                continue
+            live.append((last_used, path))
+
+        excess = len(live) - self._max_entries
+        if excess <= 0:
+            return
+        live.sort()
+        for _, path in live[:excess]:
+            path.unlink(missing_ok=True)
+
+
+def _read_entry(entry_path: Path) -> dict[str, object] | None:
+    """Read an entry, returning None if it is missing or not a JSON object."""
+    try:
+        content = entry_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    try:
+        data = json.loads(content)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    return data
@@ -8,15 +8,18 @@ query, without going through any plan list service.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 from erk_shared.core.objective_list_service import ObjectiveListService
 from erk_shared.core.pr_list_service import PrListData
 from erk_shared.gateway.github.abc import LocalGitHub
+from erk_shared.gateway.github.issues.types import IssueInfo
 from erk_shared.gateway.github.metadata.plan_header import extract_plan_header_dispatch_info
 from erk_shared.gateway.github.types import (
     GitHubRepoLocation,
     IssueFilterState,
+    PullRequestInfo,
     WorkflowRun,
 )
 from erk_shared.gateway.time.abc import Time
@@ -59,6 +62,57 @@ class RealObjectiveListService(ObjectiveListService):
             limit=limit,
             creator=creator,
         )
+        return self._build_list_data(
+            location,
+            issues,
+            pr_linkages,
+            api_start=t0,
+            skip_workflow_runs=skip_workflow_runs,
+        )
+
+    def iter_objective_list_pages(
+        self,
+        *,
+        location: GitHubRepoLocation,
+        state: IssueFilterState,
+        limit: int | None,
+        page_size: int,
+        skip_workflow_runs: bool,
+        creator: str | None,
+        exclude_labels: list[str] | None,
+        http_client: HttpClient,
+    ) -> Iterator[PrListData]:
+        pages = self._github.iter_issues_with_pr_linkages_pages(
+            location=location,
+            labels=[_OBJECTIVE_LABEL],
+            state=state,
+            limit=limit,
+            page_size=page_size,
+            creator=creator,
+        )
+        while True:
+            t0 = self._time.monotonic()
+            page = next(pages, None)
+            if page is None:
+                return
+            yield self._build_list_data(
+                location,
+                list(page.issues),
+                page.pr_linkages,
+                api_start=t0,
+                skip_workflow_runs=skip_workflow_runs,
+            )
+
+    def _build_list_data(
+        self,
+        location: GitHubRepoLocation,
+        issues: list[IssueInfo],
+        pr_linkages: dict[int, list[PullRequestInfo]],
+        *,
+        api_start: float,
+        skip_workflow_runs: bool,
+    ) -> PrListData:
+        """Convert fetched objective issues to PrListData, adding workflow runs."""
         t1 = self._time.monotonic()
 
         plans = [github_issue_to_plan(issue) for issue in issues]
@@ -88,7 +142,7 @@ class RealObjectiveListService(ObjectiveListService):
             plans=plans,
             pr_linkages=pr_linkages,
             workflow_runs=workflow_runs,
-            api_ms=(t1 - t0) * 1000,
+            api_ms=(t1 - api_start) * 1000,
             plan_parsing_ms=(t2 - t1) * 1000,
             workflow_runs_ms=(t3 - t2) * 1000,
         )
@@ -11,6 +11,7 @@ instead of separate calls for issues (~500ms) and PR linkages (~1500ms).
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
 from erk_shared.core.pr_list_service import PrListData as PrListData
@@ -18,6 +19,7 @@ from erk_shared.core.pr_list_service import PrListService
 from erk_shared.gateway.github.abc import LocalGitHub
 from erk_shared.gateway.github.graphql_queries import GET_WORKFLOW_RUNS_BY_NODE_IDS_QUERY
 from erk_shared.gateway.github.issues.abc import GitHubIssues
+from erk_shared.gateway.github.issues.types import IssueInfo
 from erk_shared.gateway.github.metadata.plan_header import extract_plan_header_dispatch_info
 from erk_shared.gateway.github.pr_data_parsing import (
     merge_rest_graphql_pr_data,
@@ -26,6 +28,7 @@ from erk_shared.gateway.github.pr_data_parsing import (
 from erk_shared.gateway.github.types import (
     GitHubRepoLocation,
     IssueFilterState,
+    PullRequestInfo,
     WorkflowRun,
 )
 from erk_shared.gateway.time.abc import Time
@@ -38,6 +41,9 @@ from erk_shared.pr_store.planned_pr_lifecycle import (
 if TYPE_CHECKING:
     from erk_shared.gateway.http.abc import HttpClient
 
+# REST issues per_page used by get_pr_list_data() when no limit is given
+_DEFAULT_REST_LIMIT = 100
+
 
 class ManagedPrListService(PrListService):
     """PR list service for managed-PR-backed plans.
@@ -112,26 +118,86 @@ class ManagedPrListService(PrListService):
         Replicates the logic of list_plan_prs_with_details() but uses
         HttpClient.get_list() and HttpClient.graphql() directly.
         """
-        repo_id = location.repo_id
+        effective_limit = limit if limit is not None else _DEFAULT_REST_LIMIT
+        endpoint = _issues_endpoint(
+            location,
+            labels=labels,
+            state=state,
+            creator=creator,
+            per_page=effective_limit,
+            page=None,
+        )
 
         # Step 1: REST issues list with server-side filtering
-        rest_state = state.lower() if state else "open"
-        effective_limit = limit if limit is not None else 100
+        t0 = self._time.monotonic()
+        issues_data = http_client.get_list(endpoint)
+        return self._build_pr_list_data_http(
+            http_client,
+            location=location,
+            issues_data=issues_data,
+            exclude_labels=exclude_labels,
+            skip_workflow_runs=skip_workflow_runs,
+            api_start=t0,
+        )
 
-        params = [
-            f"labels={','.join(labels)}",
-            f"state={rest_state}",
-            f"per_page={effective_limit}",
-            "sort=updated",
-            "direction=desc",
-        ]
-        if creator is not None:
-            params.append(f"creator={creator}")
+    def iter_pr_list_pages(
+        self,
+        *,
+        location: GitHubRepoLocation,
+        labels: list[str],
+        state: IssueFilterState,
+        limit: int | None,
+        page_size: int,
+        skip_workflow_runs: bool,
+        creator: str | None,
+        exclude_labels: list[str] | None,
+        http_client: HttpClient,
+    ) -> Iterator[PrListData]:
+        """Fetch PR list data one REST page at a time.
 
-        endpoint = f"repos/{repo_id.owner}/{repo_id.repo}/issues?{'&'.join(params)}"
+        Requests page N+1 of the issues list only after page N has been
+        enriched and consumed. per_page stays fixed so GitHub's page numbers
+        line up; the page that crosses limit is truncated client-side.
+        """
+        remaining = limit if limit is not None else _DEFAULT_REST_LIMIT
+        page = 1
+        while remaining > 0:
+            endpoint = _issues_endpoint(
+                location,
+                labels=labels,
+                state=state,
+                creator=creator,
+                per_page=page_size,
+                page=page,
+            )
+            t0 = self._time.monotonic()
+            issues_data = http_client.get_list(endpoint)
+            yield self._build_pr_list_data_http(
+                http_client,
+                location=location,
+                issues_data=issues_data[:remaining],
+                exclude_labels=exclude_labels,
+                skip_workflow_runs=skip_workflow_runs,
+                api_start=t0,
+            )
+            if len(issues_data) < page_size:
+                return
+            remaining -= len(issues_data)
+            page += 1
 
-        t0 = self._time.monotonic()
-        issues_data = http_client.get_list(endpoint)
+    def _build_pr_list_data_http(
+        self,
+        http_client: HttpClient,
+        *,
+        location: GitHubRepoLocation,
+        issues_data: list[dict[str, Any]],
+        exclude_labels: list[str] | None,
+        skip_workflow_runs: bool,
+        api_start: float,
+    ) -> PrListData:
+        """Enrich one REST issues response into PrListData (steps 2-5)."""
+        repo_id = location.repo_id
+        t0 = api_start
 
         # Filter to PRs only (items with pull_request key)
         pr_items = [item for item in issues_data if "pull_request" in item]
@@ -310,6 +376,35 @@ class ManagedPrListService(PrListService):
         return workflow_runs
 
 
+def _issues_endpoint(
+    location: GitHubRepoLocation,
+    *,
+    labels: list[str],
+    state: str | None,
+    creator: str | None,
+    per_page: int,
+    page: int | None,
+) -> str:
+    """Build the REST issues list endpoint, newest updates first.
+
+    page is omitted from the query when None (GitHub then returns page 1).
+    """
+    repo_id = location.repo_id
+    rest_state = state.lower() if state else "open"
+    params = [
+        f"labels={','.join(labels)}",
+        f"state={rest_state}",
+        f"per_page={per_page}",
+        "sort=updated",
+        "direction=desc",
+    ]
+    if creator is not None:
+        params.append(f"creator={creator}")
+    if page is not None:
+        params.append(f"page={page}")
+    return f"repos/{repo_id.owner}/{repo_id.repo}/issues?{'&'.join(params)}"
+
+
 def _build_enrichment_warnings(unenriched_count: int, total_count: int) -> tuple[str, ...]:
     """Build warning messages for degraded GraphQL enrichment data.
 
@@ -386,6 +481,59 @@ class RealPrListService(PrListService):
             limit=limit,
             creator=creator,
         )
+        return self._build_pr_list_data(
+            location,
+            issues,
+            pr_linkages,
+            api_start=t0,
+            skip_workflow_runs=skip_workflow_runs,
+        )
+
+    def iter_pr_list_pages(
+        self,
+        *,
+        location: GitHubRepoLocation,
+        labels: list[str],
+        state: IssueFilterState,
+        limit: int | None,
+        page_size: int,
+        skip_workflow_runs: bool,
+        creator: str | None,
+        exclude_labels: list[str] | None,
+        http_client: HttpClient,
+    ) -> Iterator[PrListData]:
+        """Fetch PR list data one GraphQL page of issues at a time."""
+        pages = self._github.iter_issues_with_pr_linkages_pages(
+            location=location,
+            labels=labels,
+            state=state,
+            limit=limit,
+            page_size=page_size,
+            creator=creator,
+        )
+        while True:
+            t0 = self._time.monotonic()
+            page = next(pages, None)
+            if page is None:
+                return
+            yield self._build_pr_list_data(
+                location,
+                list(page.issues),
+                page.pr_linkages,
+                api_start=t0,
+                skip_workflow_runs=skip_workflow_runs,
+            )
+
+    def _build_pr_list_data(
+        self,
+        location: GitHubRepoLocation,
+        issues: list[IssueInfo],
+        pr_linkages: dict[int, list[PullRequestInfo]],
+        *,
+        api_start: float,
+        skip_workflow_runs: bool,
+    ) -> PrListData:
+        """Convert fetched issues to PrListData, adding workflow runs."""
         t1 = self._time.monotonic()
 
         # Convert IssueInfo to Plan with enriched metadata
@@ -418,7 +566,7 @@ class RealPrListService(PrListService):
                     logging.warning("Failed to fetch workflow runs: %s", e)
         t3 = self._time.monotonic()
 
-        api_ms = (t1 - t0) * 1000
+        api_ms = (t1 - api_start) * 1000
         plan_parsing_ms = (t2 - t1) * 1000
         workflow_runs_ms = (t3 - t2) * 1000
 
@@ -3,10 +3,13 @@
 Provides mechanical stack-wide divergence resolution:
 1. Gets the full branch stack
 2. Fetches all remote state in one call
-3. For each non-trunk branch (bottom-to-top): checks divergence, fixes it
-4. Re-tracks all fixed branches with Graphite
-5. Restacks the entire stack
-6. Returns to the original branch
+3. Classifies every non-trunk branch from one ref listing and one worktree listing
+4. Fast-forwards all behind-only branches that are not checked out in one
+   `git update-ref --stdin` transaction
+5. Pulls with --rebase only the current branch (when behind) and diverged branches
+6. Re-tracks all fixed branches with Graphite
+7. Restacks the entire stack
+8. Returns to the original branch
 """
 
 from __future__ import annotations
@@ -16,7 +19,7 @@ from enum import Enum
 from pathlib import Path
 
 from erk_shared.context.context import ErkContext
-from erk_shared.gateway.git.abc import BranchDivergence
+from erk_shared.gateway.git.abc import LocalRefUpdate, RemoteBranchState
 from erk_shared.gateway.git.remote_ops.types import PullRebaseError
 
 
@@ -86,188 +89,212 @@ def sync_stack(ctx: ErkContext, *, repo_root: Path, cwd: Path) -> StackSyncResul
     # Phase 2: Bulk fetch
     ctx.git.remote.fetch_prune(repo_root, "origin")
 
-    # Phase 3: Per-branch sync (skip trunk, bottom-to-top)
-    results: list[BranchSyncResult] = []
-    branches_fixed: list[str] = []
-
-    for branch in stack[1:]:
-        result = _sync_branch(
-            ctx,
-            repo_root=repo_root,
-            cwd=cwd,
-            branch=branch,
-            current_branch=current_branch,
+    # Phase 3: Classify all non-trunk branches from one ref pass and one worktree listing
+    branches = stack[1:]
+    states = ctx.git.branch.get_remote_branch_states(repo_root, "origin", branches)
+    checked_out_at = {
+        worktree.branch: worktree.path
+        for worktree in ctx.git.worktree.list_worktrees(repo_root)
+        if worktree.branch is not None
+    }
+
+    results: dict[str, BranchSyncResult] = {}
+    fast_forwards: list[RemoteBranchState] = []
+    pulls: list[RemoteBranchState] = []
+    for branch in branches:
+        state = states[branch]
+        is_current = branch == current_branch
+        result = _classify_branch(
+            state,
+            is_current=is_current,
+            worktree_path=checked_out_at.get(branch),
+        )
+        if result is not None:
+            results[branch] = result
+        elif state.ahead == 0 and not is_current:
+            fast_forwards.append(state)
+        else:
+            pulls.append(state)
+
+    # Phase 4: Fast-forward every behind-only branch that is not checked out at once
+    for result in _fast_forward_branches(ctx, repo_root=repo_root, states=fast_forwards):
+        results[result.branch] = result
+
+    # Phase 5: pull --rebase for the current branch and for diverged branches
+    for state in pulls:
+        results[state.branch] = _pull_branch(
+            ctx, cwd=cwd, state=state, is_current=state.branch == current_branch
         )
-        results.append(result)
-        if result.action in (BranchSyncAction.FAST_FORWARDED, BranchSyncAction.REBASED):
-            branches_fixed.append(branch)
 
-    # Phase 3b: Re-track fixed branches with Graphite
-    for branch in branches_fixed:
-        ctx.branch_manager.retrack_branch(repo_root, branch)
+    ordered_results = tuple(results[branch] for branch in branches)
 
-    # Phase 4: Restack
+    # Phase 5b: Re-track fixed branches with Graphite
+    for result in ordered_results:
+        if result.action in (BranchSyncAction.FAST_FORWARDED, BranchSyncAction.REBASED):
+            ctx.branch_manager.retrack_branch(repo_root, result.branch)
+
+    # Phase 6: Restack
     restack_success, restack_error = ctx.graphite.restack(cwd)
 
-    # Phase 5: Return to original branch if needed
+    # Phase 7: Return to original branch if needed
     actual_branch = ctx.git.branch.get_current_branch(cwd)
     if actual_branch != current_branch:
         ctx.git.branch.checkout_branch(cwd, current_branch)
 
     return StackSyncResult(
-        branch_results=tuple(results),
+        branch_results=ordered_results,
         restack_success=restack_success,
         restack_error=restack_error,
         original_branch=current_branch,
     )
 
 
-def _sync_branch(
-    ctx: ErkContext,
+def _classify_branch(
+    state: RemoteBranchState,
     *,
-    repo_root: Path,
-    cwd: Path,
-    branch: str,
-    current_branch: str,
-) -> BranchSyncResult:
-    """Sync a single branch with its remote tracking branch.
+    is_current: bool,
+    worktree_path: Path | None,
+) -> BranchSyncResult | None:
+    """Decide the outcome for branches that need no git mutation.
 
     Args:
-        ctx: ErkContext with gateway dependencies
-        repo_root: Path to the git repository root
-        cwd: Current working directory
-        branch: Branch name to sync
-        current_branch: Currently checked-out branch name
+        state: Branch compared with its remote-tracking ref
+        is_current: True if the branch is checked out in the current worktree
+        worktree_path: Worktree the branch is checked out in, if any
 
     Returns:
-        BranchSyncResult describing what happened.
+        BranchSyncResult when nothing needs to change, or None when the branch
+        must be fast-forwarded or rebased.
     """
-    # Check remote exists
-    has_remote = ctx.git.branch.branch_exists_on_remote(
-        repo_root,
-        "origin",
-        branch,
-    )
-    if not has_remote:
+    if not state.exists_on_remote:
         return BranchSyncResult(
-            branch=branch,
+            branch=state.branch,
             action=BranchSyncAction.SKIPPED_NO_REMOTE,
             detail="no remote",
         )
 
-    # Check divergence
-    divergence = ctx.git.branch.is_branch_diverged_from_remote(cwd, branch, "origin")
-
     # Already in sync
-    if divergence.ahead == 0 and divergence.behind == 0:
+    if state.ahead == 0 and state.behind == 0:
         return BranchSyncResult(
-            branch=branch,
+            branch=state.branch,
             action=BranchSyncAction.ALREADY_SYNCED,
             detail="in sync",
         )
 
     # Ahead only — local is ahead, nothing to incorporate
-    if divergence.ahead > 0 and divergence.behind == 0:
+    if state.behind == 0:
         return BranchSyncResult(
-            branch=branch,
+            branch=state.branch,
             action=BranchSyncAction.ALREADY_SYNCED,
-            detail=f"{divergence.ahead} ahead",
+            detail=f"{state.ahead} ahead",
         )
 
-    # Check if branch is checked out in another worktree
-    worktree_path = ctx.git.worktree.is_branch_checked_out(repo_root, branch)
-    is_current = branch == current_branch
-    is_checked_out_elsewhere = worktree_path is not None and not is_current
-
-    if is_checked_out_elsewhere:
+    if worktree_path is not None and not is_current:
         return BranchSyncResult(
-            branch=branch,
+            branch=state.branch,
             action=BranchSyncAction.SKIPPED_OTHER_WORKTREE,
             detail=f"checked out in {worktree_path}",
         )
 
-    # Behind only — fast-forward
-    if divergence.ahead == 0 and divergence.behind > 0:
-        return _fast_forward_branch(
-            ctx,
-            repo_root=repo_root,
-            cwd=cwd,
-            branch=branch,
-            is_current=is_current,
-            behind=divergence.behind,
-        )
+    return None
 
-    # Diverged — rebase
-    return _rebase_branch(
-        ctx,
-        repo_root=repo_root,
-        cwd=cwd,
-        branch=branch,
-        is_current=is_current,
-        divergence=divergence,
-    )
 
-
-def _fast_forward_branch(
+def _fast_forward_branches(
     ctx: ErkContext,
     *,
     repo_root: Path,
-    cwd: Path,
-    branch: str,
-    is_current: bool,
-    behind: int,
-) -> BranchSyncResult:
-    """Fast-forward a branch that is behind its remote."""
-    if is_current:
-        # Current branch — use pull --rebase
-        pull_result = ctx.git.remote.pull_rebase(cwd, "origin", branch)
-        if isinstance(pull_result, PullRebaseError):
-            return BranchSyncResult(
-                branch=branch,
-                action=BranchSyncAction.ERROR,
-                detail=pull_result.message,
-            )
-    else:
-        # Not checked out — update ref directly
-        remote_sha = ctx.git.branch.get_branch_head(
-            repo_root,
-            f"origin/{branch}",
-        )
-        if remote_sha is None:
-            return BranchSyncResult(
-                branch=branch,
+    states: list[RemoteBranchState],
+) -> list[BranchSyncResult]:
+    """Fast-forward behind-only branches that are not checked out anywhere.
+
+    All ref moves go through one update-ref transaction that verifies each
+    branch still points at the commit it was classified at. If the
+    transaction is rejected (e.g. one branch moved since it was read), each
+    branch is retried in its own transaction so the others still advance
+    and the failing ones are reported individually.
+    """
+    results: dict[str, BranchSyncResult] = {}
+    updates: list[LocalRefUpdate] = []
+    for state in states:
+        if state.remote_sha is None:
+            results[state.branch] = BranchSyncResult(
+                branch=state.branch,
                 action=BranchSyncAction.ERROR,
                 detail="could not resolve origin ref",
             )
-        ctx.git.branch.update_local_ref(repo_root, branch, remote_sha)
-
-    return BranchSyncResult(
-        branch=branch,
-        action=BranchSyncAction.FAST_FORWARDED,
-        detail=f"{behind} behind",
-    )
-
+            continue
+        updates.append(
+            LocalRefUpdate(
+                branch=state.branch,
+                target_sha=state.remote_sha,
+                expected_sha=state.local_sha,
+            )
+        )
+        results[state.branch] = BranchSyncResult(
+            branch=state.branch,
+            action=BranchSyncAction.FAST_FORWARDED,
+            detail=f"{state.behind} behind",
+        )
 
-def _rebase_branch(
+    try:
+        ctx.git.branch.update_local_refs(repo_root, updates)
+    except RuntimeError:
+        for update in updates:
+            try:
+                ctx.git.branch.update_local_refs(repo_root, [update])
+            except RuntimeError as e:
+                results[update.branch] = BranchSyncResult(
+                    branch=update.branch,
+                    action=BranchSyncAction.ERROR,
+                    detail=_ref_update_error_detail(e),
+                )
+    return [results[state.branch] for state in states]
+
+
+def _ref_update_error_detail(error: RuntimeError) -> str:
+    """Prefer git's own stderr line over the generic "Failed to ..." summary."""
+    lines = str(error).splitlines()
+    for line in lines:
+        if line.startswith("stderr: "):
+            return line.removeprefix("stderr: ")
+    return lines[0] if lines else "ref update failed"
+
+
+def _pull_branch(
     ctx: ErkContext,
     *,
-    repo_root: Path,
     cwd: Path,
-    branch: str,
+    state: RemoteBranchState,
     is_current: bool,
-    divergence: BranchDivergence,
 ) -> BranchSyncResult:
-    """Rebase a diverged branch onto its remote."""
-    detail = f"{divergence.ahead} ahead, {divergence.behind} behind"
+    """Incorporate remote commits with pull --rebase.
+
+    Used for the current branch when it is only behind, and for any diverged
+    branch; a diverged branch that is not current is checked out first.
+    """
+    if state.ahead == 0:
+        pull_result = ctx.git.remote.pull_rebase(cwd, "origin", state.branch)
+        if isinstance(pull_result, PullRebaseError):
+            return BranchSyncResult(
+                branch=state.branch,
+                action=BranchSyncAction.ERROR,
+                detail=pull_result.message,
+            )
+        return BranchSyncResult(
+            branch=state.branch,
+            action=BranchSyncAction.FAST_FORWARDED,
+            detail=f"{state.behind} behind",
+        )
 
+    detail = f"{state.ahead} ahead, {state.behind} behind"
     if is_current:
-        return _rebase_current_branch(ctx, cwd=cwd, branch=branch, detail=detail)
+        return _rebase_current_branch(ctx, cwd=cwd, branch=state.branch, detail=detail)
 
     # Not checked out — checkout, rebase, checkout back
     original_branch = ctx.git.branch.get_current_branch(cwd)
-    ctx.git.branch.checkout_branch(cwd, branch)
+    ctx.git.branch.checkout_branch(cwd, state.branch)
 
-    result = _rebase_current_branch(ctx, cwd=cwd, branch=branch, detail=detail)
+    result = _rebase_current_branch(ctx, cwd=cwd, branch=state.branch, detail=detail)
 
     # Checkout back to original branch
     if original_branch is not None:
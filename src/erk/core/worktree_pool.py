@@ -2,14 +2,28 @@
 
 Provides dataclasses and persistence functions for managing a pool of
 pre-created worktrees that can be assigned to branches on demand.
+
+pool.json is shared by every erk process working in a repository, including
+agents launched in parallel. Writes go to a temporary file that is renamed
+over pool.json, so readers never see a partially written file, and every
+write bumps a "revision" counter. Read-modify-write sequences hold
+pool_state_lock() (an advisory flock on a sibling lock file) so concurrent
+allocators cannot lose each other's updates.
 """
 
 from __future__ import annotations
 
+import fcntl
 import json
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
+POOL_LOCK_SUFFIX = ".lock"
+
 
 @dataclass(frozen=True)
 class SlotInfo:
@@ -118,10 +132,75 @@ def load_pool_state(pool_json_path: Path) -> PoolState | None:
     )
 
 
+@contextmanager
+def pool_state_lock(pool_json_path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on pool.json for a read-modify-write.
+
+    Blocks until the lock is free. The lock lives in a sibling
+    "pool.json.lock" file because pool.json itself is replaced on every
+    write. Keep the locked section short: load, decide, save.
+
+    Args:
+        pool_json_path: Path to the pool.json file
+    """
+    pool_json_path.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = pool_json_path.with_name(pool_json_path.name + POOL_LOCK_SUFFIX)
+    with lock_path.open("a", encoding="utf-8") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def try_pool_state_lock(pool_json_path: Path) -> Iterator[bool]:
+    """Try to take pool_state_lock() without waiting.
+
+    Yields True while holding the lock, or False at once if another process
+    holds it; the caller must not touch pool.json in the False case.
+
+    Args:
+        pool_json_path: Path to the pool.json file
+    """
+    pool_json_path.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = pool_json_path.with_name(pool_json_path.name + POOL_LOCK_SUFFIX)
+    with lock_path.open("a", encoding="utf-8") as lock_file:
+        # Error boundary: flock reports a held lock only by raising
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def load_pool_revision(pool_json_path: Path) -> int:
+    """Return the number of writes recorded in pool.json.
+
+    Args:
+        pool_json_path: Path to the pool.json file
+
+    Returns:
+        The stored revision, or 0 if the file does not exist or predates
+        revision tracking
+    """
+    if not pool_json_path.exists():
+        return 0
+    data = json.loads(pool_json_path.read_text(encoding="utf-8"))
+    return data.get("revision", 0)
+
+
 def save_pool_state(pool_json_path: Path, state: PoolState) -> None:
     """Save pool state to JSON file.
 
-    Creates parent directories if they don't exist.
+    Creates parent directories if they don't exist. The content is written
+    to a temporary file in the same directory and renamed over pool.json,
+    and the stored revision is incremented. Callers that loaded the state
+    they are saving should hold pool_state_lock() for the whole sequence.
 
     Args:
         pool_json_path: Path to the pool.json file
@@ -131,6 +210,7 @@ def save_pool_state(pool_json_path: Path, state: PoolState) -> None:
 
     data = {
         "version": state.version,
+        "revision": load_pool_revision(pool_json_path) + 1,
         "pool_size": state.pool_size,
         "slots": [{"name": s.name} for s in state.slots],
         "assignments": [
@@ -144,4 +224,9 @@ def save_pool_state(pool_json_path: Path, state: PoolState) -> None:
         ],
     }
 
-    pool_json_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    # Unique per process and thread so concurrent writers never share a temp file
+    tmp_path = pool_json_path.with_name(
+        f".{pool_json_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    tmp_path.replace(pool_json_path)
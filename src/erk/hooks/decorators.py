@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING, TypeVar, cast
 if TYPE_CHECKING:
     import click
 
+from erk.hooks.state import HookState, load_hook_state
 from erk_shared.context.types import NoRepoSentinel
 from erk_shared.gateway.console.real import InteractiveConsole
 from erk_shared.hooks.logging import (
@@ -46,12 +47,20 @@ class HookContext:
         repo_root: Path to the git repository root.
         scratch_dir: Session-scoped scratch directory, or None if no session_id.
         is_erk_project: True if repo_root/.erk directory exists.
+        hook_state: Cached per-worktree hook state, or None outside erk projects.
     """
 
     session_id: str | None
     repo_root: Path
     scratch_dir: Path | None
     is_erk_project: bool
+    hook_state: HookState | None
+
+    def is_reminder_installed(self, reminder_name: str) -> bool:
+        """Check a reminder capability against the cached hook state."""
+        if self.hook_state is None:
+            return False
+        return reminder_name in self.hook_state.installed_reminders
 
 
 def _read_stdin_once() -> str:
@@ -94,6 +103,7 @@ def _build_hook_context(
         HookContext with all derived values computed.
     """
     is_erk_project = (repo_root / ".erk").is_dir()
+    hook_state = load_hook_state(repo_root) if is_erk_project else None
 
     scratch_dir: Path | None = None
     if session_id is not None:
@@ -104,6 +114,7 @@ def _build_hook_context(
         repo_root=repo_root,
         scratch_dir=scratch_dir,
         is_erk_project=is_erk_project,
+        hook_state=hook_state,
     )
 
 
@@ -207,12 +218,12 @@ def logged_hook(func: F) -> F:
         original_stdin = sys.stdin
         sys.stdin = io.StringIO(stdin_data)
 
+        # Resolve repo_root from the Click context; hook logs are written there too
+        repo_root = _extract_repo_root_from_click_context(args)
+
         # Build HookContext if function accepts it and we can extract repo_root
-        if accepts_hook_ctx:
-            repo_root = _extract_repo_root_from_click_context(args)
-            if repo_root is not None:
-                hook_ctx = _build_hook_context(session_id, repo_root)
-                kwargs["hook_ctx"] = hook_ctx
+        if accepts_hook_ctx and repo_root is not None:
+            kwargs["hook_ctx"] = _build_hook_context(session_id, repo_root)
 
         # Capture stdout/stderr
         stdout_buffer = io.StringIO()
@@ -266,8 +277,9 @@ def logged_hook(func: F) -> F:
                 error_message=error_message,
             )
 
-            # Write log (only if we have a session_id)
-            write_hook_log(log)
+            # Write log (only if we have a session_id) into the hook's repo,
+            # falling back to git detection when the context has no repo
+            write_hook_log(log, repo_root)
 
             # Re-emit captured output
             sys.stdout.write(stdout_content)
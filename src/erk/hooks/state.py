@@ -0,0 +1,177 @@
+"""Per-worktree hook state shared across hook invocations.
+
+Hooks fire on every prompt and tool call, and each invocation used to
+re-derive the same facts: parse .erk/state.toml once per reminder check and
+rewrite the current session ID file. This module keeps those facts in a
+small JSON file, .erk/scratch/hook-state.json, that is read once per hook.
+
+The file records the repo root and the stat signature (mtime_ns, size) of
+.erk/state.toml it was built from. A mismatch on either rebuilds it, so
+installing or removing a capability is picked up on the next hook.
+"""
+
+import dataclasses
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from erk.core.capabilities.detection import read_installed_reminders
+
+HOOK_STATE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class HookState:
+    """Cached per-worktree values used on the hook hot path.
+
+    Attributes:
+        repo_root: Worktree root the state belongs to.
+        state_toml_signature: (mtime_ns, size) of .erk/state.toml when the
+            state was built, or None if it did not exist.
+        installed_reminders: Reminder capabilities listed in state.toml.
+        session_id: Last session ID persisted to current-session-id.
+    """
+
+    repo_root: Path
+    state_toml_signature: tuple[int, int] | None
+    installed_reminders: frozenset[str]
+    session_id: str | None
+
+
+def hook_state_path(repo_root: Path) -> Path:
+    """Return the hook state file location for a worktree."""
+    return repo_root / ".erk" / "scratch" / "hook-state.json"
+
+
+def current_session_id_path(repo_root: Path) -> Path:
+    """Return the file CLI tools read the current session ID from."""
+    return repo_root / ".erk" / "scratch" / "current-session-id"
+
+
+def _state_toml_signature(repo_root: Path) -> tuple[int, int] | None:
+    state_toml = repo_root / ".erk" / "state.toml"
+    if not state_toml.exists():
+        return None
+    stat = state_toml.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_hook_state_file(path: Path) -> HookState | None:
+    """Read the state file, returning None if it is missing or unparseable.
+
+    Hooks must never fail on a truncated or hand-edited file; a None result
+    makes load_hook_state rebuild and rewrite it.
+    """
+    try:
+        content = path.read_text(encoding="utf-8")
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict) or data.get("version") != HOOK_STATE_VERSION:
+        return None
+    repo_root = data.get("repo_root")
+    signature = data.get("state_toml_signature")
+    installed_reminders = data.get("installed_reminders", [])
+    session_id = data.get("session_id")
+    if not isinstance(repo_root, str):
+        return None
+    if signature is not None and not (
+        isinstance(signature, list)
+        and len(signature) == 2
+        and all(isinstance(part, int) for part in signature)
+    ):
+        return None
+    if not isinstance(installed_reminders, list) or not all(
+        isinstance(name, str) for name in installed_reminders
+    ):
+        return None
+    return HookState(
+        repo_root=Path(repo_root),
+        state_toml_signature=(signature[0], signature[1]) if signature is not None else None,
+        installed_reminders=frozenset(installed_reminders),
+        session_id=session_id if isinstance(session_id, str) else None,
+    )
+
+
+def _write_hook_state_file(path: Path, state: HookState) -> None:
+    """Write atomically: concurrent hooks may read the file at any time."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": HOOK_STATE_VERSION,
+        "repo_root": str(state.repo_root),
+        "state_toml_signature": (
+            list(state.state_toml_signature) if state.state_toml_signature is not None else None
+        ),
+        "installed_reminders": sorted(state.installed_reminders),
+        "session_id": state.session_id,
+    }
+    _write_atomically(path, json.dumps(payload))
+
+
+def _write_atomically(path: Path, content: str) -> None:
+    """Write via a temp file and rename so readers never see a partial file."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def load_hook_state(repo_root: Path) -> HookState:
+    """Return the hook state for an erk-managed worktree.
+
+    Reuses the state file when it was built for this repo root and the
+    current state.toml; otherwise re-reads state.toml and rewrites it.
+
+    Args:
+        repo_root: Worktree root (must contain .erk/).
+
+    Returns:
+        Valid HookState for the worktree.
+    """
+    path = hook_state_path(repo_root)
+    signature = _state_toml_signature(repo_root)
+    cached = _read_hook_state_file(path)
+    if (
+        cached is not None
+        and cached.repo_root == repo_root
+        and cached.state_toml_signature == signature
+    ):
+        return cached
+
+    state = HookState(
+        repo_root=repo_root,
+        state_toml_signature=signature,
+        installed_reminders=read_installed_reminders(repo_root),
+        session_id=cached.session_id if cached is not None else None,
+    )
+    _write_hook_state_file(path, state)
+    return state
+
+
+def record_session_id(state: HookState, session_id: str) -> HookState:
+    """Persist the current session ID, skipping the writes when unchanged.
+
+    Writes .erk/scratch/current-session-id (read by CLI tools) and the hook
+    state file only when the session differs from the last recorded one or
+    the session file has been removed.
+
+    Args:
+        state: Hook state from load_hook_state.
+        session_id: Session ID from the hook's stdin.
+
+    Returns:
+        Hook state reflecting the recorded session.
+    """
+    session_file = current_session_id_path(state.repo_root)
+    if state.session_id == session_id and session_file.exists():
+        return state
+
+    session_file.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomically(session_file, session_id)
+    updated = dataclasses.replace(state, session_id=session_id)
+    _write_hook_state_file(hook_state_path(state.repo_root), updated)
+    return updated
@@ -6,9 +6,12 @@ code review behavior. This module handles parsing and validation.
 
 import re
 from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
 
 import pathspec
+from pathspec.pattern import RegexPattern
+from pathspec.util import normalize_file
 
 from erk.review.models import (
     DiscoveryResult,
@@ -241,25 +244,64 @@ def discover_review_files(reviews_dir: Path) -> list[Path]:
     return sorted(files)
 
 
-def _matches_any_path(
-    *,
-    filename: str,
-    review_paths: tuple[str, ...],
-) -> bool:
-    """Check if a filename matches any of the review path patterns.
+@dataclass(frozen=True)
+class CompiledReviewPaths:
+    """A review's path patterns compiled once into a single matcher.
+
+    Include-only pattern lists (the common case) are joined into one regex
+    so each file costs a single search. Lists containing negations keep
+    the PathSpec, which applies gitignore's last-match-wins semantics.
+
+    Attributes:
+        filename: Review filename the patterns belong to.
+        combined: Alternation of all include patterns, or None when the
+            patterns need PathSpec evaluation.
+        spec: Compiled PathSpec for the patterns.
+    """
+
+    filename: str
+    combined: re.Pattern[str] | None
+    spec: pathspec.PathSpec
+
+    def matches(self, normalized_file: str) -> bool:
+        """Check a path already normalized with pathspec.util.normalize_file."""
+        if self.combined is not None:
+            return self.combined.search(normalized_file) is not None
+        return self.spec.match_file(normalized_file)
+
+
+def compile_review_paths(*, filename: str, review_paths: tuple[str, ...]) -> CompiledReviewPaths:
+    """Compile gitignore-style review path patterns.
 
     Uses pathspec for proper gitignore-style glob matching, including
     support for ** patterns.
 
     Args:
-        filename: File path to check.
-        review_paths: Glob patterns to match against.
+        filename: Review filename the patterns belong to.
+        review_paths: Glob patterns to compile.
 
     Returns:
-        True if the file matches at least one pattern.
+        Compiled matcher for the patterns.
     """
     spec = pathspec.PathSpec.from_lines("gitignore", review_paths)
-    return spec.match_file(filename)
+    alternatives: list[str] = []
+    for pattern in spec.patterns:
+        if pattern.include is None:
+            continue
+        if (
+            pattern.include is False
+            or not isinstance(pattern, RegexPattern)
+            or pattern.regex is None
+            or pattern.regex.groupindex
+        ):
+            return CompiledReviewPaths(filename=filename, combined=None, spec=spec)
+        alternatives.append(f"(?:{pattern.regex.pattern})")
+
+    if not alternatives:
+        return CompiledReviewPaths(filename=filename, combined=None, spec=spec)
+
+    combined = re.compile("|".join(alternatives))
+    return CompiledReviewPaths(filename=filename, combined=combined, spec=spec)
 
 
 def check_duplicate_markers(reviews: list[ParsedReview]) -> dict[str, list[str]]:
@@ -303,37 +345,68 @@ def _filter_excluded_files(
     return [f for f in changed_files if not exclude_spec.match_file(f)]
 
 
-def discover_matching_reviews(
-    *,
-    reviews_dir: Path,
-    changed_files: list[str],
-    exclude_patterns: tuple[str, ...] = (),
-) -> DiscoveryResult:
-    """Discover reviews that match the PR's changed files.
+@dataclass(frozen=True)
+class ReviewIndex:
+    """All review definitions in a directory, parsed and compiled once.
 
-    Parses all review files, validates them, checks for duplicate markers,
-    and returns reviews whose path patterns match at least one changed file.
+    Attributes:
+        reviews: Valid, enabled reviews with unique markers, in filename order.
+        matchers: Compiled path matchers, parallel to reviews.
+        disabled: Review filenames with enabled: false.
+        errors: Validation and duplicate-marker errors keyed by filename.
+    """
+
+    reviews: tuple[ParsedReview, ...]
+    matchers: tuple[CompiledReviewPaths, ...]
+    disabled: tuple[str, ...]
+    errors: dict[str, tuple[str, ...]]
+
+    def match(self, changed_files: list[str]) -> dict[str, str]:
+        """Match all changed files against all reviews in one pass.
+
+        Each file is normalized once and tested only against reviews that
+        have not matched yet; the scan stops as soon as every review has hit.
+
+        Args:
+            changed_files: File paths to match.
+
+        Returns:
+            Dict mapping each matching review filename to the first changed
+            file that triggered it.
+        """
+        hits: dict[str, str] = {}
+        pending = list(self.matchers)
+        for changed_file in changed_files:
+            if not pending:
+                break
+            normalized = normalize_file(changed_file)
+            still_pending: list[CompiledReviewPaths] = []
+            for matcher in pending:
+                if matcher.matches(normalized):
+                    hits[matcher.filename] = changed_file
+                else:
+                    still_pending.append(matcher)
+            pending = still_pending
+        return hits
+
+
+def build_review_index(reviews_dir: Path) -> ReviewIndex:
+    """Parse, validate, and compile every review definition in a directory.
+
+    Reviews that share a marker are reported as errors and left out of the
+    index.
 
     Args:
         reviews_dir: Path to the reviews directory.
-        changed_files: List of file paths changed in the PR.
 
     Returns:
-        DiscoveryResult with matching reviews, skipped reviews, and errors.
+        ReviewIndex for the directory's current contents.
     """
-    # Filter out excluded files before matching
-    filtered_files = _filter_excluded_files(
-        changed_files=changed_files,
-        exclude_patterns=exclude_patterns,
-    )
-
-    review_files = discover_review_files(reviews_dir)
-
     valid_reviews: list[ParsedReview] = []
     disabled_filenames: list[str] = []
     errors: dict[str, tuple[str, ...]] = {}
 
-    for review_file in review_files:
+    for review_file in discover_review_files(reviews_dir):
         result = parse_review_file(review_file)
 
         if not result.is_valid:
@@ -362,28 +435,52 @@ def discover_matching_reviews(
         duplicate_files = {f for files in duplicates.values() for f in files}
         valid_reviews = [r for r in valid_reviews if r.filename not in duplicate_files]
 
-    # Match reviews against changed files
-    matching_reviews: list[ParsedReview] = []
-    skipped_filenames: list[str] = []
-
-    for review in valid_reviews:
-        has_match = False
-        for changed_file in filtered_files:
-            if _matches_any_path(
-                filename=changed_file,
-                review_paths=review.frontmatter.paths,
-            ):
-                has_match = True
-                break
+    return ReviewIndex(
+        reviews=tuple(valid_reviews),
+        matchers=tuple(
+            compile_review_paths(filename=review.filename, review_paths=review.frontmatter.paths)
+            for review in valid_reviews
+        ),
+        disabled=tuple(disabled_filenames),
+        errors=errors,
+    )
+
+
+def discover_matching_reviews(
+    *,
+    reviews_dir: Path,
+    changed_files: list[str],
+    exclude_patterns: tuple[str, ...] = (),
+) -> DiscoveryResult:
+    """Discover reviews that match the PR's changed files.
+
+    Builds the review index for the directory and returns reviews whose
+    path patterns match at least one changed file.
 
-        if has_match:
-            matching_reviews.append(review)
-        else:
-            skipped_filenames.append(review.filename)
+    Args:
+        reviews_dir: Path to the reviews directory.
+        changed_files: List of file paths changed in the PR.
+
+    Returns:
+        DiscoveryResult with matching reviews, skipped reviews, and errors.
+    """
+    # Filter out excluded files before matching
+    filtered_files = _filter_excluded_files(
+        changed_files=changed_files,
+        exclude_patterns=exclude_patterns,
+    )
+
+    index = build_review_index(reviews_dir)
+    hits = index.match(filtered_files)
+
+    matching_reviews = tuple(review for review in index.reviews if review.filename in hits)
+    skipped_filenames = tuple(
+        review.filename for review in index.reviews if review.filename not in hits
+    )
 
     return DiscoveryResult(
-        reviews=tuple(matching_reviews),
-        skipped=tuple(skipped_filenames),
-        disabled=tuple(disabled_filenames),
-        errors=errors,
+        reviews=matching_reviews,
+        skipped=skipped_filenames,
+        disabled=index.disabled,
+        errors=dict(index.errors),
     )
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import subprocess
+import threading
 import time
 from collections.abc import Iterator
 from datetime import datetime
@@ -13,12 +15,21 @@ from textual.app import App, ComposeResult, SystemCommand
 from textual.binding import Binding
 from textual.containers import Container
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Header, Input, Label
 
 from erk.tui.actions.filter_actions import FilterActionsMixin
 from erk.tui.actions.navigation import NavigationActionsMixin
 from erk.tui.actions.palette import PaletteActionsMixin
 from erk.tui.commands.provider import MainListCommandProvider, RunCommandProvider
+from erk.tui.data.detail_cache import (
+    DETAIL_CACHE_SIZE,
+    PREFETCH_DEBOUNCE_SECONDS,
+    PREFETCH_RADIUS,
+    PrDetailCache,
+    PrefetchingPrService,
+    prefetch_order,
+)
 from erk.tui.data.provider_abc import PrDataProvider
 from erk.tui.data.types import FetchTimings, PrFilters, PrRowData, RunRowData
 from erk.tui.filtering.logic import filter_plans
@@ -39,6 +50,7 @@ from erk.tui.widgets.plan_table import PlanDataTable
 from erk.tui.widgets.run_table import RunDataTable
 from erk.tui.widgets.status_bar import StatusBar
 from erk.tui.widgets.view_bar import ViewBar
+from erk_shared.context.context import ErkContext
 from erk_shared.gateway.pr_service.abc import PrService
 
 
@@ -87,6 +99,7 @@ class ErkDashApp(
         Binding("a", "toggle_all_users", "All Users", show=False),
         Binding("b", "view_nodes", "Nodes", show=False),
         Binding("x", "one_shot_prompt", "One-Shot"),
+        Binding("ctrl+x", "cancel_operation", "Cancel Op", show=False),
         Binding("right", "next_view", "Next View", show=False, priority=True),
         Binding("left", "previous_view", "Previous View", show=False, priority=True),
     ]
@@ -114,6 +127,7 @@ class ErkDashApp(
         refresh_interval: float = 15.0,
         initial_sort: SortState | None = None,
         cmux_integration: bool = False,
+        erk_context: ErkContext | None = None,
     ) -> None:
         """Initialize the dashboard app.
 
@@ -124,13 +138,20 @@ class ErkDashApp(
             refresh_interval: Seconds between auto-refresh (0 to disable)
             initial_sort: Initial sort state (defaults to by plan number)
             cmux_integration: Whether cmux workspace integration is enabled
+            erk_context: Warm CLI context shared by in-process operations
+                (None runs every operation as an `erk` subprocess)
         """
         super().__init__()
         self._provider = provider
-        self._service = service
+        self._detail_cache = PrDetailCache(max_entries=DETAIL_CACHE_SIZE)
+        self._service = PrefetchingPrService(wrapped=service, cache=self._detail_cache)
+        self._prefetch_timer: Timer | None = None
         self._plan_filters = filters
         self._refresh_interval = refresh_interval
         self._cmux_integration = cmux_integration
+        self._erk_context = erk_context
+        self._operation_cancel_events: dict[str, threading.Event] = {}
+        self._operation_processes: dict[str, subprocess.Popen[str]] = {}
         self._table: PlanDataTable | None = None
         self._run_table: RunDataTable | None = None
         self._status_bar: StatusBar | None = None
@@ -334,12 +355,16 @@ class ErkDashApp(
         # Apply filter and sort
         self._rows = self._apply_filter_and_sort(rows)
 
+        # Detail payloads may have changed with the list; refetch around the cursor
+        self._detail_cache.invalidate()
+
         if self._table is not None:
             self._loading_label.display = False
             # Only show plan table if not in runs view
             if self._view_mode != ViewMode.RUNS:
                 self._table.display = True
             self._table.populate(self._rows)
+        self._schedule_detail_prefetch()
 
         if self._status_bar is not None:
             noun = self._display_name_for_view(self._view_mode).lower()
@@ -421,6 +446,32 @@ class ErkDashApp(
                 # Fallback to default severity for unknown values
                 self.notify(message)
 
+    def _schedule_detail_prefetch(self) -> None:
+        """Prefetch detail payloads near the cursor once it stops moving.
+
+        Restarts the debounce timer on every call, so only the row the
+        cursor settles on (and its neighbours) is prefetched.
+        """
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+        self._prefetch_timer = self.set_timer(
+            PREFETCH_DEBOUNCE_SECONDS, self._start_detail_prefetch
+        )
+
+    def _start_detail_prefetch(self) -> None:
+        """Start prefetching the rows around the cursor (cancels any prior prefetch)."""
+        self._prefetch_timer = None
+        if self._view_mode == ViewMode.RUNS or self._table is None:
+            return
+        cursor_row = self._table.cursor_row
+        if cursor_row is None or cursor_row < 0 or cursor_row >= len(self._rows):
+            return
+        rows = [
+            self._rows[index]
+            for index in prefetch_order(cursor_row, len(self._rows), radius=PREFETCH_RADIUS)
+        ]
+        self._prefetch_details_async(rows, objective=self._view_mode == ViewMode.OBJECTIVES)
+
     def _start_refresh_timer(self) -> None:
         """Start the auto-refresh countdown timer."""
         self._seconds_remaining = int(self._refresh_interval)
@@ -567,6 +618,11 @@ class ErkDashApp(
         """Handle Enter/double-click on row - show plan details."""
         self.action_show_detail()
 
+    @on(PlanDataTable.RowHighlighted)
+    def on_row_highlighted(self, event: PlanDataTable.RowHighlighted) -> None:
+        """Handle cursor movement - prefetch details for rows near the cursor."""
+        self._schedule_detail_prefetch()
+
     @on(Input.Changed, "#filter-input")
     def on_filter_changed(self, event: Input.Changed) -> None:
         """Handle filter input text changes."""
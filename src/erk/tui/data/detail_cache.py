@@ -0,0 +1,207 @@
+"""Prefetch cache for the on-demand PR detail payloads shown by the dashboard.
+
+The plan body, review comment and check run modals each fetch their payload
+from GitHub when opened, so every open pays a full round trip. The dashboard
+instead prefetches those payloads for the rows around the cursor into a
+bounded LRU cache, and PrefetchingPrService serves the modals' fetches from
+that cache.
+
+Entries are tagged with a cache generation. A list refresh calls
+invalidate(), which clears the cache and bumps the generation, so a prefetch
+that started before the refresh cannot store a payload fetched for the old
+list.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal, TypeVar, cast
+
+from erk.tui.data.types import PrRowData
+from erk_shared.gateway.browser.abc import BrowserLauncher
+from erk_shared.gateway.clipboard.abc import Clipboard
+from erk_shared.gateway.github.types import PRCheckRun, PRReviewThread
+from erk_shared.gateway.pr_service.abc import PrService
+
+# Entries kept across all payload kinds (a row has at most three)
+DETAIL_CACHE_SIZE = 64
+
+# Rows on each side of the cursor whose payloads are prefetched
+PREFETCH_RADIUS = 2
+
+# Cursor must rest this long before a prefetch starts, so scrolling quickly
+# through the list does not fetch every row it passes
+PREFETCH_DEBOUNCE_SECONDS = 0.15
+
+DetailKind = Literal["pr_content", "objective_content", "comments", "checks"]
+DetailKey = tuple[DetailKind, int]
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class PrDetailCache:
+    """Thread-safe LRU cache of detail payloads keyed by (kind, pr_number)."""
+
+    def __init__(self, *, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[DetailKey, object] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Current generation; changes whenever the cache is invalidated."""
+        with self._lock:
+            return self._generation
+
+    def lookup(self, key: DetailKey) -> object:
+        """Return the cached payload, or _MISSING if absent.
+
+        Marks the entry as most recently used.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return _MISSING
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def store(self, key: DetailKey, value: object, *, generation: int) -> None:
+        """Store a payload fetched during `generation`.
+
+        Dropped if the cache was invalidated since the fetch started.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every entry and start a new generation."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def prefetch_order(cursor_row: int, row_count: int, *, radius: int) -> list[int]:
+    """Row indices to prefetch, nearest to the cursor first.
+
+    Rows below the cursor come before rows above it at the same distance,
+    since scrolling down is the common direction.
+    """
+    order: list[int] = []
+    for distance in range(radius + 1):
+        for index in (cursor_row + distance, cursor_row - distance):
+            if 0 <= index < row_count and index not in order:
+                order.append(index)
+    return order
+
+
+class PrefetchingPrService(PrService):
+    """PrService that serves detail fetches from a PrDetailCache.
+
+    Cache misses are fetched from the wrapped service and stored, so a modal
+    that is opened twice only fetches once per list generation. Every other
+    operation delegates unchanged.
+    """
+
+    def __init__(self, *, wrapped: PrService, cache: PrDetailCache) -> None:
+        self._wrapped = wrapped
+        self._cache = cache
+
+    @property
+    def repo_root(self) -> Path:
+        return self._wrapped.repo_root
+
+    @property
+    def clipboard(self) -> Clipboard:
+        return self._wrapped.clipboard
+
+    @property
+    def browser(self) -> BrowserLauncher:
+        return self._wrapped.browser
+
+    def close_pr(self, pr_number: int, pr_url: str) -> list[int]:
+        return self._wrapped.close_pr(pr_number, pr_url)
+
+    def dispatch_to_queue(self, pr_number: int, pr_url: str) -> None:
+        self._wrapped.dispatch_to_queue(pr_number, pr_url)
+
+    def fetch_pr_content(self, pr_number: int, pr_body: str) -> str | None:
+        return self._cached(
+            ("pr_content", pr_number),
+            lambda: self._wrapped.fetch_pr_content(pr_number, pr_body),
+        )
+
+    def fetch_objective_content(self, pr_number: int, pr_body: str) -> str | None:
+        return self._cached(
+            ("objective_content", pr_number),
+            lambda: self._wrapped.fetch_objective_content(pr_number, pr_body),
+        )
+
+    def get_branch_stack(self, branch: str) -> list[str] | None:
+        return self._wrapped.get_branch_stack(branch)
+
+    def fetch_check_runs(self, pr_number: int) -> list[PRCheckRun]:
+        return self._cached(
+            ("checks", pr_number), lambda: self._wrapped.fetch_check_runs(pr_number)
+        )
+
+    def fetch_unresolved_comments(self, pr_number: int) -> list[PRReviewThread]:
+        return self._cached(
+            ("comments", pr_number), lambda: self._wrapped.fetch_unresolved_comments(pr_number)
+        )
+
+    def fetch_ci_summaries(self, pr_number: int, *, comment_id: int | None) -> dict[str, str]:
+        return self._wrapped.fetch_ci_summaries(pr_number, comment_id=comment_id)
+
+    def prefetch_row(
+        self,
+        row: PrRowData,
+        *,
+        objective: bool,
+        is_cancelled: Callable[[], bool],
+    ) -> None:
+        """Fetch the uncached payloads a row's detail modals would request.
+
+        Only payloads the dashboard would actually open are fetched: the
+        body when the row has one, comments when some are unresolved, and
+        check runs when checks are failing.
+
+        Args:
+            row: Row to prefetch
+            objective: True in the Objectives view (body is objective content)
+            is_cancelled: Checked before each fetch; stops the prefetch early
+        """
+        fetches: list[Callable[[], object]] = []
+        if row.pr_body:
+            if objective:
+                fetches.append(lambda: self.fetch_objective_content(row.pr_number, row.pr_body))
+            else:
+                fetches.append(lambda: self.fetch_pr_content(row.pr_number, row.pr_body))
+        if row.total_comment_count > row.resolved_comment_count:
+            fetches.append(lambda: self.fetch_unresolved_comments(row.pr_number))
+        if row.checks_passing is False:
+            fetches.append(lambda: self.fetch_check_runs(row.pr_number))
+        for fetch in fetches:
+            if is_cancelled():
+                return
+            fetch()
+
+    def _cached(self, key: DetailKey, fetch: Callable[[], T]) -> T:
+        cached = self._cache.lookup(key)
+        if cached is not _MISSING:
+            return cast(T, cached)
+        generation = self._cache.generation
+        value = fetch()
+        self._cache.store(key, value, generation=generation)
+        return value
@@ -1,6 +1,7 @@
 """Real implementation of PrDataProvider for TUI data assembly."""
 
 import logging
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
 from erk.cli.constants import WORKFLOW_COMMAND_MAP
@@ -18,6 +19,7 @@ from erk.core.repo_discovery import NoRepoSentinel, RepoContext, ensure_erk_meta
 from erk.tui.data.provider_abc import PrDataProvider
 from erk.tui.data.types import FetchTimings, PrFilters, PrRowData, RunRowData
 from erk.tui.sorting.types import BranchActivity
+from erk_shared.core.pr_list_service import PrListData
 from erk_shared.gateway.github.emoji import format_checks_cell, get_pr_status_emoji
 from erk_shared.gateway.github.graphql_queries import GET_WORKFLOW_RUNS_BY_NODE_IDS_QUERY
 from erk_shared.gateway.github.issues.types import IssueInfo
@@ -134,15 +136,85 @@ class RealPrDataProvider(PrDataProvider):
         worktree_by_pr_number = self._build_worktree_mapping()
         t_wt_end = self._ctx.time.monotonic()
 
-        plans = plan_data.plans
-
         # Transform to PrRowData
         t_rows_start = self._ctx.time.monotonic()
+        rows = self._build_rows(plan_data, filters, worktree_by_pr_number=worktree_by_pr_number)
+        t_rows_end = self._ctx.time.monotonic()
+
+        timings = FetchTimings(
+            rest_issues_ms=plan_data.api_ms,
+            graphql_enrich_ms=0.0,
+            pr_parsing_ms=plan_data.plan_parsing_ms,
+            workflow_runs_ms=plan_data.workflow_runs_ms,
+            worktree_mapping_ms=(t_wt_end - t_wt_start) * 1000,
+            row_building_ms=(t_rows_end - t_rows_start) * 1000,
+            total_ms=(t_rows_end - t_total_start) * 1000,
+            warnings=plan_data.warnings,
+        )
+
+        logger.info("fetch_prs timings: %s", timings.summary())
+        self._append_timing_log(timings, len(rows))
+
+        return (rows, timings)
+
+    def iter_pr_rows(self, filters: PrFilters, *, page_size: int) -> Iterator[PrRowData]:
+        """Yield the rows fetch_prs() would return, one fetched page at a time.
+
+        Each page is fetched, enriched and turned into rows only when the
+        previous page's rows have been consumed, so callers can emit the
+        first rows before the rest of the list has been requested. Rows come
+        in fetch order (most recently updated first).
+
+        Args:
+            filters: Filter options for the query
+            page_size: Number of plans requested per page
+        """
+        needs_workflow_runs = filters.show_runs or filters.run_state is not None
+        exclude_labels = list(filters.exclude_labels) if filters.exclude_labels else None
+
+        if "erk-objective" in filters.labels:
+            pages = self._ctx.objective_list_service.iter_objective_list_pages(
+                location=self._location,
+                state=filters.state,
+                limit=filters.limit,
+                page_size=page_size,
+                skip_workflow_runs=not needs_workflow_runs,
+                creator=filters.creator,
+                exclude_labels=exclude_labels,
+                http_client=self._http_client,
+            )
+        else:
+            pages = self._ctx.pr_list_service.iter_pr_list_pages(
+                location=self._location,
+                labels=list(filters.labels),
+                state=filters.state,
+                limit=filters.limit,
+                page_size=page_size,
+                skip_workflow_runs=not needs_workflow_runs,
+                creator=filters.creator,
+                exclude_labels=exclude_labels,
+                http_client=self._http_client,
+            )
+
+        worktree_by_pr_number = self._build_worktree_mapping()
+        for plan_data in pages:
+            yield from self._build_rows(
+                plan_data, filters, worktree_by_pr_number=worktree_by_pr_number
+            )
+
+    def _build_rows(
+        self,
+        plan_data: PrListData,
+        filters: PrFilters,
+        *,
+        worktree_by_pr_number: dict[int, tuple[str, str | None]],
+    ) -> list[PrRowData]:
+        """Transform fetched plan data to PrRowData, applying the run-state filter."""
         rows: list[PrRowData] = []
         global_config = self._ctx.global_config
         use_graphite = global_config.use_graphite if global_config is not None else False
 
-        for plan in plans:
+        for plan in plan_data.plans:
             pr_number = int(plan.pr_identifier)
 
             workflow_run = plan_data.workflow_runs.get(pr_number)
@@ -162,23 +234,7 @@ class RealPrDataProvider(PrDataProvider):
                 use_graphite=use_graphite,
             )
             rows.append(row)
-        t_rows_end = self._ctx.time.monotonic()
-
-        timings = FetchTimings(
-            rest_issues_ms=plan_data.api_ms,
-            graphql_enrich_ms=0.0,
-            pr_parsing_ms=plan_data.plan_parsing_ms,
-            workflow_runs_ms=plan_data.workflow_runs_ms,
-            worktree_mapping_ms=(t_wt_end - t_wt_start) * 1000,
-            row_building_ms=(t_rows_end - t_rows_start) * 1000,
-            total_ms=(t_rows_end - t_total_start) * 1000,
-            warnings=plan_data.warnings,
-        )
-
-        logger.info("fetch_prs timings: %s", timings.summary())
-        self._append_timing_log(timings, len(rows))
-
-        return (rows, timings)
+        return rows
 
     def fetch_runs(self) -> list[RunRowData]:
         """Fetch workflow runs for the Runs tab.
@@ -0,0 +1,161 @@
+"""In-process execution of erk CLI commands for TUI background operations.
+
+Dashboard actions used to Popen a fresh `erk ...` process per action, paying
+for a full CLI import and context construction every time. This module runs
+the same Click command pipelines on the calling worker thread instead,
+reusing the dashboard's warm ErkContext (gateways, HTTP client).
+
+Output is captured per operation: user_output()/machine_output() calls made
+in the operation's context go to that operation's line writer via
+redirect_output(), so concurrent operations and the TUI itself never share a
+stream. Prompts abort while redirected, mirroring the DEVNULL stdin of the
+subprocess path.
+
+Operations are cancelled cooperatively: setting the operation's cancel event
+stops it at its next output write, subprocess, or HTTP request (see
+erk_shared.cancellation), where the subprocess path terminates the process.
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from collections.abc import Callable, Sequence
+
+import click
+
+from erk.tui.operations.types import OperationResult
+from erk_shared.cancellation import OperationCancelledError, cancellable, raise_if_cancelled
+from erk_shared.output.output import redirect_output, user_output
+
+# Exit code reported for cancelled operations (128 + SIGINT, as a shell would).
+CANCELLED_RETURN_CODE = 130
+
+# Commands that only talk to GitHub or use git plumbing against ctx paths.
+# Commands that may change the process cwd or check out worktrees (land-execute,
+# cmux-open-pr) keep running as subprocesses so they cannot disturb the TUI.
+IN_PROCESS_COMMAND_PREFIXES: tuple[tuple[str, ...], ...] = (
+    ("launch",),
+    ("pr", "dispatch"),
+    ("objective", "check"),
+    ("objective", "close"),
+    ("one-shot",),
+    ("workflow", "run", "cancel"),
+    ("workflow", "run", "retry"),
+)
+
+
+def supports_in_process(args: Sequence[str]) -> bool:
+    """Return True if `erk <args>` is safe to run inside the TUI process."""
+    return any(tuple(args[: len(prefix)]) == prefix for prefix in IN_PROCESS_COMMAND_PREFIXES)
+
+
+class _LineWriter(io.StringIO):
+    """Text stream for one operation that passes each complete line to a callback.
+
+    Nothing is stored in the underlying buffer; StringIO is the base so the
+    writer is a TextIO for click.echo(). Every write is a cancellation
+    checkpoint for the operation.
+    """
+
+    def __init__(self, on_line: Callable[[str], None]) -> None:
+        super().__init__()
+        self._on_line = on_line
+        self._pending = ""
+
+    def write(self, s: str) -> int:
+        raise_if_cancelled()
+        *complete, self._pending = (self._pending + s).split("\n")
+        for line in complete:
+            self._on_line(line)
+        return len(s)
+
+    def isatty(self) -> bool:
+        return False
+
+    def flush_pending(self) -> None:
+        """Emit a trailing line that was written without a newline."""
+        if self._pending:
+            self._on_line(self._pending)
+            self._pending = ""
+
+
+def run_click_command_in_process(
+    command: click.Command,
+    *,
+    args: Sequence[str],
+    obj: object,
+    cancel_event: threading.Event,
+    on_line: Callable[[str], None],
+) -> OperationResult:
+    """Run a Click command on the current thread, streaming its output lines.
+
+    Must be called from a background thread (@work(thread=True)). Output the
+    command writes through user_output()/machine_output() is split into lines,
+    unstyled, passed to on_line, and collected into the result, matching the
+    subprocess streaming path.
+
+    Args:
+        command: Click command or group to invoke (normally erk's root `cli`)
+        args: Arguments to pass, excluding the program name
+        obj: Click context object (the shared ErkContext)
+        cancel_event: Set from another thread to cancel the operation
+        on_line: Callback receiving each non-empty, unstyled output line
+
+    Returns:
+        Result with success flag, collected output lines, and exit code
+        (CANCELLED_RETURN_CODE if the operation was cancelled)
+    """
+    output_lines: list[str] = []
+
+    def _collect(raw_line: str) -> None:
+        clean = click.unstyle(raw_line.rstrip())
+        if clean:
+            output_lines.append(clean)
+            on_line(clean)
+
+    writer = _LineWriter(_collect)
+    # Error boundary: a cancelled operation unwinds from whichever checkpoint
+    # it reached, including the exit-code handling in _invoke.
+    try:
+        with redirect_output(writer), cancellable(cancel_event):
+            return_code = _invoke(command, args=args, obj=obj, writer=writer)
+        writer.flush_pending()
+    except OperationCancelledError:
+        _collect("Operation cancelled")
+        return_code = CANCELLED_RETURN_CODE
+
+    return OperationResult(
+        success=return_code == 0,
+        output_lines=tuple(output_lines),
+        return_code=return_code,
+    )
+
+
+def _invoke(
+    command: click.Command, *, args: Sequence[str], obj: object, writer: _LineWriter
+) -> int:
+    """Invoke command with standalone-mode exit semantics, returning the exit code."""
+    # Error boundary: translate every way a CLI command can end into an exit
+    # code, as the process boundary did for the subprocess path.
+    try:
+        result = command.main(args=list(args), prog_name="erk", obj=obj, standalone_mode=False)
+    except click.ClickException as e:
+        e.show(file=writer)
+        return e.exit_code
+    except click.Abort:
+        user_output("Aborted!")
+        return 1
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        user_output(str(e.code))
+        return 1
+    except Exception as e:
+        user_output(f"Error: {e}")
+        return 1
+    if isinstance(result, int):
+        return result
+    return 0
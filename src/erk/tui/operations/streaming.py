@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import dataclasses
 import subprocess
+import threading
 from typing import TYPE_CHECKING
 
 import click
 
+from erk.tui.operations.in_process import (
+    CANCELLED_RETURN_CODE,
+    run_click_command_in_process,
+    supports_in_process,
+)
 from erk.tui.operations.types import OperationResult
 
 if TYPE_CHECKING:
@@ -14,14 +21,17 @@ if TYPE_CHECKING:
 
 
 class StreamingOperationsMixin:
-    """Mixin providing operation lifecycle tracking and streaming subprocess execution.
+    """Mixin providing operation lifecycle tracking and streaming command execution.
 
-    Methods access self._status_bar, self._provider, and self.call_from_thread
-    which are provided by ErkDashApp at runtime through inheritance.
+    Methods access self._status_bar, self._service, self._erk_context,
+    self._operation_cancel_events, self._operation_processes, and
+    self.call_from_thread which are provided by ErkDashApp at runtime
+    through inheritance.
     """
 
     def _start_operation(self: ErkDashApp, *, op_id: str, label: str) -> None:
         """Register a background operation in the status bar."""
+        self._operation_cancel_events[op_id] = threading.Event()
         if self._status_bar is not None:
             self._status_bar.start_operation(op_id=op_id, label=label)
 
@@ -32,19 +42,48 @@ class StreamingOperationsMixin:
 
     def _finish_operation(self: ErkDashApp, *, op_id: str) -> None:
         """Remove a completed background operation from the status bar."""
+        self._operation_cancel_events.pop(op_id, None)
         if self._status_bar is not None:
             self._status_bar.finish_operation(op_id=op_id)
 
+    def _cancel_operation(self: ErkDashApp, *, op_id: str) -> None:
+        """Request cancellation of a running background operation.
+
+        Subprocess operations are terminated. In-process operations stop at
+        their next cancellation checkpoint (output write, subprocess, or HTTP
+        request). The worker still reports the (failed) result and finishes
+        the operation as usual.
+        """
+        if op_id in self._operation_cancel_events:
+            self._operation_cancel_events[op_id].set()
+        if op_id in self._operation_processes:
+            self._operation_processes[op_id].terminate()
+        if self._status_bar is not None:
+            self._status_bar.update_operation(op_id=op_id, progress="Cancelling...")
+
+    def action_cancel_operation(self: ErkDashApp) -> None:
+        """Cancel the most recently started operation that is still running."""
+        running = [
+            op_id for op_id, event in self._operation_cancel_events.items() if not event.is_set()
+        ]
+        if not running:
+            return
+        self._cancel_operation(op_id=running[-1])
+
     def _run_streaming_operation(
         self: ErkDashApp,
         *,
         op_id: str,
         command: list[str],
     ) -> OperationResult:
-        """Run a subprocess with live output streaming to the status bar.
+        """Run a command with live output streaming to the status bar.
 
         Must be called from a background thread (@work(thread=True)).
-        Uses Popen with merged stdout/stderr for real-time progress.
+
+        `erk` commands that are safe to run in-process execute on this thread
+        against the dashboard's shared ErkContext, avoiding a CLI import and
+        context rebuild per action. Everything else runs via Popen with merged
+        stdout/stderr for real-time progress.
 
         Args:
             op_id: Operation identifier for status bar updates
@@ -53,6 +92,27 @@ class StreamingOperationsMixin:
         Returns:
             Result with success flag, collected output lines, and return code
         """
+        cancel_event = self._operation_cancel_events.setdefault(op_id, threading.Event())
+
+        def _on_line(line: str) -> None:
+            self.call_from_thread(self._update_operation, op_id=op_id, progress=line)
+
+        if (
+            self._erk_context is not None
+            and command[0] == "erk"
+            and supports_in_process(command[1:])
+        ):
+            # Inline import: erk.cli.cli imports the dash command, which imports this app
+            from erk.cli.cli import cli
+
+            return run_click_command_in_process(
+                cli,
+                args=command[1:],
+                obj=dataclasses.replace(self._erk_context, cwd=self._service.repo_root),
+                cancel_event=cancel_event,
+                on_line=_on_line,
+            )
+
         output_lines: list[str] = []
         proc = subprocess.Popen(
             command,
@@ -63,13 +123,20 @@ class StreamingOperationsMixin:
             text=True,
             cwd=str(self._service.repo_root),
         )
+        self._operation_processes[op_id] = proc
+        if cancel_event.is_set():
+            proc.terminate()
         if proc.stdout is not None:
             for line in proc.stdout:
                 clean = click.unstyle(line.rstrip())
                 if clean:
                     output_lines.append(clean)
-                    self.call_from_thread(self._update_operation, op_id=op_id, progress=clean)
+                    _on_line(clean)
         return_code = proc.wait()
+        self._operation_processes.pop(op_id, None)
+        if cancel_event.is_set():
+            output_lines.append("Operation cancelled")
+            return_code = CANCELLED_RETURN_CODE
         return OperationResult(
             success=return_code == 0,
             output_lines=tuple(output_lines),
@@ -8,11 +8,14 @@ import uuid
 from typing import TYPE_CHECKING
 
 from textual import work
+from textual.worker import get_current_worker
 
 from erk.tui.operations.logic import extract_learn_pr_number, last_output_line
+from erk_shared.debug import debug_log
 
 if TYPE_CHECKING:
     from erk.tui.app import ErkDashApp
+    from erk.tui.data.types import PrRowData
 
 
 class BackgroundWorkersMixin:
@@ -535,3 +538,25 @@ class BackgroundWorkersMixin:
 
         # Update on main thread
         self.app.call_from_thread(self._on_activity_loaded, activity)
+
+    @work(thread=True, exclusive=True, group="detail-prefetch")
+    def _prefetch_details_async(
+        self: ErkDashApp, rows: list[PrRowData], *, objective: bool
+    ) -> None:
+        """Warm the detail cache for rows near the cursor, nearest first.
+
+        Exclusive within its group, so starting a new prefetch cancels the
+        previous one; the cancellation is checked before every fetch.
+        """
+        worker = get_current_worker()
+        # Error boundary: prefetching is best-effort. A failed fetch is not
+        # cached, so the modal refetches and reports the error when opened.
+        try:
+            for row in rows:
+                if worker.is_cancelled:
+                    return
+                self._service.prefetch_row(
+                    row, objective=objective, is_cancelled=lambda: worker.is_cancelled
+                )
+        except Exception as e:
+            debug_log(f"detail prefetch failed: {e}")
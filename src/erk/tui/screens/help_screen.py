@@ -133,6 +133,7 @@ class HelpScreen(ModalScreen):
             with Vertical(classes="help-section"):
                 yield Label("General", classes="help-section-title")
                 yield Label("r       Refresh data", classes="help-binding")
+                yield Label("Ctrl+X  Cancel latest running operation", classes="help-binding")
                 yield Label("?       Show this help", classes="help-binding")
                 yield Label("q/Esc   Quit", classes="help-binding")
 
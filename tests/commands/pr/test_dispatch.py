@@ -1,10 +1,16 @@
 """Tests for erk pr dispatch command."""
 
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
 from click.testing import CliRunner
 
 from erk.cli.cli import cli
+from erk.core.context import ErkContext
 from erk_shared.gateway.git.abc import WorktreeInfo
 from erk_shared.gateway.github.metadata.core import MetadataBlock, render_metadata_block
+from erk_shared.gateway.github.run_correlation import WorkflowRunResult, WorkflowRunSkipped
 from erk_shared.gateway.github.types import PRDetails
 from erk_shared.gateway.graphite.types import BranchMetadata
 from erk_shared.impl_folder import build_plan_ref_json
@@ -16,7 +22,7 @@ from tests.fakes.gateway.github_issues import FakeGitHubIssues
 from tests.fakes.gateway.graphite import FakeGraphite
 from tests.fakes.gateway.time import FakeTime
 from tests.test_utils.context_builders import build_workspace_test_context
-from tests.test_utils.env_helpers import erk_isolated_fs_env
+from tests.test_utils.env_helpers import ErkIsolatedFsEnv, erk_isolated_fs_env
 
 
 def test_dispatch_planned_pr_plan_triggers_workflow_with_planned_pr_backend() -> None:
@@ -142,6 +148,11 @@ def test_dispatch_planned_pr_plan_triggers_workflow_with_planned_pr_backend() ->
 
 def _make_pr_42(*, plan_branch: str) -> PRDetails:
     """Build a standard PRDetails for plan PR #42 used by auto-detection tests."""
+    return _make_plan_pr(42, title="[erk-pr] Auto-detect Test", plan_branch=plan_branch)
+
+
+def _make_plan_pr(number: int, *, title: str, plan_branch: str) -> PRDetails:
+    """Build an open planned-PR PRDetails whose plan-header names plan_branch."""
     plan_header = render_metadata_block(
         MetadataBlock(
             key="plan-header",
@@ -159,9 +170,9 @@ def _make_pr_42(*, plan_branch: str) -> PRDetails:
         summary=None,
     )
     return PRDetails(
-        number=42,
-        url="https://github.com/test-owner/test-repo/pull/42",
-        title="[erk-pr] Auto-detect Test",
+        number=number,
+        url=f"https://github.com/test-owner/test-repo/pull/{number}",
+        title=title,
         body=pr_body,
         state="OPEN",
         is_draft=True,
@@ -634,3 +645,239 @@ def test_dispatch_rejects_dirty_checked_out_worktree() -> None:
         assert len(fake_gh.triggered_workflows) == 0
 
         assert "Traceback" not in result.output
+
+
+class _RateLimitedPollGitHub(FakeLocalGitHub):
+    """FakeLocalGitHub whose first run-correlation poll hits a secondary rate limit."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.resolve_attempts = 0
+
+    def resolve_workflow_runs(
+        self,
+        *,
+        repo_root: Path,
+        workflow: str,
+        distinct_ids: list[str],
+        dispatched_at: datetime,
+    ) -> dict[str, WorkflowRunResult]:
+        self.resolve_attempts += 1
+        if self.resolve_attempts == 1:
+            raise RuntimeError("gh: You have exceeded a secondary rate limit. (HTTP 403)")
+        return super().resolve_workflow_runs(
+            repo_root=repo_root,
+            workflow=workflow,
+            distinct_ids=distinct_ids,
+            dispatched_at=dispatched_at,
+        )
+
+
+class _SkippedRunGitHub(FakeLocalGitHub):
+    """FakeLocalGitHub whose run for one PR's dispatch was skipped."""
+
+    def __init__(self, *, skipped_pr_number: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._skipped_pr_number = skipped_pr_number
+        self._pr_number_by_distinct_id: dict[str, str] = {}
+
+    def start_workflow(
+        self, *, repo_root: Path, workflow: str, inputs: dict[str, str], ref: str | None
+    ) -> str:
+        distinct_id = super().start_workflow(
+            repo_root=repo_root, workflow=workflow, inputs=inputs, ref=ref
+        )
+        self._pr_number_by_distinct_id[distinct_id] = inputs["pr_number"]
+        return distinct_id
+
+    def resolve_workflow_runs(
+        self,
+        *,
+        repo_root: Path,
+        workflow: str,
+        distinct_ids: list[str],
+        dispatched_at: datetime,
+    ) -> dict[str, WorkflowRunResult]:
+        results = super().resolve_workflow_runs(
+            repo_root=repo_root,
+            workflow=workflow,
+            distinct_ids=distinct_ids,
+            dispatched_at=dispatched_at,
+        )
+        for distinct_id in distinct_ids:
+            if self._pr_number_by_distinct_id[distinct_id] == str(self._skipped_pr_number):
+                results[distinct_id] = WorkflowRunSkipped(
+                    run_id="999", conclusion="skipped", message="run was skipped"
+                )
+        return results
+
+
+def _build_batch_dispatch_context(
+    env: ErkIsolatedFsEnv,
+    *,
+    fake_gh: FakeLocalGitHub,
+    fake_time: FakeTime,
+    plan_branches: list[str],
+    dirty_branch: str | None,
+) -> ErkContext:
+    """Build a local dispatch context for several plan branches.
+
+    When dirty_branch is given, it is checked out in a second worktree with
+    uncommitted changes, so syncing that branch fails.
+    """
+    fake_issues = FakeGitHubIssues()
+    pr_backend = ManagedGitHubPrBackend(fake_gh, fake_issues, time=fake_time)
+
+    branch_heads = {"main": "abc123", "origin/main": "abc123"}
+    for branch in plan_branches:
+        branch_heads[branch] = f"local-{branch}"
+        branch_heads[f"origin/{branch}"] = f"remote-{branch}"
+
+    worktrees = [WorktreeInfo(path=env.cwd, branch="main", is_root=True)]
+    file_statuses: dict[Path, tuple[list[str], list[str], list[str]]] = {}
+    if dirty_branch is not None:
+        dirty_path = env.cwd.parent / "dirty-worktree"
+        worktrees.append(WorktreeInfo(path=dirty_path, branch=dirty_branch, is_root=False))
+        file_statuses[dirty_path] = (["dirty-file.txt"], [], [])
+
+    git = FakeGit(
+        git_common_dirs={env.cwd: env.git_dir},
+        current_branches={env.cwd: "main"},
+        local_branches={env.cwd: ["main", *plan_branches]},
+        default_branches={env.cwd: "main"},
+        remote_urls={(env.cwd, "origin"): "https://github.com/test-owner/test-repo.git"},
+        remote_branches={env.cwd: ["origin/main", *(f"origin/{b}" for b in plan_branches)]},
+        repository_roots={env.cwd: env.cwd},
+        branch_heads=branch_heads,
+        worktrees={env.cwd: worktrees},
+        file_statuses=file_statuses,
+    )
+
+    graphite = FakeGraphite(
+        authenticated=True,
+        branches={
+            "main": BranchMetadata(
+                name="main", parent=None, children=[], is_trunk=True, commit_sha=None
+            ),
+        },
+    )
+
+    return build_workspace_test_context(
+        env,
+        git=git,
+        graphite=graphite,
+        github=fake_gh,
+        issues=fake_issues,
+        use_graphite=True,
+        pr_store=pr_backend,
+        time=fake_time,
+    )
+
+
+def test_dispatch_multiple_isolates_branch_push_failure() -> None:
+    """Test one PR failing to push its plan does not block the rest of the batch.
+
+    The failing PR raises inside the lock that serializes branch sync and push,
+    so the other PRs only dispatch if that lock is released on failure.
+    """
+    runner = CliRunner()
+    with erk_isolated_fs_env(runner) as env:
+        branches = {41: "plan-41", 42: "plan-42", 43: "plan-43"}
+        prs = {
+            n: _make_plan_pr(n, title=f"[erk-pr] Plan {n}", plan_branch=b)
+            for n, b in branches.items()
+        }
+        fake_gh = FakeLocalGitHub(
+            authenticated=True,
+            pr_details=prs,
+            prs_by_branch={prs[n].head_ref_name: prs[n] for n in prs},
+        )
+        ctx = _build_batch_dispatch_context(
+            env,
+            fake_gh=fake_gh,
+            fake_time=FakeTime(),
+            plan_branches=list(branches.values()),
+            dirty_branch="plan-42",
+        )
+
+        result = runner.invoke(cli, ["pr", "dispatch", "41", "42", "43", "--base", "main"], obj=ctx)
+
+        assert result.exit_code == 1
+        dispatched = sorted(inputs["pr_number"] for _, inputs, _ in fake_gh.triggered_workflows)
+        assert dispatched == ["41", "43"]
+        assert "2 PR(s) dispatched successfully" in result.output
+        assert "1 PR(s) failed to dispatch" in result.output
+        assert "#42: Branch 'plan-42' is checked out" in result.output
+        assert "uncommitted changes" in result.output
+
+        # Batch mode keeps per-step chatter quiet; progress lines name each PR
+        assert "Syncing branch:" not in result.output
+        assert "PR #42 failed" in result.output
+        assert "Traceback" not in result.output
+
+
+def test_dispatch_backs_off_on_rate_limited_poll_without_redispatching() -> None:
+    """Test a rate-limited run-correlation poll is retried without dispatching again."""
+    runner = CliRunner()
+    with erk_isolated_fs_env(runner) as env:
+        branches = {41: "plan-41", 42: "plan-42"}
+        prs = {
+            n: _make_plan_pr(n, title=f"[erk-pr] Plan {n}", plan_branch=b)
+            for n, b in branches.items()
+        }
+        fake_gh = _RateLimitedPollGitHub(
+            authenticated=True,
+            pr_details=prs,
+            prs_by_branch={prs[n].head_ref_name: prs[n] for n in prs},
+        )
+        fake_time = FakeTime()
+        ctx = _build_batch_dispatch_context(
+            env,
+            fake_gh=fake_gh,
+            fake_time=fake_time,
+            plan_branches=list(branches.values()),
+            dirty_branch=None,
+        )
+
+        result = runner.invoke(cli, ["pr", "dispatch", "41", "42", "--base", "main"], obj=ctx)
+
+        assert result.exit_code == 0, f"Unexpected failure:\n{result.output}"
+        assert len(fake_gh.triggered_workflows) == 2
+        assert fake_gh.resolve_attempts == 2
+        assert len(fake_gh.resolved_workflow_runs) == 1
+        assert fake_time.sleep_calls == [60.0]
+        assert "2 PR(s) dispatched successfully" in result.output
+
+
+def test_dispatch_multiple_finishes_resolved_runs_when_one_run_is_skipped() -> None:
+    """Test a skipped run fails only its own PR; the other PRs are still finished."""
+    runner = CliRunner()
+    with erk_isolated_fs_env(runner) as env:
+        branches = {41: "plan-41", 42: "plan-42", 43: "plan-43"}
+        prs = {
+            n: _make_plan_pr(n, title=f"[erk-pr] Plan {n}", plan_branch=b)
+            for n, b in branches.items()
+        }
+        fake_gh = _SkippedRunGitHub(
+            skipped_pr_number=42,
+            authenticated=True,
+            pr_details=prs,
+            prs_by_branch={prs[n].head_ref_name: prs[n] for n in prs},
+        )
+        ctx = _build_batch_dispatch_context(
+            env,
+            fake_gh=fake_gh,
+            fake_time=FakeTime(),
+            plan_branches=list(branches.values()),
+            dirty_branch=None,
+        )
+
+        result = runner.invoke(cli, ["pr", "dispatch", "41", "42", "43", "--base", "main"], obj=ctx)
+
+        assert result.exit_code == 1
+        assert len(fake_gh.triggered_workflows) == 3
+        assert len(fake_gh.resolved_workflow_runs) == 1
+        assert "2 PR(s) dispatched successfully" in result.output
+        assert "1 PR(s) failed to dispatch" in result.output
+        assert "#42: workflow dispatched but run not resolved: run was skipped" in result.output
+        assert "Traceback" not in result.output
@@ -1,6 +1,8 @@
 """Tests for PR command remote paths (--repo flag / NoRepoSentinel)."""
 
+import json
 from datetime import UTC, datetime
+from pathlib import Path
 
 from click.testing import CliRunner
 
@@ -8,12 +10,21 @@ from erk.cli.cli import cli
 from erk_shared.context.types import NoRepoSentinel
 from erk_shared.core.pr_list_service import PrListData
 from erk_shared.gateway.github.issues.types import IssueInfo
-from erk_shared.gateway.github.metadata.core import MetadataBlock, render_metadata_block
+from erk_shared.gateway.github.metadata.core import (
+    MetadataBlock,
+    create_plan_block,
+    create_workflow_started_block,
+    render_metadata_block,
+)
+from erk_shared.gateway.http.abc import HttpError
+from erk_shared.gateway.remote_github.types import RemoteIssueComment
 from erk_shared.pr_store.planned_pr_lifecycle import build_plan_stage_body
 from erk_shared.pr_store.types import Plan, PlanState
 from tests.fakes.gateway.console import FakeConsole
 from tests.fakes.gateway.core import FakePrListService
+from tests.fakes.gateway.erk_installation import FakeErkInstallation
 from tests.fakes.gateway.remote_github import FakeRemoteGitHub
+from tests.fakes.gateway.time import FakeTime
 from tests.fakes.tests.prompt_executor import FakePromptExecutor
 from tests.test_utils.test_context import context_for_test
 
@@ -222,6 +233,142 @@ def test_log_remote_no_events() -> None:
     assert "No events found" in result.output
 
 
+def _plan_comment(comment_id: int, timestamp: str) -> RemoteIssueComment:
+    block = create_plan_block(pr_number=42, worktree_name="test-wt", timestamp=timestamp)
+    return RemoteIssueComment(
+        id=comment_id,
+        created_at=timestamp,
+        updated_at=timestamp,
+        body=render_metadata_block(block),
+    )
+
+
+def _workflow_comment(comment_id: int, timestamp: str) -> RemoteIssueComment:
+    block = create_workflow_started_block(
+        started_at=timestamp,
+        workflow_run_id=str(comment_id),
+        workflow_run_url=f"https://github.com/owner/repo/actions/runs/{comment_id}",
+        pr_number=42,
+    )
+    return RemoteIssueComment(
+        id=comment_id,
+        created_at=timestamp,
+        updated_at=timestamp,
+        body=render_metadata_block(block),
+    )
+
+
+def _log_json(ctx: context_for_test, *args: str) -> list[dict]:
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["pr", "log", "42", "--repo", "owner/repo", "--json", *args], obj=ctx
+    )
+    assert result.exit_code == 0, result.output
+    return json.loads(result.output)
+
+
+def test_log_remote_index_fetches_only_new_comments(tmp_path: Path) -> None:
+    """Test pr log caches parsed events and fetches from the last cursor."""
+    records = [_plan_comment(1, "2024-01-15T10:00:00Z")]
+    fake_remote = FakeRemoteGitHub(
+        authenticated_user="test-user",
+        default_branch_name="main",
+        default_branch_sha="abc123",
+        next_pr_number=1,
+        dispatch_run_id="run-1",
+        issues={42: _make_issue(42)},
+        issue_comments=None,
+        issue_comment_records={42: records},
+    )
+    ctx = context_for_test(
+        repo=NoRepoSentinel(),
+        remote_github=fake_remote,
+        erk_installation=FakeErkInstallation(root_path=tmp_path),
+    )
+
+    first = _log_json(ctx)
+    records.append(_workflow_comment(2, "2024-01-15T11:00:00Z"))
+    second = _log_json(ctx)
+
+    assert [e["event_type"] for e in first] == ["plan-created"]
+    assert [e["event_type"] for e in second] == ["plan-created", "workflow-started"]
+    assert fake_remote.issue_comment_fetches == [(42, None), (42, "2024-01-15T10:00:00Z")]
+    index_path = tmp_path / "cache" / "pr-events" / "owner" / "repo" / "42.json"
+    assert json.loads(index_path.read_text(encoding="utf-8"))["cursor"] == "2024-01-15T11:00:00Z"
+
+    _log_json(ctx, "--refresh")
+    assert fake_remote.issue_comment_fetches[-1] == (42, None)
+
+
+def test_log_remote_rebuilds_corrupt_index(tmp_path: Path) -> None:
+    """Test pr log treats an unparseable index as empty and rewrites it."""
+    fake_remote = FakeRemoteGitHub(
+        authenticated_user="test-user",
+        default_branch_name="main",
+        default_branch_sha="abc123",
+        next_pr_number=1,
+        dispatch_run_id="run-1",
+        issues={42: _make_issue(42)},
+        issue_comments=None,
+        issue_comment_records={42: [_plan_comment(1, "2024-01-15T10:00:00Z")]},
+    )
+    ctx = context_for_test(
+        repo=NoRepoSentinel(),
+        remote_github=fake_remote,
+        erk_installation=FakeErkInstallation(root_path=tmp_path),
+    )
+    index_path = tmp_path / "cache" / "pr-events" / "owner" / "repo" / "42.json"
+    index_path.parent.mkdir(parents=True)
+    index_path.write_text('{"version": ', encoding="utf-8")
+
+    events = _log_json(ctx)
+
+    assert [e["event_type"] for e in events] == ["plan-created"]
+    assert fake_remote.issue_comment_fetches == [(42, None)]
+    assert json.loads(index_path.read_text(encoding="utf-8"))["cursor"] == "2024-01-15T10:00:00Z"
+
+
+def test_log_remote_filters_by_event_type_and_time_range() -> None:
+    """Test pr log --event-type, --since and --until filters."""
+    fake_remote = FakeRemoteGitHub(
+        authenticated_user="test-user",
+        default_branch_name="main",
+        default_branch_sha="abc123",
+        next_pr_number=1,
+        dispatch_run_id="run-1",
+        issues={42: _make_issue(42)},
+        issue_comments=None,
+        issue_comment_records={
+            42: [
+                _plan_comment(1, "2024-01-15T10:00:00Z"),
+                _workflow_comment(2, "2024-01-15T11:00:00Z"),
+                _workflow_comment(3, "2024-01-16T11:00:00Z"),
+            ]
+        },
+    )
+    ctx = _build_remote_context(fake_remote)
+
+    by_type = _log_json(ctx, "--event-type", "workflow-started")
+    in_range = _log_json(ctx, "--since", "2024-01-15T10:30:00Z", "--until", "2024-01-16")
+
+    assert [e["metadata"]["workflow_run_id"] for e in by_type] == ["2", "3"]
+    assert [e["timestamp"] for e in in_range] == ["2024-01-15T11:00:00Z"]
+
+
+def test_log_remote_rejects_invalid_time_bound() -> None:
+    """Test pr log --since with an unparseable time fails with a usage error."""
+    fake_remote = _make_fake_remote(issues={42: _make_issue(42)})
+    ctx = _build_remote_context(fake_remote)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["pr", "log", "42", "--repo", "owner/repo", "--since", "yesterday"], obj=ctx
+    )
+
+    assert result.exit_code == 2
+    assert "Invalid ISO 8601 time" in result.output
+
+
 # --- pr check --repo ---
 
 
@@ -493,6 +640,36 @@ def test_dispatch_remote_dispatches_workflow() -> None:
     assert any(".erk/impl-context/plan.md" in p for p in committed_paths)
 
 
+def test_dispatch_remote_resolves_all_runs_in_one_batch() -> None:
+    """Test pr dispatch --repo sends every dispatch before resolving runs together."""
+    issues = {
+        42: _make_plan_issue(42, branch_name="plnd/first"),
+        43: _make_plan_issue(43, branch_name="plnd/second"),
+    }
+    fake_remote = _make_fake_remote(issues=issues)
+    ctx = _build_remote_context(fake_remote)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["pr", "dispatch", "42", "43", "--repo", "owner/repo"],
+        obj=ctx,
+    )
+
+    assert result.exit_code == 0, f"Unexpected failure:\n{result.output}"
+    # Dispatches start concurrently, so only the set of dispatched PRs is fixed
+    assert sorted(d.inputs["pr_number"] for d in fake_remote.dispatched_workflows) == [
+        "42",
+        "43",
+    ]
+    assert len(fake_remote.resolved_workflow_runs) == 1
+    workflow, distinct_ids = fake_remote.resolved_workflow_runs[0]
+    assert workflow == "plan-implement.yml"
+    assert sorted(distinct_ids) == ["distinct-1", "distinct-2"]
+    assert "2 PR(s) dispatched successfully" in result.output
+    assert len(fake_remote.added_issue_comments) == 2
+
+
 def test_dispatch_remote_plan_not_found() -> None:
     """Test pr dispatch --repo with non-existent plan."""
     fake_remote = _make_fake_remote(issues={})
@@ -578,6 +755,121 @@ def test_dispatch_remote_multiple_plans() -> None:
     assert len(fake_remote.dispatched_workflows) == 2
 
 
+class _FailingDispatchRemoteGitHub(FakeRemoteGitHub):
+    """FakeRemoteGitHub whose start_workflow raises queued errors per branch."""
+
+    def __init__(self, *, errors_by_branch: dict[str, list[str]], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._errors_by_branch = errors_by_branch
+
+    def start_workflow(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        workflow: str,
+        ref: str,
+        inputs: dict[str, str],
+    ) -> str:
+        pending = self._errors_by_branch.get(inputs["branch_name"], [])
+        if pending:
+            raise HttpError(
+                status_code=403,
+                message=pending.pop(0),
+                endpoint=f"repos/{owner}/{repo}/actions/workflows/{workflow}/dispatches",
+            )
+        return super().start_workflow(
+            owner=owner, repo=repo, workflow=workflow, ref=ref, inputs=inputs
+        )
+
+
+def _make_failing_remote(
+    *, issues: dict[int, IssueInfo], errors_by_branch: dict[str, list[str]]
+) -> _FailingDispatchRemoteGitHub:
+    return _FailingDispatchRemoteGitHub(
+        errors_by_branch=errors_by_branch,
+        authenticated_user="test-user",
+        default_branch_name="main",
+        default_branch_sha="abc123",
+        next_pr_number=1,
+        dispatch_run_id="run-1",
+        issues=issues,
+        issue_comments=None,
+    )
+
+
+def test_dispatch_remote_multiple_plans_isolates_failure() -> None:
+    """Test one PR failing to dispatch does not stop the rest of the batch."""
+    issue_1 = _make_plan_issue(10, title="[erk-pr] Plan A", branch_name="plnd/plan-a")
+    issue_2 = _make_plan_issue(20, title="[erk-pr] Plan B", branch_name="plnd/plan-b")
+    issue_3 = _make_plan_issue(30, title="[erk-pr] Plan C", branch_name="plnd/plan-c")
+    fake_remote = _make_failing_remote(
+        issues={10: issue_1, 20: issue_2, 30: issue_3},
+        errors_by_branch={"plnd/plan-b": ["Resource not accessible by integration"]},
+    )
+    ctx = _build_remote_context(fake_remote)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["pr", "dispatch", "10", "20", "30", "--repo", "owner/repo"],
+        obj=ctx,
+    )
+
+    assert result.exit_code == 1
+    assert "2 PR(s) dispatched successfully" in result.output
+    assert "1 PR(s) failed to dispatch" in result.output
+    assert "#20: HTTP 403" in result.output
+    dispatched = sorted(w.inputs["pr_number"] for w in fake_remote.dispatched_workflows)
+    assert dispatched == ["10", "30"]
+    assert "Traceback" not in result.output
+
+
+def test_dispatch_remote_summary_keeps_input_order() -> None:
+    """Test the summary lists PRs in argument order regardless of completion order."""
+    issues = {
+        n: _make_plan_issue(n, title=f"[erk-pr] Plan {n}", branch_name=f"plnd/plan-{n}")
+        for n in (30, 10, 20)
+    }
+    fake_remote = _make_fake_remote(issues=issues)
+    ctx = _build_remote_context(fake_remote)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["pr", "dispatch", "30", "10", "20", "--repo", "owner/repo"],
+        obj=ctx,
+    )
+
+    assert result.exit_code == 0, f"Unexpected failure:\n{result.output}"
+    summary = result.output.split("Dispatched PRs:")[1]
+    assert summary.index("#30:") < summary.index("#10:") < summary.index("#20:")
+
+
+def test_dispatch_remote_backs_off_on_secondary_rate_limit() -> None:
+    """Test the workflow dispatch is retried after a secondary rate limit."""
+    issue = _make_plan_issue(42, branch_name="plnd/rate-limited")
+    fake_remote = _make_failing_remote(
+        issues={42: issue},
+        errors_by_branch={
+            "plnd/rate-limited": ["You have exceeded a secondary rate limit."],
+        },
+    )
+    fake_time = FakeTime()
+    ctx = context_for_test(repo=NoRepoSentinel(), remote_github=fake_remote, time=fake_time)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["pr", "dispatch", "42", "--repo", "owner/repo"],
+        obj=ctx,
+    )
+
+    assert result.exit_code == 0, f"Unexpected failure:\n{result.output}"
+    assert len(fake_remote.dispatched_workflows) == 1
+    assert fake_time.sleep_calls == [60.0]
+
+
 def test_dispatch_remote_posts_queued_comment() -> None:
     """Test pr dispatch --repo posts a queued event comment."""
     issue = _make_plan_issue(42, branch_name="plnd/comment-test")
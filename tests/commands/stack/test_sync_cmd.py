@@ -4,7 +4,7 @@ from click.testing import CliRunner
 
 from erk.cli.cli import cli
 from erk.core.repo_discovery import RepoContext
-from erk_shared.gateway.git.abc import BranchDivergence
+from erk_shared.gateway.git.abc import BranchDivergence, LocalRefUpdate
 from erk_shared.gateway.git.remote_ops.types import PullRebaseError
 from erk_shared.gateway.graphite.disabled import (
     GraphiteDisabled,
@@ -167,6 +167,46 @@ def test_sync_branch_behind_fast_forward_not_checked_out() -> None:
         assert git.updated_refs[0] == (env.cwd, "feat-1", "abc123")
 
 
+def test_sync_fast_forwards_behind_branches_in_one_transaction() -> None:
+    """Test that all behind-only branches not checked out move in one ref update."""
+    runner = CliRunner()
+    with erk_inmem_env(runner) as env:
+        git, graphite = env.build_ops_from_branches(
+            {
+                "main": BranchMetadata.trunk("main", children=["feat-1"]),
+                "feat-1": BranchMetadata.branch("feat-1", "main", children=["feat-2"]),
+                "feat-2": BranchMetadata.branch("feat-2", "feat-1", children=["feat-3"]),
+                "feat-3": BranchMetadata.branch("feat-3", "feat-2"),
+            },
+            current_branch="feat-3",
+        )
+        git.branch._remote_branches[env.cwd] = ["origin/feat-1", "origin/feat-2", "origin/feat-3"]
+        for branch, behind in (("feat-1", 2), ("feat-2", 1), ("feat-3", 0)):
+            git.branch._branch_divergence[(env.cwd, branch, "origin")] = BranchDivergence(
+                is_diverged=False, ahead=0, behind=behind
+            )
+        git.branch._branch_heads["feat-1"] = "old111"
+        git.branch._branch_heads["origin/feat-1"] = "new111"
+        git.branch._branch_heads["origin/feat-2"] = "new222"
+
+        test_ctx = env.build_context(git=git, graphite=graphite, use_graphite=True)
+
+        result = runner.invoke(cli, ["stack", "sync"], obj=test_ctx, catch_exceptions=False)
+
+        assert result.exit_code == 0
+        assert "2 fixed" in result.output
+        assert git.branch.ref_update_batches == [
+            (
+                env.cwd,
+                (
+                    LocalRefUpdate(branch="feat-1", target_sha="new111", expected_sha="old111"),
+                    LocalRefUpdate(branch="feat-2", target_sha="new222", expected_sha=None),
+                ),
+            )
+        ]
+        assert git.pull_rebase_calls == []
+
+
 def test_sync_branch_behind_fast_forward_current() -> None:
     """Test fast-forward when current branch is behind remote."""
     runner = CliRunner()
@@ -401,6 +401,12 @@ def test_detected_branch_includes_metadata() -> None:
         assert info.pr_number == 500
         assert info.pr_title == "Add feature one"
         assert info.worktree_path == wt_path
+        assert info.pr_id == "500"
+        assert info.objective_number is None
+        # Plan ids and objectives derive from the single batched PR read
+        assert [request[0] for request in github.pr_detail_requests] == [
+            "get_pr_details_by_branches"
+        ]
 
 
 # =============================================================================
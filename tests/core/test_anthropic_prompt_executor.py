@@ -6,27 +6,34 @@ from pathlib import Path
 
 import pytest
 
-from erk.core.anthropic_prompt_executor import AnthropicApiPromptExecutor, _resolve_model
+from erk.core.anthropic_prompt_executor import (
+    MAX_ATTEMPTS,
+    AnthropicApiPromptExecutor,
+    _resolve_model,
+)
+from erk_shared.core.prompt_executor import PromptRequest, PromptResult
+from tests.fakes.gateway.time import FakeTime
+from tests.fakes.tests.anthropic_server import FakeAnthropicServer
 
 
 def test_is_available_when_api_key_set(monkeypatch: pytest.MonkeyPatch) -> None:
     """Returns True when ANTHROPIC_API_KEY is set."""
     monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
-    executor = AnthropicApiPromptExecutor()
+    executor = AnthropicApiPromptExecutor(time=FakeTime(), base_url=None)
     assert executor.is_available() is True
 
 
 def test_is_available_when_api_key_missing(monkeypatch: pytest.MonkeyPatch) -> None:
     """Returns False when ANTHROPIC_API_KEY is not set."""
     monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
-    executor = AnthropicApiPromptExecutor()
+    executor = AnthropicApiPromptExecutor(time=FakeTime(), base_url=None)
     assert executor.is_available() is False
 
 
 def test_execute_prompt_returns_failure_when_no_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
     """execute_prompt returns PromptResult with success=False when API key is missing."""
     monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
-    executor = AnthropicApiPromptExecutor()
+    executor = AnthropicApiPromptExecutor(time=FakeTime(), base_url=None)
     result = executor.execute_prompt(
         "test prompt",
         model="claude-haiku-4-5-20251001",
@@ -41,7 +48,7 @@ def test_execute_prompt_returns_failure_when_no_api_key(monkeypatch: pytest.Monk
 
 def test_execute_command_streaming_raises() -> None:
     """execute_command_streaming raises NotImplementedError."""
-    executor = AnthropicApiPromptExecutor()
+    executor = AnthropicApiPromptExecutor(time=FakeTime(), base_url=None)
     with pytest.raises(NotImplementedError):
         list(
             executor.execute_command_streaming(
@@ -55,7 +62,7 @@ def test_execute_command_streaming_raises() -> None:
 
 def test_execute_interactive_raises() -> None:
     """execute_interactive raises NotImplementedError."""
-    executor = AnthropicApiPromptExecutor()
+    executor = AnthropicApiPromptExecutor(time=FakeTime(), base_url=None)
     with pytest.raises(NotImplementedError):
         executor.execute_interactive(
             worktree_path=Path("/tmp"),
@@ -81,7 +88,7 @@ def test_resolve_model_passes_through_full_id() -> None:
 
 def test_execute_prompt_passthrough_raises() -> None:
     """execute_prompt_passthrough raises NotImplementedError."""
-    executor = AnthropicApiPromptExecutor()
+    executor = AnthropicApiPromptExecutor(time=FakeTime(), base_url=None)
     with pytest.raises(NotImplementedError):
         executor.execute_prompt_passthrough(
             "test prompt",
@@ -94,5 +101,83 @@ def test_execute_prompt_passthrough_raises() -> None:
 
 def test_prompt_label_returns_anthropic_api() -> None:
     """prompt_label property returns 'Anthropic API'."""
-    executor = AnthropicApiPromptExecutor()
+    executor = AnthropicApiPromptExecutor(time=FakeTime(), base_url=None)
     assert executor.prompt_label == "Anthropic API"
+
+
+def _requests(count: int) -> list[PromptRequest]:
+    return [
+        PromptRequest(
+            prompt=f"prompt {index}",
+            model="haiku",
+            tools=None,
+            cwd=None,
+            system_prompt="Be brief",
+            dangerous=False,
+        )
+        for index in range(count)
+    ]
+
+
+def test_execute_prompt_streams_text_from_api(monkeypatch: pytest.MonkeyPatch) -> None:
+    """execute_prompt collects the streamed text blocks into the result."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+    with FakeAnthropicServer(latency_seconds=0.0, rate_limited_requests=0) as server:
+        executor = AnthropicApiPromptExecutor(time=FakeTime(), base_url=server.base_url)
+        result = executor.execute_prompt(
+            "hello",
+            model="haiku",
+            tools=None,
+            cwd=None,
+            system_prompt=None,
+            dangerous=False,
+        )
+
+    assert result == PromptResult(success=True, output="echo: hello", error=None)
+
+
+def test_execute_prompts_batch_runs_concurrently_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Batch results keep request order while requests overlap on the server."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+    with FakeAnthropicServer(latency_seconds=0.1, rate_limited_requests=0) as server:
+        executor = AnthropicApiPromptExecutor(time=FakeTime(), base_url=server.base_url)
+        results = executor.execute_prompts_batch(_requests(6), max_concurrency=3)
+
+    assert [r.output for r in results] == [f"echo: prompt {i}" for i in range(6)]
+    assert server.max_in_flight > 1
+    assert server.max_in_flight <= 3
+
+
+def test_execute_prompt_retries_rate_limit_honoring_retry_after(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """429 responses are retried after the server's retry-after delay."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+    fake_time = FakeTime()
+    with FakeAnthropicServer(latency_seconds=0.0, rate_limited_requests=2) as server:
+        executor = AnthropicApiPromptExecutor(time=fake_time, base_url=server.base_url)
+        results = executor.execute_prompts_batch(_requests(1), max_concurrency=4)
+
+    assert results[0].success is True
+    assert server.rate_limited_count == 2
+    assert fake_time.sleep_calls == [1.0, 1.0]
+
+
+def test_execute_prompt_gives_up_after_max_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Persistent rate limiting returns a failed result instead of retrying forever."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+    fake_time = FakeTime()
+    with FakeAnthropicServer(latency_seconds=0.0, rate_limited_requests=100) as server:
+        executor = AnthropicApiPromptExecutor(time=fake_time, base_url=server.base_url)
+        result = executor.execute_prompt(
+            "hello",
+            model="haiku",
+            tools=None,
+            cwd=None,
+            system_prompt=None,
+            dangerous=False,
+        )
+
+    assert result.success is False
+    assert server.request_count == MAX_ATTEMPTS
+    assert len(fake_time.sleep_calls) == MAX_ATTEMPTS - 1
@@ -3,6 +3,7 @@
 from erk.core.branch_slug_generator import (
     BranchSlugGenerator,
     generate_branch_slug,
+    generate_branch_slugs,
 )
 from tests.fakes.tests.prompt_executor import FakePromptExecutor
 
@@ -164,3 +165,23 @@ def test_empty_output_rejected() -> None:
 
     assert result.success is False
     assert result.slug is None
+
+
+def test_generate_branch_slugs_keeps_order_and_falls_back_per_title() -> None:
+    """Test batch slug generation returns one slug per title in order."""
+    executor = FakePromptExecutor(
+        available=True,
+        simulated_prompt_outputs=["fix-auth-bug", "singleword", "add-login-page"],
+    )
+    result = generate_branch_slugs(
+        executor,
+        ["Fix Auth Bug", "Tidy", "Add Login Page"],
+        max_concurrency=4,
+    )
+
+    assert result == ["fix-auth-bug", "Tidy", "add-login-page"]
+    assert [call[0] for call in executor.prompt_calls] == [
+        "Fix Auth Bug",
+        "Tidy",
+        "Add Login Page",
+    ]
@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from erk.core.fallback_prompt_executor import FallbackPromptExecutor
+from erk_shared.core.prompt_executor import PromptRequest
 from tests.fakes.tests.prompt_executor import FakePromptExecutor
 
 
@@ -67,6 +68,37 @@ def test_execute_prompt_falls_back_to_cli() -> None:
     assert len(cli.prompt_calls) == 1
 
 
+def _batch(count: int) -> list[PromptRequest]:
+    return [
+        PromptRequest(
+            prompt=f"p{index}",
+            model="claude-haiku-4-5-20251001",
+            tools=None,
+            cwd=None,
+            system_prompt=None,
+            dangerous=False,
+        )
+        for index in range(count)
+    ]
+
+
+def test_execute_prompts_batch_uses_api_when_available() -> None:
+    """execute_prompts_batch sends the whole batch to api_executor when available."""
+    fallback, api, cli = _make_executor(api_available=True, cli_available=True)
+    results = fallback.execute_prompts_batch(_batch(3), max_concurrency=2)
+    assert len(results) == 3
+    assert [call[0] for call in api.prompt_calls] == ["p0", "p1", "p2"]
+    assert len(cli.prompt_calls) == 0
+
+
+def test_execute_prompts_batch_falls_back_to_cli() -> None:
+    """execute_prompts_batch runs on cli_executor when api_executor is unavailable."""
+    fallback, api, cli = _make_executor(api_available=False, cli_available=True)
+    fallback.execute_prompts_batch(_batch(2), max_concurrency=2)
+    assert len(api.prompt_calls) == 0
+    assert [call[0] for call in cli.prompt_calls] == ["p0", "p1"]
+
+
 def test_streaming_delegates_to_cli() -> None:
     """execute_command_streaming always delegates to cli_executor."""
     fallback, api, cli = _make_executor(api_available=True, cli_available=True)
@@ -1,17 +1,27 @@
 """Unit tests for slot common module utilities."""
 
+import fcntl
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+from erk.core.context import ErkContext
 from erk.core.worktree_pool import (
     PoolState,
     SlotAssignment,
     SlotInfo,
+    load_pool_revision,
     load_pool_state,
+    pool_state_lock,
     save_pool_state,
 )
 from erk_shared.context.types import RepoContext
 from erk_shared.gateway.git.abc import WorktreeInfo
 from erk_slots.common import (
+    PoolWorktrees,
+    SlotAllocationResult,
+    allocate_slot_for_branch,
+    claim_next_free_slot,
     find_assignment_by_worktree,
     find_current_slot_assignment,
     find_inactive_slot,
@@ -19,9 +29,11 @@ from erk_slots.common import (
     find_oldest_assignment,
     get_pool_size,
     is_slot_initialized,
+    read_pool_worktrees,
     sync_pool_assignments,
 )
 from erk_slots.config import DEFAULT_POOL_SIZE
+from tests.fakes.gateway.console import FakeConsole
 from tests.fakes.gateway.git import FakeGit
 from tests.test_utils.test_context import context_for_test
 
@@ -170,7 +182,7 @@ class TestFindInactiveSlot:
         state = PoolState.test()
         git = FakeGit(worktrees={repo_root: []})
 
-        result = find_inactive_slot(state, git, repo_root)
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
 
         assert result is None
 
@@ -189,13 +201,34 @@ class TestFindInactiveSlot:
         )
         state = PoolState.test(pool_size=4)
 
-        result = find_inactive_slot(state, git, repo_root)
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
 
         assert result is not None
         slot_name, worktree_path = result
         assert slot_name == "erk-slot-01"
         assert worktree_path == wt1_path
 
+    def test_skips_locked_and_prunable_worktrees(self, tmp_path: Path) -> None:
+        """Locked or prunable slot worktrees are not offered for reuse."""
+        repo_root = tmp_path / "repo"
+        wt1_path = tmp_path / "worktrees" / "erk-slot-01"
+        wt2_path = tmp_path / "worktrees" / "erk-slot-02"
+        wt3_path = tmp_path / "worktrees" / "erk-slot-03"
+        git = FakeGit(
+            worktrees={
+                repo_root: [
+                    WorktreeInfo(path=wt1_path, branch="feature-a", locked=True),
+                    WorktreeInfo(path=wt2_path, branch="feature-b", prunable=True),
+                    WorktreeInfo(path=wt3_path, branch="feature-c"),
+                ]
+            }
+        )
+        state = PoolState.test(pool_size=4)
+
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
+
+        assert result == ("erk-slot-03", wt3_path)
+
     def test_returns_none_when_all_slots_assigned(self, tmp_path: Path) -> None:
         """Returns None when all worktrees have assignments."""
         repo_root = tmp_path / "repo"
@@ -223,7 +256,7 @@ class TestFindInactiveSlot:
         )
         state = PoolState.test(pool_size=2, assignments=(assignment1, assignment2))
 
-        result = find_inactive_slot(state, git, repo_root)
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
 
         assert result is None
 
@@ -250,7 +283,7 @@ class TestFindInactiveSlot:
         )
         state = PoolState.test(pool_size=4, assignments=(assignment1,))
 
-        result = find_inactive_slot(state, git, repo_root)
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
 
         assert result is not None
         slot_name, worktree_path = result
@@ -277,7 +310,7 @@ class TestFindInactiveSlot:
         # But state.slots is empty (worktree not tracked in pool.json)
         state = PoolState.test(pool_size=4, slots=())
 
-        result = find_inactive_slot(state, git, repo_root)
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
 
         # Should still find it via git
         assert result is not None
@@ -309,7 +342,7 @@ class TestFindInactiveSlot:
         )
         state = PoolState.test(pool_size=4, assignments=(assignment,))
 
-        result = find_inactive_slot(state, git, repo_root)
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
 
         # No managed slots available (the only managed one is assigned)
         assert result is None
@@ -328,7 +361,7 @@ class TestFindInactiveSlot:
         # pool_size is 4, so slot 5 is beyond the limit
         state = PoolState.test(pool_size=4)
 
-        result = find_inactive_slot(state, git, repo_root)
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
 
         assert result is None
 
@@ -349,7 +382,7 @@ class TestFindInactiveSlot:
         )
         state = PoolState.test(pool_size=4)
 
-        result = find_inactive_slot(state, git, repo_root)
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
 
         # Should skip dirty slot 1 and return clean slot 2
         assert result is not None
@@ -371,7 +404,7 @@ class TestFindInactiveSlot:
         )
         state = PoolState.test(pool_size=4)
 
-        result = find_inactive_slot(state, git, repo_root)
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
 
         assert result is None
 
@@ -390,7 +423,7 @@ class TestFindInactiveSlot:
         )
         state = PoolState.test(pool_size=4)
 
-        result = find_inactive_slot(state, git, repo_root)
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
 
         assert result is not None
         slot_name, worktree_path = result
@@ -418,7 +451,7 @@ class TestFindInactiveSlot:
         )
         state = PoolState.test(pool_size=4)
 
-        result = find_inactive_slot(state, git, repo_root)
+        result = find_inactive_slot(state, git, read_pool_worktrees(git, repo_root))
 
         assert result is not None
         slot_name, worktree_path = result
@@ -681,6 +714,15 @@ class TestFindAssignmentByWorktree:
         assert result.slot_name == "erk-slot-02"
 
 
+def _pool_worktrees(tmp_path: Path, linked: list[WorktreeInfo]) -> PoolWorktrees:
+    """Snapshot of a repo at tmp_path/repo with the given linked worktrees."""
+    repo_root = tmp_path / "repo"
+    git = FakeGit(
+        worktrees={repo_root: [WorktreeInfo(path=repo_root, branch="main", is_root=True), *linked]}
+    )
+    return read_pool_worktrees(git, repo_root)
+
+
 def test_sync_no_changes_when_branches_match(tmp_path: Path) -> None:
     """Returns same state and synced_count=0 when all branches match."""
     wt_path = tmp_path / "worktrees" / "erk-slot-01"
@@ -692,10 +734,10 @@ def test_sync_no_changes_when_branches_match(tmp_path: Path) -> None:
         worktree_path=wt_path,
     )
     state = PoolState.test(assignments=(assignment,))
-    git = FakeGit(current_branches={wt_path: "feature-a"})
+    worktrees = _pool_worktrees(tmp_path, [WorktreeInfo(path=wt_path, branch="feature-a")])
     pool_json = tmp_path / "pool.json"
 
-    result = sync_pool_assignments(state, git, pool_json)
+    result = sync_pool_assignments(state, worktrees, pool_json)
 
     assert result.synced_count == 0
     assert result.state is state
@@ -712,10 +754,10 @@ def test_sync_updates_when_branch_changed(tmp_path: Path) -> None:
         worktree_path=wt_path,
     )
     state = PoolState.test(assignments=(assignment,))
-    git = FakeGit(current_branches={wt_path: "feature-b"})
+    worktrees = _pool_worktrees(tmp_path, [WorktreeInfo(path=wt_path, branch="feature-b")])
     pool_json = tmp_path / "pool.json"
 
-    result = sync_pool_assignments(state, git, pool_json)
+    result = sync_pool_assignments(state, worktrees, pool_json)
 
     assert result.synced_count == 1
     assert len(result.state.assignments) == 1
@@ -737,10 +779,10 @@ def test_sync_saves_to_disk_on_change(tmp_path: Path) -> None:
         worktree_path=wt_path,
     )
     state = PoolState.test(assignments=(assignment,))
-    git = FakeGit(current_branches={wt_path: "feature-b"})
+    worktrees = _pool_worktrees(tmp_path, [WorktreeInfo(path=wt_path, branch="feature-b")])
     pool_json = tmp_path / "pool.json"
 
-    sync_pool_assignments(state, git, pool_json)
+    sync_pool_assignments(state, worktrees, pool_json)
 
     loaded = load_pool_state(pool_json)
     assert loaded is not None
@@ -758,13 +800,13 @@ def test_sync_does_not_save_when_unchanged(tmp_path: Path) -> None:
         worktree_path=wt_path,
     )
     state = PoolState.test(assignments=(assignment,))
-    git = FakeGit(current_branches={wt_path: "feature-a"})
+    worktrees = _pool_worktrees(tmp_path, [WorktreeInfo(path=wt_path, branch="feature-a")])
     pool_json = tmp_path / "pool.json"
     # Write initial state to disk
     save_pool_state(pool_json, state)
     mtime_before = pool_json.stat().st_mtime
 
-    sync_pool_assignments(state, git, pool_json)
+    sync_pool_assignments(state, worktrees, pool_json)
 
     mtime_after = pool_json.stat().st_mtime
     assert mtime_before == mtime_after
@@ -780,10 +822,31 @@ def test_sync_skips_missing_worktree_path(tmp_path: Path) -> None:
         worktree_path=missing_path,
     )
     state = PoolState.test(assignments=(assignment,))
-    git = FakeGit()
+    worktrees = _pool_worktrees(tmp_path, [])
+    pool_json = tmp_path / "pool.json"
+
+    result = sync_pool_assignments(state, worktrees, pool_json)
+
+    assert result.synced_count == 0
+    assert result.state.assignments[0].branch_name == "feature-a"
+
+
+def test_sync_skips_prunable_worktree(tmp_path: Path) -> None:
+    """Worktrees git reports as prunable are left unchanged."""
+    wt_path = tmp_path / "worktrees" / "erk-slot-01"
+    assignment = SlotAssignment(
+        slot_name="erk-slot-01",
+        branch_name="feature-a",
+        assigned_at="2024-01-01T12:00:00+00:00",
+        worktree_path=wt_path,
+    )
+    state = PoolState.test(assignments=(assignment,))
+    worktrees = _pool_worktrees(
+        tmp_path, [WorktreeInfo(path=wt_path, branch="feature-b", prunable=True)]
+    )
     pool_json = tmp_path / "pool.json"
 
-    result = sync_pool_assignments(state, git, pool_json)
+    result = sync_pool_assignments(state, worktrees, pool_json)
 
     assert result.synced_count == 0
     assert result.state.assignments[0].branch_name == "feature-a"
@@ -801,10 +864,10 @@ def test_sync_skips_detached_head(tmp_path: Path) -> None:
     )
     state = PoolState.test(assignments=(assignment,))
     # None indicates detached HEAD
-    git = FakeGit(current_branches={wt_path: None})
+    worktrees = _pool_worktrees(tmp_path, [WorktreeInfo(path=wt_path, branch=None)])
     pool_json = tmp_path / "pool.json"
 
-    result = sync_pool_assignments(state, git, pool_json)
+    result = sync_pool_assignments(state, worktrees, pool_json)
 
     assert result.synced_count == 0
     assert result.state.assignments[0].branch_name == "feature-a"
@@ -821,10 +884,12 @@ def test_sync_skips_placeholder_branch(tmp_path: Path) -> None:
         worktree_path=wt_path,
     )
     state = PoolState.test(assignments=(assignment,))
-    git = FakeGit(current_branches={wt_path: "__erk-slot-01-br-stub__"})
+    worktrees = _pool_worktrees(
+        tmp_path, [WorktreeInfo(path=wt_path, branch="__erk-slot-01-br-stub__")]
+    )
     pool_json = tmp_path / "pool.json"
 
-    result = sync_pool_assignments(state, git, pool_json)
+    result = sync_pool_assignments(state, worktrees, pool_json)
 
     assert result.synced_count == 0
     assert result.state.assignments[0].branch_name == "feature-a"
@@ -857,16 +922,17 @@ def test_sync_multiple_assignments(tmp_path: Path) -> None:
         worktree_path=wt3_path,
     )
     state = PoolState.test(assignments=(assignment1, assignment2, assignment3))
-    git = FakeGit(
-        current_branches={
-            wt1_path: "feature-a",  # unchanged
-            wt2_path: "feature-b-new",  # changed
-            wt3_path: "feature-c",  # unchanged
-        }
+    worktrees = _pool_worktrees(
+        tmp_path,
+        [
+            WorktreeInfo(path=wt1_path, branch="feature-a"),  # unchanged
+            WorktreeInfo(path=wt2_path, branch="feature-b-new"),  # changed
+            WorktreeInfo(path=wt3_path, branch="feature-c"),  # unchanged
+        ],
     )
     pool_json = tmp_path / "pool.json"
 
-    result = sync_pool_assignments(state, git, pool_json)
+    result = sync_pool_assignments(state, worktrees, pool_json)
 
     assert result.synced_count == 1
     assert result.state.assignments[0].branch_name == "feature-a"
@@ -904,10 +970,6 @@ def test_eviction_uses_synced_state(tmp_path: Path) -> None:
     state = PoolState.test(pool_size=2, assignments=(assignment1, assignment2))
     # User manually changed slot-01 from feature-a to feature-x
     git = FakeGit(
-        current_branches={
-            wt1_path: "feature-x",
-            wt2_path: "feature-b",
-        },
         worktrees={
             repo_root: [
                 WorktreeInfo(path=wt1_path, branch="feature-x"),
@@ -918,14 +980,15 @@ def test_eviction_uses_synced_state(tmp_path: Path) -> None:
     pool_json = tmp_path / "pool.json"
 
     # First sync to get accurate state
-    sync_result = sync_pool_assignments(state, git, pool_json)
+    worktrees = read_pool_worktrees(git, repo_root)
+    sync_result = sync_pool_assignments(state, worktrees, pool_json)
 
     # Verify sync updated slot-01's branch
     assert sync_result.state.assignments[0].branch_name == "feature-x"
 
     # Now find_inactive_slot operates on accurate state — both slots are
     # assigned so none should be available for eviction
-    inactive = find_inactive_slot(sync_result.state, git, repo_root)
+    inactive = find_inactive_slot(sync_result.state, git, worktrees)
     assert inactive is None
 
 
@@ -974,3 +1037,287 @@ class TestFindCurrentSlotAssignment:
         result = find_current_slot_assignment(state, cwd=nonexistent)
 
         assert result is None
+
+
+def _pool_repo_context(root: Path) -> RepoContext:
+    repo_dir = root / ".erk" / "repos" / "test-repo"
+    return RepoContext(
+        root=root,
+        repo_name="test-repo",
+        repo_dir=repo_dir,
+        worktrees_dir=repo_dir / "worktrees",
+        pool_json_path=repo_dir / "pool.json",
+    )
+
+
+def _configured_pool_repo(tmp_path: Path, *, pool_size: int) -> RepoContext:
+    config_dir = tmp_path / ".erk"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.toml").write_text(f"[pool]\nmax_slots = {pool_size}\n", encoding="utf-8")
+    return _pool_repo_context(tmp_path)
+
+
+def _root_only_git(tmp_path: Path) -> FakeGit:
+    return FakeGit(worktrees={tmp_path: [WorktreeInfo(path=tmp_path, branch="main", is_root=True)]})
+
+
+def _non_interactive_console() -> FakeConsole:
+    return FakeConsole(
+        is_interactive=False, is_stdout_tty=None, is_stderr_tty=None, confirm_responses=None
+    )
+
+
+def _allocate_or_none(ctx: ErkContext, repo: RepoContext, branch: str) -> str | None:
+    """Allocate like a parallel agent: never evict, report a full pool as None."""
+    try:
+        result = allocate_slot_for_branch(
+            ctx, repo, branch, force=False, reuse_inactive_slots=True, cleanup_artifacts=True
+        )
+    except SystemExit:
+        return None
+    return result.slot_name
+
+
+def _allocate_in_process(root: Path, worker: int, count: int) -> list[str | None]:
+    """Run `count` allocations through allocate_slot_for_branch in a fresh process."""
+    repo = _pool_repo_context(root)
+    ctx = context_for_test(git=_root_only_git(root), repo=repo, console=_non_interactive_console())
+    return [_allocate_or_none(ctx, repo, f"worker-{worker}-{n}") for n in range(count)]
+
+
+def test_allocate_full_pool_prompt_runs_outside_pool_lock(tmp_path: Path) -> None:
+    """The eviction prompt never holds pool.json's lock, so other processes keep going."""
+    repo = _configured_pool_repo(tmp_path, pool_size=1)
+    lock_free_during_prompt: list[bool] = []
+
+    class LockProbingConsole(FakeConsole):
+        def confirm(self, prompt: str, *, default: bool | None) -> bool:
+            lock_path = repo.pool_json_path.with_name(repo.pool_json_path.name + ".lock")
+            with lock_path.open("a", encoding="utf-8") as lock_file:
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    lock_free_during_prompt.append(False)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                    lock_free_during_prompt.append(True)
+            return super().confirm(prompt, default=default)
+
+    console = LockProbingConsole(
+        is_interactive=True, is_stdout_tty=None, is_stderr_tty=None, confirm_responses=[True]
+    )
+    ctx = context_for_test(git=_root_only_git(tmp_path), repo=repo, console=console)
+
+    allocate_slot_for_branch(
+        ctx, repo, "feature-a", force=False, reuse_inactive_slots=True, cleanup_artifacts=True
+    )
+    result = allocate_slot_for_branch(
+        ctx, repo, "feature-b", force=False, reuse_inactive_slots=True, cleanup_artifacts=True
+    )
+
+    assert lock_free_during_prompt == [True]
+    assert result.slot_name == "erk-slot-01"
+    state = load_pool_state(repo.pool_json_path)
+    assert state is not None
+    assert [a.branch_name for a in state.assignments] == ["feature-b"]
+
+
+def test_allocate_sync_does_not_revert_assignment_made_after_listing(tmp_path: Path) -> None:
+    """Sync uses a worktree listing taken under the lock, not the pre-lock snapshot.
+
+    While the pool-full prompt is open, another process reassigns the slot and
+    checks out its branch. The retry must see that branch instead of syncing
+    the assignment back to what the earlier listing showed.
+    """
+    repo = _configured_pool_repo(tmp_path, pool_size=1)
+    git = _root_only_git(tmp_path)
+    prompts: list[str] = []
+
+    class OtherProcessConsole(FakeConsole):
+        def confirm(self, prompt: str, *, default: bool | None) -> bool:
+            prompts.append(prompt)
+            if len(prompts) == 1:
+                with pool_state_lock(repo.pool_json_path):
+                    state = load_pool_state(repo.pool_json_path)
+                    assert state is not None
+                    taken = state.assignments[0]
+                    save_pool_state(
+                        repo.pool_json_path,
+                        PoolState(
+                            version=state.version,
+                            pool_size=state.pool_size,
+                            slots=state.slots,
+                            assignments=(
+                                SlotAssignment(
+                                    slot_name=taken.slot_name,
+                                    branch_name="feature-c",
+                                    assigned_at="2026-01-02T00:00:00",
+                                    worktree_path=taken.worktree_path,
+                                ),
+                            ),
+                        ),
+                    )
+                git.branch.checkout_branch(taken.worktree_path, "feature-c")
+            return super().confirm(prompt, default=default)
+
+    console = OtherProcessConsole(
+        is_interactive=True, is_stdout_tty=None, is_stderr_tty=None, confirm_responses=[True, True]
+    )
+    ctx = context_for_test(git=git, repo=repo, console=console)
+
+    allocate_slot_for_branch(
+        ctx, repo, "feature-a", force=False, reuse_inactive_slots=True, cleanup_artifacts=True
+    )
+    result = allocate_slot_for_branch(
+        ctx, repo, "feature-b", force=False, reuse_inactive_slots=True, cleanup_artifacts=True
+    )
+
+    assert prompts == [
+        "Unassign 'feature-a' to make room?",
+        "Unassign 'feature-c' to make room?",
+    ]
+    assert result.slot_name == "erk-slot-01"
+    state = load_pool_state(repo.pool_json_path)
+    assert state is not None
+    assert [a.branch_name for a in state.assignments] == ["feature-b"]
+
+
+def test_claim_next_free_slot_returns_none_when_pool_full(tmp_path: Path) -> None:
+    """Claiming never evicts: a full pool yields None and leaves pool.json alone."""
+    repo = _configured_pool_repo(tmp_path, pool_size=1)
+    ctx = context_for_test(
+        git=_root_only_git(tmp_path), repo=repo, console=_non_interactive_console()
+    )
+
+    first = claim_next_free_slot(ctx, repo, "feature-a", cleanup_artifacts=True)
+    again = claim_next_free_slot(ctx, repo, "feature-a", cleanup_artifacts=True)
+    second = claim_next_free_slot(ctx, repo, "feature-b", cleanup_artifacts=True)
+
+    assert first is not None
+    assert first.slot_name == "erk-slot-01"
+    assert again == SlotAllocationResult(
+        slot_name="erk-slot-01", worktree_path=first.worktree_path, already_assigned=True
+    )
+    assert second is None
+    state = load_pool_state(repo.pool_json_path)
+    assert state is not None
+    assert [a.branch_name for a in state.assignments] == ["feature-a"]
+
+
+def test_claim_next_free_slot_returns_none_while_lock_is_held(tmp_path: Path) -> None:
+    """Claiming does not wait for pool.json's lock."""
+    repo = _configured_pool_repo(tmp_path, pool_size=2)
+    ctx = context_for_test(
+        git=_root_only_git(tmp_path), repo=repo, console=_non_interactive_console()
+    )
+
+    with pool_state_lock(repo.pool_json_path):
+        blocked = claim_next_free_slot(ctx, repo, "feature-a", cleanup_artifacts=True)
+    claimed = claim_next_free_slot(ctx, repo, "feature-a", cleanup_artifacts=True)
+
+    assert blocked is None
+    assert claimed is not None
+    assert claimed.slot_name == "erk-slot-01"
+
+
+def _claim_until_settled(ctx: ErkContext, repo: RepoContext, branch: str) -> str | None:
+    """Claim like a parallel agent: retry while the lock is busy, stop when the pool is full."""
+    while True:
+        result = claim_next_free_slot(ctx, repo, branch, cleanup_artifacts=True)
+        if result is not None:
+            return result.slot_name
+        state = load_pool_state(repo.pool_json_path)
+        if state is not None and len(state.assignments) >= state.pool_size:
+            return None
+
+
+def _claim_in_process(root: Path, worker: int, count: int) -> list[str | None]:
+    """Run `count` claims through claim_next_free_slot in a fresh process."""
+    repo = _pool_repo_context(root)
+    ctx = context_for_test(git=_root_only_git(root), repo=repo, console=_non_interactive_console())
+    return [_claim_until_settled(ctx, repo, f"worker-{worker}-{n}") for n in range(count)]
+
+
+def test_claim_next_free_slot_concurrent_threads_get_distinct_slots(tmp_path: Path) -> None:
+    """Concurrent non-blocking claims never share a slot; extras end up with None."""
+    pool_size = 6
+    repo = _configured_pool_repo(tmp_path, pool_size=pool_size)
+    ctx = context_for_test(
+        git=_root_only_git(tmp_path), repo=repo, console=_non_interactive_console()
+    )
+    branches = [f"feature-{n}" for n in range(pool_size + 4)]
+
+    with ThreadPoolExecutor(max_workers=len(branches)) as executor:
+        results = list(executor.map(lambda b: _claim_until_settled(ctx, repo, b), branches))
+
+    claimed = [slot for slot in results if slot is not None]
+    assert len(claimed) == len(set(claimed)) == pool_size
+    state = load_pool_state(repo.pool_json_path)
+    assert state is not None
+    assert sorted(a.slot_name for a in state.assignments) == sorted(claimed)
+
+
+def test_claim_next_free_slot_concurrent_processes_never_double_assign(tmp_path: Path) -> None:
+    """Separate processes claiming at once get distinct slots and lose no writes."""
+    pool_size = 24
+    workers = 8
+    repo = _configured_pool_repo(tmp_path, pool_size=pool_size)
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = [
+            executor.submit(_claim_in_process, tmp_path, worker, pool_size // workers)
+            for worker in range(workers)
+        ]
+        claimed = [slot for future in futures for slot in future.result()]
+
+    assert None not in claimed
+    assert len(claimed) == len(set(claimed)) == pool_size
+    state = load_pool_state(repo.pool_json_path)
+    assert state is not None
+    assert sorted(a.slot_name for a in state.assignments) == sorted(str(c) for c in claimed)
+    assert load_pool_revision(repo.pool_json_path) == pool_size
+
+
+def test_allocate_concurrent_threads_get_distinct_slots(tmp_path: Path) -> None:
+    """Many concurrent allocations each get a different slot; extras find the pool full."""
+    pool_size = 6
+    repo = _configured_pool_repo(tmp_path, pool_size=pool_size)
+    ctx = context_for_test(
+        git=_root_only_git(tmp_path), repo=repo, console=_non_interactive_console()
+    )
+    branches = [f"feature-{n}" for n in range(pool_size + 4)]
+
+    with ThreadPoolExecutor(max_workers=len(branches)) as executor:
+        results = list(executor.map(lambda b: _allocate_or_none(ctx, repo, b), branches))
+
+    claimed = [slot for slot in results if slot is not None]
+    assert len(claimed) == len(set(claimed)) == pool_size
+    state = load_pool_state(repo.pool_json_path)
+    assert state is not None
+    assert sorted(a.slot_name for a in state.assignments) == sorted(claimed)
+    assert len({a.branch_name for a in state.assignments}) == pool_size
+
+
+def test_allocate_concurrent_processes_never_double_assign(tmp_path: Path) -> None:
+    """Separate erk processes allocating at once get distinct slots and lose no writes."""
+    pool_size = 24
+    workers = 8
+    repo = _configured_pool_repo(tmp_path, pool_size=pool_size)
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = [
+            executor.submit(_allocate_in_process, tmp_path, worker, pool_size // workers)
+            for worker in range(workers)
+        ]
+        claimed = [slot for future in futures for slot in future.result()]
+
+    assert None not in claimed
+    assert len(claimed) == len(set(claimed)) == pool_size
+    state = load_pool_state(repo.pool_json_path)
+    assert state is not None
+    assert sorted(a.slot_name for a in state.assignments) == sorted(str(c) for c in claimed)
+    assert load_pool_revision(repo.pool_json_path) == pool_size
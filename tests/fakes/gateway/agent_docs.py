@@ -32,6 +32,8 @@ class FakeAgentDocs(AgentDocs):
         self._files = dict(files)
         self._has_docs_dir = has_docs_dir
         self._written_files: dict[str, str] = {}
+        self._sync_manifest: str | None = None
+        self._format_calls: list[str] = []
 
     @property
     def written_files(self) -> dict[str, str]:
@@ -43,6 +45,24 @@ class FakeAgentDocs(AgentDocs):
         """
         return dict(self._written_files)
 
+    @property
+    def sync_manifest(self) -> str | None:
+        """Get the manifest written via write_sync_manifest().
+
+        This property is for test assertions only.
+        """
+        return self._sync_manifest
+
+    @property
+    def format_calls(self) -> list[str]:
+        """Get the content passed to each format_markdown() call.
+
+        Returns a copy of the list to prevent external mutation.
+
+        This property is for test assertions only.
+        """
+        return list(self._format_calls)
+
     def has_docs_dir(self, project_root: Path) -> bool:
         """Return configured docs_dir existence flag.
 
@@ -97,4 +117,25 @@ class FakeAgentDocs(AgentDocs):
         Returns:
             Same content unchanged
         """
+        self._format_calls.append(content)
         return content
+
+    def read_sync_manifest(self, project_root: Path) -> str | None:
+        """Return the manifest from the last write_sync_manifest() call.
+
+        Args:
+            project_root: Root of the project (ignored in fake)
+
+        Returns:
+            Manifest content, or None if never written
+        """
+        return self._sync_manifest
+
+    def write_sync_manifest(self, project_root: Path, content: str) -> None:
+        """Store the manifest in memory.
+
+        Args:
+            project_root: Root of the project (ignored in fake)
+            content: Manifest content to write
+        """
+        self._sync_manifest = content
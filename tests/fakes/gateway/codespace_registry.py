@@ -3,6 +3,8 @@
 Stores codespace data in memory without touching filesystem.
 """
 
+from datetime import datetime
+
 from erk_shared.gateway.codespace_registry.abc import CodespaceRegistry, RegisteredCodespace
 
 
@@ -19,15 +21,18 @@ class FakeCodespaceRegistry(CodespaceRegistry):
         *,
         codespaces: list[RegisteredCodespace] | None = None,
         default_codespace: str | None = None,
+        last_started: dict[str, datetime] | None = None,
     ) -> None:
         """Initialize the fake registry.
 
         Args:
             codespaces: Initial list of codespaces
             default_codespace: Name of the default codespace (must exist in codespaces)
+            last_started: Last recorded start time per codespace name
         """
         self._codespaces: dict[str, RegisteredCodespace] = {}
         self._default_codespace: str | None = default_codespace
+        self._last_started: dict[str, datetime] = dict(last_started) if last_started else {}
 
         # Track mutations for assertions
         self._registered: list[RegisteredCodespace] = []
@@ -58,6 +63,10 @@ class FakeCodespaceRegistry(CodespaceRegistry):
         """Get the name of the default codespace."""
         return self._default_codespace
 
+    def get_last_started_at(self, name: str) -> datetime | None:
+        """Get when erk last started or connected to a codespace."""
+        return self._last_started.get(name)
+
     # Test helper methods (not part of ABC)
 
     def register(self, codespace: RegisteredCodespace) -> None:
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple
 
@@ -244,6 +245,9 @@ class FakeCodespaceRegistry(CodespaceRegistry):
     def get_default_name(self) -> str | None:
         return self.default_name
 
+    def get_last_started_at(self, name: str) -> datetime | None:
+        return None
+
     def set_default(self, name: str) -> None:
         if name not in self.codespaces:
             raise ValueError(f"No codespace with name '{name}' exists")
@@ -311,6 +315,31 @@ class FakePrListService(PrListService):
             warnings=self._data.warnings,
         )
 
+    def iter_pr_list_pages(
+        self,
+        *,
+        location: GitHubRepoLocation,
+        labels: list[str],
+        state: IssueFilterState,
+        limit: int | None,
+        page_size: int,
+        skip_workflow_runs: bool,
+        creator: str | None,
+        exclude_labels: list[str] | None,
+        http_client: HttpClient,
+    ) -> Iterator[PrListData]:
+        data = self.get_pr_list_data(
+            location=location,
+            labels=labels,
+            state=state,
+            limit=limit,
+            skip_workflow_runs=skip_workflow_runs,
+            creator=creator,
+            exclude_labels=exclude_labels,
+            http_client=http_client,
+        )
+        yield from _chunk_pr_list_data(data, page_size=page_size)
+
 
 class FakeObjectiveListService(ObjectiveListService):
     """Fake ObjectiveListService for testing.
@@ -333,3 +362,28 @@ class FakeObjectiveListService(ObjectiveListService):
         http_client: HttpClient,
     ) -> PrListData:
         return self._data
+
+    def iter_objective_list_pages(
+        self,
+        *,
+        location: GitHubRepoLocation,
+        state: IssueFilterState,
+        limit: int | None,
+        page_size: int,
+        skip_workflow_runs: bool,
+        creator: str | None,
+        exclude_labels: list[str] | None,
+        http_client: HttpClient,
+    ) -> Iterator[PrListData]:
+        yield from _chunk_pr_list_data(self._data, page_size=page_size)
+
+
+def _chunk_pr_list_data(data: PrListData, *, page_size: int) -> Iterator[PrListData]:
+    """Split data into pages of page_size plans; always yields at least one page."""
+    for start in range(0, max(len(data.plans), 1), page_size):
+        yield PrListData(
+            plans=data.plans[start : start + page_size],
+            pr_linkages=data.pr_linkages,
+            workflow_runs=data.workflow_runs,
+            warnings=data.warnings if start == 0 else (),
+        )
@@ -1,6 +1,7 @@
 """Fake implementation of git analysis operations for testing."""
 
-from pathlib import Path
+from collections.abc import Iterator
+from pathlib import Path, PurePosixPath
 
 from erk_shared.gateway.git.analysis_ops.abc import GitAnalysisOps
 
@@ -65,6 +66,22 @@ class FakeGitAnalysisOps(GitAnalysisOps):
         """Get diff between branch and HEAD."""
         return self._diffs.get((cwd, branch), "")
 
+    def stream_diff_to_branch(
+        self,
+        cwd: Path,
+        branch: str,
+        *,
+        exclude_basenames: frozenset[str],
+    ) -> Iterator[str]:
+        """Yield the configured diff line by line, dropping excluded files."""
+        excluded = False
+        for line in self._diffs.get((cwd, branch), "").splitlines(keepends=True):
+            if line.startswith("diff --git a/"):
+                path = line[len("diff --git a/") :].split(" b/", 1)[0]
+                excluded = PurePosixPath(path).name in exclude_basenames
+            if not excluded:
+                yield line
+
     # ============================================================================
     # Test Setup (FakeGit integration)
     # ============================================================================
@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import subprocess
+from collections.abc import Sequence
 from pathlib import Path
 
-from erk_shared.gateway.git.abc import BranchDivergence, BranchSyncInfo, WorktreeInfo
+from erk_shared.gateway.git.abc import (
+    BranchDivergence,
+    BranchSyncInfo,
+    LocalRefUpdate,
+    RemoteBranchState,
+    WorktreeInfo,
+)
 from erk_shared.gateway.git.branch_ops.abc import GitBranchOps
 from erk_shared.gateway.git.branch_ops.types import BranchAlreadyExists, BranchCreated
 
@@ -107,7 +114,9 @@ class FakeGitBranchOps(GitBranchOps):
         self._detached_checkouts: list[tuple[Path, str]] = []
         self._created_tracking_branches: list[tuple[str, str]] = []  # (branch, remote_ref)
         self._updated_refs: list[tuple[Path, str, str]] = []  # (repo_root, branch, target_sha)
+        self._ref_update_batches: list[tuple[Path, tuple[LocalRefUpdate, ...]]] = []
         self._reset_hard_calls: list[tuple[Path, str]] = []  # (cwd, target_ref)
+        self._detect_trunk_branch_calls: list[Path] = []
 
     def create_branch(
         self, cwd: Path, branch_name: str, start_point: str, *, force: bool
@@ -257,6 +266,35 @@ class FakeGitBranchOps(GitBranchOps):
         self._updated_refs.append((repo_root, branch, target_sha))
         self._branch_heads[branch] = target_sha
 
+    @property
+    def ref_update_batches(self) -> list[tuple[Path, tuple[LocalRefUpdate, ...]]]:
+        """Get list of batched ref update transactions during test.
+
+        Returns list of (repo_root, updates) tuples, one per update_local_refs call.
+        This property is for test assertions only.
+        """
+        return self._ref_update_batches.copy()
+
+    def update_local_refs(self, repo_root: Path, updates: Sequence[LocalRefUpdate]) -> None:
+        """Update several local branch refs atomically (fake implementation).
+
+        Rejects the whole batch if any expected_sha does not match the current
+        branch head, then records each update like update_local_ref.
+        """
+        if not updates:
+            return
+        for update in updates:
+            current = self._branch_heads.get(update.branch)
+            if update.expected_sha is not None and current != update.expected_sha:
+                raise RuntimeError(
+                    f"Failed to update {len(updates)} local branch ref(s): "
+                    f"'{update.branch}' is at {current}, expected {update.expected_sha}"
+                )
+        self._ref_update_batches.append((repo_root, tuple(updates)))
+        for update in updates:
+            self._updated_refs.append((repo_root, update.branch, update.target_sha))
+            self._branch_heads[update.branch] = update.target_sha
+
     def reset_hard(self, cwd: Path, target_ref: str) -> None:
         """Reset the current branch to a target ref (fake implementation).
 
@@ -277,6 +315,15 @@ class FakeGitBranchOps(GitBranchOps):
         """
         return self._reset_hard_calls.copy()
 
+    @property
+    def detect_trunk_branch_calls(self) -> list[Path]:
+        """Get list of detect_trunk_branch() calls during test.
+
+        Returns list of repo_root paths passed to detect_trunk_branch().
+        This property is for test assertions only.
+        """
+        return self._detect_trunk_branch_calls.copy()
+
     def link_mutation_tracking(
         self,
         created_branches: list[tuple[Path, str, str, bool]],
@@ -335,6 +382,7 @@ class FakeGitBranchOps(GitBranchOps):
 
     def detect_trunk_branch(self, repo_root: Path) -> str:
         """Auto-detect the trunk branch name."""
+        self._detect_trunk_branch_calls.append(repo_root)
         return self._trunk_branches.get(repo_root, "main")
 
     def validate_trunk_branch(self, repo_root: Path, name: str) -> str:
@@ -376,6 +424,33 @@ class FakeGitBranchOps(GitBranchOps):
             (cwd, branch, remote), BranchDivergence(is_diverged=False, ahead=0, behind=0)
         )
 
+    def get_remote_branch_states(
+        self, repo_root: Path, remote: str, branches: Sequence[str]
+    ) -> dict[str, RemoteBranchState]:
+        """Compare local branches with their remote refs.
+
+        Remote existence comes from remote_branches, ahead/behind from
+        branch_divergence keyed by (repo_root, branch, remote), and SHAs from
+        branch_heads ("<remote>/<branch>" for the remote ref).
+        """
+        remote_refs = self._remote_branches.get(repo_root, [])
+        states: dict[str, RemoteBranchState] = {}
+        for branch in branches:
+            remote_ref = f"{remote}/{branch}"
+            divergence = self._branch_divergence.get(
+                (repo_root, branch, remote),
+                BranchDivergence(is_diverged=False, ahead=0, behind=0),
+            )
+            states[branch] = RemoteBranchState(
+                branch=branch,
+                local_sha=self._branch_heads.get(branch),
+                exists_on_remote=remote_ref in remote_refs,
+                remote_sha=self._branch_heads.get(remote_ref),
+                ahead=divergence.ahead,
+                behind=divergence.behind,
+            )
+        return states
+
     def get_behind_commit_authors(self, cwd: Path, branch: str) -> list[str]:
         """Get authors of commits on remote that are not in local branch."""
         return self._behind_commit_authors.get((cwd, branch), [])
@@ -32,6 +32,7 @@ class FakeWorktree(Worktree):
     - added_worktrees: Worktrees added via add_worktree()
     - removed_worktrees: Worktrees removed via remove_worktree()
     - chdir_history: Directories changed to via safe_chdir()
+    - list_worktrees_calls: Repo roots passed to list_worktrees()
     """
 
     def __init__(
@@ -64,6 +65,7 @@ class FakeWorktree(Worktree):
         self._added_worktrees: list[tuple[Path, str | None]] = []
         self._removed_worktrees: list[Path] = []
         self._chdir_history: list[Path] = []
+        self._list_worktrees_calls: list[Path] = []
 
     def list_worktrees(self, repo_root: Path) -> list[WorktreeInfo]:
         """List all worktrees in the repository.
@@ -73,6 +75,7 @@ class FakeWorktree(Worktree):
         - Returns the same worktree list regardless of which path is used
         - Handles symlink resolution differences (e.g., /var vs /private/var on macOS)
         """
+        self._list_worktrees_calls.append(repo_root)
         resolved_root = repo_root.resolve()
 
         # Check exact match first (with symlink resolution)
@@ -294,3 +297,12 @@ class FakeWorktree(Worktree):
         This property is for test assertions only.
         """
         return self._chdir_history.copy()
+
+    @property
+    def list_worktrees_calls(self) -> list[Path]:
+        """Get list of list_worktrees() calls during test.
+
+        Returns list of repo_root paths passed to list_worktrees().
+        This property is for test assertions only.
+        """
+        return self._list_worktrees_calls.copy()
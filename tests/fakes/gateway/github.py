@@ -5,14 +5,15 @@ in its constructor. Construct instances directly with keyword arguments.
 """
 
 import dataclasses
-from collections.abc import Callable
-from datetime import UTC
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from erk_shared.gateway.github.abc import LocalGitHub
 from erk_shared.gateway.github.issues.abc import GitHubIssues
 from erk_shared.gateway.github.issues.types import IssueInfo
+from erk_shared.gateway.github.run_correlation import WorkflowRunFound, WorkflowRunResult
 from erk_shared.gateway.github.types import (
     BodyContent,
     BodyFile,
@@ -21,6 +22,7 @@ from erk_shared.gateway.github.types import (
     GitHubRepoLocation,
     IssueFilterState,
     IssueOrPullRequest,
+    IssuesWithPrLinkagesPage,
     MergeError,
     MergeResult,
     PRCheckRun,
@@ -29,6 +31,7 @@ from erk_shared.gateway.github.types import (
     PRNotFound,
     PRReview,
     PRReviewThread,
+    PRReviewThreadPage,
     PullRequestInfo,
     RepoInfo,
     WorkflowRun,
@@ -73,6 +76,7 @@ class FakeLocalGitHub(LocalGitHub):
         pr_reviews: dict[int, list[PRReview]] | None = None,
         pr_check_runs: dict[int, list[PRCheckRun]] | None = None,
         review_threads_rate_limited: bool = False,
+        review_thread_page_size: int = 100,
         resolve_thread_failures: set[str] | None = None,
         unresolve_thread_failures: set[str] | None = None,
         pr_diff_error: str | None = None,
@@ -120,6 +124,8 @@ class FakeLocalGitHub(LocalGitHub):
             pr_reviews: Mapping of pr_number -> list[PRReview] for get_pr_reviews()
             review_threads_rate_limited: Whether get_pr_review_threads() should raise
                 RuntimeError simulating GraphQL rate limit
+            review_thread_page_size: Threads per page yielded by
+                iter_pr_review_thread_pages()
             resolve_thread_failures: Set of thread IDs that should fail when resolved
             unresolve_thread_failures: Set of thread IDs that should fail when unresolved
             pr_diff_error: If set, get_pr_diff() raises RuntimeError with this message.
@@ -166,6 +172,7 @@ class FakeLocalGitHub(LocalGitHub):
         self._pr_base_update_should_apply = pr_base_update_should_apply
         self._pr_review_threads = pr_review_threads or {}
         self._review_threads_rate_limited = review_threads_rate_limited
+        self._review_thread_page_size = review_thread_page_size
         self._resolve_thread_failures = resolve_thread_failures or set()
         self._unresolve_thread_failures = unresolve_thread_failures or set()
         self._pr_diff_error = pr_diff_error
@@ -181,8 +188,10 @@ class FakeLocalGitHub(LocalGitHub):
         self._closed_prs: list[int] = []
         self._marked_pr_ready: list[int] = []
         self._triggered_workflows: list[tuple[str, dict[str, str], str | None]] = []
+        self._resolved_workflow_runs: list[tuple[str, list[str]]] = []
         self._poll_attempts: list[tuple[str, str, int, int]] = []
         self._check_auth_status_calls: list[None] = []
+        self._pr_detail_requests: list[tuple[str, tuple[object, ...]]] = []
         self._created_prs: list[tuple[str, str, str, str | None, bool]] = []
         self._pr_labels: dict[int, set[str]] = {}
         self._added_labels: list[tuple[int, str]] = []
@@ -208,12 +217,18 @@ class FakeLocalGitHub(LocalGitHub):
         self._pr_head_branches = pr_head_branches or {}
         self._cancelled_run_ids: list[str] = []
         self._rerun_run_ids: list[tuple[str, bool]] = []
+        self._issues_with_pr_linkages_page_requests = 0
 
     @property
     def issues(self) -> GitHubIssues:
         """Access to issue operations."""
         return self._issues_gateway
 
+    @property
+    def issues_with_pr_linkages_page_requests(self) -> int:
+        """Number of issue pages fetched through iter_issues_with_pr_linkages_pages()."""
+        return self._issues_with_pr_linkages_page_requests
+
     @property
     def merged_prs(self) -> list[int]:
         """List of PR numbers that were merged."""
@@ -295,6 +310,35 @@ class FakeLocalGitHub(LocalGitHub):
         Returns:
             A fake run ID for testing
         """
+        self._record_triggered_workflow(workflow=workflow, inputs=inputs, ref=ref)
+        return "1234567890"
+
+    def start_workflow(
+        self, *, repo_root: Path, workflow: str, inputs: dict[str, str], ref: str | None
+    ) -> str:
+        """Record workflow dispatch like trigger_workflow() and return a distinct_id.
+
+        resolve_workflow_runs() maps every distinct_id to the same fake run ID
+        that trigger_workflow() returns.
+        """
+        self._record_triggered_workflow(workflow=workflow, inputs=inputs, ref=ref)
+        return f"distinct-{len(self._triggered_workflows)}"
+
+    def resolve_workflow_runs(
+        self,
+        *,
+        repo_root: Path,
+        workflow: str,
+        distinct_ids: list[str],
+        dispatched_at: datetime,
+    ) -> dict[str, WorkflowRunResult]:
+        """Record the resolution batch and return the fake run ID for each ID."""
+        self._resolved_workflow_runs.append((workflow, list(distinct_ids)))
+        return {distinct_id: WorkflowRunFound(run_id="1234567890") for distinct_id in distinct_ids}
+
+    def _record_triggered_workflow(
+        self, *, workflow: str, inputs: dict[str, str], ref: str | None
+    ) -> None:
         self._triggered_workflows.append((workflow, inputs, ref))
         run_id = "1234567890"
         # Create a WorkflowRun entry so get_workflow_run() can find it
@@ -310,7 +354,6 @@ class FakeLocalGitHub(LocalGitHub):
         )
         # Prepend to list so it's found first (most recent)
         self._workflow_runs.insert(0, triggered_run)
-        return run_id
 
     def create_pr(
         self,
@@ -415,6 +458,11 @@ class FakeLocalGitHub(LocalGitHub):
         """Read-only access to tracked workflow triggers for test assertions."""
         return self._triggered_workflows
 
+    @property
+    def resolved_workflow_runs(self) -> list[tuple[str, list[str]]]:
+        """Read-only access to resolve_workflow_runs() batches (workflow, distinct_ids)."""
+        return self._resolved_workflow_runs
+
     def list_all_workflow_runs(
         self, repo_root: Path, *, limit: int, actor: str | None = None
     ) -> list[WorkflowRun]:
@@ -705,7 +753,52 @@ class FakeLocalGitHub(LocalGitHub):
         Returns:
             Tuple of (filtered_issues, pr_linkages for those issues)
         """
-        # Filter issues by labels, state, and creator
+        filtered_issues = self._filter_issues(labels=labels, state=state, creator=creator)
+
+        # Apply limit
+        effective_limit = limit if limit is not None else len(filtered_issues)
+        filtered_issues = filtered_issues[:effective_limit]
+
+        return (filtered_issues, self._pr_linkages_for(filtered_issues))
+
+    def iter_issues_with_pr_linkages_pages(
+        self,
+        *,
+        location: GitHubRepoLocation,
+        labels: list[str],
+        state: IssueFilterState,
+        limit: int | None,
+        page_size: int,
+        creator: str | None,
+    ) -> Iterator[IssuesWithPrLinkagesPage]:
+        """Yield the issues get_issues_with_pr_linkages() returns, page_size at a time.
+
+        Cursors are "cursor-<index>" where index is the position after the
+        page's last issue. Always yields at least one (possibly empty) page.
+        """
+        self._issues_with_pr_linkages_page_requests += 1
+        issues, _ = self.get_issues_with_pr_linkages(
+            location=location, labels=labels, state=state, limit=limit, creator=creator
+        )
+        start = 0
+        while True:
+            end = min(start + page_size, len(issues))
+            page = issues[start:end]
+            end_cursor = f"cursor-{end}" if end < len(issues) else None
+            yield IssuesWithPrLinkagesPage(
+                issues=tuple(page),
+                pr_linkages=self._pr_linkages_for(page),
+                end_cursor=end_cursor,
+            )
+            if end_cursor is None:
+                return
+            self._issues_with_pr_linkages_page_requests += 1
+            start = end
+
+    def _filter_issues(
+        self, *, labels: list[str], state: IssueFilterState, creator: str | None
+    ) -> list[IssueInfo]:
+        """Filter pre-configured issues by labels, state, and creator."""
         filtered_issues = []
         for issue in self._issues_data:
             # Check if issue has all required labels
@@ -718,18 +811,15 @@ class FakeLocalGitHub(LocalGitHub):
             if creator is not None and issue.author != creator:
                 continue
             filtered_issues.append(issue)
+        return filtered_issues
 
-        # Apply limit
-        effective_limit = limit if limit is not None else len(filtered_issues)
-        filtered_issues = filtered_issues[:effective_limit]
-
-        # Build PR linkages for filtered issues
+    def _pr_linkages_for(self, issues: list[IssueInfo]) -> dict[int, list[PullRequestInfo]]:
+        """Build PR linkages for the given issues from pr_plan_linkages."""
         pr_linkages: dict[int, list[PullRequestInfo]] = {}
-        for issue in filtered_issues:
+        for issue in issues:
             if issue.number in self._pr_plan_linkages:
                 pr_linkages[issue.number] = self._pr_plan_linkages[issue.number]
-
-        return (filtered_issues, pr_linkages)
+        return pr_linkages
 
     def get_pr(self, repo_root: Path, pr_number: int) -> PRDetails | PRNotFound:
         """Get comprehensive PR details from pre-configured state.
@@ -737,6 +827,7 @@ class FakeLocalGitHub(LocalGitHub):
         Returns:
             PRDetails if pr_number exists, PRNotFound otherwise
         """
+        self._pr_detail_requests.append(("get_pr", (pr_number,)))
         if pr_number not in self._pr_details:
             return PRNotFound(pr_number=pr_number)
         return self._pr_details[pr_number]
@@ -750,6 +841,10 @@ class FakeLocalGitHub(LocalGitHub):
         Returns:
             PRDetails if a PR exists for the branch, PRNotFound otherwise
         """
+        self._pr_detail_requests.append(("get_pr_for_branch", (branch,)))
+        return self._lookup_pr_for_branch(branch)
+
+    def _lookup_pr_for_branch(self, branch: str) -> PRDetails | PRNotFound:
         # Simple lookup first
         if branch in self._prs_by_branch:
             return self._prs_by_branch[branch]
@@ -763,6 +858,38 @@ class FakeLocalGitHub(LocalGitHub):
             return PRNotFound(branch=branch)
         return pr_details
 
+    def get_pr_details_by_numbers(
+        self, repo_root: Path, pr_numbers: list[int]
+    ) -> dict[int, PRDetails]:
+        """Batch lookup from pre-configured pr_details, recorded as one request."""
+        self._pr_detail_requests.append(("get_pr_details_by_numbers", tuple(pr_numbers)))
+        return {
+            number: self._pr_details[number] for number in pr_numbers if number in self._pr_details
+        }
+
+    def get_pr_details_by_branches(
+        self, repo_root: Path, branches: list[str]
+    ) -> dict[str, PRDetails]:
+        """Batch branch lookup with get_pr_for_branch semantics, recorded as one request."""
+        self._pr_detail_requests.append(("get_pr_details_by_branches", tuple(branches)))
+        result: dict[str, PRDetails] = {}
+        for branch in branches:
+            pr = self._lookup_pr_for_branch(branch)
+            if not isinstance(pr, PRNotFound):
+                result[branch] = pr
+        return result
+
+    @property
+    def pr_detail_requests(self) -> list[tuple[str, tuple[object, ...]]]:
+        """PR detail lookups made, as (method_name, args) in call order.
+
+        Covers get_pr, get_pr_for_branch, and their batched variants, so tests
+        can assert how many round-trips a code path makes.
+
+        This property is for test assertions only.
+        """
+        return list(self._pr_detail_requests)
+
     def list_prs(
         self,
         repo_root: Path,
@@ -941,6 +1068,25 @@ class FakeLocalGitHub(LocalGitHub):
         """Set labels for a PR (for test setup)."""
         self._pr_labels[pr_number] = labels
 
+    def _current_review_threads(self, pr_number: int) -> list[PRReviewThread]:
+        """Return configured threads with test-time resolutions applied, in order.
+
+        Raises RuntimeError if review_threads_rate_limited is True, simulating
+        a GraphQL API rate limit error.
+        """
+        if self._review_threads_rate_limited:
+            raise RuntimeError("GraphQL API RATE_LIMIT exceeded")
+        threads = self._pr_review_threads.get(pr_number, [])
+
+        result_threads: list[PRReviewThread] = []
+        for t in threads:
+            is_resolved = (
+                t.is_resolved or t.id in self._resolved_thread_ids
+            ) and t.id not in self._unresolved_thread_ids
+            # Create new thread with updated resolution status
+            result_threads.append(dataclasses.replace(t, is_resolved=is_resolved))
+        return result_threads
+
     def get_pr_review_threads(
         self,
         repo_root: Path,
@@ -956,34 +1102,41 @@ class FakeLocalGitHub(LocalGitHub):
         Raises RuntimeError if review_threads_rate_limited is True, simulating
         a GraphQL API rate limit error.
         """
-        if self._review_threads_rate_limited:
-            raise RuntimeError("GraphQL API RATE_LIMIT exceeded")
-        threads = self._pr_review_threads.get(pr_number, [])
-
-        # Apply any resolutions that happened during test
-        result_threads: list[PRReviewThread] = []
-        for t in threads:
-            is_resolved = (
-                t.is_resolved or t.id in self._resolved_thread_ids
-            ) and t.id not in self._unresolved_thread_ids
-            if is_resolved and not include_resolved:
-                continue
-            # Create new thread with updated resolution status
-            result_threads.append(
-                PRReviewThread(
-                    id=t.id,
-                    path=t.path,
-                    line=t.line,
-                    is_resolved=is_resolved,
-                    is_outdated=t.is_outdated,
-                    comments=t.comments,
-                )
-            )
+        result_threads = [
+            t
+            for t in self._current_review_threads(pr_number)
+            if include_resolved or not t.is_resolved
+        ]
 
         # Sort by path, then by line
         result_threads.sort(key=lambda t: (t.path, t.line or 0))
         return result_threads
 
+    def iter_pr_review_thread_pages(
+        self,
+        repo_root: Path,
+        pr_number: int,
+        *,
+        include_resolved: bool,
+        after: str | None,
+    ) -> Iterator[PRReviewThreadPage]:
+        """Yield configured threads in pages of review_thread_page_size.
+
+        Cursors are "cursor-<index>" where index is the position after the
+        page's last thread. Resolved threads are filtered per page, like the
+        real GraphQL implementation.
+        """
+        threads = self._current_review_threads(pr_number)
+        start = int(after.removeprefix("cursor-")) if after is not None else 0
+        if start >= len(threads):
+            yield PRReviewThreadPage(threads=(), end_cursor=None)
+            return
+        while start < len(threads):
+            end = min(start + self._review_thread_page_size, len(threads))
+            page = tuple(t for t in threads[start:end] if include_resolved or not t.is_resolved)
+            yield PRReviewThreadPage(threads=page, end_cursor=f"cursor-{end}")
+            start = end
+
     def get_pr_reviews(
         self,
         repo_root: Path,
@@ -1092,6 +1245,22 @@ class FakeLocalGitHub(LocalGitHub):
                 result.append({"id": 1000000 + i, "body": body})
         return result
 
+    def iter_pr_reviews(
+        self,
+        repo_root: Path,
+        pr_number: int,
+    ) -> Iterator[PRReview]:
+        """Yield PR-level reviews for a PR from pre-configured data."""
+        yield from self._pr_reviews.get(pr_number, [])
+
+    def iter_pr_comments(
+        self,
+        repo_root: Path,
+        pr_number: int,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield all comments for a PR, in the same format as fetch_pr_comments()."""
+        yield from self.fetch_pr_comments(repo_root, pr_number)
+
     def find_pr_comment_by_marker(
         self,
         repo_root: Path,
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 from erk_shared.gateway.git.abc import Git
 from erk_shared.gateway.github.types import GitHubRepoId, PullRequestInfo
 from erk_shared.gateway.graphite.abc import Graphite
+from erk_shared.gateway.graphite.stack_index import StackIndex
 from erk_shared.gateway.graphite.types import BranchMetadata
 
 
@@ -81,6 +82,8 @@ class FakeGraphite(Graphite):
         self._auth_username = auth_username
         self._auth_repo_info = auth_repo_info
         self._check_auth_status_calls: list[None] = []
+        self._get_all_branches_calls: list[Path] = []
+        self._get_stack_index_calls: list[Path] = []
 
     def get_graphite_url(self, repo_id: GitHubRepoId, pr_number: int) -> str:
         """Get Graphite PR URL (constructs URL directly)."""
@@ -92,8 +95,30 @@ class FakeGraphite(Graphite):
 
     def get_all_branches(self, git_ops: Git, repo_root: Path) -> dict[str, BranchMetadata]:
         """Return pre-configured branch metadata for tests."""
+        self._get_all_branches_calls.append(repo_root)
         return self._branches.copy()
 
+    @property
+    def get_all_branches_calls(self) -> list[Path]:
+        """Get the repo roots of get_all_branches() calls that were made.
+
+        This property is for test assertions only.
+        """
+        return self._get_all_branches_calls
+
+    def get_stack_index(self, git_ops: Git, repo_root: Path) -> StackIndex | None:
+        """Build the stack index from pre-configured branch metadata."""
+        self._get_stack_index_calls.append(repo_root)
+        return super().get_stack_index(git_ops, repo_root)
+
+    @property
+    def get_stack_index_calls(self) -> list[Path]:
+        """Get the repo roots of get_stack_index() calls that were made.
+
+        This property is for test assertions only.
+        """
+        return self._get_stack_index_calls
+
     def get_branch_stack(self, git_ops: Git, repo_root: Path, branch: str) -> list[str] | None:
         """Return pre-configured stack for the given branch."""
         # If stacks are configured, use those
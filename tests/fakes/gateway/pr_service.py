@@ -39,6 +39,12 @@ class FakePrService(PrService):
         self._check_runs_by_pr: dict[int, list[PRCheckRun]] = {}
         self._ci_summaries_by_pr: dict[int, dict[str, str]] = {}
         self._stacks_by_branch: dict[str, list[str]] = {}
+        self._fetch_calls: list[tuple[str, int]] = []
+
+    @property
+    def fetch_calls(self) -> list[tuple[str, int]]:
+        """(method name, pr_number) for every detail fetch, in call order."""
+        return list(self._fetch_calls)
 
     @property
     def repo_root(self) -> Path:
@@ -85,6 +91,7 @@ class FakePrService(PrService):
         Returns:
             The configured PR content for this PR, or None
         """
+        self._fetch_calls.append(("fetch_pr_content", pr_number))
         return self._pr_content_by_pr_number.get(pr_number)
 
     def set_pr_content(self, pr_number: int, content: str) -> None:
@@ -106,6 +113,7 @@ class FakePrService(PrService):
         Returns:
             The configured objective content for this PR, or None
         """
+        self._fetch_calls.append(("fetch_objective_content", pr_number))
         return self._objective_content_by_pr_number.get(pr_number)
 
     def set_objective_content(self, pr_number: int, content: str) -> None:
@@ -146,6 +154,7 @@ class FakePrService(PrService):
         Returns:
             Configured list of PRCheckRun for this PR, or empty list
         """
+        self._fetch_calls.append(("fetch_check_runs", pr_number))
         return self._check_runs_by_pr.get(pr_number, [])
 
     def set_check_runs(self, pr_number: int, check_runs: list[PRCheckRun]) -> None:
@@ -166,6 +175,7 @@ class FakePrService(PrService):
         Returns:
             Configured list of PRReviewThread for this PR, or empty list
         """
+        self._fetch_calls.append(("fetch_unresolved_comments", pr_number))
         return self._review_threads_by_pr.get(pr_number, [])
 
     def set_review_threads(self, pr_number: int, threads: list[PRReviewThread]) -> None:
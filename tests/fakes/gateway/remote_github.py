@@ -4,10 +4,16 @@ Constructor-injected responses for reads, mutation tracking lists for write asse
 """
 
 from dataclasses import dataclass, replace
+from datetime import datetime
 
 from erk_shared.gateway.github.issues.types import IssueInfo, IssueNotFound
+from erk_shared.gateway.github.run_correlation import WorkflowRunFound, WorkflowRunResult
 from erk_shared.gateway.remote_github.abc import RemoteGitHub
-from erk_shared.gateway.remote_github.types import RemotePRInfo, RemotePRNotFound
+from erk_shared.gateway.remote_github.types import (
+    RemoteIssueComment,
+    RemotePRInfo,
+    RemotePRNotFound,
+)
 
 
 @dataclass(frozen=True)
@@ -142,6 +148,7 @@ class FakeRemoteGitHub(RemoteGitHub):
         issue_comments: dict[int, list[str]] | None,
         comments_by_id: dict[int, str] | None = None,
         prs: dict[int, RemotePRInfo] | None = None,
+        issue_comment_records: dict[int, list[RemoteIssueComment]] | None = None,
     ) -> None:
         """Create FakeRemoteGitHub with configurable responses.
 
@@ -155,6 +162,9 @@ class FakeRemoteGitHub(RemoteGitHub):
             issue_comments: Pre-configured comment bodies keyed by issue number
             comments_by_id: Pre-configured comment bodies keyed by comment ID
             prs: Pre-configured PRs keyed by number (for get_pr)
+            issue_comment_records: Pre-configured comments with IDs and timestamps
+                keyed by issue number (for get_issue_comments_since). Issues without
+                records fall back to issue_comments with sequential IDs.
         """
         self._authenticated_user = authenticated_user
         self._default_branch_name = default_branch_name
@@ -169,6 +179,9 @@ class FakeRemoteGitHub(RemoteGitHub):
         )
         self._comments_by_id: dict[int, str] = comments_by_id if comments_by_id is not None else {}
         self._prs: dict[int, RemotePRInfo] = prs if prs is not None else {}
+        self._issue_comment_records: dict[int, list[RemoteIssueComment]] = (
+            issue_comment_records if issue_comment_records is not None else {}
+        )
 
         # Mutation tracking
         self._created_refs: list[CreatedRef] = []
@@ -177,12 +190,14 @@ class FakeRemoteGitHub(RemoteGitHub):
         self._updated_pr_bodies: list[UpdatedPullRequestBody] = []
         self._added_labels: list[AddedLabels] = []
         self._dispatched_workflows: list[DispatchedWorkflow] = []
+        self._resolved_workflow_runs: list[tuple[str, list[str]]] = []
         self._added_issue_comments: list[AddedIssueComment] = []
         self._updated_issue_bodies: list[UpdatedIssueBody] = []
         self._updated_comments: list[UpdatedComment] = []
         self._closed_issues: list[ClosedIssue] = []
         self._closed_prs: list[ClosedPR] = []
         self._next_comment_id = 1000
+        self._issue_comment_fetches: list[tuple[int, str | None]] = []
 
     # --- Read methods ---
 
@@ -284,6 +299,35 @@ class FakeRemoteGitHub(RemoteGitHub):
         )
         return self._dispatch_run_id
 
+    def start_workflow(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        workflow: str,
+        ref: str,
+        inputs: dict[str, str],
+    ) -> str:
+        self._dispatched_workflows.append(
+            DispatchedWorkflow(owner=owner, repo=repo, workflow=workflow, ref=ref, inputs=inputs)
+        )
+        return f"distinct-{len(self._dispatched_workflows)}"
+
+    def resolve_workflow_runs(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        workflow: str,
+        distinct_ids: list[str],
+        dispatched_at: datetime,
+    ) -> dict[str, WorkflowRunResult]:
+        self._resolved_workflow_runs.append((workflow, list(distinct_ids)))
+        return {
+            distinct_id: WorkflowRunFound(run_id=self._dispatch_run_id)
+            for distinct_id in distinct_ids
+        }
+
     def add_issue_comment(
         self,
         *,
@@ -332,6 +376,31 @@ class FakeRemoteGitHub(RemoteGitHub):
     ) -> list[str]:
         return list(self._issue_comments.get(number, []))
 
+    def get_issue_comments_since(
+        self,
+        *,
+        owner: str,
+        repo: str,
+        number: int,
+        since: str | None,
+    ) -> list[RemoteIssueComment]:
+        self._issue_comment_fetches.append((number, since))
+        if number in self._issue_comment_records:
+            records = self._issue_comment_records[number]
+        else:
+            records = [
+                RemoteIssueComment(
+                    id=index + 1,
+                    created_at="2024-01-01T00:00:00Z",
+                    updated_at="2024-01-01T00:00:00Z",
+                    body=body,
+                )
+                for index, body in enumerate(self._issue_comments.get(number, []))
+            ]
+        if since is None:
+            return list(records)
+        return [record for record in records if record.updated_at >= since]
+
     def list_issues(
         self,
         *,
@@ -444,6 +513,16 @@ class FakeRemoteGitHub(RemoteGitHub):
         """Returns list of DispatchedWorkflow records."""
         return list(self._dispatched_workflows)
 
+    @property
+    def resolved_workflow_runs(self) -> list[tuple[str, list[str]]]:
+        """Returns resolve_workflow_runs() batches as (workflow, distinct_ids)."""
+        return list(self._resolved_workflow_runs)
+
+    @property
+    def issue_comment_fetches(self) -> list[tuple[int, str | None]]:
+        """Returns (issue_number, since) for each get_issue_comments_since call."""
+        return list(self._issue_comment_fetches)
+
     @property
     def added_issue_comments(self) -> list[AddedIssueComment]:
         """Returns list of AddedIssueComment records."""
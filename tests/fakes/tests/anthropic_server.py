@@ -0,0 +1,139 @@
+"""Local fake of the Anthropic Messages API for executor tests and benchmarks.
+
+Serves POST /v1/messages as a server-sent event stream with a configurable
+per-request latency, and can answer the first N requests with 429 + a
+retry-after header. Records the maximum number of requests in flight so
+tests can assert that batch execution is actually concurrent.
+
+scripts/benchmark_anthropic_batch.py uses it to compare sequential and
+batched throughput.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+from tests.fakes.tests.stub_http_server import StubHttpServer, StubRequestHandler
+
+
+def _sse(event: str, data: dict[str, object]) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+def _message_events(*, model: str, text: str) -> list[bytes]:
+    return [
+        _sse(
+            "message_start",
+            {
+                "type": "message_start",
+                "message": {
+                    "id": "msg_fake",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": model,
+                    "content": [],
+                    "stop_reason": None,
+                    "stop_sequence": None,
+                    "usage": {"input_tokens": 1, "output_tokens": 0},
+                },
+            },
+        ),
+        _sse(
+            "content_block_start",
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            },
+        ),
+        _sse(
+            "content_block_delta",
+            {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": text},
+            },
+        ),
+        _sse("content_block_stop", {"type": "content_block_stop", "index": 0}),
+        _sse(
+            "message_delta",
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": 1},
+            },
+        ),
+        _sse("message_stop", {"type": "message_stop"}),
+    ]
+
+
+class FakeAnthropicServer(StubHttpServer):
+    """Threaded HTTP server speaking the streaming Messages API.
+
+    Each response echoes the request's last user message as "echo: <prompt>".
+    Use as a context manager; `base_url` is valid inside the block.
+    """
+
+    def __init__(self, *, latency_seconds: float, rate_limited_requests: int) -> None:
+        self._latency_seconds = latency_seconds
+        self._rate_limited_remaining = rate_limited_requests
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self.request_count = 0
+        self.rate_limited_count = 0
+        super().__init__()
+
+    def _begin(self) -> bool:
+        """Track a new request. Returns True when it should be rate limited."""
+        with self._lock:
+            self.request_count += 1
+            if self._rate_limited_remaining > 0:
+                self._rate_limited_remaining -= 1
+                self.rate_limited_count += 1
+                return True
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            return False
+
+    def _end(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _handler_class(self) -> type[StubRequestHandler]:
+        server = self
+
+        class _Handler(StubRequestHandler):
+            def do_POST(self) -> None:
+                body = self.read_json_body()
+                if server._begin():
+                    payload = json.dumps(
+                        {
+                            "type": "error",
+                            "error": {"type": "rate_limit_error", "message": "rate limited"},
+                        }
+                    ).encode()
+                    self.send_body(
+                        429,
+                        content_type="application/json",
+                        body=payload,
+                        headers={"retry-after": "1"},
+                    )
+                    return
+
+                try:
+                    time.sleep(server._latency_seconds)
+                    prompt = body["messages"][-1]["content"]
+                    events = _message_events(model=body["model"], text=f"echo: {prompt}")
+                    self.send_body(
+                        200,
+                        content_type="text/event-stream",
+                        body=b"".join(events),
+                        headers={},
+                    )
+                finally:
+                    server._end()
+
+        return _Handler
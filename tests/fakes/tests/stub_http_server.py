@@ -0,0 +1,89 @@
+"""Shared plumbing for local stub HTTP servers used by tests and benchmarks.
+
+StubHttpServer runs a ThreadingHTTPServer on an ephemeral 127.0.0.1 port in a
+daemon thread for the duration of a `with` block. Subclasses provide the
+request handler class; StubRequestHandler supplies quiet logging and helpers
+for sending complete (content-length framed) responses.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Self
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Keep-alive request handler with helpers for stub responses."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+    def read_json_body(self) -> Any:
+        """Read and decode the request body as JSON."""
+        length = int(self.headers.get("content-length", "0"))
+        return json.loads(self.rfile.read(length))
+
+    def send_body(
+        self,
+        status: int,
+        *,
+        content_type: str,
+        body: bytes,
+        headers: Mapping[str, str],
+    ) -> None:
+        """Send a complete response with the given body and extra headers."""
+        self.send_response(status)
+        self.send_header("content-type", content_type)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, status: int, payload: object | None) -> None:
+        """Send payload as JSON, or an empty body when payload is None."""
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_body(status, content_type="application/json", body=body, headers={})
+
+
+class StubHttpServer(ABC):
+    """Threaded local HTTP server, started and stopped as a context manager.
+
+    `base_url` is valid inside the `with` block.
+    """
+
+    def __init__(self) -> None:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @abstractmethod
+    def _handler_class(self) -> type[StubRequestHandler]:
+        """Return the handler class; it may close over the server instance."""
+        ...
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
@@ -0,0 +1,105 @@
+"""Local stub of the GitHub workflow dispatch and runs listing REST API.
+
+Serves POST .../actions/workflows/<wf>/dispatches (creating a run whose
+display title ends with ":<distinct_id>") and GET .../actions/workflows/<wf>/runs
+with the `created>=`, `per_page` and `page` query parameters. Runs only
+appear in listings `visibility_delay` seconds after their dispatch, mimicking
+GitHub's eventual consistency, and the server can be seeded with older runs
+so correlation has to look past the first page. Counts requests by kind so
+tests can compare API usage.
+
+scripts/benchmark_workflow_run_correlation.py uses it to compare
+per-dispatch polling with batched correlation.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from tests.fakes.tests.stub_http_server import StubHttpServer, StubRequestHandler
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class FakeWorkflowRunsServer(StubHttpServer):
+    """Threaded HTTP server for workflow dispatch + runs listing.
+
+    Use as a context manager; `base_url` is valid inside the block.
+    """
+
+    def __init__(self, *, visibility_delay: float, history: int) -> None:
+        self._visibility_delay = visibility_delay
+        self._lock = threading.Lock()
+        # (visible_at monotonic, run) newest last
+        self._runs: list[tuple[float, dict[str, Any]]] = []
+        self._next_run_id = 1
+        self.dispatch_count = 0
+        self.list_count = 0
+        old = datetime.now(UTC) - timedelta(hours=1)
+        for index in range(history):
+            self._add_run(title=f"history {index}:old{index:04d}", created_at=old, visible_at=0.0)
+        super().__init__()
+
+    def _add_run(self, *, title: str, created_at: datetime, visible_at: float) -> None:
+        run = {
+            "id": self._next_run_id,
+            "display_title": title,
+            "status": "queued",
+            "conclusion": None,
+            "created_at": _iso(created_at),
+        }
+        self._next_run_id += 1
+        self._runs.append((visible_at, run))
+
+    def _dispatch(self, body: dict[str, Any]) -> None:
+        inputs = body["inputs"]
+        with self._lock:
+            self.dispatch_count += 1
+            self._add_run(
+                title=f"{inputs.get('pr_number', 'run')}:{inputs['distinct_id']}",
+                created_at=datetime.now(UTC),
+                visible_at=time.monotonic() + self._visibility_delay,
+            )
+
+    def _list(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        per_page = int(query.get("per_page", ["30"])[0])
+        page = int(query.get("page", ["1"])[0])
+        created = query.get("created", [""])[0]
+        since = created.removeprefix(">=") if created.startswith(">=") else None
+        now = time.monotonic()
+        with self._lock:
+            self.list_count += 1
+            runs = [
+                run
+                for visible_at, run in reversed(self._runs)
+                if visible_at <= now and (since is None or run["created_at"] >= since)
+            ]
+        start = (page - 1) * per_page
+        return {"total_count": len(runs), "workflow_runs": runs[start : start + per_page]}
+
+    def _handler_class(self) -> type[StubRequestHandler]:
+        server = self
+
+        class _Handler(StubRequestHandler):
+            def do_POST(self) -> None:
+                body = self.read_json_body()
+                if not urlparse(self.path).path.endswith("/dispatches"):
+                    self.send_json(404, {"message": "Not Found"})
+                    return
+                server._dispatch(body)
+                self.send_json(204, None)
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                if not url.path.endswith("/runs"):
+                    self.send_json(404, {"message": "Not Found"})
+                    return
+                self.send_json(200, server._list(parse_qs(url.query)))
+
+        return _Handler
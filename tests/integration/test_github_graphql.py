@@ -348,3 +348,76 @@ def test_get_issues_with_pr_linkages_handles_multiple_labels(
         assert len(label_args) == 2, f"Expected 2 label args, got {label_args}"
         assert "labels[]=erk-pr" in label_args
         assert "labels[]=bug" in label_args
+
+
+def test_iter_issues_with_pr_linkages_pages_follows_cursor_lazily(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Each page is requested only when iterated, passing the previous endCursor."""
+    created_commands: list[list[str]] = []
+
+    def page_response(number: int, *, has_next: bool, end_cursor: str | None) -> str:
+        node = {
+            "number": number,
+            "title": f"Plan {number}",
+            "body": "",
+            "state": "OPEN",
+            "url": f"https://github.com/dagster-io/erk/issues/{number}",
+            "author": {"login": "test-user"},
+            "labels": {"nodes": [{"name": "erk-pr"}]},
+            "assignees": {"nodes": []},
+            "createdAt": "2024-01-01T00:00:00Z",
+            "updatedAt": "2024-01-01T00:00:00Z",
+            "timelineItems": {"nodes": []},
+        }
+        return json.dumps(
+            {
+                "data": {
+                    "repository": {
+                        "issues": {
+                            "nodes": [node],
+                            "pageInfo": {"hasNextPage": has_next, "endCursor": end_cursor},
+                        }
+                    }
+                }
+            }
+        )
+
+    responses = [
+        page_response(1, has_next=True, end_cursor="abc"),
+        page_response(2, has_next=False, end_cursor="def"),
+    ]
+
+    def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+        created_commands.append(cmd)
+        return subprocess.CompletedProcess(
+            args=cmd, returncode=0, stdout=responses[len(created_commands) - 1], stderr=""
+        )
+
+    with mock_subprocess_run(monkeypatch, mock_run):
+        github = real_github_for_test()
+        location = GitHubRepoLocation(
+            root=Path("/repo"),
+            repo_id=GitHubRepoId(owner="dagster-io", repo="erk"),
+        )
+
+        pages = github.iter_issues_with_pr_linkages_pages(
+            location=location,
+            labels=["erk-pr"],
+            state="open",
+            limit=None,
+            page_size=1,
+            creator=None,
+        )
+
+        first = next(pages)
+        assert [issue.number for issue in first.issues] == [1]
+        assert first.end_cursor == "abc"
+        assert len(created_commands) == 1
+        assert "cursor=null" in created_commands[0]
+        assert "first=1" in created_commands[0]
+
+        rest = list(pages)
+        assert [issue.number for page in rest for issue in page.issues] == [2]
+        assert rest[-1].end_cursor is None
+        assert "cursor=abc" in created_commands[1]
@@ -227,6 +227,57 @@ def test_graphite_ops_get_all_branches_invalidates_on_mtime_change(tmp_path: Pat
     assert "feat-1" not in result2
 
 
+def test_graphite_ops_get_all_branches_reads_heads_from_refs(tmp_path: Path):
+    """Branch heads come from loose and packed refs without asking git."""
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads" / "feature").mkdir(parents=True)
+    cache_file = git_dir / ".graphite_cache_persist"
+    cache_file.write_text(load_fixture("graphite/graphite_cache_persist.json"), encoding="utf-8")
+
+    main_sha = "a" * 40
+    packed_sha = "b" * 40
+    loose_sha = "c" * 40
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        f"{main_sha} refs/heads/main\n"
+        f"{packed_sha} refs/heads/feature-1\n"
+        f"^{'d' * 40}\n"
+        f"{'e' * 40} refs/tags/v1\n",
+        encoding="utf-8",
+    )
+    # Loose ref overrides the packed entry
+    (git_dir / "refs" / "heads" / "feature-1").write_text(f"{loose_sha}\n", encoding="utf-8")
+
+    # FakeGit heads would be used only if the ref store were unreadable
+    git_ops = FakeGit(git_common_dirs={tmp_path: git_dir}, branch_heads={"main": "wrong"})
+
+    result = RealGraphite().get_all_branches(git_ops, tmp_path)
+
+    assert result["main"].commit_sha == main_sha
+    assert result["feature-1"].commit_sha == loose_sha
+    assert result["feature-2"].commit_sha == ""
+
+
+def test_graphite_ops_get_branch_stack_reuses_persisted_index(tmp_path: Path):
+    """A fresh RealGraphite loads the persisted stack index instead of re-parsing."""
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    cache_file = git_dir / ".graphite_cache_persist"
+    cache_file.write_text(load_fixture("graphite/graphite_cache_persist.json"), encoding="utf-8")
+    git_ops = FakeGit(git_common_dirs={tmp_path: git_dir})
+
+    first = RealGraphite().get_branch_stack(git_ops, tmp_path, "feature-1")
+    assert first == ["main", "feature-1", "feature-1-sub"]
+
+    second_ops = RealGraphite()
+    index = second_ops.get_stack_index(git_ops, tmp_path)
+
+    assert index is not None
+    assert second_ops._branches_cache is None
+    assert index.descendants("main") == ["feature-1", "feature-1-sub", "feature-2"]
+    assert second_ops.get_branch_stack(git_ops, tmp_path, "feature-2") == ["main", "feature-2"]
+
+
 def test_graphite_url_construction():
     """Test Graphite URL construction."""
     ops = RealGraphite()
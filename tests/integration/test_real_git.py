@@ -4,6 +4,7 @@ These tests verify that RealGit correctly handles git operations with real git r
 Integration tests use actual git subprocess calls to validate the abstractions.
 """
 
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -54,6 +55,31 @@ def test_list_worktrees_detached_head(git_ops_with_detached: GitWithDetached) ->
     assert detached_wt.branch is None
 
 
+def test_list_worktrees_reports_head_locked_and_prunable(
+    git_ops_with_worktrees: GitWithWorktrees,
+) -> None:
+    """Test listing worktrees parses HEAD, locked and prunable records."""
+    repo = git_ops_with_worktrees.repo
+    locked_wt, pruned_wt = git_ops_with_worktrees.worktrees
+    subprocess.run(
+        ["git", "worktree", "lock", "--reason", "in use", str(locked_wt)], cwd=repo, check=True
+    )
+    shutil.rmtree(pruned_wt)
+
+    worktrees = git_ops_with_worktrees.git.worktree.list_worktrees(repo)
+
+    by_path = {wt.path: wt for wt in worktrees}
+    head = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+    assert by_path[repo].head == head
+    assert by_path[repo].is_root
+    assert by_path[locked_wt].locked
+    assert not by_path[locked_wt].prunable
+    assert by_path[pruned_wt].prunable
+    assert by_path[pruned_wt].branch == "feature-2"
+
+
 def test_get_current_branch_normal(git_ops: GitSetup) -> None:
     """Test getting current branch in normal checkout."""
     branch = git_ops.git.branch.get_current_branch(git_ops.repo)
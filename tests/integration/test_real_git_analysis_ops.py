@@ -6,6 +6,8 @@ Tests verify real git analysis operations against actual git repositories.
 import subprocess
 from pathlib import Path
 
+import pytest
+
 from erk_shared.gateway.git.analysis_ops.real import RealGitAnalysisOps
 from tests.integration.conftest import init_git_repo
 
@@ -53,3 +55,40 @@ def test_get_diff_to_branch_excludes_diverged_master_changes(tmp_path: Path) ->
     # because two-dot compares tree states directly. Three-dot (branch...HEAD)
     # diffs from merge-base, so main's diverged commits are excluded.
     assert "main-only.txt" not in diff
+
+
+def test_stream_diff_to_branch_excludes_basenames_across_repo(tmp_path: Path) -> None:
+    """Excluded basenames are dropped at any depth, even when run from a subdirectory."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo, "main")
+    subprocess.run(["git", "checkout", "-b", "feature"], cwd=repo, check=True)
+
+    (repo / "pkg").mkdir()
+    (repo / "pkg" / "module.py").write_text("x = 1\n", encoding="utf-8")
+    (repo / "pkg" / "uv.lock").write_text("lock\n", encoding="utf-8")
+    (repo / "uv.lock").write_text("root lock\n", encoding="utf-8")
+    (repo / "top.py").write_text("y = 2\n", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-m", "Add files"], cwd=repo, check=True)
+
+    ops = RealGitAnalysisOps()
+    diff = "".join(
+        ops.stream_diff_to_branch(repo / "pkg", "main", exclude_basenames=frozenset({"uv.lock"}))
+    )
+
+    assert "diff --git a/pkg/module.py b/pkg/module.py" in diff
+    assert "diff --git a/top.py b/top.py" in diff
+    assert "uv.lock" not in diff
+
+
+def test_stream_diff_to_branch_reports_git_stderr_on_failure(tmp_path: Path) -> None:
+    """A failing diff raises with git's stderr, which is captured off the stdout pipe."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo, "main")
+
+    ops = RealGitAnalysisOps()
+
+    with pytest.raises(RuntimeError, match="stderr: fatal: "):
+        list(ops.stream_diff_to_branch(repo, "missing-branch", exclude_basenames=frozenset()))
@@ -9,6 +9,7 @@ from pathlib import Path
 
 import pytest
 
+from erk_shared.gateway.git.abc import LocalRefUpdate
 from erk_shared.gateway.git.branch_ops.real import RealGitBranchOps
 from erk_shared.gateway.git.real import RealGit
 from tests.integration.conftest import GitBranchOpsSetup, init_git_repo
@@ -346,3 +347,90 @@ def test_get_all_branch_heads_returns_empty_on_non_repo(tmp_path: Path) -> None:
 
     # Assert: Graceful degradation returns empty dict
     assert heads == {}
+
+
+def _commit_on(repo: Path, branch: str, filename: str) -> str:
+    """Check out branch, commit a new file, and return the new commit SHA."""
+    subprocess.run(["git", "checkout", "-q", branch], cwd=repo, check=True)
+    (repo / filename).write_text(filename, encoding="utf-8")
+    subprocess.run(["git", "add", filename], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", filename], cwd=repo, check=True)
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_get_remote_branch_states_compares_branches_in_one_pass(tmp_path: Path) -> None:
+    """Test ahead/behind for tracked, untracked, and local-only branches."""
+    remote_repo = tmp_path / "remote"
+    remote_repo.mkdir()
+    init_git_repo(remote_repo, "main")
+    for branch in ("synced", "behind", "diverged"):
+        subprocess.run(["git", "branch", branch], cwd=remote_repo, check=True)
+
+    local_repo = tmp_path / "local"
+    subprocess.run(["git", "clone", "-q", str(remote_repo), str(local_repo)], check=True)
+    subprocess.run(["git", "config", "user.email", "t@example.com"], cwd=local_repo, check=True)
+    subprocess.run(["git", "config", "user.name", "T"], cwd=local_repo, check=True)
+    for branch in ("synced", "behind"):
+        subprocess.run(
+            ["git", "branch", "-q", "--track", branch, f"origin/{branch}"],
+            cwd=local_repo,
+            check=True,
+        )
+    # "diverged" has no upstream configured, so counts come from rev-list
+    subprocess.run(
+        ["git", "branch", "--no-track", "diverged", "origin/diverged"], cwd=local_repo, check=True
+    )
+    subprocess.run(["git", "branch", "local-only"], cwd=local_repo, check=True)
+
+    behind_sha = _commit_on(remote_repo, "behind", "behind.txt")
+    _commit_on(remote_repo, "diverged", "remote.txt")
+    _commit_on(local_repo, "diverged", "local.txt")
+    subprocess.run(["git", "checkout", "-q", "main"], cwd=local_repo, check=True)
+    subprocess.run(["git", "fetch", "-q", "origin"], cwd=local_repo, check=True)
+
+    states = RealGitBranchOps().get_remote_branch_states(
+        local_repo, "origin", ["synced", "behind", "diverged", "local-only"]
+    )
+
+    assert (states["synced"].ahead, states["synced"].behind) == (0, 0)
+    assert states["synced"].exists_on_remote
+    assert (states["behind"].ahead, states["behind"].behind) == (0, 1)
+    assert states["behind"].remote_sha == behind_sha
+    assert (states["diverged"].ahead, states["diverged"].behind) == (1, 1)
+    assert not states["local-only"].exists_on_remote
+    assert states["local-only"].remote_sha is None
+
+
+def test_update_local_refs_is_all_or_nothing(git_branch_ops: GitBranchOpsSetup) -> None:
+    """Test that update_local_refs moves every ref, or none when one is stale."""
+    branch_ops, git, repo = git_branch_ops
+    base_sha = git.branch.get_branch_head(repo, "main")
+    assert base_sha is not None
+    subprocess.run(["git", "branch", "one"], cwd=repo, check=True)
+    subprocess.run(["git", "branch", "two"], cwd=repo, check=True)
+    head_sha = _commit_on(repo, "main", "second.txt")
+
+    branch_ops.update_local_refs(
+        repo,
+        [
+            LocalRefUpdate(branch="one", target_sha=head_sha, expected_sha=base_sha),
+            LocalRefUpdate(branch="two", target_sha=head_sha, expected_sha=base_sha),
+        ],
+    )
+
+    assert git.branch.get_branch_head(repo, "one") == head_sha
+    assert git.branch.get_branch_head(repo, "two") == head_sha
+
+    # "one" is no longer at base_sha, so the whole transaction is rejected
+    with pytest.raises(RuntimeError):
+        branch_ops.update_local_refs(
+            repo,
+            [
+                LocalRefUpdate(branch="two", target_sha=base_sha, expected_sha=head_sha),
+                LocalRefUpdate(branch="one", target_sha=base_sha, expected_sha=base_sha),
+            ],
+        )
+
+    assert git.branch.get_branch_head(repo, "two") == head_sha
@@ -11,6 +11,7 @@ from pathlib import Path
 
 import pytest
 
+from erk_shared import subprocess_utils
 from erk_shared.gateway.git.commit_ops.real import RealGitCommitOps
 from erk_shared.gateway.time.real import RealTime
 from tests.integration.conftest import init_git_repo
@@ -240,7 +241,7 @@ def test_commit_files_to_branch_does_not_affect_real_index(tmp_path: Path) -> No
 def test_commit_files_to_branch_cleans_up_temp_index(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """Test that the temporary index file is cleaned up after the operation."""
+    """Test that the temporary index and blob files are cleaned up after the operation."""
     import tempfile
 
     repo = tmp_path / "repo"
@@ -262,6 +263,74 @@ def test_commit_files_to_branch_cleans_up_temp_index(
         message="Test commit",
     )
 
-    # Assert: No erk-pr-*.idx files remain in our isolated temp dir
-    remaining = list(test_temp_dir.glob("erk-pr-*.idx"))
-    assert remaining == [], f"Temp index files not cleaned up: {remaining}"
+    # Assert: No erk-pr-* temp files remain in our isolated temp dir
+    remaining = list(test_temp_dir.glob("erk-pr-*"))
+    assert remaining == [], f"Temp files not cleaned up: {remaining}"
+
+
+def test_commit_files_to_branch_process_count_is_constant(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the number of git processes does not grow with the number of files."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo, "main")
+
+    git_commands: list[str] = []
+    real_run = subprocess.run
+
+    def counting_run(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        git_commands.append(cmd[1])
+        return real_run(cmd, **kwargs)  # type: ignore[call-overload]
+
+    monkeypatch.setattr(subprocess_utils.subprocess, "run", counting_run)
+    commit_ops = _make_commit_ops()
+
+    commit_ops.commit_files_to_branch(
+        repo, branch="main", files={"one.txt": "1\n"}, message="One file"
+    )
+    single_file_commands = list(git_commands)
+    git_commands.clear()
+    commit_ops.commit_files_to_branch(
+        repo,
+        branch="main",
+        files={f"chunks/chunk-{i:03}.xml": f"<chunk>{i}</chunk>\n" for i in range(100)},
+        message="Hundred files",
+    )
+
+    assert git_commands == single_file_commands
+    monkeypatch.undo()
+    listed = subprocess.run(
+        ["git", "ls-tree", "-r", "--name-only", "main", "chunks"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    assert len(listed) == 100
+
+
+def test_commit_files_to_branch_handles_unusual_paths(tmp_path: Path) -> None:
+    """Test that paths with spaces and non-ASCII characters round-trip exactly."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    init_git_repo(repo, "main")
+
+    commit_ops = _make_commit_ops()
+    files = {
+        "dir with space/notes.md": "spaces\n",
+        "ünïcode/naïve.txt": "unicode ✓\n",
+        "empty.txt": "",
+    }
+
+    commit_ops.commit_files_to_branch(repo, branch="main", files=files, message="Odd paths")
+
+    for path, expected_content in files.items():
+        result = subprocess.run(
+            ["git", "show", f"main:{path}"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout == expected_content, f"Content mismatch for {path}"
@@ -6,7 +6,9 @@ sentinel paths that allow tests to avoid unnecessary filesystem dependencies.
 
 from __future__ import annotations
 
+import tempfile
 from pathlib import Path
+from typing import IO
 
 
 class SentinelPath(type(Path())):
@@ -147,6 +149,42 @@ class SentinelPath(type(Path())):
         SentinelPath._file_storage[str(self)] = data
         return len(data)
 
+    def replace(self, target: str | Path) -> SentinelPath:
+        """Move stored file content to target for sentinel paths.
+
+        In production, .replace() atomically renames a file over target.
+        For sentinel paths, we move the content between storage keys.
+
+        Raises:
+            FileNotFoundError: If file was never written via write_text()
+        """
+        path_str = str(self)
+        if path_str not in SentinelPath._file_storage:
+            raise FileNotFoundError(f"No content stored for sentinel path {self}")
+        SentinelPath._file_storage[str(target)] = SentinelPath._file_storage.pop(path_str)
+        return SentinelPath(str(target))
+
+    def open(
+        self,
+        mode: str = "r",
+        buffering: int = -1,
+        encoding: str | None = None,
+        errors: str | None = None,
+        newline: str | None = None,
+    ) -> IO:
+        """Open a private scratch file for sentinel paths opened for writing.
+
+        Production code opens lock files (e.g. pool.json.lock) only to flock
+        them. Sentinel paths have no real file, so writers get an anonymous
+        temporary file: locking it always succeeds and its content is
+        discarded. Reading must go through read_text().
+        """
+        if "r" in mode:
+            raise RuntimeError(
+                f"Called .open({mode!r}) on sentinel path {self}. Use .read_text() instead."
+            )
+        return tempfile.TemporaryFile(mode=mode, encoding=encoding)
+
     def read_text(self, encoding: str | None = None, errors: str | None = None) -> str:
         """Retrieve file content from memory for sentinel paths.
 
@@ -0,0 +1,334 @@
+"""Tests for running TUI operations in-process instead of spawning the CLI."""
+
+import asyncio
+import importlib
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import click
+import pytest
+
+from erk.tui.app import ErkDashApp
+from erk.tui.data.types import PrFilters
+from erk.tui.operations import streaming
+from erk.tui.operations.in_process import (
+    CANCELLED_RETURN_CODE,
+    run_click_command_in_process,
+    supports_in_process,
+)
+from erk.tui.operations.types import OperationResult
+from erk_shared.cancellation import raise_if_cancelled
+from erk_shared.output.output import (
+    inherit_output_redirect,
+    machine_output,
+    user_confirm,
+    user_output,
+)
+from erk_shared.subprocess_utils import run_subprocess_with_context
+from tests.fakes.gateway.plan_data_provider import FakePrDataProvider, make_pr_row
+from tests.fakes.gateway.pr_service import FakePrService
+from tests.fakes.tests.shared_context import context_for_test
+
+
+@click.group()
+def _group() -> None:
+    pass
+
+
+@_group.command("echo")
+@click.argument("words", nargs=-1)
+@click.pass_obj
+def _echo(obj: str, words: tuple[str, ...]) -> None:
+    user_output(click.style(f"obj={obj}", fg="green"))
+    machine_output(" ".join(words))
+
+
+@_group.command("fail")
+def _fail() -> None:
+    user_output("about to fail")
+    raise SystemExit(3)
+
+
+@_group.command("click-error")
+def _click_error() -> None:
+    raise click.ClickException("bad input")
+
+
+@_group.command("confirm")
+def _confirm() -> None:
+    if user_confirm("Proceed?", default=True):
+        user_output("confirmed")
+
+
+@_group.command("pool")
+def _pool() -> None:
+    with ThreadPoolExecutor(max_workers=2, initializer=inherit_output_redirect()) as executor:
+        list(executor.map(lambda n: user_output(f"worker {n}"), [1, 2]))
+
+
+@_group.command("wait")
+@click.pass_obj
+def _wait(obj: threading.Event) -> None:
+    user_output("started")
+    obj.wait(timeout=5)
+
+
+@_group.command("wait-then-write")
+@click.pass_obj
+def _wait_then_write(obj: threading.Event) -> None:
+    user_output("started")
+    obj.wait(timeout=5)
+    user_output("finished")
+
+
+@_group.command("wait-then-run")
+@click.pass_obj
+def _wait_then_run(obj: threading.Event) -> None:
+    user_output("started")
+    obj.wait(timeout=5)
+    run_subprocess_with_context(
+        cmd=[sys.executable, "-c", "raise SystemExit(1)"],
+        operation_context="run after cancel",
+    )
+
+
+@_group.command("pool-checkpoint")
+def _pool_checkpoint() -> None:
+    with ThreadPoolExecutor(max_workers=1, initializer=inherit_output_redirect()) as executor:
+        executor.submit(raise_if_cancelled).result()
+    raise SystemExit(0)
+
+
+def _run(args: list[str]) -> OperationResult:
+    return run_click_command_in_process(
+        _group,
+        args=args,
+        obj="shared",
+        cancel_event=threading.Event(),
+        on_line=lambda line: None,
+    )
+
+
+def _run_cancelled_after_first_line(args: list[str]) -> OperationResult:
+    """Run args with obj=release, cancelling once the first line is streamed."""
+    cancel_event = threading.Event()
+    release = threading.Event()
+
+    def _on_line(line: str) -> None:
+        cancel_event.set()
+        release.set()
+
+    return run_click_command_in_process(
+        _group, args=args, obj=release, cancel_event=cancel_event, on_line=_on_line
+    )
+
+
+def test_captures_unstyled_output_from_both_streams() -> None:
+    streamed: list[str] = []
+    result = run_click_command_in_process(
+        _group,
+        args=["echo", "hello", "world"],
+        obj="shared",
+        cancel_event=threading.Event(),
+        on_line=streamed.append,
+    )
+
+    assert result.success is True
+    assert result.return_code == 0
+    assert result.output_lines == ("obj=shared", "hello world")
+    assert streamed == ["obj=shared", "hello world"]
+
+
+def test_leaves_std_streams_alone_while_running() -> None:
+    """A running operation must not swap the process-wide streams other threads use."""
+    before = (sys.stdout, sys.stderr, sys.stdin)
+    release = threading.Event()
+    during: list[tuple[object, object, object]] = []
+    streamed: list[str] = []
+
+    def _on_line(line: str) -> None:
+        streamed.append(line)
+        during.append((sys.stdout, sys.stderr, sys.stdin))
+        release.set()
+
+    run_click_command_in_process(
+        _group, args=["wait"], obj=release, cancel_event=threading.Event(), on_line=_on_line
+    )
+
+    assert streamed == ["started"]
+    assert during == [before]
+    assert (sys.stdout, sys.stderr, sys.stdin) == before
+
+
+def test_system_exit_code_is_reported() -> None:
+    result = _run(["fail"])
+
+    assert result.success is False
+    assert result.return_code == 3
+    assert result.output_lines == ("about to fail",)
+
+
+def test_click_exception_is_shown_and_reported() -> None:
+    result = _run(["click-error"])
+
+    assert result.return_code == 1
+    assert result.output_lines == ("Error: bad input",)
+
+
+def test_prompts_abort_without_reading_stdin() -> None:
+    result = _run(["confirm"])
+
+    assert result.success is False
+    assert result.output_lines == ("Aborted!",)
+
+
+def test_thread_pool_workers_inherit_output_capture() -> None:
+    result = _run(["pool"])
+
+    assert result.success is True
+    assert sorted(result.output_lines) == ["worker 1", "worker 2"]
+
+
+def test_cancel_stops_operation_at_next_write() -> None:
+    result = _run_cancelled_after_first_line(["wait-then-write"])
+
+    assert result.success is False
+    assert result.return_code == CANCELLED_RETURN_CODE
+    assert result.output_lines == ("started", "Operation cancelled")
+
+
+def test_cancel_stops_operation_before_next_subprocess() -> None:
+    """The subprocess would fail with exit 1; cancellation stops it from starting."""
+    result = _run_cancelled_after_first_line(["wait-then-run"])
+
+    assert result.return_code == CANCELLED_RETURN_CODE
+    assert result.output_lines == ("started", "Operation cancelled")
+
+
+def test_thread_pool_workers_inherit_cancellation() -> None:
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    result = run_click_command_in_process(
+        _group,
+        args=["pool-checkpoint"],
+        obj="shared",
+        cancel_event=cancel_event,
+        on_line=lambda line: None,
+    )
+
+    assert result.return_code == CANCELLED_RETURN_CODE
+
+
+def test_concurrent_operations_keep_output_separate() -> None:
+    results: dict[str, OperationResult] = {}
+
+    def _worker(word: str) -> None:
+        results[word] = _run(["echo", word])
+
+    threads = [threading.Thread(target=_worker, args=(f"w{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for i in range(8):
+        assert results[f"w{i}"].output_lines == ("obj=shared", f"w{i}")
+
+
+def test_supports_in_process_allowlist() -> None:
+    assert supports_in_process(["launch", "pr-address", "--pr", "1"])
+    assert supports_in_process(["pr", "dispatch", "1"])
+    assert supports_in_process(["workflow", "run", "cancel", "42"])
+    assert not supports_in_process(["exec", "land-execute", "--pr-number=1"])
+    assert not supports_in_process(["exec", "cmux-open-pr"])
+    assert not supports_in_process(["pr"])
+
+
+@pytest.mark.asyncio
+async def test_app_with_context_runs_supported_command_in_process(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """With a warm ErkContext, supported erk commands never spawn a subprocess."""
+    calls: list[list[str]] = []
+
+    def fake_in_process(command: click.Command, **kwargs: object) -> OperationResult:
+        calls.append(list(kwargs["args"]))  # type: ignore[arg-type] -- args is a list
+        return OperationResult(success=True, output_lines=("ok",), return_code=0)
+
+    def fail_popen(*args: object, **kwargs: object) -> None:
+        raise AssertionError("subprocess should not be spawned")
+
+    # Import the CLI up front: importing it runs git via subprocess
+    importlib.import_module("erk.cli.cli")
+    monkeypatch.setattr(streaming, "run_click_command_in_process", fake_in_process)
+    monkeypatch.setattr(subprocess, "Popen", fail_popen)
+
+    app = ErkDashApp(
+        provider=FakePrDataProvider(plans=[make_pr_row(123, "Test Plan")]),
+        service=FakePrService(repo_root=tmp_path),
+        filters=PrFilters.default(),
+        refresh_interval=0,
+        erk_context=context_for_test(cwd=tmp_path),
+    )
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        app._dispatch_to_queue_async("op", 123)
+        await pilot.pause(0.3)
+
+    assert calls == [["pr", "dispatch", "123"]]
+
+
+@pytest.mark.asyncio
+async def test_cancel_binding_cancels_latest_running_operation(tmp_path: Path) -> None:
+    app = ErkDashApp(
+        provider=FakePrDataProvider(plans=[make_pr_row(123, "Test Plan")]),
+        service=FakePrService(repo_root=tmp_path),
+        filters=PrFilters.default(),
+        refresh_interval=0,
+    )
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        app._start_operation(op_id="first", label="First...")
+        app._start_operation(op_id="second", label="Second...")
+        await pilot.press("ctrl+x")
+        await pilot.pause()
+
+        assert app._operation_cancel_events["second"].is_set()
+        assert not app._operation_cancel_events["first"].is_set()
+
+        # The next press moves on to the remaining running operation
+        await pilot.press("ctrl+x")
+        await pilot.pause()
+        assert app._operation_cancel_events["first"].is_set()
+
+
+@pytest.mark.asyncio
+async def test_cancel_terminates_subprocess_operation(tmp_path: Path) -> None:
+    app = ErkDashApp(
+        provider=FakePrDataProvider(plans=[make_pr_row(123, "Test Plan")]),
+        service=FakePrService(repo_root=tmp_path),
+        filters=PrFilters.default(),
+        refresh_interval=0,
+    )
+    command = [sys.executable, "-c", "import time; print('started', flush=True); time.sleep(30)"]
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        app._start_operation(op_id="op", label="Sleeping...")
+        task = asyncio.create_task(
+            asyncio.to_thread(app._run_streaming_operation, op_id="op", command=command)
+        )
+        while "op" not in app._operation_processes:
+            await pilot.pause(0.05)
+        app._cancel_operation(op_id="op")
+        result = await asyncio.wait_for(task, timeout=10)
+
+    assert result.return_code == CANCELLED_RETURN_CODE
+    assert result.output_lines[-1] == "Operation cancelled"
+    assert "op" not in app._operation_processes
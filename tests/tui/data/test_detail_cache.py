@@ -0,0 +1,114 @@
+"""Tests for the dashboard's detail prefetch cache."""
+
+import pytest
+
+from erk.tui.app import ErkDashApp
+from erk.tui.data.detail_cache import (
+    PrDetailCache,
+    PrefetchingPrService,
+    prefetch_order,
+)
+from erk.tui.data.types import PrFilters
+from erk.tui.screens.plan_body_screen import PlanBodyScreen
+from tests.fakes.gateway.plan_data_provider import FakePrDataProvider, make_pr_row
+from tests.fakes.gateway.pr_service import FakePrService
+
+
+def _service(fake: FakePrService, *, max_entries: int = 8) -> PrefetchingPrService:
+    return PrefetchingPrService(wrapped=fake, cache=PrDetailCache(max_entries=max_entries))
+
+
+def test_prefetch_order_is_nearest_first_and_clamped() -> None:
+    assert prefetch_order(0, 10, radius=2) == [0, 1, 2]
+    assert prefetch_order(5, 10, radius=2) == [5, 6, 4, 7, 3]
+    assert prefetch_order(9, 10, radius=2) == [9, 8, 7]
+
+
+def test_repeated_fetch_is_served_from_cache() -> None:
+    fake = FakePrService()
+    fake.set_pr_content(1, "plan")
+    service = _service(fake)
+
+    assert service.fetch_pr_content(1, "body") == "plan"
+    assert service.fetch_pr_content(1, "body") == "plan"
+
+    assert fake.fetch_calls == [("fetch_pr_content", 1)]
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    fake = FakePrService()
+    service = _service(fake, max_entries=2)
+
+    service.fetch_check_runs(1)
+    service.fetch_check_runs(2)
+    service.fetch_check_runs(1)  # 1 becomes most recently used
+    service.fetch_check_runs(3)  # evicts 2
+    service.fetch_check_runs(1)
+    service.fetch_check_runs(2)
+
+    assert [pr for _, pr in fake.fetch_calls] == [1, 2, 3, 2]
+
+
+def test_invalidate_drops_entries_and_stale_stores() -> None:
+    cache = PrDetailCache(max_entries=8)
+    generation = cache.generation
+    cache.store(("comments", 1), [], generation=generation)
+
+    cache.invalidate()
+    cache.store(("comments", 2), [], generation=generation)
+
+    assert len(cache) == 0
+
+
+def test_prefetch_row_fetches_only_payloads_the_row_would_open() -> None:
+    fake = FakePrService()
+    service = _service(fake)
+    row = make_pr_row(7, pr_body="body", comment_counts=(1, 3), checks_passing=False)
+    quiet_row = make_pr_row(8, comment_counts=(2, 2), checks_passing=True)
+
+    service.prefetch_row(row, objective=False, is_cancelled=lambda: False)
+    service.prefetch_row(quiet_row, objective=False, is_cancelled=lambda: False)
+
+    assert fake.fetch_calls == [
+        ("fetch_pr_content", 7),
+        ("fetch_unresolved_comments", 7),
+        ("fetch_check_runs", 7),
+    ]
+
+
+def test_prefetch_row_stops_when_cancelled() -> None:
+    fake = FakePrService()
+    service = _service(fake)
+    row = make_pr_row(7, pr_body="body", comment_counts=(0, 1), checks_passing=False)
+
+    service.prefetch_row(row, objective=True, is_cancelled=lambda: len(fake.fetch_calls) >= 1)
+
+    assert fake.fetch_calls == [("fetch_objective_content", 7)]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_prefetches_rows_near_cursor_for_detail_modals() -> None:
+    provider = FakePrDataProvider(
+        plans=[make_pr_row(n, f"Plan {n}", pr_body="metadata body") for n in range(1, 6)]
+    )
+    fake = FakePrService()
+    fake.set_pr_content(5, "# Plan 5")
+    app = ErkDashApp(
+        provider=provider, service=fake, filters=PrFilters.default(), refresh_interval=0
+    )
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.pause(0.5)
+
+        # Newest plan is first: cursor row plus the two rows below it
+        assert sorted(pr for _, pr in fake.fetch_calls) == [3, 4, 5]
+
+        await pilot.press("v")
+        await pilot.pause(0.3)
+
+        body_screen = app.screen_stack[-1]
+        assert isinstance(body_screen, PlanBodyScreen)
+        assert body_screen._content == "# Plan 5"
+        # Opening the modal did not fetch again
+        assert sorted(pr for _, pr in fake.fetch_calls) == [3, 4, 5]
@@ -0,0 +1,107 @@
+"""Tests for the docs sync manifest."""
+
+import json
+
+import pytest
+
+from erk.agent_docs.manifest import (
+    EMPTY_DOCS_SYNC_MANIFEST,
+    VALIDATION_RULES_VERSION,
+    DocManifestEntry,
+    DocsSyncManifest,
+    GeneratedManifestEntry,
+    content_sha256,
+    parse_docs_sync_manifest,
+    serialize_docs_sync_manifest,
+)
+from erk.agent_docs.models import AgentDocFrontmatter, AgentDocValidationResult, Tripwire
+
+
+def test_round_trips_valid_and_invalid_docs() -> None:
+    manifest = DocsSyncManifest(
+        docs={
+            "cli/output.md": DocManifestEntry(
+                content_sha256=content_sha256("valid"),
+                result=AgentDocValidationResult(
+                    file_path="cli/output.md",
+                    frontmatter=AgentDocFrontmatter(
+                        title="Output",
+                        read_when=["printing output"],
+                        tripwires=[
+                            Tripwire(
+                                action="using print",
+                                warning="Use click.echo.",
+                                pattern=r"\bprint\(",
+                            )
+                        ],
+                        last_audited="2026-01-02 10:00 PT",
+                        audit_result="clean",
+                    ),
+                    errors=(),
+                ),
+            ),
+            "bad.md": DocManifestEntry(
+                content_sha256=content_sha256("invalid"),
+                result=AgentDocValidationResult(
+                    file_path="bad.md",
+                    frontmatter=None,
+                    errors=("Missing required field: title",),
+                ),
+            ),
+        },
+        generated={
+            "index.md": GeneratedManifestEntry(source_sha256="a" * 64, output_sha256="b" * 64)
+        },
+    )
+
+    content = serialize_docs_sync_manifest(manifest)
+
+    assert parse_docs_sync_manifest(content) == manifest
+
+
+def test_other_rules_version_drops_cached_doc_results() -> None:
+    generated = {"index.md": GeneratedManifestEntry(source_sha256="a" * 64, output_sha256="b" * 64)}
+    manifest = DocsSyncManifest(
+        docs={
+            "bad.md": DocManifestEntry(
+                content_sha256=content_sha256("invalid"),
+                result=AgentDocValidationResult(
+                    file_path="bad.md", frontmatter=None, errors=("Missing title",)
+                ),
+            )
+        },
+        generated=generated,
+    )
+    data = json.loads(serialize_docs_sync_manifest(manifest))
+    data["rules_version"] = VALIDATION_RULES_VERSION - 1
+
+    parsed = parse_docs_sync_manifest(json.dumps(data))
+
+    assert parsed == DocsSyncManifest(docs={}, generated=generated)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        '{"version": 1, "do',
+        '{"version": 1}',
+        '{"version": 1, "rules_version": 1, "docs": [], "generated": {}}',
+        '{"version": 1, "rules_version": 1, "docs": {"a.md": {"errors": []}}, "generated": {}}',
+        '{"version": 1, "rules_version": 1, "docs": {}, "generated": {"i.md": {}}}',
+        '{"version": 1, "rules_version": 1, "generated": {}, "docs": {"a.md":'
+        ' {"sha256": "x", "errors": [], "frontmatter": {"title": "T"}}}}',
+    ],
+)
+def test_corrupt_manifest_is_empty(content: str) -> None:
+    assert parse_docs_sync_manifest(content) == EMPTY_DOCS_SYNC_MANIFEST
+
+
+def test_missing_manifest_is_empty() -> None:
+    assert parse_docs_sync_manifest(None) == EMPTY_DOCS_SYNC_MANIFEST
+
+
+def test_other_version_is_ignored() -> None:
+    content = json.dumps({"version": -1, "docs": {}, "generated": {}})
+
+    assert parse_docs_sync_manifest(content) == EMPTY_DOCS_SYNC_MANIFEST
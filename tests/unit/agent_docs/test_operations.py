@@ -199,6 +199,7 @@ def test_sync_dry_run_does_not_write() -> None:
 
     assert "index.md" in result.created
     assert agent_docs.written_files == {}
+    assert agent_docs.sync_manifest is None
 
 
 def test_sync_creates_category_index_for_two_plus_docs() -> None:
@@ -265,6 +266,71 @@ def test_sync_reports_unchanged_when_content_matches() -> None:
     assert len(result.unchanged) > 0
 
 
+def test_second_sync_skips_formatting_unchanged_files() -> None:
+    agent_docs = FakeAgentDocs(
+        has_docs_dir=True,
+        files={"doc.md": VALID_DOC, "architecture/patterns.md": VALID_DOC_WITH_TRIPWIRES},
+    )
+    first = sync_agent_docs(agent_docs, PROJECT_ROOT, dry_run=False, on_progress=lambda _: None)
+    format_calls = len(agent_docs.format_calls)
+
+    second = sync_agent_docs(agent_docs, PROJECT_ROOT, dry_run=False, on_progress=lambda _: None)
+
+    assert len(agent_docs.format_calls) == format_calls
+    assert second.created == ()
+    assert second.updated == ()
+    assert sorted(second.unchanged) == sorted(first.created)
+    assert second.tripwires_count == 2
+
+
+def test_sync_reformats_only_files_affected_by_changed_doc() -> None:
+    agent_docs = FakeAgentDocs(
+        has_docs_dir=True,
+        files={"doc.md": VALID_DOC, "architecture/patterns.md": VALID_DOC_WITH_TRIPWIRES},
+    )
+    sync_agent_docs(agent_docs, PROJECT_ROOT, dry_run=False, on_progress=lambda _: None)
+    format_calls = len(agent_docs.format_calls)
+
+    agent_docs.write_file(
+        PROJECT_ROOT, "doc.md", VALID_DOC.replace("editing test code", "editing fixtures")
+    )
+    result = sync_agent_docs(agent_docs, PROJECT_ROOT, dry_run=False, on_progress=lambda _: None)
+
+    assert result.updated == ("index.md",)
+    assert len(agent_docs.format_calls) == format_calls + 1
+    assert "editing fixtures" in agent_docs.written_files["index.md"]
+
+
+def test_sync_detects_hand_edited_generated_file() -> None:
+    agent_docs = FakeAgentDocs(has_docs_dir=True, files={"doc.md": VALID_DOC})
+    sync_agent_docs(agent_docs, PROJECT_ROOT, dry_run=False, on_progress=lambda _: None)
+
+    agent_docs.write_file(PROJECT_ROOT, "index.md", "hand edited\n")
+    result = sync_agent_docs(agent_docs, PROJECT_ROOT, dry_run=True, on_progress=lambda _: None)
+
+    assert result.updated == ("index.md",)
+
+
+def test_dry_run_does_not_cache_out_of_sync_files() -> None:
+    agent_docs = FakeAgentDocs(has_docs_dir=True, files={"doc.md": VALID_DOC})
+    sync_agent_docs(agent_docs, PROJECT_ROOT, dry_run=True, on_progress=lambda _: None)
+
+    result = sync_agent_docs(agent_docs, PROJECT_ROOT, dry_run=True, on_progress=lambda _: None)
+
+    assert result.created == ("index.md",)
+
+
+def test_validate_reports_changed_doc_after_sync() -> None:
+    agent_docs = FakeAgentDocs(has_docs_dir=True, files={"doc.md": VALID_DOC})
+    sync_agent_docs(agent_docs, PROJECT_ROOT, dry_run=False, on_progress=lambda _: None)
+
+    agent_docs.write_file(PROJECT_ROOT, "doc.md", INVALID_DOC)
+    results = validate_agent_docs(agent_docs, PROJECT_ROOT)
+
+    assert len(results) == 1
+    assert not results[0].is_valid
+
+
 # -- validate_tripwires_index --
 
 
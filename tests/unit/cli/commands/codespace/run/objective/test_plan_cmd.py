@@ -1,14 +1,21 @@
 """Unit tests for codespace run objective plan command."""
 
 from datetime import datetime
+from pathlib import Path
 
 from click.testing import CliRunner
 
 from erk.cli.cli import cli
 from erk_shared.context.types import LoadedConfig
 from erk_shared.gateway.codespace_registry.abc import RegisteredCodespace
+from erk_shared.gateway.codespace_registry.real import (
+    RealCodespaceRegistry,
+    register_codespace,
+)
 from tests.fakes.gateway.codespace import FakeCodespace
 from tests.fakes.gateway.codespace_registry import FakeCodespaceRegistry
+from tests.fakes.gateway.erk_installation import FakeErkInstallation
+from tests.fakes.gateway.time import FakeTime
 from tests.test_utils.test_context import context_for_test
 
 
@@ -235,3 +242,68 @@ def test_run_plan_with_working_directory() -> None:
     call = fake_codespace.ssh_calls[0]
     assert "cd /workspaces/dagster-compass" in call.remote_command
     assert "erk objective plan 42" in call.remote_command
+
+
+def test_run_plan_skips_start_for_recently_started_codespace() -> None:
+    """run objective plan does not start a codespace erk used moments ago."""
+    runner = CliRunner()
+
+    now = datetime(2026, 1, 20, 9, 0, 0)
+    cs = _make_codespace("mybox")
+    fake_codespace = FakeCodespace(
+        run_exit_code=0, repo_id=12345, created_codespace_name="fake-gh-name"
+    )
+    codespace_registry = FakeCodespaceRegistry(
+        codespaces=[cs],
+        default_codespace="mybox",
+        last_started={"mybox": datetime(2026, 1, 20, 8, 58, 0)},
+    )
+    ctx = context_for_test(
+        codespace=fake_codespace,
+        codespace_registry=codespace_registry,
+        time=FakeTime(current_time=now),
+    )
+
+    result = runner.invoke(
+        cli,
+        ["codespace", "run", "objective", "plan", "42"],
+        obj=ctx,
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0
+    assert "Codespace 'mybox' started recently; skipping start request" in result.output
+    assert fake_codespace.started_codespaces == []
+    assert fake_codespace.ssh_calls[0].gh_name == "user-mybox-abc123"
+
+
+def test_run_plan_records_last_started_at(tmp_path: Path) -> None:
+    """run objective plan persists last_started_at to the installation's codespaces.toml."""
+    runner = CliRunner()
+
+    now = datetime(2026, 1, 20, 9, 0, 0)
+    cs = _make_codespace("mybox")
+    installation = FakeErkInstallation(root_path=tmp_path)
+    config_path = installation.get_codespaces_config_path()
+    register_codespace(config_path, cs)
+
+    fake_codespace = FakeCodespace(
+        run_exit_code=0, repo_id=12345, created_codespace_name="fake-gh-name"
+    )
+    codespace_registry = FakeCodespaceRegistry(codespaces=[cs], default_codespace="mybox")
+    ctx = context_for_test(
+        codespace=fake_codespace,
+        codespace_registry=codespace_registry,
+        erk_installation=installation,
+        time=FakeTime(current_time=now),
+    )
+
+    result = runner.invoke(
+        cli,
+        ["codespace", "run", "objective", "plan", "42"],
+        obj=ctx,
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0
+    assert RealCodespaceRegistry.from_config_path(config_path).get_last_started_at("mybox") == now
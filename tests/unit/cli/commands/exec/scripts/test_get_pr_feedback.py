@@ -236,6 +236,44 @@ def test_get_pr_feedback_include_resolved(tmp_path: Path) -> None:
     assert len(output["review_threads"]) == 2
 
 
+def test_get_pr_feedback_since_cursor_returns_only_new_threads(tmp_path: Path) -> None:
+    """Passing back review_threads_cursor fetches only threads added since."""
+    first = make_thread("PRRT_1", "src/a.py", 1, "First", is_resolved=False, is_outdated=False)
+    second = make_thread("PRRT_2", "src/b.py", 2, "Second", is_resolved=False, is_outdated=False)
+    third = make_thread("PRRT_3", "src/c.py", 3, "Third", is_resolved=False, is_outdated=False)
+    pr_details = make_pr_details(123, branch="feature-branch")
+    runner = CliRunner()
+
+    def run(threads: list[PRReviewThread], args: list[str]) -> dict:
+        fake_github = FakeLocalGitHub(
+            issues_gateway=FakeGitHubIssues(comments_with_urls={123: []}),
+            pr_details={123: pr_details},
+            pr_review_threads={123: threads},
+            review_thread_page_size=1,
+        )
+        with runner.isolated_filesystem(temp_dir=tmp_path):
+            cwd = Path.cwd()
+            result = runner.invoke(
+                get_pr_feedback,
+                ["--pr", "123", *args],
+                obj=ErkContext.for_test(github=fake_github, git=FakeGit(), repo_root=cwd, cwd=cwd),
+            )
+        assert result.exit_code == 0, result.output
+        return json.loads(result.output)
+
+    full = run([first, second], [])
+    assert [t["id"] for t in full["review_threads"]] == ["PRRT_1", "PRRT_2"]
+
+    cursor = full["review_threads_cursor"]
+    incremental = run([first, second, third], ["--since-cursor", cursor])
+    assert [t["id"] for t in incremental["review_threads"]] == ["PRRT_3"]
+
+    latest_cursor = incremental["review_threads_cursor"]
+    unchanged = run([first, second, third], ["--since-cursor", latest_cursor])
+    assert unchanged["review_threads"] == []
+    assert unchanged["review_threads_cursor"] == latest_cursor
+
+
 def test_get_pr_feedback_filters_resolved_by_default(tmp_path: Path) -> None:
     """Test that resolved threads are excluded by default."""
     unresolved = make_thread(
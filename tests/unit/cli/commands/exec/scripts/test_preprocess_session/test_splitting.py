@@ -7,6 +7,7 @@ from click.testing import CliRunner
 
 from erk.cli.commands.exec.scripts.preprocess_session import (
     estimate_tokens,
+    generate_compressed_xml,
     preprocess_session,
     split_entries_to_chunks,
 )
@@ -44,7 +45,9 @@ def test_estimate_tokens_long_string() -> None:
 
 def test_split_entries_empty() -> None:
     """Test splitting empty entries list returns single empty session."""
-    chunks = split_entries_to_chunks([], max_tokens=1000, source_label=None, enable_pruning=True)
+    chunks = split_entries_to_chunks(
+        [], max_tokens=1000, source_label=None, enable_pruning=True, token_estimator=estimate_tokens
+    )
     assert len(chunks) == 1
     assert "<session>" in chunks[0]
     assert "</session>" in chunks[0]
@@ -54,7 +57,11 @@ def test_split_entries_single_small_entry() -> None:
     """Test that single small entry returns single chunk."""
     entries = [{"type": "user", "message": {"content": "Hello"}}]
     chunks = split_entries_to_chunks(
-        entries, max_tokens=1000, source_label=None, enable_pruning=True
+        entries,
+        max_tokens=1000,
+        source_label=None,
+        enable_pruning=True,
+        token_estimator=estimate_tokens,
     )
     assert len(chunks) == 1
     assert "Hello" in chunks[0]
@@ -69,7 +76,13 @@ def test_split_entries_splits_on_budget() -> None:
         {"type": "user", "message": {"content": "C" * 100}},  # ~25 tokens
     ]
     # With max_tokens=40, should split into multiple chunks
-    chunks = split_entries_to_chunks(entries, max_tokens=40, source_label=None, enable_pruning=True)
+    chunks = split_entries_to_chunks(
+        entries,
+        max_tokens=40,
+        source_label=None,
+        enable_pruning=True,
+        token_estimator=estimate_tokens,
+    )
     # Should be more than 1 chunk
     assert len(chunks) > 1
     # Each chunk should be valid XML
@@ -86,7 +99,13 @@ def test_split_entries_preserves_all_content() -> None:
         {"type": "user", "message": {"content": "Third message"}},
     ]
     # Use small budget to force splitting
-    chunks = split_entries_to_chunks(entries, max_tokens=50, source_label=None, enable_pruning=True)
+    chunks = split_entries_to_chunks(
+        entries,
+        max_tokens=50,
+        source_label=None,
+        enable_pruning=True,
+        token_estimator=estimate_tokens,
+    )
 
     # Concatenate all chunks and verify all content is present
     combined = "\n".join(chunks)
@@ -102,7 +121,11 @@ def test_split_entries_includes_source_label() -> None:
         {"type": "user", "message": {"content": "B" * 100}},
     ]
     chunks = split_entries_to_chunks(
-        entries, max_tokens=40, source_label="agent-123", enable_pruning=True
+        entries,
+        max_tokens=40,
+        source_label="agent-123",
+        enable_pruning=True,
+        token_estimator=estimate_tokens,
     )
 
     # Source label should be in each chunk
@@ -113,7 +136,13 @@ def test_split_entries_includes_source_label() -> None:
 def test_split_entries_each_chunk_is_valid_xml() -> None:
     """Test that each chunk is a valid XML document."""
     entries = [{"type": "user", "message": {"content": "Entry " + str(i)}} for i in range(10)]
-    chunks = split_entries_to_chunks(entries, max_tokens=50, source_label=None, enable_pruning=True)
+    chunks = split_entries_to_chunks(
+        entries,
+        max_tokens=50,
+        source_label=None,
+        enable_pruning=True,
+        token_estimator=estimate_tokens,
+    )
 
     for chunk in chunks:
         # Each chunk should have proper XML structure
@@ -129,7 +158,11 @@ def test_split_entries_respects_token_limit() -> None:
     entries = [{"type": "user", "message": {"content": "Message " + "x" * 50}} for i in range(5)]
     max_tokens = 100
     chunks = split_entries_to_chunks(
-        entries, max_tokens=max_tokens, source_label=None, enable_pruning=True
+        entries,
+        max_tokens=max_tokens,
+        source_label=None,
+        enable_pruning=True,
+        token_estimator=estimate_tokens,
     )
 
     # Each chunk should be under the token limit (approximately)
@@ -139,6 +172,67 @@ def test_split_entries_respects_token_limit() -> None:
         assert chunk_tokens <= max_tokens + 20
 
 
+def test_split_entries_chunks_match_generate_compressed_xml() -> None:
+    """Test that each assembled chunk equals rendering its entries in one session."""
+    entries = [
+        {"type": "user", "gitBranch": "feature-x", "message": {"content": "Start " * 20}},
+        {"type": "unknown"},
+        {
+            "type": "assistant",
+            "model": "claude-opus",
+            "message": {
+                "content": [
+                    {"type": "text", "text": "Looking " * 20},
+                    {"type": "tool_use", "name": "Read", "id": "t1", "input": {"path": "a.py"}},
+                ]
+            },
+        },
+        {"type": "user", "gitBranch": "feature-y", "message": {"content": "Next " * 20}},
+        {"type": "summary", "summary": "Done"},
+    ]
+
+    chunks = split_entries_to_chunks(
+        entries,
+        max_tokens=60,
+        source_label="agent-1",
+        enable_pruning=True,
+        token_estimator=estimate_tokens,
+    )
+
+    assert len(chunks) > 1
+    position = 0
+    for chunk in chunks:
+        for end in range(position + 1, len(entries) + 1):
+            expected = generate_compressed_xml(
+                entries[position:end], source_label="agent-1", enable_pruning=True
+            )
+            if expected == chunk:
+                position = end
+                break
+        else:
+            raise AssertionError(f"Chunk does not match any entry run:\n{chunk}")
+    assert position == len(entries)
+
+
+def test_split_entries_uses_token_estimator() -> None:
+    """Test that the supplied estimator drives chunk boundaries."""
+    entries = [{"type": "user", "message": {"content": f"Entry {i}"}} for i in range(4)]
+
+    def one_hundred_per_fragment(text: str) -> int:
+        return 100
+
+    chunks = split_entries_to_chunks(
+        entries,
+        max_tokens=250,
+        source_label=None,
+        enable_pruning=True,
+        token_estimator=one_hundred_per_fragment,
+    )
+
+    # Wrapper costs 100, so each chunk holds one entry
+    assert len(chunks) == 4
+
+
 # ============================================================================
 # Max Tokens CLI Tests
 # ============================================================================
@@ -1,16 +1,19 @@
 """Tests for land_learn module: learn plan creation logic."""
 
 import json
+import os
 from dataclasses import replace
 from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
+from erk.cli.commands import land_learn
 from erk.cli.commands.land_learn import (
     _compute_session_stats,
     _create_learn_pr_impl,
     _create_learn_pr_with_sessions,
+    _evict_session_stats_cache,
     _fetch_xmls_from_context_branch,
     _file_size_from_xml_files,
     _log_learn_pr_files,
@@ -664,7 +667,7 @@ def test_compute_session_stats_returns_turns_and_duration(tmp_path: Path) -> Non
     jsonl_file = tmp_path / f"{session_id}.jsonl"
     jsonl_file.write_text(jsonl_content, encoding="utf-8")
 
-    stats = _compute_session_stats(jsonl_file, session_id=session_id)
+    stats = _compute_session_stats(jsonl_file, session_id=session_id, cache_dir=None)
 
     assert stats is not None
     assert stats.user_turns == 4
@@ -676,7 +679,7 @@ def test_compute_session_stats_returns_turns_and_duration(tmp_path: Path) -> Non
 def test_compute_session_stats_returns_none_for_missing_file(tmp_path: Path) -> None:
     """Returns None when session file does not exist."""
     missing = tmp_path / "nonexistent.jsonl"
-    stats = _compute_session_stats(missing, session_id="no-such-session")
+    stats = _compute_session_stats(missing, session_id="no-such-session", cache_dir=None)
 
     assert stats is None
 
@@ -688,7 +691,7 @@ def test_compute_session_stats_returns_xml_chunks(tmp_path: Path) -> None:
     jsonl_file = tmp_path / f"{session_id}.jsonl"
     jsonl_file.write_text(jsonl_content, encoding="utf-8")
 
-    stats = _compute_session_stats(jsonl_file, session_id=session_id)
+    stats = _compute_session_stats(jsonl_file, session_id=session_id, cache_dir=None)
 
     assert stats is not None
     assert isinstance(stats.xml_chunks, tuple)
@@ -699,6 +702,112 @@ def test_compute_session_stats_returns_xml_chunks(tmp_path: Path) -> None:
     assert stats.xml_size_kb == total_bytes // 1024
 
 
+def _write_session_with_agents(tmp_path: Path, *, session_id: str, agent_count: int) -> Path:
+    jsonl_file = tmp_path / f"{session_id}.jsonl"
+    jsonl_file.write_text(
+        _make_session_jsonl(session_id=session_id, user_turns=3, duration_seconds=180),
+        encoding="utf-8",
+    )
+    for index in range(agent_count):
+        (tmp_path / f"agent-{index:04}.jsonl").write_text(
+            _make_session_jsonl(session_id=session_id, user_turns=2, duration_seconds=60),
+            encoding="utf-8",
+        )
+    return jsonl_file
+
+
+def test_compute_session_stats_includes_agent_chunks_in_order(tmp_path: Path) -> None:
+    """Agent log chunks follow the main session chunks, labelled per agent."""
+    session_id = "dddd2222-3333-4444-5555-666677778888"
+    jsonl_file = _write_session_with_agents(tmp_path, session_id=session_id, agent_count=2)
+
+    stats = _compute_session_stats(jsonl_file, session_id=session_id, cache_dir=None)
+
+    assert stats is not None
+    assert len(stats.xml_chunks) == 3
+    assert '<meta source="agent-0000" />' in stats.xml_chunks[1]
+    assert '<meta source="agent-0001" />' in stats.xml_chunks[2]
+
+
+def test_compute_session_stats_parallel_matches_serial(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Processing agent logs in a process pool gives the same result as serially."""
+    session_id = "eeee2222-3333-4444-5555-666677778888"
+    jsonl_file = _write_session_with_agents(tmp_path, session_id=session_id, agent_count=3)
+    serial = _compute_session_stats(jsonl_file, session_id=session_id, cache_dir=None)
+
+    monkeypatch.setattr(land_learn, "PARALLEL_PREPROCESS_MIN_BYTES", 0)
+    parallel = _compute_session_stats(jsonl_file, session_id=session_id, cache_dir=None)
+
+    assert parallel == serial
+
+
+def test_compute_session_stats_reuses_cached_files(tmp_path: Path) -> None:
+    """Unchanged files (same path, size, mtime) are served from the cache."""
+    session_id = "ffff2222-3333-4444-5555-666677778888"
+    sessions_dir = tmp_path / "sessions"
+    sessions_dir.mkdir()
+    jsonl_file = _write_session_with_agents(sessions_dir, session_id=session_id, agent_count=1)
+    cache_dir = tmp_path / "cache"
+
+    first = _compute_session_stats(jsonl_file, session_id=session_id, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.json"))) == 2
+
+    # Same-size edit with the original mtime restored: still a cache hit
+    stat = jsonl_file.stat()
+    content = jsonl_file.read_text(encoding="utf-8")
+    jsonl_file.write_text(content.replace("User message 1", "User message X"), encoding="utf-8")
+    os.utime(jsonl_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    cached = _compute_session_stats(jsonl_file, session_id=session_id, cache_dir=cache_dir)
+    assert cached == first
+
+    # A real modification changes mtime and is reprocessed
+    jsonl_file.write_text(content + content, encoding="utf-8")
+    os.utime(jsonl_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    fresh = _compute_session_stats(jsonl_file, session_id=session_id, cache_dir=cache_dir)
+    assert fresh is not None
+    assert first is not None
+    assert fresh.xml_chunks != first.xml_chunks
+
+
+def test_compute_session_stats_treats_corrupt_cache_entries_as_misses(tmp_path: Path) -> None:
+    """Truncated or mistyped cache entries are recomputed and rewritten."""
+    session_id = "abab2222-3333-4444-5555-666677778888"
+    sessions_dir = tmp_path / "sessions"
+    sessions_dir.mkdir()
+    jsonl_file = _write_session_with_agents(sessions_dir, session_id=session_id, agent_count=1)
+    cache_dir = tmp_path / "cache"
+    first = _compute_session_stats(jsonl_file, session_id=session_id, cache_dir=cache_dir)
+    truncated, mistyped = sorted(cache_dir.glob("*.json"))
+
+    truncated.write_text('{"user_turns": 3, "xml_ch', encoding="utf-8")
+    mistyped.write_text('{"user_turns": "3"}', encoding="utf-8")
+    recomputed = _compute_session_stats(jsonl_file, session_id=session_id, cache_dir=cache_dir)
+
+    assert recomputed == first
+    assert '"xml_chunks"' in truncated.read_text(encoding="utf-8")
+    assert '"xml_chunks"' in mistyped.read_text(encoding="utf-8")
+
+
+def test_session_stats_cache_evicts_least_recently_used_past_byte_budget(
+    tmp_path: Path,
+) -> None:
+    """Eviction drops the oldest-used entries until the cache fits its byte budget."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    for index, name in enumerate(["old", "used", "new"]):
+        entry = cache_dir / f"{name}.json"
+        entry.write_text("x" * 100, encoding="utf-8")
+        os.utime(entry, (1_000 + index, 1_000 + index))
+    # Hits refresh mtime: after one on "old", "used" is least recently used
+    os.utime(cache_dir / "old.json", (2_000, 2_000))
+
+    _evict_session_stats_cache(cache_dir, max_bytes=250)
+
+    assert sorted(path.stem for path in cache_dir.glob("*.json")) == ["new", "old"]
+
+
 # ---------------------------------------------------------------------------
 # _log_session_discovery return value
 # ---------------------------------------------------------------------------
@@ -9,9 +9,11 @@ from click.testing import CliRunner
 from erk.cli.cli import cli
 from erk.cli.commands.objective.plan_cmd import (
     ResolvedAllUnblocked,
+    _batch_update_objective_nodes,
     _resolve_all_unblocked,
 )
 from erk_shared.gateway.github.issues.types import IssueInfo
+from erk_shared.gateway.github.metadata.roadmap import parse_roadmap
 from tests.fakes.gateway.git import FakeGit
 from tests.fakes.gateway.github import FakeLocalGitHub
 from tests.fakes.gateway.github_issues import FakeGitHubIssues
@@ -279,12 +281,79 @@ class TestHandleAllUnblocked:
             assert "Dispatching node 2.2" in result.output
             assert "Dispatched 2/2 node(s)" in result.output
 
-            # Verify two workflows triggered (one per node)
+            # Verify two workflows triggered (one per node, started concurrently)
             assert len(remote.dispatched_workflows) == 2
             for wf in remote.dispatched_workflows:
                 assert wf.inputs["objective_issue"] == "42"
             triggered_node_ids = [wf.inputs["node_id"] for wf in remote.dispatched_workflows]
-            assert triggered_node_ids == ["2.1", "2.2"]
+            assert sorted(triggered_node_ids) == ["2.1", "2.2"]
+
+            # Both runs are resolved in one correlation loop
+            assert len(remote.resolved_workflow_runs) == 1
+            workflow, distinct_ids = remote.resolved_workflow_runs[0]
+            assert workflow == "one-shot.yml"
+            assert len(distinct_ids) == 2
+
+    def test_failed_node_does_not_stop_the_others(self) -> None:
+        """A node whose dispatch fails is reported; the other node still lands in the roadmap."""
+
+        class FailingNodeRemote(FakeRemoteGitHub):
+            def start_workflow(
+                self,
+                *,
+                owner: str,
+                repo: str,
+                workflow: str,
+                ref: str,
+                inputs: dict[str, str],
+            ) -> str:
+                if inputs["node_id"] == "2.2":
+                    raise RuntimeError("HTTP 500")
+                return super().start_workflow(
+                    owner=owner, repo=repo, workflow=workflow, ref=ref, inputs=inputs
+                )
+
+        runner = CliRunner()
+        with erk_isolated_fs_env(runner, env_overrides=None) as env:
+            env.setup_repo_structure()
+
+            issue = _make_issue(42, "Objective: Fan-Out", _FAN_OUT_BODY)
+            issues = FakeGitHubIssues(issues={42: issue})
+            git = FakeGit(
+                git_common_dirs={env.cwd: env.git_dir},
+                default_branches={env.cwd: "main"},
+                trunk_branches={env.cwd: "main"},
+                current_branches={env.cwd: "main"},
+            )
+            github = FakeLocalGitHub(authenticated=True, issues_gateway=issues)
+            remote = FailingNodeRemote(
+                authenticated_user="testuser",
+                default_branch_name="main",
+                default_branch_sha="abc123",
+                next_pr_number=7,
+                dispatch_run_id="run-1",
+                issues={42: issue},
+                issue_comments=None,
+            )
+            ctx = build_workspace_test_context(
+                env, git=git, github=github, issues=issues, remote_github=remote
+            )
+
+            result = runner.invoke(
+                cli,
+                ["objective", "plan", "42", "--all-unblocked"],
+                obj=ctx,
+                catch_exceptions=False,
+            )
+
+            assert result.exit_code == 1
+            assert "Dispatched 1/2 node(s)" in result.output
+            assert "2.2: Dispatching one-shot workflow failed: HTTP 500" in result.output
+            [objective_update] = [u for u in remote.updated_issue_bodies if u.number == 42]
+            phases, _errors = parse_roadmap(objective_update.body)
+            statuses = {node.id: node.status for phase in phases for node in phase.nodes}
+            assert statuses["2.1"] == "planning"
+            assert statuses["2.2"] == "pending"
 
     def test_dry_run_shows_preview(self) -> None:
         """--all-unblocked --dry-run shows preview without dispatching."""
@@ -383,3 +452,37 @@ class TestHandleAllUnblocked:
             # Verify both nodes appear as 'planning' in the single written body
             written_body = objective_body_updates[0].body
             assert "planning" in written_body
+
+
+# ---------------------------------------------------------------------------
+# _batch_update_objective_nodes() tests
+# ---------------------------------------------------------------------------
+
+
+def test_batch_update_applies_all_nodes_and_skips_unknown() -> None:
+    """Batch update writes every known node in one body write and skips unknown IDs."""
+    issue = _make_issue(42, "Objective: Fan-Out", _FAN_OUT_BODY)
+    remote = FakeRemoteGitHub(
+        authenticated_user="testuser",
+        default_branch_name="main",
+        default_branch_sha="abc123",
+        next_pr_number=1,
+        dispatch_run_id="run-1",
+        issues={42: issue},
+        issue_comments=None,
+    )
+
+    _batch_update_objective_nodes(
+        remote,
+        owner="test",
+        repo="repo",
+        issue_number=42,
+        node_updates=[("2.1", 201), ("9.9", 999), ("2.2", 202)],
+    )
+
+    assert len(remote.updated_issue_bodies) == 1
+    phases, _ = parse_roadmap(remote.updated_issue_bodies[0].body)
+    nodes = {node.id: node for phase in phases for node in phase.nodes}
+    assert (nodes["2.1"].status, nodes["2.1"].pr) == ("planning", "#201")
+    assert (nodes["2.2"].status, nodes["2.2"].pr) == ("planning", "#202")
+    assert (nodes["1.1"].status, nodes["1.1"].pr) == ("done", "#100")
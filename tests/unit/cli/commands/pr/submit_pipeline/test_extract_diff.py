@@ -100,3 +100,26 @@ def test_skip_description_returns_state_unchanged(tmp_path: Path) -> None:
     result = extract_diff(ctx, state)
 
     assert result is state
+
+
+def test_lock_files_are_excluded(tmp_path: Path) -> None:
+    """Lock file sections never reach the scratch file."""
+    diff = (
+        "diff --git a/src/app.py b/src/app.py\n"
+        "@@ -0,0 +1 @@\n"
+        "+app\n"
+        "diff --git a/uv.lock b/uv.lock\n"
+        "@@ -0,0 +1 @@\n"
+        "+lock content\n"
+    )
+    fake_git = FakeGit(diff_to_branch={(tmp_path, "main"): diff})
+    ctx = context_for_test(git=fake_git, cwd=tmp_path)
+    state = _make_state(cwd=tmp_path, base_branch="main")
+
+    result = extract_diff(ctx, state)
+
+    assert isinstance(result, SubmitState)
+    assert result.diff_file is not None
+    content = result.diff_file.read_text(encoding="utf-8")
+    assert "+app" in content
+    assert "lock content" not in content
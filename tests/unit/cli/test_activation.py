@@ -1,6 +1,7 @@
 """Tests for activation script generation."""
 
 import base64
+import os
 from pathlib import Path
 
 import pytest
@@ -538,6 +539,22 @@ def test_write_worktree_activate_script_creates_script(tmp_path: Path) -> None:
     assert ".venv/bin/activate" in content
 
 
+def test_write_worktree_activate_script_skips_unchanged_content(tmp_path: Path) -> None:
+    """write_worktree_activate_script leaves an identical script untouched."""
+    script_path = write_worktree_activate_script(
+        worktree_path=tmp_path,
+        post_create_commands=None,
+    )
+    os.utime(script_path, (0, 0))
+
+    write_worktree_activate_script(worktree_path=tmp_path, post_create_commands=None)
+    assert script_path.stat().st_mtime == 0
+
+    write_worktree_activate_script(worktree_path=tmp_path, post_create_commands=["echo hi"])
+    assert script_path.stat().st_mtime != 0
+    assert "echo hi" in script_path.read_text(encoding="utf-8")
+
+
 def test_write_worktree_activate_script_creates_erk_directory(tmp_path: Path) -> None:
     """write_worktree_activate_script creates .erk/bin/ directory if needed."""
     assert not (tmp_path / ".erk").exists()
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
-from erk.cli.commands.pr.list.operation import PrListResult
+from erk.cli.commands.pr.list.operation import PrListResult, PrListStreamResult
 from erk.cli.commands.pr.view.operation import PrViewResult, _serialize_header_fields
+from erk.tui.data.types import PrRowData
 from tests.fakes.gateway.plan_data_provider import make_pr_row
 
 
@@ -31,6 +33,31 @@ class TestPrListResult:
         assert data == {"plans": [], "count": 0}
 
 
+class TestPrListStreamResult:
+    """Tests for PrListStreamResult item serialization."""
+
+    def test_items_match_non_streamed_plans(self) -> None:
+        rows = [make_pr_row(1, "A"), make_pr_row(2, "B")]
+        stream_result = PrListStreamResult(rows=iter(rows))
+
+        items = list(stream_result.iter_json_items())
+
+        assert items == PrListResult(rows=rows, warnings=[]).to_json_dict()["plans"]
+
+    def test_serializes_rows_as_they_are_produced(self) -> None:
+        produced: list[int] = []
+
+        def rows() -> Iterator[PrRowData]:
+            for pr_number in (1, 2):
+                produced.append(pr_number)
+                yield make_pr_row(pr_number, f"Plan {pr_number}")
+
+        items = PrListStreamResult(rows=rows()).iter_json_items()
+
+        assert next(items)["pr_number"] == 1
+        assert produced == [1]
+
+
 class TestPrViewResult:
     """Tests for PrViewResult JSON serialization."""
 
@@ -1,6 +1,14 @@
 """Unit tests for codespace SSH command builder."""
 
-from erk.core.codespace_run import build_codespace_ssh_command
+from datetime import datetime, timedelta
+
+from erk.core.codespace_run import (
+    CODESPACE_WARM_WINDOW,
+    build_codespace_ssh_command,
+    is_codespace_warm,
+)
+
+NOW = datetime(2026, 1, 20, 9, 0, 0)
 
 
 def test_build_codespace_ssh_command_includes_setup() -> None:
@@ -63,3 +71,15 @@ def test_build_codespace_ssh_command_no_cd_when_working_directory_is_none() -> N
 
     assert "cd " not in result
     assert result.startswith("bash -l -c 'git pull")
+
+
+def test_is_codespace_warm_within_window() -> None:
+    """A codespace started inside the warm window does not need starting."""
+    assert is_codespace_warm(NOW - timedelta(minutes=1), now=NOW) is True
+    assert is_codespace_warm(NOW - CODESPACE_WARM_WINDOW, now=NOW) is False
+    assert is_codespace_warm(None, now=NOW) is False
+
+
+def test_is_codespace_warm_rejects_future_timestamp() -> None:
+    """A start recorded in the future (clock skew) is not trusted."""
+    assert is_codespace_warm(NOW + timedelta(minutes=1), now=NOW) is False
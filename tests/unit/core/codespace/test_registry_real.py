@@ -7,6 +7,7 @@ import pytest
 from erk_shared.gateway.codespace_registry.abc import RegisteredCodespace
 from erk_shared.gateway.codespace_registry.real import (
     RealCodespaceRegistry,
+    record_codespace_started,
     register_codespace,
     set_default_codespace,
     unregister_codespace,
@@ -178,6 +179,36 @@ class TestSetDefaultCodespace:
             set_default_codespace(config_path, "nonexistent")
 
 
+class TestRecordCodespaceStarted:
+    """Tests for the last-started cache state."""
+
+    def test_record_is_read_back_and_survives_other_mutations(self, tmp_path):
+        """record_codespace_started persists across later registry writes."""
+        config_path = tmp_path / "codespaces.toml"
+        codespace = RegisteredCodespace(
+            name="mybox",
+            gh_name="user-mybox-abc123",
+            created_at=datetime(2026, 1, 20, 8, 39, 0),
+        )
+        register_codespace(config_path, codespace)
+        started_at = datetime(2026, 1, 21, 9, 0, 0)
+
+        record_codespace_started(config_path, "mybox", started_at)
+        registry = set_default_codespace(config_path, "mybox")
+
+        assert registry.get_last_started_at("mybox") == started_at
+
+    def test_record_is_noop_without_config_or_entry(self, tmp_path):
+        """record_codespace_started writes nothing for unknown codespaces."""
+        config_path = tmp_path / "codespaces.toml"
+
+        record_codespace_started(config_path, "mybox", datetime(2026, 1, 21, 9, 0, 0))
+
+        assert not config_path.exists()
+        registry = RealCodespaceRegistry.from_config_path(config_path)
+        assert registry.get_last_started_at("mybox") is None
+
+
 class TestTomlFormat:
     """Tests for TOML format verification."""
 
@@ -0,0 +1,211 @@
+"""Tests for CachingPromptExecutor and the on-disk prompt result cache."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from tests.fakes.gateway.time import FakeTime
+from tests.fakes.tests.prompt_executor import FakePromptExecutor
+
+from erk.core.caching_prompt_executor import CachingPromptExecutor
+from erk.core.prompt_cache import PromptResultCache, prompt_cache_key
+from erk_shared.core.prompt_executor import PromptRequest, PromptResult
+
+_NOW = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def _cache(
+    root: Path, *, now: datetime, max_entries: int, eviction_interval_seconds: int = 0
+) -> PromptResultCache:
+    return PromptResultCache(
+        root,
+        time=FakeTime(current_time=now),
+        ttl_seconds=3600,
+        max_entries=max_entries,
+        eviction_interval_seconds=eviction_interval_seconds,
+    )
+
+
+def _executor(inner: FakePromptExecutor, cache: PromptResultCache) -> CachingPromptExecutor:
+    return CachingPromptExecutor(inner=inner, cache=cache)
+
+
+def _slug(executor: CachingPromptExecutor | FakePromptExecutor, prompt: str) -> PromptResult:
+    return executor.execute_prompt(
+        prompt,
+        model="haiku",
+        tools=None,
+        cwd=None,
+        system_prompt="Generate a slug",
+        dangerous=False,
+    )
+
+
+def test_identical_prompt_is_served_from_cache(tmp_path: Path) -> None:
+    inner = FakePromptExecutor(simulated_prompt_outputs=["first", "second"])
+    cache = _cache(tmp_path, now=_NOW, max_entries=10)
+    executor = _executor(inner, cache)
+
+    first = _slug(executor, "Add login page")
+    second = _slug(executor, "Add login page")
+
+    assert first.output == "first"
+    assert second == first
+    assert len(inner.prompt_calls) == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_cache_persists_across_instances(tmp_path: Path) -> None:
+    _slug(_executor(FakePromptExecutor(), _cache(tmp_path, now=_NOW, max_entries=10)), "p")
+    inner = FakePromptExecutor(simulated_prompt_output="fresh")
+
+    result = _slug(_executor(inner, _cache(tmp_path, now=_NOW, max_entries=10)), "p")
+
+    assert result.output == "Test Title\n\nTest body"
+    assert inner.prompt_calls == []
+
+
+def test_key_covers_model_system_prompt_and_tools() -> None:
+    base = prompt_cache_key(model="haiku", system_prompt="s", prompt="p", tools=["Read", "Bash"])
+
+    assert base == prompt_cache_key(
+        model="haiku", system_prompt="s", prompt="p", tools=["Bash", "Read"]
+    )
+    assert base != prompt_cache_key(model="sonnet", system_prompt="s", prompt="p", tools=None)
+    assert base != prompt_cache_key(model="haiku", system_prompt=None, prompt="p", tools=None)
+    assert base != prompt_cache_key(model="haiku", system_prompt="s", prompt="p", tools=None)
+
+
+def test_expired_entries_are_refetched(tmp_path: Path) -> None:
+    _slug(_executor(FakePromptExecutor(), _cache(tmp_path, now=_NOW, max_entries=10)), "p")
+    inner = FakePromptExecutor(simulated_prompt_output="fresh")
+    later = _cache(tmp_path, now=_NOW + timedelta(hours=2), max_entries=10)
+
+    result = _slug(_executor(inner, later), "p")
+
+    assert result.output == "fresh"
+    assert len(inner.prompt_calls) == 1
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path: Path) -> None:
+    inner = FakePromptExecutor()
+    _slug(_executor(inner, _cache(tmp_path, now=_NOW, max_entries=2)), "a")
+    _slug(_executor(inner, _cache(tmp_path, now=_NOW + timedelta(minutes=1), max_entries=2)), "b")
+    # Touch "a" so "b" becomes least recently used
+    _slug(_executor(inner, _cache(tmp_path, now=_NOW + timedelta(minutes=2), max_entries=2)), "a")
+    _slug(_executor(inner, _cache(tmp_path, now=_NOW + timedelta(minutes=3), max_entries=2)), "c")
+
+    calls_before = len(inner.prompt_calls)
+    executor = _executor(inner, _cache(tmp_path, now=_NOW + timedelta(minutes=4), max_entries=2))
+    _slug(executor, "a")
+    _slug(executor, "b")
+
+    assert [call[0] for call in inner.prompt_calls[calls_before:]] == ["b"]
+
+
+def test_eviction_runs_at_most_once_per_interval(tmp_path: Path) -> None:
+    inner = FakePromptExecutor()
+
+    def slug_at(prompt: str, minutes: int) -> None:
+        cache = _cache(
+            tmp_path,
+            now=_NOW + timedelta(minutes=minutes),
+            max_entries=1,
+            eviction_interval_seconds=600,
+        )
+        _slug(_executor(inner, cache), prompt)
+
+    slug_at("a", 0)
+    slug_at("b", 1)
+    slug_at("c", 2)
+    assert len(list(tmp_path.glob("*/*.json"))) == 3
+
+    slug_at("d", 10)
+    assert len(list(tmp_path.glob("*/*.json"))) == 1
+
+
+def test_corrupt_or_vanished_entries_are_misses(tmp_path: Path) -> None:
+    inner = FakePromptExecutor(simulated_prompt_outputs=["first", "second", "third"])
+    executor = _executor(inner, _cache(tmp_path, now=_NOW, max_entries=10))
+    _slug(executor, "p")
+    (entry_path,) = tmp_path.glob("*/*.json")
+
+    entry_path.write_text("{truncated", encoding="utf-8")
+    corrupt = _slug(executor, "p")
+    entry_path.unlink()
+    vanished = _slug(executor, "p")
+
+    assert (corrupt.output, vanished.output) == ("second", "third")
+    assert _slug(executor, "p").output == "third"
+
+
+def test_failed_results_are_not_cached(tmp_path: Path) -> None:
+    inner = FakePromptExecutor(simulated_prompt_error="rate limited")
+    executor = _executor(inner, _cache(tmp_path, now=_NOW, max_entries=10))
+
+    _slug(executor, "p")
+    _slug(executor, "p")
+
+    assert len(inner.prompt_calls) == 2
+
+
+def test_prompts_with_cwd_or_dangerous_bypass_cache(tmp_path: Path) -> None:
+    inner = FakePromptExecutor()
+    executor = _executor(inner, _cache(tmp_path, now=_NOW, max_entries=10))
+
+    for _ in range(2):
+        executor.execute_prompt(
+            "p", model="haiku", tools=None, cwd=tmp_path, system_prompt=None, dangerous=False
+        )
+        executor.execute_prompt(
+            "p", model="haiku", tools=None, cwd=None, system_prompt=None, dangerous=True
+        )
+
+    assert len(inner.prompt_calls) == 4
+
+
+def test_uncached_opts_out(tmp_path: Path) -> None:
+    inner = FakePromptExecutor()
+    executor = _executor(inner, _cache(tmp_path, now=_NOW, max_entries=10))
+    _slug(executor, "p")
+
+    uncached = executor.uncached()
+    _slug(uncached, "p")
+
+    assert uncached is inner
+    assert len(inner.prompt_calls) == 2
+
+
+def _request(prompt: str, *, cwd: Path | None) -> PromptRequest:
+    return PromptRequest(
+        prompt=prompt,
+        model="haiku",
+        tools=None,
+        cwd=cwd,
+        system_prompt="Generate a slug",
+        dangerous=False,
+    )
+
+
+def test_batch_runs_only_cache_misses_and_keeps_order(tmp_path: Path) -> None:
+    inner = FakePromptExecutor(simulated_prompt_outputs=["cached-b", "a", "c", "d"])
+    executor = _executor(inner, _cache(tmp_path, now=_NOW, max_entries=10))
+    _slug(executor, "b")
+
+    results = executor.execute_prompts_batch(
+        [
+            _request("a", cwd=None),
+            _request("b", cwd=None),
+            _request("c", cwd=None),
+            _request("d", cwd=tmp_path),
+        ],
+        max_concurrency=4,
+    )
+
+    assert [r.output for r in results] == ["a", "cached-b", "c", "d"]
+    assert [call[0] for call in inner.prompt_calls] == ["b", "a", "c", "d"]
+    # Misses without a cwd are now cached; the cwd request is not
+    executor.execute_prompts_batch(
+        [_request("a", cwd=None), _request("d", cwd=tmp_path)], max_concurrency=4
+    )
+    assert [call[0] for call in inner.prompt_calls[4:]] == ["d"]
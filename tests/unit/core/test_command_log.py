@@ -2,7 +2,7 @@
 
 import json
 import os
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch
 
@@ -10,13 +10,21 @@ from erk.core.command_log import (
     CommandLogEntry,
     _get_current_branch,
     _is_logging_disabled,
-    _rotate_log_if_needed,
     log_command_end,
     log_command_start,
     read_log_entries,
 )
 
 
+def _read_segment_lines(tmp_path: Path) -> list[str]:
+    """Read all log lines written to the segment directory, oldest segment first."""
+    segment_dir = tmp_path / "command_history"
+    lines: list[str] = []
+    for segment in sorted(segment_dir.glob("*.jsonl")):
+        lines.extend(segment.read_text(encoding="utf-8").splitlines())
+    return lines
+
+
 def test_is_logging_disabled_returns_false_when_env_not_set() -> None:
     """Test logging is enabled by default."""
     with patch.dict(os.environ, {}, clear=True):
@@ -56,7 +64,7 @@ def test_log_command_start_returns_none_when_disabled(tmp_path: Path) -> None:
 
 
 def test_log_command_start_creates_log_file(tmp_path: Path) -> None:
-    """Test log_command_start creates the log file."""
+    """Test log_command_start creates a segment next to the legacy log path."""
     log_path = tmp_path / "command_history.jsonl"
 
     with patch("erk.core.command_log._get_log_file_path", return_value=log_path):
@@ -64,7 +72,9 @@ def test_log_command_start_creates_log_file(tmp_path: Path) -> None:
             entry_id = log_command_start(["wt", "delete", "foo"], tmp_path)
 
     assert entry_id is not None
-    assert log_path.exists()
+    segment_name = datetime.fromisoformat(entry_id).strftime("%Y%m%dT%H") + ".jsonl"
+    assert (tmp_path / "command_history" / segment_name).exists()
+    assert not log_path.exists()
 
 
 def test_log_command_start_writes_valid_json(tmp_path: Path) -> None:
@@ -75,8 +85,7 @@ def test_log_command_start_writes_valid_json(tmp_path: Path) -> None:
         with patch("erk.core.command_log._get_current_branch", return_value="main"):
             log_command_start(["wt", "delete", "foo"], tmp_path)
 
-    content = log_path.read_text(encoding="utf-8")
-    lines = content.strip().split("\n")
+    lines = _read_segment_lines(tmp_path)
     assert len(lines) == 1
 
     entry = json.loads(lines[0])
@@ -98,8 +107,7 @@ def test_log_command_end_writes_completion_entry(tmp_path: Path) -> None:
             entry_id = log_command_start(["wt", "delete", "foo"], tmp_path)
             log_command_end(entry_id, 0)
 
-    content = log_path.read_text(encoding="utf-8")
-    lines = content.strip().split("\n")
+    lines = _read_segment_lines(tmp_path)
     assert len(lines) == 2
 
     completion = json.loads(lines[1])
@@ -122,8 +130,8 @@ def test_log_command_start_extracts_subcommand_correctly(tmp_path: Path) -> None
         with patch("erk.core.command_log._get_current_branch", return_value=None):
             log_command_start(["wt", "delete", "--force", "foo"], tmp_path)
 
-    content = log_path.read_text(encoding="utf-8")
-    entry = json.loads(content.strip())
+    (line,) = _read_segment_lines(tmp_path)
+    entry = json.loads(line)
     assert entry["command"] == "erk wt delete"
     assert entry["args"] == ["--force", "foo"]
 
@@ -136,36 +144,67 @@ def test_log_command_start_handles_flags_at_start(tmp_path: Path) -> None:
         with patch("erk.core.command_log._get_current_branch", return_value=None):
             log_command_start(["--debug", "doctor"], tmp_path)
 
-    content = log_path.read_text(encoding="utf-8")
-    entry = json.loads(content.strip())
+    (line,) = _read_segment_lines(tmp_path)
+    entry = json.loads(line)
     # Flags at start mean no subcommand extracted
     assert entry["command"] == "erk"
     assert entry["args"] == ["--debug", "doctor"]
 
 
-def test_rotate_log_if_needed_does_nothing_when_small(tmp_path: Path) -> None:
-    """Test rotation does nothing when file is under size limit."""
+def test_read_log_entries_reads_only_segments_in_range(tmp_path: Path) -> None:
+    """Test --since queries skip segments that end before the window."""
     log_path = tmp_path / "command_history.jsonl"
-    log_path.write_text("small content\n", encoding="utf-8")
+    segment_dir = tmp_path / "command_history"
+    segment_dir.mkdir()
+    now = datetime.now(UTC)
+    recent = {"timestamp": now.isoformat(), "command": "erk recent", "args": [], "pid": 1}
+    (segment_dir / (now.strftime("%Y%m%dT%H") + ".jsonl")).write_text(
+        json.dumps(recent) + "\n", encoding="utf-8"
+    )
+    # A recent entry inside an old segment is only seen if the segment is opened
+    old_hour = now - timedelta(hours=5)
+    misplaced = {"timestamp": now.isoformat(), "command": "erk misplaced", "args": [], "pid": 2}
+    (segment_dir / (old_hour.strftime("%Y%m%dT%H") + ".jsonl")).write_text(
+        json.dumps(misplaced) + "\n", encoding="utf-8"
+    )
 
-    _rotate_log_if_needed(log_path)
+    with patch("erk.core.command_log._get_log_file_path", return_value=log_path):
+        in_range = read_log_entries(
+            since=now - timedelta(hours=1),
+            until=None,
+            command_filter=None,
+            cwd_filter=None,
+            limit=None,
+        )
+        everything = read_log_entries(
+            since=None, until=None, command_filter=None, cwd_filter=None, limit=None
+        )
 
-    assert log_path.exists()
-    assert not (tmp_path / "command_history.jsonl.old").exists()
+    assert [e.command for e in in_range] == ["erk recent"]
+    assert sorted(e.command for e in everything) == ["erk misplaced", "erk recent"]
 
 
-def test_rotate_log_if_needed_rotates_large_file(tmp_path: Path) -> None:
-    """Test rotation when file exceeds size limit."""
+def test_read_log_entries_joins_legacy_and_segmented_entries(tmp_path: Path) -> None:
+    """Test entries from the pre-segmentation file are still returned."""
     log_path = tmp_path / "command_history.jsonl"
-    # Create a file just over 50MB
-    large_content = "x" * (50 * 1024 * 1024 + 100)
-    log_path.write_text(large_content, encoding="utf-8")
+    legacy = {
+        "timestamp": "2026-01-01T08:00:00+00:00",
+        "command": "erk legacy",
+        "args": [],
+        "cwd": "/test",
+        "pid": 1,
+    }
+    log_path.write_text(json.dumps(legacy) + "\n", encoding="utf-8")
 
-    _rotate_log_if_needed(log_path)
+    with patch("erk.core.command_log._get_log_file_path", return_value=log_path):
+        with patch("erk.core.command_log._get_current_branch", return_value=None):
+            entry_id = log_command_start(["doctor"], tmp_path)
+            log_command_end(entry_id, 0)
+        result = read_log_entries(
+            since=None, until=None, command_filter=None, cwd_filter=None, limit=None
+        )
 
-    assert not log_path.exists()
-    old_path = tmp_path / "command_history.jsonl.old"
-    assert old_path.exists()
+    assert [(e.command, e.exit_code) for e in result] == [("erk doctor", 0), ("erk legacy", None)]
 
 
 def test_read_log_entries_returns_empty_when_no_file(tmp_path: Path) -> None:
@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 from tests.fakes.gateway.console import FakeConsole
 from tests.fakes.gateway.git import FakeGit
+from tests.fakes.gateway.time import FakeTime
 from tests.fakes.tests.prompt_executor import FakePromptExecutor
 from tests.test_utils.test_context import context_for_test
 
@@ -92,7 +93,7 @@ def test_select_prompt_executor_returns_fallback_when_fast_path_enabled() -> Non
     config = GlobalConfig.test(Path("/test/erks"), anthropic_api_fast_path=True)
     fake = FakePromptExecutor()
 
-    result = select_prompt_executor(cli_executor=fake, global_config=config)
+    result = select_prompt_executor(cli_executor=fake, global_config=config, time=FakeTime())
 
     assert isinstance(result, FallbackPromptExecutor)
     assert result.cli_executor is fake
@@ -103,7 +104,7 @@ def test_select_prompt_executor_returns_cli_executor_when_fast_path_disabled() -
     config = GlobalConfig.test(Path("/test/erks"))
     fake = FakePromptExecutor()
 
-    result = select_prompt_executor(cli_executor=fake, global_config=config)
+    result = select_prompt_executor(cli_executor=fake, global_config=config, time=FakeTime())
 
     assert result is fake
 
@@ -112,6 +113,6 @@ def test_select_prompt_executor_returns_cli_executor_when_config_is_none() -> No
     """select_prompt_executor returns cli_executor unchanged when global_config is None."""
     fake = FakePromptExecutor()
 
-    result = select_prompt_executor(cli_executor=fake, global_config=None)
+    result = select_prompt_executor(cli_executor=fake, global_config=None, time=FakeTime())
 
     assert result is fake
@@ -4,10 +4,12 @@ These tests verify the health check correctly reports hook execution status
 from logs written by the @logged_hook decorator.
 """
 
-import json
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 from erk.core.health_checks.hook_health import check_hook_health
+from erk_shared.hooks.logging import write_hook_log
+from erk_shared.hooks.types import HookExecutionLog, HookExitStatus
 
 
 def _write_hook_log(
@@ -16,30 +18,26 @@ def _write_hook_log(
     hook_id: str,
     exit_status: str,
     exit_code: int,
-    timestamp: str,
+    minutes_ago: int,
     error_message: str | None = None,
 ) -> None:
-    """Helper to write a hook log file for testing."""
-    log_dir = repo_root / ".erk" / "scratch" / "sessions" / session_id / "hooks" / hook_id
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    log_data = {
-        "kit_id": "test-kit",
-        "hook_id": hook_id,
-        "session_id": session_id,
-        "started_at": timestamp,
-        "ended_at": timestamp,
-        "duration_ms": 100,
-        "exit_code": exit_code,
-        "exit_status": exit_status,
-        "stdout": "",
-        "stderr": "error output" if exit_status in ("error", "exception") else "",
-        "stdin_context": "{}",
-        "error_message": error_message,
-    }
-
-    log_file = log_dir / f"{timestamp.replace(':', '-')}.json"
-    log_file.write_text(json.dumps(log_data), encoding="utf-8")
+    """Helper to append a hook log entry for testing."""
+    timestamp = (datetime.now(UTC) - timedelta(minutes=minutes_ago)).isoformat()
+    log = HookExecutionLog(
+        kit_id="test-kit",
+        hook_id=hook_id,
+        session_id=session_id,
+        started_at=timestamp,
+        ended_at=timestamp,
+        duration_ms=100,
+        exit_code=exit_code,
+        exit_status=HookExitStatus(exit_status),
+        stdout="",
+        stderr="error output" if exit_status in ("error", "exception") else "",
+        stdin_context="{}",
+        error_message=error_message,
+    )
+    write_hook_log(log, repo_root=repo_root)
 
 
 def test_returns_healthy_when_no_logs(tmp_path: Path) -> None:
@@ -59,7 +57,7 @@ def test_returns_healthy_when_all_hooks_succeed(tmp_path: Path) -> None:
         hook_id="test-hook",
         exit_status="success",
         exit_code=0,
-        timestamp="2024-01-01T12:00:00+00:00",
+        minutes_ago=10,
     )
     _write_hook_log(
         tmp_path,
@@ -67,7 +65,7 @@ def test_returns_healthy_when_all_hooks_succeed(tmp_path: Path) -> None:
         hook_id="other-hook",
         exit_status="success",
         exit_code=0,
-        timestamp="2024-01-01T12:01:00+00:00",
+        minutes_ago=9,
     )
 
     result = check_hook_health(tmp_path)
@@ -85,7 +83,7 @@ def test_returns_healthy_when_hooks_blocked(tmp_path: Path) -> None:
         hook_id="test-hook",
         exit_status="blocked",
         exit_code=2,
-        timestamp="2024-01-01T12:00:00+00:00",
+        minutes_ago=10,
     )
 
     result = check_hook_health(tmp_path)
@@ -103,7 +101,7 @@ def test_returns_failure_when_hooks_error(tmp_path: Path) -> None:
         hook_id="failing-hook",
         exit_status="error",
         exit_code=1,
-        timestamp="2024-01-01T12:00:00+00:00",
+        minutes_ago=10,
     )
 
     result = check_hook_health(tmp_path)
@@ -122,7 +120,7 @@ def test_returns_failure_when_hooks_exception(tmp_path: Path) -> None:
         hook_id="broken-hook",
         exit_status="exception",
         exit_code=1,
-        timestamp="2024-01-01T12:00:00+00:00",
+        minutes_ago=10,
         error_message="ImportError: No module named 'missing'",
     )
 
@@ -142,7 +140,7 @@ def test_aggregates_multiple_failures(tmp_path: Path) -> None:
         hook_id="hook-a",
         exit_status="error",
         exit_code=1,
-        timestamp="2024-01-01T12:00:00+00:00",
+        minutes_ago=10,
     )
     _write_hook_log(
         tmp_path,
@@ -150,7 +148,7 @@ def test_aggregates_multiple_failures(tmp_path: Path) -> None:
         hook_id="hook-b",
         exit_status="exception",
         exit_code=1,
-        timestamp="2024-01-01T12:01:00+00:00",
+        minutes_ago=9,
     )
     _write_hook_log(
         tmp_path,
@@ -158,7 +156,7 @@ def test_aggregates_multiple_failures(tmp_path: Path) -> None:
         hook_id="hook-a",
         exit_status="success",
         exit_code=0,
-        timestamp="2024-01-01T12:02:00+00:00",
+        minutes_ago=8,
     )
 
     result = check_hook_health(tmp_path)
@@ -0,0 +1,42 @@
+"""Tests for stack sync fast-forwarding."""
+
+from pathlib import Path
+
+from tests.fakes.gateway.git import FakeGit
+from tests.test_utils.test_context import context_for_test
+
+from erk.core.stack_sync import BranchSyncAction, _fast_forward_branches
+from erk_shared.gateway.git.abc import RemoteBranchState
+
+
+def _behind(branch: str, *, local_sha: str, remote_sha: str) -> RemoteBranchState:
+    return RemoteBranchState(
+        branch=branch,
+        local_sha=local_sha,
+        exists_on_remote=True,
+        remote_sha=remote_sha,
+        ahead=0,
+        behind=1,
+    )
+
+
+def test_rejected_transaction_falls_back_to_per_branch_updates(tmp_path: Path) -> None:
+    """A branch that moved after classification fails alone; the others advance."""
+    git = FakeGit(branch_heads={"feat-1": "old111", "feat-2": "moved222"})
+    ctx = context_for_test(git=git, cwd=tmp_path)
+
+    results = _fast_forward_branches(
+        ctx,
+        repo_root=tmp_path,
+        states=[
+            _behind("feat-1", local_sha="old111", remote_sha="new111"),
+            _behind("feat-2", local_sha="old222", remote_sha="new222"),
+        ],
+    )
+
+    assert [(r.branch, r.action) for r in results] == [
+        ("feat-1", BranchSyncAction.FAST_FORWARDED),
+        ("feat-2", BranchSyncAction.ERROR),
+    ]
+    assert "expected old222" in results[1].detail
+    assert git.updated_refs == [(tmp_path, "feat-1", "new111")]
@@ -1,11 +1,13 @@
 """Unit tests for worktree pool state management."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from erk.core.worktree_pool import (
     PoolState,
     SlotAssignment,
     SlotInfo,
+    load_pool_revision,
     load_pool_state,
     save_pool_state,
 )
@@ -181,3 +183,38 @@ def test_pool_state_with_slots_no_assignments() -> None:
     assert state.slots[0].name == "erk-slot-01"
     assert state.slots[1].name == "erk-slot-02"
     assert len(state.assignments) == 0
+
+
+def test_save_pool_state_bumps_revision_without_leaving_temp_files(tmp_path: Path) -> None:
+    """Each save increments the revision and replaces pool.json atomically."""
+    pool_json = tmp_path / "pool.json"
+    assert load_pool_revision(pool_json) == 0
+
+    save_pool_state(pool_json, PoolState.test())
+    save_pool_state(pool_json, PoolState.test(pool_size=8))
+
+    assert load_pool_revision(pool_json) == 2
+    loaded = load_pool_state(pool_json)
+    assert loaded is not None
+    assert loaded.pool_size == 8
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["pool.json"]
+
+
+def test_save_pool_state_from_concurrent_threads_uses_distinct_temp_files(
+    tmp_path: Path,
+) -> None:
+    """Threads of one process saving at once never collide on a temp file."""
+    pool_json = tmp_path / "pool.json"
+
+    def save_repeatedly(pool_size: int) -> None:
+        for _ in range(20):
+            save_pool_state(pool_json, PoolState.test(pool_size=pool_size))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [executor.submit(save_repeatedly, size) for size in range(1, 9)]:
+            future.result()
+
+    loaded = load_pool_state(pool_json)
+    assert loaded is not None
+    assert 1 <= loaded.pool_size <= 8
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["pool.json"]
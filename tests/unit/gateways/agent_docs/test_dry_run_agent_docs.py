@@ -55,3 +55,12 @@ def test_format_markdown_delegates_to_wrapped() -> None:
     dry_run = DryRunAgentDocs(wrapped)
     content = "# Hello\n\nSome text\n"
     assert dry_run.format_markdown(content) == content
+
+
+def test_write_sync_manifest_does_not_write_to_wrapped() -> None:
+    wrapped = FakeAgentDocs(files={}, has_docs_dir=True)
+    dry_run = DryRunAgentDocs(wrapped)
+    dry_run.write_sync_manifest(PROJECT_ROOT, "{}")
+
+    assert wrapped.sync_manifest is None
+    assert dry_run.read_sync_manifest(PROJECT_ROOT) is None
@@ -1,5 +1,6 @@
 """Unit tests for RealLocalGitHub parsing and caching methods."""
 
+import json
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -314,6 +315,116 @@ def test_get_default_branch_propagates_runtime_error(mock_execute) -> None:  # n
     assert repo_root not in github._default_branch_cache
 
 
+# --- Tests for paginated review threads and comments ---
+
+
+def _thread_node(thread_id: str, *, comment_ids: list[int], has_more_comments: bool) -> dict:
+    return {
+        "id": thread_id,
+        "isResolved": False,
+        "isOutdated": False,
+        "path": "src/foo.py",
+        "line": 1,
+        "comments": {
+            "pageInfo": {"hasNextPage": has_more_comments, "endCursor": f"{thread_id}-c1"},
+            "nodes": [{"databaseId": cid, "body": f"c{cid}"} for cid in comment_ids],
+        },
+    }
+
+
+def _threads_page(nodes: list[dict], *, has_next: bool, end_cursor: str | None) -> str:
+    return json.dumps(
+        {
+            "data": {
+                "repository": {
+                    "pullRequest": {
+                        "reviewThreads": {
+                            "pageInfo": {"hasNextPage": has_next, "endCursor": end_cursor},
+                            "nodes": nodes,
+                        }
+                    }
+                }
+            }
+        }
+    )
+
+
+@patch("erk_shared.gateway.github.real.execute_gh_command_with_retry")
+def test_iter_review_thread_pages_follows_cursors(mock_execute) -> None:  # noqa: ANN001
+    """Thread pages are fetched lazily and long comment lists are completed."""
+    more_comments = {
+        "data": {
+            "node": {
+                "comments": {
+                    "pageInfo": {"hasNextPage": False, "endCursor": "T1-c2"},
+                    "nodes": [{"databaseId": 3, "body": "c3"}],
+                }
+            }
+        }
+    }
+    mock_execute.side_effect = [
+        _threads_page(
+            [_thread_node("T1", comment_ids=[1, 2], has_more_comments=True)],
+            has_next=True,
+            end_cursor="page-1",
+        ),
+        json.dumps(more_comments),
+        _threads_page(
+            [_thread_node("T2", comment_ids=[4], has_more_comments=False)],
+            has_next=False,
+            end_cursor="page-2",
+        ),
+    ]
+    github = real_github_for_test(repo_info=RepoInfo(owner="owner", name="repo"))
+
+    pages = github.iter_pr_review_thread_pages(
+        Path("/test/repo"), 7, include_resolved=False, after=None
+    )
+    first = next(pages)
+
+    assert mock_execute.call_count == 2
+    assert [c.id for c in first.threads[0].comments] == [1, 2, 3]
+    assert first.end_cursor == "page-1"
+
+    rest = list(pages)
+
+    assert [t.id for page in rest for t in page.threads] == ["T2"]
+    assert rest[-1].end_cursor == "page-2"
+    first_cmd = mock_execute.call_args_list[0].args[0]
+    assert first_cmd[-2:] == ["-F", "cursor=null"]
+    last_cmd = mock_execute.call_args_list[2].args[0]
+    assert last_cmd[-2:] == ["-f", "cursor=page-1"]
+
+
+@patch("erk_shared.gateway.github.real.execute_gh_command_with_retry")
+def test_find_pr_comment_by_marker_stops_at_first_match(mock_execute) -> None:  # noqa: ANN001
+    """Comment pages after the matching comment are never requested."""
+    first_page = [{"id": i, "body": "noise"} for i in range(99)]
+    first_page.append({"id": 500, "body": "<!-- marker -->"})
+    mock_execute.side_effect = [json.dumps(first_page), json.dumps([])]
+    github = real_github_for_test()
+
+    comment_id = github.find_pr_comment_by_marker(Path("/test/repo"), 7, "<!-- marker -->")
+
+    assert comment_id == 500
+    mock_execute.assert_called_once()
+    cmd = mock_execute.call_args.args[0]
+    assert cmd[-1] == "repos/{owner}/{repo}/issues/7/comments?per_page=100&page=1"
+
+
+@patch("erk_shared.gateway.github.real.execute_gh_command_with_retry")
+def test_fetch_pr_comments_reads_every_page(mock_execute) -> None:  # noqa: ANN001
+    """A full page triggers the next request; a short page ends pagination."""
+    full_page = [{"id": i, "body": ""} for i in range(100)]
+    mock_execute.side_effect = [json.dumps(full_page), json.dumps([{"id": 100, "body": ""}])]
+    github = real_github_for_test()
+
+    comments = github.fetch_pr_comments(Path("/test/repo"), 7)
+
+    assert len(comments) == 101
+    assert mock_execute.call_count == 2
+
+
 # --- Tests for _build_issues_by_numbers_query ---
 
 
@@ -561,3 +672,18 @@ def test_parse_mixed_issues_and_prs() -> None:
     assert 100 not in pr_linkages
     assert 200 in pr_linkages
     assert pr_linkages[200][0].is_draft is False
+
+
+# --- Tests for batched PR details lookups ---
+
+
+@patch("erk_shared.gateway.github.real.execute_gh_command_with_retry")
+def test_get_pr_details_by_numbers_raises_on_rate_limit(mock_execute) -> None:  # noqa: ANN001
+    """A rate-limited chunk is raised, not retried as one REST call per PR."""
+    mock_execute.side_effect = RuntimeError("gh: API rate limit exceeded for user ID 1.")
+    github = real_github_for_test(repo_info=RepoInfo(owner="owner", name="repo"))
+
+    with pytest.raises(RuntimeError, match="rate limit"):
+        github.get_pr_details_by_numbers(Path("/test/repo"), [1, 2, 3])
+
+    mock_execute.assert_called_once()
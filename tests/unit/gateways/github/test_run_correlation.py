@@ -0,0 +1,171 @@
+"""Tests for batched workflow dispatch run correlation."""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from erk_shared.gateway.github.run_correlation import (
+    RUNS_PAGE_SIZE,
+    WorkflowRunFound,
+    WorkflowRunNotFound,
+    WorkflowRunSkipped,
+    correlate_workflow_runs,
+    distinct_id_from_display_title,
+    workflow_runs_endpoint,
+)
+from erk_shared.gateway.http.real import RealHttpClient
+from erk_shared.gateway.remote_github.real import RealRemoteGitHub
+from tests.fakes.gateway.time import FakeTime
+from tests.fakes.tests.workflow_runs_server import FakeWorkflowRunsServer
+
+
+def _run(run_id: int, title: str, *, conclusion: str | None = None) -> dict[str, Any]:
+    return {"id": run_id, "display_title": title, "conclusion": conclusion}
+
+
+def test_distinct_id_is_suffix_after_last_colon() -> None:
+    assert distinct_id_from_display_title("Plan: fix bug #12:abc123") == "abc123"
+    assert distinct_id_from_display_title("no separator") is None
+
+
+def test_endpoint_filters_by_created_with_clock_skew_allowance() -> None:
+    endpoint = workflow_runs_endpoint(
+        "plan-implement.yml",
+        created_since=datetime(2026, 3, 1, 12, 0, 0, tzinfo=UTC),
+        page=2,
+    )
+
+    assert endpoint == (
+        "actions/workflows/plan-implement.yml/runs?event=workflow_dispatch"
+        "&created=%3E%3D2026-03-01T11%3A58%3A00Z&per_page=100&page=2"
+    )
+
+
+def test_resolves_all_ids_from_one_paged_listing() -> None:
+    noise = [_run(1000 + i, f"other:zz{i}") for i in range(RUNS_PAGE_SIZE)]
+    pages = {1: [_run(1, "a:id1"), *noise[1:]], 2: [_run(2, "b:id2"), _run(3, "c:id3")]}
+    fetched: list[int] = []
+
+    def fetch(page: int) -> list[dict[str, Any]]:
+        fetched.append(page)
+        return pages[page]
+
+    time = FakeTime()
+    correlation = correlate_workflow_runs(
+        workflow="wf.yml", distinct_ids=["id1", "id2", "id3"], fetch_runs_page=fetch, time=time
+    )
+
+    assert correlation.matched == {
+        "id1": WorkflowRunFound(run_id="1"),
+        "id2": WorkflowRunFound(run_id="2"),
+        "id3": WorkflowRunFound(run_id="3"),
+    }
+    assert fetched == [1, 2]
+    assert time.sleep_calls == []
+
+
+def test_keeps_polling_only_for_pending_ids() -> None:
+    responses = [[_run(1, "a:id1")], [_run(2, "b:id2"), _run(1, "a:id1")]]
+    fetched: list[int] = []
+
+    def fetch(page: int) -> list[dict[str, Any]]:
+        fetched.append(page)
+        return responses[len(fetched) - 1]
+
+    time = FakeTime()
+    correlation = correlate_workflow_runs(
+        workflow="wf.yml", distinct_ids=["id1", "id2"], fetch_runs_page=fetch, time=time
+    )
+
+    assert correlation.matched == {
+        "id1": WorkflowRunFound(run_id="1"),
+        "id2": WorkflowRunFound(run_id="2"),
+    }
+    assert time.sleep_calls == [1]
+
+
+def test_missing_ids_are_absent_after_attempts_run_out() -> None:
+    time = FakeTime()
+    correlation = correlate_workflow_runs(
+        workflow="wf.yml",
+        distinct_ids=["id1", "id2"],
+        fetch_runs_page=lambda page: [_run(1, "a:id1")],
+        time=time,
+    )
+
+    assert correlation.matched == {"id1": WorkflowRunFound(run_id="1")}
+    assert correlation.missing(["id1", "id2"]) == ["id2"]
+    assert correlation.recent_runs == [_run(1, "a:id1")]
+    assert time.sleep_calls == [1, 2, 4, 8, 8, 8, 8, 8, 8, 8]
+
+
+def test_skipped_run_does_not_discard_other_runs() -> None:
+    time = FakeTime()
+    correlation = correlate_workflow_runs(
+        workflow="wf.yml",
+        distinct_ids=["id1", "id2"],
+        fetch_runs_page=lambda page: [
+            _run(7, "a:id1", conclusion="skipped"),
+            _run(8, "b:id2"),
+        ],
+        time=time,
+    )
+
+    skipped = correlation.matched["id1"]
+    assert isinstance(skipped, WorkflowRunSkipped)
+    assert skipped.run_id == "7"
+    assert "run was skipped" in skipped.message
+    assert correlation.matched["id2"] == WorkflowRunFound(run_id="8")
+    assert time.sleep_calls == []
+
+
+def test_remote_resolve_reports_missing_runs_per_id() -> None:
+    with FakeWorkflowRunsServer(visibility_delay=0.0, history=0) as server:
+        remote = RealRemoteGitHub(
+            http_client=RealHttpClient(token="fake", base_url=server.base_url),
+            time=FakeTime(),
+        )
+        dispatched_at = datetime.now(UTC)
+        found_id = remote.start_workflow(
+            owner="o", repo="r", workflow="wf.yml", ref="main", inputs={"pr_number": "1"}
+        )
+
+        results = remote.resolve_workflow_runs(
+            owner="o",
+            repo="r",
+            workflow="wf.yml",
+            distinct_ids=[found_id, "lost01"],
+            dispatched_at=dispatched_at,
+        )
+
+    assert isinstance(results[found_id], WorkflowRunFound)
+    lost = results["lost01"]
+    assert isinstance(lost, WorkflowRunNotFound)
+    assert "Timed out" in lost.message
+
+
+def test_stub_server_correlates_many_dispatches_with_one_listing() -> None:
+    with FakeWorkflowRunsServer(visibility_delay=0.0, history=150) as server:
+        remote = RealRemoteGitHub(
+            http_client=RealHttpClient(token="fake", base_url=server.base_url),
+            time=FakeTime(),
+        )
+        dispatched_at = datetime.now(UTC)
+        distinct_ids = [
+            remote.start_workflow(
+                owner="o", repo="r", workflow="wf.yml", ref="main", inputs={"pr_number": str(n)}
+            )
+            for n in range(20)
+        ]
+
+        results = remote.resolve_workflow_runs(
+            owner="o",
+            repo="r",
+            workflow="wf.yml",
+            distinct_ids=distinct_ids,
+            dispatched_at=dispatched_at,
+        )
+
+    assert sorted(results) == sorted(distinct_ids)
+    assert all(isinstance(r, WorkflowRunFound) for r in results.values())
+    assert server.dispatch_count == 20
+    assert server.list_count == 1
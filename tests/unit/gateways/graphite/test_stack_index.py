@@ -0,0 +1,148 @@
+"""Tests for the Graphite stack graph index."""
+
+from pathlib import Path
+
+import pytest
+
+from erk_shared.gateway.graphite.dry_run import DryRunGraphite
+from erk_shared.gateway.graphite.stack_index import (
+    STACK_INDEX_FILENAME,
+    StackIndex,
+    StackIndexKey,
+    load_stack_index,
+    save_stack_index,
+)
+from erk_shared.gateway.graphite.types import BranchMetadata
+from tests.fakes.gateway.git import FakeGit
+from tests.fakes.gateway.graphite import FakeGraphite
+
+
+def _branches() -> dict[str, BranchMetadata]:
+    """main -> a -> (a1 -> a1x, a2); main -> b."""
+    return {
+        "main": BranchMetadata.trunk("main", children=["a", "b"]),
+        "a": BranchMetadata.branch("a", "main", children=["a1", "a2"]),
+        "a1": BranchMetadata.branch("a1", "a", children=["a1x"]),
+        "a1x": BranchMetadata.branch("a1x", "a1"),
+        "a2": BranchMetadata.branch("a2", "a"),
+        "b": BranchMetadata.branch("b", "main"),
+    }
+
+
+def test_ancestors_ordered_trunk_first() -> None:
+    index = StackIndex.build(_branches())
+
+    assert index.ancestors("a1x") == ["main", "a", "a1"]
+    assert index.ancestors("main") == []
+    assert index.ancestors("unknown") == []
+
+
+def test_descendants_and_subtree_in_preorder() -> None:
+    index = StackIndex.build(_branches())
+
+    assert index.descendants("a") == ["a1", "a1x", "a2"]
+    assert index.subtree("a") == ["a", "a1", "a1x", "a2"]
+    assert index.descendants("b") == []
+    assert index.subtree("unknown") == []
+
+
+def test_is_ancestor() -> None:
+    index = StackIndex.build(_branches())
+
+    assert index.is_ancestor("main", "a1x")
+    assert index.is_ancestor("a", "a2")
+    assert not index.is_ancestor("a1", "a2")
+    assert not index.is_ancestor("a", "a")
+    assert not index.is_ancestor("a1x", "a")
+    assert not index.is_ancestor("unknown", "a")
+
+
+def test_trunk_distance() -> None:
+    index = StackIndex.build(_branches())
+
+    assert index.trunk_distance("main") == 0
+    assert index.trunk_distance("a1x") == 3
+    assert index.trunk_distance("unknown") is None
+
+
+def test_linear_stack_follows_first_child() -> None:
+    index = StackIndex.build(_branches())
+
+    assert index.linear_stack("a") == ["main", "a", "a1", "a1x"]
+    assert index.linear_stack("a2") == ["main", "a", "a2"]
+    assert index.linear_stack("unknown") is None
+
+
+def test_linear_stack_stops_at_untracked_child() -> None:
+    branches = {
+        "main": BranchMetadata.trunk("main", children=["a"]),
+        "a": BranchMetadata.branch("a", "main", children=["untracked", "b"]),
+        "b": BranchMetadata.branch("b", "a"),
+    }
+    index = StackIndex.build(branches)
+
+    assert index.linear_stack("main") == ["main", "a"]
+    assert index.descendants("a") == ["b"]
+
+
+def test_untracked_parent_becomes_root() -> None:
+    branches = {"orphan": BranchMetadata.branch("orphan", "gone")}
+    index = StackIndex.build(branches)
+
+    assert index.linear_stack("orphan") == ["orphan"]
+    assert index.trunk_distance("orphan") == 0
+
+
+def test_persisted_index_round_trips(tmp_path: Path) -> None:
+    index = StackIndex.build(_branches())
+    key = StackIndexKey(mtime_ns=123, size=456)
+
+    save_stack_index(tmp_path, index, key)
+    loaded = load_stack_index(tmp_path, key)
+
+    assert loaded == index
+
+
+def test_persisted_index_ignored_when_key_changes(tmp_path: Path) -> None:
+    index = StackIndex.build(_branches())
+    save_stack_index(tmp_path, index, StackIndexKey(mtime_ns=1, size=2))
+
+    assert load_stack_index(tmp_path, StackIndexKey(mtime_ns=1, size=3)) is None
+    assert load_stack_index(tmp_path, StackIndexKey(mtime_ns=9, size=2)) is None
+
+
+def test_load_missing_index_returns_none(tmp_path: Path) -> None:
+    assert not (tmp_path / STACK_INDEX_FILENAME).exists()
+    assert load_stack_index(tmp_path, StackIndexKey(mtime_ns=1, size=2)) is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"version": 1, "mtime_ns": 1, "si',
+        "\x00\x00\x00",
+        "[]",
+        '{"version": 1, "mtime_ns": 1, "size": 2, "parents": {}, "children": {},'
+        ' "preorder": [1], "exit": [1], "depth": [0]}',
+    ],
+)
+def test_load_corrupt_index_returns_none(tmp_path: Path, content: str) -> None:
+    (tmp_path / STACK_INDEX_FILENAME).write_text(content, encoding="utf-8")
+
+    assert load_stack_index(tmp_path, StackIndexKey(mtime_ns=1, size=2)) is None
+
+
+def test_load_undecodable_index_returns_none(tmp_path: Path) -> None:
+    (tmp_path / STACK_INDEX_FILENAME).write_bytes(b"\xff\xfe{")
+
+    assert load_stack_index(tmp_path, StackIndexKey(mtime_ns=1, size=2)) is None
+
+
+def test_dry_run_graphite_delegates_stack_index() -> None:
+    wrapped = FakeGraphite(branches=_branches())
+    dry_run = DryRunGraphite(wrapped)
+
+    index = dry_run.get_stack_index(FakeGit(), Path("/repo"))
+
+    assert index == StackIndex.build(_branches())
+    assert wrapped.get_stack_index_calls == [Path("/repo")]
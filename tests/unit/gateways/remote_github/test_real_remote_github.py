@@ -8,9 +8,14 @@ import base64
 
 import pytest
 
+from erk_shared.gateway.github.run_correlation import workflow_runs_endpoint
 from erk_shared.gateway.http.abc import HttpError
 from erk_shared.gateway.remote_github.real import RealRemoteGitHub, _parse_pr_response
-from erk_shared.gateway.remote_github.types import RemotePRInfo, RemotePRNotFound
+from erk_shared.gateway.remote_github.types import (
+    RemoteIssueComment,
+    RemotePRInfo,
+    RemotePRNotFound,
+)
 from tests.fakes.gateway.http import FakeHttpClient
 from tests.fakes.gateway.time import FakeTime
 
@@ -216,11 +221,10 @@ def test_dispatch_workflow_polls_and_returns_run_id() -> None:
     http.set_response("repos/o/r/actions/workflows/one-shot.yml/dispatches", response={})
 
     # The poll GET returns a matching run on the first attempt.
-    # We need to match the endpoint pattern which includes query params.
-    # FakeHttpClient matches on exact endpoint string, so we use set_response
-    # for the runs endpoint.
+    # FakeHttpClient matches on exact endpoint string, so build the runs
+    # listing path (created>= filter included) the same way the gateway does.
     http.set_response(
-        "repos/o/r/actions/workflows/one-shot.yml/runs?per_page=10",
+        f"repos/o/r/{workflow_runs_endpoint('one-shot.yml', created_since=time.now(), page=1)}",
         response={
             "workflow_runs": [
                 {
@@ -232,11 +236,11 @@ def test_dispatch_workflow_polls_and_returns_run_id() -> None:
         },
     )
 
-    # Monkey-patch _generate_distinct_id to return a known value
+    # Monkey-patch generate_distinct_id to return a known value
     import erk_shared.gateway.remote_github.real as real_module
 
-    original_fn = real_module._generate_distinct_id
-    real_module._generate_distinct_id = lambda: "abc123"
+    original_fn = real_module.generate_distinct_id
+    real_module.generate_distinct_id = lambda: "abc123"
     try:
         run_id = remote.dispatch_workflow(
             owner="o",
@@ -246,7 +250,7 @@ def test_dispatch_workflow_polls_and_returns_run_id() -> None:
             inputs={"prompt": "fix bug"},
         )
     finally:
-        real_module._generate_distinct_id = original_fn
+        real_module.generate_distinct_id = original_fn
 
     assert run_id == "99999"
 
@@ -256,7 +260,7 @@ def test_dispatch_workflow_raises_on_skipped_run() -> None:
 
     http.set_response("repos/o/r/actions/workflows/wf.yml/dispatches", response={})
     http.set_response(
-        "repos/o/r/actions/workflows/wf.yml/runs?per_page=10",
+        f"repos/o/r/{workflow_runs_endpoint('wf.yml', created_since=time.now(), page=1)}",
         response={
             "workflow_runs": [
                 {
@@ -270,13 +274,13 @@ def test_dispatch_workflow_raises_on_skipped_run() -> None:
 
     import erk_shared.gateway.remote_github.real as real_module
 
-    original_fn = real_module._generate_distinct_id
-    real_module._generate_distinct_id = lambda: "testid"
+    original_fn = real_module.generate_distinct_id
+    real_module.generate_distinct_id = lambda: "testid"
     try:
         with pytest.raises(RuntimeError, match="was skipped"):
             remote.dispatch_workflow(owner="o", repo="r", workflow="wf.yml", ref="main", inputs={})
     finally:
-        real_module._generate_distinct_id = original_fn
+        real_module.generate_distinct_id = original_fn
 
 
 def test_dispatch_workflow_raises_on_timeout() -> None:
@@ -285,7 +289,7 @@ def test_dispatch_workflow_raises_on_timeout() -> None:
     http.set_response("repos/o/r/actions/workflows/wf.yml/dispatches", response={})
     # Return no matching runs — will always miss
     http.set_response(
-        "repos/o/r/actions/workflows/wf.yml/runs?per_page=10",
+        f"repos/o/r/{workflow_runs_endpoint('wf.yml', created_since=time.now(), page=1)}",
         response={"workflow_runs": []},
     )
 
@@ -518,6 +522,76 @@ def test_get_issue_comments_returns_empty_for_no_comments() -> None:
     assert result == []
 
 
+# --- get_issue_comments_since ---
+
+
+def test_get_issue_comments_since_passes_since_filter() -> None:
+    remote, http, _ = _make_remote()
+    http.set_list_response(
+        "repos/o/r/issues/42/comments?per_page=100&since=2024-01-15T10:00:00Z&page=1",
+        response=[
+            {
+                "id": 7,
+                "created_at": "2024-01-15T09:00:00Z",
+                "updated_at": "2024-01-15T10:05:00Z",
+                "body": "Edited comment",
+            },
+        ],
+    )
+
+    result = remote.get_issue_comments_since(
+        owner="o", repo="r", number=42, since="2024-01-15T10:00:00Z"
+    )
+    assert result == [
+        RemoteIssueComment(
+            id=7,
+            created_at="2024-01-15T09:00:00Z",
+            updated_at="2024-01-15T10:05:00Z",
+            body="Edited comment",
+        )
+    ]
+
+
+def test_get_issue_comments_since_none_fetches_all() -> None:
+    remote, http, _ = _make_remote()
+    http.set_list_response(
+        "repos/o/r/issues/42/comments?per_page=100&page=1",
+        response=[{"id": 1, "created_at": "2024-01-15T09:00:00Z", "body": None}],
+    )
+
+    result = remote.get_issue_comments_since(owner="o", repo="r", number=42, since=None)
+    assert result == [
+        RemoteIssueComment(
+            id=1,
+            created_at="2024-01-15T09:00:00Z",
+            updated_at="2024-01-15T09:00:00Z",
+            body="",
+        )
+    ]
+
+
+def test_get_issue_comments_since_reads_every_page() -> None:
+    remote, http, _ = _make_remote()
+    endpoint = "repos/o/r/issues/42/comments?per_page=100&since=2024-01-15T10:00:00Z"
+    http.set_list_response(
+        f"{endpoint}&page=1",
+        response=[
+            {"id": n, "created_at": "2024-01-15T10:00:00Z", "body": f"c{n}"} for n in range(100)
+        ],
+    )
+    http.set_list_response(
+        f"{endpoint}&page=2",
+        response=[{"id": 100, "created_at": "2024-01-15T11:00:00Z", "body": "last"}],
+    )
+
+    result = remote.get_issue_comments_since(
+        owner="o", repo="r", number=42, since="2024-01-15T10:00:00Z"
+    )
+
+    assert [c.id for c in result] == list(range(101))
+    assert result[-1].body == "last"
+
+
 # --- list_issues ---
 
 
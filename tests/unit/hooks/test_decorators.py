@@ -12,6 +12,7 @@ from click.testing import CliRunner
 
 from erk.hooks.decorators import HookContext, hook_command, logged_hook
 from erk_shared.context.context import ErkContext
+from erk_shared.hooks.logging import read_recent_hook_logs
 
 
 def test_hook_context_injection_with_erk_project(tmp_path: Path) -> None:
@@ -69,6 +70,27 @@ def test_hook_context_injection_with_session_id(tmp_path: Path) -> None:
     assert received_ctx.scratch_dir == expected_scratch
 
 
+def test_hook_log_written_to_context_repo_root(tmp_path: Path) -> None:
+    """Test that the hook log lands in the Click context's repo, not the cwd's git repo."""
+
+    @click.command()
+    @click.pass_context
+    @logged_hook
+    def sample_hook(ctx: click.Context, *, hook_ctx: HookContext) -> None:
+        click.echo("Hook executed")
+
+    (tmp_path / ".erk").mkdir()
+
+    runner = CliRunner()
+    ctx = ErkContext.for_test(repo_root=tmp_path, cwd=tmp_path)
+    stdin_data = json.dumps({"session_id": "test-session-456"})
+    result = runner.invoke(sample_hook, obj=ctx, input=stdin_data)
+
+    assert result.exit_code == 0
+    logs = read_recent_hook_logs(tmp_path)
+    assert [log.session_id for log in logs] == ["test-session-456"]
+
+
 def test_hook_context_not_erk_project(tmp_path: Path) -> None:
     """Test that is_erk_project is False when .erk/ directory doesn't exist."""
     received_ctx: HookContext | None = None
@@ -120,6 +142,7 @@ def test_hook_context_frozen() -> None:
         repo_root=Path("/tmp"),
         scratch_dir=Path("/tmp/scratch"),
         is_erk_project=True,
+        hook_state=None,
     )
 
     # Attempting to modify should raise FrozenInstanceError
@@ -0,0 +1,119 @@
+"""Unit tests for the per-worktree hook state file."""
+
+import json
+from pathlib import Path
+
+import pytest
+import tomli_w
+
+from erk.hooks.state import (
+    current_session_id_path,
+    hook_state_path,
+    load_hook_state,
+    record_session_id,
+)
+
+
+def _write_state_toml(repo_root: Path, installed_reminders: list[str]) -> None:
+    state_path = repo_root / ".erk" / "state.toml"
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    with state_path.open("wb") as f:
+        tomli_w.dump({"reminders": {"installed": installed_reminders}}, f)
+
+
+def test_load_builds_state_from_state_toml(tmp_path: Path) -> None:
+    _write_state_toml(tmp_path, ["devrun", "tripwires"])
+
+    state = load_hook_state(tmp_path)
+
+    assert state.repo_root == tmp_path
+    assert state.installed_reminders == frozenset({"devrun", "tripwires"})
+    assert state.session_id is None
+    assert hook_state_path(tmp_path).exists()
+
+
+def test_load_reuses_state_file_while_state_toml_unchanged(tmp_path: Path) -> None:
+    _write_state_toml(tmp_path, ["devrun"])
+    load_hook_state(tmp_path)
+
+    # Tamper with the cached reminders: a reused file returns them as-is
+    path = hook_state_path(tmp_path)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["installed_reminders"] = ["from-cache"]
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    assert load_hook_state(tmp_path).installed_reminders == frozenset({"from-cache"})
+
+
+def test_state_toml_change_rebuilds_state(tmp_path: Path) -> None:
+    _write_state_toml(tmp_path, ["devrun"])
+    load_hook_state(tmp_path)
+
+    _write_state_toml(tmp_path, ["devrun", "explore-docs"])
+
+    assert load_hook_state(tmp_path).installed_reminders == frozenset({"devrun", "explore-docs"})
+
+
+def test_state_for_other_repo_root_is_rebuilt(tmp_path: Path) -> None:
+    _write_state_toml(tmp_path, ["devrun"])
+    load_hook_state(tmp_path)
+    path = hook_state_path(tmp_path)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["repo_root"] = "/elsewhere"
+    data["installed_reminders"] = []
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    state = load_hook_state(tmp_path)
+
+    assert state.repo_root == tmp_path
+    assert state.installed_reminders == frozenset({"devrun"})
+
+
+def test_record_session_id_writes_once_per_session(tmp_path: Path) -> None:
+    (tmp_path / ".erk").mkdir()
+    state = record_session_id(load_hook_state(tmp_path), "session-1")
+    session_file = current_session_id_path(tmp_path)
+    assert session_file.read_text(encoding="utf-8") == "session-1"
+
+    # Same session again: no write, so an external edit survives
+    session_file.write_text("external", encoding="utf-8")
+    record_session_id(load_hook_state(tmp_path), "session-1")
+    assert session_file.read_text(encoding="utf-8") == "external"
+
+    # New session: written and remembered
+    state = record_session_id(state, "session-2")
+    assert session_file.read_text(encoding="utf-8") == "session-2"
+    assert load_hook_state(tmp_path).session_id == "session-2"
+
+
+def test_record_session_id_rewrites_missing_session_file(tmp_path: Path) -> None:
+    (tmp_path / ".erk").mkdir()
+    record_session_id(load_hook_state(tmp_path), "session-1")
+    current_session_id_path(tmp_path).unlink()
+
+    record_session_id(load_hook_state(tmp_path), "session-1")
+
+    assert current_session_id_path(tmp_path).read_text(encoding="utf-8") == "session-1"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '{"version": 1, "repo_ro',
+        "",
+        "null",
+        '{"version": 1, "repo_root": "/r", "state_toml_signature": [1], "installed_reminders": []}',
+        '{"version": 1, "repo_root": "/r", "state_toml_signature": null, "installed_reminders": 3}',
+    ],
+)
+def test_unparseable_state_file_is_rebuilt(tmp_path: Path, content: str) -> None:
+    _write_state_toml(tmp_path, ["devrun"])
+    path = hook_state_path(tmp_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+    state = load_hook_state(tmp_path)
+
+    assert state.installed_reminders == frozenset({"devrun"})
+    assert json.loads(path.read_text(encoding="utf-8"))["installed_reminders"] == ["devrun"]
+    assert list(path.parent.glob("*.tmp")) == []
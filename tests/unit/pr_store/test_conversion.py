@@ -16,6 +16,7 @@ from erk_shared.pr_store.conversion import (
     header_datetime,
     header_int,
     header_str,
+    plan_header_fields,
     pr_details_to_plan,
 )
 from erk_shared.pr_store.types import PlanState
@@ -124,6 +125,39 @@ class TestGithubIssueToPlan:
         assert plan.node_ids is None
 
 
+class TestPlanHeaderFields:
+    """Tests for the cached plan-header parse."""
+
+    def test_body_without_header_returns_none(self) -> None:
+        assert plan_header_fields("no metadata here") is None
+
+    def test_repeated_parse_returns_independent_dicts(self) -> None:
+        """Callers may mutate the returned dict without corrupting the cache."""
+        body = format_plan_header_body_for_test(objective_issue=7)
+
+        first = plan_header_fields(body)
+        assert first is not None
+        first[OBJECTIVE_ISSUE] = 99
+
+        second = plan_header_fields(body)
+        assert second is not None
+        assert second[OBJECTIVE_ISSUE] == 7
+
+    def test_nested_values_are_not_shared_with_the_cache(self) -> None:
+        """Mutating a nested list in one result leaves later results intact."""
+        body = format_plan_header_body_for_test(node_ids=["1.1", "1.2"])
+
+        first = plan_header_fields(body)
+        assert first is not None
+        nested = first["node_ids"]
+        assert isinstance(nested, list)
+        nested.append("9.9")
+
+        second = plan_header_fields(body)
+        assert second is not None
+        assert second["node_ids"] == ["1.1", "1.2"]
+
+
 class TestHeaderStr:
     """Tests for header_str typed accessor."""
 
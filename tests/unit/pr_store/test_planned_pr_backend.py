@@ -290,6 +290,67 @@ def test_list_plans_includes_only_planned_prs_with_erk_pr_title_prefix() -> None
     assert plans[0].title == "[erk-pr] Real Plan"
 
 
+# =============================================================================
+# Bulk reads
+# =============================================================================
+
+
+def _create_plans(backend: ManagedGitHubPrBackend, count: int) -> list[str]:
+    return [
+        backend.create_managed_pr(
+            repo_root=Path("/repo"),
+            title=f"Plan {index}",
+            content=f"Content {index}",
+            labels=("erk-pr",),
+            metadata={"branch_name": f"branch-{index}", "objective_issue": 100 + index},
+            summary="",
+        ).pr_id
+        for index in range(count)
+    ]
+
+
+def test_bulk_reads_use_one_batched_lookup_each() -> None:
+    """Bulk reads match the per-item reads with one batched gateway request."""
+    fake_github = FakeLocalGitHub()
+    backend = ManagedGitHubPrBackend(fake_github, fake_github.issues, time=FakeTime())
+    pr_ids = _create_plans(backend, 3)
+    requested = [*pr_ids, "424242"]
+    before = len(fake_github.pr_detail_requests)
+
+    plans = backend.get_managed_prs(Path("/repo"), requested)
+    fields = backend.get_metadata_fields_many(Path("/repo"), requested)
+    resolved = backend.resolve_pr_numbers_for_branches(
+        Path("/repo"), ["branch-0", "branch-2", "unknown"]
+    )
+
+    assert [request[0] for request in fake_github.pr_detail_requests[before:]] == [
+        "get_pr_details_by_numbers",
+        "get_pr_details_by_numbers",
+        "get_pr_details_by_branches",
+    ]
+    for pr_id in pr_ids:
+        assert plans[pr_id] == backend.get_managed_pr(Path("/repo"), pr_id)
+        assert fields[pr_id] == backend.get_all_metadata_fields(Path("/repo"), pr_id)
+    assert isinstance(plans["424242"], PrNotFound)
+    assert isinstance(fields["424242"], PrNotFound)
+    assert resolved == {"branch-0": pr_ids[0], "branch-2": pr_ids[2], "unknown": None}
+
+
+def test_plans_from_pr_details_makes_no_requests() -> None:
+    """Converting already-fetched PRs matches get_managed_pr without new lookups."""
+    fake_github = FakeLocalGitHub()
+    backend = ManagedGitHubPrBackend(fake_github, fake_github.issues, time=FakeTime())
+    pr_ids = _create_plans(backend, 2)
+    prs_by_branch = fake_github.get_pr_details_by_branches(Path("/repo"), ["branch-0", "branch-1"])
+    before = len(fake_github.pr_detail_requests)
+
+    plans = backend.plans_from_pr_details(prs_by_branch)
+
+    assert len(fake_github.pr_detail_requests) == before
+    assert plans["branch-0"] == backend.get_managed_pr(Path("/repo"), pr_ids[0])
+    assert plans["branch-1"].objective_id == 101
+
+
 # =============================================================================
 # Body parsing (via lifecycle module)
 # =============================================================================
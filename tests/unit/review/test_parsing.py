@@ -2,10 +2,15 @@
 
 from pathlib import Path
 
+import pathspec
+from pathspec.util import normalize_file
+
 from erk.review.models import ParsedReview, ReviewFrontmatter
 from erk.review.parsing import (
     _filter_excluded_files,
+    build_review_index,
     check_duplicate_markers,
+    compile_review_paths,
     discover_matching_reviews,
     discover_review_files,
     parse_review_file,
@@ -594,3 +599,73 @@ Body.
 
         assert len(result.reviews) == 1
         assert result.reviews[0].frontmatter.name == "Python Review"
+
+
+def _write_review(reviews_dir: Path, filename: str, *, paths: list[str], marker: str) -> None:
+    paths_yaml = "".join(f'  - "{path}"\n' for path in paths)
+    (reviews_dir / filename).write_text(
+        f'---\nname: {filename}\npaths:\n{paths_yaml}marker: "{marker}"\n---\n\nBody.\n',
+        encoding="utf-8",
+    )
+
+
+class TestCompileReviewPaths:
+    """Tests for compiled review path matchers."""
+
+    def test_include_only_patterns_are_combined(self) -> None:
+        """Include-only patterns compile to one regex."""
+        compiled = compile_review_paths(filename="r.md", review_paths=("**/*.py", "docs/**"))
+
+        assert compiled.combined is not None
+
+    def test_negated_patterns_fall_back_to_pathspec(self) -> None:
+        """Negations keep gitignore last-match-wins semantics."""
+        compiled = compile_review_paths(filename="r.md", review_paths=("**/*.py", "!tests/**"))
+
+        assert compiled.combined is None
+        assert compiled.matches("src/main.py")
+        assert not compiled.matches("tests/test_main.py")
+
+    def test_agrees_with_pathspec(self) -> None:
+        """Compiled matchers give the same answer as PathSpec.match_file."""
+        pattern_sets = [
+            ("**/*.py",),
+            ("src/erk/**/*.py", "*.sh"),
+            ("docs/learned/", "/README.md"),
+            ("packages/*/src/**", "!**/fakes/**"),
+        ]
+        files = [
+            "src/erk/cli/main.py",
+            "scripts/setup.sh",
+            "docs/learned/review/index.md",
+            "README.md",
+            "packages/erk-shared/README.md",
+            "packages/erk-shared/src/erk_shared/fakes/git.py",
+            "packages/erk-shared/src/erk_shared/git.py",
+            "./src/main.py",
+        ]
+
+        for patterns in pattern_sets:
+            spec = pathspec.PathSpec.from_lines("gitignore", patterns)
+            compiled = compile_review_paths(filename="r.md", review_paths=patterns)
+            for changed_file in files:
+                expected = spec.match_file(changed_file)
+                assert compiled.matches(normalize_file(changed_file)) == expected, (
+                    patterns,
+                    changed_file,
+                )
+
+
+class TestReviewIndex:
+    """Tests for the compiled review index."""
+
+    def test_match_reports_first_triggering_file(self, tmp_path: Path) -> None:
+        """Each matching review maps to the first changed file that hit it."""
+        _write_review(tmp_path, "python.md", paths=["**/*.py"], marker="<!-- python -->")
+        _write_review(tmp_path, "docs.md", paths=["docs/**"], marker="<!-- docs -->")
+        _write_review(tmp_path, "shell.md", paths=["**/*.sh"], marker="<!-- shell -->")
+
+        index = build_review_index(tmp_path)
+        hits = index.match(["README.md", "src/a.py", "docs/x.md", "src/b.py"])
+
+        assert hits == {"python.md": "src/a.py", "docs.md": "docs/x.md"}
@@ -239,3 +239,42 @@ last_dispatched_node_id: 'WFR_obj456'
         assert result.plans == []
         assert result.pr_linkages == {}
         assert result.workflow_runs == {}
+
+    def test_iter_pages_yields_objectives_page_by_page(self) -> None:
+        """iter_objective_list_pages splits objectives into pages in fetch order."""
+        now = datetime.now(UTC)
+        issues = [
+            IssueInfo(
+                number=n,
+                title=f"Objective {n}",
+                body="",
+                state="OPEN",
+                url=f"https://github.com/owner/repo/issues/{n}",
+                labels=["erk-objective"],
+                assignees=[],
+                created_at=now,
+                updated_at=now,
+                author="test-user",
+            )
+            for n in (1, 2, 3)
+        ]
+        fake_github = FakeLocalGitHub(issues_data=issues)
+
+        service = RealObjectiveListService(fake_github, time=FakeTime())
+        pages = list(
+            service.iter_objective_list_pages(
+                location=TEST_LOCATION,
+                state="open",
+                limit=None,
+                page_size=2,
+                skip_workflow_runs=True,
+                creator=None,
+                exclude_labels=None,
+                http_client=FakeHttpClient(),
+            )
+        )
+
+        assert [[plan.pr_identifier for plan in page.plans] for page in pages] == [
+            ["1", "2"],
+            ["3"],
+        ]
@@ -702,3 +702,30 @@ def test_real_plan_list_service_populates_timing_fields() -> None:
     assert result.api_ms == pytest.approx(100.0)
     assert result.plan_parsing_ms == pytest.approx(50.0)
     assert result.workflow_runs_ms == pytest.approx(50.0)
+
+
+def test_real_plan_list_service_iter_pages_fetches_next_page_on_demand() -> None:
+    """iter_pr_list_pages fetches the second page only after the first is consumed."""
+    issues = [_make_issue(number=n, title=f"Plan {n}") for n in (1, 2, 3)]
+    github = FakeLocalGitHub(issues_data=issues)
+    service = RealPrListService(github, FakeGitHubIssues(), time=FakeTime())
+
+    pages = service.iter_pr_list_pages(
+        location=TEST_LOCATION,
+        labels=["erk-pr"],
+        state="open",
+        limit=None,
+        page_size=2,
+        skip_workflow_runs=True,
+        creator=None,
+        exclude_labels=None,
+        http_client=FakeHttpClient(),
+    )
+
+    first = next(pages)
+    assert [plan.pr_identifier for plan in first.plans] == ["1", "2"]
+    assert github.issues_with_pr_linkages_page_requests == 1
+
+    rest = list(pages)
+    assert [plan.pr_identifier for page in rest for plan in page.plans] == ["3"]
+    assert github.issues_with_pr_linkages_page_requests == 2
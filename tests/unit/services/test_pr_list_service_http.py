@@ -190,3 +190,80 @@ def test_http_path_skip_workflow_runs() -> None:
     )
 
     assert result.workflow_runs == {}
+
+
+def _page_endpoint(page: int, *, per_page: int) -> str:
+    return (
+        f"repos/owner/repo/issues?labels=erk-pr&state=open&per_page={per_page}"
+        f"&sort=updated&direction=desc&page={page}"
+    )
+
+
+def test_iter_pages_requests_next_page_only_when_consumed() -> None:
+    """The REST page for the next rows is requested after the previous page is used."""
+    http_client = FakeHttpClient()
+    http_client.set_list_response(
+        _page_endpoint(1, per_page=2),
+        response=[_make_rest_issue_pr(number=1), _make_rest_issue_pr(number=2)],
+    )
+    http_client.set_list_response(
+        _page_endpoint(2, per_page=2), response=[_make_rest_issue_pr(number=3)]
+    )
+    http_client.set_response("graphql", response=_make_graphql_enrichment([1, 2, 3]))
+
+    service = ManagedPrListService(FakeLocalGitHub(), time=FakeTime())
+    pages = service.iter_pr_list_pages(
+        location=TEST_LOCATION,
+        labels=["erk-pr"],
+        state="open",
+        limit=None,
+        page_size=2,
+        skip_workflow_runs=True,
+        creator=None,
+        exclude_labels=None,
+        http_client=http_client,
+    )
+
+    first = next(pages)
+    assert [plan.pr_identifier for plan in first.plans] == ["1", "2"]
+    rest_endpoints = [r.endpoint for r in http_client.requests if r.endpoint != "graphql"]
+    assert rest_endpoints == [_page_endpoint(1, per_page=2)]
+
+    # Page 2 is short, so iteration stops without requesting page 3
+    rest = list(pages)
+    assert [plan.pr_identifier for page in rest for plan in page.plans] == ["3"]
+    rest_endpoints = [r.endpoint for r in http_client.requests if r.endpoint != "graphql"]
+    assert rest_endpoints == [_page_endpoint(1, per_page=2), _page_endpoint(2, per_page=2)]
+
+
+def test_iter_pages_stops_at_limit() -> None:
+    """The page that crosses limit is truncated and no further page is requested."""
+    http_client = FakeHttpClient()
+    http_client.set_list_response(
+        _page_endpoint(1, per_page=2),
+        response=[_make_rest_issue_pr(number=1), _make_rest_issue_pr(number=2)],
+    )
+    http_client.set_list_response(
+        _page_endpoint(2, per_page=2),
+        response=[_make_rest_issue_pr(number=3), _make_rest_issue_pr(number=4)],
+    )
+    http_client.set_response("graphql", response=_make_graphql_enrichment([1, 2, 3, 4]))
+
+    service = ManagedPrListService(FakeLocalGitHub(), time=FakeTime())
+    pages = list(
+        service.iter_pr_list_pages(
+            location=TEST_LOCATION,
+            labels=["erk-pr"],
+            state="open",
+            limit=3,
+            page_size=2,
+            skip_workflow_runs=True,
+            creator=None,
+            exclude_labels=None,
+            http_client=http_client,
+        )
+    )
+
+    assert [plan.pr_identifier for page in pages for plan in page.plans] == ["1", "2", "3"]
+    rest_endpoints = [r.endpoint for r in http_client.requests if r.endpoint != "graphql"]
+    assert len(rest_endpoints) == 2